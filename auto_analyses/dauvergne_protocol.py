@@ -22,6 +22,7 @@
 ###############################################################################
 
 # Python module imports.
+from hashlib import sha1
 from math import pi
 from os import F_OK, R_OK, X_OK, access, getcwd, listdir, sep
 from os.path import isdir
@@ -33,9 +34,11 @@ from time import sleep, time
 from info import Info_box; info = Info_box()
 from lib.errors import RelaxError, RelaxNoSequenceError, RelaxNoValueError
 from lib.float import floatAsByteArray
+from lib.io import open_read_file, open_write_file
 from lib.text.sectioning import title, subtitle
 from lib.text.string import LIST, PARAGRAPH, SECTION, SUBSECTION, TITLE, to_docstring
 from lib.timing import print_elapsed_time
+from multi import Processor_box
 from pipe_control.interatomic import interatomic_loop
 from pipe_control.mol_res_spin import exists_mol_res_spin_data, return_spin, spin_loop
 from pipe_control.pipes import cdp_name, get_pipe, has_pipe, pipe_names, switch
@@ -97,6 +100,7 @@ doc = [
         [PARAGRAPH, "The global diffusion tensor is fixed and the multiple model-free models are fitted to each spin."],
         [PARAGRAPH, "AIC model selection is used to select the models for each spin."],
         [PARAGRAPH, "All model-free and diffusion parameters are allowed to vary and a global optimisation of all parameters is carried out."],
+        [PARAGRAPH, "If the calculations are interrupted, the protocol will resume from the last completed round, reloading the results of the model-free models already optimised in the interrupted round and restoring the convergence data of the completed rounds.  These model-free results are only reused if their checkpoint marker matches the current round, diffusion tensor, relaxation data and CSA values, otherwise the model is optimised again.  Spins with unchanged relaxation data, CSA value and model-free model are not re-optimised if the diffusion tensor has not changed from the previous round (within the diff_tol relative tolerance), and the optimisation of the other spins can be started from the previous round's results by setting the warm_start flag."],
 
         [SUBSECTION, "Model III - Prolate spheroid"],
         [PARAGRAPH, "The methods used are identical to those of diffusion model MII, except that an axially symmetric diffusion tensor with Da >= 0 is used.  The base directory containing all the results is './prolate/'."],
@@ -125,7 +129,7 @@ class dAuvergne_protocol:
     opt_func_tol = 1e-25
     opt_max_iterations = int(1e7)
 
-    def __init__(self, pipe_name=None, pipe_bundle=None, results_dir=None, write_results_dir=None, diff_model=None, mf_models=['m0', 'm1', 'm2', 'm3', 'm4', 'm5', 'm6', 'm7', 'm8', 'm9'], local_tm_models=['tm0', 'tm1', 'tm2', 'tm3', 'tm4', 'tm5', 'tm6', 'tm7', 'tm8', 'tm9'], grid_inc=11, diff_tensor_grid_inc={'sphere': 11, 'prolate': 11, 'oblate': 11, 'ellipsoid': 6}, min_algor='newton', mc_sim_num=500, max_iter=None, user_fns=None, conv_loop=True):
+    def __init__(self, pipe_name=None, pipe_bundle=None, results_dir=None, write_results_dir=None, diff_model=None, mf_models=['m0', 'm1', 'm2', 'm3', 'm4', 'm5', 'm6', 'm7', 'm8', 'm9'], local_tm_models=['tm0', 'tm1', 'tm2', 'tm3', 'tm4', 'tm5', 'tm6', 'tm7', 'tm8', 'tm9'], grid_inc=11, diff_tensor_grid_inc={'sphere': 11, 'prolate': 11, 'oblate': 11, 'ellipsoid': 6}, min_algor='newton', mc_sim_num=500, max_iter=None, user_fns=None, conv_loop=True, warm_start=False, diff_tol=0.0):
         """Perform the full model-free analysis protocol of d'Auvergne and Gooley, 2008b.
 
         @keyword pipe_name:             The name of the data pipe containing the sequence info.  This data pipe should have all values set including the CSA value, the bond length, the heteronucleus name and proton name.  It should also have all relaxation data loaded.
@@ -156,6 +160,10 @@ class dAuvergne_protocol:
         @type user_fns:                 dict
         @keyword conv_loop:             Automatic looping over all rounds until convergence.
         @type conv_loop:                bool
+        @keyword warm_start:            A flag which if True will start the optimisation of each model-free model from the optimised parameter values of the previous round, rather than from a grid search.
+        @type warm_start:               bool
+        @keyword diff_tol:              The relative tolerance for the diffusion tensor parameters, below which the tensor is considered unchanged from the previous round.  The optimisation of spins with an unchanged tensor, relaxation data, CSA and model is skipped and the previous results are reused.  The default of zero requires the parameters to be identical.
+        @type diff_tol:                 float
         """
 
         # Initial printout.
@@ -177,6 +185,12 @@ class dAuvergne_protocol:
             self.mc_sim_num = mc_sim_num
             self.max_iter = max_iter
             self.conv_loop = conv_loop
+            self.warm_start = warm_start
+            self.diff_tol = diff_tol
+
+            # The global diffusion model and round of optimisation of the model-free model data pipes held in memory.
+            self.pipe_rounds = {}
+            self.round = None
 
             # The model-free data pipe names.
             self.mf_model_pipes = []
@@ -241,9 +255,8 @@ class dAuvergne_protocol:
                     self.conv_data.diff_params = ['tm', 'Da', 'theta', 'phi']
                 elif self.diff_model == 'ellipsoid':
                     self.conv_data.diff_params = ['tm', 'Da', 'Dr', 'alpha', 'beta', 'gamma']
-                self.conv_data.spin_ids = []
-                self.conv_data.mf_params = []
-                self.conv_data.mf_vals = []
+                self.conv_data.rounds = []
+                self.conv_data.spins = []
 
                 # Execute the analysis for each diffusion model.
                 self.execute()
@@ -353,6 +366,72 @@ class dAuvergne_protocol:
         if not isinstance(self.conv_loop, bool):
             raise RelaxError("The conv_loop user variable '%s' is incorrectly set.  It should be one of the booleans True or False." % self.conv_loop)
 
+        # Incremental re-execution.
+        if not isinstance(self.warm_start, bool):
+            raise RelaxError("The warm_start user variable '%s' is incorrectly set.  It should be one of the booleans True or False." % self.warm_start)
+        if not isinstance(self.diff_tol, float) or self.diff_tol < 0.0:
+            raise RelaxError("The diff_tol user variable '%s' is incorrectly set.  It should be a positive float." % self.diff_tol)
+
+
+    def checkpoint_key(self, model=None, rnd=None, tensor_pipe=None):
+        """Return the key identifying the inputs of the optimisation of a model-free model.
+
+        This is a hash of the global diffusion model, the round of optimisation, the model-free model, the optimisation settings, the relaxation data, errors and CSA values of the spins of the base data pipe, and the parameters of the fixed diffusion tensor.
+
+
+        @keyword model:         The model-free model.
+        @type model:            str
+        @keyword rnd:           The round of optimisation.
+        @type rnd:              int or None
+        @keyword tensor_pipe:   The data pipe holding the fixed diffusion tensor.  This is None for the local tm models.
+        @type tensor_pipe:      str or None
+        @return:                The checkpoint key.
+        @rtype:                 str
+        """
+
+        # The models and settings.
+        data = [self.diff_model, rnd, model, self.grid_inc, self.min_algor]
+
+        # The input data of each spin.
+        for spin, spin_id in spin_loop(pipe=self.pipe_name, return_id=True):
+            data.append([spin_id, spin.select])
+            for name in ['ri_data', 'ri_data_err', 'csa']:
+                val = getattr(spin, name, None)
+                if isinstance(val, dict):
+                    val = sorted(val.items())
+                data.append(val)
+
+        # The diffusion tensor parameters.
+        if tensor_pipe != None:
+            tensor = get_pipe(tensor_pipe).diff_tensor
+            for param in self.conv_data.diff_params:
+                data.append(getattr(tensor, param))
+
+        # Return the hash.
+        return sha1(repr(data).encode()).hexdigest()
+
+
+    def checkpoint_valid(self, dir=None, key=None):
+        """Determine if the results in the given directory are a checkpoint of a completed optimisation.
+
+        @keyword dir:   The directory to check.
+        @type dir:      str
+        @keyword key:   The key of the optimisation, as returned by checkpoint_key().
+        @type key:      str
+        @return:        True if the results file exists together with a checkpoint marker for the same key.
+        @rtype:         bool
+        """
+
+        # No results or marker.
+        if not self.results_exist(dir) or not access(dir + sep + 'checkpoint', F_OK):
+            return False
+
+        # Compare the keys.
+        file = open_read_file(file_name='checkpoint', dir=dir, verbosity=0)
+        stored = file.read().strip()
+        file.close()
+        return stored == key
+
 
     def convergence(self):
         """Test for the convergence of the global model."""
@@ -366,56 +445,22 @@ class dAuvergne_protocol:
             return True
 
         # Store the data of the current data pipe.
-        self.conv_data.chi2.append(cdp.chi2)
-
-        # Create a string representation of the model-free models of the current data pipe.
-        curr_models = ''
-        for spin in spin_loop():
-            if hasattr(spin, 'model'):
-                if not spin.model == 'None':
-                    curr_models = curr_models + spin.model
-        self.conv_data.models.append(curr_models)
-
-        # Store the diffusion tensor parameters.
-        self.conv_data.diff_vals.append([])
-        for param in self.conv_data.diff_params:
-            # Get the parameter values.
-            self.conv_data.diff_vals[-1].append(getattr(cdp.diff_tensor, param))
-
-        # Store the model-free parameters.
-        self.conv_data.mf_vals.append([])
-        self.conv_data.mf_params.append([])
-        self.conv_data.spin_ids.append([])
-        for spin, spin_id in spin_loop(return_id=True):
-            # Skip spin systems with no 'params' object.
-            if not hasattr(spin, 'params'):
-                continue
-
-            # Add the spin ID, parameters, and empty value list.
-            self.conv_data.spin_ids[-1].append(spin_id)
-            self.conv_data.mf_params[-1].append([])
-            self.conv_data.mf_vals[-1].append([])
-
-            # Loop over the parameters.
-            for j in range(len(spin.params)):
-                # Get the parameters and values.
-                self.conv_data.mf_params[-1][-1].append(spin.params[j])
-                self.conv_data.mf_vals[-1][-1].append(getattr(spin, spin.params[j].lower()))
+        self.store_conv_data(rnd=self.round)
 
         # No need for tests.
-        if self.round == 1:
+        if len(self.conv_data.rounds) == 1:
             print("First round of optimisation, skipping the convergence tests.\n\n\n")
             return False
 
         # Loop over the iterations.
         converged = False
-        for i in range(self.start_round, self.round - 1):
+        for index in range(len(self.conv_data.rounds) - 1):
+            # The round number.
+            i = self.conv_data.rounds[index] - 1
+
             # Print out.
             print("\n\n\n# Comparing the current iteration to iteration %i.\n" % (i+1))
 
-            # Index.
-            index = i - self.start_round
-
             # Chi-squared test.
             print("Chi-squared test:")
             print("    chi2 (iter %i):  %s" % (i+1, self.conv_data.chi2[index]))
@@ -443,7 +488,7 @@ class dAuvergne_protocol:
             for k in range(len(self.conv_data.diff_params)):
                 # Test if not identical.
                 if self.conv_data.diff_vals[index][k] != self.conv_data.diff_vals[-1][k]:
-                    print("    Parameter:   %s" % param)
+                    print("    Parameter:   %s" % self.conv_data.diff_params[k])
                     print("    Value (iter %i):  %s" % (i+1, self.conv_data.diff_vals[index][k]))
                     print("        (as an IEEE-754 byte array:  %s)" % floatAsByteArray(self.conv_data.diff_vals[index][k]))
                     print("    Value (iter %i):  %s" % (self.round, self.conv_data.diff_vals[-1][k]))
@@ -455,25 +500,35 @@ class dAuvergne_protocol:
                 continue
             print("    The diffusion tensor parameters have converged.\n")
 
-            # Identical model-free parameter value test.
+            # Identical model-free parameter value test, using the per-spin results.
             print("\nIdentical model-free parameter test:")
-            if len(self.conv_data.spin_ids[index]) != len(self.conv_data.spin_ids[-1]):
-                print("    Different number of spins.")
+            prev_spins = self.conv_data.spins[index]
+            curr_spins = self.conv_data.spins[-1]
+            if sorted(prev_spins.keys()) != sorted(curr_spins.keys()):
+                print("    Different spins.")
                 continue
-            for j in range(len(self.conv_data.spin_ids[-1])):
+            for spin_id in curr_spins:
+                # Skip identical results.
+                if prev_spins[spin_id] == curr_spins[spin_id]:
+                    continue
+
                 # Loop over the parameters.
-                for k in range(len(self.conv_data.mf_params[-1][j])):
+                params, curr_vals = curr_spins[spin_id]
+                prev_vals = prev_spins[spin_id][1]
+                for k in range(len(params)):
                     # Test if not identical.
-                    if self.conv_data.mf_vals[index][j][k] != self.conv_data.mf_vals[-1][j][k]:
-                        print("    Spin ID:     %s" % self.conv_data.spin_ids[-1][j])
-                        print("    Parameter:   %s" % self.conv_data.mf_params[-1][j][k])
-                        print("    Value (iter %i): %s" % (i+1, self.conv_data.mf_vals[index][j][k]))
-                        print("        (as an IEEE-754 byte array:  %s)" % floatAsByteArray(self.conv_data.mf_vals[index][j][k]))
-                        print("    Value (iter %i): %s" % (self.round, self.conv_data.mf_vals[-1][j][k]))
-                        print("        (as an IEEE-754 byte array:  %s)" % floatAsByteArray(self.conv_data.mf_vals[index][j][k]))
-                        print("    The model-free parameters have not converged.\n")
-                        params_converged = False
+                    if k >= len(prev_vals) or prev_vals[k] != curr_vals[k]:
+                        print("    Spin ID:     %s" % spin_id)
+                        print("    Parameter:   %s" % params[k])
+                        if k < len(prev_vals):
+                            print("    Value (iter %i): %s" % (i+1, prev_vals[k]))
+                            print("        (as an IEEE-754 byte array:  %s)" % floatAsByteArray(prev_vals[k]))
+                        print("    Value (iter %i): %s" % (self.round, curr_vals[k]))
+                        print("        (as an IEEE-754 byte array:  %s)" % floatAsByteArray(curr_vals[k]))
                         break
+                print("    The model-free parameters have not converged.\n")
+                params_converged = False
+                break
             if not params_converged:
                 continue
             print("    The model-free parameters have converged.\n")
@@ -504,6 +559,23 @@ class dAuvergne_protocol:
             return False
 
 
+    def count_selected(self):
+        """Count the selected spins with relaxation data in the current data pipe.
+
+        @return:    The number of spins.
+        @rtype:     int
+        """
+
+        # Count.
+        count = 0
+        for spin in spin_loop(skip_desel=True):
+            if hasattr(spin, 'ri_data') and spin.ri_data != None:
+                count += 1
+
+        # Return the count.
+        return count
+
+
     def determine_rnd(self, model=None):
         """Function for returning the name of next round of optimisation."""
 
@@ -568,15 +640,8 @@ class dAuvergne_protocol:
             # Assume the round is complete.
             complete_round = i
 
-            # The file root.
-            file_root = base_dir + sep + "round_%i" % i + sep + 'opt' + sep + 'results'
-
             # Stop looping when the opt/results file is found.
-            if access(file_root + '.bz2', F_OK):
-                break
-            if access(file_root + '.gz', F_OK):
-                break
-            if access(file_root, F_OK):
+            if self.results_exist(base_dir + sep + "round_%i" % i + sep + 'opt'):
                 break
 
         # No round, so assume the initial state.
@@ -632,6 +697,9 @@ class dAuvergne_protocol:
             # The initial round of optimisation - not zero if calculations were interrupted.
             self.start_round = self.determine_rnd(model=self.diff_model)
 
+            # Restore the convergence data of the completed rounds.
+            self.load_conv_history()
+
             # Loop until convergence if conv_loop is set, otherwise just loop once.
             # This looping could be made much cleaner by removing the dependence on the determine_rnd() function.
             while True:
@@ -829,6 +897,37 @@ class dAuvergne_protocol:
             raise RelaxError("Unknown diffusion model, change the value of 'self.diff_model'")
 
 
+    def load_conv_history(self):
+        """Restore the convergence data from the results of the rounds completed in a previous execution."""
+
+        # Nothing to do.
+        if self.start_round < 2:
+            return
+
+        # Printout.
+        subtitle(file=sys.stdout, text="Restoring the convergence data of rounds 1 to %i" % (self.start_round - 1))
+
+        # The current data pipe.
+        orig_pipe = cdp_name()
+
+        # Loop over the completed rounds.
+        name = self.name_pipe('history')
+        for rnd in range(1, self.start_round):
+            # Load the optimised results into a temporary data pipe.
+            if has_pipe(name):
+                self.interpreter.pipe.delete(name)
+            self.interpreter.pipe.create(name, 'mf', bundle=self.pipe_bundle)
+            self.interpreter.results.read(file='results', dir=self.results_dir+self.diff_model + sep+'round_'+repr(rnd)+sep+'opt')
+
+            # Store the data.
+            self.store_conv_data(rnd=rnd)
+
+        # Clean up.
+        self.interpreter.pipe.delete(name)
+        if orig_pipe != None and has_pipe(orig_pipe):
+            switch(orig_pipe)
+
+
     def load_tensor(self):
         """Function for loading the optimised diffusion tensor."""
 
@@ -872,16 +971,48 @@ class dAuvergne_protocol:
         for i in range(len(models)):
             self.pipes.append(self.name_pipe(models[i]))
 
-        # Loop over the data pipes.
+        # The data pipe holding the fixed diffusion tensor.
+        tensor_pipe = None
+        if not local_tm:
+            tensor_pipe = self.name_pipe('previous')
+
+        # Loop over the data pipes, setting up the models to optimise.
+        todo = []
+        skipped = {}
+        keys = {}
         for i in range(len(models)):
             # Place the model name into the status container.
             status.auto_analysis[self.pipe_bundle].current_model = models[i]
 
+            # The results directory and checkpoint key.
+            dir = self.base_dir + models[i]
+            keys[i] = self.checkpoint_key(model=models[i], rnd=self.round, tensor_pipe=tensor_pipe)
+
+            # Resume an interrupted run by loading the checkpointed results of this model.
+            if self.checkpoint_valid(dir=dir, key=keys[i]):
+                print("Loading the checkpointed results of the model-free model '%s' from '%s'." % (models[i], dir))
+                if has_pipe(self.pipes[i]):
+                    self.interpreter.pipe.delete(self.pipes[i])
+                self.interpreter.pipe.create(self.pipes[i], 'mf', bundle=self.pipe_bundle)
+                self.interpreter.results.read(file='results', dir=dir)
+                self.pipe_rounds[self.pipes[i]] = (self.diff_model, self.round)
+                continue
+
+            # Stale results.
+            if self.results_exist(dir):
+                print("The results of the model-free model '%s' in '%s' are not a checkpoint of the current optimisation and will be overwritten." % (models[i], dir))
+
+            # The spins of the previous round.
+            prev_spins, same_tensor = None, False
+            if not local_tm:
+                prev_spins, same_tensor = self.previous_spins(i)
+
             # Create the data pipe (by copying).
             if has_pipe(self.pipes[i]):
                 self.interpreter.pipe.delete(self.pipes[i])
             self.interpreter.pipe.copy(self.pipe_name, self.pipes[i], bundle_to=self.pipe_bundle)
             self.interpreter.pipe.switch(self.pipes[i])
+            self.pipe_rounds[self.pipes[i]] = (self.diff_model, self.round)
 
             # Copy the diffusion tensor from the 'opt' data pipe and prevent it from being minimised.
             if not local_tm:
@@ -891,16 +1022,30 @@ class dAuvergne_protocol:
             # Select the model-free model.
             self.interpreter.model_free.select_model(model=models[i])
 
-            # Minimise.
-            self.interpreter.minimise.grid_search(inc=self.grid_inc)
-            self.interpreter.minimise.execute(self.min_algor, func_tol=self.opt_func_tol, max_iter=self.opt_max_iterations)
+            # Reuse or warm-start from the previous round's results.
+            skipped[i] = self.reuse_spins(prev_spins, same_tensor)
+            todo.append(i)
+
+        # The grid search and then minimisation of all models, with the independent models optimised together by the slave processors.
+        for stage in ['grid', 'min']:
+            self.optimise_models(models=models, indices=todo, stage=stage)
+
+        # Loop over the optimised models.
+        for i in todo:
+            # Switch to the data pipe.
+            status.auto_analysis[self.pipe_bundle].current_model = models[i]
+            self.interpreter.pipe.switch(self.pipes[i])
+
+            # Restore the selection state of the skipped spins.
+            for spin, select in skipped[i]:
+                spin.select = select
 
             # Model elimination.
             self.interpreter.eliminate()
 
-            # Write the results.
-            dir = self.base_dir + models[i]
-            self.interpreter.results.write(file='results', dir=dir, force=True)
+            # Write the results, followed by the checkpoint marker of the completed optimisation.
+            self.interpreter.results.write(file='results', dir=self.base_dir + models[i], force=True)
+            self.write_checkpoint(dir=self.base_dir + models[i], key=keys[i])
 
         # Unset the status.
         status.auto_analysis[self.pipe_bundle].current_model = None
@@ -920,6 +1065,187 @@ class dAuvergne_protocol:
         return name
 
 
+    def optimise_models(self, models=None, indices=None, stage=None):
+        """Optimise the model-free models of many data pipes together.
+
+        The processor queue is held while looping over the data pipes, so that the optimisations of all the independent models are spread across the slave processors together rather than one model at a time.
+
+
+        @keyword models:    The model-free models.
+        @type models:       list of str
+        @keyword indices:   The indices of the models to optimise.
+        @type indices:      list of int
+        @keyword stage:     The optimisation stage, either 'grid' for the grid search or 'min' for the minimisation.
+        @type stage:        str
+        """
+
+        # Hold the processor queue.
+        processor = Processor_box().processor
+        processor.hold_queue()
+
+        # Loop over the models, queuing the optimisations.
+        try:
+            for i in indices:
+                # Place the model name into the status container.
+                status.auto_analysis[self.pipe_bundle].current_model = models[i]
+
+                # Switch to the data pipe.
+                self.interpreter.pipe.switch(self.pipes[i])
+
+                # Nothing to optimise.
+                if not self.count_selected():
+                    continue
+
+                # Queue the optimisation.
+                if stage == 'grid':
+                    self.interpreter.minimise.grid_search(inc=self.grid_inc)
+                else:
+                    self.interpreter.minimise.execute(self.min_algor, func_tol=self.opt_func_tol, max_iter=self.opt_max_iterations)
+
+        # Discard the queued optimisations on failure.
+        except:
+            processor.release_queue(run=False)
+            raise
+
+        # Execute the queued optimisations, coalescing the data pipe switches of the result processing.
+        with status.observers.batch(['pipe_alteration']):
+            processor.release_queue()
+
+
+    def previous_spins(self, index):
+        """Return the spin containers of the model-free model optimised in the previous round.
+
+        The model-free model data pipe of the previous round is used if it is still held in memory, otherwise the checkpointed results are loaded from the previous round's directory.
+
+
+        @param index:   The index of the model-free model.
+        @type index:    int
+        @return:        The spin containers of the previous round, with the spin IDs as keys, and a flag which is True if the diffusion tensor has not changed.
+        @rtype:         dict of SpinContainer instances, bool
+        """
+
+        # Initial round.
+        if self.round < 2:
+            return None, False
+
+        # The data pipe name and the previous round's directory.
+        name = self.pipes[index]
+        dir = self.results_dir+self.diff_model + sep+'round_'+repr(self.round-1)+sep+self.mf_models[index]
+
+        # Load the checkpointed results if the data pipe is not from the previous round.
+        if not has_pipe(name) or self.pipe_rounds.get(name) != (self.diff_model, self.round-1):
+            # No results.
+            if not self.results_exist(dir):
+                return None, False
+
+            # Load the results.
+            if has_pipe(name):
+                self.interpreter.pipe.delete(name)
+            self.interpreter.pipe.create(name, 'mf', bundle=self.pipe_bundle)
+            self.interpreter.results.read(file='results', dir=dir)
+
+            # Not a checkpoint of the previous round, for the loaded diffusion tensor and the current input data.
+            if not self.checkpoint_valid(dir=dir, key=self.checkpoint_key(model=self.mf_models[index], rnd=self.round-1, tensor_pipe=name)):
+                self.interpreter.pipe.delete(name)
+                return None, False
+
+        # The spin containers.
+        spins = {}
+        for spin, spin_id in spin_loop(pipe=name, return_id=True):
+            spins[spin_id] = spin
+
+        # Compare the diffusion tensors.
+        prev_tensor = get_pipe(name).diff_tensor
+        curr_tensor = get_pipe(self.name_pipe('previous')).diff_tensor
+        same = True
+        for param in self.conv_data.diff_params:
+            prev = getattr(prev_tensor, param)
+            curr = getattr(curr_tensor, param)
+            if abs(curr - prev) > self.diff_tol * max(abs(curr), abs(prev)):
+                same = False
+                break
+
+        # Return the spins and tensor flag.
+        return spins, same
+
+
+    def results_exist(self, dir):
+        """Determine if a results file exists in the given directory.
+
+        @param dir: The directory to check.
+        @type dir:  str
+        @return:    True if the file 'results', 'results.bz2' or 'results.gz' exists.
+        @rtype:     bool
+        """
+
+        # The file root.
+        file_root = dir + sep + 'results'
+
+        # Check the files.
+        for ext in ['.bz2', '.gz', '']:
+            if access(file_root + ext, F_OK):
+                return True
+
+        # No results.
+        return False
+
+
+    def reuse_spins(self, prev_spins, same_tensor):
+        """Reuse or warm-start from the previous round's per-spin model-free results.
+
+        Spins are only considered if the relaxation data, errors, CSA and model are identical to the previous round.  If the diffusion tensor is unchanged, the previous results are copied and the spin is deselected so that it is skipped in the optimisation.  Otherwise if the warm_start flag is set, the optimised parameter values are copied so that the grid search is skipped for these preset parameters.
+
+
+        @param prev_spins:  The spin containers of the previous round, with the spin IDs as keys.
+        @type prev_spins:   dict of SpinContainer instances or None
+        @param same_tensor: A flag which if True indicates that the diffusion tensor has not changed.
+        @type same_tensor:  bool
+        @return:            The list of skipped spins and their original selection state.
+        @rtype:             list of [SpinContainer instance, bool]
+        """
+
+        # Nothing to do.
+        skipped = []
+        if prev_spins == None or not (same_tensor or self.warm_start):
+            return skipped
+
+        # Loop over the spins.
+        count = 0
+        for spin, spin_id in spin_loop(return_id=True, skip_desel=True):
+            # No relaxation data or previous results.
+            if not hasattr(spin, 'ri_data') or spin.ri_data == None or spin_id not in prev_spins:
+                continue
+            prev = prev_spins[spin_id]
+
+            # The inputs must be unchanged.
+            changed = False
+            for name in ['model', 'ri_data', 'ri_data_err', 'csa']:
+                if getattr(spin, name, None) != getattr(prev, name, None):
+                    changed = True
+                    break
+            if changed or not hasattr(prev, 'params'):
+                continue
+
+            # Copy the optimised parameter values.
+            for param in prev.params:
+                setattr(spin, param.lower(), getattr(prev, param.lower()))
+
+            # Copy the optimisation statistics and skip the spin.
+            if same_tensor:
+                for name in ['chi2', 'iter', 'f_count', 'g_count', 'h_count', 'warning']:
+                    setattr(spin, name, getattr(prev, name, None))
+                skipped.append([spin, prev.select])
+                spin.select = False
+                count += 1
+
+        # Printout.
+        if same_tensor:
+            print("The diffusion tensor is unchanged, reusing the previous results of %i spins." % count)
+
+        # Return the skipped spins.
+        return skipped
+
+
     def status_setup(self):
         """Initialise the status object."""
 
@@ -949,6 +1275,60 @@ class dAuvergne_protocol:
         status.auto_analysis[self.pipe_bundle].convergence = False
 
 
+    def store_conv_data(self, rnd=None):
+        """Store the per-spin results of the current data pipe for the convergence tests.
+
+        @keyword rnd:   The round of optimisation of the results.
+        @type rnd:      int
+        """
+
+        # The round number and chi-squared value.
+        self.conv_data.rounds.append(rnd)
+        self.conv_data.chi2.append(cdp.chi2)
+
+        # Create a string representation of the model-free models of the current data pipe.
+        curr_models = ''
+        for spin in spin_loop():
+            if hasattr(spin, 'model'):
+                if not spin.model == 'None':
+                    curr_models = curr_models + spin.model
+        self.conv_data.models.append(curr_models)
+
+        # Store the diffusion tensor parameters.
+        self.conv_data.diff_vals.append([])
+        for param in self.conv_data.diff_params:
+            # Get the parameter values.
+            self.conv_data.diff_vals[-1].append(getattr(cdp.diff_tensor, param))
+
+        # Store the model-free parameters and values of each spin.
+        self.conv_data.spins.append({})
+        for spin, spin_id in spin_loop(return_id=True):
+            # Skip spin systems with no 'params' object.
+            if not hasattr(spin, 'params'):
+                continue
+
+            # The parameters and values.
+            vals = []
+            for param in spin.params:
+                vals.append(getattr(spin, param.lower()))
+            self.conv_data.spins[-1][spin_id] = (list(spin.params), vals)
+
+
+    def write_checkpoint(self, dir=None, key=None):
+        """Write the checkpoint marker of a completed model-free model optimisation.
+
+        @keyword dir:   The directory containing the results file.
+        @type dir:      str
+        @keyword key:   The key of the optimisation, as returned by checkpoint_key().
+        @type key:      str
+        """
+
+        # Write the key.
+        file = open_write_file(file_name='checkpoint', dir=dir, force=True, verbosity=0)
+        file.write("%s\n" % key)
+        file.close()
+
+
     def write_results(self):
         """Create Grace plots of the final model-free results."""
 
@@ -37,6 +37,7 @@ from dep_check import version_comparison
 from lib.dispersion.variables import EQ_ANALYTIC, EQ_NUMERIC, EQ_SILICO, MODEL_LIST_ANALYTIC, MODEL_LIST_NEST, MODEL_LIST_NUMERIC, MODEL_LIST_R1RHO, MODEL_LIST_R1RHO_FULL, MODEL_NOREX, MODEL_PARAMS, MODEL_R2EFF
 from lib.errors import RelaxError, RelaxFileError, RelaxNoPipeError
 from lib.io import determine_compression, get_file_path
+from lib.model_selection import aic, aicc, bic
 from lib.text.sectioning import section, subsection, subtitle, title
 from lib.timing import print_elapsed_time
 from lib.warnings import RelaxWarning
@@ -45,7 +46,8 @@ from pipe_control.pipes import has_pipe
 from prompt.interpreter import Interpreter
 from specific_analyses.relax_disp.data import has_exponential_exp_type, has_cpmg_exp_type, has_fixed_time_exp_type, has_r1rho_exp_type, is_r1_optimised
 from specific_analyses.relax_disp.data import INTERPOLATE_OFFSET, X_AXIS_W_EFF, X_AXIS_THETA, Y_AXIS_R2_R1RHO, Y_AXIS_R2_EFF
-from specific_analyses.relax_disp.model import Model_class, nesting_model, nesting_param
+from specific_analyses.api import return_api
+from specific_analyses.relax_disp.model import Model_class, nesting_model, nesting_param, sort_models
 from status import Status; status = Status()
 
 
@@ -56,7 +58,7 @@ class Relax_disp:
     opt_func_tol = 1e-25
     opt_max_iterations = int(1e7)
 
-    def __init__(self, pipe_name=None, pipe_bundle=None, results_dir=None, models=[MODEL_R2EFF], grid_inc=11, mc_sim_num=500, exp_mc_sim_num=None, modsel='AIC', pre_run_dir=None, optimise_r2eff=False, insignificance=0.0, numeric_only=False, mc_sim_all_models=False, eliminate=True, set_grid_r20=False, r1_fit=False):
+    def __init__(self, pipe_name=None, pipe_bundle=None, results_dir=None, models=[MODEL_R2EFF], grid_inc=11, mc_sim_num=500, exp_mc_sim_num=None, modsel='AIC', pre_run_dir=None, optimise_r2eff=False, insignificance=0.0, numeric_only=False, mc_sim_all_models=False, eliminate=True, set_grid_r20=False, r1_fit=False, elimination_gap=None):
         """Perform a full relaxation dispersion analysis for the given list of models.
 
         @keyword pipe_name:                 The name of the data pipe containing all of the data for the analysis.
@@ -90,6 +92,8 @@ class Relax_disp:
         @keyword set_grid_r20:              A flag which if True will set the grid R20 values from the minimum R2eff values through the r20_from_min_r2eff user function. This will speed up the grid search with a factor GRID_INC^(Nr_spec_freq). For a CPMG experiment with two fields and standard GRID_INC=21, the speed-up is a factor 441.
         @type set_grid_r20:                 bool
         @keyword r1_fit:                    A flag which if True will activate R1 parameter fitting via relax_disp.r1_fit for the models that support it.  If False, then the relax_disp.r1_fit user function will not be called.
+        @keyword elimination_gap:           The model selection criterion gap for the early elimination of models.  If set, the models will be optimised from the cheapest to the most expensive, and a model will not be optimised for a spin cluster when the lowest criterion value it could possibly reach is worse than the best criterion value of the already optimised models by more than this gap.  Monte Carlo simulations for the individual models are also skipped for the clusters in which the model is no longer competitive.  If None, all models are optimised for all spin clusters.
+        @type elimination_gap:              None or float
         """
 
         # Initial printout.
@@ -121,6 +125,7 @@ class Relax_disp:
             self.mc_sim_all_models = mc_sim_all_models
             self.eliminate = eliminate
             self.r1_fit = r1_fit
+            self.elimination_gap = elimination_gap
 
             # No results directory, so default to the current directory.
             if not self.results_dir:
@@ -189,6 +194,10 @@ class Relax_disp:
         if self.modsel not in allowed:
             raise RelaxError("The model selection technique '%s' is not in the allowed list of %s." % (self.modsel, allowed))
 
+        # Check the early elimination gap.
+        if self.elimination_gap != None and (not isinstance(self.elimination_gap, (float, int)) or self.elimination_gap < 0.0):
+            raise RelaxError("The early model elimination gap '%s' must be a positive number or None." % self.elimination_gap)
+
         # Some warning for the user if the pure numeric solution is selected.
         if self.numeric_only:
             # Loop over all models.
@@ -230,6 +239,73 @@ class Relax_disp:
                     warn(RelaxWarning("This could make the numerical analysis with model '%s', 5 to 6 times slower." % (model)))
 
 
+    def early_elimination(self, model=None, optimised=False):
+        """Deselect the spin clusters for which the model can no longer be selected.
+
+        The criterion value of each cluster is compared to the best value of the already optimised models.  Prior to optimisation, the lowest possible value for the model is used.  This is calculated with a chi-squared value of zero, as the chi-squared value of an already optimised model with identical parameters, such as an analytic approximation of a numeric model, is not a strict lower bound.
+
+
+        @keyword model:     The current model.
+        @type model:        str
+        @keyword optimised: A flag which if True indicates that the model has been optimised, so that the actual criterion values are used.
+        @type optimised:    bool
+        """
+
+        # Only the models used for model selection are eliminated.
+        if not self.is_model_for_selection(model):
+            return
+
+        # Printout.
+        subsection(file=sys.stdout, text="Early model elimination", prespace=1)
+
+        # The model selection formula.
+        formula = {'AIC': aic, 'AICc': aicc, 'BIC': bic}[self.modsel]
+
+        # Loop over the spin clusters.
+        api = return_api()
+        clusters = []
+        for spin_ids in api.model_loop():
+            # No competing models for the cluster.
+            key = tuple(spin_ids)
+            if key not in self.cluster_crit:
+                continue
+
+            # The model statistics, skipping deselected clusters.
+            k, n, chi2 = api.model_statistics(model_info=spin_ids)
+            if not n:
+                continue
+
+            # The lowest possible chi-squared value prior to optimisation.
+            if not optimised:
+                chi2 = 0.0
+
+            # Failed optimisation.
+            if chi2 == None:
+                continue
+
+            # The model cannot be selected.
+            if formula(chi2, float(k), float(n)) - self.cluster_crit[key] > self.elimination_gap:
+                clusters.append(spin_ids)
+
+        # Nothing to do.
+        if not len(clusters):
+            print("The '%s' model is competitive for all spin clusters." % model)
+            return
+
+        # Printout.
+        if optimised:
+            print("Skipping the Monte Carlo simulations of the '%s' model for the following spin clusters:" % model)
+        else:
+            print("Skipping the optimisation of the '%s' model for the following spin clusters:" % model)
+        for spin_ids in clusters:
+            print("    %s" % spin_ids)
+
+        # Deselect the spins.
+        for spin_ids in clusters:
+            for spin_id in spin_ids:
+                self.interpreter.deselect.spin(spin_id=spin_id, change_all=False)
+
+
     def error_analysis(self):
         """Perform an error analysis of the peak intensities for each field strength separately."""
 
@@ -493,6 +569,10 @@ class Relax_disp:
             # The minimisation algorithm to use. If the Jacobian and Hessian matrix have not been specified for fitting, 'simplex' should be used.
             min_algor = 'simplex'
 
+        # Skip the Monte Carlo simulations for the clusters in which the model is no longer competitive.
+        if do_monte_carlo and self.elimination_gap != None:
+            self.early_elimination(model=model, optimised=True)
+
         # Error estimation by Monte Carlo simulations.
         if do_monte_carlo:
             # Set the number of Monte-Carlo simulations.
@@ -573,8 +653,18 @@ class Relax_disp:
             # No print out.
             self.interpreter.relax_disp.r1_fit(fit=self.r1_fit)
 
-        # Loop over the models.
+        # The data pipes for model selection, in the order of the models given.
         self.model_pipes = []
+        for model in self.models:
+            if self.is_model_for_selection(model):
+                self.model_pipes.append(self.name_pipe(model))
+
+        # Early model elimination, optimising the models from the cheapest to the most expensive.
+        if self.elimination_gap != None:
+            self.models = sort_models(self.models)
+            self.cluster_crit = {}
+
+        # Loop over the models.
         for model in self.models:
             # Printout.
             subtitle(file=sys.stdout, text="The '%s' model" % model, prespace=3)
@@ -585,8 +675,6 @@ class Relax_disp:
 
             # The name of the data pipe for the model.
             model_pipe = self.name_pipe(model)
-            if self.is_model_for_selection(model):
-                self.model_pipes.append(model_pipe)
 
             # Check that results do not already exist - i.e. a previous run was interrupted.
             path1 = path + sep + 'results'
@@ -603,6 +691,10 @@ class Relax_disp:
                 # Load the results.
                 self.interpreter.results.read(file='results', dir=path)
 
+                # Store the model selection criteria.
+                if self.elimination_gap != None:
+                    self.store_criteria(model=model)
+
                 # Jump to the next model.
                 continue
 
@@ -617,6 +709,10 @@ class Relax_disp:
             if model != MODEL_R2EFF and MODEL_R2EFF in self.models:
                 self.interpreter.value.copy(pipe_from=self.name_pipe(MODEL_R2EFF), pipe_to=model_pipe, param='r2eff')
 
+            # Skip the spin clusters for which the model cannot be selected.
+            if self.elimination_gap != None:
+                self.early_elimination(model=model)
+
             # Calculate the R2eff values for the fixed relaxation time period data types.
             if model == MODEL_R2EFF and not has_exponential_exp_type():
                 self.interpreter.minimise.calculate()
@@ -628,6 +724,10 @@ class Relax_disp:
             # Write out the results.
             self.write_results(path=path, model=model)
 
+            # Store the model selection criteria.
+            if self.elimination_gap != None:
+                self.store_criteria(model=model)
+
         # The final model selection data pipe.
         if len(self.models) >= 2:
             # Printout.
@@ -657,6 +757,35 @@ class Relax_disp:
         self.interpreter.state.save(state='final_state', dir=self.results_dir, force=True)
 
 
+    def store_criteria(self, model=None):
+        """Store the model selection criterion values of the current model for the early model elimination.
+
+        @keyword model: The current model.
+        @type model:    str
+        """
+
+        # Only the models used for model selection are compared.
+        if not self.is_model_for_selection(model):
+            return
+
+        # The model selection formula.
+        formula = {'AIC': aic, 'AICc': aicc, 'BIC': bic}[self.modsel]
+
+        # Loop over the spin clusters.
+        api = return_api()
+        for spin_ids in api.model_loop():
+            # The model statistics, skipping deselected clusters and failed optimisations.
+            k, n, chi2 = api.model_statistics(model_info=spin_ids)
+            if not n or chi2 == None:
+                continue
+
+            # Store the best criterion value.
+            key = tuple(spin_ids)
+            crit = formula(chi2, float(k), float(n))
+            if key not in self.cluster_crit or crit < self.cluster_crit[key]:
+                self.cluster_crit[key] = crit
+
+
     def write_results(self, path=None, model=None):
         """Create a set of results, text and Grace files for the current data pipe.
 
@@ -53,6 +53,7 @@ from specific_analyses.relax_disp.data import generate_r20_key, has_exponential_
 from status import Status; status = Status()
 
 if dep_check.matplotlib_module:
+    dep_check.import_module('matplotlib')
     import pylab as plt
     from matplotlib.font_manager import FontProperties
     fontP = FontProperties()
@@ -49,6 +49,7 @@ __all__ = [ 'align_tensor',
             'gui',
             'interatomic',
             'mol_res_spin',
+            'peak_intensity',
             'pipe_container',
             'prototype',
             'seq_align'
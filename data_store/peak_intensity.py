@@ -0,0 +1,574 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Module docstring.
+"""The spectrum indexed peak intensity matrix store of a data pipe.
+
+The peak intensities, their errors and any other per spectrum spin data are stored as rank-2 (spins x spectra) float arrays, with a boolean presence mask, together with rank-3 (simulations x spins x spectra) arrays for the Monte Carlo simulation data.  The spin container attributes, for example spin.peak_intensity[spectrum_id], are mapping views which read and write a single row of these arrays, holding no data themselves, so that all other relax code sees the same dictionary interface.  Plain dictionaries set by other code, created when loading a results or save file, or copied between data pipes are adopted into the store on demand.
+"""
+
+# Python module imports.
+from numpy import bool_, broadcast_to, count_nonzero, float64, full, ix_, nan, zeros
+
+# relax module imports.
+from lib.compat import MutableMapping
+from lib.errors import RelaxError
+
+
+class Peak_intensity_store(object):
+    """The (spins x spectra) matrix store of the peak intensity data of a data pipe."""
+
+    def __init__(self):
+        """Initialise the empty matrices."""
+
+        # The spectrum IDs of the columns, and the reverse look up table.
+        self.spectrum_ids = []
+        self._columns = {}
+
+        # The number of rows and the allocated matrix dimensions.
+        self._num_rows = 0
+        self._row_size = 0
+        self._col_size = 0
+
+        # The rank-2 data and presence matrices, and the rank-3 simulation matrices, per spin container attribute name.
+        self._data = {}
+        self._mask = {}
+        self._sim_data = {}
+        self._sim_mask = {}
+
+        # The sparse set of (attribute name, simulation index, row, column) cells holding values of None.
+        self._none = set()
+
+        # The Monte Carlo simulation views, keyed by the attribute name and row index, for their invalidation.
+        self._sim_views = {}
+
+
+    def __deepcopy__(self, memo):
+        """Replacement deepcopy method, as the views of the copied spin containers are plain dictionaries which will be adopted into a new store."""
+
+        # A new empty store.
+        return Peak_intensity_store()
+
+
+    def _resize(self, rows=None, cols=None):
+        """Enlarge all matrices, doubling the dimensions to amortise the cost.
+
+        @keyword rows:  The minimum number of rows required.
+        @type rows:     int
+        @keyword cols:  The minimum number of columns required.
+        @type cols:     int
+        """
+
+        # The new dimensions.
+        row_size = self._row_size
+        while row_size < rows:
+            row_size = max(2*row_size, 16)
+        col_size = self._col_size
+        while col_size < cols:
+            col_size = max(2*col_size, 4)
+
+        # Nothing to do.
+        if row_size == self._row_size and col_size == self._col_size:
+            return
+
+        # Copy the rank-2 matrices.
+        for field in self._data:
+            data = full((row_size, col_size), nan, float64)
+            mask = zeros((row_size, col_size), bool_)
+            data[:self._row_size, :self._col_size] = self._data[field]
+            mask[:self._row_size, :self._col_size] = self._mask[field]
+            self._data[field] = data
+            self._mask[field] = mask
+
+        # Copy the rank-3 simulation matrices.
+        for field in self._sim_data:
+            sims = self._sim_data[field].shape[0]
+            data = full((sims, row_size, col_size), nan, float64)
+            mask = zeros((sims, row_size, col_size), bool_)
+            data[:, :self._row_size, :self._col_size] = self._sim_data[field]
+            mask[:, :self._row_size, :self._col_size] = self._sim_mask[field]
+            self._sim_data[field] = data
+            self._sim_mask[field] = mask
+
+        # Store the dimensions.
+        self._row_size = row_size
+        self._col_size = col_size
+
+
+    def _field(self, field):
+        """Initialise the rank-2 matrices for the spin container attribute, if needed.
+
+        @param field:   The name of the spin container attribute.
+        @type field:    str
+        """
+
+        # Create the matrices.
+        if field not in self._data:
+            self._data[field] = full((self._row_size, self._col_size), nan, float64)
+            self._mask[field] = zeros((self._row_size, self._col_size), bool_)
+
+
+    def column(self, spectrum_id, create=False):
+        """Return the column index of the spectrum.
+
+        @param spectrum_id: The spectrum ID string.
+        @type spectrum_id:  str
+        @keyword create:    A flag which if True will add a new column for unknown spectra.
+        @type create:       bool
+        @return:            The column index, or None if the spectrum is unknown and create is False.
+        @rtype:             int or None
+        """
+
+        # A known spectrum.
+        if spectrum_id in self._columns:
+            return self._columns[spectrum_id]
+
+        # Unknown.
+        if not create:
+            return None
+
+        # Add the column.
+        col = len(self.spectrum_ids)
+        self._resize(rows=self._num_rows, cols=col+1)
+        self.spectrum_ids.append(spectrum_id)
+        self._columns[spectrum_id] = col
+
+        # Return the new index.
+        return col
+
+
+    def columns(self, spectrum_ids):
+        """Return the column indices of the spectra, adding columns for unknown spectra.
+
+        @param spectrum_ids:    The list of spectrum ID strings.
+        @type spectrum_ids:     list of str
+        @return:                The column indices.
+        @rtype:                 list of int
+        """
+
+        # Convert.
+        return [self.column(spectrum_id, create=True) for spectrum_id in spectrum_ids]
+
+
+    def _clear_none(self, field, sim, row):
+        """Remove the None cells of the row.
+
+        @param field:   The name of the spin container attribute.
+        @type field:    str
+        @param sim:     The Monte Carlo simulation index, or None for the rank-2 matrices.
+        @type sim:      None or int
+        @param row:     The row index.
+        @type row:      int
+        """
+
+        # Nothing to do.
+        if not self._none:
+            return
+
+        # Filter the set.
+        self._none = set(cell for cell in self._none if cell[:3] != (field, sim, row))
+
+
+    def delete_sims(self):
+        """Delete all of the Monte Carlo simulation matrices, invalidating all simulation views."""
+
+        # Invalidate the views, so that later use raises a RelaxError rather than reading or writing deleted data.
+        for views in self._sim_views.values():
+            for view in views:
+                view._store = None
+
+        # Reset the structures.
+        self._sim_data = {}
+        self._sim_mask = {}
+        self._sim_views = {}
+        self._none = set(cell for cell in self._none if cell[1] == None)
+
+
+    def matrix(self, field, rows, cols):
+        """Return a copy of the sub-matrix and presence mask for the given rows and columns.
+
+        @param field:   The name of the spin container attribute.
+        @type field:    str
+        @param rows:    The row indices, as returned by the rows() method.
+        @type rows:     list of int
+        @param cols:    The column indices, as returned by the columns() method.
+        @type cols:     list of int
+        @return:        The data sub-matrix, with NaN for missing data, and the boolean presence sub-matrix.
+        @rtype:         numpy rank-2 float64 array, numpy rank-2 bool array
+        """
+
+        # Initialise if needed.
+        self._field(field)
+
+        # Fancy indexing using the open mesh.
+        mesh = ix_(rows, cols)
+        data = self._data[field][mesh]
+        mask = self._mask[field][mesh]
+
+        # Return the copies.
+        return data, mask
+
+
+    def row(self, spin):
+        """Return the row index of the spin container, if it already has one.
+
+        @param spin:    The spin container.
+        @type spin:     SpinContainer instance
+        @return:        The row index, or None.
+        @rtype:         int or None
+        """
+
+        # Search the views of the spin.
+        for field in self._data:
+            obj = getattr(spin, field, None)
+            if isinstance(obj, Peak_intensity_view) and obj._store is self:
+                return obj._row
+
+        # No row.
+        return None
+
+
+    def rows(self, spins, field):
+        """Adopt the spin container attribute for all spins, returning the row indices.
+
+        @param spins:   The list of spin containers.
+        @type spins:    list of SpinContainer instances
+        @param field:   The name of the spin container attribute.
+        @type field:    str
+        @return:        The row indices.
+        @rtype:         list of int
+        """
+
+        # Adopt each spin.
+        return [self.view(spin, field)._row for spin in spins]
+
+
+    def set_matrix(self, field, rows, cols, data, mask=None):
+        """Set the sub-matrix for the given rows and columns.
+
+        @param field:   The name of the spin container attribute.
+        @type field:    str
+        @param rows:    The row indices, as returned by the rows() method.
+        @type rows:     list of int
+        @param cols:    The column indices, as returned by the columns() method.
+        @type cols:     list of int
+        @param data:    The data sub-matrix, or anything which can be broadcast to it.
+        @type data:     numpy rank-2 float64 array
+        @keyword mask:  The cells to set, defaulting to all cells.
+        @type mask:     None or numpy rank-2 bool array
+        """
+
+        # Initialise if needed.
+        self._field(field)
+
+        # The open mesh of the sub-matrix.
+        mesh = ix_(rows, cols)
+
+        # Set all cells.
+        if mask is None:
+            self._data[field][mesh] = data
+            self._mask[field][mesh] = True
+
+        # Set the masked cells only.
+        else:
+            sub_data = self._data[field][mesh]
+            sub_data[mask] = broadcast_to(data, mask.shape)[mask]
+            self._data[field][mesh] = sub_data
+            self._mask[field][mesh] |= mask
+
+        # The cells set to values are no longer None.
+        if self._none:
+            for i in range(len(rows)):
+                for j in range(len(cols)):
+                    if mask is None or mask[i, j]:
+                        self._none.discard((field, None, rows[i], cols[j]))
+
+
+    def sim_views(self, spin, field, sim_data):
+        """Pack the Monte Carlo simulation data into the simulation matrices, returning the views.
+
+        @param spin:        The spin container.
+        @type spin:         SpinContainer instance
+        @param field:       The name of the spin container attribute which has been simulated.
+        @type field:        str
+        @param sim_data:    The simulation data, as one dictionary per simulation.
+        @type sim_data:     list of dict of float
+        @return:            The views of the simulation data, one per simulation.
+        @rtype:             list of Peak_intensity_view instances
+        """
+
+        # The row of the spin.
+        row = self.view(spin, field)._row
+
+        # Initialise the simulation matrices, or enlarge them if there are more simulations, preserving the data of all other spins.
+        sims = len(sim_data)
+        if field not in self._sim_data:
+            self._sim_data[field] = full((sims, self._row_size, self._col_size), nan, float64)
+            self._sim_mask[field] = zeros((sims, self._row_size, self._col_size), bool_)
+        elif self._sim_data[field].shape[0] < sims:
+            old_sims = self._sim_data[field].shape[0]
+            data = full((sims, self._row_size, self._col_size), nan, float64)
+            mask = zeros((sims, self._row_size, self._col_size), bool_)
+            data[:old_sims] = self._sim_data[field]
+            mask[:old_sims] = self._sim_mask[field]
+            self._sim_data[field] = data
+            self._sim_mask[field] = mask
+
+        # Invalidate the previous views of the row, as these are replaced.
+        for view in self._sim_views.get((field, row), []):
+            view._store = None
+
+        # Clear the row in all simulation planes.
+        self._sim_data[field][:, row] = nan
+        self._sim_mask[field][:, row] = False
+        for i in range(self._sim_data[field].shape[0]):
+            self._clear_none(field, i, row)
+
+        # Create and register the views.
+        views = []
+        for i in range(sims):
+            views.append(Peak_intensity_view(self, field, row, sim=i))
+            views[i].update(sim_data[i])
+        self._sim_views[field, row] = views
+
+        # Return the views.
+        return views
+
+
+    def view(self, spin, field):
+        """Return the view of the spin container attribute, adopting any plain dictionary into the store.
+
+        @param spin:    The spin container.
+        @type spin:     SpinContainer instance
+        @param field:   The name of the spin container attribute.
+        @type field:    str
+        @return:        The view, which is also set as the spin container attribute.
+        @rtype:         Peak_intensity_view instance
+        """
+
+        # Already a view into this store.
+        obj = getattr(spin, field, None)
+        if isinstance(obj, Peak_intensity_view) and obj._store is self and obj._field == field and obj._sim == None:
+            return obj
+
+        # The current contents, copied in case the object is a view into the same row.
+        contents = []
+        if obj != None:
+            contents = list(obj.items())
+
+        # Initialise if needed.
+        self._field(field)
+
+        # The row, creating a new one if needed.
+        row = self.row(spin)
+        if row == None:
+            row = self._num_rows
+            self._resize(rows=row+1, cols=len(self.spectrum_ids))
+            self._num_rows += 1
+
+        # Create the view and copy in the data.
+        view = Peak_intensity_view(self, field, row)
+        view.clear()
+        for key, value in contents:
+            view[key] = value
+
+        # Replace the spin container attribute.
+        setattr(spin, field, view)
+
+        # Return the view.
+        return view
+
+
+
+
+
+class Peak_intensity_view(MutableMapping):
+    """A dictionary of spectrum ID keys as a view into one row of the peak intensity matrix store.
+
+    The view holds no data itself, all reads and writes go directly to the row of the data and presence matrices of the store.  Values of None are stored as NaN in the data matrix and recorded in the sparse set of None cells of the store.  Copies, deep copies and pickles of the view are plain dictionaries.
+    """
+
+    def __init__(self, store, field, row, sim=None):
+        """Set up the view.
+
+        @param store:   The peak intensity matrix store.
+        @type store:    Peak_intensity_store instance
+        @param field:   The name of the spin container attribute.
+        @type field:    str
+        @param row:     The row index of the spin.
+        @type row:      int
+        @keyword sim:   The Monte Carlo simulation index for simulation data views.
+        @type sim:      None or int
+        """
+
+        # Store the arguments.
+        self._store = store
+        self._field = field
+        self._row = row
+        self._sim = sim
+
+
+    def __contains__(self, key):
+        """Determine if the spectrum ID is present."""
+
+        # The row and column.
+        mask = self._rows()[1]
+        col = self._store.column(key)
+
+        # Check the presence mask.
+        return col != None and bool(mask[col])
+
+
+    def __delitem__(self, key):
+        """Remove the spectrum ID."""
+
+        # The row and column.
+        data, mask = self._rows()
+        col = self._store.column(key)
+
+        # Missing.
+        if col == None or not mask[col]:
+            raise KeyError(key)
+
+        # Clear the cell.
+        data[col] = nan
+        mask[col] = False
+        self._store._none.discard((self._field, self._sim, self._row, col))
+
+
+    def __getitem__(self, key):
+        """Return the value for the spectrum ID."""
+
+        # The row and column.
+        data, mask = self._rows()
+        col = self._store.column(key)
+
+        # Missing.
+        if col == None or not mask[col]:
+            raise KeyError(key)
+
+        # A value of None.
+        if (self._field, self._sim, self._row, col) in self._store._none:
+            return None
+
+        # The value.
+        return float(data[col])
+
+
+    def __iter__(self):
+        """Iterate over the spectrum IDs present, in the column order of the store."""
+
+        # The present columns.
+        mask = self._rows()[1]
+        ids = self._store.spectrum_ids
+
+        # Iterate over a copy, so the view can be modified during the iteration.
+        return iter([ids[col] for col in mask.nonzero()[0]])
+
+
+    def __len__(self):
+        """Return the number of spectrum IDs present."""
+
+        # Count the presence mask.
+        return int(count_nonzero(self._rows()[1]))
+
+
+    def __reduce__(self):
+        """Copies and pickles are plain dictionaries."""
+
+        # A plain dictionary.
+        return (dict, (dict(self.items()),))
+
+
+    def __reduce_ex__(self, protocol):
+        """Copies and pickles are plain dictionaries."""
+
+        # A plain dictionary.
+        return self.__reduce__()
+
+
+    def __repr__(self):
+        """The representation of the equivalent dictionary."""
+
+        # Convert.
+        return repr(dict(self.items()))
+
+
+    def __setitem__(self, key, value):
+        """Set the value for the spectrum ID."""
+
+        # The row and column.
+        data, mask = self._rows()
+        col = self._store.column(key)
+
+        # Add a new column, fetching the row again as the matrices may have been enlarged.
+        if col == None:
+            col = self._store.column(key, create=True)
+            data, mask = self._rows()
+
+        # Set the cell.
+        cell = (self._field, self._sim, self._row, col)
+        if value is None:
+            data[col] = nan
+            self._store._none.add(cell)
+        else:
+            data[col] = value
+            self._store._none.discard(cell)
+        mask[col] = True
+
+
+    def _rows(self):
+        """Return the data and presence rows of the view.
+
+        @raises RelaxError: If the Monte Carlo simulation data of the view has been deleted.
+        @return:            The rows of the data and presence matrices of the store.
+        @rtype:             numpy rank-1 float64 array, numpy rank-1 bool array
+        """
+
+        # Invalidated simulation views.
+        if self._store == None:
+            raise RelaxError("The Monte Carlo simulation peak intensity data has been deleted.")
+
+        # The rows of the rank-2 matrices.
+        if self._sim == None:
+            return self._store._data[self._field][self._row], self._store._mask[self._field][self._row]
+
+        # The rows of the simulation planes.
+        return self._store._sim_data[self._field][self._sim, self._row], self._store._sim_mask[self._field][self._sim, self._row]
+
+
+    def clear(self):
+        """Remove all spectrum IDs."""
+
+        # Clear the row.
+        data, mask = self._rows()
+        data[:] = nan
+        mask[:] = False
+
+        # Remove the None cells of the row.
+        self._store._clear_none(self._field, self._sim, self._row)
+
+
+    def copy(self):
+        """Return a plain dictionary copy."""
+
+        # Copy.
+        return dict(self.items())
@@ -25,13 +25,117 @@
 """Module for checking relax dependencies.
 
 If essential dependencies are missing, then an error message is printed and the program terminated.
+
+To minimise the program start up time, the optional dependencies are not imported.  Instead their availability is determined by looking up the module specification, and the modules are only imported on first use via the import_module() function.
 """
 
 # Python modules.
+import importlib
 import platform
-from os import F_OK, access, environ, sep
+from os import F_OK, X_OK, access, environ, pathsep, sep
 from re import sub
 import sys
+try:
+    from importlib.util import find_spec
+except ImportError:
+    find_spec = None
+    import imp
+
+
+def import_module(name):
+    """Import an optional dependency on first use.
+
+    @param name:    The name of the module.
+    @type name:     str
+    @return:        The module, or None if it is not installed or cannot be imported.
+    @rtype:         module or None
+    """
+
+    # Import the module.
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        return None
+
+    # Force matplotlib to not use any Xwindows backend.
+    if name == 'matplotlib' and not "DISPLAY" in environ and not 'matplotlib.pyplot' in sys.modules:
+        module.use('Agg')
+
+    # Return the module.
+    return module
+
+
+def import_wx():
+    """Import the wx module and determine its version, for the GUI.
+
+    This sets the wx_module, wx_module_message, wx_classic and wx_stable module variables.
+
+
+    @return:    True if the wx module can be imported.
+    @rtype:     bool
+    """
+
+    # The global variables.
+    global wx_module, wx_module_message, wx_classic, wx_stable
+
+    # Import the module (detecting the Phoenix).
+    try:
+        import wx
+        wx_module = True
+        if version_comparison("%i.%i.%i" % (wx.VERSION[0], wx.VERSION[1], wx.VERSION[2]), "3.0.3") != -1:
+            wx_classic = False
+            if version_comparison("%i.%i.%i" % (wx.VERSION[0], wx.VERSION[1], wx.VERSION[2]), "6.0.0") != 1:
+                wx_stable = False
+    except ImportError:
+        wx_module = False
+        message = sys.exc_info()[1]
+        wx_module_message = message.args[0]
+
+    # Return the status.
+    return wx_module
+
+
+def module_available(name):
+    """Determine if a module is installed, without importing it.
+
+    @param name:    The name of the top level module or package.
+    @type name:     str
+    @return:        True if the module can be found.
+    @rtype:         bool
+    """
+
+    # Python 3.
+    if find_spec != None:
+        try:
+            return find_spec(name) != None
+        except (ImportError, ValueError):
+            return False
+
+    # Python 2.
+    try:
+        imp.find_module(name)
+        return True
+    except ImportError:
+        return False
+
+
+def program_available(name):
+    """Determine if an external program is in the system path, without executing it.
+
+    @param name:    The name of the program.
+    @type name:     str
+    @return:        True if the program can be found.
+    @rtype:         bool
+    """
+
+    # Loop over the directories of the system path.
+    for dir in environ.get('PATH', '').split(pathsep):
+        file = dir + sep + name
+        if dir and access(file, X_OK):
+            return True
+
+    # Not found.
+    return False
 
 
 def version_comparison(version1, version2):
@@ -102,33 +206,17 @@ except ImportError:
 # Optional packages.
 ####################
 # Bmrblib python package check.
-try:
-    import bmrblib
-    bmrblib_module = True
-except ImportError:
-    bmrblib_module = False
+bmrblib_module = module_available('bmrblib')
 
-# wx module (detecting the Phoenix).
+# wx module (the version is only determined when the GUI calls import_wx()).
 wx_classic = True
 wx_stable = True
-try:
-    import wx
-    wx_module = True
-    if version_comparison("%i.%i.%i" % (wx.VERSION[0], wx.VERSION[1], wx.VERSION[2]), "3.0.3") != -1:
-        wx_classic = False
-        if version_comparison("%i.%i.%i" % (wx.VERSION[0], wx.VERSION[1], wx.VERSION[2]), "6.0.0") != 1:
-            wx_stable = False
-except ImportError:
-    wx_module = False
-    message = sys.exc_info()[1]
-    wx_module_message = message.args[0]
+wx_module = module_available('wx')
+if not wx_module:
+    wx_module_message = "No module named 'wx'"
 
 # epydoc module.
-try:
-    import epydoc
-    epydoc_module = True
-except ImportError:
-    epydoc_module = False
+epydoc_module = module_available('epydoc')
 
 # Readline module (avoiding the damned ^[[?1034h escape code on Linux systems).
 try:
@@ -140,15 +228,8 @@ try:
 except ImportError:
     readline_module = False
 
-# matplotlib module.
-try:
-    import matplotlib
-    matplotlib_module = True
-    if not "DISPLAY" in environ:
-        # Force matplotlib to not use any Xwindows backend.
-        matplotlib.use('Agg')
-except ImportError:
-    matplotlib_module = False
+# matplotlib module (the Xwindows backend is deactivated by import_module()).
+matplotlib_module = module_available('matplotlib')
 
 # runpy module.
 try:
@@ -199,28 +280,14 @@ except ImportError:
     io_module_message = message.args[0]
 
 # Scipy import.
-try:
-    import scipy
-    scipy_module = True
-except:
-    scipy_module = False
+scipy_module = module_available('scipy')
 
-# VMD module imports.
-try:
-    from Scientific.Visualization import VMD    # This requires Numeric to be installed (at least in Scientific 2.7.8).
-    del VMD
-    vmd_module = True
-except:
-    vmd_module = False
+# VMD module imports (Scientific.Visualization.VMD also requires Numeric to be installed, at least in Scientific 2.7.8).
+vmd_module = module_available('Scientific') and module_available('Numeric')
 
 # mpi4py.
-try:
-    import mpi4py
-    mpi4py_module = True
-except ImportError:
-    message = sys.exc_info()[1]
-    mpi4py_module = False
-
+mpi4py_module = module_available('mpi4py')
+if not mpi4py_module:
     # The error message.
     mpi4py_message = """The dependency 'mpi4py' has not been installed. You should either:
 
@@ -232,12 +299,7 @@ except ImportError:
     """
 
 # PyMOL.
-try:
-    import pymol
-    pymol_module = True
-except ImportError:
-    message = sys.exc_info()[1]
-    pymol_module = False
+pymol_module = module_available('pymol')
 
 # XML.
 try:
@@ -267,39 +329,8 @@ except ImportError:
     subprocess_module = False
     subprocess_module_message = message.args[0]
 
-# NMRPipe showApod
-if subprocess_module:
-    try:
-        # Call function.
-        Temp = subprocess.Popen('showApod', stdout=subprocess.PIPE)
-
-        # Communicate with program, and get output and error output.
-        (output, errput) = Temp.communicate()
-
-        # Wait for finish and get return code.
-        return_value = Temp.wait()
-
-        # Split the output into lines.
-        line_split = output.splitlines()
-
-        # The first line, decoding Python 3 byte arrays.
-        line = line_split[0]
-        if hasattr(line, 'decode'):
-            line = line.decode()
-
-        # Now make test.
-        if line == 'showApod: Show Effect of Processing on Noise and Linewidth.':
-            showApod_software = True
-        else:
-            showApod_software = False
-
-    # If software not available.
-    except OSError:
-        showApod_software = False
-
-# If subprocess module not available, then do not allow showApod.
-else:
-    showApod_software = False
+# NMRPipe showApod (the program is not executed, to avoid the start up cost).
+showApod_software = subprocess_module and program_available('showApod')
 
 # ctypes module.
 try:
@@ -0,0 +1,183 @@
+#! /usr/bin/env python
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+"""Benchmark of the relax program start up times.
+
+The wall clock times are measured for 'relax --version', for the execution of a trivial script, and for the same script executed with MPI slave processors.  To run the benchmark, type:
+
+$ python devel_scripts/startup_timing.py [number of repetitions] [number of MPI processes]
+
+The defaults are 5 repetitions and 4 MPI processes.  The MPI benchmark is skipped if the mpirun program or the mpi4py Python module cannot be found.
+
+Prior to the benchmark, the user function definitions are initialised in a fresh Python process to check that none of the specific analysis implementation modules are imported at start up.  The script exits with a non-zero status if any are found.
+"""
+
+# Python module imports.
+from os import X_OK, access, close, devnull, environ, pathsep, remove, sep
+from os.path import abspath, dirname
+from subprocess import PIPE, Popen, call
+import sys
+from tempfile import mkstemp
+from time import time
+
+
+# The relax base directory.
+RELAX_PATH = abspath(dirname(abspath(__file__)) + sep + '..')
+
+# The benchmark settings.
+REPEATS = 5
+PROCESSES = 4
+if len(sys.argv) > 1:
+    REPEATS = int(sys.argv[1])
+if len(sys.argv) > 2:
+    PROCESSES = int(sys.argv[2])
+
+# The trivial relax script.
+SCRIPT = "pipe.create('timing', 'mf')\n"
+
+# The code for listing the modules loaded by the user function definitions.
+MODULE_CODE = """
+import sys
+sys.path.insert(0, %s)
+import user_functions
+user_functions.initialise()
+for name in sorted(sys.modules):
+    sys.stdout.write(name + '\\n')
+""" % repr(RELAX_PATH)
+
+# The module name endings of the specific analysis implementation, which should only be imported on use.
+LAZY_MODULES = ['.api', '.data', '.optimisation', '.parameters']
+
+
+def check_modules():
+    """Check that the user function definitions do not import the specific analysis implementations.
+
+    @return:    The names of the modules which should not have been imported.
+    @rtype:     list of str
+    """
+
+    # The modules loaded in a fresh Python process.
+    process = Popen([sys.executable, '-c', MODULE_CODE], stdout=PIPE, cwd=RELAX_PATH, universal_newlines=True)
+    names = process.communicate()[0].split()
+
+    # Failure.
+    if process.returncode:
+        sys.stdout.write("The user function definitions could not be initialised.\n")
+        sys.exit(process.returncode)
+
+    # Find the implementation modules of the analyses, excluding the API dispatcher.
+    bad = []
+    for name in names:
+        if name.startswith('specific_analyses.') and name != 'specific_analyses.api':
+            for ending in LAZY_MODULES:
+                if name.endswith(ending):
+                    bad.append(name)
+
+    # Return the list.
+    return bad
+
+
+def find_program(name):
+    """Find a program in the system path.
+
+    @param name:    The name of the program.
+    @type name:     str
+    @return:        The full path to the program, or None if not found.
+    @rtype:         str or None
+    """
+
+    # Loop over the directories of the system path.
+    for dir in environ.get('PATH', '').split(pathsep):
+        file = dir + sep + name
+        if dir and access(file, X_OK):
+            return file
+
+
+def time_command(title, command):
+    """Time the execution of the command.
+
+    @param title:   The title for the printout.
+    @type title:    str
+    @param command: The command and its arguments.
+    @type command:  list of str
+    """
+
+    # Execute the command multiple times.
+    times = []
+    null = open(devnull, 'w')
+    for i in range(REPEATS):
+        start = time()
+        return_code = call(command, stdout=null, stderr=null, cwd=RELAX_PATH)
+        times.append(time() - start)
+
+        # Failure.
+        if return_code:
+            sys.stdout.write("%-45s failed with the return code %s.\n" % (title, return_code))
+            null.close()
+            return
+    null.close()
+
+    # Printout.
+    sys.stdout.write("%-45s min %8.3f s, mean %8.3f s\n" % (title, min(times), sum(times) / len(times)))
+
+
+
+# Create the script.
+handle, script = mkstemp(suffix='.py')
+close(handle)
+file = open(script, 'w')
+file.write(SCRIPT)
+file.close()
+
+# The relax command.
+relax = [sys.executable, RELAX_PATH + sep + 'relax']
+
+# Check the modules imported at start up.
+bad = check_modules()
+if bad:
+    sys.stdout.write("The user function definitions import the following modules which should only be imported on use:\n")
+    for name in bad:
+        sys.stdout.write("    %s\n" % name)
+    remove(script)
+    sys.exit(1)
+sys.stdout.write("No specific analysis implementation modules are imported by the user function definitions.\n\n")
+
+# Printout.
+sys.stdout.write("relax start up times for %s repetitions.\n\n" % REPEATS)
+
+# The benchmarks.
+try:
+    time_command("relax --version", relax + ['--version'])
+    time_command("relax trivial_script.py", relax + [script])
+
+    # MPI slave start up.
+    mpirun = find_program('mpirun')
+    if mpirun == None:
+        sys.stdout.write("Skipping the MPI benchmark, mpirun cannot be found.\n")
+    elif call([sys.executable, '-c', 'import mpi4py'], stderr=open(devnull, 'w')):
+        sys.stdout.write("Skipping the MPI benchmark, the mpi4py module cannot be imported.\n")
+    else:
+        time_command("relax --multi mpi4py (%i processes)" % PROCESSES, [mpirun, '-np', str(PROCESSES)] + relax + ['--multi', 'mpi4py', script])
+
+# Clean up.
+finally:
+    remove(script)
@@ -27,6 +27,8 @@ This GUI was announced in the post at U{https://web.archive.org/web/https://mail
 
 # Deps.
 import dep_check
+if dep_check.wx_module:
+    dep_check.import_wx()
 
 # Python module imports.
 import sys
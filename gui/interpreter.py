@@ -81,7 +81,7 @@ class Interpreter(object):
         info = uf_info.get_uf(uf)
 
         # Return the backend.
-        return info.backend
+        return info.get_backend()
 
 
     def apply(self, uf, *args, **kwds):
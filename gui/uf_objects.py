@@ -52,6 +52,7 @@ from lib.text.string import strip_lead
 from status import Status; status = Status()
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.data import Uf_tables; uf_tables = Uf_tables()
+from user_functions.objects import import_backend
 
 
 def build_uf_menus(parent=None, menubar=None):
@@ -567,13 +568,21 @@ class Uf_page(Wiz_page):
             if not dim and 'all' in arg['container_types']:
                 dim = ()
 
+            # The file selection dialog wildcard and directory selection dialog style.
+            wildcard = arg['wiz_filesel_wildcard']
+            if wildcard == None:
+                wildcard = wx.FileSelectorDefaultWildcardStr
+            dir_style = arg['wiz_dirsel_style']
+            if dir_style == None:
+                dir_style = wx.DD_DEFAULT_STYLE
+
             # Special arg type:  file selection dialog.
             if arg['arg_type'] in ['file sel read', 'file sel write']:
                 if arg['arg_type'] == 'file sel read':
                     style = FD_OPEN
                 if arg['arg_type'] == 'file sel write':
                     style = FD_SAVE
-                self.uf_args[arg['name']] = Selector_file(name=arg['name'], parent=self, default=arg['default'], sizer=sizer, desc=desc, wildcard=arg['wiz_filesel_wildcard'], style=style, tooltip=arg['desc'], divider=self._div_left, height_element=self.height_element, preview=arg['wiz_filesel_preview'], read_only=arg['wiz_read_only'])
+                self.uf_args[arg['name']] = Selector_file(name=arg['name'], parent=self, default=arg['default'], sizer=sizer, desc=desc, wildcard=wildcard, style=style, tooltip=arg['desc'], divider=self._div_left, height_element=self.height_element, preview=arg['wiz_filesel_preview'], read_only=arg['wiz_read_only'])
 
             # Special arg type:  multiple file selection dialog.
             elif arg['arg_type'] in ['file sel multi read', 'file sel multi write']:
@@ -581,7 +590,7 @@ class Uf_page(Wiz_page):
                     style = FD_OPEN
                 if arg['arg_type'] == 'file sel multi write':
                     style = FD_SAVE
-                self.uf_args[arg['name']] = Selector_file_multiple(name=arg['name'], parent=self, default=arg['default'], sizer=sizer, desc=desc, wildcard=arg['wiz_filesel_wildcard'], style=style, tooltip=arg['desc'], divider=self._div_left, height_element=self.height_element, preview=arg['wiz_filesel_preview'], read_only=arg['wiz_read_only'])
+                self.uf_args[arg['name']] = Selector_file_multiple(name=arg['name'], parent=self, default=arg['default'], sizer=sizer, desc=desc, wildcard=wildcard, style=style, tooltip=arg['desc'], divider=self._div_left, height_element=self.height_element, preview=arg['wiz_filesel_preview'], read_only=arg['wiz_read_only'])
 
             # Special arg type:  dir arg.
             elif arg['arg_type'] == 'dir':
@@ -589,7 +598,7 @@ class Uf_page(Wiz_page):
 
             # Special arg type:  directory selection dialog.
             elif arg['arg_type'] == 'dir sel':
-                self.uf_args[arg['name']] = Selector_dir(name=arg['name'], parent=self, default=arg['default'], sizer=sizer, desc=desc, style=arg['wiz_dirsel_style'], tooltip=arg['desc'], divider=self._div_left, height_element=self.height_element, read_only=arg['wiz_read_only'])
+                self.uf_args[arg['name']] = Selector_dir(name=arg['name'], parent=self, default=arg['default'], sizer=sizer, desc=desc, style=dir_style, tooltip=arg['desc'], divider=self._div_left, height_element=self.height_element, read_only=arg['wiz_read_only'])
 
             # Special arg type:  free format file settings.
             elif arg['arg_type'] == 'free format':
@@ -994,6 +1003,9 @@ class Uf_page(Wiz_page):
             if iterator == None:
                 continue
 
+            # Import the iterator method if given as a string.
+            iterator = import_backend(iterator)
+
             # Get the new choices and data (in a safe way).
             try:
                 choices = []
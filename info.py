@@ -367,6 +367,14 @@ class Info_box(object):
         version.append("Version")
         path.append("Path")
 
+        # Import the optional packages.
+        bmrblib = dep_check.import_module('bmrblib')
+        scipy = dep_check.import_module('scipy')
+        wx = dep_check.import_module('wx')
+        matplotlib = dep_check.import_module('matplotlib')
+        mpi4py = dep_check.import_module('mpi4py')
+        epydoc = dep_check.import_module('epydoc')
+
         # minfx.
         package.append('minfx')
         status.append(True)
@@ -379,15 +387,14 @@ class Info_box(object):
         # bmrblib.
         package.append('bmrblib')
         status.append(dep_check.bmrblib_module)
-        try:
-            if hasattr(dep_check.bmrblib, '__version__'):
-                version.append(dep_check.bmrblib.__version__)
-            else:
-                version.append('Unknown')
-        except:
+        if bmrblib == None:
             version.append('')
+        elif hasattr(bmrblib, '__version__'):
+            version.append(bmrblib.__version__)
+        else:
+            version.append('Unknown')
         try:
-            path.append(dep_check.bmrblib.__path__[0])
+            path.append(bmrblib.__path__[0])
         except:
             path.append('')
 
@@ -405,8 +412,8 @@ class Info_box(object):
         package.append('scipy')
         status.append(dep_check.scipy_module)
         try:
-            version.append(dep_check.scipy.version.version)
-            path.append(dep_check.scipy.__path__[0])
+            version.append(scipy.version.version)
+            path.append(scipy.__path__[0])
         except:
             version.append('')
             path.append('')
@@ -415,8 +422,8 @@ class Info_box(object):
         package.append('wxPython')
         status.append(dep_check.wx_module)
         try:
-            version.append(dep_check.wx.version())
-            path.append(dep_check.wx.__path__[0])
+            version.append(wx.version())
+            path.append(wx.__path__[0])
         except:
             version.append('')
             path.append('')
@@ -425,8 +432,8 @@ class Info_box(object):
         package.append('matplotlib')
         status.append(dep_check.matplotlib_module)
         try:
-            version.append(dep_check.matplotlib.__version__)
-            path.append(dep_check.matplotlib.__path__[0])
+            version.append(matplotlib.__version__)
+            path.append(matplotlib.__path__[0])
         except:
             version.append('')
             path.append('')
@@ -435,8 +442,8 @@ class Info_box(object):
         package.append('mpi4py')
         status.append(dep_check.mpi4py_module)
         try:
-            version.append(dep_check.mpi4py.__version__)
-            path.append(dep_check.mpi4py.__path__[0])
+            version.append(mpi4py.__version__)
+            path.append(mpi4py.__path__[0])
 
             # MPI version.
             try:
@@ -454,8 +461,8 @@ class Info_box(object):
         package.append('epydoc')
         status.append(dep_check.epydoc_module)
         try:
-            version.append(dep_check.epydoc.__version__)
-            path.append(dep_check.epydoc.__path__[0])
+            version.append(epydoc.__version__)
+            path.append(epydoc.__path__[0])
         except:
             version.append('')
             path.append('')
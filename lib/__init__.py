@@ -44,6 +44,7 @@ __all__ = [
     'mathematics',
     'model_selection',
     'nmr',
+    'optimisation_cache',
     'order',
     'periodic_table',
     'physical_constants',
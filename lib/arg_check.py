@@ -89,6 +89,77 @@ from lib.errors import RelaxError, \
 from lib.io import DummyFileObject
 
 
+# The exact Python types of the basic data types, for the fast validation of rank-0 arguments.
+FAST_TYPES = {
+    'bool': [bool],
+    'float': [float],
+    'func': [FunctionType, MethodType],
+    'int': [int],
+    'number': [float, int],
+    'str': [str]
+}
+
+
+def compile_validator(name=None, dim=tuple(), basic_types=[], container_types=[], can_be_none=False, can_be_empty=False, none_elements=False):
+    """Create a function for validating an argument against a fixed specification.
+
+    The specification is processed once, so that repeated validation is fast.  Arguments of None (if allowed) and rank-0 arguments whose exact type is one of the common basic Python types listed in FAST_TYPES are accepted without further checks.  All other arguments are passed to validate_arg() for the full checks and the detailed RelaxError feedback.  See validate_arg() for the description of the specification.
+
+
+    @keyword name:              The plain English name of the argument, used in the RelaxError printout.
+    @type name:                 str
+    @keyword dim:               The dimensions of the object to check.
+    @type dim:                  tuple of (int or None) or list of tuples of (int or None)
+    @keyword basic_types:       The types of values are allowed for the argument.
+    @type basic_types:          list of str
+    @keyword container_types:   The container types allowed for the argument.
+    @type container_types:      list of str
+    @keyword can_be_none:       A flag specifying if the argument can be none.
+    @type can_be_none:          bool
+    @keyword can_be_empty:      A flag which if True allows container types to be empty.
+    @type can_be_empty:         bool
+    @keyword none_elements:     A flag which if True allows container types to contain None.
+    @type none_elements:        bool
+    @raise RelaxError:          If the specification is invalid.
+    @return:                    The validation function.  This accepts the argument as its only argument and returns True or raises a RelaxError, as for validate_arg().
+    @rtype:                     function
+    """
+
+    # Check the specification.
+    if 'number array' in container_types:
+        for type in basic_types:
+            if type not in ['float', 'int', 'number']:
+                raise RelaxError("The 'number array' container type does not support the '%s' basic Python data type." % type)
+    if 'number' in basic_types and ('int' in basic_types or 'float' in basic_types):
+        raise RelaxError("The 'int' or 'float' basic data types cannot be supplied if 'number' is a basic type.")
+
+    # No type-checking.
+    if 'all' in basic_types and 'all' in container_types:
+        return lambda arg: True
+
+    # The exact types of the rank-0 arguments which can be accepted without further checks.
+    fast_types = set()
+    if (isinstance(dim, list) and tuple() in dim) or dim == tuple():
+        for type in basic_types:
+            if type in FAST_TYPES:
+                fast_types.update(FAST_TYPES[type])
+
+    # The validation function.
+    def validator(arg):
+        # The fast paths.
+        if arg is None:
+            if can_be_none:
+                return True
+        elif arg.__class__ in fast_types:
+            return True
+
+        # The full checks.
+        return validate_arg(arg, name, dim=dim, basic_types=basic_types, container_types=container_types, can_be_none=can_be_none, can_be_empty=can_be_empty, none_elements=none_elements)
+
+    # Return the function.
+    return validator
+
+
 def is_bool(arg, name=None, can_be_none=False, raise_error=True):
     """Test if the argument is a Boolean.
 
@@ -79,6 +79,12 @@ if PY_VERSION == 2:
 else:
     import builtins
 
+# The abstract base classes of the dictionary interface.
+if PY_VERSION == 2:
+    from collections import Mapping, MutableMapping
+else:
+    from collections.abc import Mapping, MutableMapping
+
 # The queue module.
 if PY_VERSION == 2:
     import Queue as queue
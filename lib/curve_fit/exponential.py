@@ -24,6 +24,65 @@
 
 # Python module imports.
 from math import exp
+from numpy import absolute, bool_, exp as exp_array, float64, full, inf, log, maximum, ones, sqrt, where, zeros
+
+
+def _batch_evaluate(rate=None, i0=None, times=None, values=None, inv_err=None):
+    """Calculate the weighted residuals, chi-squared values and weighted Jacobians of many two parameter decreasing exponential curves.
+
+    @keyword rate:      The exponential rates.
+    @type rate:         numpy rank-1 float array
+    @keyword i0:        The initial intensities.
+    @type i0:           numpy rank-1 float array
+    @keyword times:     The time points, one row per curve.
+    @type times:        numpy rank-2 float array
+    @keyword values:    The intensity values, one row per curve.
+    @type values:       numpy rank-2 float array
+    @keyword inv_err:   The inverse of the intensity errors, with zeros for the padding points.
+    @type inv_err:      numpy rank-2 float array
+    @return:            The chi-squared values, the weighted residuals, and the weighted Jacobian columns for the rate and i0 parameters.
+    @rtype:             numpy rank-1 float array and 3 numpy rank-2 float arrays
+    """
+
+    # The exponential decay.
+    decay = exp_array(-rate[:, None] * times)
+
+    # The weighted residuals and Jacobian.
+    resid = (values - i0[:, None] * decay) * inv_err
+    jac_rate = -times * i0[:, None] * decay * inv_err
+    jac_i0 = decay * inv_err
+
+    # Return the values.
+    return (resid**2).sum(axis=1), resid, jac_rate, jac_i0
+
+
+def _batch_covar_errors(jac_rate=None, jac_i0=None):
+    """Calculate the parameter errors of many two parameter curves from the covariance matrix, the inverse of J^T.W.J.
+
+    @keyword jac_rate:  The weighted Jacobian column for the rate parameter, one row per curve.
+    @type jac_rate:     numpy rank-2 float array
+    @keyword jac_i0:    The weighted Jacobian column for the i0 parameter, one row per curve.
+    @type jac_i0:       numpy rank-2 float array
+    @return:            The rate and i0 errors, set to infinity for singular matrices.
+    @rtype:             tuple of 2 numpy rank-1 float arrays
+    """
+
+    # The elements of the symmetric 2x2 matrix J^T.W.J.
+    jtj_rr = (jac_rate**2).sum(axis=1)
+    jtj_ri = (jac_rate*jac_i0).sum(axis=1)
+    jtj_ii = (jac_i0**2).sum(axis=1)
+
+    # The determinant, with linearly-dependent columns (within rounding errors) being treated as singular.
+    det = jtj_rr*jtj_ii - jtj_ri**2
+    singular = det <= 1e-12 * jtj_rr*jtj_ii
+    det = where(singular, 1.0, det)
+
+    # The square root of the diagonal of the inverse.
+    rate_err = where(singular, inf, sqrt(absolute(jtj_ii / det)))
+    i0_err = where(singular, inf, sqrt(absolute(jtj_rr / det)))
+
+    # Return the errors.
+    return rate_err, i0_err
 
 
 def exponential_2param_neg(rate=None, i0=None, x=None, y=None):
@@ -45,3 +104,124 @@ def exponential_2param_neg(rate=None, i0=None, x=None, y=None):
     # Loop over the x-values.
     for i in range(len(x)):
         y[i] = i0 * exp(-rate*x[i])
+
+
+def exponential_2param_neg_batch(times=None, values=None, errors=None, mask=None, func_tol=1e-15, max_iterations=1000):
+    """Fit many standard two parameter decreasing exponential curves simultaneously.
+
+    The curves are packed into rank-2 arrays, one row per curve, padded to the length of the longest curve.  The parameters [rate, i0] of all curves are initialised by solving the linear least squares problem ln(y) = ln(i0) - rate * x, and are then optimised in parallel using the Levenberg-Marquardt algorithm, with one damping factor per curve.  The errors are calculated from the covariance matrix, the inverse of J^T.W.J, at the solution.
+
+
+    @keyword times:             The time points, one row per curve.
+    @type times:                numpy rank-2 float array
+    @keyword values:            The measured intensity values, one row per curve.
+    @type values:               numpy rank-2 float array
+    @keyword errors:            The standard deviations of the intensity values, one row per curve.
+    @type errors:               numpy rank-2 float array
+    @keyword mask:              The padding mask, where True corresponds to a real data point.  If None, all points are used.
+    @type mask:                 None or numpy rank-2 bool array
+    @keyword func_tol:          The relative chi-squared change which, when reached, terminates optimisation of the curve.
+    @type func_tol:             float
+    @keyword max_iterations:    The maximum number of iterations.
+    @type max_iterations:       int
+    @return:                    The rates, initial intensities, rate errors, initial intensity errors, chi-squared values and the number of iterations for each curve.
+    @rtype:                     tuple of 5 rank-1 float arrays and a rank-1 int array
+    """
+
+    # The mask and weights, with padding points having zero weight.
+    if mask is None:
+        mask = ones(values.shape, bool_)
+    times = where(mask, times, 0.0)
+    values = where(mask, values, 0.0)
+    inv_err = where(mask, 1.0 / where(mask, errors, 1.0), 0.0)
+
+    # The initial parameters from the linear least squares fit of the logarithm of the positive values.
+    log_mask = mask & (values > 0.0)
+    n = log_mask.sum(axis=1).astype(float64)
+    x = where(log_mask, -times, 0.0)
+    w = where(log_mask, log(where(log_mask, values, 1.0)), 0.0)
+    denom = (x**2).sum(axis=1) - (x.sum(axis=1))**2 / maximum(n, 1.0)
+    valid = (n >= 2) & (denom != 0.0)
+    rate = where(valid, ((x*w).sum(axis=1) - x.sum(axis=1) * w.sum(axis=1) / maximum(n, 1.0)) / where(valid, denom, 1.0), 0.0)
+    i0 = where(valid, exp_array((w.sum(axis=1) - rate * x.sum(axis=1)) / maximum(n, 1.0)), where(mask, values, 0.0).max(axis=1))
+
+    # Initialise the Levenberg-Marquardt optimisation.
+    chi2, resid, jac_rate, jac_i0 = _batch_evaluate(rate=rate, i0=i0, times=times, values=values, inv_err=inv_err)
+    damping = full(rate.shape, 1e-3)
+    active = ones(rate.shape, bool_)
+    iter_count = zeros(rate.shape, int)
+
+    # Iterate over all curves which have not converged.
+    for k in range(max_iterations):
+        if not active.any():
+            break
+
+        # The normal equations, (J^T.J + lambda.diag(J^T.J)).delta = J^T.r.
+        jtj_rr = (jac_rate**2).sum(axis=1)
+        jtj_ri = (jac_rate*jac_i0).sum(axis=1)
+        jtj_ii = (jac_i0**2).sum(axis=1)
+        jtr_r = (jac_rate*resid).sum(axis=1)
+        jtr_i = (jac_i0*resid).sum(axis=1)
+        a = jtj_rr * (1.0 + damping)
+        d = jtj_ii * (1.0 + damping)
+        det = a*d - jtj_ri**2
+        solvable = active & (det != 0.0)
+        det = where(solvable, det, 1.0)
+        step_rate = where(solvable, (d*jtr_r - jtj_ri*jtr_i) / det, 0.0)
+        step_i0 = where(solvable, (a*jtr_i - jtj_ri*jtr_r) / det, 0.0)
+
+        # The trial parameters.
+        new_rate = rate + step_rate
+        new_i0 = i0 + step_i0
+        new_chi2, new_resid, new_jac_rate, new_jac_i0 = _batch_evaluate(rate=new_rate, i0=new_i0, times=times, values=values, inv_err=inv_err)
+
+        # Accept the improved steps and decrease their damping, otherwise increase the damping.
+        accept = solvable & (new_chi2 <= chi2)
+        converged = accept & (chi2 - new_chi2 <= func_tol * maximum(chi2, 1e-300))
+        rate = where(accept, new_rate, rate)
+        i0 = where(accept, new_i0, i0)
+        chi2 = where(accept, new_chi2, chi2)
+        resid = where(accept[:, None], new_resid, resid)
+        jac_rate = where(accept[:, None], new_jac_rate, jac_rate)
+        jac_i0 = where(accept[:, None], new_jac_i0, jac_i0)
+        damping = where(accept, damping * 0.1, damping * 10.0)
+
+        # Update the convergence flags.
+        iter_count = iter_count + active
+        active = active & ~converged & solvable & (damping < 1e16)
+
+    # The covariance matrix errors.
+    rate_err, i0_err = _batch_covar_errors(jac_rate=jac_rate, jac_i0=jac_i0)
+
+    # Return the results.
+    return rate, i0, rate_err, i0_err, chi2, iter_count
+
+
+def exponential_2param_neg_batch_errors(rate=None, i0=None, times=None, errors=None, mask=None):
+    """Calculate the covariance matrix errors of many standard two parameter decreasing exponential curves simultaneously.
+
+    @keyword rate:      The exponential rate of each curve.
+    @type rate:         numpy rank-1 float array
+    @keyword i0:        The initial intensity of each curve.
+    @type i0:           numpy rank-1 float array
+    @keyword times:     The time points, one row per curve.
+    @type times:        numpy rank-2 float array
+    @keyword errors:    The standard deviations of the intensity values, one row per curve.
+    @type errors:       numpy rank-2 float array
+    @keyword mask:      The padding mask, where True corresponds to a real data point.  If None, all points are used.
+    @type mask:         None or numpy rank-2 bool array
+    @return:            The rate and initial intensity errors.
+    @rtype:             tuple of 2 numpy rank-1 float arrays
+    """
+
+    # The mask and weights, with padding points having zero weight.
+    if mask is None:
+        mask = ones(times.shape, bool_)
+    times = where(mask, times, 0.0)
+    inv_err = where(mask, 1.0 / where(mask, errors, 1.0), 0.0)
+
+    # The weighted Jacobian.
+    chi2, resid, jac_rate, jac_i0 = _batch_evaluate(rate=rate, i0=i0, times=times, values=zeros(times.shape, float64), inv_err=inv_err)
+
+    # Return the errors.
+    return _batch_covar_errors(jac_rate=jac_rate, jac_i0=jac_i0)
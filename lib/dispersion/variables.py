@@ -730,3 +730,15 @@ MODEL_NEST = {
     MODEL_NS_MMQ_3SITE: MODEL_NEST_NS_MMQ_3SITE,
     MODEL_NS_MMQ_3SITE_LINEAR: MODEL_NEST_NS_MMQ_3SITE_LINEAR
 }
+
+
+# Plotting variables.
+Y_AXIS_R2_EFF = "r2_eff"
+Y_AXIS_R2_R1RHO = "r2_r1rho"
+
+X_AXIS_DISP = "disp"
+X_AXIS_W_EFF = "w_eff"
+X_AXIS_THETA = "theta"
+
+INTERPOLATE_DISP = "disp"
+INTERPOLATE_OFFSET = "offset"
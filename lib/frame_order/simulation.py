@@ -23,8 +23,8 @@
 """Module for simulating the frame order motions."""
 
 # Python module imports.
-from math import cos, modf, pi, sin, sqrt
-from numpy import arange, array, concatenate, dot, eye, float64, linspace, transpose, zeros
+from math import pi
+from numpy import array, concatenate, cos, dot, einsum, eye, float64, int64, linspace, load, minimum, save, sin, sqrt, transpose, where, zeros
 import sys
 from warnings import warn
 
@@ -32,16 +32,19 @@ from warnings import warn
 from lib.errors import RelaxError
 from lib.warnings import RelaxWarning
 from lib.frame_order.variables import MODEL_DOUBLE_ROTOR
-from lib.geometry.angles import wrap_angles
-from lib.geometry.rotations import axis_angle_to_R, R_random_hypersphere, R_to_tilt_torsion, tilt_torsion_to_R
-from lib.geometry.vectors import random_unit_vector
+from lib.geometry.angles import wrap_angles_batch
+from lib.geometry.rotations import axis_angle_to_R, axis_angle_to_R_batch, R_random_hypersphere_batch, R_to_tilt_torsion_batch, tilt_torsion_to_R_batch
+from lib.geometry.vectors import random_unit_vector_batch
 
 
-def brownian(file=None, model=None, structure=None, parameters={}, eigenframe=None, pivot=None, atom_id=None, step_size=2.0, snapshot=10, total=1000):
+def brownian(file=None, model=None, structure=None, parameters={}, eigenframe=None, pivot=None, atom_id=None, step_size=2.0, snapshot=10, total=1000, walkers=1, traj_file=None):
     """Pseudo-Brownian dynamics simulation of the frame order motions.
 
-    @keyword file:          The opened and writable file object to place the snapshots into.
-    @type file:             str
+    A number of independent walkers are advanced together, with the snapshots of all walkers being taken at the same step.  The snapshots are streamed to the PDB file as they are taken, so that the structural object is never duplicated.
+
+
+    @keyword file:          The opened and writable file object to place the snapshots into.  If None, no PDB file will be created.
+    @type file:             file object or None
     @keyword structure:     The internal structural object containing the domain to simulate as a single model.
     @type structure:        lib.structure.internal.object.Internal instance
     @keyword model:         The frame order model to simulate.
@@ -60,60 +63,27 @@ def brownian(file=None, model=None, structure=None, parameters={}, eigenframe=No
     @type snapshot:         int
     @keyword total:         The total number of snapshots to take before stopping the simulation.
     @type total:            int
+    @keyword walkers:       The number of independent walkers to simulate together.
+    @type walkers:          int
+    @keyword traj_file:     The opened and writable binary file object for the compact trajectory of rotation matrices.  This can be converted to a PDB file with the trajectory_to_pdb() function.
+    @type traj_file:        binary file object or None
     """
 
-    # Check the structural object.
-    if structure.num_models() > 1:
-        raise RelaxError("Only a single model is supported.")
-
-    # Set the model number.
-    structure.set_model(model_orig=None, model_new=1)
-
-    # Generate the internal structural selection object.
-    selection = structure.selection(atom_id)
+    # Set up the structure and the output.
+    pos, indices = simulation_setup(structure=structure, atom_id=atom_id)
+    counts = snapshot_output_start(file=file, traj_file=traj_file, structure=structure, pivot=pivot)
 
     # The initial states and motional limits.
     num_states = len(pivot)
-    states = zeros((num_states, 3, 3), float64)
-    theta_max = []
-    sigma_max = []
-    for i in range(num_states):
-        states[i] = eye(3)
-        theta_max.append(None)
-        sigma_max.append(None)
+    states = zeros((walkers, num_states, 3, 3), float64)
+    states[:] = eye(3)
+    limits = motional_limits(model=model, parameters=parameters, num_states=num_states)
 
     # Initialise the rotation matrix data structures.
-    vector = zeros(3, float64)
-    R = eye(3, dtype=float64)
+    vectors = zeros((walkers, 3), float64)
+    R = zeros((walkers, 3, 3), float64)
     step_size = step_size / 360.0 * 2.0 * pi
 
-    # Axis permutations.
-    perm = [None]
-    if model == MODEL_DOUBLE_ROTOR:
-        perm = [[2, 0, 1], [1, 2, 0]]
-        perm_rev = [[1, 2, 0], [2, 0, 1]]
-
-    # The maximum cone opening angles (isotropic cones).
-    if 'cone_theta' in parameters:
-        theta_max[0] = parameters['cone_theta']
-
-    # The maximum cone opening angles (isotropic cones).
-    theta_x = None
-    theta_y = None
-    if 'cone_theta_x' in parameters:
-        theta_x = parameters['cone_theta_x']
-        theta_y = parameters['cone_theta_y']
-
-    # The maximum torsion angle.
-    if 'cone_sigma_max' in parameters:
-        sigma_max[0] = parameters['cone_sigma_max']
-    elif 'free rotor' in model:
-        sigma_max[0] = pi
-
-    # The second torsion angle.
-    if 'cone_sigma_max_2' in parameters:
-        sigma_max[1] = parameters['cone_sigma_max_2']
-
     # Printout.
     print("\nRunning the simulation:")
 
@@ -128,80 +98,28 @@ def brownian(file=None, model=None, structure=None, parameters={}, eigenframe=No
 
         # Loop over each state, or motional mode.
         for i in range(num_states):
-            # The random vector.
-            random_unit_vector(vector)
-
-            # The rotation matrix.
-            axis_angle_to_R(vector, step_size, R)
-
-            # Shift the current state.
-            states[i] = dot(R, states[i])
-
-            # Rotation in the eigenframe.
-            R_eigen = dot(transpose(eigenframe), dot(states[i], eigenframe))
-
-            # Axis permutation to shift each rotation axis to Z.
-            if perm[i] != None:
-                for j in range(3):
-                    R_eigen[:, j] = R_eigen[perm[i], j]
-                for j in range(3):
-                    R_eigen[j, :] = R_eigen[j, perm[i]]
-
-            # The angles.
-            phi, theta, sigma = R_to_tilt_torsion(R_eigen)
-            sigma = wrap_angles(sigma, -pi, pi)
-
-            # Determine theta_max for the pseudo-ellipse models.
-            if theta_x != None:
-                theta_max[i] = 1.0 / sqrt((cos(phi) / theta_x)**2 + (sin(phi) / theta_y)**2)
-
-            # Set the cone opening angle to the maximum if outside of the limit.
-            if theta_max[i] != None:
-                if theta > theta_max[i]:
-                    theta = theta_max[i]
-
-            # No tilt component.
-            else:
-                theta = 0.0
-                phi = 0.0
-
-            # Set the torsion angle to the maximum if outside of the limits.
-            if sigma_max[i] != None:
-                if sigma > sigma_max[i]:
-                    sigma = sigma_max[i]
-                elif sigma < -sigma_max[i]:
-                    sigma = -sigma_max[i]
-            else:
-                sigma = 0.0
-
-            # Reconstruct the rotation matrix, in the eigenframe, without sigma.
-            tilt_torsion_to_R(phi, theta, sigma, R_eigen)
-
-            # Reverse axis permutation to shift each rotation z-axis back.
-            if perm[i] != None:
-                for j in range(3):
-                    R_eigen[:, j] = R_eigen[perm_rev[i], j]
-                for j in range(3):
-                    R_eigen[j, :] = R_eigen[j, perm_rev[i]]
-
-            # Rotate back out of the eigenframe.
-            states[i] = dot(eigenframe, dot(R_eigen, transpose(eigenframe)))
-
-        # Take a snapshot.
-        if step == snapshot:
-            # Progress.
-            sys.stdout.write('.')
-            sys.stdout.flush()
+            # The random vectors.
+            random_unit_vector_batch(vectors)
+
+            # The rotation matrices.
+            axis_angle_to_R_batch(vectors, step_size, R)
 
-            # Increment the snapshot number.
-            current_snapshot += 1
+            # Shift the current states.
+            states[:, i] = einsum('wij,wjk->wik', R, states[:, i])
 
-            # Copy the original structural data.
-            structure.add_model(model=current_snapshot, coords_from=1)
+        # Set the states to the limits of the distribution if outside.
+        constrain_states(states=states, eigenframe=eigenframe, limits=limits, clamp=True)
 
-            # Rotate the model.
-            for i in range(num_states):
-                structure.rotate(R=states[i], origin=pivot[i], model=current_snapshot, selection=selection)
+        # Take a snapshot of each walker.
+        if step == snapshot:
+            for walker in range(walkers):
+                # Enough snapshots.
+                if current_snapshot == total:
+                    break
+
+                # Increment the snapshot number, and write it out.
+                current_snapshot += 1
+                snapshot_output(file=file, traj_file=traj_file, structure=structure, pos=pos, indices=indices, states=states[walker], pivot=pivot, serial=current_snapshot, counts=counts)
 
             # Reset the step counter.
             step = 0
@@ -209,8 +127,86 @@ def brownian(file=None, model=None, structure=None, parameters={}, eigenframe=No
         # Increment.
         step += 1
 
-    # Save the result.
-    structure.write_pdb(file=file)
+    # Finish the output.
+    snapshot_output_end(file=file, structure=structure, counts=counts)
+
+
+def constrain_states(states=None, eigenframe=None, limits=None, clamp=True):
+    """Apply the motional limits of the frame order model to a stack of states.
+
+    For each motional mode, the states are shifted into the motional eigenframe, the axes permuted so that the rotation axis is z, and the tilt and torsion angles extracted.  The states are then reconstructed from these angles, with the components not present in the model removed.
+
+
+    @keyword states:        The current states of all walkers, which will be updated.  The first dimension is the walker and the second the motional mode.
+    @type states:           numpy rank-4 (W, N, 3, 3) float64 array
+    @keyword eigenframe:    The full 3D eigenframe of the frame order motions.
+    @type eigenframe:       numpy rank-2, 3D float64 array
+    @keyword limits:        The motional limits, as returned by motional_limits().
+    @type limits:           dict
+    @keyword clamp:         A flag which if True will cause the tilt and torsion angles outside of the limits to be set to the maximum values.  Otherwise the states are left outside of the distribution.
+    @type clamp:            bool
+    @return:                The flags which are True for all walkers with every state inside of the distribution.
+    @rtype:                 numpy rank-1 (W,) bool array
+    """
+
+    # Init.
+    walkers = states.shape[0]
+    inside = zeros(walkers, bool)
+    inside[:] = True
+    R_eigen = zeros((walkers, 3, 3), float64)
+
+    # Loop over each state, or motional mode.
+    for i in range(states.shape[1]):
+        # Rotation in the eigenframe.
+        R_eigen[:] = einsum('ji,wjk,kl->wil', eigenframe, states[:, i], eigenframe)
+
+        # Axis permutation to shift each rotation axis to Z.
+        perm = limits['perm'][i]
+        if perm != None:
+            R_eigen[:] = R_eigen[:, perm][:, :, perm]
+
+        # The angles.
+        phi, theta, sigma = R_to_tilt_torsion_batch(R_eigen)
+        sigma = wrap_angles_batch(sigma, -pi, pi)
+
+        # Determine theta_max for the pseudo-ellipse models.
+        theta_max = limits['theta_max'][i]
+        if limits['theta_x'] != None:
+            theta_max = 1.0 / sqrt((cos(phi) / limits['theta_x'])**2 + (sin(phi) / limits['theta_y'])**2)
+
+        # The cone opening angle limit.
+        if theta_max is not None:
+            inside &= theta <= theta_max
+            if clamp:
+                theta = minimum(theta, theta_max)
+
+        # No tilt component.
+        else:
+            theta = zeros(walkers, float64)
+            phi = zeros(walkers, float64)
+
+        # The torsion angle limits.
+        sigma_max = limits['sigma_max'][i]
+        if sigma_max != None:
+            inside &= (sigma <= sigma_max) & (sigma >= -sigma_max)
+            if clamp:
+                sigma = where(sigma > sigma_max, sigma_max, where(sigma < -sigma_max, -sigma_max, sigma))
+        else:
+            sigma = zeros(walkers, float64)
+
+        # Reconstruct the rotation matrices, in the eigenframe.
+        tilt_torsion_to_R_batch(phi, theta, sigma, R_eigen)
+
+        # Reverse axis permutation to shift each rotation z-axis back.
+        perm_rev = limits['perm_rev'][i]
+        if perm_rev != None:
+            R_eigen[:] = R_eigen[:, perm_rev][:, :, perm_rev]
+
+        # Rotate back out of the eigenframe.
+        states[:, i] = einsum('ij,wjk,lk->wil', eigenframe, R_eigen, eigenframe)
+
+    # Return the flags.
+    return inside
 
 
 def mode_distribution(file=None, structure=None, axis=None, angle=None, pivot=None, atom_id=None, angle_inc=2*pi/360, total=None, reverse=False, mirror=False):
@@ -300,11 +296,238 @@ def mode_distribution(file=None, structure=None, axis=None, angle=None, pivot=No
     print("")
 
 
-def uniform_distribution(file=None, model=None, structure=None, parameters={}, eigenframe=None, pivot=None, atom_id=None, total=1000, max_rotations=100000):
+def motional_limits(model=None, parameters={}, num_states=1):
+    """Assemble the motional limits of the frame order model.
+
+    @keyword model:         The frame order model.
+    @type model:            str
+    @keyword parameters:    The dictionary of model parameter values.  The key is the parameter name and the value is the value.
+    @type parameters:       dict of float
+    @keyword num_states:    The number of states, or motional modes.
+    @type num_states:       int
+    @return:                The limits, with the keys 'theta_max' and 'sigma_max' for the lists of the maximum cone opening and torsion angles of each mode, 'theta_x' and 'theta_y' for the pseudo-ellipse cone angles, and 'perm' and 'perm_rev' for the axis permutations of each mode.
+    @rtype:                 dict
+    """
+
+    # Initialise.
+    limits = {
+        'theta_max': [None] * num_states,
+        'sigma_max': [None] * num_states,
+        'theta_x': None,
+        'theta_y': None,
+        'perm': [None] * num_states,
+        'perm_rev': [None] * num_states
+    }
+
+    # Axis permutations.
+    if model == MODEL_DOUBLE_ROTOR:
+        limits['perm'] = [[2, 0, 1], [1, 2, 0]]
+        limits['perm_rev'] = [[1, 2, 0], [2, 0, 1]]
+
+    # The maximum cone opening angles (isotropic cones).
+    if 'cone_theta' in parameters:
+        limits['theta_max'][0] = parameters['cone_theta']
+
+    # The maximum cone opening angles (pseudo-ellipse cones).
+    if 'cone_theta_x' in parameters:
+        limits['theta_x'] = parameters['cone_theta_x']
+        limits['theta_y'] = parameters['cone_theta_y']
+
+    # The maximum torsion angle.
+    if 'cone_sigma_max' in parameters:
+        limits['sigma_max'][0] = parameters['cone_sigma_max']
+    elif 'free rotor' in model:
+        limits['sigma_max'][0] = pi
+
+    # The second torsion angle.
+    if 'cone_sigma_max_2' in parameters:
+        limits['sigma_max'][1] = parameters['cone_sigma_max_2']
+
+    # Return the limits.
+    return limits
+
+
+def simulation_setup(structure=None, atom_id=None):
+    """Prepare the structural object for a simulation, and extract the atomic positions of the single model.
+
+    @keyword structure:     The internal structural object containing the domain to simulate as a single model.
+    @type structure:        lib.structure.internal.object.Internal instance
+    @keyword atom_id:       The atom ID string for the atoms in the structure to rotate - i.e. the moving domain.
+    @type atom_id:          None or str
+    @return:                The positions of all atoms of all molecules, in order, and the indices of the moving atoms in this array.
+    @rtype:                 numpy rank-2 (N, 3) float64 array, numpy rank-1 int64 array
+    """
+
+    # Check the structural object.
+    if structure.num_models() > 1:
+        raise RelaxError("Only a single model is supported.")
+
+    # Set the model number.
+    structure.set_model(model_orig=None, model_new=1)
+
+    # Generate the internal structural selection object.
+    selection = structure.selection(atom_id)
+
+    # The positions of all molecules, and the offsets of each molecule in the array.
+    pos = []
+    offsets = []
+    offset = 0
+    for mol in structure.structural_data[0].mol_loop():
+        pos.append(transpose(array([mol.x, mol.y, mol.z], float64)))
+        offsets.append(offset)
+        offset += len(mol.atom_name)
+    pos = concatenate(pos) if len(pos) else zeros((0, 3), float64)
+
+    # The indices of the moving atoms.
+    indices = [zeros(0, int64)]
+    for mol_index, mol_indices in selection.index_array_loop():
+        indices.append(mol_indices + offsets[mol_index])
+
+    # Return the data.
+    return pos, concatenate(indices)
+
+
+def snapshot_output(file=None, traj_file=None, structure=None, pos=None, indices=None, states=None, pivot=None, serial=None, counts=None):
+    """Append a single snapshot to the PDB file and trajectory.
+
+    @keyword file:          The opened and writable PDB file object.
+    @type file:             file object or None
+    @keyword traj_file:     The opened and writable binary trajectory file object.
+    @type traj_file:        binary file object or None
+    @keyword structure:     The internal structural object containing the domain as a single model.
+    @type structure:        lib.structure.internal.object.Internal instance
+    @keyword pos:           The original positions of all atoms.
+    @type pos:              numpy rank-2 (N, 3) float64 array
+    @keyword indices:       The indices of the moving atoms.
+    @type indices:          numpy rank-1 int64 array
+    @keyword states:        The rotation matrices of each motional mode.
+    @type states:           numpy rank-3 (M, 3, 3) float64 array
+    @keyword pivot:         The pivot points of each motional mode.
+    @type pivot:            numpy rank-2 (M, 3) float64 array
+    @keyword serial:        The model number of the snapshot.
+    @type serial:           int
+    @keyword counts:        The PDB record counts.
+    @type counts:           dict of int
+    """
+
+    # The compact trajectory.
+    if traj_file != None:
+        save(traj_file, states)
+
+    # No PDB file.
+    if file == None:
+        return
+
+    # Rotate the moving atoms about each pivot.
+    new_pos = pos.copy()
+    for i in range(len(states)):
+        new_pos[indices] = dot(new_pos[indices] - pivot[i], transpose(states[i])) + pivot[i]
+
+    # Write out the model.
+    structure.write_pdb_model(file, model_num=1, serial=serial, pos=new_pos, counts=counts)
+
+
+def snapshot_output_end(file=None, structure=None, counts=None):
+    """Finish the PDB file of a snapshot stream.
+
+    @keyword file:          The opened and writable PDB file object.
+    @type file:             file object or None
+    @keyword structure:     The internal structural object containing the domain as a single model.
+    @type structure:        lib.structure.internal.object.Internal instance
+    @keyword counts:        The PDB record counts.
+    @type counts:           dict of int
+    """
+
+    # No PDB file.
+    if file == None:
+        return
+
+    # The connectivity and termination records.
+    sys.stdout.write('\n')
+    structure.write_pdb_end(file, counts=counts)
+
+
+def snapshot_output_start(file=None, traj_file=None, structure=None, pivot=None):
+    """Start a stream of snapshots, writing the original structure as the first model.
+
+    @keyword file:          The opened and writable PDB file object.
+    @type file:             file object or None
+    @keyword traj_file:     The opened and writable binary trajectory file object.  The pivot points are stored first, followed by the rotation matrices of each snapshot.
+    @type traj_file:        binary file object or None
+    @keyword structure:     The internal structural object containing the domain as a single model.
+    @type structure:        lib.structure.internal.object.Internal instance
+    @keyword pivot:         The pivot points of each motional mode.
+    @type pivot:            numpy rank-2 (M, 3) float64 array
+    @return:                The PDB record counts.
+    @rtype:                 dict of int or None
+    """
+
+    # The trajectory header and the unrotated first snapshot.
+    if traj_file != None:
+        save(traj_file, array(pivot, float64))
+        states = zeros((len(pivot), 3, 3), float64)
+        states[:] = eye(3)
+        save(traj_file, states)
+
+    # No PDB file.
+    if file == None:
+        return
+
+    # The header records and the first model.
+    counts = structure.write_pdb_start(file)
+    print("\nMODEL records:")
+    structure.write_pdb_model(file, model_num=1, serial=1, counts=counts)
+
+    # Return the counts.
+    return counts
+
+
+def trajectory_to_pdb(file=None, traj_file=None, structure=None, atom_id=None):
+    """Expand a compact binary trajectory of rotation matrices into a PDB file.
+
+    @keyword file:          The opened and writable PDB file object.
+    @type file:             file object
+    @keyword traj_file:     The opened binary trajectory file object created by the brownian() or uniform_distribution() functions.
+    @type traj_file:        binary file object
+    @keyword structure:     The internal structural object used in the simulation, containing the domain as a single model.
+    @type structure:        lib.structure.internal.object.Internal instance
+    @keyword atom_id:       The atom ID string for the atoms in the structure to rotate - i.e. the moving domain.
+    @type atom_id:          None or str
+    """
+
+    # Set up.
+    pos, indices = simulation_setup(structure=structure, atom_id=atom_id)
+    pivot = load(traj_file)
+
+    # The header records.
+    counts = structure.write_pdb_start(file)
+    print("\nMODEL records:")
+
+    # Loop over the snapshots.
+    serial = 0
+    while True:
+        # Read the rotations, stopping at the end of the file.
+        try:
+            states = load(traj_file)
+        except EOFError:
+            break
+
+        # Write out the model.
+        serial += 1
+        snapshot_output(file=file, structure=structure, pos=pos, indices=indices, states=states, pivot=pivot, serial=serial, counts=counts)
+
+    # Finish the file.
+    snapshot_output_end(file=file, structure=structure, counts=counts)
+
+
+def uniform_distribution(file=None, model=None, structure=None, parameters={}, eigenframe=None, pivot=None, atom_id=None, total=1000, max_rotations=100000, walkers=100, traj_file=None):
     """Uniform distribution of the frame order motions.
 
-    @keyword file:          The opened and writable file object to place the PDB models of the distribution into.
-    @type file:             str
+    The random rotations of a number of independent walkers are generated together, and the states inside of the distribution are streamed to the PDB file.
+
+
+    @keyword file:          The opened and writable file object to place the PDB models of the distribution into.  If None, no PDB file will be created.
+    @type file:             file object or None
     @keyword structure:     The internal structural object containing the domain to distribute as a single model.
     @type structure:        lib.structure.internal.object.Internal instance
     @keyword model:         The frame order model to distribute.
@@ -321,152 +544,67 @@ def uniform_distribution(file=None, model=None, structure=None, parameters={}, e
     @type total:            int
     @keyword max_rotations: The maximum number of rotations to generate the distribution from.  This prevents an execution for an infinite amount of time when a frame order amplitude parameter is close to zero so that the subset of all rotations within the distribution is close to zero.
     @type max_rotations:    int
+    @keyword walkers:       The number of random rotations to generate together.
+    @type walkers:          int
+    @keyword traj_file:     The opened and writable binary file object for the compact trajectory of rotation matrices.  This can be converted to a PDB file with the trajectory_to_pdb() function.
+    @type traj_file:        binary file object or None
     """
 
-    # Check the structural object.
-    if structure.num_models() > 1:
-        raise RelaxError("Only a single model is supported.")
-
-    # Set the model number.
-    structure.set_model(model_orig=None, model_new=1)
-
-    # Generate the internal structural selection object.
-    selection = structure.selection(atom_id)
+    # Set up the structure and the output.
+    pos, indices = simulation_setup(structure=structure, atom_id=atom_id)
+    counts = snapshot_output_start(file=file, traj_file=traj_file, structure=structure, pivot=pivot)
 
     # The initial states and motional limits.
     num_states = len(pivot)
-    states = zeros((num_states, 3, 3), float64)
-    theta_max = []
-    sigma_max = []
-    for i in range(num_states):
-        states[i] = eye(3)
-        theta_max.append(None)
-        sigma_max.append(None)
+    states = zeros((walkers, num_states, 3, 3), float64)
+    states[:] = eye(3)
+    limits = motional_limits(model=model, parameters=parameters, num_states=num_states)
 
     # Initialise the rotation matrix data structures.
-    R = eye(3, dtype=float64)
-
-    # Axis permutations.
-    perm = [None]
-    if model == MODEL_DOUBLE_ROTOR:
-        perm = [[2, 0, 1], [1, 2, 0]]
-        perm_rev = [[1, 2, 0], [2, 0, 1]]
-
-    # The maximum cone opening angles (isotropic cones).
-    if 'cone_theta' in parameters:
-        theta_max[0] = parameters['cone_theta']
-
-    # The maximum cone opening angles (isotropic cones).
-    theta_x = None
-    theta_y = None
-    if 'cone_theta_x' in parameters:
-        theta_x = parameters['cone_theta_x']
-        theta_y = parameters['cone_theta_y']
-
-    # The maximum torsion angle.
-    if 'cone_sigma_max' in parameters:
-        sigma_max[0] = parameters['cone_sigma_max']
-    elif 'free rotor' in model:
-        sigma_max[0] = pi
-
-    # The second torsion angle.
-    if 'cone_sigma_max_2' in parameters:
-        sigma_max[1] = parameters['cone_sigma_max_2']
+    R = zeros((walkers, 3, 3), float64)
 
     # Printout.
     print("\nGenerating the distribution:")
 
     # Distribution.
     current_state = 1
-    num = -1
-    while True:
-        # The total number of rotations.
-        num += 1
-
-        # End.
-        if current_state == total:
-            break
+    num = 0
+    while current_state < total:
+        # The maximum number of rotations.
         if num >= max_rotations:
             sys.stdout.write('\n')
             warn(RelaxWarning("Maximum number of rotations encountered - the distribution only contains %i states." % current_state))
             break
 
         # Loop over each state, or motional mode.
-        inside = True
         for i in range(num_states):
-            # The random rotation matrix.
-            R_random_hypersphere(R)
-
-            # Shift the current state.
-            states[i] = dot(R, states[i])
-
-            # Rotation in the eigenframe.
-            R_eigen = dot(transpose(eigenframe), dot(states[i], eigenframe))
-
-            # Axis permutation to shift each rotation axis to Z.
-            if perm[i] != None:
-                for j in range(3):
-                    R_eigen[:, j] = R_eigen[perm[i], j]
-                for j in range(3):
-                    R_eigen[j, :] = R_eigen[j, perm[i]]
-
-            # The angles.
-            phi, theta, sigma = R_to_tilt_torsion(R_eigen)
-            sigma = wrap_angles(sigma, -pi, pi)
-
-            # Determine theta_max for the pseudo-ellipse models.
-            if theta_x != None:
-                theta_max[i] = 1.0 / sqrt((cos(phi) / theta_x)**2 + (sin(phi) / theta_y)**2)
-
-            # The cone opening angle is outside of the limit.
-            if theta_max[i] != None:
-                if theta > theta_max[i]:
-                    inside = False
-
-            # No tilt component.
-            else:
-                theta = 0.0
-                phi = 0.0
-
-            # The torsion angle is outside of the limits.
-            if sigma_max[i] != None:
-                if sigma > sigma_max[i]:
-                    inside = False
-                elif sigma < -sigma_max[i]:
-                    inside = False
-            else:
-                sigma = 0.0
-
-            # Reconstruct the rotation matrix, in the eigenframe, without sigma.
-            tilt_torsion_to_R(phi, theta, sigma, R_eigen)
-
-            # Reverse axis permutation to shift each rotation z-axis back.
-            if perm[i] != None:
-                for j in range(3):
-                    R_eigen[:, j] = R_eigen[perm_rev[i], j]
-                for j in range(3):
-                    R_eigen[j, :] = R_eigen[j, perm_rev[i]]
-
-            # Rotate back out of the eigenframe.
-            states[i] = dot(eigenframe, dot(R_eigen, transpose(eigenframe)))
-
-        # The state is outside of the distribution.
-        if not inside:
-            continue
-
-        # Progress.
-        sys.stdout.write('.')
-        sys.stdout.flush()
+            # The random rotation matrices.
+            R_random_hypersphere_batch(R)
 
-        # Increment the snapshot number.
-        current_state += 1
+            # Shift the current states.
+            states[:, i] = einsum('wij,wjk->wik', R, states[:, i])
 
-        # Copy the original structural data.
-        structure.add_model(model=current_state, coords_from=1)
+        # Determine which states are inside of the distribution.
+        inside = constrain_states(states=states, eigenframe=eigenframe, limits=limits, clamp=False)
 
-        # Rotate the model.
-        for i in range(num_states):
-            structure.rotate(R=states[i], origin=pivot[i], model=current_state, selection=selection)
+        # Loop over the walkers, in order.
+        for walker in range(walkers):
+            # The total number of rotations.
+            if num >= max_rotations:
+                break
+            num += 1
 
-    # Save the result.
-    structure.write_pdb(file=file)
+            # The state is outside of the distribution.
+            if not inside[walker]:
+                continue
+
+            # Increment the snapshot number, and write it out.
+            current_state += 1
+            snapshot_output(file=file, traj_file=traj_file, structure=structure, pos=pos, indices=indices, states=states[walker], pivot=pivot, serial=current_state, counts=counts)
+
+            # End.
+            if current_state == total:
+                break
+
+    # Finish the output.
+    snapshot_output_end(file=file, structure=structure, counts=counts)
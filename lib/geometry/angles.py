@@ -24,6 +24,7 @@
 
 # Python module imports.
 from math import pi
+from numpy import array, float64
 
 # relax module imports.
 from lib.errors import RelaxError
@@ -115,3 +116,46 @@ def wrap_angles(angle, lower, upper, window=2*pi):
 
     # Return the wrapped angle.
     return angle
+
+
+def wrap_angles_batch(angles, lower, upper, window=2*pi):
+    """Convert all of the given angles to be between the lower and upper values.
+
+    This is the array version of wrap_angles(), with the window being repetitively added or subtracted in the same way.
+
+
+    @param angles:  The starting angles.
+    @type angles:   numpy rank-1 float64 array
+    @param lower:   The lower bound.
+    @type lower:    float
+    @param upper:   The upper bound.
+    @type upper:    float
+    @param window:  The size of the window where symmetry exists (defaults to 2pi).
+    @type window:   float
+    @return:        The wrapped angles.
+    @rtype:         numpy rank-1 float64 array
+    """
+
+    # Check the bounds and window.
+    if window - (upper - lower) > 1e-7:
+        raise RelaxError("The lower and upper bounds [%s, %s] do not match the window size of %s." % (lower, upper, window))
+
+    # Work on a copy.
+    angles = array(angles, float64)
+
+    # Keep wrapping until all angles are within the limits.
+    while True:
+        # The angles which are too big or too small.
+        too_big = angles > upper
+        too_small = angles < lower
+
+        # All inside the window, so stop wrapping.
+        if not too_big.any() and not too_small.any():
+            break
+
+        # Shift the angles.
+        angles[too_big] = angles[too_big] - window
+        angles[too_small] = angles[too_small] + window
+
+    # Return the wrapped angles.
+    return angles
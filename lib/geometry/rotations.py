@@ -21,14 +21,17 @@
 
 # Python module imports.
 from copy import deepcopy
-from math import acos, atan2, cos, pi, sin, sqrt
-from numpy import array, cross, dot, float64, hypot, transpose, zeros
+from math import acos, atan2, cos, pi, pow, sin, sqrt
+from numpy import array, cross, dot, float64, frompyfunc, hypot, matmul, transpose, where, zeros
+from numpy import cos as np_cos
+from numpy import sin as np_sin
+from numpy import sqrt as np_sqrt
 from numpy.linalg import norm
 from random import gauss
 
 # relax module imports.
-from lib.geometry.angles import wrap_angles
-from lib.geometry.vectors import random_unit_vector
+from lib.geometry.angles import wrap_angles, wrap_angles_batch
+from lib.geometry.vectors import random_unit_vector, random_unit_vector_batch
 
 
 # Global variables.
@@ -52,6 +55,126 @@ EULER_TRANS_TABLE = {
 }
 EULER_EPSILON = 1e-5
 
+# The math module functions as numpy universal functions (used by the batched functions).
+ACOS = frompyfunc(acos, 1, 1)
+ATAN2 = frompyfunc(atan2, 2, 1)
+COS = frompyfunc(cos, 1, 1)
+POW = frompyfunc(pow, 2, 1)
+SIN = frompyfunc(sin, 1, 1)
+
+
+
+def _acos_batch(x):
+    """Element-wise arc cosine using the math module acos() function.
+
+    The numpy arccos() function can differ in the last bit from the math module, hence this is used to keep the batched functions numerically identical to their scalar counterparts.
+
+
+    @param x:   The values.
+    @type x:    numpy array
+    @return:    The arc cosines.
+    @rtype:     numpy float64 array
+    """
+
+    # Apply the math module function.
+    return array(ACOS(x), float64)
+
+
+def _atan2_batch(y, x):
+    """Element-wise arc tangent of y/x using the math module atan2() function.
+
+    The numpy arctan2() function can differ in the last bit from the math module, hence this is used to keep the batched functions numerically identical to their scalar counterparts.
+
+
+    @param y:   The y values.
+    @type y:    numpy array
+    @param x:   The x values.
+    @type x:    numpy array
+    @return:    The arc tangents.
+    @rtype:     numpy float64 array
+    """
+
+    # Apply the math module function.
+    return array(ATAN2(y, x), float64)
+
+
+def _cos_batch(x):
+    """Element-wise cosine using the math module cos() function.
+
+    The numpy cos() function may use vectorised implementations which can differ in the last bit from the math module, hence this is used where the results must be numerically identical to a scalar loop.
+
+
+    @param x:   The angles.
+    @type x:    numpy array
+    @return:    The cosines.
+    @rtype:     numpy float64 array
+    """
+
+    # Apply the math module function.
+    return array(COS(x), float64)
+
+
+def _dot_batch(vectors1, vectors2):
+    """The dot products of two stacks of vectors.
+
+    The stacked matrix multiplication uses the same summation as the numpy dot() function used by the scalar functions.
+
+
+    @param vectors1:    The first stack of vectors.
+    @type vectors1:     numpy rank-2 (N, M) array
+    @param vectors2:    The second stack of vectors.
+    @type vectors2:     numpy rank-2 (N, M) array
+    @return:            The dot products.
+    @rtype:             numpy rank-1 (N,) array
+    """
+
+    # The stacked row-column products.
+    return matmul(vectors1[:, None, :], vectors2[:, :, None])[:, 0, 0]
+
+
+def _norm_batch(vectors):
+    """The lengths of a stack of vectors, identical to the numpy.linalg.norm() values of each vector.
+
+    @param vectors: The stack of vectors.
+    @type vectors:  numpy rank-2 (N, M) array
+    @return:        The vector lengths.
+    @rtype:         numpy rank-1 (N,) array
+    """
+
+    # The square root of the dot products.
+    return np_sqrt(_dot_batch(vectors, vectors))
+
+
+def _sin_batch(x):
+    """Element-wise sine using the math module sin() function.
+
+    The numpy sin() function may use vectorised implementations which can differ in the last bit from the math module, hence this is used where the results must be numerically identical to a scalar loop.
+
+
+    @param x:   The angles.
+    @type x:    numpy array
+    @return:    The sines.
+    @rtype:     numpy float64 array
+    """
+
+    # Apply the math module function.
+    return array(SIN(x), float64)
+
+
+def _square_batch(x):
+    """Element-wise square using the math module pow() function.
+
+    The scalar functions square numpy float64 scalars or Python floats via the C library pow() function, which can differ in the last bit from the exact x*x product used for arrays.  This is used to keep the batched functions numerically identical to their scalar counterparts.
+
+
+    @param x:   The values.
+    @type x:    numpy array
+    @return:    The squared values.
+    @rtype:     numpy float64 array
+    """
+
+    # Apply the math module function.
+    return array(POW(x, 2), float64)
 
 
 def axis_angle_to_euler_xyx(axis, angle):
@@ -77,6 +200,30 @@ def axis_angle_to_euler_xyx(axis, angle):
     return R_to_euler_xyx(R)
 
 
+def axis_angle_to_euler_xyx_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to xyx Euler angles.
+
+    This is the array version of axis_angle_to_euler_xyx().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the xyx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_xyx_batch(R)
+
+
 def axis_angle_to_euler_xyz(axis, angle):
     """Convert the axis-angle notation to xyz Euler angles.
 
@@ -100,6 +247,30 @@ def axis_angle_to_euler_xyz(axis, angle):
     return R_to_euler_xyz(R)
 
 
+def axis_angle_to_euler_xyz_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to xyz Euler angles.
+
+    This is the array version of axis_angle_to_euler_xyz().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the xyz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_xyz_batch(R)
+
+
 def axis_angle_to_euler_xzx(axis, angle):
     """Convert the axis-angle notation to xzx Euler angles.
 
@@ -123,6 +294,30 @@ def axis_angle_to_euler_xzx(axis, angle):
     return R_to_euler_xzx(R)
 
 
+def axis_angle_to_euler_xzx_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to xzx Euler angles.
+
+    This is the array version of axis_angle_to_euler_xzx().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the xzx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_xzx_batch(R)
+
+
 def axis_angle_to_euler_xzy(axis, angle):
     """Convert the axis-angle notation to xzy Euler angles.
 
@@ -146,6 +341,30 @@ def axis_angle_to_euler_xzy(axis, angle):
     return R_to_euler_xzy(R)
 
 
+def axis_angle_to_euler_xzy_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to xzy Euler angles.
+
+    This is the array version of axis_angle_to_euler_xzy().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the xzy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_xzy_batch(R)
+
+
 def axis_angle_to_euler_yxy(axis, angle):
     """Convert the axis-angle notation to yxy Euler angles.
 
@@ -169,6 +388,30 @@ def axis_angle_to_euler_yxy(axis, angle):
     return R_to_euler_yxy(R)
 
 
+def axis_angle_to_euler_yxy_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to yxy Euler angles.
+
+    This is the array version of axis_angle_to_euler_yxy().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the yxy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_yxy_batch(R)
+
+
 def axis_angle_to_euler_yxz(axis, angle):
     """Convert the axis-angle notation to yxz Euler angles.
 
@@ -192,6 +435,30 @@ def axis_angle_to_euler_yxz(axis, angle):
     return R_to_euler_yxz(R)
 
 
+def axis_angle_to_euler_yxz_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to yxz Euler angles.
+
+    This is the array version of axis_angle_to_euler_yxz().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the yxz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_yxz_batch(R)
+
+
 def axis_angle_to_euler_yzx(axis, angle):
     """Convert the axis-angle notation to yzx Euler angles.
 
@@ -215,6 +482,30 @@ def axis_angle_to_euler_yzx(axis, angle):
     return R_to_euler_yzx(R)
 
 
+def axis_angle_to_euler_yzx_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to yzx Euler angles.
+
+    This is the array version of axis_angle_to_euler_yzx().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the yzx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_yzx_batch(R)
+
+
 def axis_angle_to_euler_yzy(axis, angle):
     """Convert the axis-angle notation to yzy Euler angles.
 
@@ -238,6 +529,30 @@ def axis_angle_to_euler_yzy(axis, angle):
     return R_to_euler_yzy(R)
 
 
+def axis_angle_to_euler_yzy_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to yzy Euler angles.
+
+    This is the array version of axis_angle_to_euler_yzy().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the yzy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_yzy_batch(R)
+
+
 def axis_angle_to_euler_zxy(axis, angle):
     """Convert the axis-angle notation to zxy Euler angles.
 
@@ -261,6 +576,30 @@ def axis_angle_to_euler_zxy(axis, angle):
     return R_to_euler_zxy(R)
 
 
+def axis_angle_to_euler_zxy_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to zxy Euler angles.
+
+    This is the array version of axis_angle_to_euler_zxy().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the zxy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_zxy_batch(R)
+
+
 def axis_angle_to_euler_zxz(axis, angle):
     """Convert the axis-angle notation to zxz Euler angles.
 
@@ -284,6 +623,30 @@ def axis_angle_to_euler_zxz(axis, angle):
     return R_to_euler_zxz(R)
 
 
+def axis_angle_to_euler_zxz_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to zxz Euler angles.
+
+    This is the array version of axis_angle_to_euler_zxz().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the zxz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_zxz_batch(R)
+
+
 def axis_angle_to_euler_zyx(axis, angle):
     """Convert the axis-angle notation to zyx Euler angles.
 
@@ -307,6 +670,30 @@ def axis_angle_to_euler_zyx(axis, angle):
     return R_to_euler_zyx(R)
 
 
+def axis_angle_to_euler_zyx_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to zyx Euler angles.
+
+    This is the array version of axis_angle_to_euler_zyx().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the zyx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_zyx_batch(R)
+
+
 def axis_angle_to_euler_zyz(axis, angle):
     """Convert the axis-angle notation to zyz Euler angles.
 
@@ -330,6 +717,30 @@ def axis_angle_to_euler_zyz(axis, angle):
     return R_to_euler_zyz(R)
 
 
+def axis_angle_to_euler_zyz_batch(axis, angle):
+    """Convert a stack of axis-angle notation rotations to zyz Euler angles.
+
+    This is the array version of axis_angle_to_euler_zyz().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles in the zyz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(axis), 3, 3), float64)
+
+    # Get the rotations.
+    axis_angle_to_R_batch(axis, angle, R)
+
+    # Return the Euler angles.
+    return R_to_euler_zyz_batch(R)
+
+
 def axis_angle_to_R(axis, angle, R):
     """Generate the rotation matrix from the axis-angle notation.
 
@@ -386,6 +797,53 @@ def axis_angle_to_R(axis, angle, R):
     R[2, 2] = z*zC + ca
 
 
+def axis_angle_to_R_batch(axis, angle, R):
+    """Generate a stack of rotation matrices from the axis-angle notation.
+
+    This is the array version of axis_angle_to_R().
+
+
+    @param axis:    The 3D rotation axes.
+    @type axis:     numpy rank-2 (N, 3) array
+    @param angle:   The rotation angles.
+    @type angle:    float or numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig factors.
+    ca = np_cos(angle)
+    sa = np_sin(angle)
+    C = 1 - ca
+
+    # Depack the axes.
+    x = axis[:, 0]
+    y = axis[:, 1]
+    z = axis[:, 2]
+
+    # Multiplications (to remove duplicate calculations).
+    xs = x*sa
+    ys = y*sa
+    zs = z*sa
+    xC = x*C
+    yC = y*C
+    zC = z*C
+    xyC = x*yC
+    yzC = y*zC
+    zxC = z*xC
+
+    # Update the rotation matrices.
+    R[:, 0, 0] = x*xC + ca
+    R[:, 0, 1] = xyC - zs
+    R[:, 0, 2] = zxC + ys
+    R[:, 1, 0] = xyC + zs
+    R[:, 1, 1] = y*yC + ca
+    R[:, 1, 2] = yzC - xs
+    R[:, 2, 0] = zxC - ys
+    R[:, 2, 1] = yzC + xs
+    R[:, 2, 2] = z*zC + ca
+
+
 def axis_angle_to_quaternion(axis, angle, quat, norm_flag=True):
     """Generate the quaternion from the axis-angle notation.
 
@@ -420,6 +878,33 @@ def axis_angle_to_quaternion(axis, angle, quat, norm_flag=True):
     quat[1:] = axis * sin(angle/2)
 
 
+def axis_angle_to_quaternion_batch(axis, angle, quat, norm_flag=True):
+    """Generate a stack of quaternions from the axis-angle notation.
+
+    This is the array version of axis_angle_to_quaternion().
+
+
+    @param axis:        The 3D rotation axes.
+    @type axis:         numpy rank-2 (N, 3) array
+    @param angle:       The rotation angles.
+    @type angle:        float or numpy rank-1 (N,) array
+    @param quat:        The quaternion structures.
+    @type quat:         numpy rank-2 (N, 4) array
+    @keyword norm_flag: A flag which if True forces the axes to be converted to unit vectors.
+    @type norm_flag:    bool
+    """
+
+    # Convert to unit vectors.
+    if norm_flag:
+        axis = axis / _norm_batch(axis)[:, None]
+
+    # The scalar component of q.
+    quat[:, 0] = np_cos(angle/2)
+
+    # The vector component.
+    quat[:, 1:] = axis * np_sin(angle/2).reshape(-1, 1)
+
+
 def copysign(x, y):
     """Return x with the sign of y.
 
@@ -465,6 +950,32 @@ def euler_to_axis_angle_xyx(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_xyx_batch(alpha, beta, gamma):
+    """Convert a stack of xyx Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_xyx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xyx_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_xyz(alpha, beta, gamma):
     """Convert the xyz Euler angles to axis-angle notation.
 
@@ -490,6 +1001,32 @@ def euler_to_axis_angle_xyz(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_xyz_batch(alpha, beta, gamma):
+    """Convert a stack of xyz Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_xyz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xyz_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_xzx(alpha, beta, gamma):
     """Convert the xzx Euler angles to axis-angle notation.
 
@@ -515,6 +1052,32 @@ def euler_to_axis_angle_xzx(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_xzx_batch(alpha, beta, gamma):
+    """Convert a stack of xzx Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_xzx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xzx_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_xzy(alpha, beta, gamma):
     """Convert the xzy Euler angles to axis-angle notation.
 
@@ -540,6 +1103,32 @@ def euler_to_axis_angle_xzy(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_xzy_batch(alpha, beta, gamma):
+    """Convert a stack of xzy Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_xzy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xzy_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_yxy(alpha, beta, gamma):
     """Convert the yxy Euler angles to axis-angle notation.
 
@@ -565,6 +1154,32 @@ def euler_to_axis_angle_yxy(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_yxy_batch(alpha, beta, gamma):
+    """Convert a stack of yxy Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_yxy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yxy_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_yxz(alpha, beta, gamma):
     """Convert the yxz Euler angles to axis-angle notation.
 
@@ -590,6 +1205,32 @@ def euler_to_axis_angle_yxz(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_yxz_batch(alpha, beta, gamma):
+    """Convert a stack of yxz Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_yxz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yxz_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_yzx(alpha, beta, gamma):
     """Convert the yzx Euler angles to axis-angle notation.
 
@@ -615,6 +1256,32 @@ def euler_to_axis_angle_yzx(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_yzx_batch(alpha, beta, gamma):
+    """Convert a stack of yzx Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_yzx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yzx_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_yzy(alpha, beta, gamma):
     """Convert the yzy Euler angles to axis-angle notation.
 
@@ -640,6 +1307,32 @@ def euler_to_axis_angle_yzy(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_yzy_batch(alpha, beta, gamma):
+    """Convert a stack of yzy Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_yzy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yzy_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_zxy(alpha, beta, gamma):
     """Convert the zxy Euler angles to axis-angle notation.
 
@@ -665,6 +1358,32 @@ def euler_to_axis_angle_zxy(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_zxy_batch(alpha, beta, gamma):
+    """Convert a stack of zxy Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_zxy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zxy_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_zxz(alpha, beta, gamma):
     """Convert the zxz Euler angles to axis-angle notation.
 
@@ -690,6 +1409,32 @@ def euler_to_axis_angle_zxz(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_zxz_batch(alpha, beta, gamma):
+    """Convert a stack of zxz Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_zxz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zxz_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_zyx(alpha, beta, gamma):
     """Convert the zyx Euler angles to axis-angle notation.
 
@@ -715,6 +1460,32 @@ def euler_to_axis_angle_zyx(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_zyx_batch(alpha, beta, gamma):
+    """Convert a stack of zyx Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_zyx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zyx_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_axis_angle_zyz(alpha, beta, gamma):
     """Convert the zyz Euler angles to axis-angle notation.
 
@@ -740,6 +1511,32 @@ def euler_to_axis_angle_zyz(alpha, beta, gamma):
     return R_to_axis_angle(R)
 
 
+def euler_to_axis_angle_zyz_batch(alpha, beta, gamma):
+    """Convert a stack of zyz Euler angles to axis-angle notation.
+
+    This is the array version of euler_to_axis_angle_zyz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zyz_batch(alpha, beta, gamma, R)
+
+    # Return the axes and angles.
+    return R_to_axis_angle_batch(R)
+
+
 def euler_to_R_xyx(alpha, beta, gamma, R):
     """Generate the x-y-x Euler angle convention rotation matrix.
 
@@ -800,6 +1597,46 @@ def euler_to_R_xyx(alpha, beta, gamma, R):
     R[2, 2] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
 
 
+def euler_to_R_xyx_batch(alpha, beta, gamma, R):
+    """Generate a stack of x-y-x Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_xyx().
+
+
+    @param alpha:   The alpha Euler angles in rad for the x-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the y-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the second x-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_b
+    R[:, 1, 0] =  sin_b * sin_g
+    R[:, 2, 0] = -sin_b * cos_g
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] =  sin_a * sin_b
+    R[:, 1, 1] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+    R[:, 2, 1] =  cos_a * sin_g  +  sin_a * cos_b * cos_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  cos_a * sin_b
+    R[:, 1, 2] = -sin_a * cos_g  -  cos_a * cos_b * sin_g
+    R[:, 2, 2] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+
+
 def euler_to_R_xyz(alpha, beta, gamma, R):
     """Generate the x-y-z Euler angle convention rotation matrix.
 
@@ -860,6 +1697,46 @@ def euler_to_R_xyz(alpha, beta, gamma, R):
     R[2, 2] =  cos_a * cos_b
 
 
+def euler_to_R_xyz_batch(alpha, beta, gamma, R):
+    """Generate a stack of x-y-z Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_xyz().
+
+
+    @param alpha:   The alpha Euler angles in rad for the x-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the y-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the z-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_b * cos_g
+    R[:, 1, 0] =  cos_b * sin_g
+    R[:, 2, 0] = -sin_b
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -cos_a * sin_g  +  sin_a * sin_b * cos_g
+    R[:, 1, 1] =  cos_a * cos_g  +  sin_a * sin_b * sin_g
+    R[:, 2, 1] =  sin_a * cos_b
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_a * sin_g  +  cos_a * sin_b * cos_g
+    R[:, 1, 2] = -sin_a * cos_g  +  cos_a * sin_b * sin_g
+    R[:, 2, 2] =  cos_a * cos_b
+
+
 def euler_to_R_xzx(alpha, beta, gamma, R):
     """Generate the x-z-x Euler angle convention rotation matrix.
 
@@ -909,15 +1786,55 @@ def euler_to_R_xzx(alpha, beta, gamma, R):
     R[1, 0] =  sin_b * cos_g
     R[2, 0] =  sin_b * sin_g
 
-    # The unit muy vector component of the rotation matrix.
-    R[0, 1] = -cos_a * sin_b
-    R[1, 1] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
-    R[2, 1] =  sin_a * cos_g  +  cos_a * cos_b * sin_g
+    # The unit muy vector component of the rotation matrix.
+    R[0, 1] = -cos_a * sin_b
+    R[1, 1] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+    R[2, 1] =  sin_a * cos_g  +  cos_a * cos_b * sin_g
+
+    # The unit muz vector component of the rotation matrix.
+    R[0, 2] =  sin_a * sin_b
+    R[1, 2] = -cos_a * sin_g  -  sin_a * cos_b * cos_g
+    R[2, 2] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+
+
+def euler_to_R_xzx_batch(alpha, beta, gamma, R):
+    """Generate a stack of x-z-x Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_xzx().
+
+
+    @param alpha:   The alpha Euler angles in rad for the x-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the z-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the second x-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_b
+    R[:, 1, 0] =  sin_b * cos_g
+    R[:, 2, 0] =  sin_b * sin_g
 
-    # The unit muz vector component of the rotation matrix.
-    R[0, 2] =  sin_a * sin_b
-    R[1, 2] = -cos_a * sin_g  -  sin_a * cos_b * cos_g
-    R[2, 2] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -cos_a * sin_b
+    R[:, 1, 1] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+    R[:, 2, 1] =  sin_a * cos_g  +  cos_a * cos_b * sin_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_a * sin_b
+    R[:, 1, 2] = -cos_a * sin_g  -  sin_a * cos_b * cos_g
+    R[:, 2, 2] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
 
 
 def euler_to_R_xzy(alpha, beta, gamma, R):
@@ -980,6 +1897,46 @@ def euler_to_R_xzy(alpha, beta, gamma, R):
     R[2, 2] =  cos_a * cos_g  -  sin_a * sin_b * sin_g
 
 
+def euler_to_R_xzy_batch(alpha, beta, gamma, R):
+    """Generate a stack of x-z-y Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_xzy().
+
+
+    @param alpha:   The alpha Euler angles in rad for the x-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the z-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the y-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_b * cos_g
+    R[:, 1, 0] =  sin_b
+    R[:, 2, 0] = -cos_b * sin_g
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] =  sin_a * sin_g  -  cos_a * sin_b * cos_g
+    R[:, 1, 1] =  cos_a * cos_b
+    R[:, 2, 1] =  sin_a * cos_g  +  cos_a * sin_b * sin_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  cos_a * sin_g  +  sin_a * sin_b * cos_g
+    R[:, 1, 2] = -sin_a * cos_b
+    R[:, 2, 2] =  cos_a * cos_g  -  sin_a * sin_b * sin_g
+
+
 def euler_to_R_yxy(alpha, beta, gamma, R):
     """Generate the y-x-y Euler angle convention rotation matrix.
 
@@ -1040,6 +1997,46 @@ def euler_to_R_yxy(alpha, beta, gamma, R):
     R[2, 2] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
 
 
+def euler_to_R_yxy_batch(alpha, beta, gamma, R):
+    """Generate a stack of y-x-y Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_yxy().
+
+
+    @param alpha:   The alpha Euler angles in rad for the y-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the x-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the second y-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+    R[:, 1, 0] =  sin_a * sin_b
+    R[:, 2, 0] = -cos_a * sin_g  -  sin_a * cos_b * cos_g
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] =  sin_b * sin_g
+    R[:, 1, 1] =  cos_b
+    R[:, 2, 1] =  sin_b * cos_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_a * cos_g  +  cos_a * cos_b * sin_g
+    R[:, 1, 2] = -cos_a * sin_b
+    R[:, 2, 2] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+
+
 def euler_to_R_yxz(alpha, beta, gamma, R):
     """Generate the y-x-z Euler angle convention rotation matrix.
 
@@ -1100,6 +2097,46 @@ def euler_to_R_yxz(alpha, beta, gamma, R):
     R[2, 2] =  cos_a * cos_b
 
 
+def euler_to_R_yxz_batch(alpha, beta, gamma, R):
+    """Generate a stack of y-x-z Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_yxz().
+
+
+    @param alpha:   The alpha Euler angles in rad for the y-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the x-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the z-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_a * cos_g  -  sin_a * sin_b * sin_g
+    R[:, 1, 0] =  cos_a * sin_g  +  sin_a * sin_b * cos_g
+    R[:, 2, 0] = -sin_a * cos_b
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -cos_b * sin_g
+    R[:, 1, 1] =  cos_b * cos_g
+    R[:, 2, 1] =  sin_b
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_a * cos_g  +  cos_a * sin_b * sin_g
+    R[:, 1, 2] =  sin_a * sin_g  -  cos_a * sin_b * cos_g
+    R[:, 2, 2] =  cos_a * cos_b
+
+
 def euler_to_R_yzx(alpha, beta, gamma, R):
     """Generate the y-z-x Euler angle convention rotation matrix.
 
@@ -1160,6 +2197,46 @@ def euler_to_R_yzx(alpha, beta, gamma, R):
     R[2, 2] =  cos_a * cos_g  +  sin_a * sin_b * sin_g
 
 
+def euler_to_R_yzx_batch(alpha, beta, gamma, R):
+    """Generate a stack of y-z-x Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_yzx().
+
+
+    @param alpha:   The alpha Euler angles in rad for the y-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the z-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the x-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_a * cos_b
+    R[:, 1, 0] =  sin_a * sin_g  +  cos_a * sin_b * cos_g
+    R[:, 2, 0] = -sin_a * cos_g  +  cos_a * sin_b * sin_g
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -sin_b
+    R[:, 1, 1] =  cos_b * cos_g
+    R[:, 2, 1] =  cos_b * sin_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_a * cos_b
+    R[:, 1, 2] = -cos_a * sin_g  +  sin_a * sin_b * cos_g
+    R[:, 2, 2] =  cos_a * cos_g  +  sin_a * sin_b * sin_g
+
+
 def euler_to_R_yzy(alpha, beta, gamma, R):
     """Generate the y-z-y Euler angle convention rotation matrix.
 
@@ -1220,6 +2297,46 @@ def euler_to_R_yzy(alpha, beta, gamma, R):
     R[2, 2] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
 
 
+def euler_to_R_yzy_batch(alpha, beta, gamma, R):
+    """Generate a stack of y-z-y Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_yzy().
+
+
+    @param alpha:   The alpha Euler angles in rad for the y-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the z-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the second y-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+    R[:, 1, 0] =  cos_a * sin_b
+    R[:, 2, 0] = -sin_a * cos_g  -  cos_a * cos_b * sin_g
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -sin_b * cos_g
+    R[:, 1, 1] =  cos_b
+    R[:, 2, 1] =  sin_b * sin_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  cos_a * sin_g  +  sin_a * cos_b * cos_g
+    R[:, 1, 2] =  sin_a * sin_b
+    R[:, 2, 2] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+
+
 def euler_to_R_zxy(alpha, beta, gamma, R):
     """Generate the z-x-y Euler angle convention rotation matrix.
 
@@ -1280,6 +2397,46 @@ def euler_to_R_zxy(alpha, beta, gamma, R):
     R[2, 2] =  cos_b * cos_g
 
 
+def euler_to_R_zxy_batch(alpha, beta, gamma, R):
+    """Generate a stack of z-x-y Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_zxy().
+
+
+    @param alpha:   The alpha Euler angles in rad for the z-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the x-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the y-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_a * cos_g  +  sin_a * sin_b * sin_g
+    R[:, 1, 0] =  sin_a * cos_b
+    R[:, 2, 0] = -cos_a * sin_g  +  sin_a * sin_b * cos_g
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -sin_a * cos_g  +  cos_a * sin_b * sin_g
+    R[:, 1, 1] =  cos_a * cos_b
+    R[:, 2, 1] =  sin_a * sin_g  +  cos_a * sin_b * cos_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  cos_b * sin_g
+    R[:, 1, 2] = -sin_b
+    R[:, 2, 2] =  cos_b * cos_g
+
+
 def euler_to_R_zxz(alpha, beta, gamma, R):
     """Generate the z-x-z Euler angle convention rotation matrix.
 
@@ -1340,6 +2497,46 @@ def euler_to_R_zxz(alpha, beta, gamma, R):
     R[2, 2] =  cos_b
 
 
+def euler_to_R_zxz_batch(alpha, beta, gamma, R):
+    """Generate a stack of z-x-z Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_zxz().
+
+
+    @param alpha:   The alpha Euler angles in rad for the z-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the y-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the second z-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+    R[:, 1, 0] =  cos_a * sin_g  +  sin_a * cos_b * cos_g
+    R[:, 2, 0] =  sin_a * sin_b
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -sin_a * cos_g  -  cos_a * cos_b * sin_g
+    R[:, 1, 1] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+    R[:, 2, 1] =  cos_a * sin_b
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_b * sin_g
+    R[:, 1, 2] = -sin_b * cos_g
+    R[:, 2, 2] =  cos_b
+
+
 def euler_to_R_zyx(alpha, beta, gamma, R):
     """Generate the z-y-x Euler angle convention rotation matrix.
 
@@ -1400,6 +2597,46 @@ def euler_to_R_zyx(alpha, beta, gamma, R):
     R[2, 2] =  cos_b * cos_g
 
 
+def euler_to_R_zyx_batch(alpha, beta, gamma, R):
+    """Generate a stack of z-y-x Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_zyx().
+
+
+    @param alpha:   The alpha Euler angles in rad for the z-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the y-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the x-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] =  cos_a * cos_b
+    R[:, 1, 0] =  sin_a * cos_g  +  cos_a * sin_b * sin_g
+    R[:, 2, 0] =  sin_a * sin_g  -  cos_a * sin_b * cos_g
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -sin_a * cos_b
+    R[:, 1, 1] =  cos_a * cos_g  -  sin_a * sin_b * sin_g
+    R[:, 2, 1] =  cos_a * sin_g  +  sin_a * sin_b * cos_g
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_b
+    R[:, 1, 2] = -cos_b * sin_g
+    R[:, 2, 2] =  cos_b * cos_g
+
+
 def euler_to_R_zyz(alpha, beta, gamma, R):
     """Generate the z-y-z Euler angle convention rotation matrix.
 
@@ -1460,6 +2697,46 @@ def euler_to_R_zyz(alpha, beta, gamma, R):
     R[2, 2] =  cos_b
 
 
+def euler_to_R_zyz_batch(alpha, beta, gamma, R):
+    """Generate a stack of z-y-z Euler angle convention rotation matrices.
+
+    This is the array version of euler_to_R_zyz().
+
+
+    @param alpha:   The alpha Euler angles in rad for the z-rotation.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad for the y-rotation.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad for the second z-rotation.
+    @type gamma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Trig.
+    sin_a = np_sin(alpha)
+    cos_a = np_cos(alpha)
+    sin_b = np_sin(beta)
+    cos_b = np_cos(beta)
+    sin_g = np_sin(gamma)
+    cos_g = np_cos(gamma)
+
+    # The unit mux vector component of the rotation matrices.
+    R[:, 0, 0] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+    R[:, 1, 0] =  sin_a * cos_g  +  cos_a * cos_b * sin_g
+    R[:, 2, 0] = -cos_a * sin_b
+
+    # The unit muy vector component of the rotation matrices.
+    R[:, 0, 1] = -cos_a * sin_g  -  sin_a * cos_b * cos_g
+    R[:, 1, 1] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+    R[:, 2, 1] =  sin_a * sin_b
+
+    # The unit muz vector component of the rotation matrices.
+    R[:, 0, 2] =  sin_b * cos_g
+    R[:, 1, 2] =  sin_b * sin_g
+    R[:, 2, 2] =  cos_b
+
+
 def matrix_indices(i, neg, alt):
     """Calculate the parameteric indices i, j, k, and h.
 
@@ -1512,6 +2789,26 @@ def R_random_axis(R, angle=0.0):
     axis_angle_to_R(rot_axis, angle, R)
 
 
+def R_random_axis_batch(R, angle=0.0):
+    """Generate a stack of random rotation matrices of fixed angle via the axis-angle notation.
+
+    This is the array version of R_random_axis().
+
+
+    @param R:       The 3x3 matrices to convert to the rotation matrices.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @keyword angle: The fixed rotation angle.
+    @type angle:    float
+    """
+
+    # Random rotation axes.
+    rot_axis = zeros((len(R), 3), float64)
+    random_unit_vector_batch(rot_axis)
+
+    # Generate the rotation matrices.
+    axis_angle_to_R_batch(rot_axis, angle, R)
+
+
 def R_random_hypersphere(R):
     """Generate a random rotation matrix using 4D hypersphere point picking.
 
@@ -1530,6 +2827,24 @@ def R_random_hypersphere(R):
     quaternion_to_R(quat, R)
 
 
+def R_random_hypersphere_batch(R):
+    """Generate a stack of random rotation matrices using 4D hypersphere point picking.
+
+    This is the array version of R_random_hypersphere().  The random numbers are taken from the Python random module in the same order as repeated calls to R_random_hypersphere(), so that seeding the module gives the same rotations.
+
+
+    @param R:       The 3x3 matrices to convert to the rotation matrices.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # The quaternions.
+    quat = array([gauss(0, 1) for i in range(4*len(R))], float64).reshape((len(R), 4))
+    quat = quat / norm(quat, axis=1)[:, None]
+
+    # Convert the quaternions to rotation matrices.
+    quaternion_to_R_batch(quat, R)
+
+
 def R_to_axis_angle(R):
     """Convert the rotation matrix into the axis-angle notation.
 
@@ -1570,6 +2885,37 @@ def R_to_axis_angle(R):
     return axis, theta
 
 
+def R_to_axis_angle_batch(R):
+    """Convert a stack of rotation matrices into the axis-angle notation.
+
+    This is the array version of R_to_axis_angle().
+
+
+    @param R:   The 3x3 rotation matrices.
+    @type R:    numpy rank-3 (N, 3, 3) array
+    @return:    The 3D rotation axes and angles.
+    @rtype:     numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # Axes.
+    axis = zeros((len(R), 3), float64)
+    axis[:, 0] = R[:, 2, 1] - R[:, 1, 2]
+    axis[:, 1] = R[:, 0, 2] - R[:, 2, 0]
+    axis[:, 2] = R[:, 1, 0] - R[:, 0, 1]
+
+    # Angles.
+    r = hypot(axis[:, 0], hypot(axis[:, 1], axis[:, 2]))
+    t = R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2]
+    theta = _atan2_batch(r, t-1)
+
+    # Normalise the non-zero axes.
+    nonzero = r != 0.0
+    axis[nonzero] = axis[nonzero] / r[nonzero, None]
+
+    # Return the data.
+    return axis, theta
+
+
 def R_to_euler(R, notation, axes_rot='static', second_sol=False):
     """Convert the rotation matrix to the given Euler angles.
 
@@ -1673,6 +3019,76 @@ def R_to_euler(R, notation, axes_rot='static', second_sol=False):
     return alpha, beta, gamma
 
 
+def R_to_euler_batch(R, notation, axes_rot='static'):
+    """Convert a stack of rotation matrices to the given Euler angles.
+
+    This is the array version of R_to_euler(), using the same algorithms of Ken Shoemake.
+
+
+    @param R:               The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:                numpy rank-3 (N, 3, 3) array
+    @param notation:        The Euler angle notation to use.
+    @type notation:         str
+    @keyword axes_rot:      The axes rotation - either 'static', the static axes or 'rotating', the rotating axes.
+    @type axes_rot:         str
+    @return:                The alpha, beta, and gamma Euler angles in the given convention.
+    @rtype:                 tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Get the Euler angle info.
+    i, neg, alt = EULER_TRANS_TABLE[notation]
+
+    # Axis rotations.
+    rev = 0
+    if axes_rot != 'static':
+        rev = 1
+
+    # Find the other indices.
+    j, k, h = matrix_indices(i, neg, alt)
+
+    # No axis repetition.
+    if alt:
+        # Sine of the beta angle, and the non-zero sin(beta) cases.
+        sin_beta = np_sqrt(_square_batch(R[:, i, j]) + _square_batch(R[:, i, k]))
+        nonzero = sin_beta > EULER_EPSILON
+
+        # The angles.
+        alpha = where(nonzero, _atan2_batch(R[:, i, j], R[:, i, k]), _atan2_batch(-R[:, j, k], R[:, j, j]))
+        beta = _atan2_batch(sin_beta, R[:, i, i])
+        gamma = where(nonzero, _atan2_batch(R[:, j, i], -R[:, k, i]), 0.0)
+
+    # Axis repetition.
+    else:
+        # Cosine of the beta angle, and the non-zero cos(beta) cases.
+        cos_beta = np_sqrt(_square_batch(R[:, i, i]) + _square_batch(R[:, j, i]))
+        nonzero = cos_beta > EULER_EPSILON
+
+        # The angles.
+        alpha = where(nonzero, _atan2_batch(R[:, k, j], R[:, k, k]), _atan2_batch(-R[:, j, k], R[:, j, j]))
+        beta = _atan2_batch(-R[:, k, i], cos_beta)
+        gamma = where(nonzero, _atan2_batch(R[:, j, i], R[:, i, i]), 0.0)
+
+    # Remapping.
+    if neg:
+        alpha, beta, gamma = -alpha, -beta, -gamma
+    if rev:
+        alpha, gamma = gamma, alpha
+
+    # Angle wrapping.
+    if alt:
+        flip = (-pi < beta) & (beta < 0.0)
+        alpha = where(flip, alpha + pi, alpha)
+        beta = where(flip, -beta, beta)
+        gamma = where(flip, gamma + pi, gamma)
+
+    alpha = wrap_angles_batch(alpha, 0.0, 2.0*pi)
+    beta  = wrap_angles_batch(beta,  0.0, 2.0*pi)
+    gamma = wrap_angles_batch(gamma, 0.0, 2.0*pi)
+
+    # Return the Euler angles.
+    return alpha, beta, gamma
+
+
 def R_to_euler_xyx(R):
     """Convert the rotation matrix to the xyx Euler angles.
 
@@ -1686,6 +3102,22 @@ def R_to_euler_xyx(R):
     return R_to_euler(R, 'xyx')
 
 
+def R_to_euler_xyx_batch(R):
+    """Convert a stack of rotation matrices to the xyx Euler angles.
+
+    This is the array version of R_to_euler_xyx().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the xyx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'xyx')
+
+
 def R_to_euler_xyz(R):
     """Convert the rotation matrix to the xyz Euler angles.
 
@@ -1699,6 +3131,22 @@ def R_to_euler_xyz(R):
     return R_to_euler(R, 'xyz')
 
 
+def R_to_euler_xyz_batch(R):
+    """Convert a stack of rotation matrices to the xyz Euler angles.
+
+    This is the array version of R_to_euler_xyz().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the xyz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'xyz')
+
+
 def R_to_euler_xzx(R):
     """Convert the rotation matrix to the xzx Euler angles.
 
@@ -1712,6 +3160,22 @@ def R_to_euler_xzx(R):
     return R_to_euler(R, 'xzx')
 
 
+def R_to_euler_xzx_batch(R):
+    """Convert a stack of rotation matrices to the xzx Euler angles.
+
+    This is the array version of R_to_euler_xzx().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the xzx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'xzx')
+
+
 def R_to_euler_xzy(R):
     """Convert the rotation matrix to the xzy Euler angles.
 
@@ -1725,6 +3189,22 @@ def R_to_euler_xzy(R):
     return R_to_euler(R, 'xzy')
 
 
+def R_to_euler_xzy_batch(R):
+    """Convert a stack of rotation matrices to the xzy Euler angles.
+
+    This is the array version of R_to_euler_xzy().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the xzy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'xzy')
+
+
 def R_to_euler_yxy(R):
     """Convert the rotation matrix to the yxy Euler angles.
 
@@ -1738,6 +3218,22 @@ def R_to_euler_yxy(R):
     return R_to_euler(R, 'yxy')
 
 
+def R_to_euler_yxy_batch(R):
+    """Convert a stack of rotation matrices to the yxy Euler angles.
+
+    This is the array version of R_to_euler_yxy().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the yxy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'yxy')
+
+
 def R_to_euler_yxz(R):
     """Convert the rotation matrix to the yxz Euler angles.
 
@@ -1751,6 +3247,22 @@ def R_to_euler_yxz(R):
     return R_to_euler(R, 'yxz')
 
 
+def R_to_euler_yxz_batch(R):
+    """Convert a stack of rotation matrices to the yxz Euler angles.
+
+    This is the array version of R_to_euler_yxz().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the yxz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'yxz')
+
+
 def R_to_euler_yzx(R):
     """Convert the rotation matrix to the yzx Euler angles.
 
@@ -1764,6 +3276,22 @@ def R_to_euler_yzx(R):
     return R_to_euler(R, 'yzx')
 
 
+def R_to_euler_yzx_batch(R):
+    """Convert a stack of rotation matrices to the yzx Euler angles.
+
+    This is the array version of R_to_euler_yzx().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the yzx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'yzx')
+
+
 def R_to_euler_yzy(R):
     """Convert the rotation matrix to the yzy Euler angles.
 
@@ -1777,6 +3305,22 @@ def R_to_euler_yzy(R):
     return R_to_euler(R, 'yzy')
 
 
+def R_to_euler_yzy_batch(R):
+    """Convert a stack of rotation matrices to the yzy Euler angles.
+
+    This is the array version of R_to_euler_yzy().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the yzy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'yzy')
+
+
 def R_to_euler_zxy(R):
     """Convert the rotation matrix to the zxy Euler angles.
 
@@ -1786,8 +3330,24 @@ def R_to_euler_zxy(R):
     @rtype:         tuple of float
     """
 
-    # Redirect to R_to_euler()
-    return R_to_euler(R, 'zxy')
+    # Redirect to R_to_euler()
+    return R_to_euler(R, 'zxy')
+
+
+def R_to_euler_zxy_batch(R):
+    """Convert a stack of rotation matrices to the zxy Euler angles.
+
+    This is the array version of R_to_euler_zxy().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the zxy convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'zxy')
 
 
 def R_to_euler_zxz(R):
@@ -1803,6 +3363,22 @@ def R_to_euler_zxz(R):
     return R_to_euler(R, 'zxz')
 
 
+def R_to_euler_zxz_batch(R):
+    """Convert a stack of rotation matrices to the zxz Euler angles.
+
+    This is the array version of R_to_euler_zxz().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the zxz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'zxz')
+
+
 def R_to_euler_zyx(R):
     """Convert the rotation matrix to the zyx Euler angles.
 
@@ -1816,6 +3392,22 @@ def R_to_euler_zyx(R):
     return R_to_euler(R, 'zyx')
 
 
+def R_to_euler_zyx_batch(R):
+    """Convert a stack of rotation matrices to the zyx Euler angles.
+
+    This is the array version of R_to_euler_zyx().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the zyx convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'zyx')
+
+
 def R_to_euler_zyz(R):
     """Convert the rotation matrix to the zyz Euler angles.
 
@@ -1829,6 +3421,22 @@ def R_to_euler_zyz(R):
     return R_to_euler(R, 'zyz')
 
 
+def R_to_euler_zyz_batch(R):
+    """Convert a stack of rotation matrices to the zyz Euler angles.
+
+    This is the array version of R_to_euler_zyz().
+
+
+    @param R:       The 3x3 rotation matrices to extract the Euler angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The alpha, beta, and gamma Euler angles in the zyz convention.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Redirect to R_to_euler_batch()
+    return R_to_euler_batch(R, 'zyz')
+
+
 def R_to_tilt_torsion(R):
     """Convert the rotation matrix to the tilt and torsion rotation angles.
 
@@ -1853,6 +3461,25 @@ def R_to_tilt_torsion(R):
     return phi, theta, sigma
 
 
+def R_to_tilt_torsion_batch(R):
+    """Convert a stack of rotation matrices to the tilt and torsion rotation angles.
+
+    This is the array version of R_to_tilt_torsion().
+
+
+    @param R:       The 3x3 rotation matrices to extract the tilt and torsion angles from.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @return:        The phi, theta, and sigma tilt and torsion angles.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # First obtain the zyz Euler angles.
+    alpha, beta, gamma = R_to_euler_batch(R, 'zyz')
+
+    # The convert to tilt and torsion.
+    return gamma, beta, alpha + gamma
+
+
 def R_to_quaternion(R, quat):
     """Convert a rotation matrix into quaternion form.
 
@@ -1888,6 +3515,34 @@ def R_to_quaternion(R, quat):
         quat[3] = copysign(0.5*sqrt(1 - R[0, 0] - R[1, 1] + R[2, 2]), quat[3])
 
 
+def R_to_quaternion_batch(R, quat):
+    """Convert a stack of rotation matrices into quaternion form.
+
+    This is the array version of R_to_quaternion().
+
+
+    @param R:       The 3D rotation matrices.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    @param quat:    The quaternions.
+    @type quat:     numpy rank-2 (N, 4) array
+    """
+
+    # The scalar component.
+    quat[:, 0] = 0.5 * np_sqrt(1.0 + R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2])
+
+    # The vector component, with the signs taken from the antisymmetric part of R.
+    quat[:, 1] = R[:, 2, 1] - R[:, 1, 2]
+    quat[:, 2] = R[:, 0, 2] - R[:, 2, 0]
+    quat[:, 3] = R[:, 1, 0] - R[:, 0, 1]
+    diag = [[1, -1, -1], [-1, 1, -1], [-1, -1, 1]]
+    for i in range(3):
+        # Only the non-zero elements are replaced.
+        nonzero = quat[:, i+1] != 0.0
+        sub = R[nonzero]
+        length = 0.5*np_sqrt(1 + diag[i][0]*sub[:, 0, 0] + diag[i][1]*sub[:, 1, 1] + diag[i][2]*sub[:, 2, 2])
+        quat[nonzero, i+1] = copysign(length, quat[nonzero, i+1])
+
+
 def reverse_euler_xyx(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -1908,7 +3563,7 @@ def reverse_euler_xyx(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_xyx_to_R(alpha, beta, gamma, R)
+    euler_to_R_xyx(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -1917,6 +3572,35 @@ def reverse_euler_xyx(alpha, beta, gamma):
     return R_to_euler_xyx(R)
 
 
+def reverse_euler_xyx_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation xyx Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_xyx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xyx_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_xyx_batch(R)
+
+
 def reverse_euler_xyz(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -1937,7 +3621,7 @@ def reverse_euler_xyz(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_xyz_to_R(alpha, beta, gamma, R)
+    euler_to_R_xyz(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -1946,6 +3630,35 @@ def reverse_euler_xyz(alpha, beta, gamma):
     return R_to_euler_xyz(R)
 
 
+def reverse_euler_xyz_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation xyz Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_xyz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xyz_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_xyz_batch(R)
+
+
 def reverse_euler_xzx(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -1966,7 +3679,7 @@ def reverse_euler_xzx(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_xzx_to_R(alpha, beta, gamma, R)
+    euler_to_R_xzx(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -1975,6 +3688,35 @@ def reverse_euler_xzx(alpha, beta, gamma):
     return R_to_euler_xzx(R)
 
 
+def reverse_euler_xzx_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation xzx Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_xzx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xzx_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_xzx_batch(R)
+
+
 def reverse_euler_xzy(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -1995,7 +3737,7 @@ def reverse_euler_xzy(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_xzy_to_R(alpha, beta, gamma, R)
+    euler_to_R_xzy(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2004,6 +3746,35 @@ def reverse_euler_xzy(alpha, beta, gamma):
     return R_to_euler_xzy(R)
 
 
+def reverse_euler_xzy_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation xzy Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_xzy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_xzy_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_xzy_batch(R)
+
+
 def reverse_euler_yxy(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2024,7 +3795,7 @@ def reverse_euler_yxy(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_yxy_to_R(alpha, beta, gamma, R)
+    euler_to_R_yxy(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2033,6 +3804,35 @@ def reverse_euler_yxy(alpha, beta, gamma):
     return R_to_euler_yxy(R)
 
 
+def reverse_euler_yxy_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation yxy Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_yxy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yxy_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_yxy_batch(R)
+
+
 def reverse_euler_yxz(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2053,7 +3853,7 @@ def reverse_euler_yxz(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_yxz_to_R(alpha, beta, gamma, R)
+    euler_to_R_yxz(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2062,6 +3862,35 @@ def reverse_euler_yxz(alpha, beta, gamma):
     return R_to_euler_yxz(R)
 
 
+def reverse_euler_yxz_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation yxz Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_yxz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yxz_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_yxz_batch(R)
+
+
 def reverse_euler_yzx(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2082,7 +3911,7 @@ def reverse_euler_yzx(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_yzx_to_R(alpha, beta, gamma, R)
+    euler_to_R_yzx(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2091,6 +3920,35 @@ def reverse_euler_yzx(alpha, beta, gamma):
     return R_to_euler_yzx(R)
 
 
+def reverse_euler_yzx_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation yzx Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_yzx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yzx_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_yzx_batch(R)
+
+
 def reverse_euler_yzy(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2111,7 +3969,7 @@ def reverse_euler_yzy(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_yzy_to_R(alpha, beta, gamma, R)
+    euler_to_R_yzy(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2120,6 +3978,35 @@ def reverse_euler_yzy(alpha, beta, gamma):
     return R_to_euler_yzy(R)
 
 
+def reverse_euler_yzy_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation yzy Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_yzy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_yzy_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_yzy_batch(R)
+
+
 def reverse_euler_zxy(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2140,7 +4027,7 @@ def reverse_euler_zxy(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_zxy_to_R(alpha, beta, gamma, R)
+    euler_to_R_zxy(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2149,6 +4036,35 @@ def reverse_euler_zxy(alpha, beta, gamma):
     return R_to_euler_zxy(R)
 
 
+def reverse_euler_zxy_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation zxy Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_zxy().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zxy_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_zxy_batch(R)
+
+
 def reverse_euler_zxz(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2169,7 +4085,7 @@ def reverse_euler_zxz(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_zxz_to_R(alpha, beta, gamma, R)
+    euler_to_R_zxz(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2178,6 +4094,35 @@ def reverse_euler_zxz(alpha, beta, gamma):
     return R_to_euler_zxz(R)
 
 
+def reverse_euler_zxz_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation zxz Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_zxz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zxz_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_zxz_batch(R)
+
+
 def reverse_euler_zyx(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2198,7 +4143,7 @@ def reverse_euler_zyx(alpha, beta, gamma):
     R = zeros((3, 3), float64)
 
     # Get the rotation.
-    euler_zyx_to_R(alpha, beta, gamma, R)
+    euler_to_R_zyx(alpha, beta, gamma, R)
 
     # Reverse rotation.
     R = transpose(R)
@@ -2207,6 +4152,35 @@ def reverse_euler_zyx(alpha, beta, gamma):
     return R_to_euler_zyx(R)
 
 
+def reverse_euler_zyx_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation zyx Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_zyx().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zyx_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_zyx_batch(R)
+
+
 def reverse_euler_zyz(alpha, beta, gamma):
     """Convert the given forward rotation Euler angles into the equivalent reverse rotation Euler angles.
     
@@ -2236,6 +4210,35 @@ def reverse_euler_zyz(alpha, beta, gamma):
     return R_to_euler_zyz(R)
 
 
+def reverse_euler_zyz_batch(alpha, beta, gamma):
+    """Convert a stack of forward rotation zyz Euler angles into the equivalent reverse rotation Euler angles.
+
+    This is the array version of reverse_euler_zyz().
+
+
+    @param alpha:   The alpha Euler angles in rad.
+    @type alpha:    numpy rank-1 (N,) array
+    @param beta:    The beta Euler angles in rad.
+    @type beta:     numpy rank-1 (N,) array
+    @param gamma:   The gamma Euler angles in rad.
+    @type gamma:    numpy rank-1 (N,) array
+    @return:        The alpha, beta, and gamma Euler angles for the reverse rotations.
+    @rtype:         tuple of numpy rank-1 (N,) arrays
+    """
+
+    # Init.
+    R = zeros((len(alpha), 3, 3), float64)
+
+    # Get the rotations.
+    euler_to_R_zyz_batch(alpha, beta, gamma, R)
+
+    # Reverse rotations.
+    R = transpose(R, (0, 2, 1))
+
+    # Return the Euler angles.
+    return R_to_euler_zyz_batch(R)
+
+
 def quaternion_to_axis_angle(quat):
     """Convert a quaternion into the axis-angle notation.
 
@@ -2271,6 +4274,30 @@ def quaternion_to_axis_angle(quat):
     return axis, angle
 
 
+def quaternion_to_axis_angle_batch(quat):
+    """Convert a stack of quaternions into the axis-angle notation.
+
+    This is the array version of quaternion_to_axis_angle().
+
+
+    @param quat:    The quaternions.
+    @type quat:     numpy rank-2 (N, 4) array
+    @return:        The 3D rotation axes and angles.
+    @rtype:         numpy rank-2 (N, 3) array, numpy rank-1 (N,) array
+    """
+
+    # The angles.
+    angle = 2 * _acos_batch(quat[:, 0])
+
+    # The axes.
+    axis = quat[:, 1:] * 0.0
+    nonzero = angle != 0.0
+    axis[nonzero] = quat[nonzero, 1:] / np_sin(angle[nonzero]/2)[:, None]
+
+    # Return
+    return axis, angle
+
+
 def quaternion_to_R(quat, R):
     """Convert a quaternion into rotation matrix form.
 
@@ -2319,6 +4346,50 @@ def quaternion_to_R(quat, R):
     R[2, 1] = yz + xw
 
 
+def quaternion_to_R_batch(quat, R):
+    """Convert a stack of quaternions into rotation matrix form.
+
+    This is the array version of quaternion_to_R().
+
+
+    @param quat:    The quaternions.
+    @type quat:     numpy rank-2 (N, 4) array
+    @param R:       The 3x3 matrices to convert to the rotation matrices.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Alias.
+    w = quat[:, 0]
+    x = quat[:, 1]
+    y = quat[:, 2]
+    z = quat[:, 3]
+
+    # Repetitive calculations.
+    x2 = 2.0 * _square_batch(x)
+    y2 = 2.0 * _square_batch(y)
+    z2 = 2.0 * _square_batch(z)
+    xw = 2.0 * x*w
+    xy = 2.0 * x*y
+    xz = 2.0 * x*z
+    yw = 2.0 * y*w
+    yz = 2.0 * y*z
+    zw = 2.0 * z*w
+
+    # The diagonal.
+    R[:, 0, 0] = 1.0 - y2 - z2
+    R[:, 1, 1] = 1.0 - x2 - z2
+    R[:, 2, 2] = 1.0 - x2 - y2
+
+    # The off-diagonal.
+    R[:, 0, 1] = xy - zw
+    R[:, 0, 2] = xz + yw
+    R[:, 1, 2] = yz - xw
+
+    R[:, 1, 0] = xy + zw
+    R[:, 2, 0] = xz - yw
+    R[:, 2, 1] = yz + xw
+
+
 def tilt_torsion_to_R(phi, theta, sigma, R):
     """Generate a rotation matrix from the tilt and torsion rotation angles.
 
@@ -2344,6 +4415,26 @@ def tilt_torsion_to_R(phi, theta, sigma, R):
     euler_to_R_zyz(alpha, beta, gamma, R)
 
 
+def tilt_torsion_to_R_batch(phi, theta, sigma, R):
+    """Generate a stack of rotation matrices from the tilt and torsion rotation angles.
+
+    This is the array version of tilt_torsion_to_R().
+
+
+    @param phi:     The angles defining the x-y plane rotation axis.
+    @type phi:      numpy rank-1 (N,) array
+    @param theta:   The tilt angles.
+    @type theta:    numpy rank-1 (N,) array
+    @param sigma:   The torsion angles.
+    @type sigma:    numpy rank-1 (N,) array
+    @param R:       The 3x3 rotation matrices to update.
+    @type R:        numpy rank-3 (N, 3, 3) array
+    """
+
+    # Update the rotation matrices using the zyz Euler angles.
+    euler_to_R_zyz_batch(sigma - phi, theta, phi, R)
+
+
 def two_vect_to_R(vector_orig, vector_fin, R):
     """Calculate the rotation matrix required to rotate from one vector to another.
 
@@ -2401,3 +4492,51 @@ def two_vect_to_R(vector_orig, vector_fin, R):
     R[2, 0] = -y*sa+(1.0 - ca)*x*z
     R[2, 1] = x*sa+(1.0 - ca)*y*z
     R[2, 2] = 1.0 + (1.0 - ca)*(z**2 - 1.0)
+
+
+def two_vect_to_R_batch(vector_orig, vector_fin, R):
+    """Calculate the stack of rotation matrices required to rotate from one set of vectors to another.
+
+    This is the array version of two_vect_to_R().
+
+
+    @param vector_orig: The unrotated vectors defined in the reference frame.
+    @type vector_orig:  numpy rank-2 (N, 3) array
+    @param vector_fin:  The rotated vectors defined in the reference frame.
+    @type vector_fin:   numpy rank-2 (N, 3) array
+    @param R:           The 3x3 rotation matrices to update.
+    @type R:            numpy rank-3 (N, 3, 3) array
+    """
+
+    # Convert the vectors to unit vectors.
+    vector_orig = vector_orig / _norm_batch(vector_orig)[:, None]
+    vector_fin = vector_fin / _norm_batch(vector_fin)[:, None]
+
+    # The rotation axes (normalised).
+    axis = cross(vector_orig, vector_fin)
+    axis_len = _norm_batch(axis)
+    nonzero = axis_len != 0.0
+    axis[nonzero] = axis[nonzero] / axis_len[nonzero, None]
+
+    # Alias the axis coordinates.
+    x = axis[:, 0]
+    y = axis[:, 1]
+    z = axis[:, 2]
+
+    # The rotation angles.
+    angle = _acos_batch(_dot_batch(vector_orig, vector_fin))
+
+    # Trig functions (only need to do this maths once!).
+    ca = np_cos(angle)
+    sa = np_sin(angle)
+
+    # Calculate the rotation matrix elements.
+    R[:, 0, 0] = 1.0 + (1.0 - ca)*(_square_batch(x) - 1.0)
+    R[:, 0, 1] = -z*sa + (1.0 - ca)*x*y
+    R[:, 0, 2] = y*sa + (1.0 - ca)*x*z
+    R[:, 1, 0] = z*sa+(1.0 - ca)*x*y
+    R[:, 1, 1] = 1.0 + (1.0 - ca)*(_square_batch(y) - 1.0)
+    R[:, 1, 2] = -x*sa+(1.0 - ca)*y*z
+    R[:, 2, 0] = -y*sa+(1.0 - ca)*x*z
+    R[:, 2, 1] = x*sa+(1.0 - ca)*y*z
+    R[:, 2, 2] = 1.0 + (1.0 - ca)*(_square_batch(z) - 1.0)
@@ -24,7 +24,9 @@
 
 # Python module imports.
 from math import acos, atan2, cos, pi, sin
-from numpy import array, cross, dot, float64, sqrt
+from numpy import arccos, array, cross, dot, float64, sqrt
+from numpy import cos as np_cos
+from numpy import sin as np_sin
 from numpy.linalg import norm
 from random import uniform
 
@@ -77,6 +79,31 @@ def random_unit_vector(vector):
     vector[2] = cos(phi)
 
 
+def random_unit_vector_batch(vectors):
+    """Generate a stack of random rotation axes.
+
+    This is the array version of random_unit_vector(), with uniform point sampling on a unit sphere.  The random numbers are taken from the Python random module in the same order as repeated calls to random_unit_vector(), so that seeding the module gives the same axes.
+
+
+    @param vectors: The 3D rotation axes to update.
+    @type vectors:  numpy rank-2 (N, 3) array
+    """
+
+    # The random numbers, as pairs for the azimuthal and polar angles of each axis.
+    rand = array([uniform(0, 1) for i in range(2*len(vectors))], float64)
+
+    # Random azimuthal angles.
+    theta = 2*pi*rand[0::2]
+
+    # Random polar angles.
+    phi = arccos(2.0*rand[1::2] - 1)
+
+    # Random unit vectors.
+    vectors[:, 0] = np_cos(theta) * np_sin(phi)
+    vectors[:, 1] = np_sin(theta) * np_sin(phi)
+    vectors[:, 2] = np_cos(phi)
+
+
 def unit_vector_from_2point(point1, point2):
     """Generate the unit vector connecting point 1 to point 2.
 
@@ -0,0 +1,376 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Module docstring.
+"""A persistent on-disk cache of optimisation results keyed by a fingerprint of the optimisation inputs.
+
+The fingerprint is a SHA-1 hash of the optimiser, the target function together with the complete state of its class instance (the packed data arrays, the model and any function pointers, with Python functions identified by their code), the function arguments, the starting position, the constraints and all optimiser options.  Repeating an identical optimisation will return the stored results without calling the optimiser.  A second, structural fingerprint ignores all floating point values so that, if warm starting is active, the results of a near-identical problem can be used as the starting position.
+"""
+
+# Python module imports.
+from hashlib import sha1
+from numpy import ascontiguousarray, asarray, dot, dtype, float64, generic, ndarray, ufunc
+from os import F_OK, access, getpid, remove, rename, sep
+from types import BuiltinFunctionType, BuiltinMethodType, CodeType, FunctionType, MethodType, ModuleType
+
+# relax module imports.
+from lib.compat import pickle
+from lib.errors import RelaxError
+from lib.io import mkdir_nofail
+
+
+# The optimiser keyword arguments which do not affect the results.
+IGNORED_ARGS = ['print_flag', 'print_prefix', 'verbosity']
+
+
+class Optimisation_cache:
+    """The optimisation results cache."""
+
+    def __init__(self, dir=None, warm_start=False):
+        """Set up the cache.
+
+        @keyword dir:           The directory in which the results are stored.  This will be created if it does not exist.
+        @type dir:              str
+        @keyword warm_start:    A flag which if True will allow the results of structurally identical optimisation problems to be used as the starting position.
+        @type warm_start:       bool
+        """
+
+        # Store the arguments.
+        self.dir = dir
+        self.warm_start = warm_start
+
+        # Create the directory.
+        mkdir_nofail(self.dir, verbosity=0)
+
+
+    def _file_path(self, key, prefix='opt_'):
+        """Return the path of the file for the given key.
+
+        @param key:         The fingerprint.
+        @type key:          str
+        @keyword prefix:    The file name prefix.
+        @type prefix:       str
+        @return:            The file path.
+        @rtype:             str
+        """
+
+        # The path.
+        return self.dir + sep + prefix + key + '.pkl'
+
+
+    def _hash(self, hasher, obj, values, seen):
+        """Recursively feed an object into the hash.
+
+        @param hasher:  The hash object.
+        @type hasher:   hashlib hash instance
+        @param obj:     The object to hash.
+        @type obj:      anything
+        @param values:  A flag which if False will cause floating point values to be ignored, so that only the structure of the problem is hashed.
+        @type values:   bool
+        @param seen:    The IDs of all objects with an internal state already hashed, to break reference cycles.
+        @type seen:     set of int
+        @raises RelaxError: If the object type is not supported.
+        """
+
+        # The type.
+        hasher.update(type(obj).__name__.encode())
+
+        # Numpy arrays.
+        if isinstance(obj, ndarray):
+            hasher.update(("%s%s" % (obj.dtype.str, obj.shape)).encode())
+            if obj.dtype.hasobject:
+                for element in obj.flat:
+                    self._hash(hasher, element, values, seen)
+            elif values or obj.dtype.kind not in 'fc':
+                hasher.update(ascontiguousarray(obj).tobytes())
+
+        # Floats.
+        elif isinstance(obj, (float, complex)) or (isinstance(obj, generic) and asarray(obj).dtype.kind in 'fc'):
+            if values:
+                hasher.update(repr(obj).encode())
+
+        # Other simple types.
+        elif obj is None or isinstance(obj, (bool, int, str, bytes, generic)):
+            hasher.update(repr(obj).encode())
+
+        # Sequences.
+        elif isinstance(obj, (list, tuple)):
+            hasher.update(repr(len(obj)).encode())
+            for element in obj:
+                self._hash(hasher, element, values, seen)
+
+        # Dictionaries.
+        elif isinstance(obj, dict):
+            hasher.update(repr(len(obj)).encode())
+            for key in sorted(obj, key=repr):
+                self._hash(hasher, key, values, seen)
+                self._hash(hasher, obj[key], values, seen)
+
+        # Sets, in an order independent of the hash randomisation of the Python session.
+        elif isinstance(obj, (set, frozenset)):
+            hasher.update(repr(len(obj)).encode())
+            digests = []
+            for element in obj:
+                element_hasher = sha1()
+                self._hash(element_hasher, element, values, seen)
+                digests.append(element_hasher.digest())
+            for digest in sorted(digests):
+                hasher.update(digest)
+
+        # Python functions, identified by name, code, default arguments and closure variables.
+        elif isinstance(obj, FunctionType):
+            hasher.update(str(obj.__module__).encode())
+            hasher.update(obj.__qualname__.encode())
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                self._hash(hasher, obj.__code__, values, seen)
+                self._hash(hasher, obj.__defaults__, values, seen)
+                self._hash(hasher, obj.__kwdefaults__, values, seen)
+                cells = obj.__closure__ or ()
+                self._hash(hasher, [cell.cell_contents for cell in cells], values, seen)
+
+        # Code objects, including the bytecode and constants so that any change to the function source changes the hash.
+        elif isinstance(obj, CodeType):
+            hasher.update(obj.co_code)
+            self._hash(hasher, obj.co_consts, True, seen)
+            self._hash(hasher, (obj.co_names, obj.co_varnames, obj.co_freevars, obj.co_cellvars, obj.co_argcount, obj.co_kwonlyargcount, obj.co_flags), values, seen)
+
+        # Bound methods, identified by the function and the class instance.
+        elif isinstance(obj, MethodType):
+            self._hash(hasher, obj.__func__, values, seen)
+            self._hash(hasher, obj.__self__, values, seen)
+
+        # Compiled functions, classes, modules and data types, identified by name as their code cannot be inspected.
+        elif isinstance(obj, (BuiltinFunctionType, BuiltinMethodType, ModuleType, ufunc, type, dtype)):
+            hasher.update(str(getattr(obj, '__module__', '')).encode())
+            hasher.update(str(getattr(obj, '__qualname__', getattr(obj, '__name__', obj))).encode())
+
+        # Class instances, identified by the class and internal state.
+        elif hasattr(obj, '__dict__'):
+            hasher.update(type(obj).__module__.encode())
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                self._hash(hasher, obj.__dict__, values, seen)
+
+        # Anything else cannot be reliably hashed.
+        else:
+            raise RelaxError("The object %s of type %s cannot be hashed for the optimisation results cache." % (repr(obj), type(obj)))
+
+
+    def _load(self, file_path):
+        """Load the pickled object from the file.
+
+        @param file_path:   The file path.
+        @type file_path:    str
+        @return:            The object, or None if the file does not exist or is corrupted.
+        @rtype:             anything
+        """
+
+        # No file.
+        if not access(file_path, F_OK):
+            return None
+
+        # Load the data, ignoring incomplete or incompatible files.
+        try:
+            file = open(file_path, 'rb')
+            try:
+                return pickle.load(file)
+            finally:
+                file.close()
+        except Exception:
+            return None
+
+
+    def _save(self, file_path, obj):
+        """Pickle the object to the file, atomically replacing any existing file.
+
+        @param file_path:   The file path.
+        @type file_path:    str
+        @param obj:         The object to store.
+        @type obj:          anything
+        """
+
+        # Write to a temporary file first, so that parallel processes never see partial files.
+        temp_path = "%s.%s.tmp" % (file_path, getpid())
+        file = open(temp_path, 'wb')
+        try:
+            pickle.dump(obj, file, 2)
+        finally:
+            file.close()
+
+        # Move the file into place (the removal is for operating systems which cannot rename onto an existing file).
+        try:
+            if access(file_path, F_OK):
+                remove(file_path)
+        except OSError:
+            pass
+        rename(temp_path, file_path)
+
+
+    def fingerprint(self, optimiser=None, func=None, args=(), kwargs={}, values=True):
+        """Create the fingerprint of the optimisation problem.
+
+        All of the inputs of the target function must be held by the target function class instance - data held elsewhere, for example within C modules, will not be seen.
+
+
+        @keyword optimiser: The optimisation function.
+        @type optimiser:    function
+        @keyword func:      The target function.
+        @type func:         function
+        @keyword args:      The target function arguments.
+        @type args:         tuple
+        @keyword kwargs:    The optimiser keyword arguments, which includes the starting position, constraints and all optimisation options.
+        @type kwargs:       dict
+        @keyword values:    A flag which if False will cause floating point values to be ignored, for creating the structural fingerprint.
+        @type values:       bool
+        @return:            The hexadecimal SHA-1 fingerprint.
+        @rtype:             str
+        """
+
+        # Initialise.
+        hasher = sha1()
+        seen = set()
+
+        # The optimiser, identified by its code alone, and the target function.
+        self._hash(hasher, getattr(optimiser, '__func__', optimiser), values, seen)
+        self._hash(hasher, func, values, seen)
+
+        # The target function class instance state.
+        instance = getattr(func, '__self__', None)
+        if instance != None and not isinstance(instance, ModuleType):
+            self._hash(hasher, instance, values, seen)
+
+        # The arguments and options.
+        self._hash(hasher, args, values, seen)
+        for name in sorted(kwargs):
+            if name in IGNORED_ARGS:
+                continue
+            hasher.update(name.encode())
+            self._hash(hasher, kwargs[name], values, seen)
+
+        # Return the fingerprint.
+        return hasher.hexdigest()
+
+
+    def optimise(self, optimiser, func=None, args=(), **kwargs):
+        """Perform the optimisation, returning the cached results if available.
+
+        On a cache hit, the target function is called once at the cached position so that any state of the target function, such as back-calculated values, matches that after optimisation.
+
+
+        @param optimiser:   The optimisation function, for example the minfx generic_minimise() or grid() functions.  This will be called with the func and args keyword arguments together with all other keyword arguments.
+        @type optimiser:    function
+        @keyword func:      The target function.
+        @type func:         function
+        @keyword args:      The target function arguments.
+        @type args:         tuple
+        @return:            The results of the optimiser.
+        @rtype:             tuple
+        """
+
+        # The fingerprint.
+        key = self.fingerprint(optimiser=optimiser, func=func, args=args, kwargs=kwargs)
+        file_path = self._file_path(key)
+
+        # Cache hit.
+        results = self._load(file_path)
+        if results != None:
+            func(*((results[0],) + tuple(args)))
+            return results
+
+        # Warm start.
+        struct_path = None
+        if 'x0' in kwargs:
+            struct_path = self._file_path(self.fingerprint(optimiser=optimiser, func=func, args=args, kwargs=kwargs, values=False), prefix='warm_')
+            if self.warm_start:
+                kwargs['x0'] = self.warm_start_vector(self._load(struct_path), func=func, args=args, x0=kwargs['x0'], A=kwargs.get('A'), b=kwargs.get('b'))
+
+        # Optimise.
+        results = optimiser(func=func, args=args, **kwargs)
+
+        # Store the results.
+        if results != None:
+            self._save(file_path, results)
+            if struct_path != None:
+                self._save(struct_path, results[0])
+
+        # Return the results.
+        return results
+
+
+    def warm_start_vector(self, x, func=None, args=(), x0=None, A=None, b=None):
+        """Choose between the original and cached starting positions.
+
+        @param x:       The cached position of a structurally identical problem.
+        @type x:        numpy rank-1 array or None
+        @keyword func:  The target function.
+        @type func:     function
+        @keyword args:  The target function arguments.
+        @type args:     tuple
+        @keyword x0:    The original starting position.
+        @type x0:       numpy rank-1 array
+        @keyword A:     The linear constraint matrix.
+        @type A:        numpy rank-2 array or None
+        @keyword b:     The linear constraint scalar vector.
+        @type b:        numpy rank-1 array or None
+        @return:        The cached position if it satisfies the constraints and has a lower target function value, otherwise the original starting position.
+        @rtype:         numpy rank-1 array
+        """
+
+        # No cached position.
+        if x is None or x0 is None or len(x) != len(x0):
+            return x0
+
+        # Constraint violation.
+        x = asarray(x, float64)
+        if A is not None and b is not None and (dot(A, x) < b).any():
+            return x0
+
+        # Compare the target function values.
+        if func(*((x,) + tuple(args))) < func(*((asarray(x0, float64),) + tuple(args))):
+            return x
+
+        # The original position is better.
+        return x0
+
+
+
+def cached_optimise(optimiser, cache=None, func=None, args=(), **kwargs):
+    """Call the optimiser, using the optimisation results cache if supplied.
+
+    @param optimiser:   The optimisation function, for example the minfx generic_minimise() or grid() functions.
+    @type optimiser:    function
+    @keyword cache:     The optimisation results cache.  If None, the optimiser is simply called.
+    @type cache:        Optimisation_cache instance or None
+    @keyword func:      The target function.
+    @type func:         function
+    @keyword args:      The target function arguments.
+    @type args:         tuple
+    @return:            The results of the optimiser.
+    @rtype:             tuple
+    """
+
+    # No cache.
+    if cache == None:
+        return optimiser(func=func, args=args, **kwargs)
+
+    # Cached optimisation.
+    return cache.optimise(optimiser, func=func, args=args, **kwargs)
@@ -31,7 +31,7 @@ from lib.errors import RelaxError
 from lib.sequence_alignment.align_protein import align_pairwise
 
 
-def central_star(sequences, algorithm='NW70', matrix='BLOSUM62', gap_open_penalty=1.0, gap_extend_penalty=1.0, end_gap_open_penalty=0.0, end_gap_extend_penalty=0.0):
+def central_star(sequences, algorithm='NW70', matrix='BLOSUM62', gap_open_penalty=1.0, gap_extend_penalty=1.0, end_gap_open_penalty=0.0, end_gap_extend_penalty=0.0, pairwise_func=None):
     """Align multiple protein sequences to one reference by fusing multiple pairwise alignments.
 
     @param sequences:                   The list of residue sequences as one letter codes.
@@ -48,10 +48,16 @@ def central_star(sequences, algorithm='NW70', matrix='BLOSUM62', gap_open_penalt
     @type end_gap_open_penalty:         float
     @keyword end_gap_extend_penalty:    The optional penalty for extending a gap at the end of a sequence.
     @type end_gap_extend_penalty:       float
+    @keyword pairwise_func:             The function for the all-against-all pairwise alignments, with the same arguments as pairwise_alignments().  This allows the alignments to be performed in parallel.  If not supplied, pairwise_alignments() will be used.
+    @type pairwise_func:                None or callable
     @return:                            The list of alignment strings and the gap matrix.
     @rtype:                             list of str, numpy rank-2 int array
     """
 
+    # The pairwise alignment function.
+    if pairwise_func == None:
+        pairwise_func = pairwise_alignments
+
     # Initialise.
     N = len(sequences)
     scores = zeros((N, N), float64)
@@ -82,17 +88,21 @@ def central_star(sequences, algorithm='NW70', matrix='BLOSUM62', gap_open_penalt
 
     # All pairwise alignments.
     sys.stdout.write("\nDetermining the scores for all pairwise alignments:\n")
+    pairs = []
     for i in range(N):
         for j in range(i+1, N):
-            # Align the pair.
-            sys.stdout.write("%-30s " % ("Sequences %i-%i:" % (i+1, j+1)))
-            score, align1, align2, gaps = align_pairwise(sequences[i], sequences[j], algorithm=algorithm, matrix=matrix, gap_open_penalty=gap_open_penalty, gap_extend_penalty=gap_extend_penalty, end_gap_open_penalty=end_gap_open_penalty, end_gap_extend_penalty=end_gap_extend_penalty, verbosity=0)
-            sys.stdout.write("%10.1f\n" % score)
-
-            # Store the score and alignment strings.
-            scores[i, j] = scores[j, i] = score
-            align1_matrix[i][j] = align1_matrix[j][i] = align1
-            align2_matrix[i][j] = align2_matrix[j][i] = align2
+            pairs.append([i, j])
+    results = pairwise_func(sequences, pairs=pairs, algorithm=algorithm, matrix=matrix, gap_open_penalty=gap_open_penalty, gap_extend_penalty=gap_extend_penalty, end_gap_open_penalty=end_gap_open_penalty, end_gap_extend_penalty=end_gap_extend_penalty)
+    for k in range(len(pairs)):
+        # Unpack the pair.
+        i, j = pairs[k]
+        score, align1, align2 = results[k]
+        sys.stdout.write("%-30s %10.1f\n" % (("Sequences %i-%i:" % (i+1, j+1)), score))
+
+        # Store the score and alignment strings.
+        scores[i, j] = scores[j, i] = score
+        align1_matrix[i][j] = align1_matrix[j][i] = align1
+        align2_matrix[i][j] = align2_matrix[j][i] = align2
 
     # The central sequence.
     sys.stdout.write("\nDetermining the central sequence:\n")
@@ -168,7 +178,7 @@ def central_star(sequences, algorithm='NW70', matrix='BLOSUM62', gap_open_penalt
     return strings, gaps
 
 
-def msa_general(sequences, residue_numbers=None, msa_algorithm='Central Star', pairwise_algorithm='NW70', matrix='BLOSUM62', gap_open_penalty=1.0, gap_extend_penalty=1.0, end_gap_open_penalty=0.0, end_gap_extend_penalty=0.0):
+def msa_general(sequences, residue_numbers=None, msa_algorithm='Central Star', pairwise_algorithm='NW70', matrix='BLOSUM62', gap_open_penalty=1.0, gap_extend_penalty=1.0, end_gap_open_penalty=0.0, end_gap_extend_penalty=0.0, pairwise_func=None):
     """General interface for multiple sequence alignments (MSA).
 
     This can be used to select between the following MSA algorithms:
@@ -195,6 +205,8 @@ def msa_general(sequences, residue_numbers=None, msa_algorithm='Central Star', p
     @type end_gap_open_penalty:         float
     @keyword end_gap_extend_penalty:    The optional penalty for extending a gap at the end of a sequence.
     @type end_gap_extend_penalty:       float
+    @keyword pairwise_func:             The function for the all-against-all pairwise alignments of the central star algorithm (see central_star()).
+    @type pairwise_func:                None or callable
     @return:                            The list of alignment strings and the gap matrix.
     @rtype:                             list of str, numpy rank-2 int array
     """
@@ -220,7 +232,7 @@ def msa_general(sequences, residue_numbers=None, msa_algorithm='Central Star', p
 
     # Use the central star multiple alignment algorithm.
     if msa_algorithm == 'Central Star':
-        strings, gaps = central_star(sequences, algorithm=pairwise_algorithm, matrix=matrix, gap_open_penalty=gap_open_penalty, gap_extend_penalty=gap_extend_penalty, end_gap_open_penalty=end_gap_open_penalty, end_gap_extend_penalty=end_gap_extend_penalty)
+        strings, gaps = central_star(sequences, algorithm=pairwise_algorithm, matrix=matrix, gap_open_penalty=gap_open_penalty, gap_extend_penalty=gap_extend_penalty, end_gap_open_penalty=end_gap_open_penalty, end_gap_extend_penalty=end_gap_extend_penalty, pairwise_func=pairwise_func)
 
     # Alignment by residue number.
     elif msa_algorithm == 'residue number':
@@ -293,6 +305,49 @@ def msa_residue_numbers(sequences, residue_numbers=None):
     return strings, gaps
 
 
+def pairwise_alignments(sequences, pairs=None, algorithm='NW70', matrix='BLOSUM62', gap_open_penalty=1.0, gap_extend_penalty=1.0, end_gap_open_penalty=0.0, end_gap_extend_penalty=0.0):
+    """Perform the pairwise alignment of the given sequence pairs.
+
+    @param sequences:                   The list of residue sequences as one letter codes.
+    @type sequences:                    list of str
+    @keyword pairs:                     The list of sequence index pairs to align.
+    @type pairs:                        list of list of int
+    @keyword algorithm:                 The pairwise sequence alignment algorithm to use.
+    @type algorithm:                    str
+    @keyword matrix:                    The substitution matrix to use.
+    @type matrix:                       str
+    @keyword gap_open_penalty:          The penalty for introducing gaps, as a positive number.
+    @type gap_open_penalty:             float
+    @keyword gap_extend_penalty:        The penalty for extending a gap, as a positive number.
+    @type gap_extend_penalty:           float
+    @keyword end_gap_open_penalty:      The optional penalty for opening a gap at the end of a sequence.
+    @type end_gap_open_penalty:         float
+    @keyword end_gap_extend_penalty:    The optional penalty for extending a gap at the end of a sequence.
+    @type end_gap_extend_penalty:       float
+    @return:                            The alignment score and the two alignment strings for each pair.
+    @rtype:                             list of [float, str, str]
+    """
+
+    # The alignment settings.
+    settings = {
+        'algorithm': algorithm,
+        'matrix': matrix,
+        'gap_open_penalty': gap_open_penalty,
+        'gap_extend_penalty': gap_extend_penalty,
+        'end_gap_open_penalty': end_gap_open_penalty,
+        'end_gap_extend_penalty': end_gap_extend_penalty
+    }
+
+    # Align each pair.
+    results = []
+    for i, j in pairs:
+        score, align1, align2, gaps = align_pairwise(sequences[i], sequences[j], verbosity=0, **settings)
+        results.append([score, align1, align2])
+
+    # Return the results.
+    return results
+
+
 def msa_residue_skipping(strings=None, gaps=None):
     """Create the residue skipping data structure. 
 
@@ -336,3 +391,4 @@ def msa_residue_skipping(strings=None, gaps=None):
 
     # Return the data structure.
     return skip
+
@@ -23,7 +23,7 @@
 """Functions for implementing the Needleman-Wunsch sequence alignment algorithm."""
 
 # Python module imports.
-from numpy import float32, int16, zeros
+from numpy import array, float32, int16, int64, maximum, zeros
 
 # relax module imports.
 from lib.errors import RelaxError, RelaxFault
@@ -33,7 +33,6 @@ from lib.errors import RelaxError, RelaxFault
 SCORE_MATCH = 1
 SCORE_MISMATCH = -1
 SCORE_GAP_PENALTY = 1
-SCORES = zeros(3, float32)
 
 # Indices.
 TRACEBACK_DIAG = 0
@@ -138,7 +137,7 @@ def needleman_wunsch_align(sequence1, sequence2, sub_matrix=None, sub_seq=None,
 def needleman_wunsch_matrix(sequence1, sequence2, sub_matrix=None, sub_seq=None, gap_open_penalty=SCORE_GAP_PENALTY, gap_extend_penalty=1.0, end_gap_open_penalty=0.0, end_gap_extend_penalty=0.0, epsilon=1e-7):
     """Construct the Needleman-Wunsch matrix for the given two sequences using the EMBOSS logic.
 
-    The algorithm has been modified to match that of U{EMBOSS<http://emboss.sourceforge.net/>} to allow for gap opening and extension penalties, as well as end penalties.
+    The algorithm has been modified to match that of U{EMBOSS<http://emboss.sourceforge.net/>} to allow for gap opening and extension penalties, as well as end penalties.  As each matrix element only depends on elements of the previous two anti-diagonals, the matrices are filled one anti-diagonal at a time (the wavefront) with all elements of the anti-diagonal being calculated simultaneously.
 
 
     @param sequence1:                   The first sequence.
@@ -175,15 +174,20 @@ def needleman_wunsch_matrix(sequence1, sequence2, sub_matrix=None, sub_seq=None,
     # Initial traceback matrix.
     traceback_matrix = zeros((M, N), int16)
 
+    # The substitution scores for all residue pairs.
+    indices1 = array([sub_seq.index(residue) for residue in sequence1], int64)
+    indices2 = array([sub_seq.index(residue) for residue in sequence2], int64)
+    sub_scores = sub_matrix[indices1[:, None], indices2[None, :]]
+
     # Set up position [0, 0].
-    matrix[0, 0] = sub_matrix[sub_seq.index(sequence1[0]), sub_seq.index(sequence2[0])]
+    matrix[0, 0] = sub_scores[0, 0]
     gap_matrix_vert[0, 0] = -gap_open_penalty
     gap_matrix_hori[0, 0] = -gap_open_penalty
 
     # Set up the first column.
     for i in range(1, M):
         # Substitution scores from the matrix.
-        matrix[i, 0] = sub_matrix[sub_seq.index(sequence1[i]), sub_seq.index(sequence2[0])]
+        matrix[i, 0] = sub_scores[i, 0]
 
         # Gap scores.
         score_gap_open = matrix[i-1, 0] - gap_open_penalty
@@ -199,7 +203,7 @@ def needleman_wunsch_matrix(sequence1, sequence2, sub_matrix=None, sub_seq=None,
     # Set up the first row.
     for j in range(1, N):
         # Substitution scores from the matrix.
-        matrix[0, j] = sub_matrix[sub_seq.index(sequence1[0]), sub_seq.index(sequence2[j])]
+        matrix[0, j] = sub_scores[0, j]
 
         # Gap scores.
         score_gap_open = matrix[0, j-1] - gap_open_penalty
@@ -212,41 +216,50 @@ def needleman_wunsch_matrix(sequence1, sequence2, sub_matrix=None, sub_seq=None,
         if j < N-1:
             gap_matrix_hori[0, j] = -gap_open_penalty
 
-    # Fill in the rest of the matrix.
-    for j in range(1, N):
-        for i in range(1, M):
-            # Substitution scores from the matrix.
-            sub_score = sub_matrix[sub_seq.index(sequence1[i]), sub_seq.index(sequence2[j])]
-
-            # The diagonal score.
-            SCORES[0] = matrix[i-1, j-1]
-
-            # The top score.
-            SCORES[1] = gap_matrix_vert[i-1, j-1]
-
-            # The left score.
-            SCORES[2] = gap_matrix_hori[i-1, j-1]
-
-            # Store the score.
-            matrix[i, j] = SCORES.max() + sub_score
-
-            # Horizontal gap scores.
-            if j == N-1:
-                score_gap_open = matrix[i-1, j] - end_gap_open_penalty
-                score_gap_extend = gap_matrix_hori[i-1, j] - end_gap_extend_penalty
-            else:
-                score_gap_open = max(matrix[i-1, j], gap_matrix_vert[i-1, j]) - gap_open_penalty
-                score_gap_extend = gap_matrix_hori[i-1, j] - gap_extend_penalty
-            gap_matrix_hori[i, j] = max(score_gap_open, score_gap_extend)
-
-            # Vertical gap scores.
-            if i == M-1:
-                score_gap_open = matrix[i, j-1] - end_gap_open_penalty
-                score_gap_extend = gap_matrix_vert[i, j-1] - end_gap_extend_penalty
-            else:
-                score_gap_open = max(matrix[i, j-1], gap_matrix_hori[i, j-1]) - gap_open_penalty
-                score_gap_extend = gap_matrix_vert[i, j-1] - gap_extend_penalty
-            gap_matrix_vert[i, j] = max(score_gap_open, score_gap_extend)
+    # Flat views of the matrices, in which the elements of an anti-diagonal are separated by a stride of N-1.
+    matrix_flat = matrix.ravel()
+    vert_flat = gap_matrix_vert.ravel()
+    hori_flat = gap_matrix_hori.ravel()
+    sub_flat = sub_scores.ravel()
+
+    # Fill in the rest of the matrix, one anti-diagonal i+j = d at a time.
+    for d in range(2, M+N-1):
+        # The first and last row indices of the anti-diagonal, excluding the first row and column.
+        i_first = max(1, d-N+1)
+        i_last = min(M-1, d-1)
+        if i_first > i_last:
+            continue
+
+        # The anti-diagonal element slices for positions [i, j], [i-1, j-1], [i-1, j] and [i, j-1].
+        start = i_first*(N-1) + d
+        stop = i_last*(N-1) + d + 1
+        curr = slice(start, stop, N-1)
+        diag = slice(start-N-1, stop-N-1, N-1)
+        top = slice(start-N, stop-N, N-1)
+        left = slice(start-1, stop-1, N-1)
+
+        # The maximum of the diagonal, top and left scores, plus the substitution score.
+        matrix_flat[curr] = maximum(maximum(matrix_flat[diag], vert_flat[diag]), hori_flat[diag]) + sub_flat[curr]
+
+        # Horizontal gap scores.
+        score_gap_open = maximum(matrix_flat[top], vert_flat[top]) - gap_open_penalty
+        score_gap_extend = hori_flat[top] - gap_extend_penalty
+
+        # The end gap penalties for the last column (the first element of the anti-diagonal).
+        if d-i_first == N-1:
+            score_gap_open[0] = matrix_flat[top][0] - end_gap_open_penalty
+            score_gap_extend[0] = hori_flat[top][0] - end_gap_extend_penalty
+        hori_flat[curr] = maximum(score_gap_open, score_gap_extend)
+
+        # Vertical gap scores.
+        score_gap_open = maximum(matrix_flat[left], hori_flat[left]) - gap_open_penalty
+        score_gap_extend = vert_flat[left] - gap_extend_penalty
+
+        # The end gap penalties for the last row (the last element of the anti-diagonal).
+        if i_last == M-1:
+            score_gap_open[-1] = matrix_flat[left][-1] - end_gap_open_penalty
+            score_gap_extend[-1] = vert_flat[left][-1] - end_gap_extend_penalty
+        vert_flat[curr] = maximum(score_gap_open, score_gap_extend)
 
     # Determine the best traceback path.
     j = N - 1
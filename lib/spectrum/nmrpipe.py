@@ -27,6 +27,7 @@
 # Python module imports.
 import re
 from glob import glob
+from numpy import array, float64
 from os import sep
 from os.path import abspath
 subprocess_module = False
@@ -113,10 +114,6 @@ def read_seriestab(peak_list=None, file_data=None, int_col=None):
         int_col = varsline.index('%s'%int_type) + 1
         warn(RelaxWarning("The int_col is set to '%i' from the '%s' index."%(int_col, int_type) ))
 
-    # Chemical shifts preparation.
-    w1_col = None
-    w2_col = None
-
     # Find index of chemical shift Y_PPM which in sparky is w1.
     w1_col = varsline.index('Y_PPM')
 
@@ -135,7 +132,9 @@ def read_seriestab(peak_list=None, file_data=None, int_col=None):
     # Remove the header.
     file_data = file_data[header:]
 
-    # Loop over the file data.
+    # Loop over the file data, parsing the assignments.
+    lines = []
+    assignments = []
     for line in file_data:
         # Skip non-assigned peaks.
         if line[ass_i] == '?-?':
@@ -197,34 +196,37 @@ def read_seriestab(peak_list=None, file_data=None, int_col=None):
                 res_name2 = None
                 warn(RelaxWarning("Improperly formatted NMRPipe SeriesTab file, cannot process the residue name for dimension 2 in assignment: %s. Setting residue name to %s." % (line[0], res_name2)))
 
-        # Get the intensities.
-        try:
-            # Loop over the spectra.
-            intensities = []
-            for i in range(len(spectra)):
-                # The intensity is given by column multiplication.
-                intensities.append( float(line[spectra_i[i]]) * float(line[int_col-1]) )
-
-        # Bad data.
-        except ValueError:
-            raise RelaxError("The peak intensity value %s from the line %s is invalid." % (intensity, line))
-
-        # Chemical shifts.
-        w1 = None
-        w2 = None
-        if w1_col != None:
+        # Store the assignment.
+        lines.append(line)
+        assignments.append([res_num1, res_num2, res_name1, res_name2, name1, name2])
+
+    # Get the intensities of all peaks and spectra in one conversion, as the spectral columns multiplied by the intensity column.
+    try:
+        intensities = array([[line[i] for i in spectra_i] for line in lines], float64) * array([line[int_col-1] for line in lines], float64).reshape((len(lines), 1))
+
+    # Bad data, finding the line.
+    except ValueError:
+        for line in lines:
             try:
-                w1 = float(line[w1_col])
+                [float(line[i]) for i in spectra_i + [int_col-1]]
             except ValueError:
-                raise RelaxError("The chemical shift from the line %s is invalid." % line)
-        if w2_col != None:
+                raise RelaxError("The peak intensity value from the line %s is invalid." % line)
+
+    # Chemical shifts.
+    try:
+        shifts = array([[line[w1_col], line[w2_col]] for line in lines], float64).reshape((len(lines), 2))
+    except ValueError:
+        for line in lines:
             try:
-                w2 = float(line[w2_col])
+                float(line[w1_col])
+                float(line[w2_col])
             except ValueError:
                 raise RelaxError("The chemical shift from the line %s is invalid." % line)
 
-        # Add the assignment to the peak list object.
-        peak_list.add(res_nums=[res_num1, res_num2], res_names=[res_name1, res_name2], spin_names=[name1, name2], shifts=[w1, w2], intensity=intensities, intensity_name=spectra)
+    # Add the assignments to the peak list object.
+    for i in range(len(lines)):
+        res_num1, res_num2, res_name1, res_name2, name1, name2 = assignments[i]
+        peak_list.add(res_nums=[res_num1, res_num2], res_names=[res_name1, res_name2], spin_names=[name1, name2], shifts=shifts[i].tolist(), intensity=intensities[i].tolist(), intensity_name=spectra)
 
 
 def show_apod_extract(file_name=None, dir=None, path_to_command='showApod'):
@@ -27,6 +27,7 @@
 
 
 # Python module imports.
+from numpy import array, float64, isfinite
 from warnings import warn
 
 # relax module imports.
@@ -109,14 +110,29 @@ def intensity_generic(peak_list=None, file_data=None, spin_id_col=None, mol_name
     if not isinstance(data_col, list):
         data_col = [data_col]
 
+    # Bulk conversion of multiple intensity columns, where lines with missing or bad values fall back to the column by column conversion.
+    matrix = None
+    if data_present and len(data_col) > 1:
+        try:
+            matrix = array([[line[col-1] for col in data_col] for line in file_data], float64)
+            finite = isfinite(matrix).all(axis=1)
+        except (IndexError, ValueError):
+            matrix = None
+
     # Loop over the file data.
-    for line in file_data:
+    for line_index in range(len(file_data)):
+        # The line, and the columns requiring conversion (only the first for the bulk converted lines, to validate and extract the spin information).
+        line = file_data[line_index]
+        cols = data_col
+        if matrix is not None and finite[line_index]:
+            cols = data_col[:1]
+
         # Loop over the intensity columns, storing the data.
         intensity = []
         data_flag = False
-        for i in range(len(data_col)):
+        for i in range(len(cols)):
             # Extract the data for the single line (loop of a single element).
-            for values in read_spin_data(file_data=[line], spin_id_col=spin_id_col, mol_name_col=mol_name_col, res_num_col=res_num_col, res_name_col=res_name_col, spin_num_col=spin_num_col, spin_name_col=spin_name_col, data_col=data_col[i], sep=sep, spin_id=spin_id, raise_flag=False):
+            for values in read_spin_data(file_data=[line], spin_id_col=spin_id_col, mol_name_col=mol_name_col, res_num_col=res_num_col, res_name_col=res_name_col, spin_num_col=spin_num_col, spin_name_col=spin_name_col, data_col=cols[i], sep=sep, spin_id=spin_id, raise_flag=False):
                 # The data flag.
                 data_flag = True
 
@@ -137,6 +153,10 @@ def intensity_generic(peak_list=None, file_data=None, spin_id_col=None, mol_name
                     # Unpack.
                     mol_name, res_num, res_name, spin_num, spin_name = values
 
+        # The bulk converted intensities.
+        if data_flag and len(cols) < len(data_col):
+            intensity = matrix[line_index].tolist()
+
         # Add the assignment to the peak list object.
         if data_flag:
             peak_list.add(mol_names=[mol_name, mol_name], res_nums=[res_num, res_num], res_names=[res_name, res_name], spin_nums=[spin_num, spin_num], spin_names=[spin_name, spin_name], intensity=intensity)
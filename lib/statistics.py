@@ -327,3 +327,68 @@ def multifit_covar(J=None, epsrel=0.0, weights=None):
                 #print(cond(Jt_W_J) < 1./spacing(1.) )
 
     return Qxx
+
+
+class Running_stats:
+    """Online mean and standard deviation accumulation using the Welford algorithm.
+
+    The values are added one at a time, so that the statistics of a distribution can be accumulated without storing the values.  Accumulators for different subsets of the values, for example from different processors, can be combined using the merge() method.
+    """
+
+    def __init__(self):
+        """Initialise the accumulator."""
+
+        # The number of values, the mean, and the sum of squared deviations from the mean.
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+
+    def add(self, value):
+        """Add a value to the accumulator.
+
+        @param value:   The value.
+        @type value:    float
+        """
+
+        # Update the number, mean, and sum of squared deviations.
+        self.n = self.n + 1
+        delta = value - self.mean
+        self.mean = self.mean + delta / float(self.n)
+        self.m2 = self.m2 + delta * (value - self.mean)
+
+
+    def merge(self, other):
+        """Merge the statistics of a second accumulator into this one.
+
+        @param other:   The second accumulator.
+        @type other:    Running_stats instance
+        """
+
+        # Nothing to merge.
+        if other.n == 0:
+            return
+
+        # Combine the statistics (Chan et al., 1979).
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.n / float(n)
+        self.m2 = self.m2 + other.m2 + delta**2 * self.n * other.n / float(n)
+        self.n = n
+
+
+    def std(self, dof=1):
+        """Return the standard deviation of the accumulated values.
+
+        @keyword dof:   The degrees of freedom, whereby the standard deviation is multipled by 1/(N - dof).
+        @type dof:      int
+        @return:        The standard deviation, or zero if there are less than 2 values.
+        @rtype:         float
+        """
+
+        # Not enough values.
+        if self.n <= 1:
+            return 0.0
+
+        # The standard deviation.
+        return sqrt(self.m2 / (float(self.n) - float(dof)))
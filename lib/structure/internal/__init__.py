@@ -30,3 +30,7 @@ __all__ = [
     'object',
     'selection'
 ]
+
+
+# The relax version, for the PDB remarks written by the internal structural object.
+RELAX_VERSION = None
@@ -398,92 +398,94 @@ class MolContainer:
         @type reset_serial:         bool
         """
 
-        # Loop over the records.
-        water = []
-        missing_connect = []
-        number_offset = None
+        # Separate the coordinate and connectivity records.
+        coord_records = []
+        conect_records = []
         for record in records:
-            # Nothing to do.
-            if not record or record == '\n':
+            if record[:4] == 'ATOM' or record[:6] == 'HETATM':
+                coord_records.append(record)
+            elif record[:6] == 'CONECT':
+                conect_records.append(record)
+
+        # Parse all coordinate records in one pass.
+        record_type, serial, name, alt_loc, res_name, chain_id, res_seq, icode, pos, occupancy, temp_factor, element, charge = pdb_read.atom_block(coord_records)
+        pos = pos.tolist()
+
+        # The serial number offset.
+        number_offset = 0
+        if reset_serial and len(serial):
+            number_offset = serial[0] - 1
+
+        # Loop over the atoms.
+        water = []
+        for i in range(len(coord_records)):
+            # Skip waters.
+            if res_name[i] == 'HOH':
+                water.append(res_seq[i])
                 continue
 
-            # Add the atom.
-            if record[:4] == 'ATOM' or record[:6] == 'HETATM':
-                # Parse the record.
-                if record[:4] == 'ATOM':
-                    record_type, serial, name, alt_loc, res_name, chain_id, res_seq, icode, x, y, z, occupancy, temp_factor, element, charge = pdb_read.atom(record)
-                if record[:6] == 'HETATM':
-                    record_type, serial, name, alt_loc, res_name, chain_id, res_seq, icode, x, y, z, occupancy, temp_factor, element, charge = pdb_read.hetatm(record)
-
-                # The serial number.
-                if reset_serial:
-                    # The first number.
-                    if number_offset == None:
-                        number_offset = serial - 1
-
-                    # Reset.
-                    serial -= number_offset
-
-                # Skip waters.
-                if res_name == 'HOH':
-                    water.append(res_seq)
+            # Handle the alternate locations.
+            if alt_loc[i] != None:
+                # Don't know what to do.
+                if alt_loc_select == None:
+                    raise RelaxError("Multiple alternate location indicators are present in the PDB file, but the desired coordinate set has not been specified.")
+
+                # Skip non-matching locations.
+                if alt_loc[i] != alt_loc_select:
                     continue
 
-                # Handle the alternate locations.
-                if alt_loc != None:
-                    # Don't know what to do.
-                    if alt_loc_select == None:
-                        raise RelaxError("Multiple alternate location indicators are present in the PDB file, but the desired coordinate set has not been specified.")
+            # Attempt at determining the element, if missing.
+            atom_element = element[i]
+            if not atom_element:
+                atom_element = self._det_pdb_element(name[i])
 
-                    # Skip non-matching locations.
-                    if alt_loc != alt_loc_select:
-                        continue
+            # Add.
+            self.atom_num.append(serial[i] - number_offset)
+            self.atom_name.append(name[i])
+            self.bonded.append([])
+            self.chain_id.append(None)
+            self.element.append(atom_element)
+            self.pdb_record.append(record_type[i])
+            self.res_name.append(res_name[i])
+            self.res_num.append(res_seq[i])
+            self.seg_id.append(None)
+            self.x.append(pos[i][0])
+            self.y.append(pos[i][1])
+            self.z.append(pos[i][2])
+
+        # The atom number to index mapping (the first atom for duplicated numbers).
+        atom_indices = {}
+        for i in range(len(self.atom_num)-1, -1, -1):
+            atom_indices[self.atom_num[i]] = i
+
+        # Loop over the connectivity records.
+        missing_connect = []
+        for record in conect_records:
+            # Parse the record.
+            record_type, serial, bonded1, bonded2, bonded3, bonded4 = pdb_read.conect(record)
 
-                # Attempt at determining the element, if missing.
-                if not element:
-                    element = self._det_pdb_element(name)
+            # Loop over the atoms of the record.
+            for bonded in [bonded1, bonded2, bonded3, bonded4]:
+                # Skip if there is no record.
+                if not bonded:
+                    continue
 
-                # Add.
-                self.atom_add(pdb_record=record_type, atom_num=serial, atom_name=name, res_name=res_name, res_num=res_seq, pos=[x, y, z], element=element)
-
-            # Connect atoms.
-            if record[:6] == 'CONECT':
-                # Parse the record.
-                record_type, serial, bonded1, bonded2, bonded3, bonded4 = pdb_read.conect(record)
-
-                # Reset the serial numbers.
-                if reset_serial:
-                    serial -= number_offset
-                    bonded1 -= number_offset
-                    if bonded2 != None:
-                        bonded2 -= number_offset
-                    if bonded3 != None:
-                        bonded3 -= number_offset
-                    if bonded4 != None:
-                        bonded4 -= number_offset
-
-                # Loop over the atoms of the record.
-                for bonded in [bonded1, bonded2, bonded3, bonded4]:
-                    # Skip if there is no record.
-                    if not bonded:
-                        continue
-
-                    # The atom indices.
-                    serial_index = self._atom_index(serial)
-                    bonded_index = self._atom_index(bonded)
-
-                    # Skip broken CONECT records (for when the record points to a non-existent atom).
-                    if serial_index == None:
-                        if serial not in missing_connect:
-                            missing_connect.append(serial)
-                        continue
-                    if bonded_index == None:
-                        if bonded not in missing_connect:
-                            missing_connect.append(bonded)
-                        continue
-
-                    # Make the connection.
-                    self.atom_connect(index1=serial_index, index2=bonded_index)
+                # The atom indices, resetting the serial numbers.
+                serial_index = atom_indices.get(serial - number_offset)
+                bonded_index = atom_indices.get(bonded - number_offset)
+
+                # Skip broken CONECT records (for when the record points to a non-existent atom).
+                if serial_index == None:
+                    if serial - number_offset not in missing_connect:
+                        missing_connect.append(serial - number_offset)
+                    continue
+                if bonded_index == None:
+                    if bonded - number_offset not in missing_connect:
+                        missing_connect.append(bonded - number_offset)
+                    continue
+
+                # Make the connection.
+                self.atom_connect(index1=serial_index, index2=bonded_index)
 
         # Warnings.
         if len(missing_connect):
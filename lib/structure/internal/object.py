@@ -27,7 +27,7 @@
 
 # Python module imports.
 from copy import deepcopy
-from numpy import array, dot, float64, linalg, zeros
+from numpy import array, cumsum, dot, float64, linalg, nonzero, ones, transpose, zeros
 import os
 from os import F_OK, access, curdir, sep
 from os.path import abspath
@@ -44,6 +44,7 @@ from lib.io import file_root, open_read_file
 from lib.selection import Selection, tokenise
 from lib.sequence import aa_codes_three_to_one
 from lib.structure import pdb_read, pdb_write
+import lib.structure.internal
 from lib.structure.internal.displacements import Displacements
 from lib.structure.internal.models import ModelList
 from lib.structure.internal.molecules import MolContainer
@@ -55,7 +56,6 @@ from lib.xml import fill_object_contents, object_to_xml, xml_to_object
 
 # Module variables.
 CHAIN_ID_LIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789abcdefghijklmnopqrstuvwxyz'
-RELAX_VERSION = None
 
 
 class Internal:
@@ -780,6 +780,57 @@ class Internal:
         return mol_index
 
 
+    def _read_pdb_lines(self, pdb_file, read_model=None):
+        """Stream the lines of the PDB file, skipping all models which are not to be read.
+
+        The lines of the unwanted models are discarded as the file is read, so that large multi-model files need not be held in memory or parsed in full.  The file is read to the end, as the CONECT and MASTER records follow the last model.
+
+
+        @param pdb_file:        The opened PDB file object.
+        @type pdb_file:         file object
+        @keyword read_model:    The PDB model numbers to read.  If None, all lines of the file are returned.
+        @type read_model:       None or list of int
+        @return:                The lines of the PDB file to parse.
+        @rtype:                 list of str
+        """
+
+        # All lines.
+        if not read_model:
+            return pdb_file.readlines()
+
+        # Initialise.
+        lines = []
+        model = None
+        skip = False
+
+        # Loop over the lines of the file.
+        for line in pdb_file:
+            # A new model record.
+            if line[:5] == 'MODEL':
+                try:
+                    model = int(line.split()[1])
+                except:
+                    # Leave the corrupt record for the coordinate section parser to handle.
+                    model = None
+
+                # Skip the whole model.
+                if model != None and model not in read_model:
+                    skip = True
+                    continue
+
+            # Skip the model records.
+            if skip:
+                if line[:6] == 'ENDMDL':
+                    skip = False
+                continue
+
+            # Store the line.
+            lines.append(line)
+
+        # Return the lines.
+        return lines
+
+
     def _residue_data(self, res_nums=None, res_names=None):
         """Convert the residue info into a dictionary of unique residues with numbers as keys.
 
@@ -807,6 +858,43 @@ class Internal:
         return data
 
 
+    def _selected_positions(self, mol, indices):
+        """Gather the positions of the selected atoms of a molecule into a single array.
+
+        @param mol:     The molecule container.
+        @type mol:      MolContainer instance
+        @param indices: The atom indices.
+        @type indices:  numpy int64 array
+        @return:        The atomic positions.
+        @rtype:         numpy rank-2, Nx3 float64 array
+        """
+
+        # Gather the coordinates.
+        pos = zeros((len(indices), 3), float64)
+        for dim, coords in enumerate([mol.x, mol.y, mol.z]):
+            pos[:, dim] = [coords[i] for i in indices]
+
+        # Return the positions.
+        return pos
+
+
+    def _set_positions(self, mol, indices, pos):
+        """Scatter the new positions of the selected atoms back into a molecule.
+
+        @param mol:     The molecule container.
+        @type mol:      MolContainer instance
+        @param indices: The atom indices.
+        @type indices:  numpy int64 array
+        @param pos:     The new atomic positions.
+        @type pos:      numpy rank-2, Nx3 float64 array
+        """
+
+        # Store the coordinates.
+        for dim, coords in enumerate([mol.x, mol.y, mol.z]):
+            for i, val in zip(indices, pos[:, dim]):
+                coords[i] = val
+
+
     def _validate_data_arrays(self, struct):
         """Check the validity of the data arrays in the given structure object.
 
@@ -1847,15 +1935,6 @@ class Internal:
 
         # Atom subset deletion.
         else:
-            # Loop over the atoms and find the indices of the atoms to delete.
-            indices = {}
-            for mol_index, i in selection.loop():
-                if mol_index not in indices:
-                    indices[mol_index] = []
-                indices[mol_index].append(i)
-            for mol_index in indices:
-                indices[mol_index].reverse()
-
             # Loop over the models.
             del_res_nums = []
             for model_cont in self.model_loop():
@@ -1864,40 +1943,40 @@ class Internal:
                     continue
 
                 # Loop over the molecules.
-                for mol_index in indices:
+                for mol_index, indices in selection.index_array_loop():
                     mol = model_cont.mol[mol_index]
 
+                    # Nothing to delete.
+                    if not len(indices):
+                        continue
+
                     # Generate a residue data dictionary for the metadata trimming (prior to atom deletion).
                     res_data = self._residue_data(res_nums=mol.res_num, res_names=mol.res_name)
 
-                    # Loop over the reverse indices and pop out the data.
-                    for i in indices[mol_index]:
-                        mol.atom_num.pop(i)
-                        mol.atom_name.pop(i)
-                        mol.bonded.pop(i)
-                        mol.chain_id.pop(i)
-                        mol.element.pop(i)
-                        mol.pdb_record.pop(i)
-                        mol.res_name.pop(i)
-                        res_num = mol.res_num.pop(i)
-                        mol.seg_id.pop(i)
-                        mol.x.pop(i)
-                        mol.y.pop(i)
-                        mol.z.pop(i)
-
-                        # The residue no longer exists.
-                        if res_num not in mol.res_num and res_num not in del_res_nums:
+                    # The mask of atoms to keep, and the indices of these atoms.
+                    keep = ones(len(mol.atom_num), bool)
+                    keep[indices] = False
+                    keep_indices = nonzero(keep)[0]
+
+                    # The old to new atom index mapping (deleted atoms map to -1).
+                    index_map = cumsum(keep) - 1
+                    index_map[indices] = -1
+
+                    # The residues which are to be completely removed, in the order of their first deleted atom.
+                    keep_res_nums = set([mol.res_num[i] for i in keep_indices])
+                    for i in indices:
+                        res_num = mol.res_num[i]
+                        if res_num not in keep_res_nums and res_num not in del_res_nums:
                             del_res_nums.append(res_num)
 
-                        # Second atom of the bonded pair.
-                        for j in range(len(mol.bonded)):
-                            if i in mol.bonded[j]:
-                                mol.bonded[j].pop(mol.bonded[j].index(i))
+                    # Compact the per-atom data.
+                    for name in ['atom_num', 'atom_name', 'chain_id', 'element', 'pdb_record', 'res_name', 'res_num', 'seg_id', 'x', 'y', 'z']:
+                        data = getattr(mol, name)
+                        setattr(mol, name, [data[i] for i in keep_indices])
 
-                        # Update the bonded lists, as the indices need to be shifted.
-                        for j in range(i, len(mol.bonded)):
-                            for k in range(len(mol.bonded[j])):
-                                mol.bonded[j][k] -= 1
+                    # Compact the bonded lists, removing the deleted atoms and remapping the indices of the rest.
+                    bonded = mol.bonded
+                    mol.bonded = [[int(index_map[j]) for j in bonded[i] if keep[j]] for i in keep_indices]
 
                     # Reset the metadata if nothing remains.
                     if mol.atom_num == []:
@@ -1916,9 +1995,6 @@ class Internal:
             if model != None and len(self.structural_data) > 1:
                 return
 
-            # Fix the deleted residue number order.
-            del_res_nums.reverse()
-
             # Handle the helix metadata.
             if hasattr(self, 'helices'):
                 del_helix_indices = []
@@ -2232,7 +2308,7 @@ class Internal:
 
         # Open the PDB file.
         pdb_file = open_read_file(file_path, verbosity=verbosity)
-        pdb_lines = pdb_file.readlines()
+        pdb_lines = self._read_pdb_lines(pdb_file, read_model=read_model)
         pdb_file.close()
 
         # Check for empty files.
@@ -2832,21 +2908,15 @@ class Internal:
 
         # Loop over the models.
         for model_cont in self.model_loop(model):
-            # Loop over all molecules and atoms in the selection.
-            for mol_index, i in selection.loop():
+            # Loop over all molecules in the selection.
+            for mol_index, indices in selection.index_array_loop():
                 mol = model_cont.mol[mol_index]
 
-                # The origin to atom vector.
-                vect = array([mol.x[i], mol.y[i], mol.z[i]], float64) - origin
+                # The origin to atom vectors.
+                vect = self._selected_positions(mol, indices) - origin
 
-                # Rotation.
-                rot_vect = dot(R, vect)
-
-                # The new position.
-                pos = rot_vect + origin
-                mol.x[i] = pos[0]
-                mol.y[i] = pos[1]
-                mol.z[i] = pos[2]
+                # Rotation and the new positions.
+                self._set_positions(mol, indices, dot(vect, transpose(R)) + origin)
 
 
     def selection(self, atom_id=None, inv=False):
@@ -2891,11 +2961,17 @@ class Internal:
             # Add the molecule index.
             selection.add_mol(mol_index=mol_index)
 
+            # All atoms.
+            if not inv and not sel_obj:
+                selection.add_atoms(mol_index=mol_index, atom_indices=range(len(mol.atom_num)))
+                continue
+
             # Loop over the atoms.
+            indices = []
             for i in range(len(mol.atom_num)):
                 # Skip non-matching atoms.
                 if not inv:
-                    if sel_obj and not sel_obj.contains_spin(mol.atom_num[i], mol.atom_name[i], mol.res_num[i], mol.res_name[i], mol.mol_name):
+                    if not sel_obj.contains_spin(mol.atom_num[i], mol.atom_name[i], mol.res_num[i], mol.res_name[i], mol.mol_name):
                         continue
 
                 # Skip matching atoms.
@@ -2903,8 +2979,11 @@ class Internal:
                     if (not sel_obj) or sel_obj.contains_spin(mol.atom_num[i], mol.atom_name[i], mol.res_num[i], mol.res_name[i], mol.mol_name):
                         continue
 
-                # Add the atom index.
-                selection.add_atom(mol_index=mol_index, atom_index=i)
+                # Store the atom index.
+                indices.append(i)
+
+            # Add the atom indices.
+            selection.add_atoms(mol_index=mol_index, atom_indices=indices)
 
         # Return the object.
         return selection
@@ -2977,14 +3056,12 @@ class Internal:
 
         # Loop over the models.
         for model_cont in self.model_loop(model):
-            # Loop over all molecules and atoms in the selection.
-            for mol_index, i in selection.loop():
+            # Loop over all molecules in the selection.
+            for mol_index, indices in selection.index_array_loop():
                 mol = model_cont.mol[mol_index]
 
                 # Translate.
-                mol.x[i] = mol.x[i] + T[0]
-                mol.y[i] = mol.y[i] + T[1]
-                mol.z[i] = mol.z[i] + T[2]
+                self._set_positions(mol, indices, self._selected_positions(mol, indices) + T)
 
 
     def to_xml(self, doc, element):
@@ -3122,6 +3199,258 @@ class Internal:
         @type model_num:        None or int
         """
 
+        # The header records.
+        counts = self.write_pdb_start(file)
+
+        # Determine if model records will be created.
+        model_records = False
+        for model in self.model_loop():
+            if hasattr(model, 'num') and model.num != None:
+                model_records = True
+
+        # Initial printout if models are present.
+        if model_records:
+            print("\nMODEL records:")
+
+        # Loop over the models, adding the coordinate records.
+        for model in self.model_loop(model_num):
+            self.write_pdb_model(file, model_num=model.num, counts=counts, model_record=model_records)
+
+        # Print out.
+        if model_records:
+            sys.stdout.write('\n')
+
+        # The connectivity and termination records.
+        self.write_pdb_end(file, counts=counts)
+
+
+    def write_pdb_end(self, file, counts=None):
+        """Append the CONECT, MASTER, and END records to a PDB file.
+
+        This finishes a PDB file started with the write_pdb_start() method.
+
+
+        @param file:        The PDB file object.  This object must be writable.
+        @type file:         file object
+        @keyword counts:    The record counts returned by write_pdb_start() and updated by write_pdb_model().
+        @type counts:       dict of int
+        """
+
+        # Create the CONECT records.
+        ############################
+
+        # Print out.
+        print("CONECT")
+
+        # Initialise record counts.
+        num_conect = 0
+
+        # The per molecule incremented atom counts.
+        atom_counts = [0]
+        index = 0
+        for mol in self.structural_data[0].mol_loop():
+            if index == 0:
+                atom_counts.append(len(mol.atom_name))
+            else:
+                atom_counts.append(atom_counts[index] + len(mol.atom_name))
+            index += 1
+
+        # Loop over the molecules of the first model.
+        index = 0
+        for mol in self.structural_data[0].mol_loop():
+            # Loop over the atoms.
+            for i in range(len(mol.atom_name)):
+                # No bonded atoms, hence no CONECT record is required.
+                if not len(mol.bonded[i]):
+                    continue
+
+                # Initialise some data structures.
+                flush = 0
+                bonded_index = 0
+                bonded = ['', '', '', '']
+                bonded_shifted = ['', '', '', '']
+
+                # Loop over the bonded atoms.
+                for j in range(len(mol.bonded[i])):
+                    # End of the array, hence create the CONECT record in this iteration.
+                    if j == len(mol.bonded[i])-1:
+                        flush = True
+
+                    # Only four covalently bonded atoms allowed in one CONECT record.
+                    if bonded_index == 3:
+                        flush = True
+
+                    # Get the bonded atom index.
+                    bonded[bonded_index] = mol.bonded[i][j]
+
+                    # Increment the bonded_index value.
+                    bonded_index = bonded_index + 1
+
+                    # Generate the CONECT record and increment the counter.
+                    if flush:
+                        # Convert the atom indices to atom numbers.
+                        for k in range(4):
+                            if bonded[k] != '':
+                                bonded_shifted[k] = bonded[k] + 1 + atom_counts[index]
+
+                        # Write the CONECT record.
+                        pdb_write.conect(file, serial=i+1+atom_counts[index], bonded1=bonded_shifted[0], bonded2=bonded_shifted[1], bonded3=bonded_shifted[2], bonded4=bonded_shifted[3])
+
+                        # Reset the flush flag, the bonded atom count, and the bonded atom names.
+                        flush = False
+                        bonded_index = 0
+                        bonded = ['', '', '', '']
+
+                        # Increment the CONECT record count.
+                        num_conect = num_conect + 1
+
+            # Increment the molecule index.
+            index += 1
+
+
+        # MASTER record.
+        ################
+
+        print("\nMASTER")
+        pdb_write.master(file, num_het=counts['het'], num_coord=counts['atom']+counts['hetatm'], num_ter=counts['ter'], num_conect=num_conect)
+
+
+        # END.
+        ######
+
+        print("END")
+        pdb_write.end(file)
+
+
+    def write_pdb_model(self, file, model_num=None, serial=None, pos=None, counts=None, model_record=True):
+        """Append the ATOM, HETATM, and TER records of a single model to a PDB file.
+
+        The records of each molecule are formatted in bulk.  Models can be appended one at a time to a file started with write_pdb_start(), and the alternative atomic positions allow a stream of conformations to be written from a single structural model without storing copies of it.
+
+
+        @param file:            The PDB file object.  This object must be writable.
+        @type file:             file object
+        @keyword model_num:     The model supplying the atomic information.  If not supplied, the first model will be used.
+        @type model_num:        None or int
+        @keyword serial:        The number for the MODEL record.  If not supplied, the model number will be used.
+        @type serial:           None or int
+        @keyword pos:           The alternative atomic positions for all atoms of all molecules of the model, in order.  If not supplied, the positions of the model will be used.
+        @type pos:              None or numpy rank-2 (N, 3) float64 array
+        @keyword counts:        The record counts returned by write_pdb_start(), which will be updated.
+        @type counts:           dict of int or None
+        @keyword model_record:  A flag which if True will cause the MODEL and ENDMDL records to be created.
+        @type model_record:     bool
+        """
+
+        # The model.
+        if model_num == None:
+            model = self.structural_data[0]
+        else:
+            model = None
+            for model in self.model_loop(model_num):
+                break
+            if model == None:
+                raise RelaxError("The structural model %s does not exist." % model_num)
+
+        # The MODEL record serial number.
+        if serial == None:
+            serial = model.num
+
+        # Initialise record counts.
+        num_hetatm = 0
+        num_atom = 0
+        num_ter = 0
+        ser_num = 1
+
+        # MODEL record, for multiple models.
+        ####################################
+
+        if model_record:
+            # Printout.
+            sys.stdout.write('.')
+
+            # Write the model record.
+            pdb_write.model(file, serial=serial)
+
+
+        # Add the atomic coordinate records (ATOM, HETATM, and TER).
+        ############################################################
+
+        # Loop over the molecules.
+        index = 0
+        offset = 0
+        for mol in model.mol_loop():
+            # Printout.
+            if not model_record:
+                print("ATOM, HETATM, TER")
+
+            # The atomic positions.
+            num = len(mol.atom_name)
+            if pos is None:
+                mol_pos = transpose(array([mol.x, mol.y, mol.z], float64))
+            else:
+                mol_pos = pos[offset:offset+num]
+            offset += num
+
+            # The chain ID.
+            chain_id = CHAIN_ID_LIST[index]
+
+            # The indices of the ATOM and HETATM records.
+            atom_indices = []
+            hetatm_indices = []
+            for i in range(num):
+                if mol.pdb_record[i] in [None, 'ATOM']:
+                    atom_indices.append(i)
+                elif mol.pdb_record[i] == 'HETATM':
+                    hetatm_indices.append(i)
+
+            # Write the ATOM records.
+            if len(atom_indices):
+                pdb_write.atom_block(file, record_type=['ATOM']*len(atom_indices), serial=list(range(ser_num, ser_num+len(atom_indices))), name=[mol.atom_name[i] for i in atom_indices], res_name=[mol.res_name[i] for i in atom_indices], chain_id=[chain_id]*len(atom_indices), res_seq=[mol.res_num[i] for i in atom_indices], pos=mol_pos[atom_indices], occupancy=1.0, temp_factor=0, element=[mol.element[i] for i in atom_indices])
+                num_atom += len(atom_indices)
+                ser_num += len(atom_indices)
+
+                # Finish the ATOM section with the TER record.
+                last = atom_indices[-1]
+                pdb_write.ter(file, serial=ser_num, res_name=mol.res_name[last], chain_id=chain_id, res_seq=mol.res_num[last])
+                num_ter += 1
+                ser_num += 1
+
+            # Write the HETATM records.
+            if len(hetatm_indices):
+                pdb_write.atom_block(file, record_type=['HETATM']*len(hetatm_indices), serial=list(range(ser_num, ser_num+len(hetatm_indices))), name=[self._translate(mol.atom_name[i]) for i in hetatm_indices], res_name=[mol.res_name[i] for i in hetatm_indices], chain_id=[chain_id]*len(hetatm_indices), res_seq=[mol.res_num[i] for i in hetatm_indices], pos=mol_pos[hetatm_indices], occupancy=1.0, temp_factor=0.0, element=[mol.element[i] for i in hetatm_indices])
+                num_hetatm += len(hetatm_indices)
+                ser_num += len(hetatm_indices)
+
+            # Increment the molecule index.
+            index += 1
+
+
+        # ENDMDL record, for multiple structures.
+        ########################################
+
+        if model_record:
+            pdb_write.endmdl(file)
+
+        # Store the record counts of the model.
+        if counts != None:
+            counts['atom'] = num_atom
+            counts['hetatm'] = num_hetatm
+            counts['ter'] = num_ter
+
+
+    def write_pdb_start(self, file):
+        """Start a PDB file by writing the REMARK, HET, HETNAM, FORMUL, HELIX, and SHEET records.
+
+        The coordinate records can then be appended model by model using write_pdb_model(), and the file finished with write_pdb_end().
+
+
+        @param file:    The PDB file object.  This object must be writable.
+        @type file:     file object
+        @return:        The record counts for the MASTER record, with the keys 'het', 'atom', 'hetatm', and 'ter'.
+        @rtype:         dict of int
+        """
+
         # Validate the structural data.
         self.validate()
 
@@ -3134,17 +3463,11 @@ class Internal:
         pdb_write.remark(file, num=40, remark=None)
         pdb_write.remark(file, num=40, remark="Created using relax (http://www.nmr-relax.com).")
         pdb_write.remark(file, num=40, remark=None)
-        if RELAX_VERSION:
-            pdb_write.remark(file, num=40, remark="relax version %s." % RELAX_VERSION)
+        if lib.structure.internal.RELAX_VERSION:
+            pdb_write.remark(file, num=40, remark="relax version %s." % lib.structure.internal.RELAX_VERSION)
         pdb_write.remark(file, num=40, remark="Created on %s." % asctime())
         num_remark = 2
 
-        # Determine if model records will be created.
-        model_records = False
-        for model in self.model_loop():
-            if hasattr(model, 'num') and model.num != None:
-                model_records = True
-
 
         ####################
         # Hetrogen section #
@@ -3340,180 +3663,8 @@ class Internal:
                 index += 1
 
 
-        ######################
-        # Coordinate section #
-        ######################
-
-        # Initial printout if models are present.
-        if model_records:
-            print("\nMODEL records:")
-
-        # Loop over the models.
-        for model in self.model_loop(model_num):
-            # Initialise record counts.
-            num_hetatm = 0
-            num_atom = 0
-            num_ter = 0
-            ser_num = 1
-
-            # MODEL record, for multiple models.
-            ####################################
-
-            if model_records:
-                # Printout.
-                sys.stdout.write('.')
-
-                # Write the model record.
-                pdb_write.model(file, serial=model.num)
-
-
-            # Add the atomic coordinate records (ATOM, HETATM, and TER).
-            ############################################################
-
-            # Loop over the molecules.
-            index = 0
-            for mol in model.mol_loop():
-                # Printout.
-                if not model_records:
-                    print("ATOM, HETATM, TER")
-
-                # Loop over the atomic data.
-                atom_record = False
-                for i in range(len(mol.atom_name)):
-                    # Write the ATOM record.
-                    if mol.pdb_record[i] in [None, 'ATOM']:
-                        atom_record = True
-
-                        # Write out.
-                        pdb_write.atom(file, serial=ser_num, name=mol.atom_name[i], res_name=mol.res_name[i], chain_id=CHAIN_ID_LIST[index], res_seq=mol.res_num[i], x=mol.x[i], y=mol.y[i], z=mol.z[i], occupancy=1.0, temp_factor=0, element=mol.element[i])
-                        num_atom += 1
-                        ser_num += 1
-
-                        # Info for the TER record.
-                        ter_num = ser_num + 1
-                        ter_name = mol.res_name[i]
-                        ter_chain_id = CHAIN_ID_LIST[index]
-                        ter_res_num = mol.res_num[i]
-
-                # Finish the ATOM section with the TER record.
-                if atom_record:
-                    pdb_write.ter(file, serial=ser_num, res_name=ter_name, chain_id=CHAIN_ID_LIST[index], res_seq=ter_res_num)
-                    num_ter += 1
-                    ser_num += 1
-
-                # Loop over the atomic data.
-                count_shift = False
-                for i in range(len(mol.atom_name)):
-                    # Write the HETATM record.
-                    if mol.pdb_record[i] == 'HETATM':
-                        # Increment the atom number if a TER record was created.
-                        if atom_record and ser_num == ter_num:
-                            count_shift = True
-
-                        # Write out.
-                        pdb_write.hetatm(file, serial=ser_num, name=self._translate(mol.atom_name[i]), res_name=mol.res_name[i], chain_id=CHAIN_ID_LIST[index], res_seq=mol.res_num[i], x=mol.x[i], y=mol.y[i], z=mol.z[i], occupancy=1.0, temp_factor=0.0, element=mol.element[i])
-                        num_hetatm += 1
-                        ser_num += 1
-
-                # Increment the molecule index.
-                index += 1
-
-
-            # ENDMDL record, for multiple structures.
-            ########################################
-
-            if model_records:
-                if not model_records:
-                    print("ENDMDL")
-                pdb_write.endmdl(file)
-
-
-        # Create the CONECT records.
-        ############################
-
-        # Print out.
-        if model_records:
-            sys.stdout.write('\n')
-        print("CONECT")
-
-        # Initialise record counts.
-        num_conect = 0
-
-        # The per molecule incremented atom counts.
-        atom_counts = [0]
-        index = 0
-        for mol in self.structural_data[0].mol_loop():
-            if index == 0:
-                atom_counts.append(len(mol.atom_name))
-            else:
-                atom_counts.append(atom_counts[index] + len(mol.atom_name))
-            index += 1
-
-        # Loop over the molecules of the first model.
-        index = 0
-        for mol in self.structural_data[0].mol_loop():
-            # Loop over the atoms.
-            for i in range(len(mol.atom_name)):
-                # No bonded atoms, hence no CONECT record is required.
-                if not len(mol.bonded[i]):
-                    continue
-
-                # Initialise some data structures.
-                flush = 0
-                bonded_index = 0
-                bonded = ['', '', '', '']
-                bonded_shifted = ['', '', '', '']
-
-                # Loop over the bonded atoms.
-                for j in range(len(mol.bonded[i])):
-                    # End of the array, hence create the CONECT record in this iteration.
-                    if j == len(mol.bonded[i])-1:
-                        flush = True
-
-                    # Only four covalently bonded atoms allowed in one CONECT record.
-                    if bonded_index == 3:
-                        flush = True
-
-                    # Get the bonded atom index.
-                    bonded[bonded_index] = mol.bonded[i][j]
-
-                    # Increment the bonded_index value.
-                    bonded_index = bonded_index + 1
-
-                    # Generate the CONECT record and increment the counter.
-                    if flush:
-                        # Convert the atom indices to atom numbers.
-                        for k in range(4):
-                            if bonded[k] != '':
-                                bonded_shifted[k] = bonded[k] + 1 + atom_counts[index]
-
-                        # Write the CONECT record.
-                        pdb_write.conect(file, serial=i+1+atom_counts[index], bonded1=bonded_shifted[0], bonded2=bonded_shifted[1], bonded3=bonded_shifted[2], bonded4=bonded_shifted[3])
-
-                        # Reset the flush flag, the bonded atom count, and the bonded atom names.
-                        flush = False
-                        bonded_index = 0
-                        bonded = ['', '', '', '']
-
-                        # Increment the CONECT record count.
-                        num_conect = num_conect + 1
-
-            # Increment the molecule index.
-            index += 1
-
-
-        # MASTER record.
-        ################
-
-        print("\nMASTER")
-        pdb_write.master(file, num_het=len(het_data_coll), num_coord=num_atom+num_hetatm, num_ter=num_ter, num_conect=num_conect)
-
-
-        # END.
-        ######
-
-        print("END")
-        pdb_write.end(file)
+        # Return the record counts.
+        return {'het': len(het_data_coll), 'atom': 0, 'hetatm': 0, 'ter': 0}
 
 
     def validate(self):
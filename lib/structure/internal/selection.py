@@ -22,6 +22,9 @@
 # Module docstring.
 """Module containing the fast structural selection object."""
 
+# Python module imports.
+from numpy import array, int64, unique, zeros
+
 
 class Internal_selection:
     """The fast structural selection object."""
@@ -52,6 +55,22 @@ class Internal_selection:
         self._atom_indices[index].append(atom_index)
 
 
+    def add_atoms(self, mol_index=None, atom_indices=None):
+        """Add a list of atom indices to the object in one operation.
+
+        @keyword mol_index:     The index of the molecule.
+        @type mol_index:        int
+        @keyword atom_indices:  The indices of the atoms.
+        @type atom_indices:     list of int
+        """
+
+        # Find the molecule index.
+        index = self._mol_indices.index(mol_index)
+
+        # Store the indices.
+        self._atom_indices[index] += list(atom_indices)
+
+
     def add_mol(self, mol_index=None):
         """Add a molecule index to the object.
 
@@ -82,6 +101,35 @@ class Internal_selection:
         return sum
 
 
+    def index_array(self, mol_index=None):
+        """Return the atom indices of the given molecule as an array.
+
+        @keyword mol_index: The index of the molecule.
+        @type mol_index:    int
+        @return:            The sorted and unique atom indices.  This will be empty if the molecule is not part of the selection.
+        @rtype:             numpy int64 array
+        """
+
+        # Molecule not in the selection.
+        if mol_index not in self._mol_indices:
+            return zeros(0, int64)
+
+        # Convert the index list, sorting and removing duplicates.
+        return unique(array(self._atom_indices[self._mol_indices.index(mol_index)], int64))
+
+
+    def index_array_loop(self):
+        """Fast loop over all molecules, yielding the atom indices as arrays.
+
+        @return:    The molecule index and the array of atom indices for that molecule.
+        @rtype:     int, numpy int64 array
+        """
+
+        # Molecule loop.
+        for mol_index in self._mol_indices:
+            yield mol_index, self.index_array(mol_index=mol_index)
+
+
     def loop(self):
         """Fast loop over all molecule and atom indices.
 
@@ -90,15 +138,35 @@ class Internal_selection:
         """
 
         # Molecule loop.
-        for mol_index in self._mol_indices:
-            # Find the molecule index.
-            index = self._mol_indices.index(mol_index)
+        for index in range(len(self._mol_indices)):
+            mol_index = self._mol_indices[index]
 
             # Atom loop.
             for atom_index in self._atom_indices[index]:
                 yield mol_index, atom_index
 
 
+    def mask(self, mol_index=None, num_atoms=None):
+        """Return a boolean mask of the selected atoms of the given molecule.
+
+        @keyword mol_index: The index of the molecule.
+        @type mol_index:    int
+        @keyword num_atoms: The total number of atoms in the molecule.
+        @type num_atoms:    int
+        @return:            The mask which is True for all selected atoms.
+        @rtype:             numpy bool array
+        """
+
+        # Initialise.
+        mask = zeros(num_atoms, bool)
+
+        # Set the selected atoms.
+        mask[self.index_array(mol_index=mol_index)] = True
+
+        # Return the mask.
+        return mask
+
+
     def mol_loop(self):
         """Fast loop over all molecule indices.
 
@@ -109,3 +177,4 @@ class Internal_selection:
         # Molecule loop.
         for mol_index in self._mol_indices:
             yield mol_index
+
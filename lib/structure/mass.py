@@ -31,6 +31,27 @@ from lib.warnings import RelaxWarning
 
 
 
+def atomic_masses(elements=None):
+    """Return the atomic masses for the given elements.
+
+    @keyword elements:      The list of elements.
+    @type elements:         list of str
+    @return:                The atomic masses, with zero for unknown elements.
+    @rtype:                 numpy rank-1 float64 array
+    """
+
+    # Loop over all atoms.
+    masses = zeros(len(elements), float64)
+    for i in range(len(elements)):
+        try:
+            masses[i] = periodic_table.atomic_mass(elements[i])
+        except RelaxError:
+            warn(RelaxWarning("Skipping the atom index %s as the element '%s' is unknown." % (i, elements[i])))
+
+    # Return the masses.
+    return masses
+
+
 def centre_of_mass(pos=None, elements=None, verbosity=1):
     """Calculate and return the centre of mass for the given atomic coordinates.
 
@@ -25,10 +25,39 @@
 This module currently used the PDB format version 3.30 from July, 2011 U{http://www.wwpdb.org/documentation/file-format/format33/v3.3.html}.
 """
 
+# Python module imports.
+from numpy import array, float64, zeros
+
 # relax module imports.
 from lib.errors import RelaxImplementError
 
 
+def _column(records, start, end, convert=None):
+    """Slice a fixed width field out of all records, stripping whitespace and converting empty fields to None.
+
+    @param records: The PDB records.
+    @type records:  list of str
+    @param start:   The index of the first character of the field.
+    @type start:    int
+    @param end:     The index of the character after the field.
+    @type end:      int
+    @param convert: The optional function for converting the non-empty fields, for example int or float.
+    @type convert:  None or callable
+    @return:        The field values for all records.
+    @rtype:         list
+    """
+
+    # Slice and strip.
+    fields = [record[start:end].strip() or None for record in records]
+
+    # Conversion.
+    if convert:
+        fields = [convert(field) if field else None for field in fields]
+
+    # Return the fields.
+    return fields
+
+
 def atom(record):
     """Parse the ATOM record.
 
@@ -232,6 +261,45 @@ def atom(record):
     return tuple(fields)
 
 
+def atom_block(records):
+    """Parse a block of ATOM and HETATM records in a single pass.
+
+    This is the fast, column based equivalent of calling the atom() or hetatm() functions for each record.  Each fixed width field is sliced out of all records at once and the atomic coordinates are converted directly into a numpy array.  See the atom() function for the PDB record format.
+
+
+    @param records:         The PDB ATOM and HETATM records, each padded to 80 characters.
+    @type records:          list of str
+    @return:                The record names, atom serial numbers, atom names, alternate location indicators, residue names, chain identifiers, sequence numbers, insertion codes, orthogonal coordinates in Angstroms, occupancies, temperature factors, element symbols, and charges on the atoms.  All fields other than the coordinates are lists, with empty fields set to None.
+    @rtype:                 tuple of list of str, list of int, list of str, list of str, list of str, list of str, list of int, list of str, numpy rank-2 (N, 3) float64 array, list of float, list of float, list of str, list of str
+    """
+
+    # No records.
+    if not len(records):
+        return [], [], [], [], [], [], [], [], zeros((0, 3), float64), [], [], [], []
+
+    # The string fields.
+    record_type = _column(records, 0, 6)
+    name = _column(records, 12, 16)
+    alt_loc = _column(records, 16, 17)
+    res_name = _column(records, 17, 20)
+    chain_id = _column(records, 21, 22)
+    icode = _column(records, 26, 27)
+    element = _column(records, 76, 78)
+    charge = _column(records, 78, 80)
+
+    # The numeric fields.
+    serial = _column(records, 6, 11, int)
+    res_seq = _column(records, 22, 26, int)
+    occupancy = _column(records, 54, 60, float)
+    temp_factor = _column(records, 60, 66, float)
+
+    # The coordinates.
+    pos = array([(record[30:38], record[38:46], record[46:54]) for record in records], float64)
+
+    # Return the data.
+    return record_type, serial, name, alt_loc, res_name, chain_id, res_seq, icode, pos, occupancy, temp_factor, element, charge
+
+
 def conect(record):
     """Parse the CONECT record.
 
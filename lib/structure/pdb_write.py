@@ -26,6 +26,7 @@ This module currently used the PDB format version 3.30 from July, 2011 U{http://
 """
 
 # Python module imports.
+from numpy import clip, isnan
 from textwrap import wrap
 
 # relax module imports.
@@ -340,6 +341,85 @@ def atom(file, serial='', name='', alt_loc='', res_name='', chain_id='', res_seq
     file.write('\n')
 
 
+def atom_block(file, record_type=None, serial=None, name=None, res_name=None, chain_id=None, res_seq=None, pos=None, occupancy=1.0, temp_factor=0.0, element=None):
+    """Generate and write a block of ATOM and HETATM records in a single operation.
+
+    This is the bulk equivalent of calling the atom() or hetatm() functions for each atom.  All records are formatted together and written to the file as one string, and the coordinates are clipped to the PDB bounds and checked for NaN values as a single array operation.  The alternate location indicator, insertion code and charge fields are left blank.  See the atom() function for the PDB record format.
+
+
+    @param file:            The file to write the records to.
+    @type file:             file object
+    @keyword record_type:   The record name of each atom, either 'ATOM' or 'HETATM'.  Atom names of ATOM records are aligned using the PDB conventions, whereas HETATM atom names are right-justified.
+    @type record_type:      list of str
+    @keyword serial:        The atom serial numbers.
+    @type serial:           list of int
+    @keyword name:          The atom names.
+    @type name:             list of str
+    @keyword res_name:      The residue names.
+    @type res_name:         list of str
+    @keyword chain_id:      The chain identifiers.
+    @type chain_id:         list of str
+    @keyword res_seq:       The residue sequence numbers.
+    @type res_seq:          list of int
+    @keyword pos:           The orthogonal coordinates in Angstroms.
+    @type pos:              numpy rank-2 (N, 3) float64 array
+    @keyword occupancy:     The occupancy, shared by all atoms.
+    @type occupancy:        float
+    @keyword temp_factor:   The temperature factor, shared by all atoms.
+    @type temp_factor:      float
+    @keyword element:       The element symbols.
+    @type element:          list of str
+    """
+
+    # Nothing to do.
+    if not len(record_type):
+        return
+
+    # Coordinate bounds.
+    pos = clip(pos, -999.999, 9999.999)
+
+    # Check for nan.
+    if isnan(pos).any():
+        i = isnan(pos).any(axis=1).nonzero()[0][0]
+        raise RelaxError("The PDB %s record for atom %s contains NaN values." % (record_type[i], serial[i]))
+
+    # The common end of all records.
+    end = "%6.2f%6.2f          " % (occupancy, temp_factor)
+
+    # Format all records.
+    records = []
+    for i in range(len(record_type)):
+        # The atom name alignment.
+        if record_type[i] == 'HETATM':
+            atom_name = "%4s" % _handle_none(name[i])
+        else:
+            atom_name = "%-4s" % _handle_atom_name(name[i])
+
+        # The formatted record.
+        records.append("%-6s%5s %s %3s %1s%4s    %8.3f%8.3f%8.3f%s%2s  " % (
+            record_type[i],
+            serial[i],
+            atom_name,
+            _handle_none(res_name[i]),
+            _handle_none(chain_id[i]),
+            _handle_none(res_seq[i]),
+            pos[i, 0],
+            pos[i, 1],
+            pos[i, 2],
+            end,
+            _handle_none(element[i])
+        ))
+
+    # Validate the record lengths.
+    text = '\n'.join(records) + '\n'
+    if len(text) != 81 * len(records):
+        for record in records:
+            _record_validate(record)
+
+    # Write out the formatted records.
+    file.write(text)
+
+
 def conect(file, serial='', bonded1='', bonded2='', bonded3='', bonded4=''):
     """Generate the CONECT record.
 
@@ -23,9 +23,16 @@
 """Module for handling all types of structural statistics."""
 
 # Python module imports.
-from numpy import array, float64, mean, ones, sqrt, std, zeros
+from numpy import arctan2, array, average, cross, einsum, float64, mean, ones, sqrt, std, where, zeros
 from numpy.linalg import norm
 
+# relax module imports.
+from lib.errors import RelaxError
+
+
+# The maximum number of interatomic vectors (models times atom pairs) in a single tile, to keep the memory usage bounded.
+TILE_VECTORS = 2000000
+
 
 def atomic_rmsd(coord, verbosity=0):
     """Determine the RMSD for the given atomic coordinates.
@@ -84,6 +91,72 @@ def atomic_rmsd(coord, verbosity=0):
     return rmsd_mean
 
 
+def fluctuation_matrix(coord, measure='distance', tile_size=None):
+    """Calculate the matrix of pairwise interatomic fluctuations between different structures.
+
+    The matrix is split into square tiles of atom pairs, and the fluctuations of each tile are calculated in one operation by broadcasting over the models and the atom pairs of the tile.  Only the tiles of the lower triangle are calculated, the matrix being symmetric.
+
+
+    @param coord:       The array of molecular coordinates.  The first dimension corresponds to the model, the second the atom, the third the coordinate.
+    @type coord:        rank-3 numpy array
+    @keyword measure:   The type of fluctuation to measure.  This can be either 'distance', 'angle', or 'parallax shift'.
+    @type measure:      str
+    @keyword tile_size: The number of atoms per side of the tiles.  If not set, this will be chosen so that the memory usage of a single tile is bounded.
+    @type tile_size:    None or int
+    @return:            The matrix of the corrected sample standard deviations of the fluctuations.
+    @rtype:             numpy rank-2 float64 array
+    """
+
+    # The tiles.
+    coord = array(coord, float64)
+    tiles = fluctuation_tiles(coord, measure=measure, tile_size=tile_size)
+
+    # Calculate the tiles.
+    matrix = zeros((coord.shape[1], coord.shape[1]), float64)
+    for tile in tiles:
+        store_fluctuation_tile(matrix, tile, fluctuation_tile(coord[:, tile[0]:tile[1]], coord[:, tile[2]:tile[3]], measure=measure))
+
+    # Return the matrix.
+    return matrix
+
+
+def fluctuation_tiles(coord, measure='distance', tile_size=None):
+    """Check the arguments and split the lower triangle of the interatomic fluctuation matrix into tiles.
+
+    @param coord:       The array of molecular coordinates.  The first dimension corresponds to the model, the second the atom, the third the coordinate.
+    @type coord:        rank-3 numpy array
+    @keyword measure:   The type of fluctuation to measure.  This can be either 'distance', 'angle', or 'parallax shift'.
+    @type measure:      str
+    @keyword tile_size: The number of atoms per side of the tiles.  If not set, this will be chosen so that the memory usage of a single tile is bounded.
+    @type tile_size:    None or int
+    @return:            The tile boundaries, as the start and end atom indices of the first and then second atoms.
+    @rtype:             list of list of int
+    """
+
+    # Checks.
+    allowed_measures = ['distance', 'angle', 'parallax shift']
+    if measure not in allowed_measures:
+        raise RelaxError("The measure '%s' must be one of %s." % (measure, allowed_measures))
+
+    # The dimensions.
+    m = coord.shape[0]
+    n = coord.shape[1]
+
+    # The tile size.
+    if tile_size == None:
+        tile_size = max(1, int(sqrt(TILE_VECTORS / m)))
+
+    # The tile boundaries of the lower triangle.
+    bounds = [[i, min(i+tile_size, n)] for i in range(0, n, tile_size)]
+    tiles = []
+    for a in range(len(bounds)):
+        for b in range(a+1):
+            tiles.append(bounds[a] + bounds[b])
+
+    # Return the tiles.
+    return tiles
+
+
 def calc_mean_structure(coord=None, mean=None, weights=None):
     """Average the coordinates.
 
@@ -117,6 +190,48 @@ def calc_mean_structure(coord=None, mean=None, weights=None):
         mean[i] = mean[i] / weights.sum()
 
 
+def fluctuation_tile(coord_i, coord_j, measure='distance'):
+    """Calculate the interatomic fluctuations for a tile of atom pairs.
+
+    @param coord_i:     The coordinates of the first atoms of the pairs.  The first dimension corresponds to the model, the second the atom, the third the coordinate.
+    @type coord_i:      rank-3 numpy array
+    @param coord_j:     The coordinates of the second atoms of the pairs, in the same format.
+    @type coord_j:      rank-3 numpy array
+    @keyword measure:   The type of fluctuation to measure.  This can be either 'distance', 'angle', or 'parallax shift'.
+    @type measure:      str
+    @return:            The corrected sample standard deviations of the fluctuations, with the first dimension corresponding to the first atoms and the second dimension to the second atoms.
+    @rtype:             numpy rank-2 float64 array
+    """
+
+    # The interatomic vectors between each structure (models, atoms i, atoms j, xyz).
+    vectors = coord_i[:, :, None, :] - coord_j[:, None, :, :]
+
+    # The interatomic distances.
+    if measure == 'distance':
+        return std(norm(vectors, axis=3), axis=0, ddof=1)
+
+    # The average vectors.
+    ave_vect = average(vectors, axis=0)
+
+    # The intervector angles, via the atan2() of the cross and dot products.
+    if measure == 'angle':
+        angles = arctan2(norm(cross(ave_vect[None], vectors), axis=3), einsum('ijk,mijk->mij', ave_vect, vectors))
+        return std(angles, axis=0, ddof=1)
+
+    # The unit average vectors, catching the zero vectors.
+    length = norm(ave_vect, axis=2)
+    zero = length == 0.0
+    unit = ave_vect / where(zero, 1.0, length)[:, :, None]
+
+    # The parallax shift as the distance from the projection onto the average vector.
+    proj = einsum('mijk,ijk->mij', vectors, unit)[:, :, :, None] * unit[None]
+    sd = std(norm(vectors - proj, axis=3), axis=0, ddof=1)
+
+    # The zero vectors have no shift.
+    sd[zero] = 0.0
+    return sd
+
+
 def per_atom_rmsd(coord, verbosity=0):
     """Determine the per-atom RMSDs for the given atomic coordinates.
 
@@ -154,3 +269,20 @@ def per_atom_rmsd(coord, verbosity=0):
 
     # Return the RMSDs.
     return rmsd
+
+
+def store_fluctuation_tile(matrix, tile, values):
+    """Place the fluctuations of a tile, and its transpose, into the fluctuation matrix.
+
+    @param matrix:  The matrix of fluctuations.
+    @type matrix:   numpy rank-2 float64 array
+    @param tile:    The tile boundaries, as the start and end atom indices of the first and then second atoms.
+    @type tile:     list of int
+    @param values:  The fluctuations of the tile.
+    @type values:   numpy rank-2 float64 array
+    """
+
+    # Store the tile and the symmetric partner.
+    matrix[tile[0]:tile[1], tile[2]:tile[3]] = values
+    matrix[tile[2]:tile[3], tile[0]:tile[1]] = values.T
+
@@ -23,14 +23,13 @@
 """Module for handling all types of structural superimpositions."""
 
 # Python module imports.
-from copy import deepcopy
 from math import pi
-from numpy import diag, dot, eye, float64, outer, sign, transpose, zeros
+from numpy import arctan2, array, diag, dot, einsum, eye, float64, mean, ones, sign, sqrt, transpose, zeros
 from numpy.linalg import det, norm, svd
 
 # relax module import.
-from lib.structure.mass import centre_of_mass
-from lib.structure.statistics import calc_mean_structure
+from lib.errors import RelaxError
+from lib.structure.mass import atomic_masses, centre_of_mass
 from lib.geometry.rotations import R_to_axis_angle, R_to_euler_zyz
 
 
@@ -89,96 +88,141 @@ def fit_to_first(models=None, coord=None, centre_type="centroid", elements=None,
     return T_list, R_list, pivot_list
 
 
-def fit_to_mean(models=None, coord=None, centre_type="centroid", elements=None, centroid=None, verbosity=1):
-    """Superimpose a set of structural models using the fit to first algorithm.
+def find_centres(coord=None, centre_type="centroid", elements=None, centroid=None, weights=None):
+    """Calculate the centres of a stack of structural models in one operation.
 
-    @keyword models:        The list of models to superimpose.
-    @type models:           list of int
-    @keyword coord:         The list of coordinates of all models to superimpose.  The first index is the models, the second is the atomic positions, and the third is the xyz coordinates.
-    @type coord:            list of numpy rank-2, Nx3 arrays
-    @keyword centre_type:   The type of centre to superimpose over.  This can either be the standard centroid superimposition or the CoM could be used instead.
+    @keyword coord:         The coordinates of all models.  The first index is the models, the second is the atomic positions, and the third is the xyz coordinates.
+    @type coord:            numpy rank-3, MxNx3 array
+    @keyword centre_type:   The type of centre.  This can either be the standard centroid or the CoM.
     @type centre_type:      str
-    @keyword elements:      The list of elements corresponding to the atoms.
+    @keyword elements:      The list of elements corresponding to the atoms, required for the CoM.
     @type elements:         list of str
-    @keyword centroid:      An alternative position of the centroid to allow for different superpositions, for example of pivot point motions.
+    @keyword centroid:      An alternative position of the centroid which, if given, is used for all models.
     @type centroid:         list of float or numpy rank-1, 3D array
-    @keyword verbosity:     The amount of information to print out.  If 0, nothing will be printed.
-    @type verbosity:        int
-    @return:                The lists of translation vectors, rotation matrices, and rotation pivots.
-    @rtype:                 list of numpy rank-1 3D arrays, list of numpy rank-2 3D arrays, list of numpy rank-1 3D arrays
+    @keyword weights:       The optional atomic weights.
+    @type weights:          None or numpy rank-1, N array
+    @return:                The centres of all models.
+    @rtype:                 numpy rank-2, Mx3 array
+    """
+
+    # The fixed centroid.
+    if centroid is not None:
+        return zeros((coord.shape[0], 3), float64) + array(centroid, float64)
+
+    # The atomic weights.
+    if weights is None:
+        weights = ones(coord.shape[1], float64)
+    if centre_type != 'centroid':
+        weights = weights * atomic_masses(elements=elements)
+
+    # The weighted average positions.
+    return einsum('n,mni->mi', weights, coord) / weights.sum()
+
+
+def fit_to_mean(models=None, coord=None, centre_type="centroid", elements=None, centroid=None, weights=None, outlier_cutoff=None, verbosity=1):
+    """Superimpose a set of structural models using the fit to mean algorithm.
+
+    The optimal rotations of all models to the mean structure are calculated together from a single stacked SVD, and the translations and rotations are applied to all coordinates at once.  In the iterative outlier rejection mode, the atoms with an RMSD to the mean structure above the cutoff are excluded from the superimposition, and the algorithm is repeated until the set of excluded atoms no longer changes.
+
+
+    @keyword models:            The list of models to superimpose.
+    @type models:               list of int
+    @keyword coord:             The list of coordinates of all models to superimpose.  The first index is the models, the second is the atomic positions, and the third is the xyz coordinates.  These will be updated to the superimposed positions.
+    @type coord:                list of numpy rank-2, Nx3 arrays
+    @keyword centre_type:       The type of centre to superimpose over.  This can either be the standard centroid superimposition or the CoM could be used instead.
+    @type centre_type:          str
+    @keyword elements:          The list of elements corresponding to the atoms.
+    @type elements:             list of str
+    @keyword centroid:          An alternative position of the centroid to allow for different superpositions, for example of pivot point motions.
+    @type centroid:             list of float or numpy rank-1, 3D array
+    @keyword weights:           The optional atomic weights for a weighted superimposition.
+    @type weights:              None or list of float
+    @keyword outlier_cutoff:    The per-atom RMSD to the mean structure, in Angstrom, above which atoms are rejected from the superimposition.  If None, no atoms are rejected.
+    @type outlier_cutoff:       None or float
+    @keyword verbosity:         The amount of information to print out.  If 0, nothing will be printed.
+    @type verbosity:            int
+    @return:                    The lists of translation vectors, rotation matrices, and rotation pivots.
+    @rtype:                     list of numpy rank-1 3D arrays, list of numpy rank-2 3D arrays, list of numpy rank-1 3D arrays
     """
 
     # Print out.
     if verbosity:
         print("\nSuperimposition of structural models %s using the 'fit to mean' algorithm." % models)
 
-    # Duplicate the coordinates.
-    orig_coord = deepcopy(coord)
-
-    # Initialise the displacement lists.
-    T_list = []
-    R_list = []
-    pivot_list = []
+    # Work on a copy of the coordinates.
+    orig_coord = array(coord, float64)
+    new_coord = orig_coord.copy()
+    M, N = new_coord.shape[:2]
 
-    # Initialise the mean structure.
-    N = len(coord[0])
-    mean = zeros((N, 3), float64)
-
-    # Iterative fitting to mean.
-    converged = False
-    iter = 0
-    while not converged:
-        # Print out.
-        if verbosity:
-            print("\nIteration %i of the algorithm." % iter)
-            print("%-10s%-25s%-25s" % ("Model", "Translation (Angstrom)", "Rotation (deg)"))
+    # The atomic weights.
+    if weights is None:
+        weights = ones(N, float64)
+    else:
+        weights = array(weights, float64)
+    rejected = zeros(N, bool)
+
+    # Iterative outlier rejection.
+    while True:
+        # The weights of the retained atoms.
+        fit_weights = weights * ~rejected
+        if not fit_weights.any():
+            raise RelaxError("All atoms have been rejected from the superimposition.")
+
+        # Iterative fitting to mean.
+        converged = False
+        iter = 0
+        while not converged:
+            # Print out.
+            if verbosity:
+                print("\nIteration %i of the algorithm." % iter)
+                print("%-10s%-25s%-25s" % ("Model", "Translation (Angstrom)", "Rotation (deg)"))
 
-        # Calculate the mean structure.
-        calc_mean_structure(coord, mean)
+            # Calculate the mean structure.
+            mean_str = mean(new_coord, axis=0)
 
-        # Fit each model to the mean.
-        converged = True
-        for i in range(len(models)):
-            # Calculate the displacements (Kabsch algorithm).
-            trans_vect, trans_dist, R, axis, angle, pivot = kabsch(name_from='model %s'%models[0], name_to='mean', coord_from=coord[i], coord_to=mean, centre_type=centre_type, elements=elements, centroid=centroid, verbosity=0)
+            # Fit all models to the mean.
+            trans_vect, R, pivot = kabsch_batch(coord_from=new_coord, coord_to=mean_str, centre_type=centre_type, elements=elements, centroid=centroid, weights=fit_weights)
+            trans_dist = norm(trans_vect, axis=1)
+            angle = arctan2(norm([R[:, 2, 1] - R[:, 1, 2], R[:, 0, 2] - R[:, 2, 0], R[:, 1, 0] - R[:, 0, 1]], axis=0), R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2] - 1.0)
 
             # Table printout.
             if verbosity:
-                print("%-10i%25.3g%25.3g" % (i, trans_dist, (angle / 2.0 / pi * 360.0)))
+                for i in range(M):
+                    print("%-10i%25.3g%25.3g" % (i, trans_dist[i], (angle[i] / 2.0 / pi * 360.0)))
 
-            # Shift the coordinates.
-            for j in range(N):
-                # Translate.
-                coord[i][j] += trans_vect
+            # Translate, and then rotate about the pivot.
+            new_coord = einsum('mij,mnj->mni', R, new_coord + (trans_vect - pivot)[:, None, :]) + pivot[:, None, :]
 
-                # The pivot to atom vector.
-                coord[i][j] -= pivot
+            # Convergence test.
+            converged = not (trans_dist > 1e-10).any() and not (angle > 1e-10).any()
 
-                # Rotation.
-                coord[i][j] = dot(R, coord[i][j])
+            # Increment the iteration number.
+            iter += 1
 
-                # The new position.
-                coord[i][j] += pivot
+        # No outlier rejection.
+        if outlier_cutoff == None:
+            break
 
-            # Convergence test.
-            if trans_dist > 1e-10 or angle > 1e-10:
-                converged = False
+        # The per-atom RMSD to the mean structure.
+        rmsd = sqrt(mean(((new_coord - mean(new_coord, axis=0))**2).sum(axis=2), axis=0))
 
-        # Increment the iteration number.
-        iter += 1
+        # Update the rejected atoms, finishing if the set is unchanged.
+        new_rejected = rmsd > outlier_cutoff
+        if verbosity:
+            print("\n%i of %i atoms have an RMSD to the mean structure above the %s Angstrom cutoff." % (new_rejected.sum(), N, outlier_cutoff))
+        if (new_rejected == rejected).all():
+            break
+        rejected = new_rejected
 
-    # Perform the fit once from the original coordinates to obtain the full transforms.
-    for i in range(len(models)):
-        # Calculate the displacements (Kabsch algorithm).
-        trans_vect, trans_dist, R, axis, angle, pivot = kabsch(name_from='model %s'%models[i], name_to='the mean structure', coord_from=orig_coord[i], coord_to=mean, centre_type=centre_type, elements=elements, centroid=centroid, verbosity=0)
+    # Update the coordinates.
+    for i in range(M):
+        coord[i][:] = new_coord[i]
 
-        # Store the transforms.
-        T_list.append(trans_vect)
-        R_list.append(R)
-        pivot_list.append(pivot)
+    # Perform the fit once from the original coordinates to obtain the full transforms.
+    trans_vect, R, pivot = kabsch_batch(coord_from=orig_coord, coord_to=mean_str, centre_type=centre_type, elements=elements, centroid=centroid, weights=fit_weights)
 
     # Return the transform data.
-    return T_list, R_list, pivot_list
+    return list(trans_vect), list(R), list(pivot)
 
 
 def kabsch(name_from=None, name_to=None, coord_from=None, coord_to=None, centre_type="centroid", elements=None, centroid=None, verbosity=1):
@@ -248,6 +292,42 @@ def kabsch(name_from=None, name_to=None, coord_from=None, coord_to=None, centre_
     return trans_vect, trans_dist, R, axis, angle, centroid_to
 
 
+def kabsch_batch(coord_from=None, coord_to=None, centre_type="centroid", elements=None, centroid=None, weights=None):
+    """Calculate the rotational and translational displacements of a stack of structures to a single structure.
+
+    This is a batched version of the Kabsch algorithm, with all optimal rotations obtained from a single stacked SVD.
+
+
+    @keyword coord_from:    The atomic coordinates of all starting structures.  The first index is the structure, the second is the atomic positions, and the third is the xyz coordinates.
+    @type coord_from:       numpy rank-3, MxNx3 array
+    @keyword coord_to:      The atomic coordinates for the ending structure.
+    @type coord_to:         numpy rank-2, Nx3 array
+    @keyword centre_type:   The type of centre to superimpose over.  This can either be the standard centroid superimposition or the CoM could be used instead.
+    @type centre_type:      str
+    @keyword elements:      The list of elements corresponding to the atoms.
+    @type elements:         list of str
+    @keyword centroid:      An alternative position of the centroid, used for studying pivoted systems.
+    @type centroid:         list of float or numpy rank-1, 3D array
+    @keyword weights:       The optional atomic weights.
+    @type weights:          None or numpy rank-1, N array
+    @return:                The translation vectors, rotation matrices, and rotational pivots defined as the centroid of the ending structure.
+    @rtype:                 numpy rank-2 Mx3 array, numpy rank-3 Mx3x3 array, numpy rank-2 Mx3 array
+    """
+
+    # Calculate the centroids.
+    centroid_from = find_centres(coord=coord_from, centre_type=centre_type, elements=elements, centroid=centroid, weights=weights)
+    centroid_to = find_centres(coord=coord_to[None], centre_type=centre_type, elements=elements, centroid=centroid, weights=weights)[0]
+
+    # The translations.
+    trans_vect = centroid_to - centroid_from
+
+    # The rotations.
+    R = kabsch_rotations(coord_from=coord_from, coord_to=coord_to, centroid_from=centroid_from, centroid_to=centroid_to, weights=weights)
+
+    # Return the data.
+    return trans_vect, R, zeros(centroid_from.shape, float64) + centroid_to
+
+
 def kabsch_rotation(coord_from=None, coord_to=None, centroid_from=None, centroid_to=None):
     """Calculate the rotation via SVD.
 
@@ -263,17 +343,8 @@ def kabsch_rotation(coord_from=None, coord_to=None, centroid_from=None, centroid
     @rtype:                 numpy rank-2, 3D array
     """
 
-    # Initialise the covariance matrix A.
-    A = zeros((3, 3), float64)
-
-    # Loop over the atoms.
-    for i in range(coord_from.shape[0]):
-        # The positions shifted to the origin.
-        orig_from = coord_from[i] - centroid_from
-        orig_to = coord_to[i] - centroid_to
-
-        # The outer product.
-        A += outer(orig_from, orig_to)
+    # The covariance matrix A, as the sum of the outer products of the positions shifted to the origin.
+    A = dot(transpose(coord_from - centroid_from), coord_to - centroid_to)
 
     # SVD.
     U, S, V = svd(A)
@@ -287,3 +358,41 @@ def kabsch_rotation(coord_from=None, coord_to=None, centroid_from=None, centroid
 
     # Return the rotation.
     return R
+
+
+def kabsch_rotations(coord_from=None, coord_to=None, centroid_from=None, centroid_to=None, weights=None):
+    """Calculate the rotations of a stack of structures via a single stacked SVD.
+
+    @keyword coord_from:    The atomic coordinates of all starting structures.
+    @type coord_from:       numpy rank-3, MxNx3 array
+    @keyword coord_to:      The atomic coordinates for the ending structure, or for each starting structure.
+    @type coord_to:         numpy rank-2, Nx3 array or numpy rank-3, MxNx3 array
+    @keyword centroid_from: The starting centroids.
+    @type centroid_from:    numpy rank-2, Mx3 array
+    @keyword centroid_to:   The ending centroid, or centroids.
+    @type centroid_to:      numpy rank-1, 3D array or numpy rank-2, Mx3 array
+    @keyword weights:       The optional atomic weights.
+    @type weights:          None or numpy rank-1, N array
+    @return:                The rotation matrices.
+    @rtype:                 numpy rank-3, Mx3x3 array
+    """
+
+    # The positions shifted to the origin.
+    orig_from = coord_from - centroid_from[:, None, :]
+    orig_to = coord_to - (zeros(centroid_from.shape, float64) + centroid_to)[:, None, :]
+
+    # Weighting.
+    if weights is not None:
+        orig_from = orig_from * weights[:, None]
+
+    # The covariance matrices A.
+    A = einsum('mni,mnj->mij', orig_from, orig_to)
+
+    # SVD.
+    U, S, V = svd(A)
+
+    # The handedness of the covariance matrices, applied to the last row of V (this is the sign of det(A), but is also valid for planar atom sets).
+    V[:, 2] *= sign(det(U) * det(V))[:, None]
+
+    # The rotations R = V^T.D.U^T.
+    return einsum('mki,mjk->mij', V, U)
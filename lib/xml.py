@@ -33,7 +33,7 @@ set_printoptions(precision=15, threshold=inf)
 # relax module imports.
 import lib.arg_check
 import lib.check_types
-from lib.compat import unicode
+from lib.compat import Mapping, unicode
 from lib.float import floatAsByteArray, packBytesAsPyFloat
 from lib.errors import RelaxError
 
@@ -119,7 +119,7 @@ def object_to_xml(doc, elem, value=None):
         py_type = 'int'
     elif isinstance(value, list):
         py_type = 'list'
-    elif isinstance(value, dict):
+    elif isinstance(value, Mapping):
         py_type = 'dict'
     elif isinstance(value, ndarray):
         py_type = repr(value.dtype)
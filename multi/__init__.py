@@ -101,6 +101,28 @@ To execute the calculations, the final part of the calculation code on the maste
     processor_box.processor.run_queue().
 
 
+3.4 Combining independent calculations
+--------------------------------------
+
+Independent calculations which each end with a call to run_queue() can be spread over the slave processors together by holding the queue::
+
+    processor_box.processor.hold_queue()
+    ...
+    processor_box.processor.release_queue()
+
+The commands of all run_queue() calls between these are executed together by the release_queue() call of the outermost hold.  The Memo objects must therefore contain everything needed by the Result_command to process the results, as the master may be in a different state when the results are processed.
+
+
+3.5 Restarting interrupted calculations
+---------------------------------------
+
+The results of the queued commands can be journaled to an append-only file by::
+
+    processor_box.processor.set_journal('journal.pickle')
+
+The results of each completed Slave_command with a Memo are written to the journal as soon as they have been processed by the master.  If the calculation is interrupted and restarted with the same journal file, all commands whose results are in the journal are skipped and their Result_command objects are replayed with the Memo of the new command.  Commands are identified by their class and data, excluding the memo ID, hence the commands must be recreated with exactly the same data.  The relax '--journal' command line argument switches on journaling.
+
+
 4 Example
 =========
 
@@ -118,7 +140,8 @@ This appears to be an OpenMPI problem with late 2.6 Linux kernels.
 """
 
 
-__all__ = ['memo',
+__all__ = ['journal',
+           'memo',
            'misc',
            'mpi4py_processor',
            'multi_processor_base',
@@ -144,7 +167,7 @@ from multi.slave_commands import Slave_command
 #FIXME error checking for if module required not found.
 #FIXME module loading code needs to be in a util module.
 #FIXME: remove parameters that are not required to load the module (processor_size).
-def load_multiprocessor(processor_name, callback, processor_size, verbosity=1):
+def load_multiprocessor(processor_name, callback, processor_size, group_size=1, verbosity=1):
     """Load a multi processor given its name.
 
     Dynamically load a multi processor, the current algorithm is to search in module multi for a
@@ -157,6 +180,8 @@ def load_multiprocessor(processor_name, callback, processor_size, verbosity=1):
 
     @param processor_name:  Name of the processor module/class to load.
     @type processor_name:   str
+    @keyword group_size:    The number of processes in each slave group, for the processor fabrics supporting slave groups.
+    @type group_size:       int
     @keyword verbosity:     The verbosity level at initialisation.  This can be changed during program execution.  A value of 0 suppresses all output.  A value of 1 causes the basic multi-processor information to be printed.  A value of 2 will switch on a number of debugging printouts.  Values greater than 2 currently do nothing, though this might change in the future.
     @type verbosity:        int
     @return:                A loaded processor object or None to indicate failure.
@@ -181,7 +206,10 @@ def load_multiprocessor(processor_name, callback, processor_size, verbosity=1):
         raise Exception("can't load class %s from module %s" % (class_name, module_path))
 
     # Instantiate the Processor.
-    object = clazz(callback=callback, processor_size=processor_size)
+    if group_size > 1:
+        object = clazz(callback=callback, processor_size=processor_size, group_size=group_size)
+    else:
+        object = clazz(callback=callback, processor_size=processor_size)
 
     # Load the Processor_box container and store the details and Processor instance.
     processor_box = Processor_box()
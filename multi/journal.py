@@ -0,0 +1,196 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Module docstring.
+"""The journal of completed slave commands, for restarting interrupted calculations.
+
+The result commands of each completed slave command are appended to the journal file, keyed by the identity of the slave command.  This identity is a hash of the class and the data of the command, excluding the memo ID, together with the number of times that the same command has been seen before.  When the calculation is restarted with the same journal file, the slave commands already in the journal are not executed and their result commands are instead replayed on the master.
+
+For the identity to be reproducible, the slave commands must be recreated with exactly the same data.  For example the randomised data of Monte Carlo simulations must be recreated from a saved state or with the same random seed.
+"""
+
+# Python module imports.
+from hashlib import sha1
+from os import F_OK, access, fsync
+from pickle import dump, dumps, load, loads
+
+
+# The pickle protocol, fixed for reproducible command identities.
+PROTOCOL = 2
+
+
+class Queue_journal(object):
+    """The append-only journal of the result commands of completed slave commands."""
+
+    def __init__(self, file_name):
+        """Load the existing journal entries and open the file for appending.
+
+        @param file_name:   The name of the journal file.
+        @type file_name:    str
+        """
+
+        # Store the file name.
+        self.file_name = file_name
+
+        # The journaled results, as pickled result commands keyed by the command identity.
+        self._results = {}
+
+        # The results of the currently running commands waiting to be journaled.
+        self._pending = {}
+
+        # The number of times each command has been seen.
+        self._counts = {}
+
+        # Load the existing entries.
+        if access(file_name, F_OK):
+            self._load()
+
+        # Open the file for appending.
+        self.file = open(file_name, 'ab')
+
+
+    def _load(self):
+        """Load the journal entries from the file, removing any partially written final entry."""
+
+        # Read the complete entries.
+        file = open(self.file_name, 'rb')
+        offset = 0
+        while True:
+            # The end of the file, or a partially written final entry.
+            try:
+                key, results = load(file)
+            except Exception:
+                break
+
+            # Store the entry.
+            self._results[key] = results
+            offset = file.tell()
+
+        # Remove the trailing data, so that new entries can be appended.
+        file.seek(0, 2)
+        if file.tell() > offset:
+            file.close()
+            file = open(self.file_name, 'r+b')
+            file.truncate(offset)
+        file.close()
+
+
+    def add(self, key, result):
+        """Add a result command of a running slave command to the journal.
+
+        The result will only be written to the file by the next call to flush().
+
+
+        @param key:     The identity of the slave command.
+        @type key:      str
+        @param result:  The result command.
+        @type result:   Result_command instance
+        """
+
+        # Pickle now, as the result command may be modified when run.
+        self._pending.setdefault(key, []).append(dumps(result, PROTOCOL))
+
+
+    def close(self):
+        """Close the journal file."""
+
+        # Close the file.
+        self.file.close()
+
+
+    def command_key(self, command):
+        """Return the identity of the slave command.
+
+        @param command: The slave command.
+        @type command:  Slave_command instance
+        @return:        The identity of the command, or None if the command cannot be pickled.
+        @rtype:         str or None
+        """
+
+        # The data of the command, excluding the non-reproducible memo ID.
+        state = []
+        for name in sorted(vars(command)):
+            if name != 'memo_id':
+                state.append((name, getattr(command, name)))
+
+        # Hash the class and data.
+        try:
+            digest = sha1(dumps((command.__class__.__module__, command.__class__.__name__, state), PROTOCOL)).hexdigest()
+        except Exception:
+            return None
+
+        # Distinguish repeats of the same command.
+        count = self._counts.get(digest, 0)
+        self._counts[digest] = count + 1
+
+        # Return the identity.
+        return "%s-%i" % (digest, count)
+
+
+    def discard(self):
+        """Discard the results of the slave commands which have not completed."""
+
+        # Reset the pending results.
+        self._pending = {}
+
+
+    def flush(self):
+        """Append the results of the completed slave commands to the journal file."""
+
+        # Nothing to do.
+        if not self._pending:
+            return
+
+        # Append one entry per slave command.
+        for key in self._pending:
+            dump((key, self._pending[key]), self.file, PROTOCOL)
+            self._results[key] = self._pending[key]
+        self._pending = {}
+
+        # Force the entries to disk.
+        self.file.flush()
+        fsync(self.file.fileno())
+
+
+    def has(self, key):
+        """Determine if the slave command has been journaled.
+
+        @param key: The identity of the slave command.
+        @type key:  str
+        @return:    True if the results of the command are in the journal.
+        @rtype:     bool
+        """
+
+        # Check the results.
+        return key in self._results
+
+
+    def results(self, key):
+        """Return new copies of the journaled result commands of a slave command.
+
+        @param key: The identity of the slave command.
+        @type key:  str
+        @return:    The result commands.
+        @rtype:     list of Result_command instances
+        """
+
+        # Unpickle the results.
+        return [loads(data) for data in self._results[key]]
@@ -74,6 +74,24 @@ def import_module(module_path):
         return result
 
 
+def merge_blocks(blocks):
+    """Merge the blocks created by split_blocks(), restoring the original order.
+
+    @param blocks:  The blocks of items.
+    @type blocks:   list of lists
+    @return:        The items.
+    @rtype:         list
+    """
+
+    # The merged list.
+    items = [None] * sum([len(block) for block in blocks])
+    for i in range(len(blocks)):
+        items[i::len(blocks)] = blocks[i]
+
+    # Return the items.
+    return items
+
+
 def raise_unimplemented(method):
     """Standard function for raising NotImplementedError for unimplemented abstract methods.
 
@@ -87,6 +105,22 @@ def raise_unimplemented(method):
 
 
 
+def split_blocks(items, n):
+    """Split the items into n interleaved blocks of nearly equal size.
+
+    @param items:   The items to split.
+    @type items:    list
+    @param n:       The number of blocks.
+    @type n:        int
+    @return:        The blocks of items, where block i contains the items i, i+n, i+2n, etc.
+    @rtype:         list of lists
+    """
+
+    # Split.
+    return [items[i::n] for i in range(n)]
+
+
+
 class Capturing_exception(Exception):
     """A wrapper exception for an exception captured on a slave processor.
 
@@ -214,6 +248,69 @@ class Result(object):
 
 
 
+class Command_timing(object):
+    """The timings of the slave commands of a queue, as recorded by the master.
+
+    For each command sent to a slave, the round trip time from dispatch to the return of the completed result is recorded together with the compute time reported by the slave.  The difference is the dispatch latency, i.e. the communication and waiting time.  The time spent processing each result on the master is recorded separately.
+    """
+
+    def __init__(self):
+        """Initialise the timing records."""
+
+        # The per-command records of the slave rank, the round trip time, and the compute time.
+        self.commands = []
+
+        # The result processing times.
+        self.results = []
+
+
+    def add_command(self, rank, round_trip, compute=None):
+        """Record the timing of a command.
+
+        @param rank:        The rank of the slave.
+        @type rank:         int
+        @param round_trip:  The time in seconds from dispatch to the return of the completed result.
+        @type round_trip:   float
+        @keyword compute:   The time in seconds spent executing the command on the slave, if known.
+        @type compute:      float or None
+        """
+
+        # Store the record.
+        self.commands.append([rank, round_trip, compute])
+
+
+    def add_result(self, seconds):
+        """Record the processing time of a result on the master.
+
+        @param seconds: The processing time in seconds.
+        @type seconds:  float
+        """
+
+        # Store the time.
+        self.results.append(seconds)
+
+
+    def summary(self):
+        """Return a summary of the timings.
+
+        @return:    The summary text.
+        @rtype:     str
+        """
+
+        # The totals.
+        round_trip = sum([record[1] for record in self.commands])
+        compute = sum([record[2] for record in self.commands if record[2] != None])
+        latency = sum([record[1] - record[2] for record in self.commands if record[2] != None])
+
+        # The text.
+        text = "Command timings:  %i commands, %.6f s round trip, %.6f s compute, %.6f s dispatch latency.\n" % (len(self.commands), round_trip, compute, latency)
+        text += "Result timings:  %i results, %.6f s processing on the master.\n" % (len(self.results), sum(self.results))
+
+        # Return the text.
+        return text
+
+
+
 # TODO: make this a result_command
 class Result_string(Result):
     """A simple result from a slave containing a result.
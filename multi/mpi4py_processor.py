@@ -36,17 +36,36 @@ import os
 import sys
 
 # relax module imports.
+from multi.misc import Capturing_exception, merge_blocks, split_blocks
 from multi.slave_commands import Exit_command
 from multi.multi_processor_base import Multi_processor, Too_few_slaves_exception
 
 
 class Mpi4py_processor(Multi_processor):
-    """The mpi4py multi-processor class."""
+    """The mpi4py multi-processor class.
 
-    def __init__(self, processor_size, callback):
-        """Initialise the mpi4py processor."""
+    The slave processes can be split into groups, each group acting as a single slave.  The master sends the commands to the first process of each group, the group leader, and the commands can then spread their calculations across the processes of the group via the group_map() method.  The groups communicate via sub-communicators split from MPI.COMM_WORLD.
+    """
 
-        mpi_processor_size = MPI.COMM_WORLD.size-1
+    def __init__(self, processor_size, callback, group_size=1):
+        """Initialise the mpi4py processor.
+
+        @param processor_size:  The requested number of slaves.
+        @type processor_size:   int
+        @param callback:        The application callback.
+        @type callback:         multi.processor.Application_callback instance
+        @keyword group_size:    The number of processes in each slave group.
+        @type group_size:       int
+        """
+
+        # Checks.
+        if group_size < 1:
+            raise Exception("The slave group size of %s must be at least 1." % group_size)
+
+        # The number of slave groups.
+        num_slaves = MPI.COMM_WORLD.size-1
+        self._group_size = group_size
+        mpi_processor_size = (num_slaves + group_size - 1) // group_size
 
         if processor_size == -1:
             processor_size = mpi_processor_size
@@ -64,20 +83,78 @@ class Mpi4py_processor(Multi_processor):
         # Initialise a flag for determining if we are in the run() method or not.
         self.in_main_loop = False
 
+        # The requests of the non-blocking sends of the master.
+        self._send_requests = []
+
+        # Split the world communicator into the slave groups, with the master in its own group (collective over all processes).
+        rank = MPI.COMM_WORLD.rank
+        color = 0
+        if rank != 0:
+            color = self._group_index(rank)
+        self.group_comm = MPI.COMM_WORLD.Split(color, rank)
+
 
     def _broadcast_command(self, command):
-        for i in range(1, MPI.COMM_WORLD.size):
-            if i != 0:
-                MPI.COMM_WORLD.send(obj=command, dest=i)
+        for i in range(1, self.processor_size()+1):
+            MPI.COMM_WORLD.send(obj=command, dest=self._leader_rank(i))
 
 
     def _ditch_all_results(self):
-        for i in range(1, MPI.COMM_WORLD.size):
-            if i != 0:
-                while True:
-                    result = MPI.COMM_WORLD.recv(source=i)
-                    if result.completed:
-                        break
+        for i in range(1, self.processor_size()+1):
+            while True:
+                result = MPI.COMM_WORLD.recv(source=self._leader_rank(i))
+                if result.completed:
+                    break
+
+
+    def _group_index(self, rank):
+        """Convert the world rank of a slave process to the slave group index.
+
+        @param rank:    The MPI.COMM_WORLD rank of the slave process.
+        @type rank:     int
+        @return:        The slave group index, starting from 1.
+        @rtype:         int
+        """
+
+        # The index.
+        return (rank - 1) // self._group_size + 1
+
+
+    def _group_member_loop(self):
+        """The main loop of the processes of a slave group other than the group leader.
+
+        The function and block of items are received from the group leader and the results are sent back, until the leader sends None.
+        """
+
+        # Loop until released by the group leader.
+        while True:
+            # The function.
+            function = self.group_comm.bcast(None, root=0)
+            if function == None:
+                break
+
+            # Calculate the results for the block of items.
+            block = self.group_comm.scatter(None, root=0)
+            try:
+                result = [True, function(block)]
+            except:
+                result = [False, Capturing_exception(exc_info=sys.exc_info(), rank=self.rank(), name=self.get_name())]
+
+            # Return the results to the group leader.
+            self.group_comm.gather(result, root=0)
+
+
+    def _leader_rank(self, index):
+        """Convert the slave group index to the world rank of the group leader.
+
+        @param index:   The slave group index, starting from 1.
+        @type index:    int
+        @return:        The MPI.COMM_WORLD rank of the group leader.
+        @rtype:         int
+        """
+
+        # The rank.
+        return (index - 1) * self._group_size + 1
 
 
     def abort(self):
@@ -124,6 +201,10 @@ class Mpi4py_processor(Multi_processor):
         else:
             # Slave clean up.
             if MPI.Is_initialized() and not MPI.Is_finalized() and MPI.COMM_WORLD.rank == 0:
+                # Complete all non-blocking sends.
+                MPI.Request.Waitall(self._send_requests)
+                self._send_requests = []
+
                 # Send the exit command to all slaves.
                 self._broadcast_command(Exit_command())
 
@@ -151,25 +232,79 @@ class Mpi4py_processor(Multi_processor):
         for i in range(1, len(vendor[1])):
             vendor_version = vendor_version + '.%i' % vendor[1][i]
 
+        # The slaves.
+        slaves = "%i slave processors" % self.processor_size()
+        if self._group_size > 1:
+            slaves = "%i slave groups of up to %i processes" % (self.processor_size(), self._group_size)
+
         # Return the string.
-        return "MPI %s.%s running via mpi4py with %i slave processors & 1 master.  Using %s %s." % (version_info[0], version_info[1], self.processor_size(), vendor_name, vendor_version)
+        return "MPI %s.%s running via mpi4py with %s & 1 master.  Using %s %s." % (version_info[0], version_info[1], slaves, vendor_name, vendor_version)
 
 
     def get_name(self):
         return '%s-pid%s' % (MPI.Get_processor_name(), os.getpid())
 
 
+    def group_map(self, function, items):
+        """Apply the function to the items, spread over the processes of the slave group.
+
+        The items are split into interleaved blocks, one per process of the group, which are scattered over the group sub-communicator.  The results are gathered back by the group leader.
+
+
+        @param function:    The function to apply to the blocks of items.  It is called with a list of items and must return the list of results in the same order.
+        @type function:     function
+        @param items:       The items.
+        @type items:        list
+        @return:            The results for all items, in the order of the items.
+        @rtype:             list
+        """
+
+        # No slave group.
+        if self.on_master() or self.group_comm.size == 1:
+            return function(items)
+
+        # Send the function and the blocks of items to the group.
+        self.group_comm.bcast(function, root=0)
+        block = self.group_comm.scatter(split_blocks(items, self.group_comm.size), root=0)
+
+        # The results of the group leader.
+        try:
+            result = [True, function(block)]
+        except:
+            result = [False, Capturing_exception(exc_info=sys.exc_info(), rank=self.rank(), name=self.get_name())]
+
+        # Gather the results of the group, raising the first failure.
+        results = self.group_comm.gather(result, root=0)
+        for success, value in results:
+            if not success:
+                raise value
+
+        # Return the results in the original order.
+        return merge_blocks([value for success, value in results])
+
+
+    def group_size(self):
+        """Return the number of processes in each slave group.
+
+        @return:    The number of processes in each slave group.
+        @rtype:     int
+        """
+
+        # The group size.
+        return self._group_size
+
+
     def master_queue_command(self, command, dest):
-        """Slave to master processor data transfer - send the result command from the slave.
+        """Master to slave processor data transfer - send the command to the slave, without blocking.
 
-        @param command: The results command to send to the master.
-        @type command:  Results_command instance
-        @param dest:    The destination processor's rank.
+        @param command: The command or list of commands to send to the slave.
+        @type command:  Slave_command instance or list of Slave_command instances
+        @param dest:    The destination slave group index.
         @type dest:     int
         """
 
-        # Use a basic MPI send call to transfer the result command.
-        MPI.COMM_WORLD.send(obj=command, dest=dest)
+        # Use a non-blocking MPI send to transfer the command to the slave group leader, so that the master can immediately feed the other slaves.
+        self._send_requests.append(MPI.COMM_WORLD.isend(command, dest=self._leader_rank(dest)))
 
 
     def master_receive_result(self):
@@ -181,8 +316,18 @@ class Mpi4py_processor(Multi_processor):
         @rtype:         Result_command instance
         """
 
-        # Catch and return the result command.
-        return MPI.COMM_WORLD.recv(source=MPI.ANY_SOURCE)
+        # Catch the result command.
+        result = MPI.COMM_WORLD.recv(source=MPI.ANY_SOURCE)
+
+        # Release the completed non-blocking sends (a result implies that its command has been received).
+        self._send_requests = [request for request in self._send_requests if not request.Test()]
+
+        # Convert the rank of the group leader to the slave group index.
+        if hasattr(result, 'rank') and isinstance(result.rank, int):
+            result.rank = self._group_index(result.rank)
+
+        # Return the result command.
+        return result
 
 
     def rank(self):
@@ -195,7 +340,19 @@ class Mpi4py_processor(Multi_processor):
 
     def run(self):
         self.in_main_loop = True
-        super(Mpi4py_processor, self).run()
+
+        # The processes of a slave group other than the leader serve the group leader.
+        if self.group_comm.rank != 0:
+            self._group_member_loop()
+
+        # The master and slave group leaders.
+        else:
+            super(Mpi4py_processor, self).run()
+
+            # Release the other processes of the slave group.
+            if self.on_slave() and self.group_comm.size > 1:
+                self.group_comm.bcast(None, root=0)
+
         self.in_main_loop = False
 
 
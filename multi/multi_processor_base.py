@@ -117,10 +117,15 @@ class Multi_processor(Processor):
                 memo = None
                 if result.memo_id != None:
                     memo = self.memo_map[result.memo_id]
+                self.journal_result(result)
                 result.run(self, memo)
                 if result.memo_id != None and result.completed:
                     del self.memo_map[result.memo_id]
 
+                # The slave commands of a batch have completed, so journal their results.
+                if self.journal != None and isinstance(result, Batched_result_command):
+                    self.journal.flush()
+
             elif isinstance(result, Result_string):
                 #FIXME can't cope with multiple lines
                 sys.stdout.write(result.string)
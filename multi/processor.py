@@ -101,8 +101,9 @@ The following are yet to be implemented:
 import time, datetime, math, sys
 
 # multi module imports.
-from multi.misc import Capturing_exception, raise_unimplemented, Verbosity; verbosity = Verbosity()
-from multi.result_queue import Threaded_result_queue
+from multi.journal import Queue_journal
+from multi.misc import Capturing_exception, Command_timing, raise_unimplemented, Verbosity; verbosity = Verbosity()
+from multi.result_queue import Immediate_result_queue, Threaded_result_queue
 from multi.processor_io import Redirect_text
 from multi.result_commands import Batched_result_command, Null_result_command, Result_exception
 from multi.slave_commands import Slave_storage_command
@@ -179,6 +180,18 @@ class Processor(object):
         self.threaded_result_processing = True
         """Flag for the handling of result processing via self.run_command_queue()."""
 
+        self._queue_hold = 0
+        """The nesting level of the holds on the command queue (see self.hold_queue())."""
+
+        self.timing = Command_timing()
+        """The command and result timings of the last command queue run via self.run_command_queue()."""
+
+        self.journal = None
+        """The journal of completed slave commands (see self.set_journal())."""
+
+        self._journal_keys = {}
+        """The journal identities of the queued slave commands, keyed by memo ID."""
+
 
     def abort(self):
         """Shutdown the multi processor in exceptional conditions - designed for overriding.
@@ -344,6 +357,45 @@ class Processor(object):
         return time_delta_str
 
 
+    def group_map(self, function, items):
+        """Apply the function to the items, spread over the processes of the slave group.
+
+        This allows slave commands to parallelise internally when the processor fabric supports groups of processes per slave (see the mpi4py processor).  The items are split into one block per group process and the function is called with each block, returning the list of results for that block.  The function and the items must be picklable.  This default implementation calls the function once with all items.
+
+
+        @param function:    The function to apply to the blocks of items.  It is called with a list of items and must return the list of results in the same order.
+        @type function:     function
+        @param items:       The items.
+        @type items:        list
+        @return:            The results for all items, in the order of the items.
+        @rtype:             list
+        """
+
+        # Apply the function to all items.
+        return function(items)
+
+
+    def group_size(self):
+        """Return the number of processes in each slave group.
+
+        @return:    The number of processes in each slave group.
+        @rtype:     int
+        """
+
+        # One process per slave.
+        return 1
+
+
+    def hold_queue(self):
+        """Hold the command queue, so that the commands of many run_queue() calls are executed together.
+
+        While the queue is held, the run_queue() method returns without executing the commands, which accumulate in the queue.  The commands are only executed by the release_queue() call of the outermost hold.  This allows independent calculations, which each call run_queue(), to be spread across the slave processors together.  Code using a hold must not depend on the results of the held commands until the queue has been released.
+        """
+
+        # Increment the nesting level.
+        self._queue_hold += 1
+
+
     def is_queued(self):
         """Determine if any slave commands are queued.
 
@@ -359,6 +411,64 @@ class Processor(object):
         return False
 
 
+    def journal_queue(self):
+        """Skip the already journaled slave commands of the queue, replaying their results.
+
+        The journal identities of the remaining commands with memos are stored so that their results can be journaled via self.journal_result().
+        """
+
+        # Reset.
+        self._journal_keys = {}
+        if self.journal == None:
+            return
+        self.journal.discard()
+
+        # Loop over the commands.
+        queue = []
+        replayed = 0
+        for command in self.command_queue:
+            # The command identity, only for commands with memos as the results must be associated with the command.
+            key = None
+            if getattr(command, 'memo_id', None) != None:
+                key = self.journal.command_key(command)
+
+            # Replay the journaled results.
+            if key != None and self.journal.has(key):
+                for result in self.journal.results(key):
+                    result.memo_id = command.memo_id
+                    result.run(self, self.memo_map[command.memo_id])
+                del self.memo_map[command.memo_id]
+                replayed += 1
+                continue
+
+            # Keep the command.
+            if key != None:
+                self._journal_keys[command.memo_id] = key
+            queue.append(command)
+
+        # Update the queue.
+        self.command_queue[:] = queue
+
+        # Printout.
+        if replayed:
+            sys.stdout.write("Replayed the journaled results of %i slave commands, %i commands remain.\n" % (replayed, len(queue)))
+
+
+    def journal_result(self, result):
+        """Add the result command to the journal, if the slave command it belongs to is journaled.
+
+        @param result:  The result command.
+        @type result:   Result_command instance
+        """
+
+        # Not journaled.
+        if self.journal == None or result.memo_id not in self._journal_keys:
+            return
+
+        # Add the result.
+        self.journal.add(self._journal_keys[result.memo_id], result)
+
+
     def master_queue_command(self, command, dest):
         """Slave to master processor data transfer - send the result command from the slave.
 
@@ -528,7 +638,8 @@ class Processor(object):
                     # Capture the standard IO streams for the slaves.
                     self.stdio_capture()
 
-                    # Execute each command, one by one.
+                    # Execute each command, one by one, timing the execution.
+                    start = time.time()
                     for i, command in enumerate(commands):
                         # Set the completed flag if this is the last command.
                         completed = (i == len(commands)-1)
@@ -541,7 +652,7 @@ class Processor(object):
 
                     # Process the batched results.
                     if self.batched_returns:
-                        self.return_object(Batched_result_command(processor=self, result_commands=self.result_list, io_data=self.io_data))
+                        self.return_object(Batched_result_command(processor=self, result_commands=self.result_list, io_data=self.io_data, compute_time=time.time()-start))
                         self.result_list = None
 
                 # Capture and process all slave exceptions.
@@ -560,6 +671,31 @@ class Processor(object):
             self.exit()
 
 
+    def release_queue(self, run=True):
+        """Release a hold on the command queue, executing all accumulated commands for the outermost hold.
+
+        @keyword run:   A flag which if False will cause the accumulated commands to be discarded rather than executed.  This is for cleaning up after failures.
+        @type run:      bool
+        """
+
+        # Decrement the nesting level.
+        if self._queue_hold:
+            self._queue_hold -= 1
+
+        # Still held.
+        if self._queue_hold:
+            return
+
+        # Execute the accumulated commands.
+        if run:
+            self.run_queue()
+
+        # Discard the commands.
+        else:
+            del self.command_queue[:]
+            self.memo_map.clear()
+
+
     def run_command_globally(self, command):
         """Run the same command on all slave processors.
 
@@ -586,44 +722,56 @@ class Processor(object):
         running_set = set()
         idle_set = set([i for i in range(1, self.processor_size()+1)])
 
+        # The command timings.
+        self.timing = Command_timing()
+        dispatch_times = {}
+
         if self.threaded_result_processing:
             result_queue = Threaded_result_queue(self)
         else:
             result_queue = Immediate_result_queue(self)
 
-        while len(queue) != 0:
-
-            while len(idle_set) != 0:
-                if len(queue) != 0:
-                    command = queue.pop()
-                    dest = idle_set.pop()
-                    self.master_queue_command(command=command, dest=dest)
-                    running_set.add(dest)
-                else:
-                    break
-
-            # Loop until the queue of calculations is depleted.
-            while len(running_set) != 0:
-                # Get the result.
-                result = self.master_receive_result()
-
-                # Debugging printout.
-                if verbosity.level():
-                    print('\nIdle set:    %s' % idle_set)
-                    print('Running set: %s' % running_set)
-
-                # Shift the processor rank to the idle set.
-                if result.completed:
-                    idle_set.add(result.rank)
-                    running_set.remove(result.rank)
-
-                # Add to the result queue for instant or threaded processing.
+        # Loop until all commands have been sent and all slaves have completed.
+        result = None
+        while True:
+            # Feed all idle slaves.
+            while len(idle_set) != 0 and len(queue) != 0:
+                command = queue.pop()
+                dest = idle_set.pop()
+                dispatch_times[dest] = time.time()
+                self.master_queue_command(command=command, dest=dest)
+                running_set.add(dest)
+
+            # Add the last result to the result queue for instant or threaded processing, only after the slaves have been fed.
+            if result != None:
                 result_queue.put(result)
 
+            # All slaves have completed.
+            if len(running_set) == 0:
+                break
+
+            # Get the next result.
+            result = self.master_receive_result()
+
+            # Debugging printout.
+            if verbosity.level():
+                print('\nIdle set:    %s' % idle_set)
+                print('Running set: %s' % running_set)
+
+            # Shift the processor rank to the idle set.
+            if result.completed:
+                idle_set.add(result.rank)
+                running_set.remove(result.rank)
+                self.timing.add_command(result.rank, time.time() - dispatch_times[result.rank], getattr(result, 'compute_time', None))
+
         # Process the threaded results.
         if self.threaded_result_processing:
             result_queue.run_all()
 
+        # Timing printout.
+        if verbosity.level():
+            sys.stdout.write(self.timing.summary())
+
 
     def run_queue(self):
         """Run the processor queue - an abstract method.
@@ -632,10 +780,21 @@ class Processor(object):
         thread to block until the command has completed.
         """
 
+        # The queue is held.
+        if self._queue_hold:
+            return
+
+        # Skip the journaled commands.
+        self.journal_queue()
+
         #FIXME: need a finally here to cleanup exceptions states
         lqueue = self.chunk_queue(self.command_queue)
         self.run_command_queue(lqueue)
 
+        # Journal the results returned without batching.
+        if self.journal != None:
+            self.journal.flush()
+
         del self.command_queue[:]
         self.memo_map.clear()
 
@@ -667,6 +826,26 @@ class Processor(object):
         self.run_queue()
 
 
+    def set_journal(self, file_name=None):
+        """Journal the results of the queued slave commands, allowing interrupted calculations to be restarted.
+
+        The result commands of each completed slave command with a memo are appended to the journal file.  If the file already exists, the slave commands whose results are in the journal are skipped by run_queue() and their results are replayed instead.  See the multi.journal module for the requirements.
+
+
+        @keyword file_name: The name of the journal file, or None to switch off journaling.
+        @type file_name:    str or None
+        """
+
+        # Close any current journal.
+        if self.journal != None:
+            self.journal.close()
+            self.journal = None
+
+        # Open the journal on the master.
+        if file_name != None and self.on_master():
+            self.journal = Queue_journal(file_name)
+
+
     def stdio_capture(self):
         """Enable capture of the STDOUT and STDERR.
         
@@ -26,6 +26,7 @@
 # Python module imports.
 import sys
 import threading
+from time import time
 import traceback
 
 # multi module imports.
@@ -49,6 +50,19 @@ class Result_queue(object):
         self.processor = processor
 
 
+    def process(self, job):
+        """Process the result, recording the processing time.
+
+        @param job: The result.
+        @type job:  Result_command instance
+        """
+
+        # Process and time.
+        start = time()
+        self.processor.process_result(job)
+        self.processor.timing.add_result(time() - start)
+
+
     def put(self, job):
         if isinstance(job, Result_exception) :
             self.processor.process_result(job)
@@ -63,7 +77,7 @@ class Immediate_result_queue(Result_queue):
     def put(self, job):
         super(Immediate_result_queue, self).put(job)
         try:
-            self.processor.process_result(job)
+            self.process(job)
         except:
             traceback.print_exc(file=sys.stdout)
             # FIXME: this doesn't work because this isn't the main thread so sys.exit fails...
@@ -104,7 +118,7 @@ class Threaded_result_queue(Result_queue):
                     job = self.queue.get()
                     if job == RESULT_QUEUE_EXIT_COMMAND:
                         break
-                    self.processor.process_result(job)
+                    self.process(job)
             except:
                 traceback.print_exc(file=sys.stdout)
                 # FIXME: this doesn't work because this isn't the main thread so sys.exit fails...
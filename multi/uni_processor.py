@@ -26,9 +26,10 @@
 
 # Python module imports.
 import sys, os
+from time import time
 
 # multi module imports.
-from multi.misc import Result_string
+from multi.misc import Command_timing, Result_string
 from multi.processor import Processor
 from multi.result_commands import Result_command
 
@@ -163,7 +164,10 @@ class Uni_processor(Processor):
             memo = None
             if result.memo_id != None:
                 memo = self.memo_map[result.memo_id]
+            self.journal_result(result)
+            start = time()
             result.run(self, memo)
+            self.timing.add_result(time() - start)
             if result.memo_id != None and result.completed:
                 del self.memo_map[result.memo_id]
 
@@ -177,13 +181,32 @@ class Uni_processor(Processor):
     def run_queue(self):
         """Safely run each command in the queue, cleaning up after failures."""
 
+        # The queue is held.
+        if self._queue_hold:
+            return
+
+        # The command timings.
+        self.timing = Command_timing()
+
         # Run each command in the queue.
         try:
+            # Skip the journaled commands.
+            self.journal_queue()
+
             last_command = len(self.command_queue)-1
             for i, command  in enumerate(self.command_queue):
                 completed = (i == last_command)
 
+                # Execute the command, separating the compute time from the result processing time.
+                start = time()
+                index = len(self.timing.results)
                 command.run(self, completed)
+                round_trip = time() - start
+                self.timing.add_command(0, round_trip, round_trip - sum(self.timing.results[index:]))
+
+                # Journal the results of the command.
+                if self.journal != None:
+                    self.journal.flush()
 
         # Clear the queue, even if a failure occurs.
         finally:
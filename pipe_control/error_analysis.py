@@ -24,16 +24,197 @@
 """Module for performing Monte Carlo simulations for error analysis."""
 
 # Python module imports.
+from hashlib import sha1
 from numpy import diag, ndarray, sqrt
-from random import gauss
+from random import Random, gauss, getrandbits
 
 # relax module imports.
 from lib import statistics
+from lib.compat import Mapping
 from lib.errors import RelaxError
+from pipe_control.interatomic import interatomic_loop
+from pipe_control.mol_res_spin import spin_loop
 from pipe_control.pipes import check_pipe
 from specific_analyses.api import return_api
 
 
+def _delete_sims():
+    """Delete all Monte Carlo simulation data and parameters from the current data pipe, including those of the diffusion and alignment tensors, keeping only the errors."""
+
+    # The spin and interatomic data containers, and the data pipe.
+    containers = [cdp] + list(spin_loop()) + list(interatomic_loop(skip_desel=False))
+
+    # Delete the simulation structures and the streaming accumulators.
+    for container in containers:
+        for name in list(container.__dict__.keys()):
+            if name.endswith('_sim') or name == '_sim_stats':
+                delattr(container, name)
+
+    # The read-only diffusion and alignment tensors.
+    tensors = []
+    if hasattr(cdp, 'diff_tensor'):
+        tensors.append(cdp.diff_tensor)
+    if hasattr(cdp, 'align_tensors'):
+        tensors = tensors + list(cdp.align_tensors)
+
+    # Delete the tensor simulation structures, resetting the number of simulations so that new simulations can be set up.
+    for tensor in tensors:
+        for name in list(tensor.__dict__.keys()):
+            if name.endswith('_sim'):
+                del tensor.__dict__[name]
+        tensor.__dict__['_sim_num'] = None
+
+    # The simulation matrices of the peak intensity store.
+    if hasattr(cdp, '_intensity_store'):
+        cdp._intensity_store.delete_sims()
+
+    # Remove the simulation set up.
+    del cdp.sim_number
+    del cdp.sim_state
+    if hasattr(cdp, 'sim_stream'):
+        del cdp.sim_stream
+
+
+def _randomise(data=None, error=None, error_red_chi2=None, distribution=None, fixed_error=None, sim_gauss=None):
+    """Randomise one Monte Carlo simulation data set.
+
+    @keyword data:              The original or back-calculated data.
+    @type data:                 list, numpy array or dict of float
+    @keyword error:             The errors of the data.
+    @type error:                list, numpy array or dict of float
+    @keyword error_red_chi2:    The errors from the reduced chi2 distribution, for the 'red_chi2' distribution.
+    @type error_red_chi2:       None or dict of float
+    @keyword distribution:      Which gauss distribution to draw errors from.  Can be: 'measured', 'red_chi2', 'fixed'.
+    @type distribution:         str
+    @keyword fixed_error:       If distribution is set to 'fixed', use this value as the standard deviation for the gauss distribution.
+    @type fixed_error:          float
+    @keyword sim_gauss:         The gauss(mu, sigma) function of the simulation.
+    @type sim_gauss:            function
+    @return:                    The randomised data, with None for missing data or errors.
+    @rtype:                     list or dict of float
+    """
+
+    # List type data.
+    if isinstance(data, list) or isinstance(data, ndarray):
+        random = []
+        for k in range(len(data)):
+            # No data or errors.
+            if data[k] == None or error[k] == None:
+                random.append(None)
+                continue
+
+            # Gaussian randomisation.
+            if distribution == 'fixed':
+                random.append(sim_gauss(data[k], float(fixed_error)))
+
+            else:
+                random.append(sim_gauss(data[k], error[k]))
+
+        # Return the data.
+        return random
+
+    # Dictionary type data.
+    random = {}
+    for id in data:
+        # No data or errors.
+        if data[id] == None or error[id] == None:
+            random[id] = None
+            continue
+
+        # If errors are drawn from the reduced chi2 distribution.
+        if distribution == 'red_chi2':
+            # Gaussian randomisation, centered at 0, with width of reduced chi2 distribution.
+            g_error = sim_gauss(0.0, error_red_chi2[id])
+
+            # We need to scale the gauss error, before adding to datapoint.
+            new_point = data[id] + g_error * error[id]
+
+        # If errors are drawn from fixed distribution.
+        elif distribution == 'fixed':
+            # Gaussian randomisation, centered at data point, with width of fixed error.
+            new_point = sim_gauss(data[id], float(fixed_error))
+
+        # If errors are drawn from measured values.
+        else:
+            # Gaussian randomisation, centered at data point, with width of measured error.
+            new_point = sim_gauss(data[id], error[id])
+
+        # Assign datapoint the new value.
+        random[id] = new_point
+
+    # Return the data.
+    return random
+
+
+def _sim_gauss(seed=None, data_num=None, sim_index=None):
+    """Return the Gaussian random number function for one simulation of one data set.
+
+    For reproducible sampling, each data set and simulation pair has its own random number generator seeded from the seed, the data set number and the simulation index.  The simulated data are therefore independent of the number of simulations, the order of data creation, and which simulations are created.
+
+
+    @keyword seed:      The random number seed.  If None, the unseeded global Python random number generator is used.
+    @type seed:         None or int
+    @keyword data_num:  The number of the data set, in the order of the specific analysis base_data_loop() method.
+    @type data_num:     int
+    @keyword sim_index: The Monte Carlo simulation index.
+    @type sim_index:    int
+    @return:            The gauss(mu, sigma) function.
+    @rtype:             function
+    """
+
+    # The global generator.
+    if seed == None:
+        return gauss
+
+    # The generator specific to the data set and simulation.
+    key = sha1(("%s:%s:%s" % (seed, data_num, sim_index)).encode()).hexdigest()
+    return Random(int(key, 16)).gauss
+
+
+class Sim_data_generator:
+    """Create the Monte Carlo simulation data of one data set on demand, for the streaming mode."""
+
+    def __init__(self, data_id=None):
+        """Set up the generator from the cdp.sim_stream structure.
+
+        @keyword data_id:   The data set identifier, as yielded by the specific analysis base_data_loop() method.
+        @type data_id:      str
+        """
+
+        # The data set, or None if there is no data.
+        self.data_num = None
+        if data_id in cdp.sim_stream['data']:
+            self.data_num, self.data, self.error, self.error_red_chi2 = cdp.sim_stream['data'][data_id]
+
+        # The randomisation settings.
+        self.distribution = cdp.sim_stream['distribution']
+        self.fixed_error = cdp.sim_stream['fixed_error']
+        self.seed = cdp.sim_stream['seed']
+
+
+    def create(self, sim_index=None):
+        """Create the data of one simulation.
+
+        This gives the same data as the monte_carlo_create_data() function for the same random number seed.
+
+
+        @keyword sim_index: The Monte Carlo simulation index.
+        @type sim_index:    int
+        @return:            The randomised data, or None if the data set has no data.
+        @rtype:             list or dict of float, or None
+        """
+
+        # No data.
+        if self.data_num == None:
+            return None
+
+        # The random number generator.
+        sim_gauss = _sim_gauss(seed=self.seed, data_num=self.data_num, sim_index=sim_index)
+
+        # Randomise the data.
+        return _randomise(data=self.data, error=self.error, error_red_chi2=self.error_red_chi2, distribution=self.distribution, fixed_error=self.fixed_error, sim_gauss=sim_gauss)
+
+
 def covariance_matrix(epsrel=0.0, verbosity=2):
     """Estimate model parameter errors via the covariance matrix technique.
 
@@ -73,15 +254,22 @@ def covariance_matrix(epsrel=0.0, verbosity=2):
             index = index + 1
 
 
-def monte_carlo_create_data(method=None, distribution=None, fixed_error=None):
+def monte_carlo_create_data(method=None, distribution=None, fixed_error=None, seed=None, streaming=False):
     """Function for creating simulation data.
 
+    In the streaming mode, no simulation data is created.  Instead the original or back-calculated data, the errors, and the random number seed of each data set are stored in cdp.sim_stream, so that each simulation data set can be created on demand during optimisation using the Sim_data_generator class.
+
+
     @keyword method:        The type of Monte Carlo simulation to perform.
     @type method:           str
     @keyword distribution:  Which gauss distribution to draw errors from. Can be: 'measured', 'red_chi2', 'fixed'.
     @type distribution:     str
     @keyword fixed_error:   If distribution is set to 'fixed', use this value as the standard deviation for the gauss distribution.
     @type fixed_error:      float
+    @keyword seed:          The random number seed for reproducible simulation data.  If None, the global Python random number generator is used, or for the streaming mode a seed is drawn from it.
+    @type seed:             None or int
+    @keyword streaming:     A flag which if True will cause the simulation data to be created on demand during optimisation and the simulation parameters to be accumulated as summary statistics, rather than stored.
+    @type streaming:        bool
     """
 
     # Test if the current data pipe exists.
@@ -112,8 +300,23 @@ def monte_carlo_create_data(method=None, distribution=None, fixed_error=None):
     # The specific analysis API object.
     api = return_api()
 
+    # The streaming mode set up, with a fixed seed so that the data of each simulation is the same whenever it is created.
+    if streaming:
+        api.sim_stream_check()
+        if seed == None:
+            seed = getrandbits(32)
+        cdp.sim_stream = {'distribution': distribution, 'fixed_error': fixed_error, 'seed': seed, 'data': {}}
+
+    # Remove any prior streaming set up.
+    elif hasattr(cdp, 'sim_stream'):
+        del cdp.sim_stream
+
     # Loop over the models.
+    data_num = -1
     for data_index in api.base_data_loop():
+        # Increment the data set number (prior to skipping, so that the random numbers of a data set do not depend on the presence of data in others).
+        data_num += 1
+
         # Create the Monte Carlo data.
         if method == 'back_calc':
             data = api.create_mc_data(data_index)
@@ -127,71 +330,32 @@ def monte_carlo_create_data(method=None, distribution=None, fixed_error=None):
             continue
 
         # Possible get the errors from reduced chi2 distribution.
+        error_red_chi2 = None
         if distribution == 'red_chi2':
             error_red_chi2 = api.return_error_red_chi2(data_index)
 
         # Get the errors.
         error = api.return_error(data_index)
 
-        # List type data.
-        if isinstance(data, list) or isinstance(data, ndarray):
-            # Loop over the Monte Carlo simulations.
-            random = []
-            for j in range(cdp.sim_number):
-                # Randomise the data.
-                random.append([])
-                for k in range(len(data)):
-                    # No data or errors.
-                    if data[k] == None or error[k] == None:
-                        random[j].append(None)
-                        continue
-
-                    # Gaussian randomisation.
-                    if distribution == 'fixed':
-                        random[j].append(gauss(data[k], float(fixed_error)))
-
-                    else:
-                        random[j].append(gauss(data[k], error[k]))
-
-        # Dictionary type data.
-        if isinstance(data, dict):
-            # Loop over the Monte Carlo simulations.
-            random = []
-            for j in range(cdp.sim_number):
-                # Randomise the data.
-                random.append({})
-                for id in data:
-                    # No data or errors.
-                    if data[id] == None or error[id] == None:
-                        random[j][id] = None
-                        continue
-
-                    # If errors are drawn from the reduced chi2 distribution.
-                    if distribution == 'red_chi2':
-                        # Gaussian randomisation, centered at 0, with width of reduced chi2 distribution.
-                        g_error = gauss(0.0, error_red_chi2[id])
-
-                        # We need to scale the gauss error, before adding to datapoint.
-                        new_point = data[id] + g_error * error[id]
-
-                    # If errors are drawn from fixed distribution.
-                    elif distribution == 'fixed':
-                        # Gaussian randomisation, centered at data point, with width of fixed error.
-                        new_point = gauss(data[id], float(fixed_error))
+        # Streaming, so only store what is needed to create the data on demand.
+        if streaming:
+            cdp.sim_stream['data'][data_index] = [data_num, data, error, error_red_chi2]
+            continue
 
-                    # If errors are drawn from measured values.
-                    else:
-                        # Gaussian randomisation, centered at data point, with width of measured error.
-                        new_point = gauss(data[id], error[id])
+        # Loop over the Monte Carlo simulations.
+        random = []
+        for j in range(cdp.sim_number):
+            # The random number generator.
+            sim_gauss = _sim_gauss(seed=seed, data_num=data_num, sim_index=j)
 
-                    # Assign datapoint the new value.
-                    random[j][id] = new_point
+            # Randomise the data.
+            random.append(_randomise(data=data, error=error, error_red_chi2=error_red_chi2, distribution=distribution, fixed_error=fixed_error, sim_gauss=sim_gauss))
 
         # Pack the simulation data.
         api.sim_pack_data(data_index, random)
 
 
-def monte_carlo_error_analysis():
+def monte_carlo_error_analysis(summary_only=False):
     """Function for calculating errors from the Monte Carlo simulations.
 
     The standard deviation formula used to calculate the errors is the square root of the
@@ -206,6 +370,12 @@ def monte_carlo_error_analysis():
         - n is the total number of simulations.
         - Xi is the parameter value for simulation i.
         - Xav is the mean parameter value for all simulations.
+
+    This is accumulated in a single pass over the stored simulation parameters using the online Welford algorithm.
+
+
+    @keyword summary_only:  A flag which if True will cause all simulation data and parameters to be deleted once the errors have been calculated, so that only the errors are kept.
+    @type summary_only:     bool
     """
 
     # Test if the current data pipe exists.
@@ -233,39 +403,58 @@ def monte_carlo_error_analysis():
             if param_array == None:
                 break
 
-            # Handle dictionary type parameters.
-            if isinstance(param_array[0], dict):
-                # Initialise the standard deviation structure as a dictionary.
-                sd = {}
+            # Handle the accumulators of the streaming mode.
+            if isinstance(param_array, statistics.Running_stats):
+                sd = None
+                if param_array.n:
+                    sd = param_array.std()
 
-                # Loop over each key.
+            # Handle dictionary type parameters.
+            elif isinstance(param_array[0], Mapping):
+                # Initialise one accumulator per key.
+                stats = {}
                 for key in param_array[0]:
-                    # Create a list of the values for the current key.
-                    data = []
-                    for i in range(len(param_array)):
-                        data.append(param_array[i][key])
+                    stats[key] = statistics.Running_stats()
 
-                    # Calculate and store the SD.
-                    sd[key] = statistics.std(values=data, skip=select_sim)
+                # Accumulate the values of all selected simulations.
+                for i in range(len(param_array)):
+                    if select_sim != None and not select_sim[i]:
+                        continue
+                    for key in stats:
+                        stats[key].add(param_array[i][key])
+
+                # The standard deviations.
+                sd = {}
+                for key in stats:
+                    sd[key] = stats[key].std()
 
             # Handle list type parameters.
             elif isinstance(param_array[0], list):
-                # Initialise the standard deviation structure as a list.
-                sd = []
-
-                # Loop over each element.
+                # Initialise one accumulator per element.
+                stats = []
                 for j in range(len(param_array[0])):
-                    # Create a list of the values for the current key.
-                    data = []
-                    for i in range(len(param_array)):
-                        data.append(param_array[i][j])
+                    stats.append(statistics.Running_stats())
 
-                    # Calculate and store the SD.
-                    sd.append(statistics.std(values=data, skip=select_sim))
+                # Accumulate the values of all selected simulations.
+                for i in range(len(param_array)):
+                    if select_sim != None and not select_sim[i]:
+                        continue
+                    for j in range(len(stats)):
+                        stats[j].add(param_array[i][j])
+
+                # The standard deviations.
+                sd = []
+                for j in range(len(stats)):
+                    sd.append(stats[j].std())
 
              # SD of simulation parameters with values (ie not None).
             elif param_array[0] != None:
-                sd = statistics.std(values=param_array, skip=select_sim)
+                stats = statistics.Running_stats()
+                for i in range(len(param_array)):
+                    if select_sim != None and not select_sim[i]:
+                        continue
+                    stats.add(param_array[i])
+                sd = stats.std()
 
             # Simulation parameters with the value None.
             else:
@@ -280,6 +469,10 @@ def monte_carlo_error_analysis():
     # Turn off the Monte Carlo simulation state, as the MC analysis is now finished.
     cdp.sim_state = False
 
+    # Only keep the errors.
+    if summary_only:
+        _delete_sims()
+
 
 def monte_carlo_initial_values():
     """Set the initial simulation parameter values."""
@@ -384,3 +577,53 @@ def monte_carlo_setup(number=None, all_select_sim=None):
 
     # Select all simulations.
     monte_carlo_select_all_sims(number=number, all_select_sim=all_select_sim)
+
+
+def sim_stream_add(container, values):
+    """Add the parameter values of one simulation to the streaming accumulators of the container.
+
+    @param container:   The data container holding the accumulators.
+    @type container:    data container instance
+    @param values:      The parameter names and values of the simulation.  Values of None are skipped.
+    @type values:       dict of float
+    """
+
+    # Loop over the parameters.
+    for name in values:
+        # No value.
+        if values[name] == None:
+            continue
+
+        # Catch the double counting of simulations.
+        stats = container._sim_stats[name]
+        if stats.n >= cdp.sim_number:
+            raise RelaxError("More than the %s Monte Carlo simulations have been accumulated for the parameter '%s'." % (cdp.sim_number, name))
+
+        # Accumulate.
+        stats.add(values[name])
+
+
+def sim_stream_init(container, names):
+    """Initialise the streaming accumulators of the simulation parameters of the container.
+
+    @param container:   The data container to hold the accumulators.
+    @type container:    data container instance
+    @param names:       The names of the parameters.
+    @type names:        list of str
+    """
+
+    # One accumulator per parameter, as a private structure which is not saved to the XML results file.
+    container._sim_stats = {}
+    for name in names:
+        container._sim_stats[name] = statistics.Running_stats()
+
+
+def sim_streaming():
+    """Determine if the Monte Carlo simulations are in the streaming mode.
+
+    @return:    True if the simulation data is created on demand and the simulation parameters are accumulated rather than stored.
+    @rtype:     bool
+    """
+
+    # Test the pipe.
+    return hasattr(cdp, 'sim_stream')
@@ -28,9 +28,10 @@ from numpy import float64, identity
 import sys
 
 # relax module imports.
-from lib.errors import RelaxError, RelaxIntListIntError, RelaxLenError
+from lib.errors import RelaxError, RelaxImplementError, RelaxIntListIntError, RelaxLenError
 from lib.float import isNaN
 from lib.io import write_data
+from lib.optimisation_cache import Optimisation_cache
 from multi import Processor_box
 from pipe_control.mol_res_spin import return_spin, spin_loop
 from pipe_control import pipes
@@ -86,6 +87,24 @@ def assemble_scaling_matrix(scaling=True):
     return scaling_matrix
 
 
+def cache(dir=None, warm_start=False):
+    """Activate or deactivate the persistent cache of optimisation results.
+
+    @keyword dir:           The directory in which the optimisation results are stored.  If None, the cache will be deactivated.
+    @type dir:              str or None
+    @keyword warm_start:    A flag which if True allows the cached results of structurally identical optimisation problems to be used as the starting position.
+    @type warm_start:       bool
+    """
+
+    # Deactivate the cache.
+    if dir == None:
+        status.opt_cache = None
+        return
+
+    # Activate the cache.
+    status.opt_cache = Optimisation_cache(dir=dir, warm_start=warm_start)
+
+
 def calc(verbosity=1):
     """Function for calculating the function value.
 
@@ -114,20 +133,30 @@ def calc(verbosity=1):
 
     # Monte Carlo simulation calculation.
     if hasattr(cdp, 'sim_state') and cdp.sim_state == 1:
-        # Loop over the simulations.
-        for i in range(cdp.sim_number):
-            # Status.
-            if status.current_analysis:
-                status.auto_analysis[status.current_analysis].mc_number = i
-            else:
-                status.mc_number = i
-
-            # Calculation.
-            api.calculate(verbosity=verbosity-1, sim_index=i, scaling_matrix=scaling_matrix)
+        # Calculate all simulations at once, if supported by the analysis.
+        try:
+            api.calculate_sims(verbosity=verbosity-1, scaling_matrix=scaling_matrix)
 
             # Print out.
-            if verbosity and not processor.is_queued():
-                print("Simulation " + repr(i+1))
+            if verbosity:
+                print("Simulations 1 to %s" % cdp.sim_number)
+
+        # Calculate each simulation separately.
+        except RelaxImplementError:
+            # Loop over the simulations.
+            for i in range(cdp.sim_number):
+                # Status.
+                if status.current_analysis:
+                    status.auto_analysis[status.current_analysis].mc_number = i
+                else:
+                    status.mc_number = i
+
+                # Calculation.
+                api.calculate(verbosity=verbosity-1, sim_index=i, scaling_matrix=scaling_matrix)
+
+                # Print out.
+                if verbosity and not processor.is_queued():
+                    print("Simulation " + repr(i+1))
 
         # Unset the status.
         if status.current_analysis:
@@ -26,11 +26,11 @@
 
 # Python module imports.
 from copy import deepcopy
-from numpy import float64, array, zeros
+from numpy import amax, amin, arange, array, float64, int64, minimum, nonzero, repeat, take, tile, transpose, where, zeros
 from time import asctime, localtime
 
 # relax module imports.
-from lib.errors import RelaxError
+from lib.errors import RelaxError, RelaxImplementError
 from lib.io import open_write_file, write_data
 from extern.numpy_future import percentile
 from lib.software.opendx.files import write_config, write_general, write_point, write_program
@@ -38,7 +38,7 @@ from pipe_control import value
 from specific_analyses.api import return_api
 
 
-def map(params=None, map_type='Iso3D', spin_id=None, inc=20, lower=None, upper=None, axis_incs=10, file_prefix="map", dir="dx", point=None, point_file="point", chi_surface=None, create_par_file=False):
+def map(params=None, map_type='Iso3D', spin_id=None, inc=20, lower=None, upper=None, axis_incs=10, file_prefix="map", dir="dx", point=None, point_file="point", chi_surface=None, create_par_file=False, coarse_inc=None):
     """Map the space corresponding to the spin identifier and create the OpenDX files.
 
     @keyword params:            The list of model parameters to map.
@@ -64,8 +64,12 @@ def map(params=None, map_type='Iso3D', spin_id=None, inc=20, lower=None, upper=N
     @type point:                None or list of float
     @keyword point_file:        The file prefix for the point output files.
     @type point_file:           str or None
+    @keyword chi_surface:       The chi2 values of the Innermost, Inner, Middle and Outer Isosurface.  If not supplied, these will be set to the 10, 20, 50 and 90 percentiles of the chi2 values.
+    @type chi_surface:          None or list of float
     @keyword create_par_file:   Whether to create a file with parameters and associated chi2 value.
     @type create_par_file:      bool
+    @keyword coarse_inc:        The number of increments of the coarse grid for the adaptive refinement mode.  If supplied, only the coarse grid cells spanning one of the isosurfaces will be mapped at the full resolution.
+    @type coarse_inc:           None or int
     """
 
     # Check the args.
@@ -73,6 +77,11 @@ def map(params=None, map_type='Iso3D', spin_id=None, inc=20, lower=None, upper=N
         raise RelaxError("The increment value needs to be greater than 1.")
     if axis_incs <= 1:
         raise RelaxError("The axis increment value needs to be greater than 1.")
+    if coarse_inc != None:
+        if coarse_inc < 1:
+            raise RelaxError("The coarse increment value needs to be greater than 0.")
+        if inc % coarse_inc:
+            raise RelaxError("The increment value of %i must be a multiple of the coarse increment value of %i." % (inc, coarse_inc))
 
     # Space type.
     if map_type.lower() == "iso3d":
@@ -80,7 +89,7 @@ def map(params=None, map_type='Iso3D', spin_id=None, inc=20, lower=None, upper=N
             raise RelaxError("The 3D isosurface map requires a 3 parameter model.")
 
         # Create the map.
-        Map(params, spin_id, inc, lower, upper, axis_incs, file_prefix, dir, point, point_file, chi_surface, create_par_file)
+        Map(params, spin_id, inc, lower, upper, axis_incs, file_prefix, dir, point, point_file, chi_surface, create_par_file, coarse_inc)
     else:
         raise RelaxError("The map type '" + map_type + "' is not supported.")
 
@@ -89,7 +98,7 @@ def map(params=None, map_type='Iso3D', spin_id=None, inc=20, lower=None, upper=N
 class Map:
     """The space mapping base class."""
 
-    def __init__(self, params, spin_id, inc, lower, upper, axis_incs, file_prefix, dir, point, point_file, chi_surface, create_par_file):
+    def __init__(self, params, spin_id, inc, lower, upper, axis_incs, file_prefix, dir, point, point_file, chi_surface, create_par_file, coarse_inc=None):
         """Map the space upon class instantiation."""
 
         # Initialise.
@@ -104,10 +113,16 @@ class Map:
         self.file_prefix = file_prefix
         self.dir = dir
         self.point_file = point_file
+        self.chi_surface = chi_surface
+        self.create_par_file = create_par_file
+        self.coarse_inc = coarse_inc
 
         # Define nested listed, which holds parameter values and chi2 value.
         self.par_chi2_vals = []
 
+        # Collect all chi2, to help finding a reasonable chi level for the Innermost, Inner, Middle and Outer Isosurface.
+        self.all_chi = []
+
         # The specific analysis API object.
         self.api = return_api()
 
@@ -181,16 +196,11 @@ class Map:
             self.create_par_chi2(file_prefix=self.point_file, par_chi2_vals=par_chi2_vals)
 
         # Default the chi2 surface values, for Innermost, Inner, Middle and Outer Isosurface.
-        if chi_surface == None:
-            all_chi2 = array(self.all_chi, float64)
-            innermost = percentile(all_chi2, 10)
-            inner = percentile(all_chi2, 20)
-            middle = percentile(all_chi2, 50)
-            outer = percentile(all_chi2, 90)
-            chi_surface = [innermost, inner, middle, outer]
+        if self.chi_surface is None:
+            self.chi_surface = self.default_chi_surface(self.all_chi)
 
         # Create the OpenDX .net program file.
-        write_program(file_prefix=self.file_prefix, point_file=self.point_file, dir=self.dir, inc=self.inc, N=self.n, num_points=self.num_points, labels=self.labels, tick_locations=self.tick_locations, tick_values=self.tick_values, date=self.date, chi_surface = chi_surface)
+        write_program(file_prefix=self.file_prefix, point_file=self.point_file, dir=self.dir, inc=self.inc, N=self.n, num_points=self.num_points, labels=self.labels, tick_locations=self.tick_locations, tick_values=self.tick_values, date=self.date, chi_surface = self.chi_surface)
 
         # Create the OpenDX .cfg program configuration file.
         write_config(file_prefix=self.file_prefix, dir=self.dir, date=self.date)
@@ -203,6 +213,46 @@ class Map:
             write_point(file_prefix=self.point_file, dir=self.dir, inc=self.inc, point=self.point, num_points=self.num_points, bounds=self.bounds, N=self.n)
 
 
+    def calc_chi2(self, points):
+        """Calculate the chi2 values for a batch of points.
+
+        @param points:  The parameter values of the points, one row per point.
+        @type points:   numpy rank-2 float64 array
+        @return:        The chi2 values of all points.
+        @rtype:         numpy rank-1 float64 array
+        """
+
+        # The target function set up once by the specific analysis.
+        if self.target_function != None:
+            return self.target_function(points)
+
+        # Initialise.
+        chi2 = zeros(len(points), float64)
+
+        # Loop over the points, using the full data pipe machinery.
+        for i in range(len(points)):
+            # Set the parameter values.
+            if self.spin_id:
+                value.set(val=points[i], param=self.params, spin_id=self.spin_id, verbosity=0, force=True)
+            else:
+                value.set(val=points[i], param=self.params, verbosity=0, force=True)
+
+            # Calculate the function values.
+            if self.spin_id:
+                self.api.calculate(spin_id=self.spin_id, verbosity=0)
+            else:
+                self.api.calculate(verbosity=0)
+
+            # Get the minimisation statistics for the model.
+            if self.spin_id:
+                k, n, chi2[i] = self.api.model_statistics(spin_id=self.spin_id)
+            else:
+                k, n, chi2[i] = self.api.model_statistics(model_info=0)
+
+        # Return the values.
+        return chi2
+
+
     def calc_point_par_chi2(self):
         """Function for chi2 value for the points."""
 
@@ -247,15 +297,34 @@ class Map:
         # Print out.
         print("\nCreating the map.")
 
+        # Fix the diffusion tensor.
+        unfix = False
+        if hasattr(cdp, 'diff_tensor') and not cdp.diff_tensor.fixed:
+            cdp.diff_tensor.fixed = True
+            unfix = True
+
+        # Set up the target function once, if supported by the analysis.
+        try:
+            self.target_function = self.api.map_target_function(params=self.params, spin_id=self.spin_id)
+        except RelaxImplementError:
+            self.target_function = None
+
         # Open the file.
         map_file = open_write_file(file_name=self.file_prefix, dir=self.dir, force=True)
 
         # Generate and write the text of the map.
-        self.map_3D_text(map_file)
+        if self.coarse_inc != None:
+            self.map_3D_adaptive(map_file)
+        else:
+            self.map_3D_text(map_file)
 
         # Close the file.
         map_file.close()
 
+        # Unfix the diffusion tensor.
+        if unfix:
+            cdp.diff_tensor.fixed = False
+
 
     def create_par_chi2(self, file_prefix, par_chi2_vals):
         """Function for creating file with parameters and the chi2 value."""
@@ -307,100 +376,168 @@ class Map:
         par_file.close()
 
 
+    def default_chi_surface(self, chi2):
+        """Determine the default chi2 surface values, for Innermost, Inner, Middle and Outer Isosurface.
+
+        @param chi2:    The chi2 values of the map.
+        @type chi2:     list of float or numpy rank-1 float64 array
+        @return:        The 10, 20, 50 and 90 percentiles of the chi2 values.
+        @rtype:         list of float
+        """
+
+        # The percentiles.
+        chi2 = array(chi2, float64)
+        innermost = percentile(chi2, 10)
+        inner = percentile(chi2, 20)
+        middle = percentile(chi2, 50)
+        outer = percentile(chi2, 90)
+
+        # Return the levels.
+        return [innermost, inner, middle, outer]
+
+
     def get_date(self):
         """Function for creating a date string."""
 
         self.date = asctime(localtime())
 
 
-    def map_3D_text(self, map_file):
-        """Function for creating the text of a 3D map."""
+    def grid_points(self, indices):
+        """Convert grid indices into parameter values.
+
+        @param indices: The grid indices of the points, one row per point.
+        @type indices:  numpy rank-2 int64 array
+        @return:        The parameter values of the points.
+        @rtype:         numpy rank-2 float64 array
+        """
+
+        return self.bounds[:, 0] + indices * self.step_size
+
+
+    def interpolate(self, coarse, stride):
+        """Trilinear interpolation of the coarse grid chi2 values onto the full grid.
+
+        @param coarse:  The chi2 values of the coarse grid.
+        @type coarse:   numpy rank-3 float64 array
+        @param stride:  The number of full grid increments per coarse grid increment.
+        @type stride:   int
+        @return:        The interpolated chi2 values of the full grid.
+        @rtype:         numpy rank-3 float64 array
+        """
+
+        # The coarse cell and fractional position within the cell for all full grid points along one dimension.
+        full = arange(self.inc + 1)
+        cell = minimum(full // stride, self.coarse_inc - 1)
+        frac = (full - cell * stride) / float(stride)
+
+        # Linear interpolation along each dimension in turn.
+        grid = coarse
+        for axis in range(3):
+            shape = [1, 1, 1]
+            shape[axis] = -1
+            weight = frac.reshape(shape)
+            grid = take(grid, cell, axis=axis) * (1.0 - weight) + take(grid, cell + 1, axis=axis) * weight
+
+        # Return the full grid.
+        return grid
+
+
+    def map_3D_adaptive(self, map_file):
+        """Function for creating the text of a 3D map using coarse-to-fine adaptive refinement.
+
+        The space is first mapped on the coarse grid.  Only the coarse cells for which the chi2 values at the corners span one of the isosurface levels are then mapped at full resolution, the chi2 values of all other points being interpolated from the coarse grid.
+        """
 
         # Initialise.
-        values = zeros(3, float64)
+        num = self.inc + 1
+        stride = self.inc // self.coarse_inc
+
+        # Map the coarse grid.
+        print("Mapping the coarse grid of %i points." % (self.coarse_inc + 1)**3)
+        indices = self.plane_indices(self.coarse_inc + 1)
+        coarse = []
+        for i in range(self.coarse_inc + 1):
+            indices[:, 0] = i
+            coarse.append(self.calc_chi2(self.grid_points(indices * stride)))
+        coarse = array(coarse, float64).reshape((self.coarse_inc + 1,)*3)
+
+        # Default the chi2 surface values using the coarse grid.
+        if self.chi_surface is None:
+            self.chi_surface = self.default_chi_surface(coarse[coarse <= 1e20])
+
+        # Interpolate the full grid.
+        chi2 = self.interpolate(coarse, stride)
+
+        # The range of chi2 values at the corners of each coarse cell.
+        corners = []
+        for a in range(2):
+            for b in range(2):
+                for c in range(2):
+                    corners.append(coarse[a:a+self.coarse_inc, b:b+self.coarse_inc, c:c+self.coarse_inc])
+        cell_min = amin(corners, axis=0)
+        cell_max = amax(corners, axis=0)
+
+        # The cells spanning an isosurface level.
+        cells = zeros(cell_min.shape, bool)
+        for level in self.chi_surface:
+            cells |= (cell_min <= level) & (cell_max >= level)
+
+        # The full grid points within these cells, skipping the coarse grid points.
+        mask = zeros((num, num, num), bool)
+        for a, b, c in transpose(nonzero(cells)):
+            mask[a*stride:(a+1)*stride+1, b*stride:(b+1)*stride+1, c*stride:(c+1)*stride+1] = True
+        mask[::stride, ::stride, ::stride] = False
+        refine = transpose(nonzero(mask))
+        print("Refining %i of the %i coarse grid cells, %i points." % (cells.sum(), cells.size, len(refine)))
+
+        # Map the points in batches.
+        batch = num**2
         percent = 0.0
-        percent_inc = 100.0 / (self.inc + 1.0)**(self.n - 1.0)
-        print("%-10s%8.3f%-1s" % ("Progress:", percent, "%"))
+        for i in range(0, len(refine), batch):
+            block = refine[i:i+batch]
+            values = self.calc_chi2(self.grid_points(block))
+            chi2[block[:, 0], block[:, 1], block[:, 2]] = values
 
-        # Collect all chi2, to help finding a reasobale chi level for the Innermost, Inner, Middle and Outer Isosurface.
-        all_chi = []
+            # Progress printout.
+            percent = 100.0 * (i + len(block)) / len(refine)
+            print("%-10s%8.3f%-8s%-8g" % ("Progress:", percent, "%,  " + repr(self.grid_points(block[-1])) + ",  f(x): ", values[-1]))
 
-        # Fix the diffusion tensor.
-        unfix = False
-        if hasattr(cdp, 'diff_tensor') and not cdp.diff_tensor.fixed:
-            cdp.diff_tensor.fixed = True
-            unfix = True
+        # Write out the map, one plane of the first parameter at a time.
+        indices = self.plane_indices(num)
+        for i in range(num):
+            indices[:, 0] = i
+            self.write_block(map_file, self.grid_points(indices), chi2[i].ravel())
 
-        # Initial value of the first parameter.
-        values[0] = self.bounds[0, 0]
 
-        # Define counter
-        counter = 0
+    def map_3D_text(self, map_file):
+        """Function for creating the text of a 3D map.
+
+        The points are evaluated and written in blocks, one plane of the first parameter at a time.
+        """
+
+        # Initialise.
+        num = self.inc + 1
+        percent = 0.0
+        percent_inc = 100.0 / num
+        print("%-10s%8.3f%-1s" % ("Progress:", percent, "%"))
+
+        # The grid indices of one plane.
+        indices = self.plane_indices(num)
 
         # Loop over the first parameter.
-        for i in range((self.inc + 1)):
-            # Initial value of the second parameter.
-            values[1] = self.bounds[1, 0]
-
-            # Loop over the second parameter.
-            for j in range((self.inc + 1)):
-                # Initial value of the third parameter.
-                values[2] = self.bounds[2, 0]
-
-                # Loop over the third parameter.
-                for k in range((self.inc + 1)):
-                    # Set the parameter values.
-                    if self.spin_id:
-                        value.set(val=values, param=self.params, spin_id=self.spin_id, verbosity=0, force=True)
-                    else:
-                        value.set(val=values, param=self.params, verbosity=0, force=True)
-
-                    # Calculate the function values.
-                    if self.spin_id:
-                        self.api.calculate(spin_id=self.spin_id, verbosity=0)
-                    else:
-                        self.api.calculate(verbosity=0)
-
-                    # Get the minimisation statistics for the model.
-                    if self.spin_id:
-                        k, n, chi2 = self.api.model_statistics(spin_id=self.spin_id)
-                    else:
-                        k, n, chi2 = self.api.model_statistics(model_info=0)
-
-                    # Set maximum value to 1e20 to stop the OpenDX server connection from breaking.
-                    if chi2 > 1e20:
-                        map_file.write("%30f\n" % 1e20)
-                    else:
-                        map_file.write("%30f\n" % chi2)
-
-                        # Save all values of chi2. To help find reasonale level for the Innermost, Inner, Middle and Outer Isosurface.
-                        all_chi.append(chi2)
-
-                    # Assign value to nested list.
-                    self.par_chi2_vals.append([counter, values[0], values[1], values[2], chi2])
-
-                    # Add to counter.
-                    counter += 1
-
-                    # Increment the value of the third parameter.
-                    values[2] = values[2] + self.step_size[2]
-
-                # Progress incrementation and printout.
-                percent = percent + percent_inc
-                print("%-10s%8.3f%-8s%-8g" % ("Progress:", percent, "%,  " + repr(values) + ",  f(x): ", chi2))
-
-                # Increment the value of the second parameter.
-                values[1] = values[1] + self.step_size[1]
-
-            # Increment the value of the first parameter.
-            values[0] = values[0] + self.step_size[0]
+        for i in range(num):
+            # The parameter values of the plane.
+            indices[:, 0] = i
+            points = self.grid_points(indices)
 
-        # Unfix the diffusion tensor.
-        if unfix:
-            cdp.diff_tensor.fixed = False
+            # Calculate and write the chi2 values.
+            chi2 = self.calc_chi2(points)
+            self.write_block(map_file, points, chi2)
+
+            # Progress incrementation and printout.
+            percent = percent + percent_inc
+            print("%-10s%8.3f%-8s%-8g" % ("Progress:", percent, "%,  " + repr(points[-1]) + ",  f(x): ", chi2[-1]))
 
-        # Save all chi2 values.
-        self.all_chi = all_chi
 
     def map_axes(self):
         """Function for creating labels, tick locations, and tick values for an OpenDX map."""
@@ -688,3 +825,46 @@ class Map:
 
         # Close the file.
         plot_file.close()
+
+
+    def plane_indices(self, num):
+        """Create the grid indices of one plane of the first parameter, in the order of the map file.
+
+        @param num: The number of points per dimension.
+        @type num:  int
+        @return:    The grid indices, with the first parameter index set to zero.
+        @rtype:     numpy rank-2 int64 array
+        """
+
+        # The second parameter is the slow and the third parameter the fast index.
+        indices = zeros((num**2, 3), int64)
+        indices[:, 1] = repeat(arange(num), num)
+        indices[:, 2] = tile(arange(num), num)
+
+        # Return the indices.
+        return indices
+
+
+    def write_block(self, map_file, points, chi2):
+        """Write a block of chi2 values to the map file and store the values.
+
+        @param map_file:    The file object for the map.
+        @type map_file:     file object
+        @param points:      The parameter values of the points, one row per point.
+        @type points:       numpy rank-2 float64 array
+        @param chi2:        The chi2 values of the points.
+        @type chi2:         numpy rank-1 float64 array
+        """
+
+        # Set maximum value to 1e20 to stop the OpenDX server connection from breaking.
+        capped = chi2 > 1e20
+        map_file.write("".join(["%30f\n" % val for val in where(capped, 1e20, chi2)]))
+
+        # Save all values of chi2. To help find reasonale level for the Innermost, Inner, Middle and Outer Isosurface.
+        self.all_chi += chi2[~capped].tolist()
+
+        # Assign values to the nested list.
+        if self.create_par_file:
+            counter = len(self.par_chi2_vals)
+            for i in range(len(points)):
+                self.par_chi2_vals.append([counter + i, points[i, 0], points[i, 1], points[i, 2], chi2[i]])
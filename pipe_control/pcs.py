@@ -26,9 +26,9 @@
 # Python module imports.
 from copy import deepcopy
 from math import ceil, floor, pi, sqrt
-from numpy import array, eye, float64, int32, ones, std, zeros
+from numpy import array, einsum, float64, int32, ones, std, zeros
 from numpy.linalg import norm
-from numpy.random import multivariate_normal
+from numpy.random import normal
 import sys
 from warnings import warn
 
@@ -1122,21 +1122,18 @@ def structural_noise(align_id=None, rmsd=0.2, sim_num=1000, file=None, dir=None,
     else:
         align_ids = cdp.align_ids
 
-    # Initialise some numpy data structures for use in the simulations.
+    # Initialise the Grace data structure.
     grace_data = []
-    unit_vect = zeros(3, float64)
-    pcs = {}
     for id in align_ids:
         grace_data.append([])
-        pcs[id] = zeros(sim_num, float64)
-
-    # Pre-calculate the covariance matrix as the spherical covariance.
-    cov = rmsd**2 * eye(3)
 
     # Print out.
     print("Executing %i simulations for each spin system." % sim_num)
 
-    # Loop over the spins.
+    # Collect the spins and their average positions.
+    spins = []
+    spin_ids = []
+    positions = []
     for spin, spin_id in spin_loop(return_id=True):
         # Deselected spins.
         if not spin.select:
@@ -1160,46 +1157,79 @@ def structural_noise(align_id=None, rmsd=0.2, sim_num=1000, file=None, dir=None,
                 pos += spin.pos[i]
             pos = pos / len(spin.pos)
 
-        # The original vector length (for the Grace plot).
-        orig_vect = pos - cdp.paramagnetic_centre
-        orig_r = norm(orig_vect)
-
-        # Sample from the multivariate normal distribution.
-        new_pos = multivariate_normal(pos, cov, sim_num)
-
-        # Loop over the N randomisations.
-        for i in range(sim_num):
-            # The vector and length.
-            vect = new_pos[i] - cdp.paramagnetic_centre
-            r = norm(vect)
-            vect = vect / r
-
-            # Loop over the alignments.
-            for id in align_ids:
-                # No PCS value, so skip.
-                if id not in spin.pcs:
-                    continue
+        # Store the data.
+        spins.append(spin)
+        spin_ids.append(spin_id)
+        positions.append(pos)
+    positions = array(positions, float64)
 
-                # Calculate the PCS constant.
-                dj = pcs_constant(cdp.temperature[id], cdp.spectrometer_frq[id] * 2.0 * pi / periodic_table.gyromagnetic_ratio('1H'), r/1e10)
+    # The alignment tensors and PCS constants (for a unit distance in meters) of all alignments with PCS data.
+    pcs_ids = []
+    tensors = []
+    pcs_consts = []
+    for id in align_ids:
+        for spin in spins:
+            if id in spin.pcs:
+                pcs_ids.append(id)
+                tensors.append(cdp.align_tensors[get_tensor_index(id)].A)
+                pcs_consts.append(pcs_constant(cdp.temperature[id], cdp.spectrometer_frq[id] * 2.0 * pi / periodic_table.gyromagnetic_ratio('1H'), 1.0))
+                break
+    tensors = array(tensors, float64)
+    pcs_consts = array(pcs_consts, float64)
+
+    # The PCS standard deviations for all alignments and spins.
+    sd = zeros((len(pcs_ids), len(spins)), float64)
+
+    # Loop over blocks of spins, limiting the simulation arrays to about 10^6 positions.
+    block_size = max(1, 1000000 // sim_num)
+    for start in range(0, len(spins), block_size):
+        # No PCS data.
+        if not len(pcs_ids):
+            break
+
+        # The spin positions of the block.
+        block = positions[start:start+block_size]
+
+        # Sample all randomised positions from the spherical multivariate normal distribution, with the dimensions {spin, simulation, coordinate}.
+        new_pos = normal(loc=block[:, None, :], scale=rmsd, size=(len(block), sim_num, 3))
+
+        # The unit vectors and distances (in meters).
+        vect = new_pos - cdp.paramagnetic_centre
+        r = norm(vect, axis=2)
+        unit_vect = vect / r[:, :, None]
+        r = r / 1e10
+
+        # The PCS values (in ppm) for all alignments, with the dimensions {alignment, spin, simulation}.
+        pcs = einsum('sni,aij,snj->asn', unit_vect, tensors, unit_vect)
+        pcs *= pcs_consts[:, None, None] / r**3 * 1e6
+
+        # The PCS standard deviations.
+        sd[:, start:start+block_size] = std(pcs, axis=2)
+
+    # Store the results.
+    for spin_index in range(len(spins)):
+        # Alias.
+        spin = spins[spin_index]
+        spin_id = spin_ids[spin_index]
 
-                # Calculate the PCS value (in ppm).
-                pcs[id][i] = pcs_tensor(dj, vect, cdp.align_tensors[get_tensor_index(id)].A) * 1e6
+        # The original vector length (for the Grace plot).
+        orig_r = norm(positions[spin_index] - cdp.paramagnetic_centre)
 
         # Initialise if necessary.
         if not hasattr(spin, 'pcs_struct_err'):
             spin.pcs_struct_err = {}
 
         # Loop over the alignments.
-        align_index = 0
-        for id in align_ids:
+        for align_index in range(len(align_ids)):
+            # Alias.
+            id = align_ids[align_index]
+
             # No PCS value, so skip.
             if id not in spin.pcs or spin.pcs[id] == None:
-                align_index += 1
                 continue
 
             # The PCS standard deviation.
-            sd = std(pcs[id])
+            spin_sd = sd[pcs_ids.index(id), spin_index]
 
             # Remove the previous error.
             if id in spin.pcs_struct_err:
@@ -1207,16 +1237,13 @@ def structural_noise(align_id=None, rmsd=0.2, sim_num=1000, file=None, dir=None,
                 spin.pcs_err[id] = sqrt(spin.pcs_err[id]**2 - spin.pcs_struct_err[id]**2)
 
             # Store the structural error.
-            spin.pcs_struct_err[id] = sd
+            spin.pcs_struct_err[id] = spin_sd
 
             # Add it to the PCS error (with variance addition).
-            spin.pcs_err[id] = sqrt(spin.pcs_err[id]**2 + sd**2)
+            spin.pcs_err[id] = sqrt(spin.pcs_err[id]**2 + spin_sd**2)
 
             # Store the data for the Grace plot.
-            grace_data[align_index].append([orig_r, sd, spin_id])
-
-            # Increment the alignment index.
-            align_index += 1
+            grace_data[align_index].append([orig_r, spin_sd, spin_id])
 
     # The Grace output.
     if file:
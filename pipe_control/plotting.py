@@ -29,6 +29,7 @@ The numerical graph data handled in these functions consists of a 4 dimensional
 from warnings import warn
 
 # relax module imports.
+from lib.compat import Mapping
 from lib.errors import RelaxError
 from lib.io import get_file_path, open_write_file
 from lib.plotting.api import write_xy_data, write_xy_header
@@ -652,7 +653,7 @@ def fetch_1D_data(plot_data=None, data_name=None, spin=None, res_num=None, sim_n
                 val[i] = val[i] / return_conversion_factor(data_name)
                 if err != None:
                     err[i] = err[i] / return_conversion_factor(data_name)
-        elif isinstance(val, dict):
+        elif isinstance(val, Mapping):
             for key in val:
                 val[key] = val[key] / return_conversion_factor(data_name)
                 if err != None:
@@ -23,8 +23,7 @@
 import dep_check
 
 # Python module imports.
-if dep_check.wx_module:
-    import wx
+import sys
 
 # relax module imports.
 from data_store import Relax_data_store; ds = Relax_data_store()
@@ -36,9 +35,10 @@ def reset():
     # Run the relax data storage object reset method.
     ds.__reset__()
 
-    # Clean up and reset the GUI.
-    if dep_check.wx_module:
+    # Clean up and reset the GUI (the wx module will only have been imported if the GUI is running).
+    if dep_check.wx_module and 'wx' in sys.modules:
         # The wx application.
+        import wx
         app = wx.GetApp()
 
         # Nothing to do.
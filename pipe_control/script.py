@@ -63,8 +63,9 @@ def script(file=None, dir=None):
     interpreter.populate_self()
     interpreter.on(verbose=False)
 
-    # Execute the script.
-    prompt.interpreter.run_script(local=interpreter._locals, script_file=file_path)
+    # Execute the script, coalescing the GUI notifications into one per observer.
+    with status.observers.batch(['pipe_alteration', 'result_file', 'system_cwd_path']):
+        prompt.interpreter.run_script(local=interpreter._locals, script_file=file_path)
 
     # Return the function intro flag to the original value.
     status.uf_intro = orig_intro_state
@@ -28,17 +28,17 @@
 
 # Python module imports.
 from math import sqrt
-from numpy import asarray
+from numpy import array, asarray, bool_, float64, full, nan, zeros
 import operator
 import sys
 from warnings import warn
 
 # relax module imports.
+from data_store.peak_intensity import Peak_intensity_store
 from lib.errors import RelaxError, RelaxImplementError, RelaxNoSpectraError
 from lib.io import sort_filenames, write_data
 from lib.text.sectioning import section, subsection
 from lib.spectrum.peak_list import read_peak_list
-from lib.statistics import std
 from lib.warnings import RelaxWarning, RelaxNoSpinWarning
 from pipe_control.mol_res_spin import check_mol_res_spin_data, create_spin, generate_spin_id_unique, return_spin, spin_loop
 from pipe_control.pipes import check_pipe
@@ -98,6 +98,26 @@ def __errors_repl(subset=None, verbosity=0):
         subset_flag = True
         subset = cdp.spectrum_ids
 
+    # The selected spins with intensity data, as rows of the peak intensity matrix store.
+    store = intensity_store()
+    spins = []
+    spin_ids = []
+    no_data = []
+    for spin, spin_id in spin_loop(return_id=True):
+        # Skip deselected spins.
+        if not spin.select:
+            continue
+
+        # Spins which have no data.
+        if not hasattr(spin, 'peak_intensity'):
+            no_data.append(spin)
+            continue
+
+        # Store the spin.
+        spins.append(spin)
+        spin_ids.append(spin_id)
+    rows = store.rows(spins, 'peak_intensity')
+
     # Loop over the spectra.
     for id in subset:
         # Skip non-replicated spectra.
@@ -121,50 +141,31 @@ def __errors_repl(subset=None, verbosity=0):
         if verbosity:
             print("%-20s%-20s" % ("Spin_ID", "SD"))
 
-        # Calculate the mean value.
-        count = 0
-        for spin, spin_id in spin_loop(return_id=True):
-            # Skip deselected spins.
-            if not spin.select:
-                continue
-
-            # Skip and deselect spins which have no data.
-            if not hasattr(spin, 'peak_intensity'):
-                spin.select = False
-                continue
-
-            # Missing data.
-            missing = False
-            for j in range(num_spectra):
-                if not spectra[j] in spin.peak_intensity:
-                    missing = True
-            if missing:
-                continue
-
-            # The peak intensities.
-            values = []
-            for j in range(num_spectra):
-                values.append(spin.peak_intensity[spectra[j]])
+        # Deselect spins which have no data.
+        for spin in no_data:
+            spin.select = False
 
-            # The standard deviation.
-            sd = std(values=values, dof=1)
-
-            # Printout.
-            if verbosity:
-                print("%-20s%-20s" % (spin_id, sd))
-
-            # Sum of variances (for average).
-            if not id in cdp.var_I:
-                cdp.var_I[id] = 0.0
-            cdp.var_I[id] = cdp.var_I[id] + sd**2
-            count = count + 1
+        # The peak intensity matrix of the replicated spectra, skipping spins with missing data.
+        values, mask = store.matrix('peak_intensity', rows, store.columns(spectra))
+        complete = mask.all(axis=1)
+        values = values[complete]
+        count = len(values)
 
         # No data catch.
         if not count:
             raise RelaxError("No data is present, unable to calculate errors from replicated spectra.")
 
+        # The standard deviation of each spin, as a reduction over the spectra.
+        sd = values.std(axis=1, ddof=1)
+
+        # Printout.
+        if verbosity:
+            complete_ids = [spin_ids[i] for i in range(len(spin_ids)) if complete[i]]
+            for i in range(count):
+                print("%-20s%-20s" % (complete_ids[i], sd[i]))
+
         # Average variance.
-        cdp.var_I[id] = cdp.var_I[id] / float(count)
+        cdp.var_I[id] = float((sd**2).sum()) / float(count)
 
         # Set all spectra variances.
         for j in range(num_spectra):
@@ -215,14 +216,20 @@ def __errors_repl(subset=None, verbosity=0):
         # Create the standard deviation data structure.
         cdp.sigma_I[id] = sqrt(cdp.var_I[id])
 
-    # Set the spin specific errors.
+    # The selected spins, replacing any prior errors.
+    spins = []
     for spin in spin_loop():
         # Skip deselected spins.
         if not spin.select:
             continue
 
-        # Set the error.
-        spin.peak_intensity_err = cdp.sigma_I
+        # Reset the errors.
+        spin.peak_intensity_err = {}
+        spins.append(spin)
+
+    # Set the spin specific errors as a single matrix update.
+    ids = list(cdp.sigma_I.keys())
+    store.set_matrix('peak_intensity_err', store.rows(spins, 'peak_intensity_err'), store.columns(ids), array([cdp.sigma_I[id] for id in ids], float64))
 
 
 def __errors_volume_no_repl(subset=None):
@@ -487,6 +494,21 @@ def get_ids():
     return cdp.spectrum_ids
 
 
+def intensity_store():
+    """Return the peak intensity matrix store of the current data pipe, creating it if needed.
+
+    @return:    The (spins x spectra) peak intensity matrix store.
+    @rtype:     data_store.peak_intensity.Peak_intensity_store instance
+    """
+
+    # Initialise the store.
+    if not hasattr(cdp, '_intensity_store'):
+        cdp._intensity_store = Peak_intensity_store()
+
+    # Return the store.
+    return cdp._intensity_store
+
+
 def integration_points(N=0, spectrum_id=None, spin_id=None):
     """Set the number of integration points for the given spectrum.
 
@@ -604,6 +626,10 @@ def read(file=None, dir=None, spectrum_id=None, dim=1, int_col=None, int_method=
     if not isinstance(file, list):
         file = [file]
 
+    # The peak intensity matrix store, and the spin ID to container look up table for this sequence.
+    store = intensity_store()
+    spin_lookup = {}
+
     # Loop over all files.
     for file_index in range(len(file)):
         # Read the peak list data.
@@ -613,9 +639,19 @@ def read(file=None, dir=None, spectrum_id=None, dim=1, int_col=None, int_method=
         if spectrum_id == 'auto':
             spectrum_id = peak_list[0].intensity_name
 
-        # Loop over the assignments.
-        data = []
-        data_flag = False
+        # The spectrum IDs of the intensity columns.
+        if flag_multi_file:
+            ids = [spectrum_id[file_index]]
+        elif flag_multi_col:
+            ids = spectrum_id
+        else:
+            ids = [spectrum_id]
+
+        # Loop over the assignments, resolving each spin once.
+        spins = []
+        spin_ids = []
+        values = full((len(peak_list), len(ids)), nan, float64)
+        mask = zeros((len(peak_list), len(ids)), bool_)
         for assign in peak_list:
             # Generate the spin_id.
             spin_id = generate_spin_id_unique(res_num=assign.res_nums[dim-1], spin_name=assign.spin_names[dim-1])
@@ -625,44 +661,64 @@ def read(file=None, dir=None, spectrum_id=None, dim=1, int_col=None, int_method=
             if not isinstance(intensity, list):
                 intensity = [intensity]
 
-            # Loop over the intensity data.
-            for int_index in range(len(intensity)):
-                # Sanity check.
-                if intensity[int_index] == 0.0:
+            # Sanity check.
+            if 0.0 in intensity:
+                for i in range(intensity.count(0.0)):
                     warn(RelaxWarning("A peak intensity of zero has been encountered for the spin '%s' - this could be fatal later on." % spin_id))
 
-                # Get the spin container.
-                spin = return_spin(spin_id=spin_id)
-                if not spin:
-                    warn(RelaxNoSpinWarning(spin_id))
-                    continue
+            # Get the spin container from the look up table.
+            if spin_id not in spin_lookup:
+                spin_lookup[spin_id] = return_spin(spin_id=spin_id)
+            spin = spin_lookup[spin_id]
+            if not spin:
+                warn(RelaxNoSpinWarning(spin_id))
+                continue
 
-                # Skip deselected spins.
-                if not spin.select:
-                    continue
+            # Skip deselected spins.
+            if not spin.select:
+                continue
 
-                # Initialise.
-                if not hasattr(spin, 'peak_intensity'):
-                    spin.peak_intensity = {}
+            # A single spectrum ID, so the last value is used.
+            if len(ids) == 1:
+                intensity = intensity[-1:]
 
-                # Intensity scaling.
-                if ncproc != None:
-                    intensity[int_index] = intensity[int_index] / float(2**ncproc)
+            # Store the row.
+            index = len(spins)
+            spins.append(spin)
+            spin_ids.append(spin_id)
+            values[index, :len(intensity)] = intensity[:len(ids)]
+            mask[index, :len(intensity)] = True
 
-                # Add the data.
-                if flag_multi_file:
-                    id = spectrum_id[file_index]
-                elif flag_multi_col:
-                    id = spectrum_id[int_index]
-                else:
-                    id = spectrum_id
-                spin.peak_intensity[id] = intensity[int_index]
+        # Truncate the matrices.
+        values = values[:len(spins)]
+        mask = mask[:len(spins)]
 
-                # Switch the flag.
-                data_flag = True
+        # Intensity scaling.
+        if ncproc != None:
+            values = values / float(2**ncproc)
 
-                # Append the data for printing out.
-                data.append([spin_id, repr(intensity[int_index])])
+        # The data for printing out.
+        data = []
+        if verbose:
+            for i, value in zip(mask.nonzero()[0].tolist(), values[mask].tolist()):
+                data.append([spin_ids[i], repr(value)])
+
+        # Merge duplicated spins, the last assignment taking precedence.
+        seen = {}
+        for i in range(len(spins)):
+            if id(spins[i]) in seen:
+                first = seen[id(spins[i])]
+                values[first][mask[i]] = values[i][mask[i]]
+                mask[first] |= mask[i]
+            else:
+                seen[id(spins[i])] = i
+        unique = list(seen.values())
+
+        # Assign the intensities of all spectra as a single matrix update.
+        data_flag = mask.any()
+        if data_flag:
+            spins = [spins[i] for i in unique]
+            store.set_matrix('peak_intensity', store.rows(spins, 'peak_intensity'), store.columns(ids), values[unique], mask=mask[unique])
 
         # Add the spectrum id (and ncproc) to the relax data store.
         spectrum_ids = spectrum_id
@@ -894,7 +950,9 @@ def signal_noise_ratio(verbose=True):
     if verbose:
         print("\nThe following signal to noise ratios has been calculated:\n")
 
-    # Set the spin specific signal to noise ratio.
+    # The selected spins with intensity data.
+    spins = []
+    spin_ids = []
     for spin, spin_id in spin_loop(return_id=True):
         # Skip deselected spins.
         if not spin.select:
@@ -908,26 +966,37 @@ def signal_noise_ratio(verbose=True):
         if not hasattr(spin, 'peak_intensity_err'):
             raise RelaxError("Intensity error analysis has not been performed.  Please see spectrum.error_analysis().")
 
-        # If necessary, create the dictionary.
-        if not hasattr(spin, 'sn_ratio'):
-            spin.sn_ratio = {}
+        # Store the spin.
+        spins.append(spin)
+        spin_ids.append(spin_id)
 
-        # Loop over the ID.
-        ids = []
-        for id in spin.peak_intensity:
-            # Append the ID to the list.
-            ids.append(id)
+    # The peak intensity and error matrices, as the rows are shared by all spin attributes.
+    store = intensity_store()
+    rows = store.rows(spins, 'peak_intensity')
+    store.rows(spins, 'peak_intensity_err')
+    store.rows(spins, 'sn_ratio')
+    cols = list(range(len(store.spectrum_ids)))
+    pint, mask = store.matrix('peak_intensity', rows, cols)
+    pint_err, err_mask = store.matrix('peak_intensity_err', rows, cols)
 
-            # Calculate the sn_ratio.
-            pint = float(spin.peak_intensity[id])
-            pint_err = float(spin.peak_intensity_err[id])
-            sn_ratio = pint / pint_err
+    # Missing errors.
+    for i in range(len(spins)):
+        if (mask[i] & ~err_mask[i]).any():
+            raise RelaxError("The peak intensity errors for spin '%s' are missing, please see spectrum.error_analysis()." % spin_ids[i])
 
-            # Assign the sn_ratio.
-            spin.sn_ratio[id] = sn_ratio
+    # The signal to noise ratio matrix.
+    sn_ratio = full(pint.shape, nan, float64)
+    sn_ratio[mask] = pint[mask] / pint_err[mask]
 
+    # Set the spin specific signal to noise ratios as a single matrix update.
+    store.set_matrix('sn_ratio', rows, cols, sn_ratio, mask=mask)
+
+    # Printout.
+    if not verbose:
+        return
+    for spin, spin_id in zip(spins, spin_ids):
         # Sort the ids alphanumeric.
-        ids = sort_filenames(filenames=ids, rev=False)
+        ids = sort_filenames(filenames=list(spin.peak_intensity.keys()), rev=False)
 
         # Collect the data under sorted ids.
         data_i = []
@@ -940,9 +1009,9 @@ def signal_noise_ratio(verbose=True):
             # Store the data.
             data_i.append([id, repr(pint), repr(pint_err), repr(sn_ratio)])
 
-        if verbose:
-            section(file=sys.stdout, text="Signal to noise ratio for spin ID '%s'"%spin_id, prespace=1)
-            write_data(out=sys.stdout, headings=["Spectrum ID", "Signal", "Noise", "S/N"], data=data_i)
+        # Write out.
+        section(file=sys.stdout, text="Signal to noise ratio for spin ID '%s'"%spin_id, prespace=1)
+        write_data(out=sys.stdout, headings=["Spectrum ID", "Signal", "Noise", "S/N"], data=data_i)
 
 
 def sn_ratio_deselection(ratio=10.0, operation='<', all_sn=False, select=False, verbose=True):
@@ -1014,8 +1083,9 @@ def sn_ratio_deselection(ratio=10.0, operation='<', all_sn=False, select=False,
     section(file=sys.stdout, text="Signal to noise ratio comparison selection", prespace=1, postspace=0)
     print("For the comparion test: S/N %s %1.1f"%(operation, ratio))
 
-    # Loop over the spins.
-    spin_ids = []
+    # The spins with signal to noise ratios.
+    spins = []
+    all_ids = []
     for spin, spin_id in spin_loop(return_id=True):
         # Skip spins missing sn_ratio.
         if not hasattr(spin, 'sn_ratio'):
@@ -1024,59 +1094,59 @@ def sn_ratio_deselection(ratio=10.0, operation='<', all_sn=False, select=False,
                 warn(RelaxWarning("Spin '%s' does not contain Signal to Noise calculations. Perform the user function 'spectrum.sn_ratio'. This spin is skipped." % spin_id))
             continue
 
-        # Loop over the ID, collect and sort.
-        ids = []
-        for id in spin.peak_intensity:
-            # Append the ID to the list.
-            ids.append(id)
+        # Store the spin.
+        spins.append(spin)
+        all_ids.append(spin_id)
 
-        # Sort the ids alphanumeric.
-        ids = sort_filenames(filenames=ids, rev=False)
-
-        # Loop over the sorted ids.
-        sn_val = []
-        for id in ids:
-            # Append the Signal to Noise in the list.
-            sn_val.append(spin.sn_ratio[id])
+    # The signal to noise ratio matrix, masked by the presence of peak intensity data.
+    store = intensity_store()
+    rows = store.rows(spins, 'sn_ratio')
+    store.rows(spins, 'peak_intensity')
+    cols = list(range(len(store.spectrum_ids)))
+    sn_val = store.matrix('sn_ratio', rows, cols)[0]
+    mask = store.matrix('peak_intensity', rows, cols)[1]
 
-        # Convert the list to array.
-        sn_val = asarray(sn_val)
+    # Make the comparison for the whole matrix.
+    test_arr = op(sn_val, ratio) & mask
 
-        # Make the comparison for the whole array.
-        test_arr = op(sn_val, ratio)
+    # Determine how the test should evaluate for each spin.
+    if all_sn:
+        tests = (test_arr | ~mask).all(axis=1)
+    else:
+        tests = test_arr.any(axis=1)
 
-        # Determine how the test should evaluate.
-        if all_sn:
-            test = test_arr.all()
-        else:
-            test = test_arr.any()
+    # Loop over the spins.
+    spin_ids = []
+    for i in range(len(spins)):
+        # print
+        if verbose:
+            # Sort the ids alphanumeric.
+            ids = sort_filenames(filenames=list(spins[i].peak_intensity.keys()), rev=False)
 
-        # Make an numpy array for the ids, an extract id which failed the test.
-        ids_arr = asarray(ids)
-        ids_test_arr = ids_arr[test_arr]
+            # Make an numpy array for the ids, an extract id which failed the test.
+            ids_arr = asarray(ids)
+            test_ids = asarray([test_arr[i, store.column(id)] for id in ids], bool)
+            ids_test_arr = ids_arr[test_ids]
 
-        # Make inversion of bool
-        test_arr_inv = test_arr == False
-        ids_test_arr_inv = ids_arr[test_arr_inv]
+            # Make inversion of bool
+            ids_test_arr_inv = ids_arr[test_ids == False]
 
-        # print
-        if verbose:
-            subsection(file=sys.stdout, text="Signal to noise ratio comparison for spin ID '%s'"%spin_id, prespace=1, postspace=0)
+            subsection(file=sys.stdout, text="Signal to noise ratio comparison for spin ID '%s'"%all_ids[i], prespace=1, postspace=0)
             print("Following spectra ID evaluated to True: %s"%ids_test_arr)
             print("Following spectra ID evaluated to False: %s"%ids_test_arr_inv)
-            print("'%s' comparisons have been used for evaluation, which evaluated to: %s"%(text_all_sn, test))
-            if test:
-                print("The spin ID '%s' is %s"%(spin_id, text_sel))
+            print("'%s' comparisons have been used for evaluation, which evaluated to: %s"%(text_all_sn, tests[i]))
+            if tests[i]:
+                print("The spin ID '%s' is %s"%(all_ids[i], text_sel))
             else:
-                print("The spin ID '%s' is skipped"%spin_id)
+                print("The spin ID '%s' is skipped"%all_ids[i])
 
         # If the test evaluates to True, then do selection action.
-        if test:
+        if tests[i]:
             # Select/Deselect the spin.
-            sel_func(spin_id=spin_id)
+            sel_func(spin_id=all_ids[i])
 
             # Assign spin_id to list, for printing.
-            spin_ids.append(spin_id)
+            spin_ids.append(all_ids[i])
 
     # Make summary
     if verbose:
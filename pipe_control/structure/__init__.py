@@ -37,6 +37,7 @@ independent of parser, writer, etc.
 
 __all__ = [
     'checks',
+    'distributed',
     'geometric',
     'main',
     'mass'
@@ -0,0 +1,316 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Module docstring.
+"""The distribution of the structural calculations over the slave processors of the multi-processor framework."""
+
+# Python module imports.
+from numpy import array, float64, zeros
+
+# relax module imports.
+from lib.sequence_alignment.msa import pairwise_alignments as pairwise_alignments_serial
+from lib.structure.statistics import fluctuation_matrix as fluctuation_matrix_serial, fluctuation_tile, fluctuation_tiles, store_fluctuation_tile
+from multi import Memo, Processor_box, Result_command, Slave_command
+
+
+def fluctuation_matrix(coord, measure='distance', tile_size=None):
+    """Calculate the matrix of pairwise interatomic fluctuations, distributing the tiles over the slave processors.
+
+    The tiles of lib.structure.statistics.fluctuation_tiles() are queued as Fluctuation_command objects.  If no processor has been set up, the matrix will be calculated serially by lib.structure.statistics.fluctuation_matrix().
+
+
+    @param coord:       The array of molecular coordinates.  The first dimension corresponds to the model, the second the atom, the third the coordinate.
+    @type coord:        rank-3 numpy array
+    @keyword measure:   The type of fluctuation to measure.  This can be either 'distance', 'angle', or 'parallax shift'.
+    @type measure:      str
+    @keyword tile_size: The number of atoms per side of the tiles.  If not set, this will be chosen so that the memory usage of a single tile is bounded.
+    @type tile_size:    None or int
+    @return:            The matrix of the corrected sample standard deviations of the fluctuations.
+    @rtype:             numpy rank-2 float64 array
+    """
+
+    # Get the Processor box singleton (it contains the Processor instance) and alias the Processor.
+    processor = getattr(Processor_box(), 'processor', None)
+
+    # No processor, so calculate the tiles serially.
+    if processor == None:
+        return fluctuation_matrix_serial(coord, measure=measure, tile_size=tile_size)
+
+    # The tiles.
+    coord = array(coord, float64)
+    tiles = fluctuation_tiles(coord, measure=measure, tile_size=tile_size)
+
+    # Queue the tiles.
+    memo = Fluctuation_memo(matrix=zeros((coord.shape[1], coord.shape[1]), float64))
+    for tile in tiles:
+        processor.add_to_queue(Fluctuation_command(coord, tile=tile, measure=measure), memo)
+
+    # Execute the queued calculations.
+    processor.run_queue()
+
+    # Return the matrix.
+    return memo.matrix
+
+
+def pairwise_alignments(sequences, pairs=None, **settings):
+    """Perform the pairwise alignment of the given sequence pairs, distributed over the slave processors.
+
+    The pairs are split into blocks which are queued as Pairwise_align_command objects.  If no processor has been set up, the alignments will be performed serially by lib.sequence_alignment.msa.pairwise_alignments().
+
+
+    @param sequences:   The list of residue sequences as one letter codes.
+    @type sequences:    list of str
+    @keyword pairs:     The list of sequence index pairs to align.
+    @type pairs:        list of list of int
+    @keyword settings:  The remaining keyword arguments of lib.sequence_alignment.msa.pairwise_alignments().
+    @type settings:     dict
+    @return:            The alignment score and the two alignment strings for each pair.
+    @rtype:             list of [float, str, str]
+    """
+
+    # Get the Processor box singleton (it contains the Processor instance) and alias the Processor.
+    processor = getattr(Processor_box(), 'processor', None)
+
+    # No processor, so perform the alignments serially.
+    if processor == None:
+        return pairwise_alignments_serial(sequences, pairs=pairs, **settings)
+
+    # Split the pairs into blocks, a few per slave for load balancing.
+    num_blocks = min(len(pairs), 4 * processor.processor_size())
+    memo = Pairwise_align_memo(num_pairs=len(pairs))
+    for block in range(num_blocks):
+        indices = list(range(block, len(pairs), num_blocks))
+        command = Pairwise_align_command(sequences, pairs=[pairs[index] for index in indices], indices=indices, settings=settings)
+        processor.add_to_queue(command, memo)
+
+    # Execute the queued alignments.
+    processor.run_queue()
+
+    # Return the results.
+    return memo.results
+
+
+
+class Fluctuation_memo(Memo):
+    """The interatomic fluctuation memo class, storing the matrix on the master."""
+
+    def __init__(self, matrix=None):
+        """Set up the interatomic fluctuation memo class.
+
+        @keyword matrix:    The matrix of fluctuations to fill.
+        @type matrix:       numpy rank-2 float64 array
+        """
+
+        # Execute the base class __init__() method.
+        super(Fluctuation_memo, self).__init__()
+
+        # The results storage.
+        self.matrix = matrix
+
+
+
+class Fluctuation_command(Slave_command):
+    """Command class for calculating the interatomic fluctuations of a tile on the slave processor."""
+
+    def __init__(self, coord, tile=None, measure=None):
+        """Store all the master data to be sent to the slave processor.
+
+        @param coord:       The array of molecular coordinates.  The first dimension corresponds to the model, the second the atom, the third the coordinate.
+        @type coord:        rank-3 numpy array
+        @keyword tile:      The tile boundaries, as the start and end atom indices of the first and then second atoms.
+        @type tile:         list of int
+        @keyword measure:   The type of fluctuation to measure.
+        @type measure:      str
+        """
+
+        # Execute the base class __init__() method.
+        super(Fluctuation_command, self).__init__()
+
+        # Store only the coordinates required for this tile.
+        self.coord_i = coord[:, tile[0]:tile[1]].copy()
+        self.coord_j = coord[:, tile[2]:tile[3]].copy()
+
+        # Store the remaining arguments.
+        self.tile = tile
+        self.measure = measure
+
+
+    def run(self, processor, completed):
+        """Calculate the fluctuations of the tile.
+
+        @param processor:   The slave processor the command is running on.
+        @type processor:    Processor instance
+        @param completed:   The flag used in batching result returns.
+        @type completed:    bool
+        """
+
+        # The calculation.
+        values = fluctuation_tile(self.coord_i, self.coord_j, measure=self.measure)
+
+        # Send the results back to the master.
+        processor.return_object(Fluctuation_result_command(processor=processor, memo_id=self.memo_id, tile=self.tile, values=values, completed=completed))
+
+
+
+class Fluctuation_result_command(Result_command):
+    """Class for returning the interatomic fluctuations of a tile to the master."""
+
+    def __init__(self, processor=None, memo_id=None, tile=None, values=None, completed=True):
+        """Set up this class object on the slave, placing the tile results here.
+
+        @keyword processor: The processor object.
+        @type processor:    multi.processor.Processor instance
+        @keyword memo_id:   The memo identification string.
+        @type memo_id:      str
+        @keyword tile:      The tile boundaries, as the start and end atom indices of the first and then second atoms.
+        @type tile:         list of int
+        @keyword values:    The fluctuations of the tile.
+        @type values:       numpy rank-2 float64 array
+        @keyword completed: A flag which if True signals that the calculation successfully completed.
+        @type completed:    bool
+        """
+
+        # Execute the base class __init__() method.
+        super(Fluctuation_result_command, self).__init__(processor=processor, completed=completed, memo_id=memo_id)
+
+        # Store the arguments.
+        self.tile = tile
+        self.values = values
+
+
+    def run(self, processor=None, memo=None):
+        """Store the tile in the fluctuation matrix of the memo on the master.
+
+        @param processor:   Unused!
+        @type processor:    None
+        @param memo:        The interatomic fluctuation memo.
+        @type memo:         Fluctuation_memo instance
+        """
+
+        # Store the results.
+        store_fluctuation_tile(memo.matrix, self.tile, self.values)
+
+
+
+class Pairwise_align_memo(Memo):
+    """The pairwise alignment memo class, storing the results on the master."""
+
+    def __init__(self, num_pairs=None):
+        """Set up the pairwise alignment memo class.
+
+        @keyword num_pairs: The total number of sequence pairs.
+        @type num_pairs:    int
+        """
+
+        # Execute the base class __init__() method.
+        super(Pairwise_align_memo, self).__init__()
+
+        # The results storage.
+        self.results = [None] * num_pairs
+
+
+
+class Pairwise_align_command(Slave_command):
+    """Command class for the pairwise alignment of a block of sequence pairs on the slave processor."""
+
+    def __init__(self, sequences, pairs=None, indices=None, settings=None):
+        """Store all the master data to be sent to the slave processor.
+
+        @param sequences:   The list of residue sequences as one letter codes.
+        @type sequences:    list of str
+        @keyword pairs:     The block of sequence index pairs to align.
+        @type pairs:        list of list of int
+        @keyword indices:   The indices of the pairs in the full list of pairs.
+        @type indices:      list of int
+        @keyword settings:  The keyword arguments for the pairwise_alignments() function.
+        @type settings:     dict
+        """
+
+        # Execute the base class __init__() method.
+        super(Pairwise_align_command, self).__init__()
+
+        # Store only the sequences required for this block.
+        self.sequences = {}
+        for i, j in pairs:
+            self.sequences[i] = sequences[i]
+            self.sequences[j] = sequences[j]
+
+        # Store the remaining arguments.
+        self.pairs = pairs
+        self.indices = indices
+        self.settings = settings
+
+
+    def run(self, processor, completed):
+        """Align all sequence pairs of the block.
+
+        @param processor:   The slave processor the command is running on.
+        @type processor:    Processor instance
+        @param completed:   The flag used in batching result returns.
+        @type completed:    bool
+        """
+
+        # The alignments.
+        results = pairwise_alignments_serial(self.sequences, pairs=self.pairs, **self.settings)
+
+        # Send the results back to the master.
+        processor.return_object(Pairwise_align_result_command(processor=processor, memo_id=self.memo_id, indices=self.indices, results=results, completed=completed))
+
+
+
+class Pairwise_align_result_command(Result_command):
+    """Class for returning the pairwise alignments to the master."""
+
+    def __init__(self, processor=None, memo_id=None, indices=None, results=None, completed=True):
+        """Set up this class object on the slave, placing the alignment results here.
+
+        @keyword processor: The processor object.
+        @type processor:    multi.processor.Processor instance
+        @keyword memo_id:   The memo identification string.
+        @type memo_id:      str
+        @keyword indices:   The indices of the pairs in the full list of pairs.
+        @type indices:      list of int
+        @keyword results:   The alignment score and the two alignment strings for each pair.
+        @type results:      list of [float, str, str]
+        @keyword completed: A flag which if True signals that the alignments successfully completed.
+        @type completed:    bool
+        """
+
+        # Execute the base class __init__() method.
+        super(Pairwise_align_result_command, self).__init__(processor=processor, completed=completed, memo_id=memo_id)
+
+        # Store the arguments.
+        self.indices = indices
+        self.results = results
+
+
+    def run(self, processor=None, memo=None):
+        """Store the alignments in the memo on the master.
+
+        @param processor:   Unused!
+        @type processor:    None
+        @param memo:        The pairwise alignment memo.
+        @type memo:         Pairwise_align_memo instance
+        """
+
+        # Store the results.
+        for k in range(len(self.indices)):
+            memo.results[self.indices[k]] = self.results[k]
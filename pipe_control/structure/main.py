@@ -24,7 +24,7 @@
 
 # Python module imports.
 from minfx.generic import generic_minimise
-from numpy import array, average, concatenate, dot, float64, mean, ones, std, zeros
+from numpy import array, concatenate, float64, mean, ones, zeros
 from numpy.linalg import norm
 from os import F_OK, access, getcwd
 from re import search
@@ -36,7 +36,6 @@ from data_store import Relax_data_store; ds = Relax_data_store()
 from data_store.seq_align import Sequence_alignments
 from lib.check_types import is_float
 from lib.errors import RelaxError, RelaxFileError
-from lib.geometry.vectors import vector_angle_atan2
 from lib.io import get_file_path, open_write_file, write_data
 from lib.plotting.api import correlation_matrix, write_xy_data, write_xy_header
 from lib.selection import tokenise
@@ -55,6 +54,7 @@ from pipe_control.interatomic import interatomic_loop
 from pipe_control.mol_res_spin import check_mol_res_spin_data, create_spin, generate_spin_id_unique, linear_ave, return_spin, spin_loop
 from pipe_control.pipes import cdp_name, check_pipe, get_pipe
 from pipe_control.structure.checks import check_structure
+from pipe_control.structure.distributed import fluctuation_matrix, pairwise_alignments
 from pipe_control.structure.mass import pipe_centre_of_mass
 from status import Status; status = Status()
 from target_functions.ens_pivot_finder import Pivot_finder
@@ -345,86 +345,8 @@ def atomic_fluctuations(pipes=None, models=None, molecules=None, atom_id=None, m
     for i in range(n):
         labels.append(generate_spin_id_unique(mol_name=mol_names[i], res_num=res_nums[i], res_name=res_names[i], spin_name=atom_names[i]))
 
-    # Initialise the SD matrix and other structures.
-    matrix = zeros((n, n), float64)
-    dist = zeros(m, float64)
-    vectors = zeros((m, 3), float64)
-    parallax_vectors = zeros((m, 3), float64)
-    angles = zeros(m, float64)
-
-    # Generate the pairwise distance SD matrix.
-    if measure == 'distance':
-        for i in range(n):
-            for j in range(n):
-                # Only calculate the upper triangle to avoid duplicate calculations.
-                if j > i:
-                    continue
-
-                # The interatomic distances between each structure.
-                for k in range(m):
-                    dist[k] = norm(coord[k, i] - coord[k, j])
-
-                # Calculate and store the corrected sample standard deviation.
-                matrix[i, j] = matrix[j, i] = std(dist, ddof=1)
-
-    # Generate the pairwise angle SD matrix.
-    elif measure == 'angle':
-        # Loop over the atom pairs.
-        for i in range(n):
-            for j in range(n):
-                # Only calculate the upper triangle to avoid duplicate calculations.
-                if j > i:
-                    continue
-
-                # The interatomic vectors between each structure.
-                for k in range(m):
-                    vectors[k] = coord[k, i] - coord[k, j]
-
-                # The average vector.
-                ave_vect = average(vectors, axis=0)
-
-                # The intervector angles.
-                for k in range(m):
-                    angles[k] = vector_angle_atan2(ave_vect, vectors[k])
-
-                # Calculate and store the corrected sample standard deviation.
-                matrix[i, j] = matrix[j, i] = std(angles, ddof=1)
-
-    # Generate the pairwise parallax shift SD matrix.
-    elif measure == 'parallax shift':
-        # Loop over the atom pairs.
-        for i in range(n):
-            for j in range(n):
-                # Only calculate the upper triangle to avoid duplicate calculations.
-                if j > i:
-                    continue
-
-                # The interatomic vectors between each structure.
-                for k in range(m):
-                    vectors[k] = coord[k, i] - coord[k, j]
-
-                # The average vector.
-                ave_vect = average(vectors, axis=0)
-
-                # Catch the zero vector.
-                length = norm(ave_vect)
-                if length == 0.0:
-                    matrix[i, j] = matrix[j, i] = 0.0
-                    continue
-
-                # The unit average vector.
-                unit = ave_vect / length
-
-                # The parallax shift.
-                for k in range(m):
-                    # The projection onto the average vector.
-                    proj = dot(vectors[k], unit) * unit
-
-                    # The distance shift.
-                    dist[k] = norm(vectors[k] - proj)
-
-                # Calculate and store the corrected sample standard deviation.
-                matrix[i, j] = matrix[j, i] = std(dist, ddof=1)
+    # Calculate the SD matrix.
+    matrix = fluctuation_matrix(coord, measure=measure)
 
     # Call the plotting API.
     correlation_matrix(format=format, matrix=matrix, labels=labels, file=file, dir=dir, force=force)
@@ -1503,7 +1425,7 @@ def sequence_alignment(pipes=None, models=None, molecules=None, msa_algorithm='C
             res_num_list[mol_index].append(res_nums[mol_index][i][key])
 
     # MSA.
-    strings, gaps = msa_general(one_letter_codes, residue_numbers=res_num_list, msa_algorithm=msa_algorithm, pairwise_algorithm=pairwise_algorithm, matrix=matrix, gap_open_penalty=gap_open_penalty, gap_extend_penalty=gap_extend_penalty, end_gap_open_penalty=end_gap_open_penalty, end_gap_extend_penalty=end_gap_extend_penalty)
+    strings, gaps = msa_general(one_letter_codes, residue_numbers=res_num_list, msa_algorithm=msa_algorithm, pairwise_algorithm=pairwise_algorithm, matrix=matrix, gap_open_penalty=gap_open_penalty, gap_extend_penalty=gap_extend_penalty, end_gap_open_penalty=end_gap_open_penalty, end_gap_extend_penalty=end_gap_extend_penalty, pairwise_func=pairwise_alignments)
 
     # Set up the data store object.
     if not hasattr(ds, 'sequence_alignments'):
@@ -1578,25 +1500,27 @@ def structure_loop(pipes=None, molecules=None, models=None, atom_id=None):
         yield pipe_index, model_num, mol_name
 
 
-def superimpose(pipes=None, models=None, molecules=None, atom_id=None, displace_id=None, method='fit to mean', centre_type="centroid", centroid=None):
+def superimpose(pipes=None, models=None, molecules=None, atom_id=None, displace_id=None, method='fit to mean', centre_type="centroid", centroid=None, outlier_cutoff=None):
     """Superimpose a set of structures.
 
-    @keyword pipes:         The data pipes to include in the alignment and superimposition.
-    @type pipes:            None or list of str
-    @keyword models:        The list of models to for each data pipe superimpose.  The number of elements must match the pipes argument.  If set to None, then all models will be used.
-    @type models:           list of lists of int or None
-    @keyword molecules:     The molecule names to include in the alignment and superimposition.  The number of elements must match the pipes argument.
-    @type molecules:        None or list of str
-    @keyword atom_id:       The molecule, residue, and atom identifier string.  This matches the spin ID string format.
-    @type atom_id:          str or None
-    @keyword displace_id:   The atom ID string for restricting the displacement to a subset of all atoms.  If not set, then all atoms will be translated and rotated.  This can be a list of atom IDs with each element corresponding to one of the structures.
-    @type displace_id:      None, str, or list of str
-    @keyword method:        The superimposition method.  It must be one of 'fit to mean' or 'fit to first'.
-    @type method:           str
-    @keyword centre_type:   The type of centre to superimpose over.  This can either be the standard centroid superimposition or the CoM could be used instead.
-    @type centre_type:      str
-    @keyword centroid:      An alternative position of the centroid to allow for different superpositions, for example of pivot point motions.
-    @type centroid:         list of float or numpy rank-1, 3D array
+    @keyword pipes:           The data pipes to include in the alignment and superimposition.
+    @type pipes:              None or list of str
+    @keyword models:          The list of models to for each data pipe superimpose.  The number of elements must match the pipes argument.  If set to None, then all models will be used.
+    @type models:             list of lists of int or None
+    @keyword molecules:       The molecule names to include in the alignment and superimposition.  The number of elements must match the pipes argument.
+    @type molecules:          None or list of str
+    @keyword atom_id:         The molecule, residue, and atom identifier string.  This matches the spin ID string format.
+    @type atom_id:            str or None
+    @keyword displace_id:     The atom ID string for restricting the displacement to a subset of all atoms.  If not set, then all atoms will be translated and rotated.  This can be a list of atom IDs with each element corresponding to one of the structures.
+    @type displace_id:        None, str, or list of str
+    @keyword method:          The superimposition method.  It must be one of 'fit to mean' or 'fit to first'.
+    @type method:             str
+    @keyword centre_type:     The type of centre to superimpose over.  This can either be the standard centroid superimposition or the CoM could be used instead.
+    @type centre_type:        str
+    @keyword centroid:        An alternative position of the centroid to allow for different superpositions, for example of pivot point motions.
+    @type centroid:           list of float or numpy rank-1, 3D array
+    @keyword outlier_cutoff:  The per-atom RMSD to the mean structure above which atoms are rejected from the 'fit to mean' superimposition.
+    @type outlier_cutoff:     None or float
     """
 
     # Check the method.
@@ -1622,12 +1546,13 @@ def superimpose(pipes=None, models=None, molecules=None, atom_id=None, displace_
 
     # The different algorithms.
     if method == 'fit to mean':
-        T, R, pivot = fit_to_mean(models=list(range(len(ids))), coord=coord, centre_type=centre_type, elements=elements, centroid=centroid)
+        T, R, pivot = fit_to_mean(models=list(range(len(ids))), coord=coord, centre_type=centre_type, elements=elements, centroid=centroid, outlier_cutoff=outlier_cutoff)
     elif method == 'fit to first':
         T, R, pivot = fit_to_first(models=list(range(len(ids))), coord=coord, centre_type=centre_type, elements=elements, centroid=centroid)
 
     # Loop over all pipes, models, and molecules.
     i = 0
+    selections = {}
     for pipe_index, model_num, mol_name in structure_loop(pipes=pipes, models=models, molecules=molecules, atom_id=atom_id):
         # Skip the first structure if not moved.
         if i == 0 and method == 'fit to first':
@@ -1653,11 +1578,25 @@ def superimpose(pipes=None, models=None, molecules=None, atom_id=None, displace_
             else:
                 id = '#%s%s' % (mol_name, curr_displace_id)
 
+        # The selection object, created only once for each data pipe and displacement ID.
+        dp = get_pipe(pipes[pipe_index])
+        if (pipe_index, id) not in selections:
+            selections[pipe_index, id] = dp.structure.selection(atom_id=id)
+        selection = selections[pipe_index, id]
+
         # Translate the molecule first (the rotational pivot is defined in the first model).
-        translate(T=T[i], model=model_num, pipe_name=pipes[pipe_index], atom_id=id)
+        dp.structure.translate(T=array(T[i], float64), model=model_num, selection=selection)
+        if model_num != None:
+            print("Translated %i atoms of model %i." % (selection.count_atoms(), model_num))
+        else:
+            print("Translated %i atoms of all models." % selection.count_atoms())
 
         # Rotate the molecule.
-        rotate(R=R[i], origin=pivot[i], model=model_num, pipe_name=pipes[pipe_index], atom_id=id)
+        dp.structure.rotate(R=array(R[i], float64), origin=array(pivot[i], float64), model=model_num, selection=selection)
+        if model_num != None:
+            print("Rotated %i atoms of model %i." % (selection.count_atoms(), model_num))
+        else:
+            print("Rotated %i atoms of all models." % selection.count_atoms())
 
         # Increment the index.
         i += 1
@@ -30,6 +30,7 @@ import sys
 
 # relax module imports.
 from lib.check_types import is_num
+from lib.compat import Mapping
 from lib.errors import RelaxError, RelaxNoSequenceError, RelaxParamSetError, RelaxValueError
 from lib.io import get_file_path, open_write_file
 from lib.sequence import read_spin_data, write_spin_data
@@ -544,7 +545,7 @@ def write_data(param=None, file=None, scaling=1.0, bc=False, return_value=None,
         value, error = return_value(spin, param, bc=bc)
 
         # Dictionary type data.
-        if isinstance(value, dict):
+        if isinstance(value, Mapping):
             # Sanity check.
             if not data_type in [None, 'dict']:
                 raise RelaxError("Mixed data types.")
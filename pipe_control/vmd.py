@@ -38,6 +38,9 @@ def view():
     if not hasattr(cdp, 'structure'):
         raise RelaxNoPdbError
 
+    # Import the module on first use.
+    from Scientific.Visualization import VMD
+
     # Create an empty scene.
     cdp.vmd_scene = VMD.Scene()
 
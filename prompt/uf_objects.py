@@ -30,7 +30,7 @@ from lib.errors import RelaxError
 from lib.text.string import strip_lead
 from status import Status; status = Status()
 from user_functions.data import Uf_info; uf_info = Uf_info()
-from user_functions.objects import Desc_container
+from user_functions.objects import Desc_container, import_backend
 
 
 class Class_container(object):
@@ -152,10 +152,19 @@ class Uf_object(object):
             # The printout.
             print(self._intro_text(keys, values))
 
+        # Create the argument validation functions on first use.
+        if self._validators == None:
+            self._validators = []
+            for arg in self._kargs:
+                self._validators.append(lib.arg_check.compile_validator(name=arg['desc_short'], dim=arg['dim'], basic_types=arg['basic_types'], container_types=arg['container_types'], can_be_none=arg['can_be_none'], can_be_empty=arg['can_be_empty'], none_elements=arg['none_elements']))
+
         # Check the argument values.
         for i in range(self._karg_num):
-            arg = self._kargs[i]
-            lib.arg_check.validate_arg(uf_kargs[self._kargs[i]['name']], arg['desc_short'], dim=arg['dim'], basic_types=arg['basic_types'], container_types=arg['container_types'], can_be_none=arg['can_be_none'], can_be_empty=arg['can_be_empty'], none_elements=arg['none_elements'])
+            self._validators[i](uf_kargs[self._karg_names[i]])
+
+        # Import the back end on first use.
+        if isinstance(self._backend, str):
+            self._backend = import_backend(self._backend)
 
         # Execute the functional code.
         self._backend(*new_args, **uf_kargs)
@@ -170,8 +179,8 @@ class Uf_object(object):
         @type title:            str
         @keyword kargs:         The list of keyword argument details.
         @type kargs:            list of dict
-        @keyword backend:       The user function back end.  This should be a string version with full module path of the function which executes the back end.  For example 'pipe_control.pipes.create'.  Note, this should be importable as __import__(backend)!
-        @type backend:          executable object
+        @keyword backend:       The user function back end.  This should be a string version with full module path of the function which executes the back end.  For example 'pipe_control.pipes.create'.  The module is imported when the user function is first executed.  A function object is also accepted.
+        @type backend:          str or executable object
         @keyword desc:          The full, multi-paragraph description.
         @type desc:             str
          """
@@ -193,6 +202,9 @@ class Uf_object(object):
         for i in range(self._karg_num):
             self._karg_names.append(self._kargs[i]['name'])
 
+        # The argument validation functions, created when the user function is first executed.
+        self._validators = None
+
 
     def __repr__(self):
         """Replacement function for displaying an instance of this user function class."""
@@ -59,9 +59,6 @@ import user_functions
 import version
 
 
-# Set up the user functions.
-user_functions.initialise()
-
 # Modify the environmental variables.
 putenv('PDBVIEWER', 'vmd')
 
@@ -89,6 +86,8 @@ def start(mode=None, profile_flag=False):
         relax.tee_file = None
         relax.multiprocessor_type = 'uni'
         relax.n_processors = 1
+        relax.group_size = 1
+        relax.journal_file = None
 
     # Process the command line arguments.
     else:
@@ -102,7 +101,11 @@ def start(mode=None, profile_flag=False):
     verbosity = 0
     if status.debug:
         verbosity = 1
-    processor = load_multiprocessor(relax.multiprocessor_type, callbacks, processor_size=relax.n_processors, verbosity=verbosity)
+    processor = load_multiprocessor(relax.multiprocessor_type, callbacks, processor_size=relax.n_processors, group_size=relax.group_size, verbosity=verbosity)
+
+    # Journal the results of the slave commands.
+    if relax.journal_file != None:
+        processor.set_journal(relax.journal_file)
 
     # Place the processor fabric intro string into the info box.
     info = Info_box()
@@ -186,6 +189,9 @@ class Relax:
             # Stop execution.
             return
 
+        # Set up the user functions (this is skipped for the modes above and on the slave processors, to improve program start up speeds).
+        user_functions.initialise()
+
         # Run the interpreter for the prompt or script modes.
         if self.mode == 'prompt' or self.mode == 'script':
             # Run the interpreter.
@@ -294,6 +300,8 @@ class Relax:
         group = parser.add_argument_group('Multi-processor arguments', description="The arguments allowing relax to run in multi-processor environments.")
         group.add_argument('-m', '--multi', action='store', type=str, dest='multiprocessor', default='uni', help='set multi processor method to one of \'uni\' or \'mpi4py\'')
         group.add_argument('-n', '--processors', action='store', type=int, dest='n_processors', default=-1, help='set number of processors (may be ignored)')
+        group.add_argument('--group-size', action='store', type=int, dest='group_size', default=1, help='set the number of MPI processes in each slave group, allowing the calculations to be spread over the processes of the group (only for the \'mpi4py\' method)')
+        group.add_argument('--journal', action='store', type=str, dest='journal_file', default=None, help='journal the results of the calculations sent to the slave processors to the given file, and skip the calculations already in the file to restart an interrupted run')
 
         # Recognised command line arguments for IO redirection.
         group = parser.add_argument_group('IO redirection arguments', description="The arguments for sending relax output into a file.")
@@ -410,6 +418,14 @@ class Relax:
             parser.error("The processor type '%s' is not supported.\n" % args.multiprocessor)
         self.multiprocessor_type = args.multiprocessor
         self.n_processors = args.n_processors
+        self.group_size = args.group_size
+        self.journal_file = args.journal_file
+
+        # Checks for the slave group size.
+        if self.group_size < 1:
+            parser.error("The slave group size must be at least 1.")
+        if self.group_size > 1 and self.multiprocessor_type != 'mpi4py':
+            parser.error("Slave groups are only supported by the 'mpi4py' multi processor method.")
 
         # Checks for the multiprocessor mode.
         if self.multiprocessor_type == 'mpi4py' and not dep_check.mpi4py_module:
@@ -489,7 +505,7 @@ class Relax:
                 parser.error("The relax GUI mode and licence mode are mutually exclusive.")
 
             # Missing wx module.
-            if not dep_check.wx_module:
+            if not dep_check.wx_module or not dep_check.import_wx():
                 # Not installed.
                 if dep_check.wx_module_message == "No module named 'wx'":
                     parser.error("To use the GUI, the wxPython module must be installed.")
@@ -122,6 +122,24 @@ class API_base(object):
         raise RelaxImplementError('calculate')
 
 
+    def calculate_sims(self, spin_id=None, scaling_matrix=None, verbosity=1):
+        """Calculate the values for all Monte Carlo simulations at once.
+
+        This is an optional method for the analyses which can calculate all simulations in a single vectorised operation.  If not implemented, the calculate() method will be called for each simulation.
+
+
+        @keyword spin_id:           The spin ID string.
+        @type spin_id:              None or str
+        @keyword scaling_matrix:    The per-model list of diagonal and square scaling matrices.
+        @type scaling_matrix:       list of numpy rank-2, float64 array or list of None
+        @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
+        @type verbosity:            int
+        """
+
+        # Not implemented.
+        raise RelaxImplementError('calculate_sims')
+
+
     def constraint_algorithm(self):
         """Return the optimisation constraint algorithm, defaulting to the Method of Multipliers.
 
@@ -386,6 +404,24 @@ class API_base(object):
         raise RelaxImplementError('map_bounds')
 
 
+    def map_target_function(self, params=None, spin_id=None):
+        """Create the target function for the fast chi-squared evaluation of the OpenDX mapping points.
+
+        The returned function is set up once and does not modify the data pipe.  It accepts a rank-2 array of parameter values, one row per point with the columns corresponding to the mapped parameters, and returns the chi-squared values for all points.
+
+
+        @keyword params:    The names of the parameters being mapped.
+        @type params:       list of str
+        @keyword spin_id:   The spin identification string.
+        @type spin_id:      None or str
+        @return:            The target function for evaluating a batch of points.
+        @rtype:             function
+        """
+
+        # Not implemented.
+        raise RelaxImplementError('map_target_function')
+
+
     def minimise(self, min_algor=None, min_options=None, func_tol=None, grad_tol=None, max_iterations=None, constraints=False, scaling_matrix=None, verbosity=0, sim_index=None, lower=None, upper=None, inc=None):
         """Minimisation method.
 
@@ -812,6 +848,13 @@ class API_base(object):
         raise RelaxImplementError('sim_return_selected')
 
 
+    def sim_stream_check(self):
+        """Check that the Monte Carlo simulation data can be created on demand and the simulation parameters accumulated, for the streaming mode."""
+
+        # Not implemented.
+        raise RelaxImplementError('sim_stream_check')
+
+
     def skip_function(self, model_info=None):
         """Skip certain data.
 
@@ -24,12 +24,15 @@
 
 # Python module imports.
 from copy import deepcopy
+from numpy import array, float64
 import sys
 
 # relax module imports.
 import lib.arg_check
 from lib.errors import RelaxError, RelaxNoSequenceError
+from lib.periodic_table import periodic_table
 from lib.text.sectioning import subsection
+from pipe_control.interatomic import return_interatom_list
 from pipe_control.mol_res_spin import count_spins, exists_mol_res_spin_data, return_spin, spin_loop
 
 
@@ -317,6 +320,104 @@ class API_common:
         """Dummy method, normally for deselecting spins with insufficient data for minimisation."""
 
 
+    def _pack_relax_data_frq(self, frq=None, spin_id=None, sim_index=None, sims=False):
+        """Pack the R1, R2, and NOE data of a single field strength for all spins into numpy arrays.
+
+        Selected spins lacking any of the three data types or a dipolar relaxation mechanism are skipped.  If more than one data set of a type exists at the field strength, the last is used.
+
+
+        @keyword frq:       The proton frequency in Hz.
+        @type frq:          float
+        @keyword spin_id:   The spin identification string.
+        @type spin_id:      None or str
+        @keyword sim_index: The optional MC simulation index, to pack the data of a single simulation.
+        @type sim_index:    None or int
+        @keyword sims:      A flag which if True will cause the data of all Monte Carlo simulations to be packed.
+        @type sims:         bool
+        @return:            The spin containers, the spin IDs, and a dictionary of numpy arrays.  The keys 'gx', 'gh', 'r', and 'csa' are of dimensions {spin, 1}.  The keys 'r1', 'r2', and 'noe' are of dimensions {spin, 1} or {spin, simulation} if the sims flag is set.
+        @rtype:             list of SpinContainer instances, list of str, dict of numpy rank-2 arrays
+        """
+
+        # The relaxation data IDs at the field strength.
+        ri_ids = {}
+        for ri_id in cdp.ri_ids:
+            if cdp.spectrometer_frq[ri_id] == frq and cdp.ri_type[ri_id] in ['R1', 'R2', 'NOE']:
+                ri_ids[cdp.ri_type[ri_id]] = ri_id
+
+        # Initialise.
+        spins, spin_ids = [], []
+        data = {}
+        for name in ['gx', 'gh', 'r', 'csa', 'r1', 'r2', 'noe']:
+            data[name] = []
+
+        # Loop over the spins.
+        for spin, id in spin_loop(spin_id, return_id=True):
+            # Skip deselected spins.
+            if not spin.select:
+                continue
+
+            # Get the R1, R2, and NOE values corresponding to the set frequency.
+            values = {}
+            for ri_type in ['R1', 'R2', 'NOE']:
+                values[ri_type] = None
+                if ri_type not in ri_ids or not hasattr(spin, 'ri_data') or spin.ri_data.get(ri_ids[ri_type]) == None:
+                    continue
+                if sims:
+                    values[ri_type] = spin.ri_data_sim[ri_ids[ri_type]][:cdp.sim_number]
+                elif sim_index != None:
+                    values[ri_type] = [spin.ri_data_sim[ri_ids[ri_type]][sim_index]]
+                else:
+                    values[ri_type] = [spin.ri_data[ri_ids[ri_type]]]
+
+            # Skip the spin if not all of the three value exist.
+            if values['R1'] == None or values['R2'] == None or values['NOE'] == None:
+                continue
+
+            # Loop over the interatomic data.
+            r = None
+            interatoms = return_interatom_list(spin_hash=spin._hash)
+            for i in range(len(interatoms)):
+                # No relaxation mechanism.
+                if not interatoms[i].dipole_pair:
+                    continue
+
+                # The surrounding spins.
+                if id != interatoms[i].spin_id1:
+                    spin_id2 = interatoms[i].spin_id1
+                else:
+                    spin_id2 = interatoms[i].spin_id2
+                spin2 = return_spin(spin_id=spin_id2)
+
+                # Gyromagnetic ratios.
+                gx = periodic_table.gyromagnetic_ratio(spin.isotope)
+                gh = periodic_table.gyromagnetic_ratio(spin2.isotope)
+
+                # The interatomic distance.
+                r = interatoms[i].r
+
+            # No relaxation mechanism.
+            if r == None:
+                continue
+
+            # Store the data.
+            spins.append(spin)
+            spin_ids.append(id)
+            data['gx'].append([gx])
+            data['gh'].append([gh])
+            data['r'].append([r])
+            data['csa'].append([spin.csa])
+            data['r1'].append(values['R1'])
+            data['r2'].append(values['R2'])
+            data['noe'].append(values['NOE'])
+
+        # Convert to numpy arrays.
+        for name in data:
+            data[name] = array(data[name], float64)
+
+        # Return the data.
+        return spins, spin_ids, data
+
+
     def _print_model_title_global(self, prefix=None, model_info=None):
         """Default method for when the model_loop() method simply loops over a single global model.
 
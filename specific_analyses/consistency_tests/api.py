@@ -25,12 +25,12 @@
 """The consistency testing analysis API object."""
 
 # Python module imports.
+from numpy import array, float64
 from warnings import warn
 
 # relax module imports.
 from lib.errors import RelaxError, RelaxNoSequenceError, RelaxNoValueError, RelaxSpinTypeError
 from lib.float import isInf
-from lib.periodic_table import periodic_table
 from lib.physical_constants import h_bar, mu0
 from lib.warnings import RelaxWarning, RelaxDeselectWarning
 from pipe_control.interatomic import return_interatom_list
@@ -38,7 +38,7 @@ from pipe_control.mol_res_spin import exists_mol_res_spin_data, return_spin, spi
 from specific_analyses.api_base import API_base
 from specific_analyses.api_common import API_common
 from specific_analyses.consistency_tests.parameter_object import Consistency_tests_params
-from target_functions.consistency_tests import Consistency
+from target_functions.consistency_tests import consistency_array
 
 
 class Consistency_tests(API_base, API_common):
@@ -66,17 +66,11 @@ class Consistency_tests(API_base, API_common):
         self._PARAMS = Consistency_tests_params()
 
 
-    def calculate(self, spin_id=None, scaling_matrix=None, verbosity=1, sim_index=None):
-        """Calculation of the consistency functions.
+    def _check_calc(self, spin_id=None):
+        """Check that all of the data required for the calculation is present.
 
-        @keyword spin_id:           The spin identification string.
-        @type spin_id:              None or str
-        @keyword scaling_matrix:    The per-model list of diagonal and square scaling matrices.
-        @type scaling_matrix:       list of numpy rank-2, float64 array or list of None
-        @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
-        @type verbosity:            int
-        @keyword sim_index:         The optional MC simulation index.
-        @type sim_index:            None or int
+        @keyword spin_id:   The spin identification string.
+        @type spin_id:      None or str
         """
 
         # Test if the frequency has been set.
@@ -135,94 +129,88 @@ class Consistency_tests(API_base, API_common):
         if cdp.ct_frq not in list(cdp.spectrometer_frq.values()):
             raise RelaxError("No relaxation data corresponding to the frequency %s has been loaded." % cdp.ct_frq)
 
-        # Consistency testing.
-        for spin, id in spin_loop(spin_id, return_id=True):
-            # Skip deselected spins.
-            if not spin.select:
-                continue
 
-            # Set the r1, r2, and NOE to None.
-            r1 = None
-            r2 = None
-            noe = None
-
-            # Get the R1, R2, and NOE values corresponding to the set frequency.
-            for ri_id in cdp.ri_ids:
-                # The frequency does not match.
-                if cdp.spectrometer_frq[ri_id] != cdp.ct_frq:
-                    continue
-
-                # R1.
-                if cdp.ri_type[ri_id] == 'R1':
-                    if sim_index == None:
-                        r1 = spin.ri_data[ri_id]
-                    else:
-                        r1 = spin.ri_data_sim[ri_id][sim_index]
-
-                # R2.
-                if cdp.ri_type[ri_id] == 'R2':
-                    if sim_index == None:
-                        r2 = spin.ri_data[ri_id]
-                    else:
-                        r2 = spin.ri_data_sim[ri_id][sim_index]
-
-                # NOE.
-                if cdp.ri_type[ri_id] == 'NOE':
-                    if sim_index == None:
-                        noe = spin.ri_data[ri_id]
-                    else:
-                        noe = spin.ri_data_sim[ri_id][sim_index]
-
-            # Skip the spin if not all of the three value exist.
-            if r1 == None or r2 == None or noe == None:
-                continue
+    def calculate(self, spin_id=None, scaling_matrix=None, verbosity=1, sim_index=None):
+        """Calculation of the consistency functions.
 
-            # Loop over the interatomic data.
-            interatoms = return_interatom_list(spin_hash=spin._hash)
-            for i in range(len(interatoms)):
-                # No relaxation mechanism.
-                if not interatoms[i].dipole_pair:
-                    continue
+        @keyword spin_id:           The spin identification string.
+        @type spin_id:              None or str
+        @keyword scaling_matrix:    The per-model list of diagonal and square scaling matrices.
+        @type scaling_matrix:       list of numpy rank-2, float64 array or list of None
+        @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
+        @type verbosity:            int
+        @keyword sim_index:         The optional MC simulation index.
+        @type sim_index:            None or int
+        """
 
-                # The surrounding spins.
-                if id != interatoms[i].spin_id1:
-                    spin_id2 = interatoms[i].spin_id1
-                else:
-                    spin_id2 = interatoms[i].spin_id2
-                spin2 = return_spin(spin_id=spin_id2)
+        # Checks.
+        self._check_calc(spin_id=spin_id)
 
-                # Gyromagnetic ratios.
-                gx = periodic_table.gyromagnetic_ratio(spin.isotope)
-                gh = periodic_table.gyromagnetic_ratio(spin2.isotope)
+        # Pack the relaxation data of all spins.
+        spins, spin_ids, data = self._pack_relax_data_frq(frq=cdp.ct_frq, spin_id=spin_id, sim_index=sim_index)
 
-                # The interatomic distance.
-                r = interatoms[i].r
+        # The angles Theta and correlation times.
+        orientation = array([[spin.orientation] for spin in spins], float64)
+        tc = array([[spin.tc] for spin in spins], float64)
 
-            # Initialise the function to calculate.
-            ct = Consistency(frq=cdp.ct_frq, gx=gx, gh=gh, mu0=mu0, h_bar=h_bar)
+        # Consistency testing.
+        j0, f_eta, f_r2 = consistency_array(frq=cdp.ct_frq, gx=data['gx'], gh=data['gh'], mu0=mu0, h_bar=h_bar, orientation=orientation, tc=tc, r=data['r'], csa=data['csa'], r1=data['r1'], r2=data['r2'], noe=data['noe'])
 
-            # Calculate the consistency tests values.
-            j0, f_eta, f_r2 = ct.func(orientation=spin.orientation, tc=spin.tc, r=r, csa=spin.csa, r1=r1, r2=r2, noe=noe)
+        # Loop over the spins.
+        for i in range(len(spins)):
+            spin = spins[i]
 
             # Consistency tests values.
             if sim_index == None:
-                spin.j0 = j0
-                spin.f_eta = f_eta
-                spin.f_r2 = f_r2
+                spin.j0 = float(j0[i, 0])
+                spin.f_eta = float(f_eta[i, 0])
+                spin.f_r2 = float(f_r2[i, 0])
 
             # Monte Carlo simulated consistency tests values.
             else:
                 # Initialise the simulation data structures.
-                self.data_init(id, sim=1)
+                self.data_init(spin_ids[i], sim=1)
                 if spin.j0_sim == None:
                     spin.j0_sim = []
                     spin.f_eta_sim = []
                     spin.f_r2_sim = []
 
                 # Consistency tests values.
-                spin.j0_sim.append(j0)
-                spin.f_eta_sim.append(f_eta)
-                spin.f_r2_sim.append(f_r2)
+                spin.j0_sim.append(float(j0[i, 0]))
+                spin.f_eta_sim.append(float(f_eta[i, 0]))
+                spin.f_r2_sim.append(float(f_r2[i, 0]))
+
+
+    def calculate_sims(self, spin_id=None, scaling_matrix=None, verbosity=1):
+        """Calculation of the consistency tests values for all Monte Carlo simulations at once.
+
+        @keyword spin_id:           The spin identification string.
+        @type spin_id:              None or str
+        @keyword scaling_matrix:    The per-model list of diagonal and square scaling matrices.
+        @type scaling_matrix:       list of numpy rank-2, float64 array or list of None
+        @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
+        @type verbosity:            int
+        """
+
+        # Checks.
+        self._check_calc(spin_id=spin_id)
+
+        # Pack the simulated relaxation data of all spins.
+        spins, spin_ids, data = self._pack_relax_data_frq(frq=cdp.ct_frq, spin_id=spin_id, sims=True)
+
+        # The angles Theta and correlation times.
+        orientation = array([[spin.orientation] for spin in spins], float64)
+        tc = array([[spin.tc] for spin in spins], float64)
+
+        # Consistency testing.
+        j0, f_eta, f_r2 = consistency_array(frq=cdp.ct_frq, gx=data['gx'], gh=data['gh'], mu0=mu0, h_bar=h_bar, orientation=orientation, tc=tc, r=data['r'], csa=data['csa'], r1=data['r1'], r2=data['r2'], noe=data['noe'])
+
+        # Store the simulated consistency tests values.
+        for i in range(len(spins)):
+            self.data_init(spin_ids[i], sim=1)
+            spins[i].j0_sim = j0[i].tolist()
+            spins[i].f_eta_sim = f_eta[i].tolist()
+            spins[i].f_r2_sim = f_r2[i].tolist()
 
 
     def data_init(self, data, sim=False):
@@ -25,18 +25,19 @@
 # Python module imports.
 from copy import deepcopy
 from math import pi
+from os import F_OK, access
 from numpy import argsort, array, float64, ones, transpose, zeros
 from warnings import warn
 
 # relax module imports.
 from lib.arg_check import is_float_array
 from lib.check_types import is_float
-from lib.errors import RelaxError, RelaxFault
+from lib.errors import RelaxError, RelaxFault, RelaxFileOverwriteError
 from lib.frame_order.simulation import brownian, mode_distribution, uniform_distribution
 from lib.frame_order.variables import MODEL_DOUBLE_ROTOR, MODEL_ISO_CONE, MODEL_LIST, MODEL_LIST_FREE_ROTORS, MODEL_LIST_ISO_CONE, MODEL_LIST_PSEUDO_ELLIPSE, MODEL_LIST_RESTRICTED_TORSION, MODEL_PSEUDO_ELLIPSE, MODEL_RIGID
 from lib.geometry.coord_transform import cartesian_to_spherical
 from lib.geometry.rotations import R_to_euler_zyz
-from lib.io import open_write_file
+from lib.io import get_file_path, mkdir_nofail, open_write_file
 from lib.warnings import RelaxWarning
 from pipe_control.pipes import check_pipe
 from specific_analyses.frame_order.checks import check_domain, check_model, check_parameters, check_pivot
@@ -549,7 +550,7 @@ def select_model(model=None):
     update_model()
 
 
-def simulate(file="simulation.pdb.bz2", dir=None, step_size=2.0, snapshot=10, total=1000, model=1, force=True):
+def simulate(file="simulation.pdb.bz2", dir=None, step_size=2.0, snapshot=10, total=1000, model=1, walkers=1, traj_file=None, force=True):
     """Pseudo-Brownian dynamics simulation of the frame order motions.
 
     @keyword file:      The PDB file for storing the frame order pseudo-Brownian dynamics simulation.  The compression is determined automatically by the file extensions '*.pdb', '*.pdb.gz', and '*.pdb.bz2'.
@@ -564,6 +565,10 @@ def simulate(file="simulation.pdb.bz2", dir=None, step_size=2.0, snapshot=10, to
     @type total:        int
     @keyword model:     Only one model from an analysed ensemble of structures can be used for the pseudo-Brownian simulation, as the simulation and corresponding PDB file consists of one model per simulation.
     @type model:        int
+    @keyword walkers:   The number of independent walkers simulated together.
+    @type walkers:      int
+    @keyword traj_file: The optional binary trajectory file for the rotation matrices of each snapshot.
+    @type traj_file:    str or None
     @keyword force:     A flag which, if set to True, will overwrite the any pre-existing file.
     @type force:        bool
     """
@@ -583,8 +588,20 @@ def simulate(file="simulation.pdb.bz2", dir=None, step_size=2.0, snapshot=10, to
         print("Skipping the rigid model.")
         return
 
-    # Open the output file.
-    file = open_write_file(file_name=file, dir=dir, force=force)
+    # Nothing to write.
+    if file == None and traj_file == None:
+        raise RelaxError("Either the PDB file or the trajectory file must be supplied.")
+
+    # Open the output files.
+    if file != None:
+        file = open_write_file(file_name=file, dir=dir, force=force)
+    if traj_file != None:
+        mkdir_nofail(dir, verbosity=0)
+        traj_path = get_file_path(traj_file, dir)
+        if access(traj_path, F_OK) and not force:
+            raise RelaxFileOverwriteError(traj_path, 'force flag')
+        print("Opening the file %s for writing." % repr(traj_path))
+        traj_file = open(traj_path, 'wb')
 
     # The parameter values.
     values = assemble_param_vector()
@@ -614,10 +631,13 @@ def simulate(file="simulation.pdb.bz2", dir=None, step_size=2.0, snapshot=10, to
     frame = generate_axis_system()
 
     # Create the distribution.
-    brownian(file=file, model=cdp.model, structure=structure, parameters=params, eigenframe=frame, pivot=pivot, atom_id=domain_moving(), step_size=step_size, snapshot=snapshot, total=total)
+    brownian(file=file, model=cdp.model, structure=structure, parameters=params, eigenframe=frame, pivot=pivot, atom_id=domain_moving(), step_size=step_size, snapshot=snapshot, total=total, walkers=walkers, traj_file=traj_file)
 
-    # Close the file.
-    file.close()
+    # Close the files.
+    if file != None:
+        file.close()
+    if traj_file != None:
+        traj_file.close()
 
 
 def sobol_setup(max_num=200, oversample=100):
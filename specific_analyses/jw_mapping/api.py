@@ -30,7 +30,6 @@ from warnings import warn
 # relax module imports.
 from lib.errors import RelaxError, RelaxNoSequenceError, RelaxNoValueError, RelaxSpinTypeError
 from lib.float import isInf
-from lib.periodic_table import periodic_table
 from lib.physical_constants import h_bar, mu0
 from lib.warnings import RelaxDeselectWarning
 from pipe_control.interatomic import return_interatom_list
@@ -38,7 +37,7 @@ from pipe_control.mol_res_spin import exists_mol_res_spin_data, return_spin, spi
 from specific_analyses.api_base import API_base
 from specific_analyses.api_common import API_common
 from specific_analyses.jw_mapping.parameter_object import Jw_mapping_params
-from target_functions.jw_mapping import Mapping
+from target_functions.jw_mapping import jw_mapping_array
 
 
 class Jw_mapping(API_base, API_common):
@@ -66,17 +65,11 @@ class Jw_mapping(API_base, API_common):
         self._PARAMS = Jw_mapping_params()
 
 
-    def calculate(self, spin_id=None, scaling_matrix=None, verbosity=1, sim_index=None):
-        """Calculation of the spectral density values.
+    def _check_calc(self, spin_id=None):
+        """Check that all of the data required for the calculation is present.
 
-        @keyword spin_id:           The spin identification string.
-        @type spin_id:              None or str
-        @keyword scaling_matrix:    The per-model list of diagonal and square scaling matrices.
-        @type scaling_matrix:       list of numpy rank-2, float64 array or list of None
-        @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
-        @type verbosity:            int
-        @keyword sim_index:         The optional MC simulation index.
-        @type sim_index:            None or int
+        @keyword spin_id:   The spin identification string.
+        @type spin_id:      None or str
         """
 
         # Test if the frequency has been set.
@@ -127,94 +120,80 @@ class Jw_mapping(API_base, API_common):
         if cdp.jw_frq not in list(cdp.spectrometer_frq.values()):
             raise RelaxError("No relaxation data corresponding to the frequency " + repr(cdp.jw_frq) + " has been loaded.")
 
-        # Reduced spectral density mapping.
-        for spin, id in spin_loop(spin_id, return_id=True):
-            # Skip deselected spins.
-            if not spin.select:
-                continue
 
-            # Set the r1, r2, and NOE to None.
-            r1 = None
-            r2 = None
-            noe = None
-
-            # Get the R1, R2, and NOE values corresponding to the set frequency.
-            for ri_id in cdp.ri_ids:
-                # The frequency does not match.
-                if cdp.spectrometer_frq[ri_id] != cdp.jw_frq:
-                    continue
-
-                # R1.
-                if cdp.ri_type[ri_id] == 'R1':
-                    if sim_index == None:
-                        r1 = spin.ri_data[ri_id]
-                    else:
-                        r1 = spin.ri_data_sim[ri_id][sim_index]
-
-                # R2.
-                if cdp.ri_type[ri_id] == 'R2':
-                    if sim_index == None:
-                        r2 = spin.ri_data[ri_id]
-                    else:
-                        r2 = spin.ri_data_sim[ri_id][sim_index]
-
-                # NOE.
-                if cdp.ri_type[ri_id] == 'NOE':
-                    if sim_index == None:
-                        noe = spin.ri_data[ri_id]
-                    else:
-                        noe = spin.ri_data_sim[ri_id][sim_index]
-
-            # Skip the spin if not all of the three value exist.
-            if r1 == None or r2 == None or noe == None:
-                continue
-
-            # Loop over the interatomic data.
-            interatoms = return_interatom_list(spin_hash=spin._hash)
-            for i in range(len(interatoms)):
-                # No relaxation mechanism.
-                if not interatoms[i].dipole_pair:
-                    continue
+    def calculate(self, spin_id=None, scaling_matrix=None, verbosity=1, sim_index=None):
+        """Calculation of the spectral density values.
 
-                # The surrounding spins.
-                if id != interatoms[i].spin_id1:
-                    spin_id2 = interatoms[i].spin_id1
-                else:
-                    spin_id2 = interatoms[i].spin_id2
-                spin2 = return_spin(spin_id=spin_id2)
+        @keyword spin_id:           The spin identification string.
+        @type spin_id:              None or str
+        @keyword scaling_matrix:    The per-model list of diagonal and square scaling matrices.
+        @type scaling_matrix:       list of numpy rank-2, float64 array or list of None
+        @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
+        @type verbosity:            int
+        @keyword sim_index:         The optional MC simulation index.
+        @type sim_index:            None or int
+        """
 
-                # Gyromagnetic ratios.
-                gx = periodic_table.gyromagnetic_ratio(spin.isotope)
-                gh = periodic_table.gyromagnetic_ratio(spin2.isotope)
+        # Checks.
+        self._check_calc(spin_id=spin_id)
 
-                # The interatomic distance.
-                r = interatoms[i].r
+        # Pack the relaxation data of all spins.
+        spins, spin_ids, data = self._pack_relax_data_frq(frq=cdp.jw_frq, spin_id=spin_id, sim_index=sim_index)
 
-            # Initialise the function to calculate.
-            jw = Mapping(frq=cdp.jw_frq, gx=gx, gh=gh, mu0=mu0, h_bar=h_bar)
+        # Reduced spectral density mapping.
+        j0, jwx, jwh = jw_mapping_array(frq=cdp.jw_frq, gx=data['gx'], gh=data['gh'], mu0=mu0, h_bar=h_bar, r=data['r'], csa=data['csa'], r1=data['r1'], r2=data['r2'], noe=data['noe'])
 
-            # Calculate the spectral density values.
-            j0, jwx, jwh = jw.func(r=r, csa=spin.csa, r1=r1, r2=r2, noe=noe)
+        # Loop over the spins.
+        for i in range(len(spins)):
+            spin = spins[i]
 
-            # Reduced spectral density values.
+            # Spectral density values.
             if sim_index == None:
-                spin.j0 = j0
-                spin.jwx = jwx
-                spin.jwh = jwh
+                spin.j0 = float(j0[i, 0])
+                spin.jwx = float(jwx[i, 0])
+                spin.jwh = float(jwh[i, 0])
 
-            # Monte Carlo simulated reduced spectral density values.
+            # Monte Carlo simulated spectral density values.
             else:
                 # Initialise the simulation data structures.
-                self.data_init(id, sim=1)
+                self.data_init(spin_ids[i], sim=1)
                 if spin.j0_sim == None:
                     spin.j0_sim = []
                     spin.jwx_sim = []
                     spin.jwh_sim = []
 
-                # Reduced spectral density values.
-                spin.j0_sim.append(j0)
-                spin.jwx_sim.append(jwx)
-                spin.jwh_sim.append(jwh)
+                # Spectral density values.
+                spin.j0_sim.append(float(j0[i, 0]))
+                spin.jwx_sim.append(float(jwx[i, 0]))
+                spin.jwh_sim.append(float(jwh[i, 0]))
+
+
+    def calculate_sims(self, spin_id=None, scaling_matrix=None, verbosity=1):
+        """Calculation of the spectral density values for all Monte Carlo simulations at once.
+
+        @keyword spin_id:           The spin identification string.
+        @type spin_id:              None or str
+        @keyword scaling_matrix:    The per-model list of diagonal and square scaling matrices.
+        @type scaling_matrix:       list of numpy rank-2, float64 array or list of None
+        @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
+        @type verbosity:            int
+        """
+
+        # Checks.
+        self._check_calc(spin_id=spin_id)
+
+        # Pack the simulated relaxation data of all spins.
+        spins, spin_ids, data = self._pack_relax_data_frq(frq=cdp.jw_frq, spin_id=spin_id, sims=True)
+
+        # Reduced spectral density mapping.
+        j0, jwx, jwh = jw_mapping_array(frq=cdp.jw_frq, gx=data['gx'], gh=data['gh'], mu0=mu0, h_bar=h_bar, r=data['r'], csa=data['csa'], r1=data['r1'], r2=data['r2'], noe=data['noe'])
+
+        # Store the simulated spectral density values.
+        for i in range(len(spins)):
+            self.data_init(spin_ids[i], sim=1)
+            spins[i].j0_sim = j0[i].tolist()
+            spins[i].jwx_sim = jwx[i].tolist()
+            spins[i].jwh_sim = jwh[i].tolist()
 
 
     def data_init(self, data, sim=False):
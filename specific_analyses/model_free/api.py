@@ -31,7 +31,7 @@ if dep_check.bmrblib_module:
 from copy import deepcopy
 from math import pi
 from minfx.grid import grid_split
-from numpy import array, dot, float64, int32, zeros
+from numpy import array, dot, float64, int32, isfinite, tile, zeros
 from numpy.linalg import inv
 from re import match, search
 import string
@@ -41,15 +41,15 @@ from warnings import warn
 
 # relax module imports.
 from lib.arg_check import is_num_list, is_str_list
-from lib.errors import RelaxError, RelaxFault, RelaxNoModelError, RelaxNoSequenceError, RelaxNoTensorError
+from lib.errors import RelaxError, RelaxFault, RelaxImplementError, RelaxNoModelError, RelaxNoSequenceError, RelaxNoTensorError
 from lib.float import isInf
-from lib.periodic_table import periodic_table
 from lib.physical_constants import h_bar, mu0
 from lib.text.sectioning import subsection
 from lib.warnings import RelaxDeselectWarning, RelaxWarning
 from multi import Processor_box
 from pipe_control import diffusion_tensor, interatomic, mol_res_spin, pipes, relax_data, sequence
 from pipe_control.bmrb import list_sample_conditions
+from pipe_control.error_analysis import sim_stream_init, sim_streaming
 from pipe_control.exp_info import bmrb_write_citations, bmrb_write_methods, bmrb_write_software
 from pipe_control.interatomic import return_interatom_list
 from pipe_control.mol_res_spin import count_spins, exists_mol_res_spin_data, find_index, get_molecule_names, return_spin, return_spin_from_index, return_spin_indices, spin_loop
@@ -61,10 +61,12 @@ from specific_analyses.model_free.data import compare_objects
 from specific_analyses.model_free.molmol import Molmol
 from specific_analyses.model_free.model import determine_model_type
 from specific_analyses.model_free.parameters import are_mf_params_set, assemble_param_names, assemble_param_vector, linear_constraints
-from specific_analyses.model_free.optimisation import MF_grid_command, MF_memo, MF_minimise_command, minimise_data_setup, relax_data_opt_structs
+from specific_analyses.model_free.optimisation import MF_batch_memo, MF_grid_batch_command, MF_grid_command, MF_memo, MF_minimise_command, minimise_data_setup, spin_target_function
 from specific_analyses.model_free.parameter_object import Model_free_params
 from specific_analyses.model_free.pymol import Pymol
+from status import Status; status = Status()
 from target_functions.mf import Mf
+from target_functions.mf_grid import Mf_grid
 
 
 class Model_free(API_base, API_common):
@@ -439,6 +441,10 @@ class Model_free(API_base, API_common):
         if not exists_mol_res_spin_data():
             raise RelaxNoSequenceError
 
+        # The simulation data does not exist in the streaming mode.
+        if sim_index != None and sim_streaming():
+            raise RelaxError("The chi-squared value cannot be calculated for the streaming Monte Carlo simulations.")
+
         # Determine the model type.
         model_type = determine_model_type()
 
@@ -518,84 +524,8 @@ class Model_free(API_base, API_common):
                 elif err != None and err < 0.0:
                     raise RelaxError("Negative error of %s for spin '%s' for the relaxation data ID '%s', minimisation not possible." % (err, id, ri_id))
 
-            # Create the initial parameter vector.
-            param_vector = assemble_param_vector(spin=spin, sim_index=sim_index)
-
-            # The relaxation data optimisation structures.
-            data = relax_data_opt_structs(spin, sim_index=sim_index)
-
-            # The spin data.
-            ri_data = [array(data[0])]
-            ri_data_err = [array(data[1])]
-            num_frq = [data[2]]
-            num_ri = [data[3]]
-            ri_labels = [data[4]]
-            frq = [data[5]]
-            remap_table = [data[6]]
-            noe_r1_table = [data[7]]
-            gx = [periodic_table.gyromagnetic_ratio(spin.isotope)]
-            if sim_index == None:
-                csa = [spin.csa]
-            else:
-                csa = [spin.csa_sim[sim_index]]
-
-            # The interatomic data.
-            interatoms = return_interatom_list(spin_hash=spin._hash)
-            for i in range(len(interatoms)):
-                # No relaxation mechanism.
-                if not interatoms[i].dipole_pair:
-                    continue
-
-                # The surrounding spins.
-                if spin_id != interatoms[i].spin_id1:
-                    spin_id2 = interatoms[i].spin_id1
-                else:
-                    spin_id2 = interatoms[i].spin_id2
-                spin2 = return_spin(spin_id=spin_id2)
-
-                # The data.
-                if sim_index == None:
-                    r = [interatoms[i].r]
-                else:
-                    r = [interatoms[i].r_sim[sim_index]]
-
-                # Vectors.
-                if model_type != 'local_tm' and cdp.diff_tensor.type != 'sphere':
-                    xh_unit_vectors = [interatoms[i].vector]
-                else:
-                    xh_unit_vectors = [None]
-
-                # Gyromagnetic ratios.
-                gh = [periodic_table.gyromagnetic_ratio(spin2.isotope)]
-
-            # Count the number of model-free parameters for the residue index.
-            num_params = [len(spin.params)]
-
-            # Repackage the parameter values as a local model (ignore if the diffusion tensor is not fixed).
-            param_values = [assemble_param_vector(model_type='mf')]
-
-            # Package the diffusion tensor parameters.
-            if model_type == 'local_tm':
-                diff_params = [spin.local_tm]
-                diff_type = 'sphere'
-            else:
-                # Diff type.
-                diff_type = cdp.diff_tensor.type
-
-                # Spherical diffusion.
-                if diff_type == 'sphere':
-                    diff_params = [cdp.diff_tensor.tm]
-
-                # Spheroidal diffusion.
-                elif diff_type == 'spheroid':
-                    diff_params = [cdp.diff_tensor.tm, cdp.diff_tensor.Da, cdp.diff_tensor.theta, cdp.diff_tensor.phi]
-
-                # Ellipsoidal diffusion.
-                elif diff_type == 'ellipsoid':
-                    diff_params = [cdp.diff_tensor.tm, cdp.diff_tensor.Da, cdp.diff_tensor.Dr, cdp.diff_tensor.alpha, cdp.diff_tensor.beta, cdp.diff_tensor.gamma]
-
-            # Initialise the model-free function.
-            mf = Mf(init_params=param_vector, model_type='mf', diff_type=diff_type, diff_params=diff_params, num_spins=1, equations=[spin.equation], param_types=[spin.params], param_values=param_values, relax_data=ri_data, errors=ri_data_err, bond_length=r, csa=csa, num_frq=num_frq, frq=frq, num_ri=num_ri, remap_table=remap_table, noe_r1_table=noe_r1_table, ri_labels=ri_labels, gx=gx, gh=gh, h_bar=h_bar, mu0=mu0, num_params=num_params, vectors=xh_unit_vectors)
+            # Set up the target function.
+            mf, param_vector = spin_target_function(spin=spin, spin_id=spin_id, model_type=model_type, sim_index=sim_index)
 
             # Chi-squared calculation.
             try:
@@ -1006,6 +936,10 @@ class Model_free(API_base, API_common):
         # Determine the model type.
         model_type = determine_model_type()
 
+        # The simulation parameter values are not stored in the streaming mode.
+        if sim_index != None and sim_streaming():
+            raise RelaxError("The parameter values of the streaming Monte Carlo simulations are not stored.")
+
         # Set the spin container (to None if the model is global).
         if model_type == 'mf' or model_type == 'local_tm':
             spin = return_spin_from_index(global_index=model_info)
@@ -1078,6 +1012,72 @@ class Model_free(API_base, API_common):
             return [-100 * 1e-6, -300 * 1e-6]
 
 
+    def map_target_function(self, params=None, spin_id=None):
+        """Create the target function for the fast chi-squared evaluation of the OpenDX mapping points.
+
+        All points of a batch are evaluated at once by the vectorised model-free chi-squared calculation of the target_functions.mf_grid module.  This is only supported for the mapping of the model-free parameters of a single spin, the diffusion tensor and any local tm being fixed.
+
+
+        @keyword params:    The names of the parameters being mapped.
+        @type params:       list of str
+        @keyword spin_id:   The spin identification string.
+        @type spin_id:      None or str
+        @return:            The target function for evaluating a batch of points.
+        @rtype:             function
+        """
+
+        # Only the spin specific model types are supported.
+        model_type = determine_model_type()
+        if model_type not in ['mf', 'local_tm']:
+            raise RelaxImplementError('map_target_function')
+
+        # A single selected spin with relaxation data is required.
+        spins = []
+        for spin in spin_loop(spin_id):
+            if spin.select and hasattr(spin, 'ri_data') and hasattr(spin, 'ri_data_err'):
+                spins.append(spin)
+        if len(spins) != 1 or not spins[0].model:
+            raise RelaxImplementError('map_target_function')
+        spin = spins[0]
+
+        # All mapped parameters must be part of the model-free model, and all parameters must have values.
+        for param in params:
+            if param not in spin.params:
+                raise RelaxImplementError('map_target_function')
+        if are_mf_params_set(spin) != None:
+            raise RelaxImplementError('map_target_function')
+
+        # The local tm is fixed in the single spin target function.
+        if 'local_tm' in params:
+            raise RelaxImplementError('map_target_function')
+
+        # Check the data by performing a normal chi-squared calculation.
+        self.calculate(spin_id=spin_id, verbosity=0)
+
+        # The indices of the mapped parameters in the parameter vector.
+        indices = [spin.params.index(param) for param in params]
+
+        # Set up the target function and the vectorised chi-squared calculation once.
+        mf, param_vector = spin_target_function(spin=spin, spin_id=spin_id, model_type=model_type)
+        engine = Mf_grid()
+
+        # The batch evaluation function.
+        def func(points):
+            # The full parameter vectors of all points.
+            vectors = tile(param_vector, (len(points), 1))
+            vectors[:, indices] = points
+
+            # The chi-squared values, with overflows and NaN values replaced as for the data pipe evaluation.
+            chi2 = engine.calc_chi2(mf, vectors)
+            chi2[~isfinite(chi2)] = 1e200
+
+            # Return the values.
+            return chi2
+
+        # Return the function.
+        return func
+
+
     def minimise(self, min_algor=None, min_options=None, func_tol=None, grad_tol=None, max_iterations=None, constraints=False, scaling_matrix=None, verbosity=0, sim_index=None, lower=None, upper=None, inc=None):
         """Model-free minimisation function.
 
@@ -1155,6 +1155,9 @@ class Model_free(API_base, API_common):
         # Add the keyword args.
         opt_params.verbosity = verbosity
 
+        # The optimisation results cache.
+        opt_params.opt_cache = status.opt_cache
+
         # Determine the model type.
         data_store.model_type = determine_model_type()
         if not data_store.model_type:
@@ -1256,10 +1259,18 @@ class Model_free(API_base, API_common):
             num_data_sets = 0
             data_store.num_spins = 1
 
+        # Streaming Monte Carlo simulations, optimised from the starting point of the original model as the simulation parameter values are not stored.
+        streaming = sim_index != None and sim_streaming()
+        if streaming and (match('^[Gg]rid', min_algor) or match('^[Ss]et', min_algor)):
+            raise RelaxError("The grid search and setting of parameter values is not supported for the streaming Monte Carlo simulations.")
+
         # Get the Processor box singleton (it contains the Processor instance) and alias the Processor.
         processor_box = Processor_box() 
         processor = processor_box.processor
 
+        # The spin data for the vectorised grid search.
+        batch = []
+
         # Loop over the models.
         for index in self.model_loop():
             # Get the spin container if required.
@@ -1299,7 +1310,10 @@ class Model_free(API_base, API_common):
 
             else:
                 # Create the initial parameter vector.
-                opt_params.param_vector = assemble_param_vector(spin=spin, sim_index=sim_index)
+                if streaming:
+                    opt_params.param_vector = assemble_param_vector(spin=spin)
+                else:
+                    opt_params.param_vector = assemble_param_vector(spin=spin, sim_index=sim_index)
 
                 # The number of parameters.
                 num_params = len(opt_params.param_vector)
@@ -1387,6 +1401,12 @@ class Model_free(API_base, API_common):
                 # Exit this method.
                 return
 
+            # Vectorised grid search of the single spin models (collect the data).
+            if search('^[Gg]rid', min_algor) and (data_store.model_type == 'mf' or data_store.model_type == 'local_tm'):
+                memo = MF_memo(model_free=self, model_type=data_store.model_type, spin=spin, sim_index=sim_index, scaling_matrix=data_store.scaling_matrix)
+                batch.append((deepcopy(data_store), deepcopy(opt_params), memo))
+                continue
+
             # Normal grid search (command initialisation).
             if search('^[Gg]rid', min_algor):
                 command = MF_grid_command()
@@ -1402,6 +1422,21 @@ class Model_free(API_base, API_common):
             memo = MF_memo(model_free=self, model_type=data_store.model_type, spin=spin, sim_index=sim_index, scaling_matrix=data_store.scaling_matrix)
             processor.add_to_queue(command, memo)
 
+        # Split the spins of the vectorised grid search into one batch per processor.
+        num_batches = min(len(batch), processor.processor_size())
+        for i in range(num_batches):
+            # Grid search initialisation.
+            command = MF_grid_batch_command()
+
+            # Pass in the data and optimisation parameters of each spin.
+            memos = []
+            for data, params, memo in batch[i::num_batches]:
+                command.store_data(data, params)
+                memos.append(memo)
+
+            # Set up the batched model-free memo and add it to the processor queue.
+            processor.add_to_queue(command, MF_batch_memo(memos=memos))
+
         # Execute the queued elements.
         processor.run_queue()
 
@@ -2042,6 +2077,10 @@ class Model_free(API_base, API_common):
                     if hasattr(spin, sim_object_name):
                         raise RelaxError("Monte Carlo parameter values have already been set.")
 
+                # Test if the accumulators of the streaming mode already exist.
+                if hasattr(spin, '_sim_stats'):
+                    raise RelaxError("Monte Carlo parameter values have already been set.")
+
 
         # Set the Monte Carlo parameter values.
         #######################################
@@ -2079,8 +2118,18 @@ class Model_free(API_base, API_common):
                 for j in range(cdp.sim_number):
                     cdp.diff_tensor.set(param=object_name, value=deepcopy(getattr(cdp.diff_tensor, object_name)), category='sim', sim_index=j)
 
+        # The streaming mode, where the spin specific parameters and chi-squared values are accumulated rather than stored.
+        if sim_streaming():
+            for spin in spin_loop():
+                # Skip deselected spins.
+                if not spin.select:
+                    continue
+
+                # Initialise the accumulators.
+                sim_stream_init(spin, param_names + ['chi2'])
+
         # Spin specific parameters.
-        if model_type != 'diff':
+        elif model_type != 'diff':
             for spin in spin_loop():
                 # Skip deselected spins.
                 if not spin.select:
@@ -2248,6 +2297,10 @@ class Model_free(API_base, API_common):
 
             # Loop over the spin specific parameters.
             for param in param_names:
+                # Return the accumulator of the streaming mode.
+                if index == inc and sim_streaming():
+                    return spin._sim_stats[param]
+
                 # Return the parameter array.
                 if index == inc:
                     return getattr(spin, param + "_sim")
@@ -2285,6 +2338,20 @@ class Model_free(API_base, API_common):
             return spin.select_sim
 
 
+    def sim_stream_check(self):
+        """Check that the Monte Carlo simulations can be run in the streaming mode.
+
+        Only the single spin 'mf' and 'local_tm' model types are supported.
+        """
+
+        # Determine the model type.
+        model_type = determine_model_type()
+
+        # Check.
+        if model_type != 'mf' and model_type != 'local_tm':
+            raise RelaxError("The streaming Monte Carlo simulations are only supported for the 'mf' and 'local_tm' model types, not '%s'." % model_type)
+
+
     def skip_function(self, model_info=None):
         """Skip certain data.
 
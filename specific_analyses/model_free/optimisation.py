@@ -26,26 +26,32 @@
 """The model-free analysis optimisation functions."""
 
 # Python module imports.
+from functools import partial
 from minfx.generic import generic_minimise
 from minfx.grid import grid, grid_point_array
 from numpy import array, dot, float64
 import sys
 
 # relax module imports.
+from data_store.mol_res_spin import SpinContainer
 import lib.arg_check
 from lib.errors import RelaxError, RelaxInfError, RelaxMultiVectorError, RelaxNaNError
 from lib.float import isNaN, isInf
+from lib.optimisation_cache import cached_optimise
 from lib.periodic_table import periodic_table
+from lib.physical_constants import h_bar, mu0
 from lib.text.sectioning import subsection
 from multi import Memo, Result_command, Slave_command
 from pipe_control import pipes
+from pipe_control.error_analysis import Sim_data_generator, sim_stream_add, sim_streaming
 from pipe_control.interatomic import return_interatom_list
 from pipe_control.mol_res_spin import return_spin, return_spin_from_index
 from specific_analyses.model_free.parameters import assemble_param_vector, disassemble_param_vector
 from target_functions.mf import Mf
+from target_functions.mf_grid import Mf_grid
 
 
-def disassemble_result(param_vector=None, func=None, iter=None, fc=None, gc=None, hc=None, warning=None, spin=None, sim_index=None, model_type=None, scaling_matrix=None):
+def disassemble_result(param_vector=None, func=None, iter=None, fc=None, gc=None, hc=None, warning=None, spin=None, sim_index=None, model_type=None, scaling_matrix=None, pipe_name=None):
     """Disassemble the optimisation results.
 
     @keyword param_vector:      The model-free parameter vector.
@@ -71,12 +77,24 @@ def disassemble_result(param_vector=None, func=None, iter=None, fc=None, gc=None
     @type model_type:           str
     @keyword scaling_matrix:    The diagonal, square scaling matrix.
     @type scaling_matrix:       numpy diagonal matrix
+    @keyword pipe_name:         The name of the data pipe of the optimisation.  If different from the current data pipe, the results will be stored in this data pipe.
+    @type pipe_name:            str or None
     """
 
     # No result.
     if param_vector is None:
         return
 
+    # The results of a different data pipe, from a held processor queue, so temporarily switch to it.
+    orig_pipe = pipes.cdp_name()
+    if pipe_name != None and pipe_name != orig_pipe:
+        pipes.switch(pipe_name)
+        try:
+            disassemble_result(param_vector=param_vector, func=func, iter=iter, fc=fc, gc=gc, hc=hc, warning=warning, spin=spin, sim_index=sim_index, model_type=model_type, scaling_matrix=scaling_matrix)
+        finally:
+            pipes.switch(orig_pipe)
+        return
+
     # Alias the current data pipe.
     cdp = pipes.get_pipe()
 
@@ -117,6 +135,26 @@ def disassemble_result(param_vector=None, func=None, iter=None, fc=None, gc=None
         else:
             print("Storing the optimisation results%s, the optimised chi-squared value is lower than the current value (%s < %s)." % (spin_text, func, chi2))
 
+    # Streaming Monte Carlo simulations, so accumulate the results rather than storing them.
+    if sim_index != None and (model_type == 'mf' or model_type == 'local_tm') and sim_streaming():
+        # Disassemble the parameter vector into a temporary container, starting from the spin values, so that the derived order parameters are calculated.
+        sim = SpinContainer()
+        sim.params = spin.params
+        for name in spin._sim_stats:
+            if name != 'chi2':
+                setattr(sim, name, getattr(spin, name, None))
+        disassemble_param_vector(model_type, param_vector=param_vector, spin=sim)
+
+        # The simulation values.
+        values = {'chi2': func}
+        for name in spin._sim_stats:
+            if name != 'chi2':
+                values[name] = getattr(sim, name)
+
+        # Accumulate and exit.
+        sim_stream_add(spin, values)
+        return
+
     # Disassemble the parameter vector.
     disassemble_param_vector(model_type, param_vector=param_vector, spin=spin, sim_index=sim_index)
 
@@ -206,6 +244,76 @@ def disassemble_result(param_vector=None, func=None, iter=None, fc=None, gc=None
             cdp.warning = warning
 
 
+def grid_point_values(data, opt_params, points):
+    """Calculate the target function values for a block of grid points.
+
+    @param data:        The data used to initialise the model-free target function class.
+    @type data:         class instance
+    @param opt_params:  The parameters and data required for optimisation using minfx.
+    @type opt_params:   class instance
+    @param points:      The grid points.
+    @type points:       list of numpy rank-1 arrays
+    @return:            The target function value for each point.
+    @rtype:             list of float
+    """
+
+    # Initialise the target function.
+    mf = init_target_function(data, opt_params)
+
+    # The values.
+    return [mf.func(point) for point in points]
+
+
+def grid_spins(items):
+    """Perform the vectorised grid search for a block of spins.
+
+    The spectral density tables of the target function class are shared between all spins of the block.
+
+
+    @param items:   The data used to initialise the model-free target function class and the optimisation parameters, for each spin.
+    @type items:    list of [class instance, class instance]
+    @return:        The parameter vector, function value, iteration count, function count, gradient count, Hessian count, and warning for each spin.
+    @rtype:         list of tuples
+    """
+
+    # The vectorised grid search.
+    engine = Mf_grid()
+
+    # Loop over the spins.
+    results = []
+    for data, opt_params in items:
+        # Initialise the target function.
+        mf = init_target_function(data, opt_params)
+
+        # Printout.
+        if opt_params.verbosity >= 1:
+            subsection(file=sys.stdout, text="Optimisation:  Spin '%s'" % data.spin_id, prespace=2, postspace=0)
+
+        # The grid search.
+        param_vector, func, iter, warning = engine.grid(mf=mf, num_incs=opt_params.inc, lower=opt_params.lower, upper=opt_params.upper, A=opt_params.A, b=opt_params.b)
+        if opt_params.verbosity >= 1:
+            print("Grid search:  %s points, chi2 = %s" % (iter, func))
+        results.append((param_vector, func, iter, iter, 0.0, 0.0, warning))
+
+    # Return the results.
+    return results
+
+
+def init_target_function(data, opt_params):
+    """Initialise the model-free target function class.
+
+    @param data:        The data used to initialise the model-free target function class.
+    @type data:         class instance
+    @param opt_params:  The parameters and data required for optimisation using minfx.
+    @type opt_params:   class instance
+    @return:            The model-free target function class.
+    @rtype:             Mf instance
+    """
+
+    # Initialise and return the target function class.
+    return Mf(init_params=opt_params.param_vector, model_type=data.model_type, diff_type=data.diff_type, diff_params=data.diff_params, scaling_matrix=data.scaling_matrix, num_spins=data.num_spins, equations=data.equations, param_types=data.param_types, param_values=data.param_values, relax_data=data.ri_data, errors=data.ri_data_err, bond_length=data.r, csa=data.csa, num_frq=data.num_frq, frq=data.frq, num_ri=data.num_ri, remap_table=data.remap_table, noe_r1_table=data.noe_r1_table, ri_labels=data.ri_types, gx=data.gx, gh=data.gh, h_bar=data.h_bar, mu0=data.mu0, num_params=data.num_params, vectors=data.xh_unit_vectors)
+
+
 def minimise_data_setup(data_store, min_algor, num_data_sets, min_options, spin=None, sim_index=None):
     """Set up all the data required for minimisation.
 
@@ -225,7 +333,11 @@ def minimise_data_setup(data_store, min_algor, num_data_sets, min_options, spin=
     @rtype:                 tuple
     """
 
+    # Streaming Monte Carlo simulations, where the simulation data is created by the optimisation command.
+    streaming = sim_index != None and (data_store.model_type == 'mf' or data_store.model_type == 'local_tm') and sim_streaming()
+
     # Initialise the data structures for the model-free function.
+    data_store.sim_data = None
     data_store.ri_data = []
     data_store.ri_data_err = []
     data_store.equations = []
@@ -319,8 +431,28 @@ def minimise_data_setup(data_store, min_algor, num_data_sets, min_options, spin=
             elif err != None and err < 0.0:
                 raise RelaxError("Negative error of %s for spin '%s' for the relaxation data ID '%s', minimisation not possible." % (err, data_store.spin_id, ri_id))
 
+        # The relaxation data optimisation structures of the streaming simulations, with the simulation data to be created on demand.
+        if streaming:
+            # The data generator.
+            generator = Sim_data_generator(data_id=data_store.spin_id)
+            if generator.data_num == None:
+                raise RelaxError("No Monte Carlo simulation data has been set up for the spin '%s'." % data_store.spin_id)
+
+            # The structures, with the original or back-calculated data as placeholders.
+            data = relax_data_opt_structs(spin, sim_data=generator.data)
+
+            # The indices of the data used in the optimisation.
+            keep = []
+            for k in range(len(cdp.ri_ids)):
+                if cdp.ri_ids[k] in spin.ri_data and generator.data[k] != None and generator.error[k] != None:
+                    keep.append(k)
+
+            # Store the generator.
+            data_store.sim_data = [generator, sim_index, keep]
+
         # The relaxation data optimisation structures.
-        data = relax_data_opt_structs(spin, sim_index=sim_index)
+        else:
+            data = relax_data_opt_structs(spin, sim_index=sim_index)
 
         # Append the data.
         data_store.ri_data.append(data[0])
@@ -331,7 +463,7 @@ def minimise_data_setup(data_store, min_algor, num_data_sets, min_options, spin=
         data_store.frq.append(data[5])
         data_store.remap_table.append(data[6])
         data_store.noe_r1_table.append(data[7])
-        if sim_index == None or data_store.model_type == 'diff':
+        if sim_index == None or data_store.model_type == 'diff' or streaming:
             data_store.csa.append(spin.csa)
         else:
             data_store.csa.append(spin.csa_sim[sim_index])
@@ -357,7 +489,7 @@ def minimise_data_setup(data_store, min_algor, num_data_sets, min_options, spin=
 
             # The data.
             data_store.gh.append(periodic_table.gyromagnetic_ratio(spin2.isotope))
-            if sim_index == None or data_store.model_type == 'diff' or not hasattr(interatoms[i], 'r_sim'):
+            if sim_index == None or data_store.model_type == 'diff' or streaming or not hasattr(interatoms[i], 'r_sim'):
                 data_store.r.append(interatoms[i].r)
             else:
                 data_store.r.append(interatoms[i].r_sim[sim_index])
@@ -419,13 +551,15 @@ def minimise_data_setup(data_store, min_algor, num_data_sets, min_options, spin=
         data_store.diff_params = [spin.local_tm]
 
 
-def relax_data_opt_structs(spin, sim_index=None):
+def relax_data_opt_structs(spin, sim_index=None, sim_data=None):
     """Package the relaxation data into the data structures used for optimisation.
 
     @param spin:        The spin container to extract the data from.
     @type spin:         SpinContainer instance
     @keyword sim_index: The optional MC simulation index.
     @type sim_index:    int
+    @keyword sim_data:  The optional simulation data, in the order of cdp.ri_ids, to use instead of the spin data.
+    @type sim_data:     list of float
     @return:            The structures ri_data, ri_data_err, num_frq, num_ri, ri_ids, frq, remap_table, noe_r1_table.
     @rtype:             tuple
     """
@@ -445,7 +579,9 @@ def relax_data_opt_structs(spin, sim_index=None):
             continue
 
         # The Rx data.
-        if sim_index == None:
+        if sim_data != None:
+            data = sim_data[cdp.ri_ids.index(ri_id)]
+        elif sim_index == None:
             data = spin.ri_data[ri_id]
         else:
             data = spin.ri_data_sim[ri_id][sim_index]
@@ -489,6 +625,104 @@ def relax_data_opt_structs(spin, sim_index=None):
     return ri_data, ri_data_err, len(frq), num_ri, ri_labels, frq, remap_table, noe_r1_table
 
 
+def spin_target_function(spin=None, spin_id=None, model_type=None, sim_index=None):
+    """Set up the model-free target function for the chi-squared calculation of a single spin.
+
+    @keyword spin:          The spin container.
+    @type spin:             SpinContainer instance
+    @keyword spin_id:       The spin identification string.
+    @type spin_id:          str
+    @keyword model_type:    The model type, one of 'all', 'diff', 'mf', or 'local_tm'.
+    @type model_type:       str
+    @keyword sim_index:     The optional MC simulation index.
+    @type sim_index:        int
+    @return:                The model-free target function object and the initial parameter vector.
+    @rtype:                 Mf instance, numpy rank-1 float64 array
+    """
+
+    # Create the initial parameter vector.
+    param_vector = assemble_param_vector(spin=spin, sim_index=sim_index)
+
+    # The relaxation data optimisation structures.
+    data = relax_data_opt_structs(spin, sim_index=sim_index)
+
+    # The spin data.
+    ri_data = [array(data[0])]
+    ri_data_err = [array(data[1])]
+    num_frq = [data[2]]
+    num_ri = [data[3]]
+    ri_labels = [data[4]]
+    frq = [data[5]]
+    remap_table = [data[6]]
+    noe_r1_table = [data[7]]
+    gx = [periodic_table.gyromagnetic_ratio(spin.isotope)]
+    if sim_index == None:
+        csa = [spin.csa]
+    else:
+        csa = [spin.csa_sim[sim_index]]
+
+    # The interatomic data.
+    interatoms = return_interatom_list(spin_hash=spin._hash)
+    for i in range(len(interatoms)):
+        # No relaxation mechanism.
+        if not interatoms[i].dipole_pair:
+            continue
+
+        # The surrounding spins.
+        if spin_id != interatoms[i].spin_id1:
+            spin_id2 = interatoms[i].spin_id1
+        else:
+            spin_id2 = interatoms[i].spin_id2
+        spin2 = return_spin(spin_id=spin_id2)
+
+        # The data.
+        if sim_index == None:
+            r = [interatoms[i].r]
+        else:
+            r = [interatoms[i].r_sim[sim_index]]
+
+        # Vectors.
+        if model_type != 'local_tm' and cdp.diff_tensor.type != 'sphere':
+            xh_unit_vectors = [interatoms[i].vector]
+        else:
+            xh_unit_vectors = [None]
+
+        # Gyromagnetic ratios.
+        gh = [periodic_table.gyromagnetic_ratio(spin2.isotope)]
+
+    # Count the number of model-free parameters for the residue index.
+    num_params = [len(spin.params)]
+
+    # Repackage the parameter values as a local model (ignore if the diffusion tensor is not fixed).
+    param_values = [assemble_param_vector(model_type='mf')]
+
+    # Package the diffusion tensor parameters.
+    if model_type == 'local_tm':
+        diff_params = [spin.local_tm]
+        diff_type = 'sphere'
+    else:
+        # Diff type.
+        diff_type = cdp.diff_tensor.type
+
+        # Spherical diffusion.
+        if diff_type == 'sphere':
+            diff_params = [cdp.diff_tensor.tm]
+
+        # Spheroidal diffusion.
+        elif diff_type == 'spheroid':
+            diff_params = [cdp.diff_tensor.tm, cdp.diff_tensor.Da, cdp.diff_tensor.theta, cdp.diff_tensor.phi]
+
+        # Ellipsoidal diffusion.
+        elif diff_type == 'ellipsoid':
+            diff_params = [cdp.diff_tensor.tm, cdp.diff_tensor.Da, cdp.diff_tensor.Dr, cdp.diff_tensor.alpha, cdp.diff_tensor.beta, cdp.diff_tensor.gamma]
+
+    # Initialise the model-free function.
+    mf = Mf(init_params=param_vector, model_type='mf', diff_type=diff_type, diff_params=diff_params, num_spins=1, equations=[spin.equation], param_types=[spin.params], param_values=param_values, relax_data=ri_data, errors=ri_data_err, bond_length=r, csa=csa, num_frq=num_frq, frq=frq, num_ri=num_ri, remap_table=remap_table, noe_r1_table=noe_r1_table, ri_labels=ri_labels, gx=gx, gh=gh, h_bar=h_bar, mu0=mu0, num_params=num_params, vectors=xh_unit_vectors)
+
+    # Return the target function and parameter vector.
+    return mf, param_vector
+
+
 
 class MF_memo(Memo):
     """The model-free memo class.
@@ -521,6 +755,27 @@ class MF_memo(Memo):
         self.sim_index = sim_index
         self.scaling_matrix = scaling_matrix
 
+        # The data pipe, as the results may be processed after switching pipes.
+        self.pipe_name = pipes.cdp_name()
+
+
+
+class MF_batch_memo(Memo):
+    """The model-free memo class for the batched grid search of many spins."""
+
+    def __init__(self, memos=None):
+        """Initialise the batched model-free memo class.
+
+        @keyword memos: The model-free memos for each spin of the batch.
+        @type memos:    list of MF_memo instances
+        """
+
+        # Execute the base class __init__() method.
+        super(MF_batch_memo, self).__init__()
+
+        # Store the arguments.
+        self.memos = memos
+
 
 
 class MF_minimise_command(Slave_command):
@@ -533,15 +788,17 @@ class MF_minimise_command(Slave_command):
         super(MF_minimise_command, self).__init__()
 
 
-    def optimise(self):
+    def optimise(self, processor):
         """Model-free optimisation.
 
-        @return:    The optimisation results consisting of the parameter vector, function value, iteration count, function count, gradient count, Hessian count, and warnings.
-        @rtype:     tuple of numpy array, float, int, int, int, int, str
+        @param processor:   The slave processor the command is running on.
+        @type processor:    Processor instance
+        @return:            The optimisation results consisting of the parameter vector, function value, iteration count, function count, gradient count, Hessian count, and warnings.
+        @rtype:             tuple of numpy array, float, int, int, int, int, str
         """
 
         # Minimisation.
-        results = generic_minimise(func=self.mf.func, dfunc=self.mf.dfunc, d2func=self.mf.d2func, args=(), x0=self.opt_params.param_vector, min_algor=self.opt_params.min_algor, min_options=self.opt_params.min_options, func_tol=self.opt_params.func_tol, grad_tol=self.opt_params.grad_tol, maxiter=self.opt_params.max_iterations, A=self.opt_params.A, b=self.opt_params.b, full_output=True, print_flag=self.opt_params.verbosity)
+        results = cached_optimise(generic_minimise, cache=self.opt_params.opt_cache, func=self.mf.func, dfunc=self.mf.dfunc, d2func=self.mf.d2func, args=(), x0=self.opt_params.param_vector, min_algor=self.opt_params.min_algor, min_options=self.opt_params.min_options, func_tol=self.opt_params.func_tol, grad_tol=self.opt_params.grad_tol, maxiter=self.opt_params.max_iterations, A=self.opt_params.A, b=self.opt_params.b, full_output=True, print_flag=self.opt_params.verbosity)
 
         # Return the minfx results unmodified.
         return results
@@ -550,15 +807,21 @@ class MF_minimise_command(Slave_command):
     def run(self, processor, completed):
         """Setup and perform the model-free optimisation."""
 
+        # Create the data of the streaming Monte Carlo simulation.
+        if self.data.sim_data != None:
+            generator, sim_index, keep = self.data.sim_data
+            values = generator.create(sim_index=sim_index)
+            self.data.ri_data = [array([values[k] for k in keep], float64)]
+
         # Initialise the function to minimise.
-        self.mf = Mf(init_params=self.opt_params.param_vector, model_type=self.data.model_type, diff_type=self.data.diff_type, diff_params=self.data.diff_params, scaling_matrix=self.data.scaling_matrix, num_spins=self.data.num_spins, equations=self.data.equations, param_types=self.data.param_types, param_values=self.data.param_values, relax_data=self.data.ri_data, errors=self.data.ri_data_err, bond_length=self.data.r, csa=self.data.csa, num_frq=self.data.num_frq, frq=self.data.frq, num_ri=self.data.num_ri, remap_table=self.data.remap_table, noe_r1_table=self.data.noe_r1_table, ri_labels=self.data.ri_types, gx=self.data.gx, gh=self.data.gh, h_bar=self.data.h_bar, mu0=self.data.mu0, num_params=self.data.num_params, vectors=self.data.xh_unit_vectors)
+        self.mf = init_target_function(self.data, self.opt_params)
 
         # Printout.
         if self.opt_params.verbosity >= 1 and (self.data.model_type == 'mf' or self.data.model_type == 'local_tm'):
             subsection(file=sys.stdout, text="Optimisation:  Spin '%s'" % self.data.spin_id, prespace=2, postspace=0)
 
         # Preform optimisation.
-        results = self.optimise()
+        results = self.optimise(processor)
 
         # Disassemble the results list.
         param_vector, func, iter, fc, gc, hc, warning = results
@@ -591,20 +854,29 @@ class MF_grid_command(MF_minimise_command):
         super(MF_grid_command, self).__init__()
 
 
-    def optimise(self):
+    def optimise(self, processor):
         """Model-free grid search.
 
-        @return:    The optimisation results consisting of the parameter vector, function value, iteration count, function count, gradient count, Hessian count, and warnings.
-        @rtype:     tuple of numpy array, float, int, int, int, int, str
+        The points of a subdivided grid are spread over the processes of the slave group.
+
+
+        @param processor:   The slave processor the command is running on.
+        @type processor:    Processor instance
+        @return:            The optimisation results consisting of the parameter vector, function value, iteration count, function count, gradient count, Hessian count, and warnings.
+        @rtype:             tuple of numpy array, float, int, int, int, int, str
         """
 
         # Normal grid search.
         if not hasattr(self.opt_params, 'subdivision'):
-            results = grid(func=self.mf.func, args=(), num_incs=self.opt_params.inc, lower=self.opt_params.lower, upper=self.opt_params.upper, A=self.opt_params.A, b=self.opt_params.b, verbosity=self.opt_params.verbosity)
+            results = cached_optimise(grid, cache=self.opt_params.opt_cache, func=self.mf.func, args=(), num_incs=self.opt_params.inc, lower=self.opt_params.lower, upper=self.opt_params.upper, A=self.opt_params.A, b=self.opt_params.b, verbosity=self.opt_params.verbosity)
 
         # Subdivided grid.
+        elif processor.group_size() == 1:
+            results = cached_optimise(grid_point_array, cache=self.opt_params.opt_cache, func=self.mf.func, args=(), points=self.opt_params.subdivision, verbosity=self.opt_params.verbosity)
+
+        # Subdivided grid spread over the slave group.
         else:
-            results = grid_point_array(func=self.mf.func, args=(), points=self.opt_params.subdivision, verbosity=self.opt_params.verbosity)
+            results = self.group_grid(processor)
 
         # Unpack the results.
         param_vector, func, iter, warning = results
@@ -616,6 +888,105 @@ class MF_grid_command(MF_minimise_command):
         return param_vector, func, iter, fc, gc, hc, warning
 
 
+    def group_grid(self, processor):
+        """Grid search over the points of the grid subdivision, spread over the processes of the slave group.
+
+        @param processor:   The slave processor the command is running on.
+        @type processor:    Processor instance
+        @return:            The parameter vector, function value, iteration count, and warning.
+        @rtype:             numpy rank-1 array, float, int, None
+        """
+
+        # The target function values of all points.
+        points = list(self.opt_params.subdivision)
+        values = processor.group_map(partial(grid_point_values, self.data, self.opt_params), points)
+
+        # The first minimum, as found by the minfx grid_point_array() function.
+        index = 0
+        for i in range(1, len(values)):
+            if values[i] < values[index]:
+                index = i
+
+        # Printout.
+        if self.opt_params.verbosity >= 1:
+            print("Grid search:  %s points spread over %s processes, chi2 = %s" % (len(points), processor.group_size(), values[index]))
+
+        # Return the results.
+        return array(points[index], float64), values[index], len(points), None
+
+
+
+class MF_grid_batch_command(Slave_command):
+    """Command class for the vectorised grid search of the model-free parameters of many spins.
+
+    The 'mf' and 'local_tm' model types are supported.  The spectral density tables of the target function class are shared between all spins of the batch.
+    """
+
+    def __init__(self):
+        """Initialise all the data."""
+
+        # Execute the base class __init__() method.
+        super(MF_grid_batch_command, self).__init__()
+
+        # The per-spin data.
+        self.data = []
+        self.opt_params = []
+
+
+    def run(self, processor, completed):
+        """Setup and perform the grid search for all spins, spread over the processes of the slave group."""
+
+        # The grid search of all spins.
+        results = processor.group_map(grid_spins, list(zip(self.data, self.opt_params)))
+
+        # Return the results.
+        processor.return_object(MF_batch_result_command(processor, self.memo_id, results, completed=False))
+
+
+    def store_data(self, data, opt_params):
+        """Add the data of a spin to the batch.
+
+        @param data:        The data used to initialise the model-free target function class.
+        @type data:         class instance
+        @param opt_params:  The parameters and data required for optimisation using minfx.
+        @type opt_params:   class instance
+        """
+
+        # Store the data.
+        self.data.append(data)
+        self.opt_params.append(opt_params)
+
+
+
+class MF_batch_result_command(Result_command):
+    """Class for processing the model-free results of many spins."""
+
+    def __init__(self, processor, memo_id, results, completed):
+        """Set up the class, placing the minimisation results here."""
+
+        # Execute the base class __init__() method.
+        super(MF_batch_result_command, self).__init__(processor=processor, completed=completed)
+
+        # Store the arguments.
+        self.memo_id = memo_id
+        self.results = results
+
+
+    def run(self, processor, memo):
+        """Disassemble the model-free optimisation results of all spins.
+
+        @param processor:   Unused!
+        @type processor:    None
+        @param memo:        The batched model-free memo.
+        @type memo:         MF_batch_memo instance
+        """
+
+        # Disassemble the results of each spin.
+        for spin_memo, results in zip(memo.memos, self.results):
+            param_vector, func, iter, fc, gc, hc, warning = results
+            disassemble_result(param_vector=param_vector, func=func, iter=iter, fc=fc, gc=gc, hc=hc, warning=warning, spin=spin_memo.spin, sim_index=spin_memo.sim_index, model_type=spin_memo.model_type, scaling_matrix=spin_memo.scaling_matrix, pipe_name=spin_memo.pipe_name)
+
+
 
 class MF_result_command(Result_command):
     """Class for processing the model-free results."""
@@ -647,4 +1018,4 @@ class MF_result_command(Result_command):
         """
 
         # Disassemble the results.
-        disassemble_result(param_vector=self.param_vector, func=self.func, iter=self.iter, fc=self.fc, gc=self.gc, hc=self.hc, warning=self.warning, spin=memo.spin, sim_index=memo.sim_index, model_type=memo.model_type, scaling_matrix=memo.scaling_matrix)
+        disassemble_result(param_vector=self.param_vector, func=self.func, iter=self.iter, fc=self.fc, gc=self.gc, hc=self.hc, warning=self.warning, spin=memo.spin, sim_index=memo.sim_index, model_type=memo.model_type, scaling_matrix=memo.scaling_matrix, pipe_name=memo.pipe_name)
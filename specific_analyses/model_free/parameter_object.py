@@ -26,10 +26,34 @@
 from math import pi
 
 # relax module imports.
+from lib.errors import RelaxError
 from lib.physical_constants import N15_CSA
 from pipe_control import relax_data
 from specific_analyses.parameter_object import Param_list
-from specific_analyses.model_free.parameters import conv_factor_rex, units_rex
+
+
+def conv_factor_rex():
+    """Calculate and return the Rex conversion factor.
+
+    @return:    The Rex conversion factor.
+    @rtype:     float
+    """
+
+    # No frequency info.
+    if not hasattr(cdp, 'spectrometer_frq'):
+        raise RelaxError("No spectrometer frequency information is present in the current data pipe.")
+
+    # The 1st spectrometer frequency.
+    if hasattr(cdp, 'ri_ids'):
+        frq = cdp.spectrometer_frq[cdp.ri_ids[0]]
+
+    # Take the highest frequency, if all else fails.
+    else:
+        frqs = sorted(cdp.spectrometer_frq.values())
+        frq = frqs[-1]
+
+    # The factor.
+    return 1.0 / (2.0 * pi * frq)**2
 
 
 def rex_scaling(model_info=None):
@@ -60,6 +84,21 @@ def rex_upper(incs=None, model_info=None):
     return 5.0 / (2.0 * pi * cdp.spectrometer_frq[cdp.ri_ids[0]])**2
 
 
+def units_rex():
+    """Return the units for the Rex parameter.
+
+    @return:    The field strength dependent Rex units.
+    @rtype:     str
+    """
+
+    # No frequency info.
+    if not hasattr(cdp, 'frq_labels') or len(cdp.frq_labels) == 0:
+        return ''
+
+    # The units.
+    return cdp.frq_labels[0] + ' MHz'
+
+
 
 class Model_free_params(Param_list):
     """The Lipari-Szabo model-free parameter list singleton."""
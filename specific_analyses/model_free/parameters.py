@@ -25,7 +25,6 @@
 """The model-free analysis parameter functions."""
 
 # Python module imports.
-from math import pi
 from numpy import array, float64, int8, zeros
 from re import match
 
@@ -323,30 +322,6 @@ def assemble_param_vector(spin=None, spin_id=None, sim_index=None, model_type=No
     return array(param_vector, float64)
 
 
-def conv_factor_rex():
-    """Calculate and return the Rex conversion factor.
-
-    @return:    The Rex conversion factor.
-    @rtype:     float
-    """
-
-    # No frequency info.
-    if not hasattr(cdp, 'spectrometer_frq'):
-        raise RelaxError("No spectrometer frequency information is present in the current data pipe.")
-
-    # The 1st spectrometer frequency.
-    if hasattr(cdp, 'ri_ids'):
-        frq = cdp.spectrometer_frq[cdp.ri_ids[0]]
-
-    # Take the highest frequency, if all else fails.
-    else:
-        frqs = sorted(cdp.spectrometer_frq.values())
-        frq = frqs[-1]
-
-    # The factor.
-    return 1.0 / (2.0 * pi * frq)**2
-
-
 def disassemble_param_vector(model_type, param_vector=None, spin=None, spin_id=None, sim_index=None):
     """Disassemble the model-free parameter vector.
 
@@ -922,18 +897,3 @@ def linear_constraints(num_params, model_type=None, spin=None, spin_id=None, sca
     b = array(b, float64)
 
     return A, b
-
-
-def units_rex():
-    """Return the units for the Rex parameter.
-
-    @return:    The field strength dependent Rex units.
-    @rtype:     str
-    """
-
-    # No frequency info.
-    if not hasattr(cdp, 'frq_labels') or len(cdp.frq_labels) == 0:
-        return ''
-
-    # The units.
-    return cdp.frq_labels[0] + ' MHz'
@@ -33,14 +33,10 @@ from pipe_control import pipes
 from pipe_control.mol_res_spin import exists_mol_res_spin_data, spin_loop
 from pipe_control.pipes import check_pipe
 import specific_analyses
-from specific_analyses.model_free.api import Model_free
 from specific_analyses.model_free.model import model_map
 from user_functions.data import Uf_tables; uf_tables = Uf_tables()
 from user_functions.objects import Desc_container
 
-# The API object.
-api_model_free = Model_free()
-
 
 # Classic style documentation.
 classic_style_doc = Desc_container("Model-free classic style")
@@ -232,6 +228,10 @@ def delete():
     if not exists_mol_res_spin_data():
         raise RelaxNoSequenceError
 
+    # The API object, imported here so that the user function definitions do not load the analysis.
+    from specific_analyses.model_free.api import Model_free
+    api_model_free = Model_free()
+
     # Get all data structure names.
     names = api_model_free.data_names(scope='spin')
 
@@ -266,6 +266,10 @@ def model_setup(model=None, equation=None, params=None, spin_id=None):
             if param == 'local_tm' and hasattr(pipes.get_pipe(), 'diff_tensor'):
                 raise RelaxTensorError('diffusion')
 
+    # The API object.
+    from specific_analyses.model_free.api import Model_free
+    api_model_free = Model_free()
+
     # Loop over the sequence.
     for spin, spin_id in spin_loop(spin_id, return_id=True):
         # Initialise the data structures (if needed).
@@ -34,6 +34,7 @@ from warnings import warn
 import lib.arg_check
 from lib.errors import RelaxError, RelaxInfError, RelaxNaNError, RelaxNoModelError
 from lib.float import isNaN, isInf
+from lib.optimisation_cache import cached_optimise
 from lib.warnings import RelaxWarning
 from pipe_control import align_tensor, pcs, rdc
 from pipe_control.align_tensor import opt_uses_align_data, opt_uses_tensor
@@ -45,6 +46,7 @@ from specific_analyses.n_state_model.data import base_data_types, calc_ave_dist,
 from specific_analyses.n_state_model.optimisation import minimise_bc_data, target_fn_setup
 from specific_analyses.n_state_model.parameter_object import N_state_params
 from specific_analyses.n_state_model.parameters import assemble_param_vector, disassemble_param_vector, linear_constraints, param_num
+from status import Status; status = Status()
 from target_functions.potential import quad_pot
 
 
@@ -504,7 +506,7 @@ class N_state_model(API_base, API_common):
         # Grid search.
         if search('^[Gg]rid', min_algor):
             # The search.
-            results = grid(func=model.func, args=(), num_incs=inc[0], lower=lower[0], upper=upper[0], A=A, b=b, verbosity=verbosity)
+            results = cached_optimise(grid, cache=status.opt_cache, func=model.func, args=(), num_incs=inc[0], lower=lower[0], upper=upper[0], A=A, b=b, verbosity=verbosity)
 
             # Unpack the results.
             param_vector, func, iter_count, warning = results
@@ -514,7 +516,7 @@ class N_state_model(API_base, API_common):
 
         # Minimisation.
         else:
-            results = generic_minimise(func=model.func, dfunc=model.dfunc, d2func=model.d2func, args=(), x0=param_vector, min_algor=min_algor, min_options=min_options, func_tol=func_tol, grad_tol=grad_tol, maxiter=max_iterations, A=A, b=b, full_output=1, print_flag=verbosity)
+            results = cached_optimise(generic_minimise, cache=status.opt_cache, func=model.func, dfunc=model.dfunc, d2func=model.d2func, args=(), x0=param_vector, min_algor=min_algor, min_options=min_options, func_tol=func_tol, grad_tol=grad_tol, maxiter=max_iterations, A=A, b=b, full_output=1, print_flag=verbosity)
 
             # Unpack the results.
             if results == None:
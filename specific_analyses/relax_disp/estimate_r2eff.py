@@ -24,13 +24,14 @@
 
 # Python module imports.
 from copy import deepcopy
-from numpy import array, asarray, diag, exp, log, ones, sqrt, sum, transpose, zeros
+from numpy import array, asarray, bool_, diag, exp, float64, log, ones, sqrt, sum, transpose, zeros
 from minfx.generic import generic_minimise
 import sys
 from warnings import warn
 
 # relax module imports.
 from dep_check import C_module_exp_fn, scipy_module
+from lib.curve_fit.exponential import exponential_2param_neg_batch, exponential_2param_neg_batch_errors
 from lib.dispersion.variables import MODEL_R2EFF
 from lib.errors import RelaxError
 from lib.statistics import multifit_covar
@@ -52,6 +53,9 @@ if scipy_module:
 def estimate_r2eff_err(spin_id=None, epsrel=0.0, verbosity=1):
     """This will estimate the R2eff and i0 errors from the covariance matrix Qxx.  Qxx is calculated from the Jacobian matrix and the optimised parameters.
 
+    The errors for all exponential curves of all spins are calculated simultaneously.
+
+
     @keyword spin_id:       The spin identification string.
     @type spin_id:          str
     @param epsrel:          Any columns of R which satisfy |R_{kk}| <= epsrel |R_{11}| are considered linearly-dependent and are excluded from the covariance matrix, where the corresponding rows and columns of the covariance matrix are set to zero.
@@ -60,10 +64,6 @@ def estimate_r2eff_err(spin_id=None, epsrel=0.0, verbosity=1):
     @type verbosity:        int
     """
 
-    # Check that the C modules have been compiled.
-    if not C_module_exp_fn:
-        raise RelaxError("Relaxation curve fitting is not available.  Try compiling the C modules on your platform.")
-
     # Perform checks.
     check_model_type(model=MODEL_R2EFF)
 
@@ -82,88 +82,66 @@ def estimate_r2eff_err(spin_id=None, epsrel=0.0, verbosity=1):
                 text = "Spin %s contains a gradient count of 0.0.  Is the R2eff parameter optimised?  Try execute: minimise.execute(min_algor='Newton', constraints=False)" %(spin_string)
                 warn(RelaxWarning("%s." % text))
 
+    # Pack all exponential curves.
+    curves, times, values, errors, mask = pack_exp_curves(spin_id=spin_id)
+
+    # The optimised parameters.
+    r2eff = zeros(len(curves), float64)
+    i0 = zeros(len(curves), float64)
+    for i in range(len(curves)):
+        cur_spin, spin_string, param_key, exp_type, frq, offset, point = curves[i]
+        r2eff[i] = cur_spin.r2eff[param_key]
+        i0[i] = cur_spin.i0[param_key]
+
+    # Calculate the errors of all curves.
+    r2eff_err, i0_err = exponential_2param_neg_batch_errors(rate=r2eff, i0=i0, times=times, errors=errors, mask=mask)
+
+    # Loop over the curves.
+    last_spin = None
+    for i in range(len(curves)):
+        # Unpack the curve information.
+        cur_spin, spin_string, param_key, exp_type, frq, offset, point = curves[i]
+
         # Print information.
-        if verbosity >= 1:
+        if verbosity >= 1 and cur_spin is not last_spin:
             # Individual spin block section.
             top = 2
             if verbosity >= 2:
                 top += 2
             subsection(file=sys.stdout, text="Estimating R2eff error for spin: %s"%spin_string, prespace=top)
+        last_spin = cur_spin
 
-        # Loop over each spectrometer frequency and dispersion point.
-        for exp_type, frq, offset, point, ei, mi, oi, di in loop_exp_frq_offset_point(return_indices=True):
-            # The parameter key.
-            param_key = return_param_key_from_data(exp_type=exp_type, frq=frq, offset=offset, point=point)
-
-            # Extract values.
-            r2eff = getattr(cur_spin, 'r2eff')[param_key]
-            i0 = getattr(cur_spin, 'i0')[param_key]
+        # Copy r2eff dictionary, to r2eff_err dictionary. They have same keys to the dictionary,
+        if not hasattr(cur_spin, 'r2eff_err'):
+            setattr(cur_spin, 'r2eff_err', deepcopy(getattr(cur_spin, 'r2eff')))
+        if not hasattr(cur_spin, 'i0_err'):
+            setattr(cur_spin, 'i0_err', deepcopy(getattr(cur_spin, 'i0')))
 
-            # Pack data
-            param_vector = [r2eff, i0]
+        # Set error.
+        cur_spin.r2eff_err[param_key] = r2eff_err[i]
+        cur_spin.i0_err[param_key] = i0_err[i]
 
-            # The peak intensities, errors and times.
-            values = []
-            errors = []
-            times = []
-            for time in loop_time(exp_type=exp_type, frq=frq, offset=offset, point=point):
-                values.append(average_intensity(spin=cur_spin, exp_type=exp_type, frq=frq, offset=offset, point=point, time=time))
-                errors.append(average_intensity(spin=cur_spin, exp_type=exp_type, frq=frq, offset=offset, point=point, time=time, error=True))
-                times.append(time)
-
-            # Convert to numpy array.
-            values = asarray(values)
-            errors = asarray(errors)
-            times = asarray(times)
+        # Get other relevant information.
+        chi2 = getattr(cur_spin, 'chi2')
 
-            # Initialise data in C code.
-            scaling_list = [1.0, 1.0]
-            model = Relax_fit_opt(model='exp', num_params=len(param_vector), values=values, errors=errors, relax_times=times, scaling_matrix=scaling_list)
-
-            # Use the direct Jacobian from function.
-            jacobian_matrix_exp = transpose(asarray( model.jacobian(param_vector) ) )
-            weights = 1. / errors**2
-
-            # Get the co-variance
-            pcov = multifit_covar(J=jacobian_matrix_exp, weights=weights)
-
-            # To compute one standard deviation errors on the parameters, take the square root of the diagonal covariance.
-            param_vector_error = sqrt(diag(pcov))
-
-            # Extract values.
-            r2eff_err, i0_err = param_vector_error
-
-            # Copy r2eff dictionary, to r2eff_err dictionary. They have same keys to the dictionary,
-            if not hasattr(cur_spin, 'r2eff_err'):
-                setattr(cur_spin, 'r2eff_err', deepcopy(getattr(cur_spin, 'r2eff')))
-            if not hasattr(cur_spin, 'i0_err'):
-                setattr(cur_spin, 'i0_err', deepcopy(getattr(cur_spin, 'i0')))
-
-            # Set error.
-            cur_spin.r2eff_err[param_key] = r2eff_err
-            cur_spin.i0_err[param_key] = i0_err
+        # Print information.
+        print_strings = []
+        if verbosity >= 1:
+            # Add print strings.
+            point_info = "%s at %3.1f MHz, for offset=%3.3f ppm and dispersion point %-5.1f, with %i time points." % (exp_type, frq/1E6, offset, point, mask[i].sum())
+            print_strings.append(point_info)
 
-            # Get other relevant information.
-            chi2 = getattr(cur_spin, 'chi2')
+            par_info = "r2eff=%3.3f r2eff_err=%3.4f, i0=%6.1f, i0_err=%3.4f, chi2=%3.3f.\n" % ( r2eff[i], r2eff_err[i], i0[i], i0_err[i], chi2)
+            print_strings.append(par_info)
 
-            # Print information.
-            print_strings = []
-            if verbosity >= 1:
-                # Add print strings.
-                point_info = "%s at %3.1f MHz, for offset=%3.3f ppm and dispersion point %-5.1f, with %i time points." % (exp_type, frq/1E6, offset, point, len(times))
-                print_strings.append(point_info)
+            if verbosity >= 2:
+                time_info = ', '.join(map(str, times[i][mask[i]]))
+                print_strings.append('For time array: '+time_info+'.\n\n')
 
-                par_info = "r2eff=%3.3f r2eff_err=%3.4f, i0=%6.1f, i0_err=%3.4f, chi2=%3.3f.\n" % ( r2eff, r2eff_err, i0, i0_err, chi2)
-                print_strings.append(par_info)
-
-                if verbosity >= 2:
-                    time_info = ', '.join(map(str, times))
-                    print_strings.append('For time array: '+time_info+'.\n\n')
-
-            # Print info
-            if len(print_strings) > 0:
-                for print_string in print_strings:
-                    print(print_string),
+        # Print info
+        if len(print_strings) > 0:
+            for print_string in print_strings:
+                print(print_string),
 
 
 #### This class is only for testing.
@@ -507,7 +485,7 @@ def estimate_r2eff(method='minfx', min_algor='simplex', c_code=True, constraints
     Then solving initial guess by linear least squares of: ln(Intensity[j]) = ln(i0) - time[j]* r2eff.
 
 
-    @keyword method:            The method to minimise and estimate errors.  Options are: 'minfx' or 'scipy.optimize.leastsq'.
+    @keyword method:            The method to minimise and estimate errors.  Options are: 'minfx', 'scipy.optimize.leastsq' or 'batch'.  The 'batch' method simultaneously fits all exponential curves of all spins using a vectorised Levenberg-Marquardt algorithm, with the ftol and maxfev arguments used as the function tolerance and maximum number of iterations.
     @type method:               string
     @keyword min_algor:         The minimisation algorithm
     @type min_algor:            string
@@ -538,6 +516,11 @@ def estimate_r2eff(method='minfx', min_algor='simplex', c_code=True, constraints
     if not C_module_exp_fn and method == 'minfx':
         raise RelaxError("Relaxation curve fitting is not available.  Try compiling the C modules on your platform.")
 
+    # Simultaneous fitting of all curves.
+    if method == 'batch':
+        minimise_batch(spin_id=spin_id, func_tol=ftol, max_iterations=maxfev, verbosity=verbosity)
+        return
+
     # Set class scipy setting.
     E = Exp(verbosity=verbosity)
     E.set_settings_leastsq(ftol=ftol, xtol=xtol, maxfev=maxfev, factor=factor)
@@ -847,3 +830,135 @@ def minimise_minfx(E=None):
 
     # Return, including errors.
     return results
+
+
+def minimise_batch(spin_id=None, func_tol=1e-15, max_iterations=10000000, verbosity=1):
+    """Estimate r2eff and errors by simultaneously fitting all exponential curves with a vectorised Levenberg-Marquardt algorithm.
+
+    @keyword spin_id:           The spin identification string.
+    @type spin_id:              str
+    @keyword func_tol:          The relative chi-squared change which, when reached, terminates optimisation of a curve.
+    @type func_tol:             float
+    @keyword max_iterations:    The maximum number of iterations.
+    @type max_iterations:       int
+    @keyword verbosity:         The amount of information to print.  The higher the value, the greater the verbosity.
+    @type verbosity:            int
+    """
+
+    # Pack all exponential curves.
+    curves, times, values, errors, mask = pack_exp_curves(spin_id=spin_id)
+
+    # Fit all curves.
+    r2eff, i0, r2eff_err, i0_err, chi2, iter_count = exponential_2param_neg_batch(times=times, values=values, errors=errors, mask=mask, func_tol=func_tol, max_iterations=max_iterations)
+
+    # Loop over the curves.
+    last_spin = None
+    for i in range(len(curves)):
+        # Unpack the curve information.
+        cur_spin, spin_string, param_key, exp_type, frq, offset, point = curves[i]
+
+        # Print information.
+        if verbosity >= 1 and cur_spin is not last_spin:
+            # Individual spin block section.
+            top = 2
+            if verbosity >= 2:
+                top += 2
+            subsection(file=sys.stdout, text="Fitting with batch to: %s"%spin_string, prespace=top)
+        last_spin = cur_spin
+
+        # Disassemble the parameter vector.
+        disassemble_param_vector(param_vector=[r2eff[i], i0[i]], spins=[cur_spin], key=param_key)
+
+        # Errors.
+        if not hasattr(cur_spin, 'r2eff_err'):
+            setattr(cur_spin, 'r2eff_err', deepcopy(getattr(cur_spin, 'r2eff')))
+        if not hasattr(cur_spin, 'i0_err'):
+            setattr(cur_spin, 'i0_err', deepcopy(getattr(cur_spin, 'i0')))
+
+        # Set error.
+        cur_spin.r2eff_err[param_key] = r2eff_err[i]
+        cur_spin.i0_err[param_key] = i0_err[i]
+
+        # Chi-squared statistic.
+        cur_spin.chi2 = chi2[i]
+
+        # Iterations.
+        cur_spin.f_count = int(iter_count[i])
+
+        # Warning.
+        cur_spin.warning = None
+
+        # Print information.
+        print_strings = []
+        if verbosity >= 1:
+            # Add print strings.
+            point_info = "%s at %3.1f MHz, for offset=%3.3f ppm and dispersion point %-5.1f, with %i time points." % (exp_type, frq/1E6, offset, point, mask[i].sum())
+            print_strings.append(point_info)
+
+            par_info = "r2eff=%3.3f r2eff_err=%3.4f, i0=%6.1f, i0_err=%3.4f, chi2=%3.3f.\n" % ( r2eff[i], r2eff_err[i], i0[i], i0_err[i], chi2[i])
+            print_strings.append(par_info)
+
+            if verbosity >= 2:
+                time_info = ', '.join(map(str, times[i][mask[i]]))
+                print_strings.append('For time array: '+time_info+'.\n\n')
+
+        # Print info
+        if len(print_strings) > 0:
+            for print_string in print_strings:
+                print(print_string),
+
+
+def pack_exp_curves(spin_id=None):
+    """Pack the exponential curves of all selected spins into padded numpy arrays.
+
+    @keyword spin_id:   The spin identification string.
+    @type spin_id:      str
+    @return:            The list of curve information, each element of which is the spin container, spin string, parameter key, experiment type, spectrometer frequency, offset and dispersion point.  This is followed by the time, intensity, intensity error and padding mask arrays, with one row per curve.
+    @rtype:             list of tuples, 3 numpy rank-2 float arrays, numpy rank-2 bool array
+    """
+
+    # Collect the data.
+    curves = []
+    data = []
+    for cur_spin, mol_name, resi, resn, cur_spin_id in spin_loop(selection=spin_id, full_info=True, return_id=True, skip_desel=True):
+        # Generate spin string.
+        spin_string = generate_spin_string(spin=cur_spin, mol_name=mol_name, res_num=resi, res_name=resn)
+
+        # Loop over each spectrometer frequency and dispersion point.
+        for exp_type, frq, offset, point, ei, mi, oi, di in loop_exp_frq_offset_point(return_indices=True):
+            # The parameter key.
+            param_key = return_param_key_from_data(exp_type=exp_type, frq=frq, offset=offset, point=point)
+
+            # The peak intensities, errors and times.
+            values = []
+            errors = []
+            times = []
+            for time in loop_time(exp_type=exp_type, frq=frq, offset=offset, point=point):
+                values.append(average_intensity(spin=cur_spin, exp_type=exp_type, frq=frq, offset=offset, point=point, time=time))
+                errors.append(average_intensity(spin=cur_spin, exp_type=exp_type, frq=frq, offset=offset, point=point, time=time, error=True))
+                times.append(time)
+
+            # Store.
+            curves.append((cur_spin, spin_string, param_key, exp_type, frq, offset, point))
+            data.append((times, values, errors))
+
+    # The padded arrays.
+    num_times = 0
+    for times, values, errors in data:
+        num_times = max(num_times, len(times))
+    times_array = zeros((len(data), num_times), float64)
+    values_array = zeros((len(data), num_times), float64)
+    errors_array = ones((len(data), num_times), float64)
+    mask = zeros((len(data), num_times), bool_)
+
+    # Fill the arrays.
+    for i in range(len(data)):
+        times, values, errors = data[i]
+        num = len(times)
+        times_array[i, :num] = times
+        values_array[i, :num] = values
+        errors_array[i, :num] = errors
+        mask[i, :num] = True
+
+    # Return the data.
+    return curves, times_array, values_array, errors_array, mask
@@ -38,6 +38,7 @@ from dep_check import C_module_exp_fn
 from lib.dispersion.two_point import calc_two_point_r2eff, calc_two_point_r2eff_err
 from lib.dispersion.variables import EXP_TYPE_LIST_CPMG, MODEL_CR72, MODEL_CR72_FULL, MODEL_LM63, MODEL_M61, MODEL_MP05, MODEL_TAP03, MODEL_TP02
 from lib.errors import RelaxError
+from lib.optimisation_cache import cached_optimise
 from lib.text.sectioning import subsection
 from lib.warnings import RelaxWarning
 from multi import Memo, Result_command, Slave_command
@@ -45,6 +46,7 @@ from pipe_control.mol_res_spin import generate_spin_string, spin_loop
 from specific_analyses.relax_disp.checks import check_disp_points, check_exp_type, check_exp_type_fixed_time
 from specific_analyses.relax_disp.data import average_intensity, count_spins, find_intensity_keys, has_exponential_exp_type, has_proton_mmq_cpmg, is_r1_optimised, loop_exp, loop_exp_frq_offset_point, loop_exp_frq_offset_point_time, loop_frq, loop_offset, loop_time, pack_back_calc_r2eff, return_cpmg_frqs, return_offset_data, return_param_key_from_data, return_r1_data, return_r2eff_arrays, return_spin_lock_nu1
 from specific_analyses.relax_disp.parameters import assemble_param_vector, disassemble_param_vector, linear_constraints, param_conversion, param_num, r1_setup
+from status import Status; status = Status()
 from target_functions.relax_disp import Dispersion
 from target_functions.relax_fit_wrapper import Relax_fit_opt
 
@@ -434,7 +436,7 @@ def minimise_r2eff(spins=None, spin_ids=None, min_algor=None, min_options=None,
 
             # Grid search.
             if search('^[Gg]rid', min_algor):
-                results = grid(func=model.func, args=(), num_incs=inc, lower=lower, upper=upper, A=A, b=b, verbosity=verbosity)
+                results = cached_optimise(grid, cache=status.opt_cache, func=model.func, args=(), num_incs=inc, lower=lower, upper=upper, A=A, b=b, verbosity=verbosity)
 
                 # Unpack the results.
                 param_vector, chi2, iter_count, warning = results
@@ -444,7 +446,7 @@ def minimise_r2eff(spins=None, spin_ids=None, min_algor=None, min_options=None,
 
             # Minimisation.
             else:
-                results = generic_minimise(func=model.func, dfunc=model.dfunc, d2func=model.d2func, args=(), x0=param_vector, min_algor=min_algor, min_options=min_options, func_tol=func_tol, grad_tol=grad_tol, maxiter=max_iterations, A=A, b=b, full_output=True, print_flag=verbosity)
+                results = cached_optimise(generic_minimise, cache=status.opt_cache, func=model.func, dfunc=model.dfunc, d2func=model.d2func, args=(), x0=param_vector, min_algor=min_algor, min_options=min_options, func_tol=func_tol, grad_tol=grad_tol, maxiter=max_iterations, A=A, b=b, full_output=True, print_flag=verbosity)
 
                 # Unpack the results.
                 if results == None:
@@ -596,6 +598,9 @@ class Disp_minimise_command(Slave_command):
         self.fields = fields
         self.param_names = param_names
 
+        # The optimisation results cache, taken from the master.
+        self.opt_cache = status.opt_cache
+
         # Create the initial parameter vector.
         self.param_vector = assemble_param_vector(spins=self.spins)
         if len(scaling_matrix):
@@ -651,7 +656,7 @@ class Disp_minimise_command(Slave_command):
 
         # Grid search.
         if search('^[Gg]rid', self.min_algor):
-            results = grid(func=model.func, args=(), num_incs=self.inc, lower=self.lower, upper=self.upper, A=self.A, b=self.b, verbosity=self.verbosity)
+            results = cached_optimise(grid, cache=self.opt_cache, func=model.func, args=(), num_incs=self.inc, lower=self.lower, upper=self.upper, A=self.A, b=self.b, verbosity=self.verbosity)
 
             # Unpack the results.
             param_vector, chi2, iter_count, warning = results
@@ -661,7 +666,7 @@ class Disp_minimise_command(Slave_command):
 
         # Minimisation.
         else:
-            results = generic_minimise(func=model.func, args=(), x0=self.param_vector, min_algor=self.min_algor, min_options=self.min_options, func_tol=self.func_tol, grad_tol=self.grad_tol, maxiter=self.max_iterations, A=self.A, b=self.b, full_output=True, print_flag=self.verbosity)
+            results = cached_optimise(generic_minimise, cache=self.opt_cache, func=model.func, args=(), x0=self.param_vector, min_algor=self.min_algor, min_options=self.min_options, func_tol=self.func_tol, grad_tol=self.grad_tol, maxiter=self.max_iterations, A=self.A, b=self.b, full_output=True, print_flag=self.verbosity)
 
             # Unpack the results.
             if results == None:
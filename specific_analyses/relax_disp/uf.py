@@ -33,13 +33,7 @@ from lib.dispersion.variables import MODEL_DESC, MODEL_LIST_FULL, MODEL_PARAMS,
 from lib.errors import RelaxError
 from pipe_control.mol_res_spin import check_mol_res_spin_data, spin_loop
 from pipe_control.pipes import check_pipe
-from specific_analyses.relax_disp.api import Relax_disp
 from specific_analyses.relax_disp.checks import check_c_modules, check_exp_type, check_pipe_type
-from specific_analyses.relax_disp.data import get_curve_type
-
-
-# The API object.
-api_relax_disp = Relax_disp()
 
 
 def cluster(cluster_id=None, spin_id=None):
@@ -121,6 +115,10 @@ def model_setup(model, params):
     else:
         cdp.model_type = 'disp'
 
+    # The API object, imported here so that the user function definitions do not load the analysis.
+    from specific_analyses.relax_disp.api import Relax_disp
+    api_relax_disp = Relax_disp()
+
     # Loop over the sequence.
     for spin, spin_id in spin_loop(skip_desel=True, return_id=True):
         # The model and parameter names.
@@ -156,6 +154,7 @@ def select_model(model=MODEL_R2EFF):
     check_exp_type()
 
     # The curve type.
+    from specific_analyses.relax_disp.data import get_curve_type
     curve_type = get_curve_type()
     if model == MODEL_R2EFF and curve_type == 'exponential':
         check_c_modules()
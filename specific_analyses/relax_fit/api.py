@@ -36,15 +36,18 @@ from warnings import warn
 # relax module imports.
 from dep_check import C_module_exp_fn
 from lib.errors import RelaxError, RelaxNoModelError
+from lib.optimisation_cache import cached_optimise
 from lib.text.sectioning import subsection
 from lib.warnings import RelaxDeselectWarning
 from pipe_control.mol_res_spin import check_mol_res_spin_data, return_spin, spin_loop
+from pipe_control.spectrum import intensity_store
 from specific_analyses.api_base import API_base
 from specific_analyses.api_common import API_common
 from specific_analyses.relax_fit.checks import check_model_setup
 from specific_analyses.relax_fit.optimisation import back_calc
 from specific_analyses.relax_fit.parameter_object import Relax_fit_params
 from specific_analyses.relax_fit.parameters import assemble_param_vector, disassemble_param_vector, linear_constraints
+from status import Status; status = Status()
 from target_functions.relax_fit_wrapper import Relax_fit_opt
 
 
@@ -396,7 +399,7 @@ class Relax_fit(API_base, API_common):
 
             # Grid search.
             if search('^[Gg]rid', min_algor):
-                results = grid(func=model.func, args=(), num_incs=inc[model_index], lower=lower[model_index], upper=upper[model_index], A=A, b=b, verbosity=verbosity)
+                results = cached_optimise(grid, cache=status.opt_cache, func=model.func, args=(), num_incs=inc[model_index], lower=lower[model_index], upper=upper[model_index], A=A, b=b, verbosity=verbosity)
 
                 # Unpack the results.
                 param_vector, chi2, iter_count, warning = results
@@ -406,7 +409,7 @@ class Relax_fit(API_base, API_common):
 
             # Minimisation.
             else:
-                results = generic_minimise(func=model.func, dfunc=model.dfunc, d2func=model.d2func, args=(), x0=param_vector, min_algor=min_algor, min_options=min_options, func_tol=func_tol, grad_tol=grad_tol, maxiter=max_iterations, A=A, b=b, full_output=True, print_flag=verbosity)
+                results = cached_optimise(generic_minimise, cache=status.opt_cache, func=model.func, dfunc=model.dfunc, d2func=model.d2func, args=(), x0=param_vector, min_algor=min_algor, min_options=min_options, func_tol=func_tol, grad_tol=grad_tol, maxiter=max_iterations, A=A, b=b, full_output=True, print_flag=verbosity)
 
                 # Unpack the results.
                 if results == None:
@@ -557,5 +560,5 @@ class Relax_fit(API_base, API_common):
         # Get the spin container.
         spin = return_spin(spin_id=data_id)
 
-        # Create the data structure.
-        spin.peak_intensity_sim = sim_data
+        # Pack the data into the simulation planes of the peak intensity matrix store.
+        spin.peak_intensity_sim = intensity_store().sim_views(spin, 'peak_intensity', sim_data)
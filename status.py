@@ -23,6 +23,7 @@
 """Module containing the status singleton object."""
 
 # Python module imports.
+from contextlib import contextmanager
 from os import F_OK, access, environ, getcwd
 try:
     from os import get_terminal_size    # Only in Python >= 3.3.
@@ -64,6 +65,7 @@ class Status(object):
             self._instance.gui_uf_force_sync = False
             self._instance.install_path = self._instance._det_install_path()
             self._instance.skip_blacklisted_tests = True
+            self._instance.opt_cache = None
 
             # Set up the singleton.
             self._instance._setup()
@@ -435,9 +437,25 @@ class Observer(object):
         # The status container.
         self._status = Status()
 
+        # The notification batching state.
+        self._batch_level = 0
+        self._pending = False
+        self._interval = None
+        self._last_delivery = 0.0
 
-    def notify(self):
-        """Notify all observers of the state change."""
+        # The notification statistics.
+        self.notify_count = 0
+        self.delivery_count = 0
+        self.callback_time = 0.0
+
+
+    def _deliver(self):
+        """Execute all callback methods, timing them."""
+
+        # Update the batching state and statistics.
+        self._pending = False
+        self._last_delivery = time()
+        self.delivery_count += 1
 
         # Loop over the callback methods and execute them.
         for key in self._keys:
@@ -449,7 +467,65 @@ class Observer(object):
                     sys.stdout.write("debug> Observer: '%s' notifying '%s'.\n" % (self._name, key))
 
             # Call the method.
-            self._callback[key]()
+            start = time()
+            try:
+                self._callback[key]()
+            finally:
+                self.callback_time += time() - start
+
+
+    def batch_end(self):
+        """End one level of notification batching, without delivering the pending notification.
+
+        The flush() method should be called afterwards to deliver the coalesced notification.
+        """
+
+        # Decrement the batching level.
+        if self._batch_level:
+            self._batch_level -= 1
+
+
+    def batch_start(self, interval=None):
+        """Start a level of notification batching.
+
+        While batching, all notifications are coalesced into a single pending notification.
+
+
+        @keyword interval:  The optional debounce interval in seconds.  If supplied, a pending notification is delivered by the first notification arriving after this time has elapsed since the start of the batch or the last delivery.  This is only used by the outermost batch.
+        @type interval:     float or None
+        """
+
+        # The outermost batch.
+        if not self._batch_level:
+            self._interval = interval
+            self._last_delivery = time()
+
+        # Increment the batching level.
+        self._batch_level += 1
+
+
+    def flush(self):
+        """Deliver the coalesced notification, if pending and no longer batching."""
+
+        # Deliver.
+        if self._pending and not self._batch_level:
+            self._deliver()
+
+
+    def notify(self):
+        """Notify all observers of the state change."""
+
+        # Count the notification.
+        self.notify_count += 1
+
+        # Batching, so coalesce the notification unless the debounce interval has elapsed.
+        if self._batch_level:
+            self._pending = True
+            if self._interval == None or time() - self._last_delivery < self._interval:
+                return
+
+        # Deliver the notification.
+        self._deliver()
 
 
     def register(self, key, method, method_name=None):
@@ -625,20 +701,83 @@ class Relax_lock:
 class Observer_container:
     """The container for holding all the observer objects."""
 
-    def info(self):
-        """Print out info about all the status objects."""
+    def _observers(self, names=None):
+        """Return the observer objects.
 
-        # Blacklisted objects.
-        blacklist = list(self.__class__.__dict__.keys()) + list(dict.__dict__.keys())
+        @keyword names: The names of the observers to return.  If not supplied, all observers in this container will be returned.
+        @type names:    None or list of str
+        @return:        The observer objects.
+        @rtype:         list of Observer instances
+        """
+
+        # Specific observers.
+        if names != None:
+            return [getattr(self, name) for name in names]
 
         # Loop over all objects in this container.
+        observers = []
         for name in dir(self):
-            # Skip blacklisted objects.
-            if name in blacklist:
-                continue
-
             # Get the object.
             obj = getattr(self, name)
 
+            # Store the observer objects.
+            if isinstance(obj, Observer):
+                observers.append(obj)
+
+        # Return the observers.
+        return observers
+
+
+    @contextmanager
+    def batch(self, names=None, interval=None):
+        """Context manager for coalescing the notifications of a bulk operation.
+
+        Within the context, each notification of the observers is deferred and all deferred notifications of an observer are coalesced into a single notification delivered at the end of the outermost batch.  For example::
+
+            with status.observers.batch(['pipe_alteration', 'result_file']):
+                ...
+
+        Batching is global and will also coalesce the notifications from other threads.  Observers which are used for synchronisation, such as 'exec_lock', should therefore normally not be batched.
+
+
+        @keyword names:     The names of the observers to batch.  If not supplied, all observers will be batched.
+        @type names:        None or list of str
+        @keyword interval:  The optional debounce interval in seconds.  If supplied, a coalesced notification will also be delivered by the first notification arriving after this time has elapsed since the last delivery.
+        @type interval:     float or None
+        """
+
+        # Start batching.
+        observers = self._observers(names)
+        for observer in observers:
+            observer.batch_start(interval=interval)
+
+        # Execute the bulk operation.
+        try:
+            yield
+
+        # End batching for all observers prior to delivering the coalesced notifications.
+        finally:
+            for observer in observers:
+                observer.batch_end()
+            for observer in observers:
+                observer.flush()
+
+
+    def info(self):
+        """Print out info about all the status objects."""
+
+        # Loop over all observer objects in this container.
+        for obj in self._observers():
             # An observer object.
             print("Observer '%s' keys: %s" % (obj._name, obj._keys))
+
+
+    def stats(self):
+        """Print out the notification statistics of all observer objects."""
+
+        # The header.
+        print("%-20s %15s %15s %15s %20s" % ("Observer", "Notifications", "Deliveries", "Coalesced", "Callback time (s)"))
+
+        # Loop over all observer objects in this container.
+        for obj in self._observers():
+            print("%-20s %15i %15i %15i %20.6f" % (obj._name, obj.notify_count, obj.delivery_count, obj.notify_count - obj.delivery_count, obj.callback_time))
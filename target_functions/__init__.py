@@ -30,6 +30,7 @@ __all__ = [
     'frame_order',
     'jw_mapping',
     'mf',
+    'mf_grid',
     'n_state_model',
     'potential',
     'relax_disp',
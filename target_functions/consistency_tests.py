@@ -22,7 +22,7 @@
 
 # Python module imports.
 from math import cos, pi
-from numpy import float64, zeros
+from numpy import cos as cos_array, errstate, float64, where, zeros
 
 # relax module imports.
 from lib.auto_relaxation.ri_comps import calc_fixed_csa, calc_fixed_dip, comp_csa_const_func, comp_dip_const_func
@@ -148,6 +148,78 @@ class Consistency:
         return j0, f_eta, f_r2
 
 
+def consistency_array(frq=None, gx=None, gh=None, mu0=None, h_bar=None, orientation=None, tc=None, r=None, csa=None, r1=None, r2=None, noe=None):
+    """Vectorised consistency tests for many spins and Monte Carlo simulations.
+
+    This is the closed-form equivalent of the Consistency.func() method.  The spin specific arguments and the relaxation data are numpy arrays which are broadcast together, for example the spin parameters of dimensions {spin, 1} and the relaxation data of dimensions {spin, simulation}.
+
+
+    @keyword frq:           The proton frequency in Hz.
+    @type frq:              float
+    @keyword gx:            The gyromagnetic ratios of the heteronuclei.
+    @type gx:               numpy array
+    @keyword gh:            The gyromagnetic ratios of the protons.
+    @type gh:               numpy array
+    @keyword mu0:           The permeability of free space.
+    @type mu0:              float
+    @keyword h_bar:         The reduced Planck's constant.
+    @type h_bar:            float
+    @keyword orientation:   The angles Theta between the X-H vectors and the principal axes of the CSA tensors, in degrees.
+    @type orientation:      numpy array
+    @keyword tc:            The correlation times.
+    @type tc:               numpy array
+    @keyword r:             The interatomic distances.
+    @type r:                numpy array
+    @keyword csa:           The CSA values.
+    @type csa:              numpy array
+    @keyword r1:            The R1 relaxation rates.
+    @type r1:               numpy array
+    @keyword r2:            The R2 relaxation rates.
+    @type r2:               numpy array
+    @keyword noe:           The steady-state NOE values.
+    @type noe:              numpy array
+    @return:                The J(0), F_eta and F_R2 values.
+    @rtype:                 tuple of 3 numpy arrays
+    """
+
+    # The dipolar constants.
+    dip_const_fixed = ((mu0 / (4.0*pi)) * h_bar * gh * gx) ** 2
+    with errstate(divide='ignore'):
+        d = where(r == 0.0, 1e99, 0.25 * dip_const_fixed * r**-6)
+
+    # The CSA constants.
+    frqH = frq * 2 * pi
+    frqX = frqH * gx / gh
+    c = frqX**2 / 3.0 * csa**2
+
+    # Calculate the sigma NOE value.
+    sigma_noe = (noe - 1.0) * r1 * gx / gh
+
+    # Calculate J(0).
+    j0 = -1.5 / (3.0*d + c) * (0.5*r1 - r2 + 0.6*sigma_noe)
+
+    # Calculate J(wX).
+    jwx = 1.0 / (3.0*d + c) * (r1 - 1.4*sigma_noe)
+
+    # Calculate P_2.
+    p_2 = 0.5 * ((3.0 * (cos_array(orientation * pi / 180)) ** 2) -1)
+
+    # Calculate eta.
+    eta = ((d * c/3.0) ** 0.5) * (4.0 * j0 + 3.0 * jwx) * p_2
+
+    # Calculate F_eta.
+    f_eta = eta * gh / (frqH * (4.0 + 3.0 / (1 + (frqX * tc) ** 2)))
+
+    # Calculate P_HF.
+    p_hf = 1.3 * (gx / gh) * (1.0 - noe) * r1
+
+    # Calculate F_R2.
+    f_r2 = (r2 - p_hf) / ((4.0 + 3.0 / (1 + (frqX * tc) ** 2)) * (d + c/3.0))
+
+    # Return the three values.
+    return j0, f_eta, f_r2
+
+
 class Data:
     def __init__(self):
         """Empty container for storing data."""
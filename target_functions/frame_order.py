@@ -24,7 +24,7 @@
 
 # Python module imports.
 from copy import deepcopy
-from math import acos, cos, pi, sin, sqrt
+from math import pi, sqrt
 from numpy import add, array, dot, float32, float64, ones, outer, subtract, transpose, uint8, zeros
 
 # relax module imports.
@@ -48,7 +48,7 @@ from lib.frame_order.pseudo_ellipse_torsionless import compile_2nd_matrix_pseudo
 from lib.frame_order.rotor import compile_2nd_matrix_rotor, pcs_numeric_quad_int_rotor, pcs_numeric_qr_int_rotor
 from lib.frame_order.variables import MODEL_DOUBLE_ROTOR, MODEL_FREE_ROTOR, MODEL_ISO_CONE, MODEL_ISO_CONE_FREE_ROTOR, MODEL_ISO_CONE_TORSIONLESS, MODEL_PSEUDO_ELLIPSE, MODEL_PSEUDO_ELLIPSE_FREE_ROTOR, MODEL_PSEUDO_ELLIPSE_TORSIONLESS, MODEL_RIGID, MODEL_ROTOR
 from lib.geometry.coord_transform import spherical_to_cartesian
-from lib.geometry.rotations import euler_to_R_zyz, tilt_torsion_to_R, two_vect_to_R
+from lib.geometry.rotations import _acos_batch, _cos_batch, _sin_batch, _square_batch, euler_to_R_zyz, tilt_torsion_to_R_batch, two_vect_to_R
 from lib.linear_algebra.kronecker_product import kron_prod
 from lib.physical_constants import pcs_constant
 from target_functions.chi2 import chi2
@@ -2030,84 +2030,82 @@ class Frame_order:
         # The Sobol' points.
         points = i4_sobol_generate(m, total_num, 1000)
 
-        # Loop over the points.
-        for i in range(total_num):
-            # Loop over the dimensions, converting the points to angles.
-            theta = None
-            phi = None
-            sigma = None
-            for j in range(m):
-                # The tilt angle - the angle of rotation about the x-y plane rotation axis.
-                if dims[j] in ['theta']:
-                    theta = acos(2.0*points[j, i] - 1.0)
-                    sobol_data.sobol_angles[j, i] = theta
-
-                # The angle defining the x-y plane rotation axis.
-                if dims[j] in ['phi']:
-                    phi = 2.0 * pi * points[j, i]
-                    sobol_data.sobol_angles[j, i] = phi
-
-                # The 1st torsion angle - the angle of rotation about the z' axis (or y' for the double motion models).
-                if dims[j] in ['sigma']:
-                    sigma = 2.0 * pi * (points[j, i] - 0.5)
-                    sobol_data.sobol_angles[j, i] = sigma
-
-                # The 2nd torsion angle - the angle of rotation about the x' axis.
-                if dims[j] in ['sigma2']:
-                    sigma2 = 2.0 * pi * (points[j, i] - 0.5)
-                    sobol_data.sobol_angles[j, i] = sigma2
-
-            # Pre-calculate the rotation matrices for the double motion models.
-            if 'sigma2' in dims:
-                # The 1st rotation about the y-axis.
-                c_sigma = cos(sigma)
-                s_sigma = sin(sigma)
-                sobol_data.Ri_prime[i, 0, 0] =  c_sigma
-                sobol_data.Ri_prime[i, 0, 2] =  s_sigma
-                sobol_data.Ri_prime[i, 1, 1] = 1.0
-                sobol_data.Ri_prime[i, 2, 0] = -s_sigma
-                sobol_data.Ri_prime[i, 2, 2] =  c_sigma
-
-                # The 2nd rotation about the x-axis.
-                c_sigma2 = cos(sigma2)
-                s_sigma2 = sin(sigma2)
-                sobol_data.Ri2_prime[i, 0, 0] = 1.0
-                sobol_data.Ri2_prime[i, 1, 1] =  c_sigma2
-                sobol_data.Ri2_prime[i, 1, 2] = -s_sigma2
-                sobol_data.Ri2_prime[i, 2, 1] =  s_sigma2
-                sobol_data.Ri2_prime[i, 2, 2] =  c_sigma2
-
-            # Pre-calculate the rotation matrix for the full tilt-torsion.
-            elif theta != None and phi != None and sigma != None:
-                tilt_torsion_to_R(phi, theta, sigma, sobol_data.Ri_prime[i])
-
-            # Pre-calculate the rotation matrix for the torsionless models.
-            elif sigma == None:
-                c_theta = cos(theta)
-                s_theta = sin(theta)
-                c_phi = cos(phi)
-                s_phi = sin(phi)
-                c_phi_c_theta = c_phi * c_theta
-                s_phi_c_theta = s_phi * c_theta
-                sobol_data.Ri_prime[i, 0, 0] =  c_phi_c_theta*c_phi + s_phi**2
-                sobol_data.Ri_prime[i, 0, 1] =  c_phi_c_theta*s_phi - c_phi*s_phi
-                sobol_data.Ri_prime[i, 0, 2] =  c_phi*s_theta
-                sobol_data.Ri_prime[i, 1, 0] =  s_phi_c_theta*c_phi - c_phi*s_phi
-                sobol_data.Ri_prime[i, 1, 1] =  s_phi_c_theta*s_phi + c_phi**2
-                sobol_data.Ri_prime[i, 1, 2] =  s_phi*s_theta
-                sobol_data.Ri_prime[i, 2, 0] = -s_theta*c_phi
-                sobol_data.Ri_prime[i, 2, 1] = -s_theta*s_phi
-                sobol_data.Ri_prime[i, 2, 2] =  c_theta
-
-            # Pre-calculate the rotation matrix for the rotor models.
-            else:
-                c_sigma = cos(sigma)
-                s_sigma = sin(sigma)
-                sobol_data.Ri_prime[i, 0, 0] =  c_sigma
-                sobol_data.Ri_prime[i, 0, 1] = -s_sigma
-                sobol_data.Ri_prime[i, 1, 0] =  s_sigma
-                sobol_data.Ri_prime[i, 1, 1] =  c_sigma
-                sobol_data.Ri_prime[i, 2, 2] = 1.0
+        # Convert the points to angles, one dimension at a time (the math module trig functions are used to match the original scalar loop to the last bit).
+        theta = None
+        phi = None
+        sigma = None
+        for j in range(m):
+            # The tilt angle - the angle of rotation about the x-y plane rotation axis.
+            if dims[j] in ['theta']:
+                theta = _acos_batch(2.0*points[j] - 1.0)
+                sobol_data.sobol_angles[j] = theta
+
+            # The angle defining the x-y plane rotation axis.
+            if dims[j] in ['phi']:
+                phi = 2.0 * pi * points[j]
+                sobol_data.sobol_angles[j] = phi
+
+            # The 1st torsion angle - the angle of rotation about the z' axis (or y' for the double motion models).
+            if dims[j] in ['sigma']:
+                sigma = 2.0 * pi * (points[j] - 0.5)
+                sobol_data.sobol_angles[j] = sigma
+
+            # The 2nd torsion angle - the angle of rotation about the x' axis.
+            if dims[j] in ['sigma2']:
+                sigma2 = 2.0 * pi * (points[j] - 0.5)
+                sobol_data.sobol_angles[j] = sigma2
+
+        # Pre-calculate the rotation matrices for the double motion models.
+        if 'sigma2' in dims:
+            # The 1st rotation about the y-axis.
+            c_sigma = _cos_batch(sigma)
+            s_sigma = _sin_batch(sigma)
+            sobol_data.Ri_prime[:, 0, 0] =  c_sigma
+            sobol_data.Ri_prime[:, 0, 2] =  s_sigma
+            sobol_data.Ri_prime[:, 1, 1] = 1.0
+            sobol_data.Ri_prime[:, 2, 0] = -s_sigma
+            sobol_data.Ri_prime[:, 2, 2] =  c_sigma
+
+            # The 2nd rotation about the x-axis.
+            c_sigma2 = _cos_batch(sigma2)
+            s_sigma2 = _sin_batch(sigma2)
+            sobol_data.Ri2_prime[:, 0, 0] = 1.0
+            sobol_data.Ri2_prime[:, 1, 1] =  c_sigma2
+            sobol_data.Ri2_prime[:, 1, 2] = -s_sigma2
+            sobol_data.Ri2_prime[:, 2, 1] =  s_sigma2
+            sobol_data.Ri2_prime[:, 2, 2] =  c_sigma2
+
+        # Pre-calculate the rotation matrices for the full tilt-torsion.
+        elif theta is not None and phi is not None and sigma is not None:
+            tilt_torsion_to_R_batch(phi, theta, sigma, sobol_data.Ri_prime)
+
+        # Pre-calculate the rotation matrices for the torsionless models.
+        elif sigma is None:
+            c_theta = _cos_batch(theta)
+            s_theta = _sin_batch(theta)
+            c_phi = _cos_batch(phi)
+            s_phi = _sin_batch(phi)
+            c_phi_c_theta = c_phi * c_theta
+            s_phi_c_theta = s_phi * c_theta
+            sobol_data.Ri_prime[:, 0, 0] =  c_phi_c_theta*c_phi + _square_batch(s_phi)
+            sobol_data.Ri_prime[:, 0, 1] =  c_phi_c_theta*s_phi - c_phi*s_phi
+            sobol_data.Ri_prime[:, 0, 2] =  c_phi*s_theta
+            sobol_data.Ri_prime[:, 1, 0] =  s_phi_c_theta*c_phi - c_phi*s_phi
+            sobol_data.Ri_prime[:, 1, 1] =  s_phi_c_theta*s_phi + _square_batch(c_phi)
+            sobol_data.Ri_prime[:, 1, 2] =  s_phi*s_theta
+            sobol_data.Ri_prime[:, 2, 0] = -s_theta*c_phi
+            sobol_data.Ri_prime[:, 2, 1] = -s_theta*s_phi
+            sobol_data.Ri_prime[:, 2, 2] =  c_theta
+
+        # Pre-calculate the rotation matrices for the rotor models.
+        else:
+            c_sigma = _cos_batch(sigma)
+            s_sigma = _sin_batch(sigma)
+            sobol_data.Ri_prime[:, 0, 0] =  c_sigma
+            sobol_data.Ri_prime[:, 0, 1] = -s_sigma
+            sobol_data.Ri_prime[:, 1, 0] =  s_sigma
+            sobol_data.Ri_prime[:, 1, 1] =  c_sigma
+            sobol_data.Ri_prime[:, 2, 2] = 1.0
 
         # Printout (useful to see how long this takes!).
         print("   Oversampled to %s points." % total_num)
@@ -21,7 +21,7 @@
 
 # Python module imports.
 from math import pi
-from numpy import float64, zeros
+from numpy import errstate, float64, where, zeros
 
 # relax module imports.
 from lib.auto_relaxation.ri_comps import calc_fixed_csa, calc_fixed_dip, comp_csa_const_func, comp_dip_const_func
@@ -102,6 +102,61 @@ class Mapping:
         return j0, jwx, jwh
 
 
+def jw_mapping_array(frq=None, gx=None, gh=None, mu0=None, h_bar=None, r=None, csa=None, r1=None, r2=None, noe=None):
+    """Vectorised reduced spectral density mapping for many spins and Monte Carlo simulations.
+
+    This is the closed-form equivalent of the Mapping.func() method.  The spin specific arguments and the relaxation data are numpy arrays which are broadcast together, for example the gyromagnetic ratios, interatomic distances and CSA values of dimensions {spin, 1} and the relaxation data of dimensions {spin, simulation}.
+
+
+    @keyword frq:   The proton frequency in Hz.
+    @type frq:      float
+    @keyword gx:    The gyromagnetic ratios of the heteronuclei.
+    @type gx:       numpy array
+    @keyword gh:    The gyromagnetic ratios of the protons.
+    @type gh:       numpy array
+    @keyword mu0:   The permeability of free space.
+    @type mu0:      float
+    @keyword h_bar: The reduced Planck's constant.
+    @type h_bar:    float
+    @keyword r:     The interatomic distances.
+    @type r:        numpy array
+    @keyword csa:   The CSA values.
+    @type csa:      numpy array
+    @keyword r1:    The R1 relaxation rates.
+    @type r1:       numpy array
+    @keyword r2:    The R2 relaxation rates.
+    @type r2:       numpy array
+    @keyword noe:   The steady-state NOE values.
+    @type noe:      numpy array
+    @return:        The J(0), J(wX), and J(wH) (or J(0.87wH)) values.
+    @rtype:         tuple of 3 numpy arrays
+    """
+
+    # The dipolar constants.
+    dip_const_fixed = ((mu0 / (4.0*pi)) * h_bar * gh * gx) ** 2
+    with errstate(divide='ignore'):
+        d = where(r == 0.0, 1e99, 0.25 * dip_const_fixed * r**-6)
+
+    # The CSA constants.
+    frqX = frq * 2 * pi * gx / gh
+    c = frqX**2 / 3.0 * csa**2
+
+    # Calculate the sigma NOE value.
+    sigma_noe = (noe - 1.0) * r1 * gx / gh
+
+    # Calculate J(0).
+    j0 = -1.5 / (3.0*d + c) * (0.5*r1 - r2 + 0.6*sigma_noe)
+
+    # Calculate J(wX).
+    jwx = 1.0 / (3.0*d + c) * (r1 - 1.4*sigma_noe)
+
+    # Calculate J(wH).
+    jwh = sigma_noe / (5.0*d)
+
+    # Return the three values.
+    return j0, jwx, jwh
+
+
 class Data:
     def __init__(self):
         """Empty container for storing data."""
@@ -0,0 +1,305 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Module docstring.
+"""The vectorised model-free grid search for single spins.
+
+The chi-squared values of all grid points of a spin are calculated at once from the spectral density components of the Lipari-Szabo model-free equations.  The components which depend only on the field strengths, the diffusion correlation times and a single internal correlation time are stored in tables which are shared between all spins with the same spectrometer frequencies and the same diffusion tensor correlation times, i.e. all spins of a spherical diffusion tensor or all spins with the same local tm grid values.
+"""
+
+# Python module imports.
+from numpy import arange, array, dot, errstate, float64, inf, isnan, linspace, pi, prod, unique, where, zeros
+
+# relax module imports.
+from lib.errors import RelaxError
+
+
+class Mf_grid:
+    """The vectorised model-free grid search class."""
+
+    def __init__(self, max_points=20000):
+        """Set up the shared spectral density tables.
+
+        @keyword max_points:    The maximum number of grid points to calculate at once, to limit the memory usage.
+        @type max_points:       int
+        """
+
+        # Store the arguments.
+        self.max_points = max_points
+
+        # The shared spectral density tables.
+        self._tables = {}
+
+
+    def _fact(self, w_ti_sqrd, ti, tau):
+        """Return the shared spectral density factors for one internal correlation time.
+
+        This is the fact_ti component for tau set to None, or the fact_te, fact_tf, or fact_ts component otherwise.
+
+
+        @param w_ti_sqrd:   The omega squared times ti squared values of dimensions {frequency, 5, ti index}.
+        @type w_ti_sqrd:    numpy rank-3 array
+        @param ti:          The diffusion correlation times.
+        @type ti:           numpy rank-1 array
+        @param tau:         The internal correlation time, or None for the overall tumbling factor.
+        @type tau:          float or None
+        @return:            The spectral density factors of dimensions {frequency, 5, ti index}.
+        @rtype:             numpy rank-3 array
+        """
+
+        # The table key.
+        key = (w_ti_sqrd.tobytes(), ti.tobytes(), tau)
+
+        # Calculate the factors, following the order of operations of the model-free target function.
+        if key not in self._tables:
+            if tau == None:
+                self._tables[key] = 1.0 / (1.0 + w_ti_sqrd)
+            else:
+                tau_ti = tau + ti
+                self._tables[key] = tau_ti * tau / (tau_ti**2 + w_ti_sqrd * tau**2)
+
+        # Return the factors.
+        return self._tables[key]
+
+
+    def _jw_term(self, data, tis, cis, w_ti_sqrds, tm_index, tau=None):
+        """Calculate a spectral density term for all points.
+
+        @param data:        The spin specific data of the model-free target function class.
+        @type data:         class instance
+        @param tis:         The diffusion correlation times for each unique local tm value.
+        @type tis:          list of numpy rank-1 arrays
+        @param cis:         The diffusion weights for each unique local tm value.
+        @type cis:          list of numpy rank-1 arrays
+        @param w_ti_sqrds:  The omega squared times ti squared values for each unique local tm value.
+        @type w_ti_sqrds:   list of numpy rank-3 arrays
+        @param tm_index:    The unique local tm value index for each point.
+        @type tm_index:     numpy rank-1 int array
+        @keyword tau:       The internal correlation time for each point, or None for the overall tumbling term.
+        @type tau:          numpy rank-1 array or None
+        @return:            The term sum_i(ci.ti.fact) of dimensions {point, frequency, 5}.
+        @rtype:             numpy rank-3 array
+        """
+
+        # The unique internal correlation times.
+        if tau is None:
+            tau_values = [None]
+            tau_index = zeros(len(tm_index), int)
+        else:
+            tau_values, tau_index = unique(tau, return_inverse=True)
+
+        # The table of terms for all unique tm and tau combinations.
+        table = zeros((len(tis) * len(tau_values),) + data.frq_sqrd_list.shape, float64)
+        for i in range(len(tis)):
+            ci_ti = cis[i] * tis[i]
+            for j in range(len(tau_values)):
+                fact = self._fact(w_ti_sqrds[i], tis[i], tau_values[j])
+                table[i*len(tau_values) + j] = (ci_ti * fact).sum(axis=2)
+
+        # Expand to all points.
+        return table[tm_index*len(tau_values) + tau_index]
+
+
+    def calc_chi2(self, mf, points):
+        """Calculate the chi-squared values for a set of points.
+
+        @param mf:      The model-free target function class instance for the spin, of the 'mf' or 'local_tm' model type.
+        @type mf:       target_functions.mf.Mf instance
+        @param points:  The parameter vectors, which are scaled if the target function is scaled, of dimensions {point, parameter}.
+        @type points:   numpy rank-2 array
+        @return:        The chi-squared values, with NaN values replaced by infinity.
+        @rtype:         numpy rank-1 array
+        """
+
+        # Checks.
+        if mf.model_type not in ['mf', 'local_tm']:
+            raise RelaxError("The vectorised grid search is not implemented for the '%s' model type." % mf.model_type)
+
+        # Alias the spin data.
+        data = mf.data[0]
+        diff_data = mf.diff_data
+
+        # Scaling.
+        params = points
+        if mf.scaling_flag:
+            params = dot(points, mf.scaling_matrix)
+
+        # The diffusion weights and correlation times for each unique local tm value.
+        tis, cis, w_ti_sqrds = [], [], []
+        if mf.model_type == 'local_tm':
+            tm_values, tm_index = unique(params[:, 0], return_inverse=True)
+            for tm in tm_values:
+                diff_data.params = array([tm], float64)
+                diff_data.calc_ci(data, diff_data)
+                diff_data.calc_ti(data, diff_data)
+                tis.append(data.ti * 1.0)
+                cis.append(data.ci * 1.0)
+        else:
+            if diff_data.calc_di:
+                diff_data.calc_di(data, diff_data)
+            diff_data.calc_ci(data, diff_data)
+            diff_data.calc_ti(data, diff_data)
+            tis.append(data.ti * 1.0)
+            cis.append(data.ci * 1.0)
+            tm_index = zeros(len(params), int)
+        for ti in tis:
+            w_ti_sqrds.append(data.frq_sqrd_list_ext * ti**2)
+
+        # The parameter values, or None if not part of the model.
+        values = {}
+        for name in ['s2', 's2f', 's2s', 'te', 'tf', 'ts', 'rex', 'r', 'csa']:
+            index = getattr(data, name + '_i')
+            values[name] = None
+            if index != None:
+                values[name] = params[:, index]
+
+        # The overall and internal motion amplitudes and correlation times.
+        s2 = values['s2']
+        terms = []
+        if data.equations == 'mf_orig':
+            if values['te'] is not None:
+                terms.append((1.0 - s2, values['te']))
+        elif data.equations == 'mf_ext':
+            if values['tf'] is not None:
+                terms.append((1.0 - values['s2f'], values['tf']))
+            terms.append((values['s2f'] - s2, values['ts']))
+        elif data.equations == 'mf_ext2':
+            s2 = values['s2f'] * values['s2s']
+            if values['tf'] is not None:
+                terms.append((1.0 - values['s2f'], values['tf']))
+            terms.append((values['s2f'] * (1.0 - values['s2s']), values['ts']))
+
+        # The spectral densities.
+        jw = self._jw_term(data, tis, cis, w_ti_sqrds, tm_index)
+        if s2 is not None:
+            jw = s2[:, None, None] * jw
+        for amp, tau in terms:
+            jw = jw + amp[:, None, None] * self._jw_term(data, tis, cis, w_ti_sqrds, tm_index, tau=tau)
+        jw = 0.4 * jw
+
+        # The dipolar constant.
+        if values['r'] is not None:
+            with errstate(divide='ignore'):
+                dip = where(values['r'] == 0.0, 1e99, 0.25 * data.dip_const_fixed * values['r']**-6)
+        else:
+            dip = data.dip_const_func
+
+        # Loop over the relaxation data, summing the chi-squared values.
+        chi2 = zeros(len(params), float64)
+        with errstate(all='ignore'):
+            for m in range(data.num_ri):
+                # The field strength and CSA constant.
+                frq_num = data.remap_table[m]
+                if values['csa'] is not None:
+                    csa = data.csa_const_fixed[frq_num] * values['csa']**2
+                else:
+                    csa = data.csa_const_func[frq_num]
+                j = jw[:, frq_num]
+
+                # The R1 value (also needed for the NOE).
+                if data.ri_labels[m] in ['R1', 'NOE']:
+                    r1 = dip * (j[:, 2] + 3.0*j[:, 1] + 6.0*j[:, 4]) + csa * j[:, 1]
+
+                # The relaxation values.
+                if data.ri_labels[m] == 'R1':
+                    ri = r1
+                elif data.ri_labels[m] == 'R2':
+                    ri = dip / 2.0 * (4.0*j[:, 0] + j[:, 2] + 3.0*j[:, 1] + 6.0*j[:, 3] + 6.0*j[:, 4]) + csa / 6.0 * (4.0*j[:, 0] + 3.0*j[:, 1])
+                    if values['rex'] is not None:
+                        ri = ri + values['rex'] * (2.0 * pi * data.frq[frq_num])**2
+                elif data.ri_labels[m] == 'NOE':
+                    sigma_noe = dip * (6.0*j[:, 4] - j[:, 2])
+                    ri = where(r1 == 0.0, where(sigma_noe == 0.0, 1.0, 1e99), 1.0 + data.g_ratio * (sigma_noe / r1))
+                else:
+                    raise RelaxError("The relaxation data type '%s' is not supported." % data.ri_labels[m])
+
+                # The chi-squared sum.
+                chi2 = chi2 + (data.relax_data[m] - ri)**2 / data.errors[m]**2
+
+        # Replace NaN values.
+        chi2[isnan(chi2)] = inf
+
+        # Return the values.
+        return chi2
+
+
+    def grid(self, mf=None, num_incs=None, lower=None, upper=None, A=None, b=None):
+        """Perform the grid search for a single spin.
+
+        The grid points, their order and the choice of the minimum follow the minfx grid() function, with the first dimension being the fastest changing.
+
+
+        @keyword mf:        The model-free target function class instance for the spin.
+        @type mf:           target_functions.mf.Mf instance
+        @keyword num_incs:  The number of increments in each dimension of the grid.
+        @type num_incs:     list of int
+        @keyword lower:     The lower bounds of the grid.
+        @type lower:        list of float
+        @keyword upper:     The upper bounds of the grid.
+        @type upper:        list of float
+        @keyword A:         The linear constraint matrix.
+        @type A:            numpy rank-2 array or None
+        @keyword b:         The linear constraint scalar vector.
+        @type b:            numpy rank-1 array or None
+        @return:            The parameter vector, the function value, the number of function evaluations, and the warning.
+        @rtype:             numpy rank-1 array, float, int, None
+        """
+
+        # The grid values for each dimension.
+        n = len(num_incs)
+        axes = []
+        strides = []
+        stride = 1
+        for k in range(n):
+            axes.append(linspace(lower[k], upper[k], num_incs[k]))
+            strides.append(stride)
+            stride = stride * num_incs[k]
+        total = int(prod(num_incs))
+
+        # Initialise the minimum, as in minfx.
+        min_params = array(lower, float64)
+        f_min = 1e300
+        count = 0
+
+        # Loop over the blocks of points.
+        for start in range(0, total, self.max_points):
+            # The points.
+            index = arange(start, min(start + self.max_points, total))
+            points = zeros((len(index), n), float64)
+            for k in range(n):
+                points[:, k] = axes[k][(index // strides[k]) % num_incs[k]]
+
+            # Skip the points which violate the constraints.
+            if A is not None and len(A):
+                points = points[(dot(points, A.T) - b >= 0.0).all(axis=1)]
+            if not len(points):
+                continue
+            count += len(points)
+
+            # The minimum of the block.
+            chi2 = self.calc_chi2(mf, points)
+            i = chi2.argmin()
+            if chi2[i] < f_min:
+                f_min = chi2[i]
+                min_params = points[i] * 1.0
+
+        # Return the minfx style results.
+        return min_params, f_min, count, None
@@ -56,8 +56,13 @@ class Relax_fit_opt:
         @type scaling_matrix:       list of float
         """
 
-        # Store the args.
+        # Store the args, as the data held by the C code must also identify the problem for the optimisation results cache.
         self.model = model
+        self.num_params = num_params
+        self.values = values
+        self.errors = errors
+        self.relax_times = relax_times
+        self.scaling_matrix = scaling_matrix
 
         # Initialise the C code.
         setup(num_params=num_params, num_times=len(relax_times), values=values, sd=errors, relax_times=relax_times, scaling_matrix=scaling_matrix)
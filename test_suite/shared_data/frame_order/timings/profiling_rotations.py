@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Module docstring.
+"""Benchmark of the scalar versus batched rotation conversions of the lib.geometry.rotations module.
+
+Each conversion is performed for a stack of random rotations, once by looping over the scalar function and once using the batched function, and the results are checked for equality.  To run the benchmark, type:
+
+$ python profiling_rotations.py /path/to/relax [number of rotations]
+
+The default is 100,000 rotations.
+"""
+
+# Python module imports.
+from numpy import array, float64, transpose, zeros
+from numpy.random import RandomState
+from os import getcwd, path
+import sys
+from time import time
+
+# Add the relax base directory to the system path.
+if len(sys.argv) == 1:
+    path_to_base = path.join(getcwd(), '..', '..', '..', '..')
+else:
+    path_to_base = path.abspath(sys.argv[1])
+sys.path.insert(0, path_to_base)
+
+# relax module imports.
+from lib.geometry.rotations import axis_angle_to_R, axis_angle_to_R_batch, euler_to_R_zyz, euler_to_R_zyz_batch, quaternion_to_R, quaternion_to_R_batch, R_to_axis_angle, R_to_axis_angle_batch, R_to_euler_zyz, R_to_euler_zyz_batch, R_to_quaternion, R_to_quaternion_batch, R_to_tilt_torsion, R_to_tilt_torsion_batch, tilt_torsion_to_R, tilt_torsion_to_R_batch
+
+
+# The benchmark settings.
+N = 100000
+if len(sys.argv) > 2:
+    N = int(sys.argv[2])
+
+
+def matrix_loop(fn, *args):
+    """Loop over the scalar function which updates a rotation matrix.
+
+    @param fn:      The scalar function.
+    @type fn:       function
+    @param args:    The stacked arguments, excluding the rotation matrix.
+    @type args:     numpy arrays
+    @return:        The stack of rotation matrices.
+    @rtype:         numpy rank-3 (N, 3, 3) array
+    """
+
+    # Loop over the rotations.
+    R = zeros((N, 3, 3), float64)
+    for i in range(N):
+        fn(*([arg[i] for arg in args] + [R[i]]))
+
+    # Return the matrices.
+    return R
+
+
+def quaternion_loop(R):
+    """Loop over the scalar R_to_quaternion() function.
+
+    @param R:   The stack of rotation matrices.
+    @type R:    numpy rank-3 (N, 3, 3) array
+    @return:    The stack of quaternions.
+    @rtype:     numpy rank-2 (N, 4) array
+    """
+
+    # Loop over the rotations.
+    quat = zeros((N, 4), float64)
+    for i in range(N):
+        R_to_quaternion(R[i], quat[i])
+
+    # Return the quaternions.
+    return quat
+
+
+def batch(fn, *args):
+    """Call the batched function which updates a stack of rotation matrices.
+
+    @param fn:      The batched function.
+    @type fn:       function
+    @param args:    The stacked arguments, excluding the rotation matrices.
+    @type args:     numpy arrays
+    @return:        The stack of rotation matrices.
+    @rtype:         numpy rank-3 (N, 3, 3) array
+    """
+
+    # Call the function.
+    R = zeros((N, 3, 3), float64)
+    fn(*(list(args) + [R]))
+
+    # Return the matrices.
+    return R
+
+
+def quaternion_batch(R):
+    """Call the batched R_to_quaternion_batch() function.
+
+    @param R:   The stack of rotation matrices.
+    @type R:    numpy rank-3 (N, 3, 3) array
+    @return:    The stack of quaternions.
+    @rtype:     numpy rank-2 (N, 4) array
+    """
+
+    # Call the function.
+    quat = zeros((N, 4), float64)
+    R_to_quaternion_batch(R, quat)
+
+    # Return the quaternions.
+    return quat
+
+
+def main():
+    """Run the benchmark."""
+
+    # Reproducible random data.
+    rand = RandomState(1)
+    alpha, beta, gamma = rand.uniform(-3.0, 6.0, (3, N))
+    axis = rand.normal(0, 1, (N, 3))
+    axis = transpose(transpose(axis) / (axis**2).sum(axis=1)**0.5)
+    R = batch(euler_to_R_zyz_batch, alpha, beta, gamma)
+    quat = quaternion_batch(R)
+
+    # The conversions, as the name, the scalar version and the batched version.
+    conversions = [
+        ["euler_to_R_zyz", lambda: matrix_loop(euler_to_R_zyz, alpha, beta, gamma), lambda: batch(euler_to_R_zyz_batch, alpha, beta, gamma)],
+        ["R_to_euler_zyz", lambda: array([R_to_euler_zyz(R[i]) for i in range(N)]), lambda: transpose(R_to_euler_zyz_batch(R))],
+        ["axis_angle_to_R", lambda: matrix_loop(axis_angle_to_R, axis, alpha), lambda: batch(axis_angle_to_R_batch, axis, alpha)],
+        ["R_to_axis_angle", lambda: array([R_to_axis_angle(R[i])[1] for i in range(N)]), lambda: R_to_axis_angle_batch(R)[1]],
+        ["tilt_torsion_to_R", lambda: matrix_loop(tilt_torsion_to_R, alpha, beta, gamma), lambda: batch(tilt_torsion_to_R_batch, alpha, beta, gamma)],
+        ["R_to_tilt_torsion", lambda: array([R_to_tilt_torsion(R[i]) for i in range(N)]), lambda: transpose(R_to_tilt_torsion_batch(R))],
+        ["quaternion_to_R", lambda: matrix_loop(quaternion_to_R, quat), lambda: batch(quaternion_to_R_batch, quat)],
+        ["R_to_quaternion", lambda: quaternion_loop(R), lambda: quaternion_batch(R)],
+    ]
+
+    # Printout.
+    print("Benchmarking the rotation conversions for %i rotations.\n" % N)
+    print("%-20s %12s %12s %10s %10s" % ("Conversion", "Scalar (s)", "Batched (s)", "Speed up", "Identical"))
+
+    # Time each conversion.
+    for name, scalar_fn, batch_fn in conversions:
+        start = time()
+        scalar = scalar_fn()
+        scalar_time = time() - start
+        start = time()
+        batched = batch_fn()
+        batch_time = time() - start
+        print("%-20s %12.3f %12.3f %10.1f %10s" % (name, scalar_time, batch_time, scalar_time / batch_time, (scalar == batched).all()))
+
+
+# Execute.
+if __name__ == "__main__":
+    main()
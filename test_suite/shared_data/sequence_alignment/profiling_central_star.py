@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Module docstring.
+"""Benchmark of the Needleman-Wunsch and central star multiple sequence alignment algorithms.
+
+A set of related protein sequences is randomly generated from a common ancestor by point mutations and terminal truncations, and these are then aligned.  To run the benchmark, type:
+
+$ python profiling_central_star.py /path/to/relax [number of chains] [minimum length] [maximum length]
+
+The defaults are 50 chains of 300 to 1000 residues.  Note that the central star pairwise alignments are only distributed over slave processors when run within relax with the --multi command line argument.
+"""
+
+# Python module imports.
+import cProfile
+from os import devnull, getcwd, path
+import pstats
+from random import choice, randint, random, seed
+import sys
+import tempfile
+from time import time
+
+# Add the relax base directory to the system path.
+if len(sys.argv) == 1:
+    path_to_base = path.join(getcwd(), '..', '..', '..')
+else:
+    path_to_base = path.abspath(sys.argv[1])
+sys.path.insert(0, path_to_base)
+
+# relax module imports.
+from lib.sequence_alignment.align_protein import align_pairwise
+from lib.sequence_alignment.msa import central_star
+
+
+# The benchmark settings.
+NUM_CHAINS = 50
+MIN_LENGTH = 300
+MAX_LENGTH = 1000
+if len(sys.argv) > 2:
+    NUM_CHAINS = int(sys.argv[2])
+if len(sys.argv) > 4:
+    MIN_LENGTH = int(sys.argv[3])
+    MAX_LENGTH = int(sys.argv[4])
+
+# The amino acids.
+RESIDUES = 'ARNDCQEGHILKMFPSTWYV'
+
+
+def create_sequences():
+    """Randomly generate the related sequences.
+
+    @return:    The list of one letter code sequences.
+    @rtype:     list of str
+    """
+
+    # A reproducible ancestor.
+    seed(1)
+    ancestor = ''.join([choice(RESIDUES) for i in range(MAX_LENGTH)])
+
+    # Mutate and truncate.
+    sequences = []
+    for i in range(NUM_CHAINS):
+        sequence = ''.join([residue if random() > 0.2 else choice(RESIDUES) for residue in ancestor])
+        length = randint(MIN_LENGTH, MAX_LENGTH)
+        start = randint(0, MAX_LENGTH - length)
+        sequences.append(sequence[start:start+length])
+
+    # Return the sequences.
+    return sequences
+
+
+def main():
+    """Run the benchmark."""
+
+    # The sequences.
+    sequences = create_sequences()
+    print("Benchmarking the alignment of %i chains of %i to %i residues." % (NUM_CHAINS, MIN_LENGTH, MAX_LENGTH))
+
+    # A single pairwise alignment.
+    start = time()
+    align_pairwise(sequences[0], sequences[1], matrix='BLOSUM62', gap_open_penalty=10.0, gap_extend_penalty=0.5, verbosity=0)
+    print("%-40s %10.3f s" % ("Single Needleman-Wunsch alignment:", time() - start))
+
+    # Profile the central star MSA, silencing its printouts.
+    filename = tempfile.NamedTemporaryFile(delete=False).name
+    stdout = sys.stdout
+    sys.stdout = open(devnull, 'w')
+    start = time()
+    cProfile.runctx("central_star(sequences, matrix='BLOSUM62', gap_open_penalty=10.0, gap_extend_penalty=0.5)", globals(), {'sequences': sequences}, filename)
+    sys.stdout.close()
+    sys.stdout = stdout
+    print("%-40s %10.3f s" % ("Central star multiple alignment:", time() - start))
+
+    # The profile.
+    stats = pstats.Stats(filename)
+    stats.sort_stats('cumulative').print_stats(15)
+
+
+# Execute.
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,7 @@ import dep_check
 from lib.compat import linux_distribution
 from pipe_control import pipes
 from pipe_control.interatomic import interatomic_loop
-from pipe_control.mol_res_spin import spin_loop
+from pipe_control.mol_res_spin import return_spin, spin_loop
 from lib.errors import RelaxError, RelaxMultiSpinIDError
 from lib.physical_constants import N15_CSA
 from lib.io import DummyFileObject, open_read_file
@@ -255,6 +255,51 @@ class Mf(SystemTestCase):
                 self.assertEqual(str(sub_obj1), str(sub_obj2))
 
 
+    def setup_dauvergne_protocol_sphere(self):
+        """Set up the sphere data for the dauvergne_protocol auto-analysis tests."""
+
+        # The data directory.
+        dir = status.install_path + sep+'test_suite'+sep+'shared_data'+sep+'model_free'+sep+'sphere'
+
+        # Reset relax.
+        self.interpreter.reset()
+
+        # Set up a data pipe and bundle.
+        self.interpreter.pipe.create('sphere test', 'mf', bundle='sphere test')
+
+        # Load the sequence.
+        self.interpreter.sequence.read(file='noe.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, sep=None, spin_id=None)
+
+        # Load the relaxation data.
+        self.interpreter.relax_data.read(ri_id='r1.500', ri_type='R1', frq=500000000.0, file='r1.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
+        self.interpreter.relax_data.read(ri_id='r2.500', ri_type='R2', frq=500000000.0, file='r2.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
+        self.interpreter.relax_data.read(ri_id='noe.500', ri_type='NOE', frq=500000000.0, file='noe.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
+        self.interpreter.relax_data.read(ri_id='r1.900', ri_type='R1', frq=900000000.0, file='r1.900.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
+        self.interpreter.relax_data.read(ri_id='r2.900', ri_type='R2', frq=900000000.0, file='r2.900.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
+        self.interpreter.relax_data.read(ri_id='noe.900', ri_type='NOE', frq=900000000.0, file='noe.900.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
+        self.interpreter.relax_data.peak_intensity_type(ri_id='noe.900', type='height')
+        self.interpreter.relax_data.peak_intensity_type(ri_id='r2.900', type='height')
+        self.interpreter.relax_data.peak_intensity_type(ri_id='r1.900', type='height')
+        self.interpreter.relax_data.peak_intensity_type(ri_id='noe.500', type='height')
+        self.interpreter.relax_data.peak_intensity_type(ri_id='r2.500', type='height')
+        self.interpreter.relax_data.peak_intensity_type(ri_id='r1.500', type='height')
+        self.interpreter.relax_data.peak_intensity_type(ri_id='r1.500', type='height')
+
+        # Set up the interatomic interactions.
+        self.interpreter.structure.read_pdb(file='sphere.pdb', dir=dir, read_mol=None, set_mol_name=None, read_model=None, set_model_num=None, alt_loc=None, verbosity=1, merge=False)
+        self.interpreter.structure.get_pos(spin_id=None, ave_pos=True)
+        self.interpreter.interatom.define(spin_id1='@N*', spin_id2='@H*', direct_bond=True, spin_selection=True, pipe=None)
+        self.interpreter.interatom.set_dist(spin_id1='@N*', spin_id2='@H*', ave_dist=1.02e-10, unit='meter')
+        self.interpreter.interatom.unit_vectors(ave=True)
+
+        # Set the CSA value.
+        self.interpreter.value.set(val=-0.000172, param='csa', index=0, spin_id='@N*', error=False, force=True)
+
+        # Set up the isotope information.
+        self.interpreter.spin.isotope(isotope='15N', spin_id='@N*', force=True)
+        self.interpreter.spin.isotope(isotope='1H', spin_id='@H*', force=True)
+
+
     def test_bug_14872_unicode_selection(self):
         """Test catching U{bug #14872<https://web.archive.org/web/https://gna.org/bugs/?14872>}, the unicode string selection failure as submitted by Olivier Serve."""
 
@@ -819,52 +864,80 @@ class Mf(SystemTestCase):
     def test_dauvergne_protocol_sphere(self):
         """Catch a failure when loading relaxation data."""
 
-        # The data directory.
-        dir = status.install_path + sep+'test_suite'+sep+'shared_data'+sep+'model_free'+sep+'sphere'
+        # Set up the data.
+        self.setup_dauvergne_protocol_sphere()
 
-        # Reset relax.
-        self.interpreter.reset()
-
-        # Set up a data pipe and bundle.
-        self.interpreter.pipe.create('sphere test', 'mf', bundle='sphere test')
-
-        # Load the sequence.
-        self.interpreter.sequence.read(file='noe.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, sep=None, spin_id=None)
+        # Create a temporary directory for dumping files.
+        ds.tmpdir = mkdtemp()
 
-        # Load the relaxation data.
-        self.interpreter.relax_data.read(ri_id='r1.500', ri_type='R1', frq=500000000.0, file='r1.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
-        self.interpreter.relax_data.read(ri_id='r2.500', ri_type='R2', frq=500000000.0, file='r2.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
-        self.interpreter.relax_data.read(ri_id='noe.500', ri_type='NOE', frq=500000000.0, file='noe.500.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
-        self.interpreter.relax_data.read(ri_id='r1.900', ri_type='R1', frq=900000000.0, file='r1.900.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
-        self.interpreter.relax_data.read(ri_id='r2.900', ri_type='R2', frq=900000000.0, file='r2.900.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
-        self.interpreter.relax_data.read(ri_id='noe.900', ri_type='NOE', frq=900000000.0, file='noe.900.out', dir=dir, spin_id_col=None, mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=6, error_col=7, sep=None, spin_id=None)
-        self.interpreter.relax_data.peak_intensity_type(ri_id='noe.900', type='height')
-        self.interpreter.relax_data.peak_intensity_type(ri_id='r2.900', type='height')
-        self.interpreter.relax_data.peak_intensity_type(ri_id='r1.900', type='height')
-        self.interpreter.relax_data.peak_intensity_type(ri_id='noe.500', type='height')
-        self.interpreter.relax_data.peak_intensity_type(ri_id='r2.500', type='height')
-        self.interpreter.relax_data.peak_intensity_type(ri_id='r1.500', type='height')
-        self.interpreter.relax_data.peak_intensity_type(ri_id='r1.500', type='height')
+        # The dauvergne_protocol model-free auto-analysis.
+        dAuvergne_protocol(pipe_name='sphere test', pipe_bundle='sphere test', results_dir=ds.tmpdir, diff_model=['local_tm', 'sphere'], mf_models=['m1', 'm2'], local_tm_models=['tm0', 'tm1'], grid_inc=3, diff_tensor_grid_inc={'sphere': 5, 'prolate': 5, 'oblate': 5, 'ellipsoid': 3}, min_algor='newton', mc_sim_num=2, max_iter=1, conv_loop=True)
 
-        # Set up the interatomic interactions.
-        self.interpreter.structure.read_pdb(file='sphere.pdb', dir=dir, read_mol=None, set_mol_name=None, read_model=None, set_model_num=None, alt_loc=None, verbosity=1, merge=False)
-        self.interpreter.structure.get_pos(spin_id=None, ave_pos=True)
-        self.interpreter.interatom.define(spin_id1='@N*', spin_id2='@H*', direct_bond=True, spin_selection=True, pipe=None)
-        self.interpreter.interatom.set_dist(spin_id1='@N*', spin_id2='@H*', ave_dist=1.02e-10, unit='meter')
-        self.interpreter.interatom.unit_vectors(ave=True)
 
-        # Set the CSA value.
-        self.interpreter.value.set(val=-0.000172, param='csa', index=0, spin_id='@N*', error=False, force=True)
+    def test_dauvergne_protocol_sphere_resume(self):
+        """Check that an interrupted dauvergne_protocol run resumes from the checkpointed results."""
 
-        # Set up the isotope information.
-        self.interpreter.spin.isotope(isotope='15N', spin_id='@N*', force=True)
-        self.interpreter.spin.isotope(isotope='1H', spin_id='@H*', force=True)
+        # The protocol arguments.
+        args = {'pipe_name': 'sphere test', 'pipe_bundle': 'sphere test', 'diff_model': ['local_tm', 'sphere'], 'mf_models': ['m1', 'm2'], 'local_tm_models': ['tm0', 'tm1'], 'grid_inc': 3, 'diff_tensor_grid_inc': {'sphere': 5, 'prolate': 5, 'oblate': 5, 'ellipsoid': 3}, 'min_algor': 'newton', 'mc_sim_num': 2, 'max_iter': 1, 'conv_loop': True}
 
         # Create a temporary directory for dumping files.
-        ds.tmpdir = mkdtemp()
-
-        # The dauvergne_protocol model-free auto-analysis.
-        dAuvergne_protocol(pipe_name='sphere test', pipe_bundle='sphere test', results_dir=ds.tmpdir, diff_model=['local_tm', 'sphere'], mf_models=['m1', 'm2'], local_tm_models=['tm0', 'tm1'], grid_inc=3, diff_tensor_grid_inc={'sphere': 5, 'prolate': 5, 'oblate': 5, 'ellipsoid': 3}, min_algor='newton', mc_sim_num=2, max_iter=1, conv_loop=True)
+        self.tmpdir = mkdtemp()
+        dir_full = self.tmpdir + sep + 'full'
+        dir = self.tmpdir + sep + 'resumed'
+
+        # The uninterrupted run.
+        self.setup_dauvergne_protocol_sphere()
+        dAuvergne_protocol(results_dir=dir_full, **args)
+
+        # Interrupt the second run at the model selection of the second round of the sphere model (after those of the local tm model and the first round).
+        self.setup_dauvergne_protocol_sphere()
+        calls = []
+        model_selection = self.interpreter.model_selection
+        def interrupt(*args, **kargs):
+            if kargs.get('modsel_pipe') == 'aic - sphere test':
+                calls.append(True)
+                if len(calls) == 3:
+                    raise RelaxError("Simulated interruption.")
+            model_selection(*args, **kargs)
+        self.assertRaises(RelaxError, dAuvergne_protocol, results_dir=dir, user_fns={'model_selection': interrupt}, **args)
+
+        # The checkpoints of the interrupted round, making the 'm2' checkpoint stale.
+        round_dir = dir + sep + 'sphere' + sep + 'round_2'
+        self.assertFalse(path.isdir(round_dir + sep + 'opt'))
+        file = open(round_dir + sep + 'm2' + sep + 'checkpoint', 'w')
+        file.write("stale\n")
+        file.close()
+        times = {}
+        for model_dir in [dir+sep+'local_tm'+sep+'tm0', dir+sep+'local_tm'+sep+'tm1', round_dir+sep+'m1', round_dir+sep+'m2']:
+            times[model_dir] = path.getmtime(model_dir + sep + 'results.bz2')
+
+        # Resume the run.
+        self.setup_dauvergne_protocol_sphere()
+        dAuvergne_protocol(results_dir=dir, **args)
+
+        # Only the stale checkpoint has been optimised again.
+        for model_dir in times:
+            if model_dir == round_dir+sep+'m2':
+                self.assertNotEqual(path.getmtime(model_dir + sep + 'results.bz2'), times[model_dir])
+            else:
+                self.assertEqual(path.getmtime(model_dir + sep + 'results.bz2'), times[model_dir])
+
+        # Compare the final results of the resumed and uninterrupted runs.
+        for name, results_dir in [['full', dir_full], ['resumed', dir]]:
+            self.interpreter.pipe.create(name, 'mf')
+            self.interpreter.results.read(file='results', dir=results_dir+sep+'sphere'+sep+'round_2'+sep+'opt')
+        full = pipes.get_pipe('full')
+        resumed = pipes.get_pipe('resumed')
+        self.assertAlmostEqual(resumed.diff_tensor.tm, full.diff_tensor.tm)
+        self.assertAlmostEqual(resumed.chi2, full.chi2)
+        count = 0
+        for spin, spin_id in spin_loop(pipe='full', return_id=True, skip_desel=True):
+            spin2 = return_spin(spin_id=spin_id, pipe='resumed')
+            self.assertEqual(spin2.model, spin.model)
+            for param in spin.params:
+                self.assertAlmostEqual(getattr(spin2, param.lower()), getattr(spin, param.lower()))
+            count += 1
+        self.assertNotEqual(count, 0)
 
 
     def test_generate_ri(self):
@@ -1156,6 +1229,49 @@ class Mf(SystemTestCase):
         self.script_exec(status.install_path + sep+'test_suite'+sep+'system_tests'+sep+'scripts'+sep+'model_free'+sep+'opt_tm9_grid.py')
 
 
+    def test_monte_carlo_streaming(self):
+        """Check that the streaming Monte Carlo simulations give the same errors as the stored simulations."""
+
+        # Setup the data pipe for optimisation.
+        self.script_exec(status.install_path + sep+'test_suite'+sep+'system_tests'+sep+'scripts'+sep+'model_free'+sep+'opt_setup_S2_0_970_te_2048_Rex_0_149.py')
+
+        # Set up the initial model-free parameter values and minimise.
+        self.interpreter.value.set([1.0, 0.0, 0.0], ['s2', 'te', 'rex'])
+        self.interpreter.minimise.execute('newton')
+
+        # Alias the relevent spin container.
+        spin = cdp.mol[0].res[1].spin[0]
+
+        # Stored Monte Carlo simulations.
+        self.interpreter.monte_carlo.setup(number=5)
+        self.interpreter.monte_carlo.create_data(distribution='fixed', fixed_error=0.1, seed=10)
+        self.interpreter.monte_carlo.initial_values()
+        self.interpreter.minimise.execute('newton')
+        self.interpreter.monte_carlo.error_analysis(summary_only=True)
+        errors = [spin.s2_err, spin.te_err, spin.rex_err]
+
+        # Streaming Monte Carlo simulations.
+        self.interpreter.monte_carlo.setup(number=5)
+        self.interpreter.monte_carlo.create_data(distribution='fixed', fixed_error=0.1, seed=10, streaming=True)
+        self.interpreter.monte_carlo.initial_values()
+        self.interpreter.minimise.execute('newton')
+
+        # No simulation data or parameters are stored.
+        self.assertFalse(hasattr(spin, 'ri_data_sim'))
+        self.assertFalse(hasattr(spin, 's2_sim'))
+        self.assertEqual(spin._sim_stats['s2'].n, 5)
+
+        # The simulations cannot be optimised twice.
+        self.assertRaises(RelaxError, self.interpreter.minimise.execute, 'newton')
+
+        # The errors.
+        self.interpreter.monte_carlo.error_analysis()
+        self.assertNotEqual(errors[0], 0.0)
+        self.assertAlmostEqual(spin.s2_err, errors[0])
+        self.assertAlmostEqual(spin.te_err / 1e-12, errors[1] / 1e-12)
+        self.assertAlmostEqual(spin.rex_err, errors[2])
+
+
     def test_omp_analysis(self):
         """Try a very minimal model-free analysis on the OMP relaxation data."""
 
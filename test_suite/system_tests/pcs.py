@@ -24,12 +24,21 @@
 
 
 # Python module imports.
+from copy import deepcopy
+from math import pi, sqrt
+from numpy import array, eye, float64, std, zeros
+from numpy.linalg import norm
+from numpy.random import multivariate_normal, seed
 from os import sep
 from re import search
 from tempfile import mkdtemp, mkstemp
 
 # relax module imports.
 from data_store import Relax_data_store; ds = Relax_data_store()
+from lib.alignment.pcs import pcs_tensor
+from lib.periodic_table import periodic_table
+from lib.physical_constants import pcs_constant
+from pipe_control.align_tensor import get_tensor_index
 from pipe_control.mol_res_spin import count_spins, spin_loop
 from status import Status; status = Status()
 from test_suite.system_tests.base_classes import SystemTestCase
@@ -530,3 +539,54 @@ class Pcs(SystemTestCase):
         for id in ['Dy N-dom', 'Tb N-dom', 'Tm N-dom', 'Er N-dom']:
             self.assertAlmostEqual(spin.pcs_struct_err[id], pcs_struct_err[id], 2)
             self.assertAlmostEqual(spin.pcs_err[id], pcs_err[id], 2)
+
+
+    def test_structural_noise_seed(self):
+        """Compare the pcs.structural_noise user function to the original spin by spin simulation algorithm for a fixed random seed."""
+
+        # Load the state.
+        state = status.install_path + sep+'test_suite'+sep+'shared_data'+sep+'saved_states'+sep+'pcs_structural_noise_test.bz2'
+        self.interpreter.state.load(state)
+
+        # A second spin, further from the paramagnetic centre and missing one PCS value.
+        self.interpreter.spin.copy(spin_from='#CaM:5@N', spin_to='#CaM:5@H')
+        spin2 = cdp.mol[0].res[0].spin[1]
+        spin2.pos = [pos + array([-3.0, 2.0, 1.0]) for pos in spin2.pos]
+        del spin2.pcs['Er N-dom']
+
+        # The original PCS errors.
+        orig_err = {}
+        for spin in spin_loop():
+            orig_err[spin.name] = deepcopy(spin.pcs_err)
+
+        # The structural noise.
+        seed(1000)
+        self.interpreter.pcs.structural_noise(rmsd=0.5, sim_num=500, file='devnull', dir=None, force=True)
+
+        # The original algorithm, with the spin, simulation and alignment loops.
+        seed(1000)
+        for spin in spin_loop():
+            # The average position and randomised positions.
+            pos = sum(spin.pos) / len(spin.pos)
+            new_pos = multivariate_normal(pos, 0.5**2 * eye(3), 500)
+
+            # Back-calculate the PCS values for each randomised position.
+            pcs = {}
+            for id in cdp.align_ids:
+                pcs[id] = zeros(500, float64)
+            for i in range(500):
+                vect = new_pos[i] - cdp.paramagnetic_centre
+                r = norm(vect)
+                vect = vect / r
+                for id in cdp.align_ids:
+                    if id not in spin.pcs:
+                        continue
+                    dj = pcs_constant(cdp.temperature[id], cdp.spectrometer_frq[id] * 2.0 * pi / periodic_table.gyromagnetic_ratio('1H'), r/1e10)
+                    pcs[id][i] = pcs_tensor(dj, vect, cdp.align_tensors[get_tensor_index(id)].A) * 1e6
+
+            # Compare the structural errors.
+            self.assertEqual(sorted(spin.pcs_struct_err.keys()), sorted(spin.pcs.keys()))
+            for id in spin.pcs:
+                sd = std(pcs[id])
+                self.assertAlmostEqual(spin.pcs_struct_err[id], sd, 12)
+                self.assertAlmostEqual(spin.pcs_err[id], sqrt(orig_err[spin.name][id]**2 + sd**2), 12)
@@ -4140,6 +4140,53 @@ class Relax_disp(SystemTestCase):
         self.assertAlmostEqual(spin71.chi2, 15.6595374286822, 3)
 
 
+    def test_hansen_cpmg_data_auto_analysis_elimination(self):
+        """Test of the early model elimination in the dispersion auto-analysis using Dr. Flemming Hansen's CPMG data.
+
+        The model selection with the early model elimination is compared to that of a run without elimination.
+        """
+
+        # The models, with Monte Carlo simulations for all models.
+        models = [MODEL_NOREX, MODEL_LM63, MODEL_CR72, MODEL_NS_CPMG_2SITE_EXPANDED]
+        ds.models = models
+        ds.mc_sim_all_models = True
+
+        # Execute the script, without early elimination.
+        self.interpreter.run(script_file=status.install_path + sep+'test_suite'+sep+'system_tests'+sep+'scripts'+sep+'relax_disp'+sep+'hansen_data.py')
+
+        # The selected models.
+        self.interpreter.pipe.switch(pipe_name='final - relax_disp')
+        selected = {}
+        for spin, spin_id in spin_loop(return_id=True, skip_desel=True):
+            selected[spin_id] = [spin.model, spin.chi2]
+
+        # Reset relax, and execute the script with early elimination.
+        self.interpreter.reset()
+        ds.tmpdir = self.tmpdir + sep + 'elimination'
+        ds.models = models
+        ds.mc_sim_all_models = True
+        ds.elimination_gap = 0.5
+        self.interpreter.run(script_file=status.install_path + sep+'test_suite'+sep+'system_tests'+sep+'scripts'+sep+'relax_disp'+sep+'hansen_data.py')
+
+        # The spins skipped in the individual models.
+        skipped = []
+        for model in models:
+            self.interpreter.pipe.switch(pipe_name='%s - relax_disp' % model)
+            for spin, spin_id in spin_loop(return_id=True):
+                if spin_id in selected and not spin.select:
+                    skipped.append([model, spin_id])
+        print("\nSpins skipped by the early model elimination:  %s" % skipped)
+        self.assertNotEqual(skipped, [])
+
+        # Check the model selection.
+        self.interpreter.pipe.switch(pipe_name='final - relax_disp')
+        for spin, spin_id in spin_loop(return_id=True, skip_desel=True):
+            print("%-10s %-30s %-30s" % (spin_id, selected[spin_id][0], spin.model))
+            self.assertEqual(spin.model, selected[spin_id][0])
+            self.assertAlmostEqual(spin.chi2, selected[spin_id][1])
+        self.assertEqual(len(list(spin_loop(skip_desel=True))), len(selected))
+
+
     def test_hansen_cpmg_data_auto_analysis_numeric(self):
         """Test of the numeric model only dispersion auto-analysis using Dr. Flemming Hansen's CPMG data.
 
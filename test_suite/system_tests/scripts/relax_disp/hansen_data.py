@@ -44,6 +44,10 @@ if not hasattr(ds, 'tmpdir'):
 # The numeric flag.
 if not hasattr(ds, 'numeric_only'):
     ds.numeric_only = False
+if not hasattr(ds, 'mc_sim_all_models'):
+    ds.mc_sim_all_models = False
+if not hasattr(ds, 'elimination_gap'):
+    ds.elimination_gap = None
 
 # The grid search size (the number of increments per dimension).
 GRID_INC = None
@@ -78,4 +82,4 @@ Relax_disp.opt_func_tol = 1e-5
 Relax_disp.opt_max_iterations = 10000
 
 # Do not change!
-Relax_disp(pipe_name=pipe_name, pipe_bundle=pipe_bundle, results_dir=ds.tmpdir, models=MODELS, grid_inc=GRID_INC, mc_sim_num=MC_NUM, numeric_only=ds.numeric_only)
+Relax_disp(pipe_name=pipe_name, pipe_bundle=pipe_bundle, results_dir=ds.tmpdir, models=MODELS, grid_inc=GRID_INC, mc_sim_num=MC_NUM, numeric_only=ds.numeric_only, mc_sim_all_models=ds.mc_sim_all_models, elimination_gap=ds.elimination_gap)
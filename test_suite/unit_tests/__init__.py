@@ -38,6 +38,7 @@ __all__ = [
     'spin_testing_base',
     'state_testing_base',
     'structure_testing_base',
+    'test_status',
     'unit_test_runner',
     'value_testing_base',
     '_auto_analyses',
@@ -20,4 +20,7 @@
 ###############################################################################
 
 
-__all__ = ['test___init__']
+__all__ = [
+    'test___init__',
+    'test_dauvergne_protocol'
+]
@@ -0,0 +1,370 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from os import mkdir, remove, sep
+from tempfile import mkdtemp
+
+# relax module imports.
+from auto_analyses.dauvergne_protocol import Container, dAuvergne_protocol
+from data_store import Relax_data_store; ds = Relax_data_store()
+from lib.errors import RelaxError
+from pipe_control import diffusion_tensor, pipes
+from pipe_control.mol_res_spin import create_spin, return_spin
+from prompt.interpreter import Interpreter
+from test_suite.unit_tests.base_classes import UnitTestCase
+
+
+class Test_dauvergne_protocol(UnitTestCase):
+    """Unit tests for the incremental re-execution of the auto_analyses.dauvergne_protocol module."""
+
+    def setUp(self):
+        """Set up the base data pipe and a protocol object without executing the protocol."""
+
+        # The interpreter.
+        self.interpreter = Interpreter(show_script=False, raise_relax_error=True)
+        self.interpreter.populate_self()
+        self.interpreter.on(verbose=False)
+
+        # A temporary directory for the results.
+        self.tmpdir = mkdtemp()
+
+        # The base data pipe, with two spins.
+        ds.add(pipe_name='base', pipe_type='mf', bundle='test')
+        pipes.switch('base')
+        cdp.ri_ids = ['R1_600', 'R2_600', 'NOE_600', 'R1_800']
+        cdp.ri_type = {'R1_600': 'R1', 'R2_600': 'R2', 'NOE_600': 'NOE', 'R1_800': 'R1'}
+        cdp.spectrometer_frq = {'R1_600': 600e6, 'R2_600': 600e6, 'NOE_600': 600e6, 'R1_800': 800e6}
+        for res_num in [1, 2]:
+            create_spin(spin_num=res_num, spin_name='N', res_num=res_num, res_name='Gly')
+            spin = return_spin(spin_id=':%i@N' % res_num)
+            spin.isotope = '15N'
+            spin.ri_data = {'R1_600': 1.0 + res_num, 'R2_600': 10.0 + res_num, 'NOE_600': 0.8, 'R1_800': 0.8 + res_num}
+            spin.ri_data_err = {'R1_600': 0.02, 'R2_600': 0.2, 'NOE_600': 0.05, 'R1_800': 0.02}
+            spin.csa = -172e-6
+
+        # The protocol object, bypassing the execution of the protocol in the __init__() method.
+        self.protocol = dAuvergne_protocol.__new__(dAuvergne_protocol)
+        self.protocol.interpreter = self.interpreter
+        self.protocol.pipe_name = 'base'
+        self.protocol.pipe_bundle = 'test'
+        self.protocol.mf_models = ['m1', 'm2']
+        self.protocol.local_tm_models = ['tm1', 'tm2']
+        self.protocol.grid_inc = 11
+        self.protocol.diff_tensor_grid_inc = {'sphere': 11, 'prolate': 11, 'oblate': 11, 'ellipsoid': 6}
+        self.protocol.min_algor = 'newton'
+        self.protocol.mc_sim_num = 500
+        self.protocol.max_iter = None
+        self.protocol.conv_loop = True
+        self.protocol.warm_start = False
+        self.protocol.diff_tol = 0.0
+        self.protocol.diff_model_list = ['sphere']
+        self.protocol.diff_model = 'sphere'
+        self.protocol.results_dir = self.tmpdir + sep
+        self.protocol.pipe_rounds = {}
+        self.protocol.round = 2
+        self.protocol.pipes = [self.protocol.name_pipe('m1'), self.protocol.name_pipe('m2')]
+        self.protocol.conv_data = Container()
+        self.protocol.conv_data.chi2 = []
+        self.protocol.conv_data.models = []
+        self.protocol.conv_data.diff_vals = []
+        self.protocol.conv_data.diff_params = ['tm']
+        self.protocol.conv_data.rounds = []
+        self.protocol.conv_data.spins = []
+
+        # The fixed diffusion tensor of the current round.
+        self.protocol.interpreter.pipe.create(self.protocol.name_pipe('previous'), 'mf', bundle='test')
+        diffusion_tensor.init(params=1e-8)
+        pipes.switch('base')
+
+
+    def create_model_pipe(self, name=None, model='m2', tm=1e-8, s2=0.8):
+        """Create a data pipe of optimised model-free results.
+
+        @keyword name:  The name of the data pipe.
+        @type name:     str
+        @keyword model: The model-free model.
+        @type model:    str
+        @keyword tm:    The correlation time of the spherical diffusion tensor.
+        @type tm:       float
+        @keyword s2:    The S2 value of the first spin.
+        @type s2:       float
+        """
+
+        # Copy the base data pipe.
+        self.protocol.interpreter.pipe.copy('base', name, bundle_to='test')
+        self.protocol.interpreter.pipe.switch(name)
+        diffusion_tensor.init(params=tm)
+
+        # The optimised model-free parameters.
+        for res_num in [1, 2]:
+            spin = return_spin(spin_id=':%i@N' % res_num)
+            spin.model = model
+            spin.params = ['s2', 'te']
+            spin.s2 = s2 + 0.01*res_num
+            spin.te = 1e-11 * res_num
+            spin.chi2 = 0.5 * res_num
+            spin.iter = 10
+            spin.f_count = 20
+            spin.g_count = 30
+            spin.h_count = 40
+            spin.warning = None
+
+        # Switch back to the base data pipe.
+        self.protocol.interpreter.pipe.switch('base')
+
+
+    def test_check_vars(self):
+        """Test the checking of the warm_start and diff_tol arguments."""
+
+        # The default values are fine.
+        self.protocol.check_vars()
+
+        # Invalid warm_start values.
+        self.protocol.warm_start = 1
+        self.assertRaises(RelaxError, self.protocol.check_vars)
+        self.protocol.warm_start = True
+        self.protocol.check_vars()
+
+        # Invalid diff_tol values.
+        for val in [-1e-5, 1, None, '0.0']:
+            self.protocol.diff_tol = val
+            self.assertRaises(RelaxError, self.protocol.check_vars)
+        self.protocol.diff_tol = 1e-5
+        self.protocol.check_vars()
+
+
+    def test_checkpoint(self):
+        """Test the checkpoint markers of the model-free model optimisations."""
+
+        # The key of the current optimisation.
+        tensor_pipe = self.protocol.name_pipe('previous')
+        key = self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=tensor_pipe)
+
+        # The results without a marker are not a checkpoint.
+        dir = self.tmpdir + sep + 'm2'
+        mkdir(dir)
+        open(dir + sep + 'results.bz2', 'w').close()
+        self.assertFalse(self.protocol.checkpoint_valid(dir=dir, key=key))
+
+        # The marker of the completed optimisation.
+        self.protocol.write_checkpoint(dir=dir, key=key)
+        self.assertTrue(self.protocol.checkpoint_valid(dir=dir, key=key))
+
+        # A marker without results.
+        dir2 = self.tmpdir + sep + 'm1'
+        self.protocol.write_checkpoint(dir=dir2, key=key)
+        self.assertFalse(self.protocol.checkpoint_valid(dir=dir2, key=key))
+
+        # A different round, model, or local tm model.
+        self.assertNotEqual(self.protocol.checkpoint_key(model='m2', rnd=3, tensor_pipe=tensor_pipe), key)
+        self.assertNotEqual(self.protocol.checkpoint_key(model='m1', rnd=2, tensor_pipe=tensor_pipe), key)
+        self.assertNotEqual(self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=None), key)
+
+        # A different global diffusion model.
+        self.protocol.diff_model = 'prolate'
+        self.assertNotEqual(self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=tensor_pipe), key)
+        self.protocol.diff_model = 'sphere'
+        self.assertEqual(self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=tensor_pipe), key)
+
+        # A different diffusion tensor.
+        pipes.get_pipe(tensor_pipe).diff_tensor.set(param='tm', value=1.1e-8)
+        self.assertFalse(self.protocol.checkpoint_valid(dir=dir, key=self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=tensor_pipe)))
+        pipes.get_pipe(tensor_pipe).diff_tensor.set(param='tm', value=1e-8)
+        self.assertTrue(self.protocol.checkpoint_valid(dir=dir, key=self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=tensor_pipe)))
+
+        # Different relaxation data or CSA values.
+        spin = return_spin(spin_id=':2@N')
+        spin.ri_data['R2_600'] = 12.5
+        self.assertNotEqual(self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=tensor_pipe), key)
+        spin.ri_data['R2_600'] = 12.0
+        spin.csa = -160e-6
+        self.assertNotEqual(self.protocol.checkpoint_key(model='m2', rnd=2, tensor_pipe=tensor_pipe), key)
+
+
+    def test_load_conv_history(self):
+        """Test the restoration of the convergence data of the completed rounds."""
+
+        # The optimised results of the two completed rounds.
+        for rnd in [1, 2]:
+            name = 'opt %i' % rnd
+            self.create_model_pipe(name=name, tm=1e-8 + rnd*1e-10, s2=0.7 + rnd*0.1)
+            pipes.get_pipe(name).chi2 = 10.0 / rnd
+            self.protocol.interpreter.pipe.switch(name)
+            self.protocol.interpreter.results.write(file='results', dir=self.tmpdir + sep + 'sphere' + sep + 'round_%i' % rnd + sep + 'opt', force=True)
+        self.protocol.interpreter.pipe.switch('base')
+
+        # Restore the data for the third round.
+        self.protocol.round = 3
+        self.protocol.start_round = 3
+        self.protocol.load_conv_history()
+
+        # The round number and current data pipe are unchanged.
+        self.assertEqual(self.protocol.round, 3)
+        self.assertEqual(pipes.cdp_name(), 'base')
+        self.assertFalse(pipes.has_pipe(self.protocol.name_pipe('history')))
+
+        # The convergence data.
+        self.assertEqual(self.protocol.conv_data.rounds, [1, 2])
+        self.assertEqual(self.protocol.conv_data.chi2, [10.0, 5.0])
+        self.assertEqual(self.protocol.conv_data.models, ['m2m2', 'm2m2'])
+        self.assertAlmostEqual(self.protocol.conv_data.diff_vals[0][0], 1.01e-8)
+        self.assertAlmostEqual(self.protocol.conv_data.diff_vals[1][0], 1.02e-8)
+        self.assertEqual(sorted(self.protocol.conv_data.spins[1].keys()), [':1@N', ':2@N'])
+        params, vals = self.protocol.conv_data.spins[1][':1@N']
+        self.assertEqual(params, ['s2', 'te'])
+        self.assertAlmostEqual(vals[0], 0.91)
+        self.assertAlmostEqual(vals[1], 1e-11)
+
+        # Nothing to restore for the first round.
+        self.protocol.conv_data.rounds = []
+        self.protocol.start_round = 1
+        self.protocol.load_conv_history()
+        self.assertEqual(self.protocol.conv_data.rounds, [])
+
+
+    def test_previous_spins(self):
+        """Test the retrieval of the spins of the previous round and the diffusion tensor comparison."""
+
+        # The model-free model data pipe of the previous round held in memory.
+        name = self.protocol.name_pipe('m2')
+        self.create_model_pipe(name=name, tm=1.000001e-8)
+        self.protocol.pipe_rounds[name] = ('sphere', 1)
+
+        # The spins and a changed diffusion tensor, for the default identical tensor tolerance.
+        spins, same = self.protocol.previous_spins(1)
+        self.assertEqual(sorted(spins.keys()), [':1@N', ':2@N'])
+        self.assertAlmostEqual(spins[':1@N'].s2, 0.81)
+        self.assertFalse(same)
+
+        # The diffusion tensor is unchanged within the relative tolerance.
+        self.protocol.diff_tol = 1e-5
+        spins, same = self.protocol.previous_spins(1)
+        self.assertTrue(same)
+
+        # The first round.
+        self.protocol.round = 1
+        self.assertEqual(self.protocol.previous_spins(1), (None, False))
+        self.protocol.round = 2
+
+        # The data pipe is not from the previous round, and no results exist.
+        self.protocol.pipe_rounds[name] = ('sphere', 2)
+        self.assertEqual(self.protocol.previous_spins(1), (None, False))
+
+        # Results without a checkpoint marker.
+        dir = self.tmpdir + sep + 'sphere' + sep + 'round_1' + sep + 'm2'
+        self.protocol.interpreter.pipe.switch(name)
+        self.protocol.interpreter.results.write(file='results', dir=dir, force=True)
+        self.protocol.interpreter.pipe.switch('base')
+        self.assertEqual(self.protocol.previous_spins(1), (None, False))
+        self.assertFalse(pipes.has_pipe(name))
+
+        # Results with a marker of a different round.
+        self.protocol.write_checkpoint(dir=dir, key='stale')
+        self.assertEqual(self.protocol.previous_spins(1), (None, False))
+
+        # Results with the checkpoint marker of the previous round.
+        self.create_model_pipe(name=name, tm=1.000001e-8)
+        self.protocol.write_checkpoint(dir=dir, key=self.protocol.checkpoint_key(model='m2', rnd=1, tensor_pipe=name))
+        self.protocol.interpreter.pipe.delete(name)
+        spins, same = self.protocol.previous_spins(1)
+        self.assertEqual(sorted(spins.keys()), [':1@N', ':2@N'])
+        self.assertAlmostEqual(spins[':2@N'].s2, 0.82)
+        self.assertTrue(same)
+
+
+    def test_results_exist(self):
+        """Test the detection of the results files."""
+
+        # No directory.
+        dir = self.tmpdir + sep + 'm1'
+        self.assertFalse(self.protocol.results_exist(dir))
+
+        # An empty directory.
+        mkdir(dir)
+        self.assertFalse(self.protocol.results_exist(dir))
+
+        # The results files.
+        for ext in ['', '.gz', '.bz2']:
+            file = dir + sep + 'results' + ext
+            open(file, 'w').close()
+            self.assertTrue(self.protocol.results_exist(dir))
+            remove(file)
+
+
+    def test_reuse_spins(self):
+        """Test the reuse and warm starting of the previous round's per-spin results."""
+
+        # The previous round.
+        prev = self.protocol.name_pipe('prev')
+        self.create_model_pipe(name=prev)
+        prev_spins = {}
+        for res_num in [1, 2]:
+            prev_spins[':%i@N' % res_num] = return_spin(spin_id=':%i@N' % res_num, pipe=prev)
+
+        # The current data pipe, with changed relaxation data for the second spin.
+        self.protocol.interpreter.pipe.copy('base', 'curr', bundle_to='test')
+        self.protocol.interpreter.pipe.switch('curr')
+        for res_num in [1, 2]:
+            spin = return_spin(spin_id=':%i@N' % res_num)
+            spin.model = 'm2'
+            spin.params = ['s2', 'te']
+            spin.s2 = None
+            spin.te = None
+        spin1 = return_spin(spin_id=':1@N')
+        spin2 = return_spin(spin_id=':2@N')
+        spin2.ri_data['R2_600'] = 13.0
+
+        # No previous results, or a changed tensor without warm starting.
+        self.assertEqual(self.protocol.reuse_spins(None, True), [])
+        self.assertEqual(self.protocol.reuse_spins(prev_spins, False), [])
+        self.assertEqual(spin1.s2, None)
+
+        # Warm starting with a changed tensor.
+        self.protocol.warm_start = True
+        self.assertEqual(self.protocol.reuse_spins(prev_spins, False), [])
+        self.assertAlmostEqual(spin1.s2, 0.81)
+        self.assertAlmostEqual(spin1.te, 1e-11)
+        self.assertTrue(spin1.select)
+        self.assertFalse(hasattr(spin1, 'chi2'))
+        self.assertEqual(spin2.s2, None)
+
+        # Reuse with an unchanged tensor.
+        self.protocol.warm_start = False
+        spin1.s2 = None
+        skipped = self.protocol.reuse_spins(prev_spins, True)
+        self.assertEqual(len(skipped), 1)
+        self.assertEqual(skipped[0][0], spin1)
+        self.assertEqual(skipped[0][1], True)
+        self.assertFalse(spin1.select)
+        self.assertAlmostEqual(spin1.s2, 0.81)
+        self.assertEqual(spin1.chi2, 0.5)
+        self.assertEqual(spin1.f_count, 20)
+        self.assertTrue(spin2.select)
+        self.assertEqual(spin2.s2, None)
+
+        # A changed model or CSA value.
+        spin1.select = True
+        spin1.model = 'm1'
+        self.assertEqual(self.protocol.reuse_spins(prev_spins, True), [])
+        spin1.model = 'm2'
+        spin1.csa = -160e-6
+        self.assertEqual(self.protocol.reuse_spins(prev_spins, True), [])
@@ -23,5 +23,6 @@ __all__ = [
     'test___init__',
     'test_diff_tensor',
     'test_mol_res_spin',
+    'test_peak_intensity',
     'test_seq_align'
 ]
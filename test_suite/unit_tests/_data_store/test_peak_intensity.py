@@ -0,0 +1,227 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from copy import deepcopy
+from math import isnan
+from numpy import array, float64
+from pickle import dumps, loads
+from unittest import TestCase
+
+# relax module imports.
+from data_store.mol_res_spin import SpinContainer
+from data_store.peak_intensity import Peak_intensity_store, Peak_intensity_view
+from lib.errors import RelaxError
+
+
+class Test_peak_intensity(TestCase):
+    """Unit tests for the data_store.peak_intensity relax module."""
+
+    def setUp(self):
+        """Create a store and a few spins with plain dictionaries of peak intensities."""
+
+        # The store.
+        self.store = Peak_intensity_store()
+
+        # The spins.
+        self.spins = []
+        for i in range(3):
+            self.spins.append(SpinContainer())
+            self.spins[i].peak_intensity = {'ref': 100.0 + i, 'sat': 50.0 + i}
+        self.spins[2].peak_intensity['extra'] = 1.0
+
+
+    def test_adoption(self):
+        """Test the adoption of plain dictionaries into the store."""
+
+        # Adopt.
+        rows = self.store.rows(self.spins, 'peak_intensity')
+
+        # Checks.
+        self.assertEqual(rows, [0, 1, 2])
+        self.assertEqual(self.store.spectrum_ids, ['ref', 'sat', 'extra'])
+        for i in range(3):
+            self.assertTrue(isinstance(self.spins[i].peak_intensity, Peak_intensity_view))
+        self.assertEqual(self.spins[0].peak_intensity, {'ref': 100.0, 'sat': 50.0})
+        self.assertEqual({'ref': 102.0, 'sat': 52.0, 'extra': 1.0}, self.spins[2].peak_intensity)
+        self.assertEqual(repr(self.spins[1].peak_intensity), repr({'ref': 101.0, 'sat': 51.0}))
+
+        # Adopting again returns the same view.
+        view = self.spins[0].peak_intensity
+        self.assertTrue(self.store.view(self.spins[0], 'peak_intensity') is view)
+
+        # A second attribute shares the row of the spin.
+        self.spins[1].peak_intensity_err = {'ref': 2.0}
+        self.assertEqual(self.store.rows(self.spins[1:2], 'peak_intensity_err'), [1])
+
+
+    def test_copies(self):
+        """Test that copies and pickles of the views are plain dictionaries."""
+
+        # Adopt.
+        self.store.rows(self.spins, 'peak_intensity')
+
+        # Deep copies of the spin container.
+        spin = deepcopy(self.spins[0])
+        self.assertEqual(type(spin.peak_intensity), dict)
+        self.assertEqual(spin.peak_intensity, {'ref': 100.0, 'sat': 50.0})
+
+        # Pickling.
+        data = loads(dumps(self.spins[2].peak_intensity))
+        self.assertEqual(type(data), dict)
+        self.assertEqual(data, {'ref': 102.0, 'sat': 52.0, 'extra': 1.0})
+
+        # Dictionary conversion.
+        self.assertEqual(dict(self.spins[1].peak_intensity), {'ref': 101.0, 'sat': 51.0})
+
+        # Deep copies of the store are empty.
+        self.assertEqual(deepcopy(self.store).spectrum_ids, [])
+
+
+    def test_dict_interface(self):
+        """Test the dictionary interface of the views."""
+
+        # Adopt.
+        view = self.store.view(self.spins[2], 'peak_intensity')
+
+        # Access.
+        self.assertEqual(len(view), 3)
+        self.assertTrue('ref' in view)
+        self.assertFalse('x' in view)
+        self.assertEqual(view.get('x', 3.0), 3.0)
+        self.assertEqual(list(view.keys()), ['ref', 'sat', 'extra'])
+        self.assertEqual(list(view.values()), [102.0, 52.0, 1.0])
+        self.assertRaises(KeyError, view.__getitem__, 'x')
+
+        # Modification.
+        view['new'] = 5
+        view['none'] = None
+        del view['sat']
+        self.assertEqual(view.pop('extra'), 1.0)
+        self.assertEqual(view, {'ref': 102.0, 'new': 5.0, 'none': None})
+
+        # The other spins are unaffected.
+        view = self.store.view(self.spins[1], 'peak_intensity')
+        self.assertEqual(view, {'ref': 101.0, 'sat': 51.0})
+
+        # Clearing.
+        view.clear()
+        self.assertEqual(len(view), 0)
+        self.assertFalse(view)
+
+
+    def test_no_storage(self):
+        """Test that the views hold no data, reading and writing only the row of the store."""
+
+        # Adopt, and modify the view and the matrix.
+        rows = self.store.rows(self.spins, 'peak_intensity')
+        view = self.spins[0].peak_intensity
+        view['nan'] = float('nan')
+        view['none'] = None
+        del view['sat']
+        self.store.set_matrix('peak_intensity', rows[:1], self.store.columns(['ref']), array([[7.0]], float64))
+
+        # The view has no dictionary storage.
+        self.assertFalse(isinstance(view, dict))
+        self.assertEqual(sorted(view.__dict__.keys()), ['_field', '_row', '_sim', '_store'])
+
+        # The matrix updates are seen by the view.
+        self.assertEqual(list(view.keys()), ['ref', 'nan', 'none'])
+        self.assertEqual(view['ref'], 7.0)
+        self.assertEqual(repr(view), "{'ref': 7.0, 'nan': nan, 'none': None}")
+
+        # NaN and None values are preserved.
+        self.assertTrue(isnan(view['nan']))
+        self.assertEqual(view['none'], None)
+        self.assertTrue(isnan(deepcopy(self.spins[0]).peak_intensity['nan']))
+        self.assertEqual(deepcopy(self.spins[0]).peak_intensity['none'], None)
+
+        # Setting the None cell in the matrix replaces the None value.
+        self.store.set_matrix('peak_intensity', rows[:1], self.store.columns(['none']), array([[3.0]], float64))
+        self.assertEqual(view['none'], 3.0)
+
+
+    def test_matrix(self):
+        """Test the sub-matrix access and update."""
+
+        # Adopt.
+        rows = self.store.rows(self.spins, 'peak_intensity')
+        cols = self.store.columns(['sat', 'extra'])
+
+        # The sub-matrix.
+        data, mask = self.store.matrix('peak_intensity', rows, cols)
+        self.assertEqual(data[:, 0].tolist(), [50.0, 51.0, 52.0])
+        self.assertEqual(mask.tolist(), [[True, False], [True, False], [True, True]])
+
+        # Set the error sub-matrix by broadcasting a row.
+        self.store.rows(self.spins, 'peak_intensity_err')
+        self.store.set_matrix('peak_intensity_err', rows, cols, array([1.0, 2.0], float64), mask=mask)
+        self.assertEqual(self.spins[0].peak_intensity_err, {'sat': 1.0})
+        self.assertEqual(self.spins[2].peak_intensity_err, {'sat': 1.0, 'extra': 2.0})
+
+        # Growth of the matrices preserves the data.
+        for i in range(40):
+            spin = SpinContainer()
+            spin.peak_intensity = {'id%i' % i: float(i)}
+            self.store.view(spin, 'peak_intensity')
+        self.assertEqual(spin.peak_intensity, {'id39': 39.0})
+        self.assertEqual(self.spins[2].peak_intensity, {'ref': 102.0, 'sat': 52.0, 'extra': 1.0})
+
+
+    def test_sim_views(self):
+        """Test the Monte Carlo simulation planes."""
+
+        # Pack the simulations.
+        sims = [{'ref': 99.0, 'sat': 49.0}, {'ref': 101.0, 'sat': 51.0}]
+        views = self.store.sim_views(self.spins[0], 'peak_intensity', sims)
+
+        # Checks.
+        self.assertEqual(len(views), 2)
+        self.assertEqual(views[0], sims[0])
+        self.assertEqual(views[1]['sat'], 51.0)
+        self.assertEqual(self.spins[0].peak_intensity, {'ref': 100.0, 'sat': 50.0})
+
+        # A different number of simulations for another spin preserves the data of the first spin.
+        old_views = self.store.sim_views(self.spins[1], 'peak_intensity', [{'ref': 1.0}, {'ref': 2.0}, {'ref': 3.0}])
+        self.assertEqual(old_views[2], {'ref': 3.0})
+        self.assertEqual(views[0], sims[0])
+        self.assertEqual(views[1], sims[1])
+        views2 = self.store.sim_views(self.spins[1], 'peak_intensity', [{'sat': 4.0}])
+        self.assertEqual(views2[0], {'sat': 4.0})
+        self.assertEqual(views[1], sims[1])
+
+        # The replaced views of a spin are invalidated.
+        self.assertRaises(RelaxError, old_views[2].__getitem__, 'ref')
+
+        # Delete the simulations.
+        self.store.delete_sims()
+        self.assertEqual(self.store._sim_data, {})
+        self.assertEqual(self.spins[0].peak_intensity, {'ref': 100.0, 'sat': 50.0})
+
+        # The simulation views are invalidated.
+        self.assertRaises(RelaxError, views[0].__setitem__, 'ref', 1.0)
+        self.assertRaises(RelaxError, views[1].__getitem__, 'ref')
+        self.assertRaises(RelaxError, len, views2[0])
+
+        # New simulations.
+        views = self.store.sim_views(self.spins[0], 'peak_intensity', sims[:1])
+        views[0]['ref'] = 98.0
+        self.assertEqual(views[0], {'ref': 98.0, 'sat': 49.0})
@@ -0,0 +1,130 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+
+# Python module imports.
+from numpy import array, exp, float64, ones, sqrt
+from numpy.linalg import inv
+from unittest import TestCase
+
+# relax module imports.
+from lib.curve_fit.exponential import exponential_2param_neg_batch, exponential_2param_neg_batch_errors
+
+
+class Test_exponential(TestCase):
+    """Unit tests for the lib.curve_fit.exponential relax module."""
+
+    def setUp(self):
+        """Create a set of padded exponential curves."""
+
+        # The curve parameters.
+        self.rates = array([2.0, 15.0, 0.5], float64)
+        self.i0 = array([1000.0, 20000.0, 50.0], float64)
+
+        # The padded times, with the last curve having one point less.
+        self.times = array([[0.0, 0.1, 0.2, 0.4, 0.8],
+                            [0.0, 0.02, 0.04, 0.08, 0.16],
+                            [0.0, 1.0, 2.0, 3.0, 0.0]], float64)
+        self.mask = array([[True, True, True, True, True],
+                           [True, True, True, True, True],
+                           [True, True, True, True, False]])
+
+        # The intensities and errors, with small perturbations.
+        self.values = self.i0[:, None] * exp(-self.rates[:, None] * self.times)
+        self.values += array([[1.0, -1.0, 0.5, -0.5, 0.2], [20.0, -10.0, 5.0, -15.0, 10.0], [0.1, -0.2, 0.1, 0.05, 0.0]])
+        self.errors = array([[1.0]*5, [10.0]*5, [0.2]*5], float64)
+
+
+    def covar_errors(self, rate, i0, times, errors):
+        """Calculate the parameter errors of a single curve from the covariance matrix.
+
+        @param rate:    The rate.
+        @type rate:     float
+        @param i0:      The initial intensity.
+        @type i0:       float
+        @param times:   The time points.
+        @type times:    numpy rank-1 float array
+        @param errors:  The intensity errors.
+        @type errors:   numpy rank-1 float array
+        @return:        The rate and i0 errors.
+        @rtype:         tuple of float
+        """
+
+        # The Jacobian.
+        jacobian = array([-times * i0 * exp(-rate * times), exp(-rate * times)]).T
+
+        # The covariance matrix.
+        covar = inv(jacobian.T.dot(jacobian / errors[:, None]**2))
+
+        # The errors.
+        return sqrt(covar[0, 0]), sqrt(covar[1, 1])
+
+
+    def test_exponential_2param_neg_batch(self):
+        """Test the simultaneous fitting of multiple curves."""
+
+        # Fit the exact curves.
+        values = self.i0[:, None] * exp(-self.rates[:, None] * self.times)
+        rate, i0, rate_err, i0_err, chi2, iter_count = exponential_2param_neg_batch(times=self.times, values=values, errors=self.errors, mask=self.mask)
+        for i in range(3):
+            self.assertAlmostEqual(rate[i], self.rates[i])
+            self.assertAlmostEqual(i0[i] / self.i0[i], 1.0)
+            self.assertAlmostEqual(chi2[i], 0.0)
+
+        # Fit the perturbed curves.
+        rate, i0, rate_err, i0_err, chi2, iter_count = exponential_2param_neg_batch(times=self.times, values=self.values, errors=self.errors, mask=self.mask)
+
+        # Check each curve against a fit of the curve on its own.
+        for i in range(3):
+            num = self.mask[i].sum()
+            results = exponential_2param_neg_batch(times=self.times[i:i+1, :num], values=self.values[i:i+1, :num], errors=self.errors[i:i+1, :num])
+            self.assertAlmostEqual(rate[i] / results[0][0], 1.0)
+            self.assertAlmostEqual(i0[i] / results[1][0], 1.0)
+            self.assertAlmostEqual(chi2[i], results[4][0])
+
+            # The minimum, as the chi-squared gradient is zero.
+            times = self.times[i, :num]
+            resid = (self.values[i, :num] - i0[i] * exp(-rate[i] * times)) / self.errors[i, :num]**2
+            self.assertAlmostEqual(sum(resid * times * i0[i] * exp(-rate[i] * times)) / i0[i], 0.0, 5)
+            self.assertAlmostEqual(sum(resid * exp(-rate[i] * times)), 0.0, 5)
+
+            # The errors.
+            errors = self.covar_errors(rate[i], i0[i], times, self.errors[i, :num])
+            self.assertAlmostEqual(rate_err[i] / errors[0], 1.0)
+            self.assertAlmostEqual(i0_err[i] / errors[1], 1.0)
+
+
+    def test_exponential_2param_neg_batch_errors(self):
+        """Test the simultaneous error calculation for multiple curves."""
+
+        # The errors.
+        rate_err, i0_err = exponential_2param_neg_batch_errors(rate=self.rates, i0=self.i0, times=self.times, errors=self.errors, mask=self.mask)
+
+        # Check against the covariance matrix of each curve.
+        for i in range(3):
+            num = self.mask[i].sum()
+            errors = self.covar_errors(self.rates[i], self.i0[i], self.times[i, :num], self.errors[i, :num])
+            self.assertAlmostEqual(rate_err[i] / errors[0], 1.0)
+            self.assertAlmostEqual(i0_err[i] / errors[1], 1.0)
+
+        # A singular curve, with all time points equal.
+        rate_err, i0_err = exponential_2param_neg_batch_errors(rate=self.rates[:1], i0=self.i0[:1], times=ones((1, 3)), errors=ones((1, 3)))
+        self.assertEqual(rate_err[0], float('inf'))
@@ -0,0 +1,225 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from io import BytesIO, StringIO
+from math import pi
+from numpy import array, dot, eye, float64, load, transpose, zeros
+from os import sep
+from random import seed
+from unittest import TestCase
+
+# relax module imports.
+from lib.frame_order.simulation import brownian, trajectory_to_pdb, uniform_distribution
+from lib.geometry.angles import wrap_angles
+from lib.geometry.rotations import axis_angle_to_R, euler_to_R_zyz, R_random_hypersphere, R_to_tilt_torsion, tilt_torsion_to_R
+from lib.geometry.vectors import random_unit_vector
+from lib.structure.internal.object import Internal
+from status import Status; status = Status()
+
+
+class Test_simulation(TestCase):
+    """Unit tests for the lib.frame_order.simulation relax module."""
+
+    def setUp(self):
+        """Set up the structural object and frame order motions for the tests."""
+
+        # The structure.
+        self.structure = Internal()
+        self.structure.load_pdb(status.install_path + sep+'test_suite'+sep+'shared_data'+sep+'structures'+sep+'pyrotartaric_anhydride.pdb')
+
+        # The isotropic cone motions.
+        self.model = 'iso cone'
+        self.parameters = {'cone_theta': 0.6, 'cone_sigma_max': 0.3}
+        self.eigenframe = zeros((3, 3), float64)
+        euler_to_R_zyz(0.3, 1.1, -2.0, self.eigenframe)
+        self.pivot = array([[1.0, -2.0, 0.5]], float64)
+
+
+    def read_traj(self, traj_file):
+        """Read all records of the binary trajectory file.
+
+        @param traj_file:   The binary trajectory file object.
+        @type traj_file:    binary file object
+        @return:            The pivot points and the list of states of each snapshot.
+        @rtype:             numpy rank-2 array, list of numpy rank-3 arrays
+        """
+
+        # The pivot.
+        traj_file.seek(0)
+        pivot = load(traj_file)
+
+        # The states.
+        states = []
+        while True:
+            try:
+                states.append(load(traj_file))
+            except EOFError:
+                break
+
+        # Return the data.
+        return pivot, states
+
+
+    def scalar_constrain(self, state, clamp=True):
+        """The original single state algorithm for applying the isotropic cone limits.
+
+        @param state:   The rotation matrix of the state, which will be updated.
+        @type state:    numpy rank-2, 3D float64 array
+        @keyword clamp: A flag which if True will set the angles outside of the limits to the maximum values.
+        @type clamp:    bool
+        @return:        True if the state is inside of the distribution.
+        @rtype:         bool
+        """
+
+        # The angles in the eigenframe.
+        R_eigen = dot(transpose(self.eigenframe), dot(state, self.eigenframe))
+        phi, theta, sigma = R_to_tilt_torsion(R_eigen)
+        sigma = wrap_angles(sigma, -pi, pi)
+
+        # The limits.
+        inside = True
+        if theta > self.parameters['cone_theta']:
+            inside = False
+            if clamp:
+                theta = self.parameters['cone_theta']
+        if sigma > self.parameters['cone_sigma_max']:
+            inside = False
+            if clamp:
+                sigma = self.parameters['cone_sigma_max']
+        elif sigma < -self.parameters['cone_sigma_max']:
+            inside = False
+            if clamp:
+                sigma = -self.parameters['cone_sigma_max']
+
+        # Reconstruct the state.
+        tilt_torsion_to_R(phi, theta, sigma, R_eigen)
+        state[:] = dot(self.eigenframe, dot(R_eigen, transpose(self.eigenframe)))
+
+        # Return the flag.
+        return inside
+
+
+    def test_brownian_single_walker(self):
+        """Check that the single walker pseudo-Brownian simulation reproduces the original algorithm."""
+
+        # The simulation.
+        traj_file = BytesIO()
+        seed(1000)
+        brownian(model=self.model, structure=self.structure, parameters=self.parameters, eigenframe=self.eigenframe, pivot=self.pivot, step_size=20.0, snapshot=3, total=6, walkers=1, traj_file=traj_file)
+        pivot, states = self.read_traj(traj_file)
+
+        # The original single walker algorithm, with the same random numbers.
+        seed(1000)
+        state = eye(3, dtype=float64)
+        vector = zeros(3, float64)
+        R = zeros((3, 3), float64)
+        snapshots = [eye(3, dtype=float64)]
+        while len(snapshots) < 6:
+            for step in range(3):
+                random_unit_vector(vector)
+                axis_angle_to_R(vector, 20.0 / 360.0 * 2.0 * pi, R)
+                state = dot(R, state)
+                self.scalar_constrain(state)
+            snapshots.append(state.copy())
+
+        # Check the trajectory.
+        self.assertEqual(pivot.tolist(), self.pivot.tolist())
+        self.assertEqual(len(states), 6)
+        for i in range(6):
+            self.assertEqual(states[i].shape, (1, 3, 3))
+            for j in range(3):
+                for k in range(3):
+                    self.assertAlmostEqual(states[i][0, j, k], snapshots[i][j, k])
+
+
+    def test_brownian_walkers(self):
+        """Check the snapshots of the many walker pseudo-Brownian simulation."""
+
+        # The simulation.
+        file = StringIO()
+        traj_file = BytesIO()
+        seed(1000)
+        brownian(file=file, model=self.model, structure=self.structure, parameters=self.parameters, eigenframe=self.eigenframe, pivot=self.pivot, step_size=20.0, snapshot=2, total=8, walkers=3, traj_file=traj_file)
+        pivot, states = self.read_traj(traj_file)
+
+        # The number of snapshots.
+        lines = file.getvalue().split('\n')
+        self.assertEqual(len([line for line in lines if line[:6] == 'MODEL ']), 8)
+        self.assertEqual(len([line for line in lines if line[:6] == 'ENDMDL']), 8)
+        self.assertEqual(lines[-2][:3], 'END')
+        self.assertEqual(len(states), 8)
+
+        # All states are within the limits.
+        for i in range(8):
+            state = states[i][0].copy()
+            self.scalar_constrain(state)
+            self.assertAlmostEqual(abs(state - states[i][0]).max(), 0.0)
+
+        # The walkers are independent.
+        self.assertNotAlmostEqual(abs(states[1][0] - states[2][0]).max(), 0.0)
+
+
+    def test_trajectory_to_pdb(self):
+        """Check that the binary trajectory is converted into the same PDB file as the direct output."""
+
+        # The distribution, with both outputs.
+        file = StringIO()
+        traj_file = BytesIO()
+        seed(1000)
+        uniform_distribution(file=file, model=self.model, structure=self.structure, parameters=self.parameters, eigenframe=self.eigenframe, pivot=self.pivot, atom_id='@H*', total=5, walkers=10, traj_file=traj_file)
+
+        # The conversion.
+        traj_file.seek(0)
+        file2 = StringIO()
+        trajectory_to_pdb(file=file2, traj_file=traj_file, structure=self.structure, atom_id='@H*')
+
+        # Check the PDB files.
+        self.assertEqual(len([line for line in file.getvalue().split('\n') if line[:6] == 'MODEL ']), 5)
+        self.assertEqual(file2.getvalue(), file.getvalue())
+
+
+    def test_uniform_distribution_single_walker(self):
+        """Check that the single walker uniform distribution reproduces the original algorithm."""
+
+        # The distribution.
+        traj_file = BytesIO()
+        seed(1000)
+        uniform_distribution(model=self.model, structure=self.structure, parameters=self.parameters, eigenframe=self.eigenframe, pivot=self.pivot, total=4, walkers=1, traj_file=traj_file)
+        pivot, states = self.read_traj(traj_file)
+
+        # The original single walker algorithm, with the same random numbers.
+        seed(1000)
+        state = eye(3, dtype=float64)
+        R = zeros((3, 3), float64)
+        snapshots = [eye(3, dtype=float64)]
+        while len(snapshots) < 4:
+            R_random_hypersphere(R)
+            state = dot(R, state)
+            if self.scalar_constrain(state, clamp=False):
+                snapshots.append(state.copy())
+
+        # Check the trajectory.
+        self.assertEqual(len(states), 4)
+        for i in range(4):
+            for j in range(3):
+                for k in range(3):
+                    self.assertAlmostEqual(states[i][0, j, k], snapshots[i][j, k])
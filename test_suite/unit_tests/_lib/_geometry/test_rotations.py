@@ -22,14 +22,17 @@
 # Python module imports.
 from copy import deepcopy
 from math import asin, cos, pi, sin, sqrt
-from numpy import array, dot, eye, float64, zeros
-from numpy.linalg import norm
+from numpy import array, dot, eye, float64, transpose, zeros
+from numpy.linalg import det, norm
+from numpy.random import RandomState
 from random import shuffle, uniform
 from unittest import TestCase
 
 # relax module imports.
+from lib.geometry import rotations
 from lib.geometry.angles import wrap_angles
 from lib.geometry.rotations import axis_angle_to_euler_xyx, axis_angle_to_euler_xyz, axis_angle_to_euler_xzx, axis_angle_to_euler_xzy, axis_angle_to_euler_yxy, axis_angle_to_euler_yxz, axis_angle_to_euler_yzx, axis_angle_to_euler_yzy, axis_angle_to_euler_zxy, axis_angle_to_euler_zxz, axis_angle_to_euler_zyx, axis_angle_to_euler_zyz, axis_angle_to_R, axis_angle_to_quaternion, euler_to_axis_angle_xyx, euler_to_axis_angle_xyz, euler_to_axis_angle_xzx, euler_to_axis_angle_xzy, euler_to_axis_angle_yxy, euler_to_axis_angle_yxz, euler_to_axis_angle_yzx, euler_to_axis_angle_yzy, euler_to_axis_angle_zxy, euler_to_axis_angle_zxz, euler_to_axis_angle_zyx, euler_to_axis_angle_zyz, euler_to_R_xyx, euler_to_R_xyz, euler_to_R_xzx, euler_to_R_xzy, euler_to_R_yxy, euler_to_R_yxz, euler_to_R_yzx, euler_to_R_yzy, euler_to_R_zxy, euler_to_R_zxz, euler_to_R_zyx, euler_to_R_zyz, R_random_hypersphere, R_to_axis_angle, R_to_euler_xyx, R_to_euler_xyz, R_to_euler_xzx, R_to_euler_xzy, R_to_euler_yxy, R_to_euler_yxz, R_to_euler_yzx, R_to_euler_yzy, R_to_euler_zxy, R_to_euler_zxz, R_to_euler_zyx, R_to_euler_zyz, R_to_quaternion, reverse_euler_zyz, quaternion_to_axis_angle, quaternion_to_R
+from lib.geometry.rotations import axis_angle_to_quaternion_batch, axis_angle_to_R_batch, quaternion_to_axis_angle_batch, quaternion_to_R_batch, R_random_axis_batch, R_random_hypersphere_batch, R_to_axis_angle_batch, R_to_euler, R_to_euler_batch, R_to_quaternion_batch, R_to_tilt_torsion, R_to_tilt_torsion_batch, tilt_torsion_to_R, tilt_torsion_to_R_batch, two_vect_to_R, two_vect_to_R_batch
 
 
 # Global variables (reusable storage).
@@ -1356,3 +1359,179 @@ class Test_rotations(TestCase):
 
         # Check the rotation.
         self.check_rotation(R, x_real_pos, y_real_pos, z_real_pos, x_real_neg, y_real_neg, z_real_neg)
+
+
+    def batch_data(self, N=200):
+        """Generate the Euler angles, axis-angle pairs, and rotation matrices for the batched function checks.
+
+        @keyword N: The number of rotations.
+        @type N:    int
+        @return:    The alpha, beta and gamma angles, the axes and angles, and the rotation matrices.
+        @rtype:     tuple of numpy arrays
+        """
+
+        # Reproducible random data.
+        rand = RandomState(1)
+
+        # Euler angles, including the gimbal lock positions.
+        alpha = rand.uniform(-2.0*pi, 2.0*pi, N)
+        beta = rand.uniform(-pi, 2.0*pi, N)
+        gamma = rand.uniform(-2.0*pi, 2.0*pi, N)
+        beta[:20] = [0.0, pi/2.0, pi, -pi/2.0, 3.0*pi/2.0] * 4
+        alpha[20:30] = 0.0
+        gamma[20:30] = 0.0
+
+        # Axis-angle pairs, including no rotation.
+        axis = rand.normal(0, 1, (N, 3))
+        axis = axis / norm(axis, axis=1)[:, None]
+        angle = rand.uniform(-pi, 2.0*pi, N)
+        angle[:4] = [0.0, pi/2.0, -pi/2.0, 2.0*pi]
+
+        # Rotation matrices.
+        R_stack = zeros((N, 3, 3), float64)
+        axis_angle_to_R_batch(axis, angle, R_stack)
+        R_stack[0] = eye(3)
+        R_stack[1] = array([[1, 0, 0], [0, -1, 0], [0, 0, -1]], float64)
+        R_stack[2] = array([[0, 1, 0], [1, 0, 0], [0, 0, -1]], float64)
+
+        # Return the data.
+        return alpha, beta, gamma, axis, angle, R_stack
+
+
+    def test_batch_axis_angle_and_quaternions(self):
+        """Exact cross-check of the batched axis-angle and quaternion conversions against the scalar versions."""
+
+        # The data.
+        alpha, beta, gamma, axis, angle, R_stack = self.batch_data()
+        N = len(angle)
+
+        # axis_angle_to_R_batch().
+        R_batch = zeros((N, 3, 3), float64)
+        axis_angle_to_R_batch(axis, angle, R_batch)
+        for i in range(N):
+            axis_angle_to_R(axis[i], angle[i], R)
+            self.assertEqual(R_batch[i].tolist(), R.tolist())
+
+        # axis_angle_to_quaternion_batch(), with non-unit axes.
+        quat = zeros((N, 4), float64)
+        axis_angle_to_quaternion_batch(3.0*axis, angle, quat)
+        quat_scalar = zeros(4, float64)
+        for i in range(N):
+            axis_angle_to_quaternion(3.0*axis[i], angle[i], quat_scalar)
+            self.assertEqual(quat[i].tolist(), quat_scalar.tolist())
+
+        # R_to_axis_angle_batch().
+        axis_batch, angle_batch = R_to_axis_angle_batch(R_stack)
+        for i in range(N):
+            axis_scalar, angle_scalar = R_to_axis_angle(R_stack[i])
+            self.assertEqual(axis_batch[i].tolist(), axis_scalar.tolist())
+            self.assertEqual(angle_batch[i], angle_scalar)
+
+        # R_to_quaternion_batch().
+        R_to_quaternion_batch(R_stack, quat)
+        for i in range(N):
+            R_to_quaternion(R_stack[i], quat_scalar)
+            self.assertEqual(quat[i].tolist(), quat_scalar.tolist())
+
+        # quaternion_to_axis_angle_batch().
+        axis_batch, angle_batch = quaternion_to_axis_angle_batch(quat)
+        for i in range(N):
+            axis_scalar, angle_scalar = quaternion_to_axis_angle(quat[i])
+            self.assertEqual(axis_batch[i].tolist(), axis_scalar.tolist())
+            self.assertEqual(angle_batch[i], angle_scalar)
+
+        # quaternion_to_R_batch().
+        quaternion_to_R_batch(quat, R_batch)
+        for i in range(N):
+            quaternion_to_R(quat[i], R)
+            self.assertEqual(R_batch[i].tolist(), R.tolist())
+
+
+    def test_batch_euler(self):
+        """Exact cross-check of all batched Euler angle conversions against the scalar versions."""
+
+        # The data.
+        alpha, beta, gamma, axis, angle, R_stack = self.batch_data()
+        N = len(angle)
+        R_batch = zeros((N, 3, 3), float64)
+
+        # Loop over all notations.
+        for notation in ['xyx', 'xyz', 'xzx', 'xzy', 'yxy', 'yxz', 'yzx', 'yzy', 'zxy', 'zxz', 'zyx', 'zyz']:
+            # The functions.
+            euler_to_R = getattr(rotations, 'euler_to_R_%s' % notation)
+            R_to_euler_notation = getattr(rotations, 'R_to_euler_%s' % notation)
+            reverse_euler = getattr(rotations, 'reverse_euler_%s' % notation)
+            axis_angle_to_euler = getattr(rotations, 'axis_angle_to_euler_%s' % notation)
+            euler_to_axis_angle = getattr(rotations, 'euler_to_axis_angle_%s' % notation)
+
+            # The batched conversions.
+            getattr(rotations, 'euler_to_R_%s_batch' % notation)(alpha, beta, gamma, R_batch)
+            euler_batch = transpose(getattr(rotations, 'R_to_euler_%s_batch' % notation)(R_stack))
+            euler_lock_batch = transpose(getattr(rotations, 'R_to_euler_%s_batch' % notation)(R_batch))
+            reverse_batch = transpose(getattr(rotations, 'reverse_euler_%s_batch' % notation)(alpha, beta, gamma))
+            aa_euler_batch = transpose(getattr(rotations, 'axis_angle_to_euler_%s_batch' % notation)(axis, angle))
+            axis_batch, angle_batch = getattr(rotations, 'euler_to_axis_angle_%s_batch' % notation)(alpha, beta, gamma)
+
+            # Check each rotation.
+            for i in range(N):
+                euler_to_R(alpha[i], beta[i], gamma[i], R)
+                self.assertEqual(R_batch[i].tolist(), R.tolist())
+                self.assertEqual(list(euler_batch[i]), list(R_to_euler_notation(R_stack[i])))
+                self.assertEqual(list(euler_lock_batch[i]), list(R_to_euler_notation(R)))
+                self.assertEqual(list(reverse_batch[i]), list(reverse_euler(alpha[i], beta[i], gamma[i])))
+                self.assertEqual(list(aa_euler_batch[i]), list(axis_angle_to_euler(axis[i], angle[i])))
+                axis_scalar, angle_scalar = euler_to_axis_angle(alpha[i], beta[i], gamma[i])
+                self.assertEqual(axis_batch[i].tolist(), axis_scalar.tolist())
+                self.assertEqual(angle_batch[i], angle_scalar)
+
+            # The rotating axes.
+            euler_batch = transpose(R_to_euler_batch(R_stack, notation, axes_rot='rotating'))
+            for i in range(N):
+                self.assertEqual(list(euler_batch[i]), list(R_to_euler(R_stack[i], notation, axes_rot='rotating')))
+
+
+    def test_batch_random(self):
+        """Check the rotation matrices of the batched random rotation functions."""
+
+        # The random rotations.
+        R_batch = zeros((100, 3, 3), float64)
+        R_random_hypersphere_batch(R_batch)
+        R_axis = zeros((100, 3, 3), float64)
+        R_random_axis_batch(R_axis, angle=0.3)
+
+        # Check for orthonormality and the fixed angle.
+        for i in range(100):
+            for matrix in [R_batch[i], R_axis[i]]:
+                self.assertAlmostEqual(norm(dot(matrix, transpose(matrix)) - eye(3)), 0.0)
+                self.assertAlmostEqual(det(matrix), 1.0)
+            self.assertAlmostEqual(R_to_axis_angle(R_axis[i])[1], 0.3)
+
+
+    def test_batch_tilt_torsion_and_two_vect(self):
+        """Exact cross-check of the batched tilt-torsion and two vector conversions against the scalar versions."""
+
+        # The data.
+        alpha, beta, gamma, axis, angle, R_stack = self.batch_data()
+        N = len(angle)
+        R_batch = zeros((N, 3, 3), float64)
+
+        # tilt_torsion_to_R_batch().
+        tilt_torsion_to_R_batch(alpha, beta, gamma, R_batch)
+        for i in range(N):
+            tilt_torsion_to_R(alpha[i], beta[i], gamma[i], R)
+            self.assertEqual(R_batch[i].tolist(), R.tolist())
+
+        # R_to_tilt_torsion_batch().
+        angles = transpose(R_to_tilt_torsion_batch(R_stack))
+        for i in range(N):
+            self.assertEqual(list(angles[i]), list(R_to_tilt_torsion(R_stack[i])))
+
+        # two_vect_to_R_batch(), including a zero rotation.
+        vector_orig = 1.0 * axis
+        vector_fin = 2.0 * axis[::-1]
+        vector_orig[0] = [0.0, 0.0, 1.0]
+        vector_fin[0] = [0.0, 0.0, 2.0]
+        two_vect_to_R_batch(vector_orig, vector_fin, R_batch)
+        for i in range(N):
+            two_vect_to_R(vector_orig[i], vector_fin[i], R)
+            self.assertEqual(R_batch[i].tolist(), R.tolist())
@@ -22,5 +22,7 @@
 
 __all__ = [
     'test___init__',
+    'test_nmrpipe',
+    'test_peak_list',
     'test_sparky'
 ]
@@ -0,0 +1,77 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from unittest import TestCase
+
+# relax module imports.
+from lib.errors import RelaxError
+from lib.spectrum.nmrpipe import read_seriestab
+from lib.spectrum.objects import Peak_list
+
+
+class Test_nmrpipe(TestCase):
+    """Unit tests for the lib.spectrum.nmrpipe relax module."""
+
+    def setUp(self):
+        """Set up a SeriesTab file with two assigned peaks and three planes."""
+
+        # The file data.
+        self.file_data = [
+            ['REMARK', 'Mode:', 'Summation', 'Dimensions:', '2'],
+            [],
+            ['VARS', 'INDEX', 'X_AXIS', 'Y_AXIS', 'X_PPM', 'Y_PPM', 'VOL', 'ASS', 'Z_A0', 'Z_A1', 'Z_A2'],
+            ['FORMAT', '%5d', '%9.3f', '%9.3f', '%8.3f', '%8.3f', '%+e', '%s', '%7.4f', '%7.4f', '%7.4f'],
+            [],
+            ['1', '295.826', '56.316', '8.117', '126.189', '+2.000000e+05', '?-?', '1.0000', '0.5000', '0.2500'],
+            ['2', '272.690', '83.965', '8.343', '123.204', '+1.000000e+05', 'L10N-L10HN', '1.0000', '0.5000', '0.2500'],
+            ['3', '259.484', '98.971', '8.472', '121.584', '+4.000000e+05', 'V6N-V6HN', '1.0000', '0.7500', '0.1250']
+        ]
+
+
+    def test_read_seriestab(self):
+        """Test the lib.spectrum.nmrpipe.read_seriestab() function for multiple planes."""
+
+        # Read the data.
+        peak_list = Peak_list()
+        read_seriestab(peak_list=peak_list, file_data=self.file_data, int_col=6)
+
+        # Check the assignments.
+        self.assertEqual(len(peak_list), 2)
+        self.assertEqual(peak_list[0].res_nums, [10, 10])
+        self.assertEqual(peak_list[1].spin_names, ['N', 'HN'])
+        self.assertEqual(peak_list[0].shifts, [123.204, 8.343])
+        self.assertEqual(peak_list[1].shifts, [121.584, 8.472])
+
+        # Check the intensities, scaled by the volume column.
+        self.assertEqual(peak_list[0].intensity, [100000.0, 50000.0, 25000.0])
+        self.assertEqual(peak_list[1].intensity, [400000.0, 300000.0, 50000.0])
+        self.assertEqual(peak_list[1].intensity_name, ['Z_A0', 'Z_A1', 'Z_A2'])
+
+
+    def test_read_seriestab_bad_float(self):
+        """Test the lib.spectrum.nmrpipe.read_seriestab() function for a non-float intensity."""
+
+        # Corrupt a plane.
+        self.file_data[7][9] = 'x'
+
+        # Read the data.
+        self.assertRaises(RelaxError, read_seriestab, peak_list=Peak_list(), file_data=self.file_data, int_col=6)
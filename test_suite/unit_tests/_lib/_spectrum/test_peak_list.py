@@ -0,0 +1,121 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from unittest import TestCase
+from warnings import catch_warnings, simplefilter
+
+# relax module imports.
+from lib.spectrum.objects import Peak_list
+from lib.spectrum.peak_list import intensity_generic
+
+
+class Test_peak_list(TestCase):
+    """Unit tests for the lib.spectrum.peak_list relax module."""
+
+    def setUp(self):
+        """Set up a generic peak list with three intensity columns."""
+
+        # The file data.
+        self.file_data = [
+            ['#', 'mol_name', 'res_num', 'res_name', 'spin_num', 'spin_name', 'int_A', 'int_B', 'int_C'],
+            ['Ubi', '3', 'Ile', '1', 'N', '1.0e6', '5.0e5', '2.5e5'],
+            ['Ubi', '4', 'Phe', '2', 'N', '2.0e6', '1.5e6', '-1.0e5'],
+            ['Ubi', '5', 'Val', '3', 'N', '3.0e6', '2.0e6', '1.25e6'],
+            ['Ubi', '6', 'Lys', '4', 'N', '4.0e6', '3.0e6', '2.0e6']
+        ]
+
+
+    def read(self, data_col=None):
+        """Read the generic peak list.
+
+        @keyword data_col:  The intensity columns.
+        @type data_col:     int or list of int
+        @return:            The peak list.
+        @rtype:             Peak_list instance
+        """
+
+        # Read the data.
+        peak_list = Peak_list()
+        with catch_warnings():
+            simplefilter('ignore')
+            intensity_generic(peak_list=peak_list, file_data=[line[:] for line in self.file_data], mol_name_col=1, res_num_col=2, res_name_col=3, spin_num_col=4, spin_name_col=5, data_col=data_col)
+
+        # Return the peak list.
+        return peak_list
+
+
+    def check_columns(self):
+        """Check the multi-column peak list against single column reads."""
+
+        # Read all columns at once, and one at a time.
+        multi = self.read(data_col=[6, 7, 8])
+        single = [self.read(data_col=col) for col in [6, 7, 8]]
+
+        # Compare the assignments and intensities.
+        self.assertEqual(len(multi), len(single[0]))
+        for i in range(len(multi)):
+            self.assertEqual(multi[i].res_nums, single[0][i].res_nums)
+            self.assertEqual(multi[i].res_names, single[0][i].res_names)
+            self.assertEqual(multi[i].spin_nums, single[0][i].spin_nums)
+            self.assertEqual(multi[i].spin_names, single[0][i].spin_names)
+            self.assertEqual(multi[i].intensity, [single[j][i].intensity[0] for j in range(3)])
+
+
+    def test_intensity_generic_multi_col(self):
+        """Test the lib.spectrum.peak_list.intensity_generic() function for multiple intensity columns."""
+
+        # Read the data.
+        peak_list = self.read(data_col=[6, 7, 8])
+
+        # Check the data.
+        self.assertEqual(len(peak_list), 4)
+        self.assertEqual(peak_list[0].mol_names, ['Ubi', 'Ubi'])
+        self.assertEqual(peak_list[1].res_nums, [4, 4])
+        self.assertEqual(peak_list[2].res_names, ['Val', 'Val'])
+        self.assertEqual(peak_list[3].spin_nums, [4, 4])
+        self.assertEqual(peak_list[0].spin_names, ['N', 'N'])
+        self.assertEqual(peak_list[0].intensity, [1.0e6, 5.0e5, 2.5e5])
+        self.assertEqual(peak_list[1].intensity, [2.0e6, 1.5e6, -1.0e5])
+        self.assertEqual(peak_list[3].intensity, [4.0e6, 3.0e6, 2.0e6])
+
+        # Compare to the single column reads.
+        self.check_columns()
+
+
+    def test_intensity_generic_multi_col_bad_value(self):
+        """Test the lib.spectrum.peak_list.intensity_generic() function for multiple intensity columns with a non-numeric value."""
+
+        # A missing intensity, which prevents the bulk conversion.
+        self.file_data[2][7] = 'None'
+
+        # Read the data.
+        peak_list = self.read(data_col=[6, 7, 8])
+
+        # Check the data.
+        self.assertEqual(len(peak_list), 4)
+        self.assertEqual(peak_list[0].intensity, [1.0e6, 5.0e5, 2.5e5])
+        self.assertEqual(peak_list[1].intensity, [2.0e6, 1.5e6, None])
+        self.assertEqual(peak_list[3].intensity, [4.0e6, 3.0e6, 2.0e6])
+
+        # Compare to the single column reads.
+        self.check_columns()
+
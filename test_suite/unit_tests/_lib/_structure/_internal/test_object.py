@@ -19,8 +19,13 @@
 #                                                                             #
 ###############################################################################
 
+# Python module imports.
+from os import close, sep
+from tempfile import mkstemp
+
 # relax module imports.
 from lib.structure.internal import object
+from status import Status; status = Status()
 from test_suite.unit_tests.base_classes import UnitTestCase
 
 
@@ -108,3 +113,88 @@ class Test_object(UnitTestCase):
             self.assertEqual(struct.structural_data[i].mol[0].y[0], 2.0)
             self.assertEqual(struct.structural_data[i].mol[0].z[0], 3.0)
             self.assertEqual(struct.structural_data[i].mol[0].element[0], 'N')
+
+
+    def test_delete_atoms(self):
+        """Test the mask based deletion of atoms, including the remapping of the bonded indices."""
+
+        # Initialise a structural object and add some atoms.
+        struct = object.Internal()
+        for i in range(6):
+            struct.add_atom(atom_name='A%i' % i, res_name='UNK', res_num=i//2+1, mol_name='X', pos=[float(i), 0., 0.], element='C')
+        for i in range(5):
+            struct.connect_atom(mol_name='X', index1=i, index2=i+1)
+        struct.add_model(model=2, coords_from=1)
+
+        # Delete the second residue.
+        selection = struct.selection(atom_id=':2')
+        struct.delete(selection=selection, verbosity=0)
+
+        # Check the data of both models.
+        for i in range(2):
+            mol = struct.structural_data[i].mol[0]
+            self.assertEqual(mol.atom_name, ['A0', 'A1', 'A4', 'A5'])
+            self.assertEqual(mol.res_num, [1, 1, 3, 3])
+            self.assertEqual(mol.x, [0.0, 1.0, 4.0, 5.0])
+            self.assertEqual(mol.bonded, [[1], [0], [3], [2]])
+
+
+    def test_read_pdb_lines_conect(self):
+        """Test that the CONECT and MASTER records after the last model are kept when only some models are read."""
+
+        # The atoms of a single structure.
+        file = open(status.install_path + sep + 'test_suite' + sep + 'shared_data' + sep + 'structures' + sep + 'pyrotartaric_anhydride.pdb')
+        records = file.readlines()
+        file.close()
+        atoms = [line for line in records if line[:6] == 'HETATM']
+        conect = [line for line in records if line[:6] == 'CONECT']
+        master = "MASTER        0    0    0    0    0    0    0    0   42    0   14    0\n"
+
+        # Create a three model PDB file with the CONECT and MASTER records at the end.
+        handle, self.tmpfile = mkstemp(suffix='.pdb')
+        close(handle)
+        file = open(self.tmpfile, 'w')
+        for model in range(1, 4):
+            file.write("MODEL     %4i\n" % model)
+            file.writelines(atoms)
+            file.write("ENDMDL\n")
+        file.writelines(conect)
+        file.write(master)
+        file.write("END\n")
+        file.close()
+
+        # Read the lines of the first and second models.
+        struct = object.Internal()
+        file = open(self.tmpfile)
+        lines = struct._read_pdb_lines(file, read_model=[1, 2])
+        file.close()
+
+        # Check the lines.
+        self.assertEqual(len(lines), 2*(len(atoms)+2) + len(conect) + 2)
+        self.assertEqual(lines[0], "MODEL        1\n")
+        self.assertEqual(lines[len(atoms)+2], "MODEL        2\n")
+        self.assertEqual(lines[-len(conect)-2:], conect + [master, "END\n"])
+        self.assertFalse("MODEL        3\n" in lines)
+
+        # Load the models.
+        struct.load_pdb(self.tmpfile, read_model=[1, 2])
+        self.assertEqual(struct.structural_data.current_models, [1, 2])
+        for i in range(2):
+            self.assertEqual(len(struct.structural_data[i].mol[0].atom_num), 14)
+
+
+    def test_selection_index_array(self):
+        """Test the index arrays and masks of the internal structural selection object."""
+
+        # Initialise a structural object and add some atoms.
+        struct = object.Internal()
+        for i in range(6):
+            struct.add_atom(atom_name='A%i' % i, res_name='UNK', res_num=i//2+1, mol_name='X', pos=[float(i), 0., 0.], element='C')
+
+        # The selection.
+        selection = struct.selection(atom_id=':1,3')
+
+        # Check the arrays.
+        self.assertEqual(list(selection.index_array(mol_index=0)), [0, 1, 4, 5])
+        self.assertEqual(list(selection.mask(mol_index=0, num_atoms=6)), [True, True, False, False, True, True])
+        self.assertEqual(len(selection.index_array(mol_index=1)), 0)
@@ -51,6 +51,39 @@ class Test_pdb_read(UnitTestCase):
         self.assertEqual(record[14], None)
 
 
+    def test_atom_block(self):
+        """Test the lib.structure.pdb_read.atom_block() function."""
+
+        # Parse a block of PDB records.
+        records = [
+            'ATOM    158  CG  GLU    11       9.590  -1.041 -11.596  1.00  0.00           C  ',
+            'HETATM  159 CA    CA A1000     -12.310 100.200   1.000  0.50 10.00          CA  '
+        ]
+        record_type, serial, name, alt_loc, res_name, chain_id, res_seq, icode, pos, occupancy, temp_factor, element, charge = pdb_read.atom_block(records)
+
+        # Test the elements, comparing to the single record parser.
+        for i in range(2):
+            if i == 0:
+                record = pdb_read.atom(records[i])
+            else:
+                record = pdb_read.hetatm(records[i])
+            self.assertEqual(record_type[i], record[0])
+            self.assertEqual(serial[i], record[1])
+            self.assertEqual(name[i], record[2])
+            self.assertEqual(alt_loc[i], record[3])
+            self.assertEqual(res_name[i], record[4])
+            self.assertEqual(chain_id[i], record[5])
+            self.assertEqual(res_seq[i], record[6])
+            self.assertEqual(icode[i], record[7])
+            self.assertEqual(pos[i, 0], record[8])
+            self.assertEqual(pos[i, 1], record[9])
+            self.assertEqual(pos[i, 2], record[10])
+            self.assertEqual(occupancy[i], record[11])
+            self.assertEqual(temp_factor[i], record[12])
+            self.assertEqual(element[i], record[13])
+            self.assertEqual(charge[i], record[14])
+
+
     def test_helix(self):
         """Test the lib.structure.pdb_read.helix() function."""
 
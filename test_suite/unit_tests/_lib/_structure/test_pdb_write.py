@@ -19,6 +19,9 @@
 #                                                                             #
 ###############################################################################
 
+# Python module imports.
+from numpy import array
+
 # relax module imports.
 from lib.structure import pdb_write
 from lib.io import DummyFileObject
@@ -45,6 +48,30 @@ class Test_pdb_write(UnitTestCase):
         self.assertEqual(records[0], actual)
 
 
+    def test_atom_block(self):
+        """Test the lib.structure.pdb_write.atom_block() function."""
+
+        # A dummy file to write to.
+        file = DummyFileObject()
+
+        # Create the PDB records.
+        pdb_write.atom_block(file, record_type=['ATOM', 'HETATM'], serial=[158, 159], name=['CG', 'CA'], res_name=['GLU', 'CA'], chain_id=[None, 'A'], res_seq=[11, 1000], pos=array([[9.59, -1.041, -11.596], [-12.31, 100.2, 1.0]]), occupancy=1.0, temp_factor=0.0, element=['C', 'CA'])
+
+        # The records from the single record functions.
+        file2 = DummyFileObject()
+        pdb_write.atom(file2, serial=158, name='CG', res_name='GLU', res_seq=11, x=9.59, y=-1.041, z=-11.596, occupancy=1.0, temp_factor=0.0, element='C')
+        pdb_write.hetatm(file2, serial=159, name='CA', res_name='CA', chain_id='A', res_seq=1000, x=-12.31, y=100.2, z=1.0, occupancy=1.0, temp_factor=0.0, element='CA')
+
+        # Test the records.
+        records = file.readlines()
+        actual = file2.readlines()
+        self.assertEqual(len(records), 2)
+        for i in range(2):
+            print(repr(records[i]))
+            print(repr(actual[i]))
+            self.assertEqual(records[i], actual[i])
+
+
     def test_helix(self):
         """Test the lib.structure.pdb_write.helix() function."""
 
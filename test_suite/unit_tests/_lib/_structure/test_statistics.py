@@ -0,0 +1,97 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from numpy import array, average, dot, float64, std, zeros
+from numpy.linalg import norm
+
+# relax module imports.
+from lib.geometry.vectors import vector_angle_atan2
+from lib.structure.statistics import fluctuation_matrix
+from test_suite.unit_tests.base_classes import UnitTestCase
+
+
+class Test_statistics(UnitTestCase):
+    """Unit tests for the functions of the 'lib.structure.statistics' module."""
+
+    def setUp(self):
+        """Set up some structural coordinates."""
+
+        # Three models of five atoms, the last atom being a copy of the first.
+        self.coord = array([
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [1.0, 1.0, 1.0], [0.0, 0.0, 0.0]],
+            [[0.1, 0.0, 0.0], [1.0, 0.2, 0.0], [0.0, 2.0, 0.3], [1.0, 0.9, 1.0], [0.1, 0.0, 0.0]],
+            [[0.0, -0.1, 0.0], [0.8, 0.0, 0.1], [0.2, 1.9, 0.0], [1.1, 1.0, 0.8], [0.0, -0.1, 0.0]]
+        ], float64)
+
+
+    def check_matrix(self, measure=None):
+        """Compare the tiled fluctuation matrix to a direct per atom pair calculation.
+
+        @keyword measure:   The type of fluctuation to measure.
+        @type measure:      str
+        """
+
+        # The direct calculation.
+        m, n = self.coord.shape[:2]
+        matrix = zeros((n, n), float64)
+        for i in range(n):
+            for j in range(n):
+                vectors = self.coord[:, i] - self.coord[:, j]
+                ave_vect = average(vectors, axis=0)
+                if measure == 'distance':
+                    values = [norm(vectors[k]) for k in range(m)]
+                elif measure == 'angle':
+                    values = [vector_angle_atan2(ave_vect, vectors[k]) for k in range(m)]
+                elif norm(ave_vect) == 0.0:
+                    continue
+                else:
+                    unit = ave_vect / norm(ave_vect)
+                    values = [norm(vectors[k] - dot(vectors[k], unit) * unit) for k in range(m)]
+                matrix[i, j] = std(values, ddof=1)
+
+        # Check all tile sizes.
+        for tile_size in [None, 1, 2, 3, 5]:
+            result = fluctuation_matrix(self.coord, measure=measure, tile_size=tile_size)
+            for i in range(n):
+                for j in range(n):
+                    self.assertAlmostEqual(result[i, j], matrix[i, j])
+
+
+    def test_fluctuation_matrix_angle(self):
+        """Test the interatomic angle fluctuations of lib.structure.statistics.fluctuation_matrix()."""
+
+        # Check.
+        self.check_matrix(measure='angle')
+
+
+    def test_fluctuation_matrix_distance(self):
+        """Test the interatomic distance fluctuations of lib.structure.statistics.fluctuation_matrix()."""
+
+        # Check.
+        self.check_matrix(measure='distance')
+
+
+    def test_fluctuation_matrix_parallax_shift(self):
+        """Test the interatomic parallax shift fluctuations of lib.structure.statistics.fluctuation_matrix()."""
+
+        # Check.
+        self.check_matrix(measure='parallax shift')
@@ -0,0 +1,96 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from numpy import array, dot, float64, transpose, zeros
+from numpy.linalg import norm
+
+# relax module imports.
+from lib.geometry.rotations import axis_angle_to_R
+from lib.structure.superimpose import find_centroid, fit_to_mean, kabsch_rotation, kabsch_rotations
+from test_suite.unit_tests.base_classes import UnitTestCase
+
+
+class Test_superimpose(UnitTestCase):
+    """Unit tests for the functions of the 'lib.structure.superimpose' module."""
+
+    def setUp(self):
+        """Set up three models of a small structure, the second and third being rotated and translated."""
+
+        # The base structure.
+        self.base = array([[0.0, 0.0, 0.0], [1.5, 0.0, 0.0], [2.0, 1.4, 0.0], [3.5, 1.4, 0.3], [4.0, 2.8, -0.5], [1.0, -1.0, 2.0]], float64)
+
+        # The rotations.
+        self.R = []
+        for axis, angle in [[[0.0, 0.0, 1.0], 0.0], [[1.0, 0.0, 0.0], 0.5], [[0.0, 0.6, 0.8], -1.2]]:
+            R = zeros((3, 3), float64)
+            axis_angle_to_R(array(axis, float64), angle, R)
+            self.R.append(R)
+
+        # The models.
+        self.coord = array([dot(self.base, transpose(self.R[i])) + [i, 2.0*i, -i] for i in range(3)], float64)
+
+
+    def test_fit_to_mean(self):
+        """Test that lib.structure.superimpose.fit_to_mean() superimposes all models."""
+
+        # Superimpose.
+        T, R, pivot = fit_to_mean(models=[0, 1, 2], coord=self.coord, verbosity=0)
+
+        # All models should now be identical.
+        for i in range(1, 3):
+            self.assertAlmostEqual(norm(self.coord[i] - self.coord[0]), 0.0)
+
+        # The transforms should reproduce the superimposed coordinates from the original.
+        for i in range(3):
+            orig = dot(self.base, transpose(self.R[i])) + [i, 2.0*i, -i]
+            pos = dot(orig + T[i] - pivot[i], transpose(R[i])) + pivot[i]
+            self.assertAlmostEqual(norm(pos - self.coord[i]), 0.0)
+
+
+    def test_fit_to_mean_outliers(self):
+        """Test the outlier rejection mode of lib.structure.superimpose.fit_to_mean()."""
+
+        # Displace the last atom of the last model.
+        self.coord[2, 5] += [5.0, 5.0, 5.0]
+
+        # Superimpose, rejecting the displaced atom.
+        fit_to_mean(models=[0, 1, 2], coord=self.coord, outlier_cutoff=1.0, verbosity=0)
+
+        # The remaining atoms should be perfectly superimposed.
+        for i in range(1, 3):
+            self.assertAlmostEqual(norm(self.coord[i, :5] - self.coord[0, :5]), 0.0)
+
+
+    def test_kabsch_rotations(self):
+        """Test that lib.structure.superimpose.kabsch_rotations() matches kabsch_rotation()."""
+
+        # The centroids.
+        centroids = array([find_centroid(self.coord[i]) for i in range(3)], float64)
+
+        # The batched rotations.
+        R = kabsch_rotations(coord_from=self.coord, coord_to=self.base, centroid_from=centroids, centroid_to=find_centroid(self.base))
+
+        # Compare.
+        for i in range(3):
+            R_single = kabsch_rotation(coord_from=self.coord[i], coord_to=self.base, centroid_from=centroids[i], centroid_to=find_centroid(self.base))
+            self.assertAlmostEqual(norm(R[i] - R_single), 0.0)
+            self.assertAlmostEqual(norm(dot(R[i], self.R[i]) - [[1, 0, 0], [0, 1, 0], [0, 0, 1]]), 0.0)
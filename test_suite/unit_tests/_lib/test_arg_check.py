@@ -25,7 +25,8 @@ from re import search
 import sys
 
 # relax module imports.
-from lib.arg_check import is_bool, \
+from lib.arg_check import compile_validator, \
+        is_bool, \
         is_bool_or_bool_list, \
         is_float, \
         is_float_array, \
@@ -213,7 +214,7 @@ class Test_arg_check(UnitTestCase):
 
 
     def check_validate_arg(self, allowed=[], none_elem=[], empty=[], error=None, dim=(), basic_types=[], container_types=[]):
-        """Check the operation of lib.arg_check.validate_arg().
+        """Check the operation of lib.arg_check.validate_arg() and of the functions created by lib.arg_check.compile_validator().
 
         @keyword allowed:       The list of Python data type names from self.objects that should result in the function returning True.
         @type allowed:          list of str
@@ -243,21 +244,25 @@ class Test_arg_check(UnitTestCase):
             if type in allowed:
                 print("Checking allowed type %s: %s" % (type, value_str))
                 self.assertEqual(validate_arg(self.objects[type], name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_none=False, none_elements=False), True)
+                self.assertEqual(compile_validator(name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_none=False, none_elements=False)(self.objects[type]), True)
 
             # None allowed.
             elif type in ['none']:
                 print("Checking None type %s: %s" % (type, value_str))
                 self.assertEqual(validate_arg(self.objects[type], name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_none=True, none_elements=False), True)
+                self.assertEqual(compile_validator(name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_none=True, none_elements=False)(self.objects[type]), True)
 
             # Allowed types with None elements.
             elif type in none_elem:
                 print("Checking allowed type with None elements %s: %s" % (type, value_str))
                 self.assertEqual(validate_arg(self.objects[type], name=type, dim=dim, basic_types=basic_types, container_types=container_types, none_elements=True), True)
+                self.assertEqual(compile_validator(name=type, dim=dim, basic_types=basic_types, container_types=container_types, none_elements=True)(self.objects[type]), True)
 
             # Allowed empty types.
             elif type in empty:
                 print("Checking allowed empty type %s: %s" % (type, value_str))
                 self.assertEqual(validate_arg(self.objects[type], name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_empty=True, none_elements=False), True)
+                self.assertEqual(compile_validator(name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_empty=True, none_elements=False)(self.objects[type]), True)
 
             # Negative tests.
             else:
@@ -266,6 +271,7 @@ class Test_arg_check(UnitTestCase):
                     for none_elements in [True, False]:
                         self.assertEqual(validate_arg(self.objects[type], name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_empty=can_be_empty, none_elements=none_elements, raise_error=False), False)
                         self.assertRaises(error, validate_arg, self.objects[type], name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_empty=can_be_empty, none_elements=none_elements)
+                        self.assertRaises(error, compile_validator(name=type, dim=dim, basic_types=basic_types, container_types=container_types, can_be_empty=can_be_empty, none_elements=none_elements), self.objects[type])
 
 
     def setUp(self):
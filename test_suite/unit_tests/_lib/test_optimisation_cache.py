@@ -0,0 +1,189 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from numpy import array, float64
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+# relax module imports.
+from lib.errors import RelaxError
+from lib.optimisation_cache import Optimisation_cache, cached_optimise
+
+
+class Quadratic:
+    """A simple target function class, the quadratic sum((x - centre)**2)."""
+
+    def __init__(self, centre=None):
+        """Store the data.
+
+        @keyword centre:    The position of the minimum.
+        @type centre:       numpy rank-1 array
+        """
+
+        # Store the data.
+        self.centre = centre
+        self.func = self.func_quad
+
+
+    def func_quad(self, params):
+        """The target function.
+
+        @param params:  The parameter vector.
+        @type params:   numpy rank-1 array
+        @return:        The function value.
+        @rtype:         float
+        """
+
+        # Store the position for checking.
+        self.last = params
+
+        # Return the function value.
+        return float(((params - self.centre)**2).sum())
+
+
+
+class Test_optimisation_cache(TestCase):
+    """Unit tests for the lib.optimisation_cache relax module."""
+
+    def setUp(self):
+        """Create a temporary cache directory and the optimiser."""
+
+        # The cache directory.
+        self.tmpdir = mkdtemp()
+
+        # The optimiser call count and starting positions.
+        self.calls = 0
+        self.starts = []
+
+
+    def tearDown(self):
+        """Remove the cache directory."""
+
+        # Delete the directory.
+        rmtree(self.tmpdir)
+
+
+    def optimiser(self, func=None, args=(), x0=None, min_algor=None, print_flag=0):
+        """A fake optimiser which jumps to the minimum of the Quadratic class.
+
+        @return:    The minfx style results.
+        @rtype:     tuple
+        """
+
+        # Count the calls.
+        self.calls += 1
+        self.starts.append(x0)
+
+        # The minimum.
+        x = func.__self__.centre.copy()
+        return x, func(x, *args), 1, 2, 0, 0, None
+
+
+    def test_cache_hit(self):
+        """Test that repeated optimisations are read from the cache."""
+
+        # The cache.
+        cache = Optimisation_cache(dir=self.tmpdir)
+
+        # Optimise twice, with a new cache object for the second call as in a new relax session.
+        for i in range(2):
+            model = Quadratic(centre=array([1.0, 2.0], float64))
+            results = cached_optimise(self.optimiser, cache=cache, func=model.func, args=(), x0=array([0.0, 0.0]), min_algor='newton', print_flag=i)
+            cache = Optimisation_cache(dir=self.tmpdir)
+
+            # Checks.
+            self.assertEqual(list(results[0]), [1.0, 2.0])
+            self.assertEqual(results[1:], (0.0, 1, 2, 0, 0, None))
+            self.assertEqual(list(model.last), [1.0, 2.0])
+        self.assertEqual(self.calls, 1)
+
+
+    def test_cache_miss(self):
+        """Test that changes in the data, starting position or options are not read from the cache."""
+
+        # The cache.
+        cache = Optimisation_cache(dir=self.tmpdir)
+
+        # The reference and modified optimisations.
+        cached_optimise(self.optimiser, cache=cache, func=Quadratic(centre=array([1.0, 2.0])).func, x0=array([0.0, 0.0]), min_algor='newton')
+        cached_optimise(self.optimiser, cache=cache, func=Quadratic(centre=array([1.0, 2.5])).func, x0=array([0.0, 0.0]), min_algor='newton')
+        cached_optimise(self.optimiser, cache=cache, func=Quadratic(centre=array([1.0, 2.0])).func, x0=array([0.0, 1.0]), min_algor='newton')
+        cached_optimise(self.optimiser, cache=cache, func=Quadratic(centre=array([1.0, 2.0])).func, x0=array([0.0, 0.0]), min_algor='simplex')
+        self.assertEqual(self.calls, 4)
+
+        # No cache.
+        cached_optimise(self.optimiser, cache=None, func=Quadratic(centre=array([1.0, 2.0])).func, x0=array([0.0, 0.0]), min_algor='newton')
+        self.assertEqual(self.calls, 5)
+
+
+    def test_fingerprint_code(self):
+        """Test that the fingerprint changes with the code of the target function."""
+
+        # Two target functions with the same name but different code.
+        def target(params):
+            return float((params**2).sum())
+        func1 = target
+        def target(params):
+            return float((params**4).sum())
+        func2 = target
+
+        # The fingerprints.
+        cache = Optimisation_cache(dir=self.tmpdir)
+        key1 = cache.fingerprint(optimiser=self.optimiser, func=func1, kwargs={'x0': array([0.0])})
+        key2 = cache.fingerprint(optimiser=self.optimiser, func=func2, kwargs={'x0': array([0.0])})
+        self.assertEqual(func1.__qualname__, func2.__qualname__)
+        self.assertNotEqual(key1, key2)
+
+        # Identical code gives identical fingerprints.
+        self.assertEqual(key1, cache.fingerprint(optimiser=self.optimiser, func=func1, kwargs={'x0': array([0.0])}))
+
+
+    def test_fingerprint_unsupported(self):
+        """Test that objects which cannot be reliably hashed are rejected."""
+
+        # The cache.
+        cache = Optimisation_cache(dir=self.tmpdir)
+
+        # A target function class holding an object without a hashable state.
+        model = Quadratic(centre=array([1.0, 2.0]))
+        model.handle = object()
+        self.assertRaises(RelaxError, cache.fingerprint, optimiser=self.optimiser, func=model.func, kwargs={'x0': array([0.0, 0.0])})
+
+
+    def test_warm_start(self):
+        """Test the warm starting from structurally identical problems."""
+
+        # The cache.
+        cache = Optimisation_cache(dir=self.tmpdir, warm_start=True)
+
+        # The first problem, and a near-identical problem.
+        cached_optimise(self.optimiser, cache=cache, func=Quadratic(centre=array([1.0, 2.0])).func, x0=array([0.0, 0.0]), min_algor='newton')
+        cached_optimise(self.optimiser, cache=cache, func=Quadratic(centre=array([1.0, 2.1])).func, x0=array([0.0, 0.0]), min_algor='newton')
+
+        # The second optimisation started from the first solution.
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(list(self.starts[1]), [1.0, 2.0])
+
+        # A different number of parameters cannot be warm started.
+        cached_optimise(self.optimiser, cache=cache, func=Quadratic(centre=array([1.0, 2.0, 3.0])).func, x0=array([0.0, 0.0, 0.0]), min_algor='newton')
+        self.assertEqual(list(self.starts[2]), [0.0, 0.0, 0.0])
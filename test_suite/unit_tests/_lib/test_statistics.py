@@ -20,7 +20,7 @@
 ###############################################################################
 
 # relax module imports.
-from lib.statistics import geometric_mean, geometric_std
+from lib.statistics import Running_stats, geometric_mean, geometric_std, std
 from test_suite.unit_tests.base_classes import UnitTestCase
 
 
@@ -41,3 +41,34 @@ class Test_statistics(UnitTestCase):
         # Calculate the geometric std and check it.
         std = geometric_std(values=[2, 8])
         self.assertEqual(std, 2.0)
+
+
+    def test_running_stats(self):
+        """Check the online Welford statistics against the two-pass standard deviation."""
+
+        # The values.
+        values = [1.2, 3.4, -0.5, 10.1, 7.7, 2.2, 2.2]
+
+        # Accumulate all values, and two subsets which are then merged.
+        stats = Running_stats()
+        stats_a = Running_stats()
+        stats_b = Running_stats()
+        for i in range(len(values)):
+            stats.add(values[i])
+            if i < 3:
+                stats_a.add(values[i])
+            else:
+                stats_b.add(values[i])
+        stats_a.merge(stats_b)
+
+        # Checks.
+        for acc in [stats, stats_a]:
+            self.assertEqual(acc.n, 7)
+            self.assertAlmostEqual(acc.mean, sum(values) / 7.0)
+            self.assertAlmostEqual(acc.std(), std(values=values))
+
+        # Less than two values.
+        stats = Running_stats()
+        self.assertEqual(stats.std(), 0.0)
+        stats.add(1.0)
+        self.assertEqual(stats.std(), 0.0)
@@ -20,5 +20,11 @@
 ###############################################################################
 
 
-__all__ = ['test___init__'
+__all__ = [
+    'test___init__',
+    'test_journal',
+    'test_misc',
+    'test_mpi4py_processor',
+    'test_processor',
+    'test_uni_processor'
 ]
@@ -0,0 +1,178 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+###############################################################################
+
+# Python module imports.
+from os import close, remove
+from os.path import getsize
+from tempfile import mkstemp
+from unittest import TestCase
+
+# relax module imports.
+from multi.journal import Queue_journal
+from multi.uni_processor import Uni_processor
+from test_suite.unit_tests._multi.test_uni_processor import Append_command, Append_result_command, List_memo
+
+
+# The values of the executed commands.
+EXECUTED = []
+
+
+class Counted_command(Append_command):
+    """A slave command recording its execution and failing for negative values."""
+
+    def run(self, processor, completed):
+        """Record the execution and return the value to the master."""
+
+        # Fail.
+        if self.value < 0:
+            raise ValueError("The value %s is negative." % self.value)
+
+        # Record the execution.
+        EXECUTED.append(self.value)
+
+        # Return the result command.
+        super(Counted_command, self).run(processor, completed)
+
+
+
+class Test_journal(TestCase):
+    """Unit tests for the multi.journal module."""
+
+    def setUp(self):
+        """Create an empty journal file name."""
+
+        # The journal file.
+        handle, self.file_name = mkstemp(suffix='.pickle')
+        close(handle)
+        remove(self.file_name)
+
+        # Reset the executions.
+        del EXECUTED[:]
+
+
+    def tearDown(self):
+        """Remove the journal file."""
+
+        # Delete the file.
+        try:
+            remove(self.file_name)
+        except OSError:
+            pass
+
+
+    def run_values(self, values):
+        """Run the commands for the values with a new journaled uni-processor.
+
+        @param values:  The command values.
+        @type values:   list of int
+        @return:        The results.
+        @rtype:         list of int
+        """
+
+        # The processor.
+        processor = Uni_processor(processor_size=1, callback=None)
+        processor.set_journal(self.file_name)
+
+        # Queue and run.
+        results = []
+        for value in values:
+            processor.add_to_queue(Counted_command(value), List_memo(results))
+        try:
+            processor.run_queue()
+        finally:
+            processor.set_journal(None)
+
+        # Return the results.
+        return results
+
+
+    def test_command_key(self):
+        """Test the command identities."""
+
+        # The journal.
+        journal = Queue_journal(self.file_name)
+
+        # Commands differing only in the memo ID.
+        command1 = Append_command(1)
+        command2 = Append_command(1)
+        command1.memo_id = 10
+        command2.memo_id = 20
+        key1 = journal.command_key(command1)
+        key2 = journal.command_key(command2)
+
+        # Repeats are distinguished.
+        self.assertEqual(key1[:-2], key2[:-2])
+        self.assertEqual(key1[-2:], '-0')
+        self.assertEqual(key2[-2:], '-1')
+
+        # Different data and classes.
+        self.assertNotEqual(journal.command_key(Append_command(2))[:-2], key1[:-2])
+        self.assertNotEqual(journal.command_key(Counted_command(1))[:-2], key1[:-2])
+        journal.close()
+
+
+    def test_journal_file(self):
+        """Test the writing and reloading of the journal, with the removal of a partial entry."""
+
+        # Journal the results of two commands, discarding an incomplete one.
+        journal = Queue_journal(self.file_name)
+        journal.add('a-0', Append_result_command(Uni_processor(processor_size=1, callback=None), None, 1, True))
+        journal.flush()
+        journal.add('b-0', Append_result_command(Uni_processor(processor_size=1, callback=None), None, 2, True))
+        journal.flush()
+        journal.add('c-0', Append_result_command(Uni_processor(processor_size=1, callback=None), None, 3, True))
+        journal.discard()
+        journal.flush()
+        journal.close()
+
+        # Simulate an interrupted write.
+        size = getsize(self.file_name)
+        file = open(self.file_name, 'ab')
+        file.write(b'\x80\x02(X')
+        file.close()
+
+        # Reload.
+        journal = Queue_journal(self.file_name)
+        journal.close()
+        self.assertTrue(journal.has('a-0'))
+        self.assertTrue(journal.has('b-0'))
+        self.assertFalse(journal.has('c-0'))
+        self.assertEqual([result.value for result in journal.results('b-0')], [2])
+        self.assertEqual(getsize(self.file_name), size)
+
+
+    def test_restart(self):
+        """Test the restart of an interrupted queue from the journal."""
+
+        # The interrupted run.
+        self.assertRaises(ValueError, self.run_values, [1, 2, -3, 4])
+        self.assertEqual(EXECUTED, [1, 2])
+
+        # The restart only executes the remaining commands, replaying the journaled results.
+        del EXECUTED[:]
+        self.assertEqual(self.run_values([1, 2, 3, 4]), [1, 2, 3, 4])
+        self.assertEqual(EXECUTED, [3, 4])
+
+        # Nothing is executed for a second restart.
+        del EXECUTED[:]
+        self.assertEqual(self.run_values([1, 2, 3, 4]), [1, 2, 3, 4])
+        self.assertEqual(EXECUTED, [])
@@ -0,0 +1,63 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from unittest import TestCase
+
+# relax module imports.
+from multi.misc import Command_timing, merge_blocks, split_blocks
+
+
+class Test_misc(TestCase):
+    """Unit tests for the multi.misc module."""
+
+    def test_command_timing(self):
+        """Test the recording and summary of the command timings."""
+
+        # Record.
+        timing = Command_timing()
+        timing.add_command(1, 2.0, 1.5)
+        timing.add_command(2, 1.0)
+        timing.add_result(0.25)
+
+        # Checks.
+        self.assertEqual(timing.commands, [[1, 2.0, 1.5], [2, 1.0, None]])
+        self.assertEqual(timing.summary(), "Command timings:  2 commands, 3.000000 s round trip, 1.500000 s compute, 0.500000 s dispatch latency.\nResult timings:  1 results, 0.250000 s processing on the master.\n")
+
+
+    def test_split_blocks(self):
+        """Test the splitting of items into blocks and their merging."""
+
+        # The items.
+        items = list(range(11))
+
+        # More items than blocks.
+        blocks = split_blocks(items, 4)
+        self.assertEqual(blocks, [[0, 4, 8], [1, 5, 9], [2, 6, 10], [3, 7]])
+        self.assertEqual(merge_blocks(blocks), items)
+
+        # Fewer items than blocks.
+        blocks = split_blocks(items[:2], 3)
+        self.assertEqual(blocks, [[0], [1], []])
+        self.assertEqual(merge_blocks(blocks), [0, 1])
+
+        # A single block.
+        self.assertEqual(merge_blocks(split_blocks(items, 1)), items)
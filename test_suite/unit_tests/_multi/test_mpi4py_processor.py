@@ -0,0 +1,411 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+import sys
+from threading import Barrier, Lock, Thread, local
+from unittest import TestCase
+
+# relax module imports.
+from multi import mpi4py_processor
+from multi.misc import Capturing_exception
+from multi.mpi4py_processor import Mpi4py_processor
+from multi.slave_commands import Exit_command
+
+
+# The thread timeout, in seconds.
+TIMEOUT = 30
+
+
+def square(items):
+    """Square the items, failing for the value of 99.
+
+    @param items:   The items.
+    @type items:    list of int
+    @return:        The squared items.
+    @rtype:         list of int
+    """
+
+    # Failure.
+    if 99 in items:
+        raise ValueError("The value of 99 cannot be squared.")
+
+    # Square.
+    return [item**2 for item in items]
+
+
+
+class Mock_request:
+    """A mock of the MPI request of a non-blocking send, which has already completed."""
+
+    def Test(self):
+        """The send has completed."""
+
+        # Completed.
+        return True
+
+
+
+class Mock_sub_comm:
+    """A mock of an MPI sub-communicator, shared by the threads of its processes."""
+
+    def __init__(self, world, ranks):
+        """Set up the sub-communicator.
+
+        @param world:   The mock world communicator.
+        @type world:    Mock_world instance
+        @param ranks:   The world ranks of the processes of the sub-communicator, in the order of their sub-communicator ranks.
+        @type ranks:    list of int
+        """
+
+        # Store the arguments.
+        self._world = world
+        self._ranks = ranks
+        self.size = len(ranks)
+
+        # The synchronisation of the collective operations.
+        self._barrier = Barrier(self.size, timeout=TIMEOUT)
+        self._data = None
+        self._gathered = [None] * self.size
+
+
+    @property
+    def rank(self):
+        """The sub-communicator rank of the current thread."""
+
+        # The rank.
+        return self._ranks.index(self._world.rank)
+
+
+    def bcast(self, obj, root=0):
+        """Broadcast the object of the root process."""
+
+        # Store the object.
+        if self.rank == root:
+            self._data = obj
+        self._barrier.wait()
+
+        # Fetch the object.
+        obj = self._data
+        self._barrier.wait()
+        return obj
+
+
+    def gather(self, obj, root=0):
+        """Gather the objects on the root process."""
+
+        # Store the object.
+        self._gathered[self.rank] = obj
+        self._barrier.wait()
+
+        # Fetch the objects.
+        objs = None
+        if self.rank == root:
+            objs = list(self._gathered)
+        self._barrier.wait()
+        return objs
+
+
+    def scatter(self, objs, root=0):
+        """Scatter the objects of the root process."""
+
+        # Store the objects.
+        if self.rank == root:
+            self._data = objs
+        self._barrier.wait()
+
+        # Fetch the object for this process.
+        obj = self._data[self.rank]
+        self._barrier.wait()
+        return obj
+
+
+
+class Mock_world:
+    """A mock of the MPI.COMM_WORLD communicator, where each process is a thread."""
+
+    def __init__(self, size):
+        """Set up the world communicator.
+
+        @param size:    The number of processes.
+        @type size:     int
+        """
+
+        # The size and the thread-local rank.
+        self.size = size
+        self._local = local()
+
+        # The point to point messages for each process.
+        self._queues = [Queue() for i in range(size)]
+
+        # The Split() data.
+        self._barrier = Barrier(size, timeout=TIMEOUT)
+        self._colours = [None] * size
+        self._comms = {}
+        self._lock = Lock()
+
+
+    @property
+    def rank(self):
+        """The rank of the current thread."""
+
+        # The rank.
+        return self._local.rank
+
+
+    def Abort(self):
+        """Abort via an exception."""
+
+        # Fail.
+        raise Exception("MPI abort.")
+
+
+    def isend(self, obj, dest=0):
+        """The non-blocking send."""
+
+        # Send.
+        self.send(obj, dest=dest)
+        return Mock_request()
+
+
+    def recv(self, source=None):
+        """Receive an object from the given source, or from any source."""
+
+        # Receive from any source.
+        sender, obj = self._queues[self.rank].get(timeout=TIMEOUT)
+        if source not in [None, mpi4py_processor.MPI.ANY_SOURCE] and sender != source:
+            raise Exception("Received from rank %s instead of %s." % (sender, source))
+
+        # Return the object.
+        return obj
+
+
+    def send(self, obj, dest=0):
+        """The blocking send."""
+
+        # Send.
+        self._queues[dest].put((self.rank, obj))
+
+
+    def set_rank(self, rank):
+        """Set the rank of the current thread.
+
+        @param rank:    The rank.
+        @type rank:     int
+        """
+
+        # Store.
+        self._local.rank = rank
+
+
+    def Split(self, color, key):
+        """Split the communicator (collective over all processes)."""
+
+        # Store the colour of this process.
+        self._colours[self.rank] = color
+        self._barrier.wait()
+
+        # Create the sub-communicator, once per colour.
+        with self._lock:
+            if color not in self._comms:
+                ranks = [rank for rank in range(self.size) if self._colours[rank] == color]
+                self._comms[color] = Mock_sub_comm(self, ranks)
+
+        # Return the sub-communicator.
+        return self._comms[color]
+
+
+
+class Mock_MPI:
+    """A mock of the mpi4py MPI module."""
+
+    ANY_SOURCE = -1
+
+    def __init__(self, size):
+        """Set up the world communicator.
+
+        @param size:    The number of processes.
+        @type size:     int
+        """
+
+        # The world communicator.
+        self.COMM_WORLD = Mock_world(size)
+
+
+    def Get_processor_name(self):
+        """The name of the host."""
+
+        # The name.
+        return 'mock'
+
+
+
+class Test_mpi4py_processor(TestCase):
+    """Unit tests for the slave groups of the multi.mpi4py_processor module, using threads for the MPI processes."""
+
+    def setUp(self):
+        """Store the MPI module and the IO streams."""
+
+        # Store.
+        self.mpi = mpi4py_processor.MPI
+        self.stdout = sys.stdout
+        self.stderr = sys.stderr
+
+
+    def tearDown(self):
+        """Restore the MPI module and the IO streams."""
+
+        # Restore.
+        mpi4py_processor.MPI = self.mpi
+        sys.stdout = self.stdout
+        sys.stderr = self.stderr
+
+
+    def run_processes(self, size, group_size, target):
+        """Create the processors in one thread per MPI process and run the target function in each.
+
+        @param size:        The number of MPI processes, including the master.
+        @type size:         int
+        @param group_size:  The number of processes in each slave group.
+        @type group_size:   int
+        @param target:      The function to run in each thread, called with the processor.  The return values are stored.
+        @type target:       function
+        @return:            The processor and the return value or exception of the target, for each rank.
+        @rtype:             list of [Mpi4py_processor instance, anything]
+        """
+
+        # The mock MPI module.
+        mpi4py_processor.MPI = Mock_MPI(size)
+        world = mpi4py_processor.MPI.COMM_WORLD
+
+        # The thread function.
+        results = [[None, None] for i in range(size)]
+        def process(rank):
+            world.set_rank(rank)
+            try:
+                processor = Mpi4py_processor(processor_size=-1, callback=None, group_size=group_size)
+                results[rank][0] = processor
+                results[rank][1] = target(processor)
+            except Exception:
+                results[rank][1] = sys.exc_info()[1]
+
+        # Run all processes.
+        threads = [Thread(target=process, args=(rank,)) for rank in range(size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(TIMEOUT)
+            self.assert_(not thread.is_alive())
+
+        # Return the results.
+        return results
+
+
+    def test_group_map(self):
+        """Test the group_map() method, the member loop and the release of the group members."""
+
+        # The target of each process.
+        def target(processor):
+            # The master does nothing.
+            if processor.on_master():
+                return None
+
+            # The group members serve the leader until released.
+            if processor.group_comm.rank != 0:
+                processor._group_member_loop()
+                return 'released'
+
+            # The group leader.
+            values = []
+            values.append(processor.group_map(square, list(range(10))))
+            values.append(processor.group_map(square, [5]))
+            try:
+                processor.group_map(square, [1, 99, 3, 4])
+            except Capturing_exception:
+                values.append('failed')
+            values.append(processor.group_map(square, [6, 7]))
+
+            # Release the group.
+            processor.group_comm.bcast(None, root=0)
+            return values
+
+        # Two slave groups of three processes.
+        results = self.run_processes(7, 3, target)
+
+        # The group leaders, including the failure of a group member (the value of 99 is in the block of the second process).
+        for rank in [1, 4]:
+            self.assertEqual(results[rank][1], [[i**2 for i in range(10)], [25], 'failed', [36, 49]])
+
+        # The members have been released.
+        for rank in [2, 3, 5, 6]:
+            self.assertEqual(results[rank][1], 'released')
+
+
+    def test_run(self):
+        """Test the running of a slave group until the exit command of the master."""
+
+        # The target of each process.
+        def target(processor):
+            # The master sends the exit command to the group leader.
+            if processor.on_master():
+                mpi4py_processor.MPI.COMM_WORLD.send(Exit_command(), dest=1)
+                return mpi4py_processor.MPI.COMM_WORLD.recv(source=1)
+
+            # The slaves.
+            processor.run()
+            return processor.do_quit
+
+        # One slave group of three processes.
+        results = self.run_processes(4, 3, target)
+
+        # The batched result of the exit command was returned to the master.
+        self.assert_(results[0][1].completed)
+
+        # The leader exited its loop and the members have been released.
+        self.assertEqual(results[1][1], True)
+        self.assertEqual(results[2][1], False)
+        self.assertEqual(results[3][1], False)
+
+
+    def test_split(self):
+        """Test the splitting of the slave processes into groups."""
+
+        # The group size and rank of each process.
+        def target(processor):
+            return processor.processor_size(), processor.group_size(), processor.group_comm.size, processor.group_comm.rank
+
+        # Seven slaves, split into groups of three with a smaller last group.
+        results = self.run_processes(8, 3, target)
+
+        # The master is in its own group.
+        self.assertEqual(results[0][1], (3, 3, 1, 0))
+
+        # The slave groups.
+        self.assertEqual([results[rank][1][2:] for rank in range(1, 8)], [(3, 0), (3, 1), (3, 2), (3, 0), (3, 1), (3, 2), (1, 0)])
+
+        # The conversion between the group indices and the leader ranks.
+        processor = results[0][0]
+        self.assertEqual([processor._group_index(rank) for rank in range(1, 8)], [1, 1, 1, 2, 2, 2, 3])
+        self.assertEqual([processor._leader_rank(index) for index in range(1, 4)], [1, 4, 7])
@@ -0,0 +1,105 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from unittest import TestCase
+
+# relax module imports.
+from multi.multi_processor_base import Multi_processor
+from multi.result_commands import Null_result_command
+
+
+class Fake_processor(Multi_processor):
+    """A multi-processor with two simulated slaves, the first of which is slow."""
+
+    def __init__(self):
+        """Set up the simulated slaves."""
+
+        # Execute the base class __init__() method.
+        super(Fake_processor, self).__init__(processor_size=2, callback=None)
+        self.threaded_result_processing = False
+
+        # The log of the sent commands and returned results, and the running commands.
+        self.log = []
+        self.running = {}
+
+
+    def assert_on_master(self):
+        """The simulation is always on the master."""
+
+
+    def master_queue_command(self, command, dest):
+        """Simulate sending a command to the slave."""
+
+        # Store.
+        self.log.append("send %s to %s" % (command, dest))
+        self.running[dest] = command
+
+
+    def master_receive_result(self):
+        """Simulate the return of a result, with the fast slave 2 always returning first."""
+
+        # The slave.
+        dest = 2
+        if dest not in self.running:
+            dest = 1
+
+        # The result.
+        self.log.append("result %s from %s" % (self.running.pop(dest), dest))
+        result = Null_result_command(processor=self, completed=True)
+        result.rank = dest
+        return result
+
+
+    def rank(self):
+        """The master rank."""
+
+        # Return the rank.
+        return 0
+
+
+
+class Test_processor(TestCase):
+    """Unit tests for the multi.processor module."""
+
+    def test_run_command_queue(self):
+        """Test that the idle slaves are fed immediately, without waiting for the slow slave."""
+
+        # Run the queue.
+        processor = Fake_processor()
+        processor.run_command_queue(['d', 'c', 'b', 'a'])
+
+        # The fast slave processes all remaining commands while the slow slave is running.
+        self.assertEqual(processor.log, [
+            "send a to 1",
+            "send b to 2",
+            "result b from 2",
+            "send c to 2",
+            "result c from 2",
+            "send d to 2",
+            "result d from 2",
+            "result a from 1"
+        ])
+
+        # The timings.
+        self.assertEqual(len(processor.timing.commands), 4)
+        self.assertEqual(len(processor.timing.results), 4)
+        self.assertEqual([record[0] for record in processor.timing.commands], [2, 2, 2, 1])
@@ -0,0 +1,170 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from unittest import TestCase
+
+# relax module imports.
+from multi import Memo, Result_command, Slave_command
+from multi.uni_processor import Uni_processor
+
+
+class Append_command(Slave_command):
+    """A slave command returning its value to the master."""
+
+    def __init__(self, value):
+        """Store the value.
+
+        @param value:   The value to return.
+        @type value:    int
+        """
+
+        # Execute the base class __init__() method.
+        super(Append_command, self).__init__()
+
+        # Store the value.
+        self.value = value
+
+
+    def run(self, processor, completed):
+        """Return the value to the master."""
+
+        # Return the result command.
+        processor.return_object(Append_result_command(processor, self.memo_id, self.value, completed))
+
+
+
+class Append_result_command(Result_command):
+    """A result command appending the value to the list of the memo."""
+
+    def __init__(self, processor, memo_id, value, completed):
+        """Store the value."""
+
+        # Execute the base class __init__() method.
+        super(Append_result_command, self).__init__(processor=processor, completed=completed)
+
+        # Store the arguments.
+        self.memo_id = memo_id
+        self.value = value
+
+
+    def run(self, processor, memo):
+        """Append the value to the list."""
+
+        # Append.
+        memo.values.append(self.value)
+
+
+
+class List_memo(Memo):
+    """A memo holding the list of results."""
+
+    def __init__(self, values):
+        """Store the list.
+
+        @param values:  The list of results.
+        @type values:   list
+        """
+
+        # Store the list.
+        self.values = values
+
+
+
+class Test_uni_processor(TestCase):
+    """Unit tests for the multi.uni_processor module."""
+
+    def setUp(self):
+        """Set up the uni-processor."""
+
+        # The processor and the results list.
+        self.processor = Uni_processor(processor_size=1, callback=None)
+        self.values = []
+
+
+    def queue(self, value):
+        """Queue a command and memo for the value.
+
+        @param value:   The value.
+        @type value:    int
+        """
+
+        # Queue.
+        self.processor.add_to_queue(Append_command(value), List_memo(self.values))
+
+
+    def test_group_map(self):
+        """Test the group_map() method, which for the uni-processor processes all items at once."""
+
+        # The block sizes and results.
+        blocks = []
+        def square(items):
+            blocks.append(len(items))
+            return [item**2 for item in items]
+
+        # Checks.
+        self.assertEqual(self.processor.group_size(), 1)
+        self.assertEqual(self.processor.group_map(square, [1, 2, 3]), [1, 4, 9])
+        self.assertEqual(blocks, [3])
+
+
+    def test_hold_queue(self):
+        """Test the holding of the command queue over many run_queue() calls."""
+
+        # Nested holds.
+        self.processor.hold_queue()
+        self.queue(1)
+        self.processor.run_queue()
+        self.processor.hold_queue()
+        self.queue(2)
+        self.processor.run_queue()
+        self.processor.release_queue()
+        self.assertEqual(self.values, [])
+        self.assertTrue(self.processor.is_queued())
+
+        # Release the outermost hold.
+        self.processor.release_queue()
+        self.assertEqual(self.values, [1, 2])
+        self.assertFalse(self.processor.is_queued())
+
+        # No longer held.
+        self.queue(3)
+        self.processor.run_queue()
+        self.assertEqual(self.values, [1, 2, 3])
+
+        # The timings of the last queue.
+        self.assertEqual(len(self.processor.timing.commands), 1)
+        self.assertEqual(len(self.processor.timing.results), 1)
+
+
+    def test_release_queue_discard(self):
+        """Test the discarding of the held commands."""
+
+        # Hold and discard.
+        self.processor.hold_queue()
+        self.queue(1)
+        self.processor.run_queue()
+        self.processor.release_queue(run=False)
+
+        # Checks.
+        self.assertEqual(self.values, [])
+        self.assertFalse(self.processor.is_queued())
+        self.assertEqual(self.processor.memo_map, {})
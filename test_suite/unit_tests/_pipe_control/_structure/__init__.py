@@ -22,5 +22,6 @@
 
 __all__ = [
     'test__init__',
+    'test_distributed',
     'test_internal'
 ]
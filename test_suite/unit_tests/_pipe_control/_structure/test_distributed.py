@@ -0,0 +1,96 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from numpy.random import RandomState
+from unittest import TestCase
+
+# relax module imports.
+from lib.sequence_alignment.msa import central_star, pairwise_alignments as pairwise_alignments_serial
+from lib.structure.statistics import fluctuation_matrix as fluctuation_matrix_serial
+from multi import Processor_box
+from multi.uni_processor import Uni_processor
+from pipe_control.structure.distributed import fluctuation_matrix, pairwise_alignments
+
+
+class Test_distributed(TestCase):
+    """Unit tests for the pipe_control.structure.distributed relax module."""
+
+    def setUp(self):
+        """Set up a uni-processor in the Processor_box singleton."""
+
+        # Store the current processor.
+        self.box = Processor_box()
+        self.processor = getattr(self.box, 'processor', None)
+
+        # The uni-processor.
+        self.box.processor = Uni_processor(processor_size=1, callback=None)
+
+        # Some sequences.
+        self.sequences = ['GSMSEQKLISEEDLPQG', 'MSEQKLISEEDL', 'GSMSEQKLISAEDLG', 'SEQKVISEDLG']
+
+
+    def tearDown(self):
+        """Restore the original processor."""
+
+        # Restore.
+        self.box.processor = self.processor
+
+
+    def test_central_star(self):
+        """Test the central star MSA with the distributed pairwise alignments."""
+
+        # The alignments.
+        serial = central_star(self.sequences, matrix='BLOSUM62', gap_open_penalty=5.0, gap_extend_penalty=1.0)
+        distributed = central_star(self.sequences, matrix='BLOSUM62', gap_open_penalty=5.0, gap_extend_penalty=1.0, pairwise_func=pairwise_alignments)
+
+        # Checks.
+        self.assertEqual(distributed[0], serial[0])
+        self.assertEqual(distributed[1].tolist(), serial[1].tolist())
+
+
+    def test_fluctuation_matrix(self):
+        """Test that the distributed fluctuation matrices match the serial matrices."""
+
+        # Random coordinates of 4 models of 7 atoms.
+        coord = RandomState(0).normal(size=(4, 7, 3))
+
+        # Compare for all measures, with tiles of 3 atoms.
+        for measure in ['distance', 'angle', 'parallax shift']:
+            serial = fluctuation_matrix_serial(coord, measure=measure, tile_size=3)
+            distributed = fluctuation_matrix(coord, measure=measure, tile_size=3)
+            self.assertEqual(distributed.tolist(), serial.tolist())
+
+
+    def test_pairwise_alignments(self):
+        """Test that the distributed pairwise alignments match the serial alignments."""
+
+        # All pairs.
+        pairs = [[i, j] for i in range(4) for j in range(i+1, 4)]
+
+        # Compare.
+        serial = pairwise_alignments_serial(self.sequences, pairs=pairs, gap_open_penalty=5.0, gap_extend_penalty=1.0)
+        distributed = pairwise_alignments(self.sequences, pairs=pairs, gap_open_penalty=5.0, gap_extend_penalty=1.0)
+        self.assertEqual(distributed, serial)
+
+        # Serial alignments without a processor.
+        self.box.processor = None
+        self.assertEqual(pairwise_alignments(self.sequences, pairs=pairs, gap_open_penalty=5.0, gap_extend_penalty=1.0), serial)
@@ -0,0 +1,161 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from unittest import TestCase
+
+# relax module imports.
+from data_store import Relax_data_store; ds = Relax_data_store()
+from pipe_control import align_tensor, diffusion_tensor, error_analysis, pipes
+from lib.errors import RelaxError
+from pipe_control.mol_res_spin import create_spin, return_spin
+from test_suite.unit_tests.base_classes import UnitTestCase
+
+
+class Test_error_analysis(UnitTestCase):
+    """Unit tests for the functions of the 'pipe_control.error_analysis' module."""
+
+    def setUp(self):
+        """Set up a data pipe with simulation data."""
+
+        # Add a data pipe to the data store.
+        ds.add(pipe_name='orig', pipe_type='N-state')
+        pipes.switch('orig')
+
+        # The Monte Carlo simulation set up.
+        cdp.sim_number = 3
+        cdp.sim_state = False
+
+        # A spin with simulation data.
+        create_spin(spin_num=1, spin_name='N', res_num=1, res_name='Gly')
+        spin = return_spin(spin_id=':1@N')
+        spin.x = 1.0
+        spin.x_err = 0.1
+        spin.x_sim = [1.1, 0.9, 1.0]
+
+        # A diffusion tensor with simulation data.
+        diffusion_tensor.init(params=1e-8)
+        cdp.diff_tensor.set(param='tm', value=1e-9, category='err')
+        cdp.diff_tensor.set_sim_num(cdp.sim_number)
+        for i in range(cdp.sim_number):
+            cdp.diff_tensor.set(param='tm', value=1e-8 + i*1e-9, category='sim', sim_index=i)
+
+        # An alignment tensor with simulation data.
+        align_tensor.init(tensor='A', align_id='A', params=(0.0, 0.0, 0.0, 0.0, 0.0), param_types=2)
+        cdp.align_tensors[0].set_sim_num(cdp.sim_number)
+        for i in range(cdp.sim_number):
+            cdp.align_tensors[0].set(param='Axx', value=1e-4 * i, category='sim', sim_index=i)
+
+
+    def test_delete_sims(self):
+        """Test the deletion of all simulation data by the pipe_control.error_analysis._delete_sims() function."""
+
+        # Check the set up.
+        self.assertEqual(len(cdp.diff_tensor.tm_sim), 3)
+        self.assertEqual(len(cdp.align_tensors[0].Axx_sim), 3)
+
+        # Delete the simulations.
+        error_analysis._delete_sims()
+
+        # The spin data.
+        spin = return_spin(spin_id=':1@N')
+        self.assertEqual(spin.x, 1.0)
+        self.assertEqual(spin.x_err, 0.1)
+        self.assertFalse(hasattr(spin, 'x_sim'))
+
+        # The tensor data.
+        for tensor in [cdp.diff_tensor, cdp.align_tensors[0]]:
+            self.assertEqual([name for name in tensor.__dict__ if name.endswith('_sim')], [])
+            self.assertEqual(tensor._sim_num, None)
+        self.assertEqual(cdp.diff_tensor.tm, 1e-8)
+        self.assertEqual(cdp.diff_tensor.tm_err, 1e-9)
+
+        # The simulation set up.
+        self.assertFalse(hasattr(cdp, 'sim_number'))
+        self.assertFalse(hasattr(cdp, 'sim_state'))
+
+        # New simulations can be set up.
+        cdp.diff_tensor.set_sim_num(5)
+        cdp.diff_tensor.set(param='tm', value=2e-8, category='sim', sim_index=4)
+        self.assertEqual(cdp.diff_tensor.tm_sim[4], 2e-8)
+
+
+    def test_delete_sims_streaming(self):
+        """Test the deletion of the streaming simulation set up by the pipe_control.error_analysis._delete_sims() function."""
+
+        # The streaming set up.
+        spin = return_spin(spin_id=':1@N')
+        cdp.sim_stream = {'distribution': 'measured', 'fixed_error': None, 'seed': 1, 'data': {}}
+        error_analysis.sim_stream_init(spin, ['x'])
+
+        # Delete the simulations.
+        error_analysis._delete_sims()
+
+        # Checks.
+        self.assertFalse(hasattr(spin, '_sim_stats'))
+        self.assertFalse(hasattr(cdp, 'sim_stream'))
+
+
+    def test_sim_data_generator(self):
+        """Test that the pipe_control.error_analysis.Sim_data_generator class recreates the same simulation data."""
+
+        # The streaming set up.
+        data = [1.0, None, 3.0]
+        error = [0.1, 0.2, 0.3]
+        cdp.sim_stream = {'distribution': 'measured', 'fixed_error': None, 'seed': 10, 'data': {':1@N': [0, data, error, None]}}
+
+        # The generator.
+        generator = error_analysis.Sim_data_generator(data_id=':1@N')
+
+        # The data of each simulation.
+        for i in range(cdp.sim_number):
+            sim_gauss = error_analysis._sim_gauss(seed=10, data_num=0, sim_index=i)
+            values = error_analysis._randomise(data=data, error=error, distribution='measured', sim_gauss=sim_gauss)
+            self.assertEqual(generator.create(sim_index=i), values)
+            self.assertEqual(generator.create(sim_index=i), values)
+            self.assertEqual(values[1], None)
+
+        # The simulations differ.
+        self.assertNotEqual(generator.create(sim_index=0), generator.create(sim_index=1))
+
+        # A data set without data.
+        self.assertEqual(error_analysis.Sim_data_generator(data_id=':2@N').create(sim_index=0), None)
+
+
+    def test_sim_stream_add(self):
+        """Test the accumulation of the streaming simulation parameters."""
+
+        # The accumulators.
+        spin = return_spin(spin_id=':1@N')
+        error_analysis.sim_stream_init(spin, ['x', 'y'])
+
+        # Add the simulations.
+        for i in range(cdp.sim_number):
+            error_analysis.sim_stream_add(spin, {'x': spin.x_sim[i], 'y': None})
+
+        # Checks.
+        self.assertEqual(spin._sim_stats['x'].n, 3)
+        self.assertAlmostEqual(spin._sim_stats['x'].mean, 1.0)
+        self.assertAlmostEqual(spin._sim_stats['x'].std(), 0.1)
+        self.assertEqual(spin._sim_stats['y'].n, 0)
+
+        # Double counting.
+        self.assertRaises(RelaxError, error_analysis.sim_stream_add, spin, {'x': 1.0})
@@ -26,8 +26,11 @@
 from unittest import TestCase
 
 # relax module imports.
+from lib.errors import RelaxFloatError, RelaxStrListStrError
 from prompt.uf_objects import Class_container, Uf_object
+from status import Status; status = Status()
 from user_functions.data import Uf_info; uf_info = Uf_info()
+from user_functions.objects import Uf_container
 
 
 class Test_uf_objects(TestCase):
@@ -61,3 +64,36 @@ class Test_uf_objects(TestCase):
 
             # Create the documentation and print it.
             text = obj._build_doc()
+
+
+    def test_uf_object_validation(self):
+        """Test the argument validation of the prompt user function objects."""
+
+        # The user function data.
+        data = Uf_container()
+        data.add_keyarg(name='val', default=1.0, basic_types=['float'], desc_short='value', desc='The value.')
+        data.add_keyarg(name='ids', default=None, basic_types=['str'], container_types=['list'], dim=[(), (None,)], desc_short='IDs', desc='The IDs.', can_be_none=True)
+
+        # The user function, storing the arguments of the back end calls.
+        calls = []
+        obj = Uf_object('test', title='Test', kargs=data.kargs, backend=lambda **kargs: calls.append(kargs), desc=[])
+        self.assertEqual(obj._validators, None)
+
+        # Valid calls.
+        intro = status.uf_intro
+        status.uf_intro = False
+        try:
+            obj()
+            obj(2.0, 'a')
+            obj(val=3.0, ids=['a', 'b'])
+
+            # Invalid calls.
+            self.assertRaises(RelaxFloatError, obj, 1)
+            self.assertRaises(RelaxStrListStrError, obj, ids=1)
+            self.assertRaises(RelaxStrListStrError, obj, ids=['a', 1])
+        finally:
+            status.uf_intro = intro
+
+        # Checks.
+        self.assertEqual(len(obj._validators), 2)
+        self.assertEqual(calls, [{'val': 1.0, 'ids': None}, {'val': 2.0, 'ids': 'a'}, {'val': 3.0, 'ids': ['a', 'b']}])
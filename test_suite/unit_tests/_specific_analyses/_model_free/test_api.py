@@ -20,13 +20,17 @@
 ###############################################################################
 
 # Python module imports.
+from numpy import array, float64
+from numpy.random import RandomState
 from os import sep
 
 # relax module imports.
 from data_store import Relax_data_store; ds = Relax_data_store()
-from pipe_control import pipes, results, structure
-from lib.errors import RelaxError
+from pipe_control import diffusion_tensor, pipes, results, structure
+from pipe_control.mol_res_spin import return_spin
+from lib.errors import RelaxError, RelaxImplementError
 from specific_analyses.model_free.api import Model_free
+from specific_analyses.model_free.optimisation import spin_target_function
 from status import Status; status = Status()
 from test_suite.unit_tests.base_classes import UnitTestCase
 
@@ -118,3 +122,42 @@ class Test_api(UnitTestCase):
 
         # Duplicate the data and catch the error.
         self.assertRaises(RelaxError, self.inst.duplicate_data, 'orig', 'new', model_info=0)
+
+
+    def test_map_target_function(self):
+        """Compare the batch evaluation of the model-free map_target_function() method to the target function point by point."""
+
+        # Read a model-free results file, and replace the diffusion tensor with a sphere so that no structure is needed.
+        results.read(file='final_results_trunc_1.3_v2', dir=status.install_path + sep+'test_suite'+sep+'shared_data'+sep+'model_free'+sep+'OMP')
+        diffusion_tensor.delete()
+        diffusion_tensor.init(1e-8)
+
+        # The spins, mapped parameters and ranges for the {S2, te}, {S2, te, Rex}, and {S2f, S2, ts} models.
+        maps = [
+            [':159@N', ['s2', 'te'], [[0.0, 1.0], [0.0, 1e-9]]],
+            [':43@N', ['te', 'rex'], [[0.0, 1e-9], [0.0, 1e-15]]],
+            [':162@N', ['s2f', 'ts'], [[0.5, 1.0], [0.0, 5e-9]]]
+        ]
+
+        # Loop over the maps.
+        random = RandomState(10)
+        for spin_id, params, ranges in maps:
+            # Random points, including the edges of the space.
+            points = array([[random.uniform(*ranges[j]) for j in range(len(params))] for i in range(20)] + [[ranges[j][0] for j in range(len(params))]], float64)
+
+            # The batch evaluation.
+            func = self.inst.map_target_function(params=params, spin_id=spin_id)
+            chi2 = func(points)
+
+            # Compare to the target function, point by point.
+            spin = return_spin(spin_id=spin_id)
+            mf, param_vector = spin_target_function(spin=spin, spin_id=spin_id, model_type='mf')
+            indices = [spin.params.index(param) for param in params]
+            self.assertEqual(len(chi2), len(points))
+            for i in range(len(points)):
+                vector = param_vector.copy()
+                vector[indices] = points[i]
+                self.assertAlmostEqual(chi2[i] / mf.func(vector), 1.0, 10)
+
+        # Parameters which are not part of the model cannot be mapped.
+        self.assertRaises(RelaxImplementError, self.inst.map_target_function, params=['s2', 'rex'], spin_id=':159@N')
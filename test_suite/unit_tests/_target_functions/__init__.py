@@ -21,5 +21,9 @@
 
 
 __all__ = [
+    'test_consistency_tests',
+    'test_frame_order',
+    'test_jw_mapping',
+    'test_mf_grid',
     'test_relax_fit'
 ]
@@ -0,0 +1,64 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from numpy import array
+from numpy.random import RandomState
+from unittest import TestCase
+
+# relax module imports.
+from lib.periodic_table import periodic_table
+from lib.physical_constants import h_bar, mu0
+from target_functions.consistency_tests import Consistency, consistency_array
+
+
+class Test_consistency_tests(TestCase):
+    """Unit tests for the target_functions.consistency_tests relax module."""
+
+    def test_consistency_array(self):
+        """Compare the vectorised consistency tests to the Consistency class."""
+
+        # The spin parameters, of dimensions {spin, 1}.
+        random = RandomState(2)
+        gx = array([[periodic_table.gyromagnetic_ratio('15N')]] * 3)
+        gh = array([[periodic_table.gyromagnetic_ratio('1H')]] * 3)
+        r = array([[1.02e-10], [1.03e-10], [1.01e-10]])
+        csa = array([[-172e-6], [-160e-6], [-180e-6]])
+        orientation = array([[15.7], [20.0], [10.0]])
+        tc = array([[13e-9], [8e-9], [10e-9]])
+
+        # The relaxation data, of dimensions {spin, simulation}.
+        r1 = random.uniform(0.5, 2.0, (3, 5))
+        r2 = random.uniform(5.0, 20.0, (3, 5))
+        noe = random.uniform(0.2, 0.9, (3, 5))
+
+        # The vectorised values.
+        j0, f_eta, f_r2 = consistency_array(frq=600e6, gx=gx, gh=gh, mu0=mu0, h_bar=h_bar, orientation=orientation, tc=tc, r=r, csa=csa, r1=r1, r2=r2, noe=noe)
+        self.assertEqual(f_eta.shape, (3, 5))
+
+        # Compare to the Consistency class.
+        for i in range(3):
+            ct = Consistency(frq=600e6, gx=gx[i, 0], gh=gh[i, 0], mu0=mu0, h_bar=h_bar)
+            for j in range(5):
+                values = ct.func(orientation=orientation[i, 0], tc=tc[i, 0], r=r[i, 0], csa=csa[i, 0], r1=r1[i, j], r2=r2[i, j], noe=noe[i, j])
+                self.assertAlmostEqual(j0[i, j] / values[0], 1.0, 12)
+                self.assertAlmostEqual(f_eta[i, j] / values[1], 1.0, 12)
+                self.assertAlmostEqual(f_r2[i, j] / values[2], 1.0, 12)
@@ -0,0 +1,183 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from math import acos, cos, pi, sin
+from numpy import array_equal, float32, zeros
+from unittest import TestCase
+
+# relax module imports.
+from extern.sobol.sobol_lib import i4_sobol_generate
+from lib.geometry.rotations import tilt_torsion_to_R
+from target_functions import frame_order
+from target_functions.frame_order import Frame_order
+
+
+def sobol_data_loop(dims, total_num):
+    """The original point by point creation of the Sobol' angles and rotation matrices.
+
+    @param dims:        The list of parameters.
+    @type dims:         list of str
+    @param total_num:   The total number of points.
+    @type total_num:    int
+    @return:            The Sobol' angles and the first and second rotation matrices.
+    @rtype:             numpy rank-2 array, numpy rank-3 array, numpy rank-3 array
+    """
+
+    # Initialise.
+    m = len(dims)
+    sobol_angles = zeros((m, total_num), float32)
+    Ri_prime = zeros((total_num, 3, 3), float32)
+    Ri2_prime = zeros((total_num, 3, 3), float32)
+
+    # The Sobol' points.
+    points = i4_sobol_generate(m, total_num, 1000)
+
+    # Loop over the points.
+    for i in range(total_num):
+        # Loop over the dimensions, converting the points to angles.
+        theta = None
+        phi = None
+        sigma = None
+        for j in range(m):
+            if dims[j] in ['theta']:
+                theta = acos(2.0*points[j, i] - 1.0)
+                sobol_angles[j, i] = theta
+            if dims[j] in ['phi']:
+                phi = 2.0 * pi * points[j, i]
+                sobol_angles[j, i] = phi
+            if dims[j] in ['sigma']:
+                sigma = 2.0 * pi * (points[j, i] - 0.5)
+                sobol_angles[j, i] = sigma
+            if dims[j] in ['sigma2']:
+                sigma2 = 2.0 * pi * (points[j, i] - 0.5)
+                sobol_angles[j, i] = sigma2
+
+        # The double motion models.
+        if 'sigma2' in dims:
+            c_sigma = cos(sigma)
+            s_sigma = sin(sigma)
+            Ri_prime[i, 0, 0] =  c_sigma
+            Ri_prime[i, 0, 2] =  s_sigma
+            Ri_prime[i, 1, 1] = 1.0
+            Ri_prime[i, 2, 0] = -s_sigma
+            Ri_prime[i, 2, 2] =  c_sigma
+            c_sigma2 = cos(sigma2)
+            s_sigma2 = sin(sigma2)
+            Ri2_prime[i, 0, 0] = 1.0
+            Ri2_prime[i, 1, 1] =  c_sigma2
+            Ri2_prime[i, 1, 2] = -s_sigma2
+            Ri2_prime[i, 2, 1] =  s_sigma2
+            Ri2_prime[i, 2, 2] =  c_sigma2
+
+        # The full tilt-torsion.
+        elif theta != None and phi != None and sigma != None:
+            tilt_torsion_to_R(phi, theta, sigma, Ri_prime[i])
+
+        # The torsionless models.
+        elif sigma == None:
+            c_theta = cos(theta)
+            s_theta = sin(theta)
+            c_phi = cos(phi)
+            s_phi = sin(phi)
+            c_phi_c_theta = c_phi * c_theta
+            s_phi_c_theta = s_phi * c_theta
+            Ri_prime[i, 0, 0] =  c_phi_c_theta*c_phi + s_phi**2
+            Ri_prime[i, 0, 1] =  c_phi_c_theta*s_phi - c_phi*s_phi
+            Ri_prime[i, 0, 2] =  c_phi*s_theta
+            Ri_prime[i, 1, 0] =  s_phi_c_theta*c_phi - c_phi*s_phi
+            Ri_prime[i, 1, 1] =  s_phi_c_theta*s_phi + c_phi**2
+            Ri_prime[i, 1, 2] =  s_phi*s_theta
+            Ri_prime[i, 2, 0] = -s_theta*c_phi
+            Ri_prime[i, 2, 1] = -s_theta*s_phi
+            Ri_prime[i, 2, 2] =  c_theta
+
+        # The rotor models.
+        else:
+            c_sigma = cos(sigma)
+            s_sigma = sin(sigma)
+            Ri_prime[i, 0, 0] =  c_sigma
+            Ri_prime[i, 0, 1] = -s_sigma
+            Ri_prime[i, 1, 0] =  s_sigma
+            Ri_prime[i, 1, 1] =  c_sigma
+            Ri_prime[i, 2, 2] = 1.0
+
+    # Return the data.
+    return sobol_angles, Ri_prime, Ri2_prime
+
+
+
+class Test_frame_order(TestCase):
+    """Unit tests for the target_functions.frame_order relax module."""
+
+    def check_sobol_data(self, dims=None):
+        """Compare the Sobol' data of create_sobol_data() to the original point by point loop.
+
+        @keyword dims:  The list of parameters.
+        @type dims:     list of str
+        """
+
+        # A minimal target function object, skipping the full set up.
+        func = Frame_order.__new__(Frame_order)
+        func.quad_int = False
+        func.sobol_max_points = 20
+        func.sobol_oversample = 1
+        func.model = 'test %s' % dims
+
+        # Create the data, avoiding any pre-created data.
+        frame_order.sobol_data.total_num = None
+        func.create_sobol_data(dims=dims)
+
+        # The original loop.
+        sobol_angles, Ri_prime, Ri2_prime = sobol_data_loop(dims, frame_order.sobol_data.total_num)
+
+        # The data must be identical.
+        self.assert_(array_equal(frame_order.sobol_data.sobol_angles, sobol_angles))
+        self.assert_(array_equal(frame_order.sobol_data.Ri_prime, Ri_prime))
+        self.assert_(array_equal(frame_order.sobol_data.Ri2_prime, Ri2_prime))
+
+
+    def test_create_sobol_data_double_rotor(self):
+        """Test the Sobol' data of create_sobol_data() for the double rotor model."""
+
+        # Check.
+        self.check_sobol_data(dims=['sigma', 'sigma2'])
+
+
+    def test_create_sobol_data_rotor(self):
+        """Test the Sobol' data of create_sobol_data() for the rotor model."""
+
+        # Check.
+        self.check_sobol_data(dims=['sigma'])
+
+
+    def test_create_sobol_data_tilt_torsion(self):
+        """Test the Sobol' data of create_sobol_data() for the full tilt-torsion models."""
+
+        # Check.
+        self.check_sobol_data(dims=['theta', 'phi', 'sigma'])
+
+
+    def test_create_sobol_data_torsionless(self):
+        """Test the Sobol' data of create_sobol_data() for the torsionless models."""
+
+        # Check.
+        self.check_sobol_data(dims=['theta', 'phi'])
@@ -0,0 +1,62 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from numpy import array
+from numpy.random import RandomState
+from unittest import TestCase
+
+# relax module imports.
+from lib.periodic_table import periodic_table
+from lib.physical_constants import h_bar, mu0
+from target_functions.jw_mapping import Mapping, jw_mapping_array
+
+
+class Test_jw_mapping(TestCase):
+    """Unit tests for the target_functions.jw_mapping relax module."""
+
+    def test_jw_mapping_array(self):
+        """Compare the vectorised reduced spectral density mapping to the Mapping class."""
+
+        # The spin parameters, of dimensions {spin, 1}, including a zero distance.
+        random = RandomState(1)
+        gx = array([[periodic_table.gyromagnetic_ratio('15N')], [periodic_table.gyromagnetic_ratio('13C')], [periodic_table.gyromagnetic_ratio('15N')]])
+        gh = array([[periodic_table.gyromagnetic_ratio('1H')]] * 3)
+        r = array([[1.02e-10], [1.09e-10], [0.0]])
+        csa = array([[-172e-6], [-120e-6], [-160e-6]])
+
+        # The relaxation data, of dimensions {spin, simulation}.
+        r1 = random.uniform(0.5, 2.0, (3, 4))
+        r2 = random.uniform(5.0, 20.0, (3, 4))
+        noe = random.uniform(0.2, 0.9, (3, 4))
+
+        # The vectorised values.
+        j0, jwx, jwh = jw_mapping_array(frq=600e6, gx=gx, gh=gh, mu0=mu0, h_bar=h_bar, r=r, csa=csa, r1=r1, r2=r2, noe=noe)
+        self.assertEqual(j0.shape, (3, 4))
+
+        # Compare to the Mapping class.
+        for i in range(3):
+            jw = Mapping(frq=600e6, gx=gx[i, 0], gh=gh[i, 0], mu0=mu0, h_bar=h_bar)
+            for j in range(4):
+                values = jw.func(r=r[i, 0], csa=csa[i, 0], r1=r1[i, j], r2=r2[i, j], noe=noe[i, j])
+                self.assertAlmostEqual(j0[i, j] / values[0], 1.0, 12)
+                self.assertAlmostEqual(jwx[i, j] / values[1], 1.0, 12)
+                self.assertAlmostEqual(jwh[i, j] / values[2], 1.0, 12)
@@ -0,0 +1,162 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from numpy import array, diag, float64, pi
+from numpy.random import RandomState
+from unittest import TestCase
+
+# relax module imports.
+from lib.periodic_table import periodic_table
+from lib.physical_constants import N15_CSA, NH_BOND_LENGTH, h_bar, mu0
+from target_functions.mf import Mf
+from target_functions.mf_grid import Mf_grid
+
+
+# The parameter scaling and random point ranges (in scaled units).
+SCALING = {'local_tm': 1e-12, 's2': 1.0, 's2f': 1.0, 's2s': 1.0, 'te': 1e-12, 'tf': 1e-12, 'ts': 1e-12, 'rex': 1.0 / (2.0 * pi * 600e6)**2, 'r': 1e-10, 'csa': 1e-4}
+RANGES = {'local_tm': [4000.0, 12000.0], 's2': [0.0, 1.0], 's2f': [0.0, 1.0], 's2s': [0.0, 1.0], 'te': [0.0, 500.0], 'tf': [0.0, 500.0], 'ts': [0.0, 5000.0], 'rex': [0.0, 5.0], 'r': [1.0, 1.05], 'csa': [-2.0, -1.5]}
+
+
+class Test_mf_grid(TestCase):
+    """Unit tests for the target_functions.mf_grid relax module."""
+
+    def check_chi2(self, equations=None, param_types=None, model_type='mf', diff_type='sphere', diff_params=[1e-8], ri_labels=['R1', 'R2', 'NOE', 'R1', 'R2', 'NOE'], remap_table=[0, 0, 0, 1, 1, 1], noe_r1_table=[None, None, 0, None, None, 3]):
+        """Compare the vectorised chi-squared values to those of the model-free target function.
+
+        @keyword equations:     The model-free equations.
+        @type equations:        str
+        @keyword param_types:   The parameter types.
+        @type param_types:      list of str
+        @keyword model_type:    The 'mf' or 'local_tm' model type.
+        @type model_type:       str
+        @keyword diff_type:     The diffusion tensor type.
+        @type diff_type:        str
+        @keyword diff_params:   The diffusion tensor parameters.
+        @type diff_params:      list of float
+        @keyword ri_labels:     The relaxation data types.
+        @type ri_labels:        list of str
+        @keyword remap_table:   The relaxation data to frequency index table.
+        @type remap_table:      list of int
+        @keyword noe_r1_table:  The NOE to R1 data table.
+        @type noe_r1_table:     list of int or None
+        """
+
+        # Random data.
+        random = RandomState(10)
+        num_ri = len(ri_labels)
+        relax_data = array([random.uniform(0.5, 15.0) for i in range(num_ri)], float64)
+        errors = 0.02 * relax_data
+        for i in range(num_ri):
+            if ri_labels[i] == 'NOE':
+                relax_data[i] = random.uniform(0.5, 0.8)
+                errors[i] = 0.05
+
+        # The target function.
+        num_params = len(param_types)
+        scaling_matrix = diag([SCALING[param] for param in param_types])
+        mf = Mf(init_params=array([sum(RANGES[param]) / 2.0 for param in param_types]), model_type=model_type, diff_type=diff_type, diff_params=array(diff_params), scaling_matrix=scaling_matrix, num_spins=1, equations=[equations], param_types=[param_types], param_values=None, relax_data=[relax_data], errors=[errors], bond_length=[NH_BOND_LENGTH], csa=[N15_CSA], num_frq=[2], frq=[[600e6, 800e6]], num_ri=[num_ri], remap_table=[remap_table], noe_r1_table=[noe_r1_table], ri_labels=[ri_labels], gx=[periodic_table.gyromagnetic_ratio('15N')], gh=[periodic_table.gyromagnetic_ratio('1H')], h_bar=h_bar, mu0=mu0, num_params=[num_params], vectors=[array([0.2, 0.3, 0.932737905308882])])
+
+        # Random points, with the local tm values on a grid as in the grid search.
+        points = array([[random.uniform(*RANGES[param]) for param in param_types] for i in range(50)], float64)
+        if model_type == 'local_tm':
+            points[:, 0] = random.choice([5000.0, 8000.0, 11000.0], 50)
+
+        # The vectorised chi-squared values.
+        chi2 = Mf_grid().calc_chi2(mf, points)
+
+        # Compare to the target function.
+        for i in range(len(points)):
+            self.assertAlmostEqual(chi2[i] / mf.func(points[i]), 1.0, 10)
+
+
+    def test_calc_chi2_ellipsoid(self):
+        """Test the chi-squared values for the ellipsoidal diffusion tensor."""
+
+        # Check.
+        self.check_chi2(equations='mf_orig', param_types=['s2', 'te', 'rex'], diff_type='ellipsoid', diff_params=[1e-8, 1e7, 0.3, 1.0, 2.0, 0.5])
+
+
+    def test_calc_chi2_local_tm(self):
+        """Test the chi-squared values for the local tm models."""
+
+        # Check.
+        self.check_chi2(equations='mf_orig', param_types=['local_tm', 's2', 'te', 'rex'], model_type='local_tm')
+        self.check_chi2(equations='mf_ext', param_types=['local_tm', 's2f', 's2', 'ts'], model_type='local_tm')
+
+
+    def test_calc_chi2_mf_ext(self):
+        """Test the chi-squared values for the extended model-free equations."""
+
+        # Check.
+        self.check_chi2(equations='mf_ext', param_types=['s2f', 's2', 'ts'])
+        self.check_chi2(equations='mf_ext', param_types=['s2f', 'tf', 's2', 'ts', 'rex'])
+        self.check_chi2(equations='mf_ext2', param_types=['s2f', 's2s', 'ts'])
+        self.check_chi2(equations='mf_ext2', param_types=['s2f', 's2s', 'ts', 'rex', 'csa'])
+
+
+    def test_calc_chi2_mf_orig(self):
+        """Test the chi-squared values for the original model-free equations."""
+
+        # Check.
+        self.check_chi2(equations='mf_orig', param_types=[])
+        self.check_chi2(equations='mf_orig', param_types=['s2'])
+        self.check_chi2(equations='mf_orig', param_types=['s2', 'te'])
+        self.check_chi2(equations='mf_orig', param_types=['s2', 'rex'])
+        self.check_chi2(equations='mf_orig', param_types=['s2', 'te', 'rex', 'r', 'csa'])
+        self.check_chi2(equations='mf_orig', param_types=['s2', 'csa'])
+
+
+    def test_calc_chi2_noe_without_r1(self):
+        """Test the chi-squared values for NOE data without the R1 data of the same field strength."""
+
+        # Check.
+        self.check_chi2(equations='mf_orig', param_types=['s2', 'te', 'r'], ri_labels=['R2', 'NOE', 'R1', 'R2', 'NOE'], remap_table=[0, 0, 1, 1, 1], noe_r1_table=[None, None, None, None, 2])
+
+
+    def test_grid(self):
+        """Test that the grid search matches a simple loop over the grid points."""
+
+        # The target function.
+        mf = Mf(init_params=array([0.5, 100.0]), model_type='mf', diff_type='sphere', diff_params=array([1e-8]), scaling_matrix=diag([1.0, 1e-12]), num_spins=1, equations=['mf_orig'], param_types=[['s2', 'te']], param_values=None, relax_data=[array([1.5, 10.0, 0.7])], errors=[array([0.05, 0.2, 0.05])], bond_length=[NH_BOND_LENGTH], csa=[N15_CSA], num_frq=[1], frq=[[600e6]], num_ri=[3], remap_table=[[0, 0, 0]], noe_r1_table=[[None, None, 0]], ri_labels=[['R1', 'R2', 'NOE']], gx=[periodic_table.gyromagnetic_ratio('15N')], gh=[periodic_table.gyromagnetic_ratio('1H')], h_bar=h_bar, mu0=mu0, num_params=[2], vectors=[None])
+
+        # The grid search, with a constraint of te <= 400 ps and small blocks of points.
+        A = array([[0.0, -1.0]])
+        b = array([-400.0])
+        params, chi2, count, warning = Mf_grid(max_points=7).grid(mf=mf, num_incs=[11, 21], lower=[0.0, 0.0], upper=[1.0, 500.0], A=A, b=b)
+
+        # The loop over the grid, the first dimension being the fastest changing.
+        best, best_chi2, num = None, 1e300, 0
+        for j in range(21):
+            for i in range(11):
+                point = array([i * 0.1, j * 25.0])
+                if point[1] > 400.0:
+                    continue
+                num += 1
+                value = mf.func(point)
+                if value < best_chi2:
+                    best, best_chi2 = point, value
+
+        # Checks.
+        self.assertEqual(count, num)
+        self.assertEqual(list(params), list(best))
+        self.assertAlmostEqual(chi2 / best_chi2, 1.0, 10)
+        self.assertEqual(warning, None)
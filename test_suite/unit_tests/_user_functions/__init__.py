@@ -20,5 +20,6 @@
 ###############################################################################
 
 
-__all__ = ['test___init__'
+__all__ = ['test___init__',
+           'test_objects'
 ]
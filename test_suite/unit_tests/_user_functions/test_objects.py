@@ -0,0 +1,75 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from unittest import TestCase
+
+# relax module imports.
+from pipe_control.pipes import create
+import user_functions
+from user_functions.data import Uf_info; uf_info = Uf_info()
+from user_functions.objects import import_backend
+
+
+class Test_objects(TestCase):
+    """Unit tests for the user_functions.objects relax module."""
+
+    def test_get_backend(self):
+        """Test that the back ends of all user functions can be imported."""
+
+        # Set up the user functions.
+        user_functions.initialise()
+
+        # Loop over the user functions.
+        for name, data in uf_info.uf_loop():
+            # The back end must be a function.
+            self.assertTrue(hasattr(data.get_backend(), '__call__'), "The back end of the %s user function is not callable." % name)
+
+            # The combo box iterators must be functions.
+            for arg in data.kargs:
+                if arg['wiz_combo_iter'] != None:
+                    self.assertTrue(hasattr(import_backend(arg['wiz_combo_iter']), '__call__'), "The '%s' argument iterator of the %s user function is not callable." % (arg['name'], name))
+
+
+    def test_lazy_backends(self):
+        """Test that the back ends of the module based user functions are imported on demand."""
+
+        # Set up the user functions.
+        user_functions.initialise()
+
+        # Loop over the user functions.
+        for name, data in uf_info.uf_loop():
+            # The hybrid data pipe back end is the method of an object in the user function module.
+            if name == 'pipe.hybridise':
+                continue
+
+            # The back end must be a module path.
+            self.assertTrue(isinstance(data.backend, str), "The back end of the %s user function is not a module path." % name)
+
+
+    def test_import_backend(self):
+        """Test the user_functions.objects.import_backend() function."""
+
+        # The module path.
+        self.assertTrue(import_backend('pipe_control.pipes.create') is create)
+
+        # A function.
+        self.assertTrue(import_backend(create) is create)
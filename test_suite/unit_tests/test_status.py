@@ -0,0 +1,133 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2019 Edward d'Auvergne                                        #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+# Python module imports.
+from time import sleep
+from unittest import TestCase
+
+# relax module imports.
+from status import Observer, Observer_container
+
+
+class Test_status(TestCase):
+    """Unit tests for the observer objects of the status relax module."""
+
+    def setUp(self):
+        """Set up a container of observers with callbacks recording their calls."""
+
+        # The observers.
+        self.observers = Observer_container()
+        self.observers.a = Observer('a')
+        self.observers.b = Observer('b')
+
+        # The callbacks.
+        self.calls = []
+        self.observers.a.register('x', lambda: self.calls.append('a.x'))
+        self.observers.a.register('y', lambda: self.calls.append('a.y'))
+        self.observers.b.register('x', lambda: self.calls.append('b.x'))
+
+
+    def test_batch(self):
+        """Test the coalescing of notifications within nested batches."""
+
+        # Nested batches.
+        with self.observers.batch():
+            for i in range(5):
+                self.observers.a.notify()
+            with self.observers.batch():
+                self.observers.b.notify()
+                self.observers.a.notify()
+            self.assertEqual(self.calls, [])
+
+        # One delivery per observer, in the callback registration order.
+        self.assertEqual(sorted(self.calls), ['a.x', 'a.y', 'b.x'])
+        self.assertEqual(self.calls.index('a.x') < self.calls.index('a.y'), True)
+
+        # The statistics.
+        self.assertEqual(self.observers.a.notify_count, 6)
+        self.assertEqual(self.observers.a.delivery_count, 1)
+        self.assertEqual(self.observers.b.notify_count, 1)
+        self.assertEqual(self.observers.b.delivery_count, 1)
+
+        # Outside of the batch, the notifications are immediate.
+        self.observers.b.notify()
+        self.assertEqual(self.calls.count('b.x'), 2)
+
+
+    def test_batch_names(self):
+        """Test the batching of only some observers."""
+
+        # Batch observer 'a' only.
+        with self.observers.batch(['a']):
+            self.observers.a.notify()
+            self.observers.b.notify()
+            self.assertEqual(self.calls, ['b.x'])
+        self.assertEqual(self.calls, ['b.x', 'a.x', 'a.y'])
+
+        # No notification, no delivery.
+        with self.observers.batch(['a']):
+            pass
+        self.assertEqual(len(self.calls), 3)
+
+
+    def test_batch_error(self):
+        """Test the delivery of the coalesced notifications when the bulk operation fails."""
+
+        # The failing operation.
+        try:
+            with self.observers.batch():
+                self.observers.a.notify()
+                raise ValueError
+        except ValueError:
+            pass
+
+        # Checks.
+        self.assertEqual(self.calls, ['a.x', 'a.y'])
+        self.assertEqual(self.observers.a._batch_level, 0)
+
+
+    def test_batch_interval(self):
+        """Test the debounce interval of a batch."""
+
+        # Batch with a debounce interval.
+        with self.observers.batch(['a'], interval=0.05):
+            self.observers.a.notify()
+            self.observers.a.notify()
+            self.assertEqual(self.calls, [])
+            sleep(0.06)
+            self.observers.a.notify()
+            self.assertEqual(self.calls, ['a.x', 'a.y'])
+            self.observers.a.notify()
+        self.assertEqual(self.calls, ['a.x', 'a.y', 'a.x', 'a.y'])
+        self.assertEqual(self.observers.a.delivery_count, 2)
+
+
+    def test_callback_time(self):
+        """Test the timing of the callbacks."""
+
+        # A slow callback.
+        self.observers.b.register('slow', lambda: sleep(0.02))
+        self.observers.b.notify()
+
+        # Checks.
+        self.assertEqual(self.observers.b.delivery_count, 1)
+        self.assertTrue(self.observers.b.callback_time >= 0.02)
+        self.assertEqual(self.observers.a.callback_time, 0.0)
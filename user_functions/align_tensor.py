@@ -90,7 +90,7 @@ uf.desc[-1].add_prompt("relax> align_tensor.copy(tensor_from='Otting', pipe_to='
 uf.desc[-1].add_paragraph("To copy the alignment tensor data of 'Otting' to that of 'Otting new', type one of:")
 uf.desc[-1].add_prompt("relax> align_tensor.copy('Otting', tensor_to='Otting new')")
 uf.desc[-1].add_prompt("relax> align_tensor.copy(tensor_from='Pf1', tensor_to='Otting new')")
-uf.backend = align_tensor.copy
+uf.backend = 'pipe_control.align_tensor.copy'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (800, 600)
@@ -114,7 +114,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will delete the specified alignment tensor data from the current data pipe.  If no tensor is specified, all tensors will be deleted.")
-uf.backend = align_tensor.delete
+uf.backend = 'pipe_control.align_tensor.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -143,7 +143,7 @@ uf.desc[-1].add_list_element("Alignment tensor.")
 uf.desc[-1].add_list_element("Magnetic susceptibility tensor.")
 uf.desc[-1].add_paragraph("All possible tensor parameters and information will also be shown (Eigensystem, GDO, Aa, Ar, R, eta, chi_ax, chi_rh, etc).  The printout will be extensive.")
 uf.desc[-1].add_paragraph("If no tensor is specified, all tensors will be displayed.")
-uf.backend = align_tensor.display
+uf.backend = 'pipe_control.align_tensor.display'
 uf.menu_text = "dis&play"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_height_desc = 400
@@ -174,7 +174,7 @@ uf.add_keyarg(
 )
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("If the ID string is left unset, then all alignment tensors will be fixed.")
-uf.backend = align_tensor.fix
+uf.backend = 'pipe_control.align_tensor.fix'
 uf.menu_text = "&fix"
 uf.gui_icon = "oxygen.status.object-locked"
 uf.wizard_size = (800, 500)
@@ -289,7 +289,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To set a rhombic tensor for the domain labelled 'domain 1' with the alignment named 'super media', type one of:")
 uf.desc[-1].add_prompt("relax> align_tensor.init('domain 1', 'super media', (-8.6322e-05, -5.5786e-04, -3.1732e-05, 2.2927e-05, 2.8599e-04), param_types=1)")
 uf.desc[-1].add_prompt("relax> align_tensor.init(tensor='domain 1', align_id='super media', params=(-8.6322e-05, -5.5786e-04, -3.1732e-05, 2.2927e-05, 2.8599e-04), param_types=1)")
-uf.backend = align_tensor.init
+uf.backend = 'pipe_control.align_tensor.init'
 uf.menu_text = "&init"
 uf.wizard_height_desc = 370
 uf.wizard_size = (1000, 750)
@@ -392,7 +392,7 @@ uf.desc[-1].add_verbatim("""\
                    \ |A1|.|A2| / \
 """)
 uf.desc[-1].add_paragraph("where the inner product <A1|A2> is simply the vector dot product and |A1| is the vector length.")
-uf.backend = align_tensor.matrix_angles
+uf.backend = 'pipe_control.align_tensor.matrix_angles'
 uf.menu_text = "&matrix_angles"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_height_desc = 450
@@ -429,7 +429,7 @@ uf.desc[-1].add_paragraph("Prior to optimisation of the N-state model and Frame
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To state that the alignment tensor loaded as 'chi3 C-dom' is a reduction of 'chi3 N-dom', type:")
 uf.desc[-1].add_prompt("relax> align_tensor.reduction(full_tensor='chi3 N-dom', red_tensor='chi3 C-dom')")
-uf.backend = align_tensor.reduction
+uf.backend = 'pipe_control.align_tensor.reduction'
 uf.menu_text = "&reduction"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
 
@@ -460,7 +460,7 @@ uf.desc[-1].add_paragraph("Prior to optimisation of the N-state model or Frame O
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To link the alignment tensor loaded as 'chi3 C-dom' to the C-terminal domain 'C', type:")
 uf.desc[-1].add_prompt("relax> align_tensor.set_domain(tensor='chi3 C-dom', domain='C')")
-uf.backend = align_tensor.set_domain
+uf.backend = 'pipe_control.align_tensor.set_domain'
 uf.menu_text = "&set_domain"
 uf.gui_icon = "oxygen.actions.edit-select"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -568,7 +568,7 @@ uf.desc[-1].add_verbatim("""\
     Szz = - Sxx - Syy,
     Sxxyy = Sxx - Syy.\
 """)
-uf.backend = align_tensor.svd
+uf.backend = 'pipe_control.align_tensor.svd'
 uf.menu_text = "s&vd"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_height_desc = 500
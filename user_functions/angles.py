@@ -23,7 +23,6 @@
 """The angles user function definitions."""
 
 # relax module imports.
-from pipe_control import angles
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -42,7 +41,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("If the diffusion tensor is isotropic, then nothing will be done.")
 uf.desc[-1].add_paragraph("If the diffusion tensor is axially symmetric, then the angle alpha will be calculated for each XH bond vector.")
 uf.desc[-1].add_paragraph("If the diffusion tensor is asymmetric, then the three angles will be calculated.")
-uf.backend = angles.angle_diff_frame
+uf.backend = 'pipe_control.angles.angle_diff_frame'
 uf.menu_text = "&diff_frame"
 uf.wizard_size = (800, 400)
 uf.gui_icon = "oxygen.categories.applications-education"
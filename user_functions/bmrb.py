@@ -25,7 +25,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import bmrb, exp_info, pipes
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -167,7 +167,7 @@ uf.desc[-1].add_paragraph("The standard journal abbreviation is that defined by
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To add the citation \"d'Auvergne E. J., Gooley P. R. (2007). Set theory formulation of the model-free problem and the diffusion seeded model-free paradigm. Mol. Biosyst., 3(7), 483-494.\", type:")
 uf.desc[-1].add_prompt("relax> bmrb.citation(authors=[[\"Edward\", \"d'Auvergne\", \"E.\", \"J.\"], [\"Paul\", \"Gooley\", \"P.\", \"R.\"]], doi=\"10.1039/b702202f\", pubmed_id=\"17579774\", full_citation=\"d'Auvergne E. J., Gooley P. R. (2007). Set theory formulation of the model-free problem and the diffusion seeded model-free paradigm. Mol. Biosyst., 3(7), 483-494.\", title=\"Set theory formulation of the model-free problem and the diffusion seeded model-free paradigm.\", status=\"published\", type=\"journal\", journal_abbrev=\"Mol. Biosyst.\", journal_full=\"Molecular Biosystems\", volume=3, issue=7, page_first=483, page_last=498, year=2007)")
-uf.backend = exp_info.citation
+uf.backend = 'pipe_control.exp_info.citation'
 uf.menu_text = "&citation"
 uf.gui_icon = "oxygen.actions.documentation"
 uf.wizard_height_desc = 180
@@ -197,7 +197,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will print the BMRB NMR-STAR formatted data to STDOUT.")
-uf.backend = bmrb.display
+uf.backend = 'pipe_control.bmrb.display'
 uf.menu_text = "&display"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_size = (700, 500)
@@ -239,7 +239,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will allow most of the data from a BMRB NMR-STAR formatted file to be loaded into the relax data store.  Note that an empty data pipe should be created for storing the data, and that currently only model-free data pipes can be used.  Also, only one sample condition can be read per relax data pipe.  Therefore if one of the sample conditions is not specified and multiple conditions exist in the NMR-STAR file, an error will be raised.")
-uf.backend = bmrb.read
+uf.backend = 'pipe_control.bmrb.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 300
@@ -350,7 +350,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("For BMRB deposition, to specify that the full_analysis.py script was used, type one of:")
 uf.desc[-1].add_prompt("relax> bmrb.script('full_analysis.py', 'model-free', 'AIC', 'relax', True, True)")
 uf.desc[-1].add_prompt("relax> bmrb.script(file='full_analysis.py', dir=None, analysis_type='model-free', model_selection='AIC', engine='relax', model_elim=True, universal_solution=True)")
-uf.backend = exp_info.script
+uf.backend = 'pipe_control.exp_info.script'
 uf.menu_text = "&script"
 uf.gui_icon = "oxygen.mimetypes.application-x-desktop"
 uf.wizard_height_desc = 400
@@ -438,7 +438,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("For BMRB deposition, to say that Sparky was used in the analysis, type:")
 uf.desc[-1].add_prompt("relax> cite_id = bmrb.citation(authors=[[\"Tom\", \"Goddard\", \"T.\", \"D.\"], [\"D\", \"Kneller\", \"D.\", \"G.\"]], title=\"Goddard, T. D. and Kneller, D. G., SPARKY 3, University of California, San Francisco.\"")
 uf.desc[-1].add_prompt("relax> bmrb.software(\"Sparky\", version=\"3.110\", url=\"http://www.cgl.ucsf.edu/home/sparky/\", vendor_name=\"Goddard, T. D.\", cite_ids=[cite_id], tasks=[\"spectral analysis\"])")
-uf.backend = exp_info.software
+uf.backend = 'pipe_control.exp_info.software'
 uf.menu_text = "soft&ware"
 uf.gui_icon = "oxygen.apps.utilities-terminal"
 uf.wizard_height_desc = 450
@@ -478,7 +478,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("For BMRB deposition, to say that both NMRPipe and Sparky were used prior to relax, type:")
 uf.desc[-1].add_prompt("relax> bmrb.software_select('NMRPipe')")
 uf.desc[-1].add_prompt("relax> bmrb.software_select('Sparky', version='3.113')")
-uf.backend = exp_info.software_select
+uf.backend = 'pipe_control.exp_info.software_select'
 uf.menu_text = "software_se&lect"
 uf.gui_icon = "oxygen.apps.utilities-terminal"
 uf.wizard_height_desc = 550
@@ -531,7 +531,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("For BMRB deposition, to say that the protein studied is in the oxidised state, tyype one of:")
 uf.desc[-1].add_prompt("relax> bmrb.thiol_state('oxidised')")
 uf.desc[-1].add_prompt("relax> bmrb.thiol_state(state='oxidised')")
-uf.backend = exp_info.thiol_state
+uf.backend = 'pipe_control.exp_info.thiol_state'
 uf.menu_text = "&thiol_state"
 uf.wizard_height_desc = 400
 uf.wizard_size = (900, 600)
@@ -582,7 +582,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will create a NMR-STAR formatted file of the data in the current data pipe for BMRB deposition.")
 uf.desc[-1].add_paragraph("In the prompt/script UI modes, to place the BMRB file in the current working directory, set dir to None.  If dir is set to the special name 'pipe_name', then the results file will be placed into a directory with the same name as the current data pipe.")
-uf.backend = bmrb.write
+uf.backend = 'pipe_control.bmrb.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 300
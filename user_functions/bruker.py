@@ -24,7 +24,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import bruker
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -62,7 +61,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This user function is used to load the fitted relaxation data out of a Bruker Dynamics Center (DC) file for the analyses in relax that use relaxation data.  Currently the R1 and R2 relaxation rates and steady-state NOE data is supported.  The peak intensity information in the file, which is used by the Dynamics Center to fit or calculate the relaxation values, will be discarded.")
-uf.backend = bruker.read
+uf.backend = 'pipe_control.bruker.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (800, 500)
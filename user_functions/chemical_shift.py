@@ -27,7 +27,6 @@ from os import sep
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import chemical_shift
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 from user_functions.wildcards import WILDCARD_SPECTRUM_PEAKLIST
@@ -128,7 +127,7 @@ uf.desc[-1].add_paragraph("This will read chemical shifts from a peak list or a
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("The following commands will read the chemical shifts out of the Sparky peak list '10ms.list':")
 uf.desc[-1].add_prompt("relax> chemical_shift.read('10ms.list')")
-uf.backend = chemical_shift.read
+uf.backend = 'pipe_control.chemical_shift.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (800, 500)
@@ -26,7 +26,6 @@
 # relax module imports.
 from graphics import ANALYSIS_IMAGE_PATH
 from pipe_control import spectrometer
-from specific_analyses.consistency_tests.uf import set_frq
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -58,7 +57,7 @@ uf.desc[-1].add_paragraph("This will select the relaxation data to use in the co
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_prompt("relax> consistency_tests.set_frq(600.0 * 1e6)")
 uf.desc[-1].add_prompt("relax> consistency_tests.set_frq(frq=600.0 * 1e6)")
-uf.backend = set_frq
+uf.backend = 'specific_analyses.consistency_tests.uf.set_frq'
 uf.menu_text = "&set_frq"
 uf.gui_icon = "relax.frq"
 uf.wizard_height_desc = 350
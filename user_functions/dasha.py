@@ -24,7 +24,6 @@
 """The dasha user function definitions for controlling the Dasha model-free software."""
 
 # relax module imports.
-from pipe_control import dasha
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -73,7 +72,7 @@ uf.desc[-1].add_paragraph("The two minimisation algorithms within Dasha are acce
 uf.desc[-1].add_item_list_element("'LM'", "The Levenberg-Marquardt algorithm,")
 uf.desc[-1].add_item_list_element("'NR'", "Newton-Raphson algorithm.")
 uf.desc[-1].add_paragraph("For Levenberg-Marquardt minimisation, the function 'lmin' will be called, while for Newton-Raphson, the function 'min' will be executed.")
-uf.backend = dasha.create
+uf.backend = 'pipe_control.dasha.create'
 uf.menu_text = "&create"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_height_desc = 400
@@ -112,7 +111,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("Dasha will be executed as")
 uf.desc[-1].add_prompt("$ dasha < dasha_script | tee dasha_results")
 uf.desc[-1].add_paragraph("If you would like to use a different Dasha executable file, change the binary name to the appropriate file name.  If the file is not located within the environment's path, include the full path in front of the binary file name.")
-uf.backend = dasha.execute
+uf.backend = 'pipe_control.dasha.execute'
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.menu_text = "&execute"
 uf.wizard_size = (700, 500)
@@ -133,7 +132,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The model-free results will be extracted from the Dasha results file 'dasha_results' located in the given directory.")
-uf.backend = dasha.extract
+uf.backend = 'pipe_control.dasha.extract'
 uf.menu_text = "ex&tract"
 uf.gui_icon = "oxygen.actions.archive-extract"
 uf.wizard_apply_button = False
@@ -25,7 +25,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import selection, spectrum
+from pipe_control import selection
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -49,7 +49,7 @@ uf.desc[-1].add_paragraph("This will deselect all spins, irregardless of their c
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To deselect all spins, simply type:")
 uf.desc[-1].add_prompt("relax> deselect.all()")
-uf.backend = selection.desel_all
+uf.backend = 'pipe_control.selection.desel_all'
 uf.menu_text = "&all"
 uf.wizard_size = (600, 550)
 uf.wizard_apply_button = False
@@ -111,7 +111,7 @@ uf.desc[-1].add_prompt("relax> deselect.interatom(spin_id1='@N', spin_id2='@H')"
 uf.desc[-1].add_paragraph("To deselect all H-H interatomic vectors of a small organic molecule, type one of:")
 uf.desc[-1].add_prompt("relax> deselect.interatom('@H*', '@H*')")
 uf.desc[-1].add_prompt("relax> deselect.interatom(spin_id1='@H*', spin_id2='@H*')")
-uf.backend = selection.desel_interatom
+uf.backend = 'pipe_control.selection.desel_interatom'
 uf.menu_text = "&interatom"
 uf.wizard_height_desc = 450
 uf.wizard_size = (1000, 750)
@@ -237,7 +237,7 @@ uf.desc[-1].add_prompt("relax> deselect.read(file='unresolved', res_num_col=1)")
 uf.desc[-1].add_paragraph("To deselect the spins in the second column of the relaxation data file 'r1.600' while selecting all other spins, for example type:")
 uf.desc[-1].add_prompt("relax> deselect.read('r1.600', spin_num_col=2, change_all=True)")
 uf.desc[-1].add_prompt("relax> deselect.read(file='r1.600', spin_num_col=2, change_all=True)")
-uf.backend = selection.desel_read
+uf.backend = 'pipe_control.selection.desel_read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 400
@@ -264,7 +264,7 @@ uf.desc[-1].add_paragraph("By supplying the spin ID string, a subset of spins ca
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("To deselect all currently selected spins and select those which are deselected type:")
 uf.desc[-1].add_prompt("relax> deselect.reverse()")
-uf.backend = selection.reverse
+uf.backend = 'pipe_control.selection.reverse'
 uf.menu_text = "re&verse"
 uf.gui_icon = "oxygen.actions.system-switch-user"
 uf.wizard_size = (700, 550)
@@ -326,7 +326,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To deselect all spins with a signal to noise ratio lower than 10.0:")
 uf.desc[-1].add_prompt("relax> deselect.sn_ratio(ratio=10.0, operation='<')")
 uf.desc[-1].add_prompt("relax> deselect.sn_ratio(ratio=10.0, operation='<', all_sn=True)")
-uf.backend = spectrum.sn_ratio_deselection
+uf.backend = 'pipe_control.spectrum.sn_ratio_deselection'
 uf.menu_text = "&sn_ratio"
 uf.gui_icon = "relax.fid"
 uf.wizard_height_desc = 500
@@ -382,7 +382,7 @@ uf.desc[-1].add_paragraph("To deselect residue 12 MET type:")
 uf.desc[-1].add_prompt("relax> deselect.spin(':12')")
 uf.desc[-1].add_prompt("relax> deselect.spin(spin_id=':12')")
 uf.desc[-1].add_prompt("relax> deselect.spin(spin_id=':12&:MET')")
-uf.backend = selection.desel_spin
+uf.backend = 'pipe_control.selection.desel_spin'
 uf.menu_text = "&spin"
 uf.gui_icon = "relax.spin_grey"
 uf.wizard_height_desc = 500
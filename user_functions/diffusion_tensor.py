@@ -24,7 +24,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import diffusion_tensor, pipes
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -73,7 +73,7 @@ uf.desc[-1].add_prompt("relax> diffusion_tensor.copy(pipe_to='m9')")
 uf.desc[-1].add_paragraph("To copy the diffusion tensor from the data pipe 'm1' to 'm2', type:")
 uf.desc[-1].add_prompt("relax> diffusion_tensor.copy('m1', 'm2')")
 uf.desc[-1].add_prompt("relax> diffusion_tensor.copy(pipe_from='m1', pipe_to='m2')")
-uf.backend = diffusion_tensor.copy
+uf.backend = 'pipe_control.diffusion_tensor.copy'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (700, 500)
@@ -87,7 +87,7 @@ uf.title_short = "Diffusion tensor data deletion."
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will delete all diffusion tensor data from the current data pipe.")
-uf.backend = diffusion_tensor.delete
+uf.backend = 'pipe_control.diffusion_tensor.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_size = (600, 400)
@@ -102,7 +102,7 @@ uf.display = True
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will display all of the diffusion tensor information of the current data pipe.")
-uf.backend = diffusion_tensor.display
+uf.backend = 'pipe_control.diffusion_tensor.display'
 uf.menu_text = "dis&play"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_size = (600, 400)
@@ -283,7 +283,7 @@ uf.desc[-1].add_prompt("relax> diffusion_tensor.init((1.698e-1, 1.417e-1, 1.1724
 uf.desc[-1].add_prompt("relax> diffusion_tensor.init(params=(1.698e-1, 1.417e-1, 1.1724, -1.4612), param_types=3, d_scale=1e8, angle_units='rad', fixed=True)")
 uf.desc[-1].add_paragraph("To select ellipsoidal diffusion, type:")
 uf.desc[-1].add_prompt("relax> diffusion_tensor.init((1.340e7, 1.516e7, 1.691e7, -82.027, -80.573, 65.568), param_types=2)")
-uf.backend = diffusion_tensor.init
+uf.backend = 'pipe_control.diffusion_tensor.init'
 uf.menu_text = "&init"
 uf.gui_icon = "relax.diff_tensor"
 uf.wizard_size = (1000, 750)
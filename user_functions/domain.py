@@ -23,7 +23,6 @@
 """The domain user function definitions."""
 
 # relax module imports.
-from pipe_control import domain
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -48,5 +47,5 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This is used to define structural domains.  Multiple domains can be defined, and these can overlap.  Rather than labelling the currently loaded spins with the ID string, the spin ID string is stored for later use.  This allows new spins to be loaded later and still be included within the same domain.")
-uf.backend = domain.define
+uf.backend = 'pipe_control.domain.define'
 uf.menu_text = "&domain"
@@ -25,8 +25,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from lib.software.opendx.execute import run
-from pipe_control.opendx import map
 from specific_analyses.frame_order.parameter_object import Frame_order_params; frame_order_params = Frame_order_params()
 from specific_analyses.model_free.parameter_object import Model_free_params; model_free_params = Model_free_params()
 from specific_analyses.n_state_model.parameter_object import N_state_params; n_state_params = N_state_params()
@@ -80,7 +78,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will execute OpenDX to display the space maps created previously by the dx.map user function.  This will work for any type of OpenDX map.")
-uf.backend = run
+uf.backend = 'lib.software.opendx.execute.run'
 uf.menu_text = "&execute"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_size = (700, 500)
@@ -202,6 +200,14 @@ uf.add_keyarg(
     desc_short = "creation of file with parameter and calculated chi2",
     desc = "A flag specifying whether to create a file with parameters and associated chi2 value.  The default of False causes the file not to be created."
 )
+uf.add_keyarg(
+    name = "coarse_inc",
+    default = None,
+    basic_types = ["int"],
+    desc_short = "number of coarse increments",
+    desc = "The number of increments of the coarse grid for the adaptive refinement mode.  If supplied, the space is first mapped on this coarse grid and then only the coarse grid cells spanning one of the chi2 isosurface levels are mapped at the full resolution, the chi2 values of all other points being linearly interpolated.  The number of increments must be a multiple of this value.  The default of None maps all points at the full resolution.",
+    can_be_none = True
+)
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will map the space corresponding to the spin identifier and create the OpenDX files.  The map type can be changed to one of the following supported map types:")
@@ -224,7 +230,7 @@ uf.desc[-1].add_prompt("relax> dx.map(params=['s2', 's2f', 'ts'], spin_id=':6',
 uf.desc[-1].add_paragraph("To map the model-free space 'm4' for residue 2, spin N6 defined by the parameters {S2, te, Rex}, name the results 'test', and to place the files in the current directory, use one of the following commands:")
 uf.desc[-1].add_prompt("relax> dx.map(['s2', 'te', 'rex'], spin_id=':2@N6', file_prefix='test', dir=None)")
 uf.desc[-1].add_prompt("relax> dx.map(params=['s2', 'te', 'rex'], spin_id=':2@N6', inc=100, file_prefix='test', dir=None)")
-uf.backend = map
+uf.backend = 'pipe_control.opendx.map'
 uf.menu_text = "&map"
 uf.gui_icon = "relax.grid_search"
 uf.wizard_height_desc = 260
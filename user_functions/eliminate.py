@@ -24,7 +24,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import eliminate
 from specific_analyses.model_free import uf as model_free_uf
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
@@ -56,7 +55,7 @@ uf.desc[-1].add_paragraph("Empirical rules are used for model rejection and are
 uf.desc[-1].add_paragraph("The function arguments should be a tuple, a list enclosed in round brackets, and will be passed to the user supplied function or the inbuilt function.  For a description of the arguments accepted by the inbuilt functions, see below.")
 uf.desc[-1].add_paragraph("Once a model is rejected, the select flag corresponding to that model will be set to False so that model selection, or any other function, will then skip the model.")
 uf.desc += model_free_uf.eliminate_doc
-uf.backend = eliminate.eliminate
+uf.backend = 'pipe_control.eliminate.eliminate'
 uf.menu_text = "&eliminate"
 uf.gui_icon = "oxygen.actions.edit-delete"
 uf.wizard_height_desc = 620
@@ -29,7 +29,6 @@ from os import sep
 
 # relax module imports.
 from graphics import ANALYSIS_IMAGE_PATH
-from pipe_control.error_analysis import covariance_matrix
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -69,7 +68,7 @@ uf.desc[-1].add_paragraph("This method is inspired from the GNU Scientific Libra
 uf.desc[-1].add_paragraph("The covariance matrix is given by: covar = Qxx = (J^T.W.J)^-1, where the weight matrix W is constructed by the multiplication of an Identity matrix I and a weight array w.  The weight array is 1/errors^2, which then gives W = I.w = I x 1/errors^2.")
 uf.desc[-1].add_paragraph("Qxx is computed by QR decomposition, J^T.W.J=QR, Qxx=R^-1. Q^T.  The columns of R which satisfy: |R_{kk}| <= epsrel |R_{11}| are considered linearly-dependent and are excluded from the covariance matrix (the corresponding rows and columns of the covariance matrix are set to zero).")
 uf.desc[-1].add_paragraph("The parameter 'epsrel' is used to remove linear-dependent columns when J is rank deficient.")
-uf.backend = covariance_matrix
+uf.backend = 'pipe_control.error_analysis.covariance_matrix'
 uf.menu_text = "&covariance_matrix"
 uf.wizard_size = (800, 800)
 uf.wizard_image = ANALYSIS_IMAGE_PATH + sep + 'blank_150x150.png'
@@ -24,7 +24,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import fix
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -64,7 +63,7 @@ uf.desc[-1].add_item_list_element("'diff'", "The diffusion tensor parameters.  T
 uf.desc[-1].add_item_list_element("'all_spins'", "Using this keyword, all parameters from all spins will be toggled.")
 uf.desc[-1].add_item_list_element("'all'", "All parameters will be toggled.  This is equivalent to combining both 'diff' and 'all_spins'.")
 uf.desc[-1].add_paragraph("The flag 'fixed', if set to True, will fix parameters during optimisation whereas a value of False will allow parameters to vary.")
-uf.backend = fix.fix
+uf.backend = 'pipe_control.fix.fix'
 uf.menu_text = "&fix"
 uf.gui_icon = "oxygen.status.object-locked"
 uf.wizard_height_desc = 400
@@ -25,8 +25,6 @@
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
 from lib.frame_order.variables import MODEL_DOUBLE_ROTOR, MODEL_FREE_ROTOR, MODEL_ISO_CONE, MODEL_ISO_CONE_FREE_ROTOR, MODEL_ISO_CONE_TORSIONLESS, MODEL_PSEUDO_ELLIPSE, MODEL_PSEUDO_ELLIPSE_FREE_ROTOR, MODEL_PSEUDO_ELLIPSE_TORSIONLESS, MODEL_RIGID, MODEL_ROTOR
-from specific_analyses.frame_order.optimisation import count_sobol_points
-from specific_analyses.frame_order.uf import decompose, distribute, sobol_setup, pdb_model, permute_axes, pivot, quad_int, ref_domain, select_model, simulate
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.data import Uf_tables; uf_tables = Uf_tables()
 from user_functions.objects import Desc_container
@@ -47,7 +45,7 @@ uf.title_short = "Used Sobol' point count."
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This allows the number of Sobol' integration points used during the Frame Order target function optimisation to be counted.  This uses the current parameter values to determine how many are used for the PCS calculation compared to the total number.")
-uf.backend = count_sobol_points
+uf.backend = 'specific_analyses.frame_order.optimisation.count_sobol_points'
 uf.menu_text = "&count_sobol_points"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_size = (800, 400)
@@ -124,7 +122,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("An alternative way to visualise the frame order motions is to decompose the motions and visualise each mode separately.  This user function will create a uniform distribution of structures shifted from the original position and rotated around the eigenvector for that motional mode.  Each distribution will be output to a PDB file appended with '_modeX.pdb', where X are the discrete motional modes ordered from largest to smallest.  The curved line of positions will extend over the full distribution of structures.")
-uf.backend = decompose
+uf.backend = 'specific_analyses.frame_order.uf.decompose'
 uf.menu_text = "&decompose"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 420
@@ -200,7 +198,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("To visualise the frame order motions, this user function generates a distribution of structures randomly within the bounds of the uniform distribution of the frame order model.  The original structure is rotated randomly and only accepted for the distribution if it is within the bounds.  This is a more faithful representation of the dynamics than the pseudo-Brownian simulation user function.")
 uf.desc[-1].add_paragraph("Note that the RDC and PCS data does not contain information about all parts of the real distribution of structures.  Therefore the structures in this distribution only represent the components of the distribution present in the data, as modelled by the frame order models.")
 uf.desc[-1].add_paragraph("As the distribution consists of one model per state, if an ensemble of structures has been analysed, only one model from the ensemble can be used for the representation.")
-uf.backend = distribute
+uf.backend = 'specific_analyses.frame_order.uf.distribute'
 uf.menu_text = "&distribute"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 420
@@ -292,7 +290,7 @@ uf.desc[-1].add_paragraph("The three files are specified via the file root where
 uf.desc[-1].add_paragraph("There are four different types of residue within the PDB.  The pivot point is represented as as a single carbon atom of the residue 'PIV'.  The cone consists of numerous H atoms of the residue 'CON'.  The cone axis vector is presented as the residue 'AXE' with one carbon atom positioned at the pivot and the other x Angstroms away on the cone axis (set by the geometric object size).  Finally, if Monte Carlo have been performed, there will be multiple 'MCC' residues representing the cone for each simulation, and multiple 'MCA' residues representing the multiple cone axes.")
 uf.desc[-1].add_paragraph("To create the diffusion in a cone PDB representation, a uniform distribution of vectors on a sphere is generated using spherical coordinates with the polar angle defined by the cone axis.  By incrementing the polar angle using an arccos distribution, a radial array of vectors representing latitude are created while incrementing the azimuthal angle evenly creates the longitudinal vectors.  These are all placed into the PDB file as H atoms and are all connected using PDB CONECT records.  Each H atom is connected to its two neighbours on the both the longitude and latitude.  This creates a geometric PDB object with longitudinal and latitudinal lines representing the filled cone.")
 uf.desc[-1].add_paragraph("The PDB representation of the Monte Carlo simulations consists of one model per simulation.  Therefore if an ensemble of structures has been analysed, only one model from the ensemble can be used for the representation.  This defaults to model number 1, but this can be changed.")
-uf.backend = pdb_model
+uf.backend = 'specific_analyses.frame_order.uf.pdb_model'
 uf.menu_text = "pdb_&model"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 400
@@ -338,7 +336,7 @@ uf.desc[-1].add_paragraph("In this table, the condition and cone angle values [x
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("For combination 'A', simply type:")
 uf.desc[-1].add_prompt("relax> frame_order.permute_axes('A')")
-uf.backend = permute_axes
+uf.backend = 'specific_analyses.frame_order.uf.permute_axes'
 uf.menu_text = "per&mute_axes"
 uf.wizard_height_desc = 580
 uf.wizard_size = (1000, 750)
@@ -386,7 +384,7 @@ uf.desc[-1].add_prompt("relax> frame_order.pivot([12.067, 14.313, -3.2675])")
 uf.desc[-1].add_prompt("relax> frame_order.pivot(pivot=[12.067, 14.313, -3.2675])")
 uf.desc[-1].add_paragraph("To change an already set and fixed pivot point so that it can now be optimised, type:")
 uf.desc[-1].add_prompt("relax> frame_order.pivot(fix=False)")
-uf.backend = pivot
+uf.backend = 'specific_analyses.frame_order.uf.pivot'
 uf.menu_text = "&pivot"
 uf.wizard_size = (900, 600)
 uf.wizard_image = WIZARD_IMAGE_PATH + 'frame_order.png'
@@ -406,7 +404,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This allows the high precision numerical integration of the Scipy quad() and related functions to be used instead of the lower precision quasi-random Sobol' sequence integration.  This is for the optimisation of the Frame Order target functions.  The quadratic integration is orders of magnitude slower than the Sobol' sequence integration, but the precision is much higher.")
-uf.backend = quad_int
+uf.backend = 'specific_analyses.frame_order.uf.quad_int'
 uf.menu_text = "&quad_int"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_size = (900, 500)
@@ -430,7 +428,7 @@ uf.desc[-1].add_paragraph("Prior to optimisation of the frame order model, the f
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To set up the isotropic cone frame order model with 'centre' domain being the frame of reference, type:")
 uf.desc[-1].add_prompt("relax> frame_order.ref_domain(ref='centre')")
-uf.backend = ref_domain
+uf.backend = 'specific_analyses.frame_order.uf.ref_domain'
 uf.menu_text = "&ref_domain"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_size = (900, 500)
@@ -494,7 +492,7 @@ uf.desc[-1].add_item_list_element(repr(MODEL_DOUBLE_ROTOR), "Restricted motions
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To select the isotropic cone model, type:")
 uf.desc[-1].add_prompt("relax> frame_order.select_model(model='%s')" % MODEL_ISO_CONE)
-uf.backend = select_model
+uf.backend = 'specific_analyses.frame_order.uf.select_model'
 uf.menu_text = "&select_model"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_height_desc = 560
@@ -514,7 +512,8 @@ uf.add_keyarg(
     desc_short = "simulation file",
     desc = "The PDB file for storing the frame order pseudo-Brownian dynamics simulation.  The compression is determined automatically by the file extensions '*.pdb', '*.pdb.gz', and '*.pdb.bz2'.",
     wiz_filesel_wildcard = WILDCARD_STRUCT_PDB_ALL,
-    wiz_filesel_preview = False
+    wiz_filesel_preview = False,
+    can_be_none = True
 )
 uf.add_keyarg(
     name = "dir",
@@ -558,6 +557,23 @@ uf.add_keyarg(
     desc = "Only one model from an analysed ensemble of structures can be used for the pseudo-Brownian simulation, as the simulation and corresponding PDB file consists of one model per simulation.",
     wiz_element_type = "spin"
 )
+uf.add_keyarg(
+    name = "walkers",
+    default = 1,
+    min = 1,
+    max = 10000,
+    basic_types = ["int"],
+    desc_short = "number of walkers",
+    desc = "The number of independent walkers simulated together.  At each snapshot step, one snapshot per walker is taken.",
+    wiz_element_type = "spin"
+)
+uf.add_keyarg(
+    name = "traj_file",
+    arg_type = "file sel write",
+    desc_short = "binary trajectory file",
+    desc = "The optional file for storing the compact binary trajectory of the rotation matrices of each snapshot.",
+    can_be_none = True
+)
 uf.add_keyarg(
     name = "force",
     default = False,
@@ -580,7 +596,8 @@ uf.desc[-1].add_item_list_element("7", "Store a snapshot if the correct number o
 uf.desc[-1].add_item_list_element("8", "Terminate the loop if the maximum number of snapshots has been reached.")
 uf.desc[-1].add_paragraph("The setting of the steps outside of the distribution to the maximum parameter values is specifically to allow for models with parameter values close to zero.  Without this, the simulation would take a huge amount of time to complete.")
 uf.desc[-1].add_paragraph("As the simulation consists of one model per snapshot, if an ensemble of structures has been analysed, only one model from the ensemble can be used for the representation.  This defaults to model number 1, but this can be changed.")
-uf.backend = simulate
+uf.desc[-1].add_paragraph("Multiple independent walkers can be simulated together to more rapidly generate the snapshots.  The snapshots are written to the PDB file as they are taken.  For long simulations, the rotation matrices of each snapshot can also be stored in a compact binary trajectory file.  If the PDB file name is set to None, only this trajectory file will be created.")
+uf.backend = 'specific_analyses.frame_order.uf.simulate'
 uf.menu_text = "simula&te"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 420
@@ -627,7 +644,7 @@ uf.desc[-1].add_list_element("Generate the Sobol' sequence for the total number
 uf.desc[-1].add_list_element("Convert all points to the torsion-tilt angle system.")
 uf.desc[-1].add_list_element("Skip all Sobol' points with angles greater than the current parameter values.")
 uf.desc[-1].add_list_element("Terminate the loop over the Sobol' points once the maximum number of points has been reached.")
-uf.backend = sobol_setup
+uf.backend = 'specific_analyses.frame_order.uf.sobol_setup'
 uf.menu_text = "&sobol_setup"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 500
@@ -26,7 +26,6 @@
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
 from pipe_control import grace
-from pipe_control.plotting import write_xy
 from specific_analyses.consistency_tests.parameter_object import Consistency_tests_params; consistency_test_params = Consistency_tests_params()
 from specific_analyses.jw_mapping.parameter_object import Jw_mapping_params; jw_mapping_params = Jw_mapping_params()
 from specific_analyses.model_free.parameter_object import Model_free_params; model_free_params = Model_free_params()
@@ -80,7 +79,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To view the file 's2.agr' in the directory 'grace', type:")
 uf.desc[-1].add_prompt("relax> grace.view(file='s2.agr')")
 uf.desc[-1].add_prompt("relax> grace.view(file='s2.agr', dir='grace')")
-uf.backend = grace.view
+uf.backend = 'pipe_control.grace.view'
 uf.menu_text = "&view"
 uf.gui_icon = "relax.grace_icon"
 uf.wizard_size = (900, 500)
@@ -215,7 +214,7 @@ uf.desc[-1].add_prompt("relax> grace.write('rex', 'te', spin_id=':123', plot_dat
 uf.desc[-1].add_prompt("relax> grace.write(x_data_type='rex', y_data_type='te', spin_id=':123', plot_data='sims', file='s2_te.agr')")
 uf.desc[-1].add_paragraph("By plotting the peak intensities, the integrity of exponential relaxation curves can be checked and anomalies searched for prior to model-free analysis or reduced spectral density mapping.  For example the normalised average peak intensities can be plotted verses the relaxation time periods for the relaxation curves of all residues of a protein.  The normalisation, whereby the initial peak intensity of each residue I(0) is set to 1, emphasises any problems.  To produce this Grace file, type:")
 uf.desc[-1].add_prompt("relax> grace.write(x_data_type='relax_times', y_data_type='ave_int', file='intensities_norm.agr', force=True, norm=True)")
-uf.backend = write_xy
+uf.backend = 'pipe_control.plotting.write_xy'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (1000, 700)
@@ -29,7 +29,7 @@ from os import sep
 from graphics import WIZARD_IMAGE_PATH
 from lib.physical_constants import NH_BOND_LENGTH
 from pipe_control.mol_res_spin import get_spin_ids
-from pipe_control import pipes, interatomic
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -90,7 +90,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To copy the interatomic data container between ':2@C' and ':2@H', from the 'orig' data pipe to the current data pipe, type one of:")
 uf.desc[-1].add_prompt("relax> interatom.copy('orig', spin_id1=':2@C', spin_id2=':2@H')")
 uf.desc[-1].add_prompt("relax> interatom.copy(pipe_from='orig', spin_id1=':2@C', spin_id2=':2@H')")
-uf.backend = interatomic.copy
+uf.backend = 'pipe_control.interatomic.copy'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (700, 600)
@@ -154,7 +154,7 @@ uf.desc[-1].add_prompt("relax> interatom.define(spin_id1=':1@N', spin_id2=':1@H'
 uf.desc[-1].add_paragraph("To define the protein 15N heteronuclear relaxation mechanism for a model-free analysis, type one of the following:")
 uf.desc[-1].add_prompt("relax> interatom.define('@N', '@H', True)")
 uf.desc[-1].add_prompt("relax> interatom.define(spin_id1='@N', spin_id2='@H', direct_bond=True)")
-uf.backend = interatomic.define_dipole_pair
+uf.backend = 'pipe_control.interatomic.define_dipole_pair'
 uf.menu_text = "&define"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_height_desc = 380
@@ -233,7 +233,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To load the distances in meters from the fifth column of the 'distances' file, and where the spin IDs are in the first and second columns, type one of the following:")
 uf.desc[-1].add_prompt("relax> interatom.read_dist('distances', 1, 2, 5)")
 uf.desc[-1].add_prompt("relax> interatom.read_dist(file='distances', unit='meter', spin_id1_col=1, spin_id2_col=2, data_col=5)")
-uf.backend = interatomic.read_dist
+uf.backend = 'pipe_control.interatomic.read_dist'
 uf.menu_text = "&read_dist"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 350
@@ -286,7 +286,7 @@ uf.desc[-1].add_paragraph("To set the N-H distance for protein the 15N heteronuc
 uf.desc[-1].add_prompt("relax> interatom.set_dist('@N', '@H', 1.02 * 1e-10)")
 uf.desc[-1].add_prompt("relax> interatom.set_dist(spin_id1='@N', spin_id2='@H', ave_dist=1.02 * 1e-10, unit='meter')")
 uf.desc[-1].add_prompt("relax> interatom.set_dist(spin_id1='@N', spin_id2='@H', ave_dist=1.02, unit='Angstrom')")
-uf.backend = interatomic.set_dist
+uf.backend = 'pipe_control.interatomic.set_dist'
 uf.menu_text = "&set_dist"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 350
@@ -314,7 +314,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To calculate the unit vectors prior to a model-free analysis, type one of the following:")
 uf.desc[-1].add_prompt("relax> interatom.unit_vectors(True)")
 uf.desc[-1].add_prompt("relax> interatom.unit_vectors(ave=True)")
-uf.backend = interatomic.unit_vectors
+uf.backend = 'pipe_control.interatomic.unit_vectors'
 uf.menu_text = "&unit_vectors"
 uf.wizard_height_desc = 400
 uf.wizard_size = (900, 600)
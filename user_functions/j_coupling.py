@@ -24,7 +24,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import pipes, j_coupling
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -66,7 +66,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To copy all J coupling data from pipe 'DMSO' to pipe 'CDCl3', type one of:")
 uf.desc[-1].add_prompt("relax> j_coupling.copy('DMSO', 'CDCl3')")
 uf.desc[-1].add_prompt("relax> j_coupling.copy(pipe_from='DMSO', pipe_to='CDCl3')")
-uf.backend = j_coupling.copy
+uf.backend = 'pipe_control.j_coupling.copy'
 uf.menu_text = "cop&y"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (750, 450)
@@ -84,7 +84,7 @@ uf.desc[-1].add_paragraph("This will delete all J coupling data in the current d
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To delete all J coupling data, type:")
 uf.desc[-1].add_prompt("relax> j_coupling.delete()")
-uf.backend = j_coupling.delete
+uf.backend = 'pipe_control.j_coupling.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_size = (750, 450)
@@ -103,7 +103,7 @@ uf.desc[-1].add_paragraph("This will display all of the J coupling data in the c
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To display all J coupling data, type:")
 uf.desc[-1].add_prompt("relax> j_coupling.display()")
-uf.backend = j_coupling.display
+uf.backend = 'pipe_control.j_coupling.display'
 uf.menu_text = "di&splay"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_size = (750, 450)
@@ -185,7 +185,7 @@ uf.desc[-1].add_prompt("relax> j_coupling.read('J.txt', sep=',')")
 uf.desc[-1].add_paragraph("If the individual spin J coupling errors are located in the file 'j_err.txt' in column number 5 then, to read these values into relax, type one of:")
 uf.desc[-1].add_prompt("relax> j_coupling.read('j_err.txt', error_col=5)")
 uf.desc[-1].add_prompt("relax> j_coupling.read(file='j_err.txt', error_col=5)")
-uf.backend = j_coupling.read
+uf.backend = 'pipe_control.j_coupling.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 300
@@ -220,7 +220,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will write the J coupling values to file.  If no directory name is given, the file will be placed in the current working directory.")
-uf.backend = j_coupling.write
+uf.backend = 'pipe_control.j_coupling.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (800, 500)
@@ -24,7 +24,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import minimise
 from user_functions.data import Uf_info, Uf_tables; uf_info = Uf_info(); uf_tables = Uf_tables()
 from user_functions.objects import Desc_container
 
@@ -36,6 +35,42 @@ uf_class.menu_text = "&minimise"
 uf_class.gui_icon = "relax.rosenbrock"
 
 
+# The minimise.cache user function.
+uf = uf_info.add_uf('minimise.cache')
+uf.title = "Activate or deactivate the persistent cache of optimisation results."
+uf.title_short = "Optimisation results cache."
+uf.add_keyarg(
+    name = "dir",
+    arg_type = "dir",
+    desc_short = "cache directory",
+    desc = "The directory in which the optimisation results are stored.  Setting this to None deactivates the cache.",
+    can_be_none = True
+)
+uf.add_keyarg(
+    name = "warm_start",
+    default = False,
+    basic_types = ["bool"],
+    desc_short = "warm start flag",
+    desc = "A flag which if True allows the cached results of structurally identical optimisation problems to be used as the starting position, if the target function value is lower than that of the original starting position."
+)
+# Description.
+uf.desc.append(Desc_container())
+uf.desc[-1].add_paragraph("This opt-in cache allows the results of grid searches and optimisations to be reused when scripts or auto-analyses are re-run.  Each optimisation problem is identified by a fingerprint of all its inputs - the target function together with the packed data and model, the starting parameter values, the constraints and all optimisation settings.  The optimised parameter values and statistics are stored in the cache directory and, if the identical problem is encountered again, these results are returned without repeating the optimisation.  Any change in the data, model, starting position or settings will result in the problem being optimised again.")
+uf.desc[-1].add_paragraph("With the warm start flag, problems which only differ in their floating point inputs, for example after a small change in the data, can be started from the cached results of the structurally identical problem.  As this can change the local minimum found, it is turned off by default.")
+uf.desc[-1].add_paragraph("The cache directory can be shared between relax sessions and parallel processes.  It can be safely deleted at any time.")
+# Prompt examples.
+uf.desc.append(Desc_container("Prompt examples"))
+uf.desc[-1].add_paragraph("To cache the optimisation results in the directory 'opt_cache', type:")
+uf.desc[-1].add_prompt("relax> minimise.cache('opt_cache')")
+uf.desc[-1].add_paragraph("To deactivate the cache, type:")
+uf.desc[-1].add_prompt("relax> minimise.cache(None)")
+uf.backend = 'pipe_control.minimise.cache'
+uf.menu_text = "cac&he"
+uf.gui_icon = "oxygen.actions.document-save"
+uf.wizard_size = (900, 600)
+uf.wizard_image = WIZARD_IMAGE_PATH + 'minimise.png'
+
+
 # The minimise.calculate user function.
 uf = uf_info.add_uf('minimise.calculate')
 uf.title = "Calculate the model parameters or the current target function value."
@@ -53,7 +88,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The operation of this user function is two-fold and depends on whether the solution for the models of the current analysis are found by direct calculation or by optimisation.  The dual operations are:")
 uf.desc[-1].add_item_list_element("Direct calculation models", "For these models, the parameters will be directly calculated from the base data.  This will be the exact solution and the user function will store the parameter values.  The grid search and optimisation user functions are not implemented for this analysis type.")
 uf.desc[-1].add_item_list_element("Optimised models", "This will call the target function normally used for optimisation for each model using the current parameter values.  This can be used to manually find the chi-squared value for different parameter values.  The parameter values will not be affected.")
-uf.backend = minimise.calc
+uf.backend = 'pipe_control.minimise.calc'
 uf.menu_text = "&calculate"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_size = (900, 500)
@@ -312,7 +347,7 @@ uf.desc[-1].add_prompt("relax> minimise.execute('newton', constraints=True, max_
 uf.desc[-1].add_prompt("relax> minimise.execute('newton', verbosity=1)")
 uf.desc[-1].add_paragraph("To use constrained Simplex minimisation with a maximum of 5000 iterations, type:")
 uf.desc[-1].add_prompt("relax> minimise.execute('simplex', constraints=True, max_iter=5000)")
-uf.backend = minimise.minimise
+uf.backend = 'pipe_control.minimise.minimise'
 uf.menu_text = "&execute"
 uf.gui_icon = "relax.rosenbrock"
 uf.wizard_height_desc = 300
@@ -380,7 +415,7 @@ uf.desc[-1].add_paragraph("The optimisation of a mathematical model normally con
 uf.desc[-1].add_paragraph("The region of the parameter space that the grid search covers is defined by the lower and upper grid bounds.  These will generally default to the entire parameter space except for when the parameter is non-bounded, for example a 3D position in the PDB space.  This user function will print out the grid bounds used and, if the default bounds are deemed to be insufficient, then the lower, upper or both bounds can supplied.  This only works if all active models have the same parameters.  The coarseness or fineness of the grid is defined by the number of increments to search across between the bounds.  For an alternative to using large numbers of increments, see the zooming grid search.")
 uf.desc[-1].add_paragraph("It is possible to decrease the dimensionality of the grid search, and hence drop the computational cost by orders of magnitude, if certain parameter values are know a priori.  For example if the values are determined via a different experiment.  Such parameters can be set with the value setting user function.  Then, when the skip preset flag is set, these parameters will be skipped in the grid search.  This feature should not be abused and statistical bias should be avoided at all cost.")
 uf.desc[-1].add_paragraph("The parameter skipping logic is as follows.  Firstly setting the increments argument to a list with None elements causes the corresponding parameters to be skipped in the grid search, or an error to be raised if no preset parameter is present.  This overrides all other settings.  Secondly the preset skipping flag only allows parameters to be skipped if the zooming grid search is non-active and a value is preset.")
-uf.backend = minimise.grid_search
+uf.backend = 'pipe_control.minimise.grid_search'
 uf.menu_text = "&grid_search"
 uf.gui_icon = "relax.grid_search"
 uf.wizard_height_desc = 370
@@ -405,7 +440,7 @@ uf.desc[-1].add_paragraph("The optimisation of a mathematical model normally con
 uf.desc[-1].add_paragraph("The zooming grid search can be activated via this user function.  After setting the desired zoom level, the original grid search user function should be called again.  The zoom level is used to decrease the total area of the grid search.  The grid width for each dimension of the parameter space will be divided by 2**zoom_level.  So a level of 1 will halve all dimensions, a level of 2 will quarter the widths, a level of 3 will be an eighth of the widths, etc.")
 uf.desc[-1].add_paragraph("The zooming algorithm proceeds as follows.  The new zoomed grid will be centred at the current parameter values.  However if the new grid is outside of the bounds of the original grid, the entire grid will be translated so that it lies entirely within the original bounds.  This is to avoid grid points lying within undefined regions of the space.  An exception is when the zoom factor is negative, hence the new grid will be larger than the original.")
 uf.desc[-1].add_paragraph("An example of using the zooming grid search is to first perform a standard initial grid search, then set the zoom level to 1 and perform a second grid search.  Continue for zoom levels 2, 3, etc. until the desired fineness is obtained.  Note that convergence is not guaranteed - as the zoom level is increased to infinity, the parameter values do not necessarily converge to the local minimum.  Therefore performing standard optimisation is recommended after completing a zooming grid search. ")
-uf.backend = minimise.grid_zoom
+uf.backend = 'pipe_control.minimise.grid_zoom'
 uf.menu_text = "&grid_zoom"
 uf.gui_icon = "oxygen.actions.zoom-in"
 uf.wizard_height_desc = 500
@@ -24,7 +24,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import model_selection, pipes
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -114,7 +114,7 @@ uf.desc[-1].add_prompt("relax> model_selection('AIC', 'mixed')")
 uf.desc[-1].add_prompt("relax> model_selection(method='AIC', modsel_pipe='mixed')")
 uf.desc[-1].add_prompt("relax> model_selection('AIC', 'mixed', ['m1', 'm2', 'm3', 'm4', 'm5'])")
 uf.desc[-1].add_prompt("relax> model_selection(method='AIC', modsel_pipe='mixed', pipes=['m1', 'm2', 'm3', 'm4', 'm5'])")
-uf.backend = model_selection.select
+uf.backend = 'pipe_control.model_selection.select'
 uf.menu_text = "m&odel_selection"
 uf.gui_icon = "relax.discrepancy_curve"
 uf.wizard_height_desc = 450
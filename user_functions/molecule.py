@@ -25,7 +25,7 @@
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
 from pipe_control import pipes
-from pipe_control.mol_res_spin import ALLOWED_MOL_TYPES, copy_molecule, create_molecule, delete_molecule, display_molecule, get_molecule_ids, id_string_doc, name_molecule, type_molecule
+from pipe_control.mol_res_spin import ALLOWED_MOL_TYPES, get_molecule_ids, id_string_doc
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -90,7 +90,7 @@ uf.desc[-1].add_prompt("relax> molecule.copy(mol_from='#GST', mol_to='#wt-GST')"
 uf.desc[-1].add_paragraph("To copy the molecule data of the molecule 'Ap4Aase' from the data pipe 'm1' to 'm2', assuming the current data pipe is 'm1', type:")
 uf.desc[-1].add_prompt("relax> molecule.copy(mol_from='#ApAase', pipe_to='m2')")
 uf.desc[-1].add_prompt("relax> molecule.copy(pipe_from='m1', mol_from='#ApAase', pipe_to='m2', mol_to='#ApAase')")
-uf.backend = copy_molecule
+uf.backend = 'pipe_control.mol_res_spin.copy_molecule'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_height_desc = 600
@@ -132,7 +132,7 @@ uf.desc[-1].add_paragraph("To create the molecules 'Ap4Aase', 'ATP', and 'MgF4',
 uf.desc[-1].add_prompt("relax> molecule.create('Ap4Aase')")
 uf.desc[-1].add_prompt("relax> molecule.create('ATP')")
 uf.desc[-1].add_prompt("relax> molecule.create('MgF4')")
-uf.backend = create_molecule
+uf.backend = 'pipe_control.mol_res_spin.create_molecule'
 uf.menu_text = "c&reate"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_size = (700, 500)
@@ -156,7 +156,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This can be used to delete a single or sets of molecules from the relax data store.  The molecule will be deleted from the current data pipe.")
 uf.desc.append(id_string_doc)
-uf.backend = delete_molecule
+uf.backend = 'pipe_control.mol_res_spin.delete_molecule'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_height_desc = 550
@@ -180,7 +180,7 @@ uf.add_keyarg(
     can_be_none = True
 )
 uf.desc.append(id_string_doc)
-uf.backend = display_molecule
+uf.backend = 'pipe_control.mol_res_spin.display_molecule'
 uf.menu_text = "dis&play"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_height_desc = 400
@@ -225,7 +225,7 @@ uf.desc[-1].add_prompt("relax> molecule.name('#Ap4Aase', 'Inhib Ap4Aase', True)"
 uf.desc[-1].add_prompt("relax> molecule.name(mol_id='#Ap4Aase', name='Inhib Ap4Aase', force=True)")
 uf.desc[-1].add_paragraph("This assumes the molecule 'Ap4Aase' already exists.")
 uf.desc.append(id_string_doc)
-uf.backend = name_molecule
+uf.backend = 'pipe_control.mol_res_spin.name_molecule'
 uf.menu_text = "&name"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 550
@@ -275,7 +275,7 @@ uf.desc[-1].add_paragraph("To set the molecule 'Ap4Aase' to the 'protein' type,
 uf.desc[-1].add_prompt("relax> molecule.type('#Ap4Aase', 'protein', True)")
 uf.desc[-1].add_prompt("relax> molecule.type(mol_id='#Ap4Aase', type='protein', force=True)")
 uf.desc.append(id_string_doc)
-uf.backend = type_molecule
+uf.backend = 'pipe_control.mol_res_spin.type_molecule'
 uf.menu_text = "&type"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 600
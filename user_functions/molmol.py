@@ -29,7 +29,6 @@ from os import sep
 # relax module imports.
 import colour
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import molmol
 from specific_analyses.model_free.uf import classic_style_doc
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
@@ -51,7 +50,7 @@ uf.title_short = "Clear Molmol history."""
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will clear the Molmol history from memory.")
-uf.backend = molmol.molmol_obj.clear_history
+uf.backend = 'pipe_control.molmol.molmol_obj.clear_history'
 uf.menu_text = "clear_&history"
 uf.wizard_size = (600, 300)
 uf.wizard_apply_button = False
@@ -75,7 +74,7 @@ uf.desc[-1].add_paragraph("This allows Molmol commands to be passed to the progr
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To reinitialise the Molmol instance, type:")
 uf.desc[-1].add_prompt("relax> molmol.command(\"InitAll yes\")")
-uf.backend = molmol.command
+uf.backend = 'pipe_control.molmol.command'
 uf.menu_text = "&command"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_size = (700, 400)
@@ -158,7 +157,7 @@ uf.desc[-1].add_paragraph("To map the order parameter values, S2, onto the struc
 uf.desc[-1].add_prompt("relax> molmol.macro_apply('s2')")
 uf.desc[-1].add_prompt("relax> molmol.macro_apply(data_type='s2')")
 uf.desc[-1].add_prompt("relax> molmol.macro_apply(data_type='s2', style=\"classic\")")
-uf.backend = molmol.macro_apply
+uf.backend = 'pipe_control.molmol.macro_apply'
 uf.menu_text = "&macro_apply"
 uf.gui_icon = "relax.molmol"
 uf.wizard_size = (1000, 750)
@@ -194,7 +193,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To execute the macro file 's2.mac' located in the directory 'molmol', type:")
 uf.desc[-1].add_prompt("relax> molmol.macro_run(file='s2.mac')")
 uf.desc[-1].add_prompt("relax> molmol.macro_run(file='s2.mac', dir='molmol')")
-uf.backend = molmol.macro_run
+uf.backend = 'pipe_control.molmol.macro_run'
 uf.menu_text = "macro_&run"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (700, 400)
@@ -299,7 +298,7 @@ uf.desc[-1].add_paragraph("To create a Molmol macro mapping the order parameter
 uf.desc[-1].add_prompt("relax> molmol.macro_write('s2')")
 uf.desc[-1].add_prompt("relax> molmol.macro_write(data_type='s2')")
 uf.desc[-1].add_prompt("relax> molmol.macro_write(data_type='s2', style=\"classic\", file='s2.mac', dir='molmol')")
-uf.backend = molmol.macro_write
+uf.backend = 'pipe_control.molmol.macro_write'
 uf.menu_text = "macro_&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (1000, 750)
@@ -322,7 +321,7 @@ uf.desc[-1].add_list_element("XMacStand ribbon.mac")
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To apply the ribbon style to the PDB file loaded, type:")
 uf.desc[-1].add_prompt("relax> molmol.ribbon()")
-uf.backend = molmol.ribbon
+uf.backend = 'pipe_control.molmol.ribbon'
 uf.menu_text = "ri&bbon"
 uf.wizard_size = (700, 500)
 uf.wizard_height_desc = 450
@@ -366,7 +365,7 @@ uf.desc[-1].add_paragraph("The appearance is finally touched up:")
 uf.desc[-1].add_list_element("RadiusAtom 1")
 uf.desc[-1].add_list_element("SelectAtom ':TNS@C*'")
 uf.desc[-1].add_list_element("RadiusAtom 1.5")
-uf.backend = molmol.tensor_pdb
+uf.backend = 'pipe_control.molmol.tensor_pdb'
 uf.menu_text = "&tensor_pdb"
 uf.wizard_height_desc = 550
 uf.wizard_size = (1000, 750)
@@ -384,7 +383,7 @@ uf.desc[-1].add_paragraph("This will simply launch Molmol.")
 # Prompt examples.
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_prompt("relax> molmol.view()")
-uf.backend = molmol.view
+uf.backend = 'pipe_control.molmol.view'
 uf.menu_text = "&view"
 uf.wizard_size = (600, 300)
 uf.wizard_apply_button = False
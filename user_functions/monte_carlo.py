@@ -26,7 +26,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import error_analysis
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -101,14 +100,31 @@ uf.add_keyarg(
     desc = "The fixed value to use when distribution is set to 'fixed'.",
     can_be_none = True
 )
+uf.add_keyarg(
+    name = "seed",
+    basic_types = ["int"],
+    default = None,
+    desc_short = "random number seed",
+    desc = "The random number seed for creating reproducible simulation data.",
+    can_be_none = True
+)
+uf.add_keyarg(
+    name = "streaming",
+    default = False,
+    basic_types = ["bool"],
+    desc_short = "streaming flag",
+    desc = "A flag which if True will cause the simulation data to be created on demand during optimisation and the simulation parameters to be accumulated, rather than stored."
+)
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The method can either be set to back calculation (Monte Carlo) or direct (bootstrapping), the choice of which determines the simulation type.  If the values or parameters are calculated rather than minimised, this option will have no effect.  Errors should only be propagated via Monte Carlo simulations if errors have been measured. ")
 uf.desc[-1].add_paragraph("For error analysis, the method should be set to back calculation which will result in proper Monte Carlo simulations.  The data used for each simulation is back calculated from the minimised model parameters and is randomised using Gaussian noise where the standard deviation is from the original error set.  When the method is set to back calculation, this function should only be called after the model is fully minimised.")
 uf.desc[-1].add_paragraph("The simulation type can be changed by setting the method to direct.  This will result in bootstrapping simulations which cannot be used in error analysis (and which are no longer Monte Carlo simulations).  However, these simulations are required for certain model selection techniques (see the documentation for the model selection user function for details), and can be used for other purposes.  Rather than the data being back calculated from the fitted model parameters, the data is generated by taking the original data and randomising using Gaussian noise with the standard deviations set to the original error set.")
 uf.desc[-1].add_paragraph("The errors generated per simulation can either be generated indidual per datapoint and drawn from a gauss distrubtion described by the standard deviation of the indidual point, or it can be generated from a overall gauss distribution described by the standard deviation of the goodness of fit, where SD_fit = sqrt(chi2/(N-p)).  The last possibility is to supply a fixed value of the standard deviation, from which gauss distribution to draw errors from.")
+uf.desc[-1].add_paragraph("If the random number seed is supplied, each simulation of each data set is randomised using its own random number generator seeded from the seed, the data set and the simulation number.  The simulation data are then fully reproducible, independent of the number of simulations and of the order in which the data sets are created.")
+uf.desc[-1].add_paragraph("For large numbers of simulations, the streaming flag can be set so that the memory use is independent of the number of simulations.  No simulation data is then stored.  Instead the data of each simulation is created when that simulation is optimised, and the optimised parameter values are accumulated into running means and variances for the error analysis rather than being stored.  If no random number seed is supplied, one is drawn so that the data of each simulation is reproducible.  The parameter values of the individual simulations are therefore not available, and the simulations cannot be grid searched, eliminated, or deselected.  This is currently only supported for the model-free analysis of single spins, in which case the simulations are optimised from the parameter values of the original model.")
 uf.desc.append(monte_carlo_desc)
-uf.backend = error_analysis.monte_carlo_create_data
+uf.backend = 'pipe_control.error_analysis.monte_carlo_create_data'
 uf.menu_text = "&create_data"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_height_desc = 500
@@ -121,11 +137,19 @@ uf.wizard_image = WIZARD_IMAGE_PATH + 'monte_carlo.png'
 uf = uf_info.add_uf('monte_carlo.error_analysis')
 uf.title = "Calculate parameter errors from the Monte Carlo simulations."
 uf.title_short = "Error calculation."
+uf.add_keyarg(
+    name = "summary_only",
+    default = False,
+    basic_types = ["bool"],
+    desc_short = "summary only flag",
+    desc = "A flag which if True will cause all simulation data and parameters to be deleted once the errors have been calculated."
+)
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("Parameter errors are calculated as the standard deviation of the distribution of parameter values.  This function should never be used if parameter values are obtained by minimisation and the simulation data are generated using the method 'direct'.  The reason is because only true Monte Carlo simulations can give the true parameter errors.")
+uf.desc[-1].add_paragraph("The standard deviations are accumulated in a single pass over the stored simulation parameters, or taken from the running accumulators of the streaming mode of the monte_carlo.create_data user function.  To free the memory held by the simulations once the errors are known and to reduce the size of the results files, the summary only flag can be set.  The simulation data and parameters, including those of the diffusion and alignment tensors, will then be deleted and the Monte Carlo simulation set up removed, keeping only the parameter errors.")
 uf.desc.append(monte_carlo_desc)
-uf.backend = error_analysis.monte_carlo_error_analysis
+uf.backend = 'pipe_control.error_analysis.monte_carlo_error_analysis'
 uf.menu_text = "&error_analysis"
 uf.gui_icon = "oxygen.actions.roll-relax-blue"
 uf.wizard_height_desc = 620
@@ -143,7 +167,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This only effects where minimisation occurs and can therefore be skipped if the values or parameters are calculated rather than minimised.  However, if accidentally run in this case, the results will be unaffected.  It should only be called after the model or run is fully minimised.  Once called, the user functions minimise.grid_search and minimise.execute will only effect the simulations and not the model parameters.")
 uf.desc[-1].add_paragraph("The initial values of the parameters for each simulation is set to the minimised parameters of the model.  A grid search can be undertaken for each simulation instead, although this is computationally expensive and unnecessary.  The minimisation function should be executed for a second time after running this function.")
 uf.desc.append(monte_carlo_desc)
-uf.backend = error_analysis.monte_carlo_initial_values
+uf.backend = 'pipe_control.error_analysis.monte_carlo_initial_values'
 uf.menu_text = "&initial_values"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_height_desc = 620
@@ -160,7 +184,7 @@ uf.title_short = "Simulations off."""
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will turn off the Monte Carlo simulations so that subsequent optimisation will operate directly on the model parameters and not on the simulations.")
 uf.desc.append(monte_carlo_desc)
-uf.backend = error_analysis.monte_carlo_off
+uf.backend = 'pipe_control.error_analysis.monte_carlo_off'
 uf.menu_text = "o&ff"
 uf.gui_icon = "oxygen.actions.dialog-cancel"
 uf.wizard_height_desc = 620
@@ -177,7 +201,7 @@ uf.title_short = "Simulations on."""
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will turn on the Monte Carlo simulations so that subsequent optimisation will operate on the simulations rather than on the real model parameters.")
 uf.desc.append(monte_carlo_desc)
-uf.backend = error_analysis.monte_carlo_on
+uf.backend = 'pipe_control.error_analysis.monte_carlo_on'
 uf.menu_text = "o&n"
 uf.gui_icon = "oxygen.actions.dialog-ok"
 uf.wizard_height_desc = 620
@@ -203,7 +227,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This must be called prior to any of the other Monte Carlo functions.  The effect is that the number of simulations will be set and that simulations will be turned on.")
 uf.desc.append(monte_carlo_desc)
-uf.backend = error_analysis.monte_carlo_setup
+uf.backend = 'pipe_control.error_analysis.monte_carlo_setup'
 uf.menu_text = "&setup"
 uf.gui_icon = "oxygen.actions.document-edit"
 uf.wizard_height_desc = 570
@@ -24,8 +24,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from specific_analyses.n_state_model import uf as n_state_model_uf
-from specific_analyses.n_state_model.parameters import elim_no_prob, number_of_states, ref_domain, select_model
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 from user_functions.wildcards import WILDCARD_STRUCT_PDB_ALL
@@ -75,7 +73,7 @@ uf.desc[-1].add_paragraph("To perform an analysis where the pivot is at the orig
 uf.desc[-1].add_prompt("relax> n_state_model.CoM(centre=[0, 0, 1])")
 uf.desc[-1].add_prompt("relax> n_state_model.CoM(centre=[0.0, 0.0, 1.0])")
 uf.desc[-1].add_prompt("relax> n_state_model.CoM(pivot_point=[0.0, 0.0, 0.0], centre=[0.0, 0.0, 1.0])")
-uf.backend = n_state_model_uf.CoM
+uf.backend = 'specific_analyses.n_state_model.uf.CoM'
 uf.menu_text = "Co&M"
 uf.wizard_height_desc = 350
 uf.wizard_size = (800, 600)
@@ -141,7 +139,7 @@ uf.desc[-1].add_list_element("'diff on cone'")
 uf.desc[-1].add_paragraph("The model can be selected by setting the cone type to one of these values.  The cone is represented as an isotropic cone with its axis parallel to the average pivot-CoM vector, the vertex placed at the pivot point of the domain motions, and the length of the edge of the cone equal to the pivot-CoM distance multiplied by the scaling factor.  The resultant PDB file can subsequently read into any molecular viewer.")
 uf.desc[-1].add_paragraph("There are four different types of residue within the PDB.  The pivot point is represented as as a single carbon atom of the residue 'PIV'.  The cone consists of numerous H atoms of the residue 'CON'.  The average pivot-CoM vector is presented as the residue 'AVE' with one carbon atom positioned at the pivot and the other at the head of the vector (after scaling by the scaling factor).  Finally, if Monte Carlo have been performed, there will be multiple 'MCC' residues representing the cone for each simulation, and multiple 'MCA' residues representing the varying average pivot-CoM vector for each simulation.")
 uf.desc[-1].add_paragraph("To create the diffusion in a cone PDB representation, a uniform distribution of vectors on a sphere is generated using spherical coordinates with the polar angle defined from the average pivot-CoM vector.  By incrementing the polar angle using an arccos distribution, a radial array of vectors representing latitude are created while incrementing the azimuthal angle evenly creates the longitudinal vectors.  These are all placed into the PDB file as H atoms and are all connected using PDB CONECT records.  Each H atom is connected to its two neighbours on the both the longitude and latitude.  This creates a geometric PDB object with longitudinal and latitudinal lines representing the filled cone.")
-uf.backend = n_state_model_uf.cone_pdb
+uf.backend = 'specific_analyses.n_state_model.uf.cone_pdb'
 uf.menu_text = "&cone_pdb"
 uf.wizard_height_desc = 480
 uf.wizard_size = (1000, 750)
@@ -160,7 +158,7 @@ uf.desc[-1].add_paragraph("This will simply remove the structures from the N-sta
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("Simply type:")
 uf.desc[-1].add_prompt("relax> n_state_model.elim_no_prob(N=8)")
-uf.backend = elim_no_prob
+uf.backend = 'specific_analyses.n_state_model.parameters.elim_no_prob'
 uf.menu_text = "&elim_no_prob"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_size = (700, 400)
@@ -186,7 +184,7 @@ uf.desc[-1].add_paragraph("Prior to optimisation, the number of states in the N-
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To set up an 8-state model, type:")
 uf.desc[-1].add_prompt("relax> n_state_model.number_of_states(N=8)")
-uf.backend = number_of_states
+uf.backend = 'specific_analyses.n_state_model.parameters.number_of_states'
 uf.menu_text = "&number_of_states"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_apply_button = False
@@ -210,7 +208,7 @@ uf.desc[-1].add_paragraph("Prior to optimisation of the '2-domain' N-state model
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To set up a 5-state model with 'C' domain being the frame of reference, type:")
 uf.desc[-1].add_prompt("relax> n_state_model.ref_domain(ref='C')")
-uf.backend = ref_domain
+uf.backend = 'specific_analyses.n_state_model.parameters.ref_domain'
 uf.menu_text = "&ref_domain"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'n_state_model.png'
@@ -240,7 +238,7 @@ uf.desc[-1].add_item_list_element("'2-domain'", "The N-state model for a system
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To analyse populations of states, type:")
 uf.desc[-1].add_prompt("relax> n_state_model.select_model(model='populations')")
-uf.backend = select_model
+uf.backend = 'specific_analyses.n_state_model.parameters.select_model'
 uf.menu_text = "&select_model"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_height_desc = 400
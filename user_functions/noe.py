@@ -25,8 +25,7 @@
 
 # relax module imports.
 from graphics import ANALYSIS_IMAGE_PATH
-from pipe_control import noesy, spectrum
-from specific_analyses.noe.uf import spectrum_type
+from pipe_control import spectrum
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -106,7 +105,7 @@ uf.desc[-1].add_prompt("relax> noe.read_restraints('NOE.xpl')")
 uf.desc[-1].add_prompt("relax> noe.read_restraints(file='NOE.xpl')")
 uf.desc[-1].add_paragraph("To read the generic formatted file 'noes', type one of:")
 uf.desc[-1].add_prompt("relax> noe.read_restraints(file='NOE.xpl', proton1_col=0, proton2_col=1, lower_col=2, upper_col=3)")
-uf.backend = noesy.read_restraints
+uf.backend = 'pipe_control.noesy.read_restraints'
 uf.menu_text = "&read_restraints"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (800, 600)
@@ -142,7 +141,7 @@ uf.desc[-1].add_paragraph("The spectrum type can be one of the following:")
 uf.desc[-1].add_list_element("The steady-state NOE reference spectrum.")
 uf.desc[-1].add_list_element("The steady-state NOE spectrum with proton saturation turned on.")
 uf.desc[-1].add_paragraph("Peak intensities should be loaded before this user function via the spectrum.read_intensities user function.  The intensity values will then be associated with a spectrum ID string which can be used here.")
-uf.backend = spectrum_type
+uf.backend = 'specific_analyses.noe.uf.spectrum_type'
 uf.menu_text = "&spectrum_type"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 350
@@ -23,12 +23,7 @@
 """The module of all the objects used to hold the user function details."""
 
 # Python module imports.
-import dep_check
-if dep_check.wx_module:
-    from wx import DD_DEFAULT_STYLE, FileSelectorDefaultWildcardStr
-else:
-    DD_DEFAULT_STYLE = -1
-    FileSelectorDefaultWildcardStr = -1
+from importlib import import_module
 
 # relax module imports.
 from graphics import IMAGE_PATH
@@ -301,8 +296,8 @@ class Uf_container(object):
     @type title_short:          str or None
     @ivar kargs:                The list of keyword argument details.
     @type kargs:                list of dict
-    @ivar backend:              The user function back end.  This should be a string version with full module path of the function which executes the back end.  For example 'pipe_control.pipes.create'.  Note, this should be importable as __import__(backend)!
-    @type backend:              executable object
+    @ivar backend:              The user function back end.  This should be a string version with full module path of the function which executes the back end.  For example 'pipe_control.pipes.create'.  The module is only imported when the user function is first executed, via the get_backend() method.  A function object is also accepted.
+    @type backend:              str or executable object
     @ivar display:              A flag specifying if the user function displays output to STDOUT.  This is used for certain UIs to display that output.
     @type display:              str
     @ivar desc:                 The multi-paragraph description defined via the Desc_container class.
@@ -391,7 +386,7 @@ class Uf_container(object):
         self.__dict__[name] = value
 
 
-    def add_keyarg(self, name=None, default=None, basic_types=[], container_types=[], dim=(), arg_type=None, min=0, max=1000, desc_short=None, desc=None, list_titles=None, wiz_element_type='default', wiz_combo_choices=None, wiz_combo_data=None, wiz_combo_iter=None, wiz_combo_list_min=None, wiz_filesel_wildcard=FileSelectorDefaultWildcardStr, wiz_dirsel_style=DD_DEFAULT_STYLE, wiz_read_only=None, wiz_filesel_preview=True, can_be_none=False, can_be_empty=False, none_elements=False):
+    def add_keyarg(self, name=None, default=None, basic_types=[], container_types=[], dim=(), arg_type=None, min=0, max=1000, desc_short=None, desc=None, list_titles=None, wiz_element_type='default', wiz_combo_choices=None, wiz_combo_data=None, wiz_combo_iter=None, wiz_combo_list_min=None, wiz_filesel_wildcard=None, wiz_dirsel_style=None, wiz_read_only=None, wiz_filesel_preview=True, can_be_none=False, can_be_empty=False, none_elements=False):
         """Wrapper method for adding keyword argument information to the container.
 
         Types
@@ -527,14 +522,14 @@ class Uf_container(object):
         @type wiz_combo_choices:        list of str
         @keyword wiz_combo_data:        The data returned by a call to GetValue().  This is only used if the element_type is set to 'combo'.  If supplied, it should be the same length at the combo_choices list.  If not supplied, the combo_choices list will be used for the returned data.
         @type wiz_combo_data:           list
-        @keyword wiz_combo_iter:        An iterator method for regenerating the ComboBox choices.
-        @type wiz_combo_iter:           iterator or None
+        @keyword wiz_combo_iter:        An iterator method for regenerating the ComboBox choices.  This can be given as the full module path of the method, in which case the module will only be imported when the choices are regenerated (see import_backend()).
+        @type wiz_combo_iter:           iterator, str, or None
         @keyword wiz_combo_list_min:    The minimum length of the Combo_list element.
         @type wiz_combo_list_min:       int or None
-        @keyword wiz_filesel_wildcard:  The file selection dialog wildcard string.  For example for opening PDB files, this could be "PDB files (*.pdb)|*.pdb;*.PDB".
+        @keyword wiz_filesel_wildcard:  The file selection dialog wildcard string.  For example for opening PDB files, this could be "PDB files (*.pdb)|*.pdb;*.PDB".  If None, the wx default wildcard will be used.
         @type wiz_filesel_wildcard:     str or None
-        @keyword wiz_dirsel_style:      The directory selection dialog style.
-        @type wiz_dirsel_style:         int
+        @keyword wiz_dirsel_style:      The directory selection dialog style.  If None, the wx default style will be used.
+        @type wiz_dirsel_style:         int or None
         @keyword wiz_read_only:         A flag which if True means that the text of the GUI wizard page element cannot be edited.  If the default of None is given, then each UI element will decide for itself what to do.
         @type wiz_read_only:            bool or None
         @keyword wiz_filesel_preview:   A flag which if True will enable the preview button in the file selection GUI wizard page element.
@@ -633,3 +628,41 @@ class Uf_container(object):
         arg['can_be_none'] = can_be_none
         arg['can_be_empty'] = can_be_empty
         arg['none_elements'] = none_elements
+
+
+    def get_backend(self):
+        """Return the user function back end, importing its module if needed.
+
+        @return:    The back end function.
+        @rtype:     executable object
+        """
+
+        # Import the back end.
+        return import_backend(self.backend)
+
+
+
+def import_backend(backend):
+    """Return the user function back end, importing its module if the back end is given as a string.
+
+    @param backend: The back end, either as the full module path of the function, for example 'pipe_control.pipes.create' or 'pipe_control.molmol.molmol_obj.clear_history' for the method of a module level object, or the function itself.
+    @type backend:  str or executable object
+    @return:        The back end function.
+    @rtype:         executable object
+    """
+
+    # Already a function.
+    if not isinstance(backend, str):
+        return backend
+
+    # Walk along the path, importing the packages and modules and then fetching the objects.
+    names = backend.split('.')
+    obj = import_module(names[0])
+    for i in range(1, len(names)):
+        if hasattr(obj, names[i]):
+            obj = getattr(obj, names[i])
+        else:
+            obj = import_module('.'.join(names[:i+1]))
+
+    # Return the function.
+    return obj
@@ -25,7 +25,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import palmer
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -145,7 +144,7 @@ uf.desc[-1].add_paragraph("The file 'dir/run.sh' contains the single command,")
 uf.desc[-1].add_item_list_element(None, "'modelfree4 -i mfin -d mfdata -p mfpar -m mfmodel -o mfout -e out',")
 uf.desc[-1].add_paragraph("which can be used to execute modelfree4.")
 uf.desc[-1].add_paragraph("If you would like to use a different Modelfree executable file, change the binary name to the appropriate file name.  If the file is not located within the environment's path, include the full path in front of the binary file name.")
-uf.backend = palmer.create
+uf.backend = 'pipe_control.palmer.create'
 uf.menu_text = "&create"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_height_desc = 230
@@ -188,7 +187,7 @@ uf.desc[-1].add_paragraph("Modelfree 4 will be executed as")
 uf.desc[-1].add_prompt("$ modelfree4 -i mfin -d mfdata -p mfpar -m mfmodel -o mfout -e out")
 uf.desc[-1].add_paragraph("If a PDB file is loaded and non-isotropic diffusion is selected, then the file name will be placed on the command line as '-s pdb_file_name'.")
 uf.desc[-1].add_paragraph("If you would like to use a different Modelfree executable file, change the binary name to the appropriate file name.  If the file is not located within the environment's path, include the full path in front of the binary file name.")
-uf.backend = palmer.execute
+uf.backend = 'pipe_control.palmer.execute'
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.menu_text = "&execute"
 uf.wizard_size = (800, 600)
@@ -210,7 +209,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The model-free results will be extracted from the Modelfree4 results file 'mfout' located in the given directory.")
-uf.backend = palmer.extract
+uf.backend = 'pipe_control.palmer.extract'
 uf.menu_text = "ex&tract"
 uf.gui_icon = "oxygen.actions.archive-extract"
 uf.wizard_apply_button = False
@@ -24,7 +24,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import paramag, pipes
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -111,7 +111,7 @@ uf.desc[-1].add_prompt("relax> paramag.centre([0.136, 12.543, 4.356])")
 uf.desc[-1].add_prompt("relax> paramag.centre(pos=[0.136, 12.543, 4.356])")
 uf.desc[-1].add_paragraph("To find an unknown paramagnetic centre, type:")
 uf.desc[-1].add_prompt("relax> paramag.centre(fix=False)")
-uf.backend = paramag.centre
+uf.backend = 'pipe_control.paramag.centre'
 uf.menu_text = "&centre"
 uf.wizard_height_desc = 400
 uf.wizard_size = (1000, 750)
@@ -24,7 +24,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import align_tensor, pcs, pipes
+from pipe_control import align_tensor, pipes
 from pipe_control.mol_res_spin import get_spin_ids
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
@@ -56,7 +56,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will back calculate the pseudo-contact shifts if the paramagnetic centre, temperature and magnetic field strength has been specified, an alignment tensor is present, and atomic positions have been loaded into the relax data store.")
-uf.backend = pcs.back_calc
+uf.backend = 'pipe_control.pcs.back_calc'
 uf.menu_text = "&back_calc"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -90,7 +90,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To calculate the PCS Q factor for only the spins '@H26', '@H27', and '@H28', type one of:")
 uf.desc[-1].add_prompt("relax> pcs.calc_q_factors('@H26 & @H27 & @H28')")
 uf.desc[-1].add_prompt("relax> pcs.calc_q_factors(spin_id='@H26 & @H27 & @H28')")
-uf.backend = pcs.q_factors
+uf.backend = 'pipe_control.pcs.q_factors'
 uf.menu_text = "&calc_q_factors"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -149,7 +149,7 @@ uf.desc[-1].add_prompt("relax> pcs.copy(pipe_from='m1', pipe_to='m9', align_id=N
 uf.desc[-1].add_paragraph("To copy only the 'Th' PCS data from 'm3' to 'm6', type one of:")
 uf.desc[-1].add_prompt("relax> pcs.copy('m3', 'm6', 'Th')")
 uf.desc[-1].add_prompt("relax> pcs.copy(pipe_from='m3', pipe_to='m6', align_id='Th')")
-uf.backend = pcs.copy
+uf.backend = 'pipe_control.pcs.copy'
 uf.menu_text = "cop&y"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -216,7 +216,7 @@ uf.desc[-1].add_prompt("relax> pcs.corr_plot()")
 uf.desc[-1].add_paragraph("To create a plain text list of the measured and back-calculated data, type one of:")
 uf.desc[-1].add_prompt("relax> pcs.corr_plot(None)")
 uf.desc[-1].add_prompt("relax> pcs.corr_plot(format=None)")
-uf.backend = pcs.corr_plot
+uf.backend = 'pipe_control.pcs.corr_plot'
 uf.menu_text = "corr_&plot"
 uf.gui_icon = "relax.grace_icon"
 uf.wizard_size = (800, 500)
@@ -245,7 +245,7 @@ uf.desc[-1].add_paragraph("This will delete all PCS data associated with the ali
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To delete the PCS data corresponding to align_id='PH_gel', type:")
 uf.desc[-1].add_prompt("relax> pcs.delete('PH_gel')")
-uf.backend = pcs.delete
+uf.backend = 'pipe_control.pcs.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -279,7 +279,7 @@ uf.desc[-1].add_paragraph("This will display all of the PCS data associated with
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To display the 'phage' PCS data, type:")
 uf.desc[-1].add_prompt("relax> pcs.display('phage')")
-uf.backend = pcs.display
+uf.backend = 'pipe_control.pcs.display'
 uf.menu_text = "di&splay"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -400,7 +400,7 @@ uf.desc[-1].add_prompt("relax> pcs.read('Tb', 'Tb.txt', sep=',')")
 uf.desc[-1].add_paragraph("To read the 15N and 1H PCSs from the file 'Eu.txt', where the 15N values are in the 4th column and the 1H in the 9th, type both the following:")
 uf.desc[-1].add_prompt("relax> pcs.read('Tb', 'Tb.txt', spin_id='@N', res_num_col=1, data_col=4)")
 uf.desc[-1].add_prompt("relax> pcs.read('Tb', 'Tb.txt', spin_id='@H', res_num_col=1, data_col=9)")
-uf.backend = pcs.read
+uf.backend = 'pipe_control.pcs.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (900, 600)
@@ -439,7 +439,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("If the PCS errors have not already been read from a PCS data file or if they need to be changed, then the errors can be set via this user function.")
-uf.backend = pcs.set_errors
+uf.backend = 'pipe_control.pcs.set_errors'
 uf.menu_text = "&set_errors"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -517,7 +517,7 @@ uf.desc[-1].add_list_element("The PCS for the randomised position will be back c
 uf.desc[-1].add_list_element("The PCS standard deviation will be calculated from the N randomised PCS values.")
 uf.desc[-1].add_paragraph("The standard deviation will both be stored in the spin container data structure in the relax data store as well as being added to the already present PCS error (using variance addition).  This will then be used in any optimisations involving the PCS.")
 uf.desc[-1].add_paragraph("If the alignment ID string is not supplied, the procedure will be applied to the PCS data from all alignments.")
-uf.backend = pcs.structural_noise
+uf.backend = 'pipe_control.pcs.structural_noise'
 uf.menu_text = "&structural_noise"
 uf.wizard_size = (1000, 700)
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -554,7 +554,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This can be used to force the PCS to contribute more or less to the chi-squared optimisation statistic.  The higher the value, the more importance the PCS will have.")
-uf.backend = pcs.weight
+uf.backend = 'pipe_control.pcs.weight'
 uf.menu_text = "wei&ght"
 uf.wizard_size = (700, 500)
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -603,7 +603,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("If no directory name is given, the file will be placed in the current working directory.  The alignment ID is required for selecting which PCS data set will be written to file.")
-uf.backend = pcs.write
+uf.backend = 'pipe_control.pcs.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (800, 600)
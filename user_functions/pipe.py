@@ -72,7 +72,7 @@ uf.desc[-1].add_paragraph("To add the data pipes 'test 1', 'test 2', and 'test 3
 uf.desc[-1].add_prompt("relax> pipe.bundle('first analysis 1', 'test 1')")
 uf.desc[-1].add_prompt("relax> pipe.bundle('first analysis 1', 'test 2')")
 uf.desc[-1].add_prompt("relax> pipe.bundle('first analysis 1', 'test 3')")
-uf.backend = pipes.bundle
+uf.backend = 'pipe_control.pipes.bundle'
 uf.menu_text = "&bundle"
 uf.gui_icon = "relax.pipe_bundle"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'pipe_bundle.png'
@@ -92,7 +92,7 @@ uf.add_keyarg(
     wiz_combo_data = pipes.VALID_TYPES,
     wiz_read_only = True
 )
-uf.backend = pipes.change_type
+uf.backend = 'pipe_control.pipes.change_type'
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The data pipe type must be one of the following:")
@@ -149,7 +149,7 @@ uf.desc[-1].add_prompt("relax> pipe.copy('m1', 'm2')")
 uf.desc[-1].add_prompt("relax> pipe.copy(pipe_from='m1', pipe_to='m2')")
 uf.desc[-1].add_paragraph("If the current data pipe is 'm1', then the following command can be used:")
 uf.desc[-1].add_prompt("relax> pipe.copy(pipe_to='m2')")
-uf.backend = pipes.copy
+uf.backend = 'pipe_control.pipes.copy'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (800, 500)
@@ -186,7 +186,7 @@ uf.add_keyarg(
     wiz_read_only = False,
     can_be_none = True
 )
-uf.backend = pipes.create
+uf.backend = 'pipe_control.pipes.create'
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The data pipe name can be any string however the data pipe type can only be one of the following:")
@@ -219,7 +219,7 @@ uf = uf_info.add_uf('pipe.current')
 uf.title = "Print the name of the current data pipe."
 uf.title_short = "Current data pipe printing."
 uf.display = True
-uf.backend = pipes.current
+uf.backend = 'pipe_control.pipes.current'
 # Prompt examples.
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To run the user function, type:")
@@ -246,7 +246,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will permanently remove the data pipe and all of its contents from the relax data store.  If the pipe name is not given, then all data pipes will be deleted.")
-uf.backend = pipes.delete
+uf.backend = 'pipe_control.pipes.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'pipe.png'
@@ -258,7 +258,7 @@ uf = uf_info.add_uf('pipe.display')
 uf.title = "Print a list of all the data pipes."
 uf.title_short = "Data pipe listing."
 uf.display = True
-uf.backend = pipes.display
+uf.backend = 'pipe_control.pipes.display'
 # Prompt examples.
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To run the user function, type:")
@@ -319,7 +319,7 @@ uf.add_keyarg(
     wiz_element_type = 'combo',
     wiz_combo_iter = pipes.pipe_names
 )
-uf.backend = pipes.switch
+uf.backend = 'pipe_control.pipes.switch'
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will switch between the various data pipes within the relax data store.")
@@ -29,7 +29,6 @@ from os import sep
 # relax module imports.
 import colour
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import pymol_control
 from specific_analyses.model_free.uf import classic_style_doc
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
@@ -58,7 +57,7 @@ uf.desc[-1].add_paragraph("where file is the file name without the '.pdb' extens
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To apply this user function, type:")
 uf.desc[-1].add_prompt("relax> pymol.cartoon()")
-uf.backend = pymol_control.cartoon
+uf.backend = 'pipe_control.pymol_control.cartoon'
 uf.menu_text = "cart&oon"
 uf.wizard_size = (700, 500)
 uf.wizard_height_desc = 450
@@ -73,7 +72,7 @@ uf.title_short = "Clear PyMOL history."""
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will clear the Pymol history from memory.")
-uf.backend = pymol_control.pymol_obj.clear_history
+uf.backend = 'pipe_control.pymol_control.pymol_obj.clear_history'
 uf.menu_text = "clear_&history"
 uf.wizard_size = (600, 350)
 uf.wizard_apply_button = False
@@ -97,7 +96,7 @@ uf.desc[-1].add_paragraph("This allows PyMOL commands to be passed to the progra
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To reinitialise the PyMOL instance, type:")
 uf.desc[-1].add_prompt("relax> pymol.command(\"reinitialise\")")
-uf.backend = pymol_control.command
+uf.backend = 'pipe_control.pymol_control.command'
 uf.menu_text = "&command"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_size = (700, 400)
@@ -129,7 +128,7 @@ uf.desc[-1].add_list_element("select resn CON")
 uf.desc[-1].add_list_element("hide ('sele')")
 uf.desc[-1].add_list_element("show sticks, 'sele'")
 uf.desc[-1].add_list_element("color white, 'sele'")
-uf.backend = pymol_control.cone_pdb
+uf.backend = 'pipe_control.pymol_control.cone_pdb'
 uf.menu_text = "cone_&pdb"
 uf.wizard_height_desc = 500
 uf.wizard_size = (900, 700)
@@ -182,7 +181,7 @@ uf.desc[-1].add_item_list_element("Average position", "The default is to load th
 uf.desc[-1].add_item_list_element("Frame order motional representation", "The is to load the 'frame_order.pdb', 'frame_order_A.pdb', 'frame_order_B.pdb', 'frame_order_sim.pdb', 'frame_order_sim_A.pdb' and 'frame_order_sim_B.pdb' files, if present.")
 uf.desc[-1].add_item_list_element("Brownian simulation", "The default is to load the 'simulation.pdb.gz' file.")
 uf.desc[-1].add_paragraph("The user function will not only search for these files, but also all *.gz and *.bz2 versions of the average position and frame order representations.  This is to support all output files from the frame_order.pdb_model user function.")
-uf.backend = pymol_control.frame_order
+uf.backend = 'pipe_control.pymol_control.frame_order'
 uf.menu_text = "&frame_order"
 uf.gui_icon = "relax.frame_order"
 uf.wizard_height_desc = 400
@@ -267,7 +266,7 @@ uf.desc[-1].add_paragraph("To map the order parameter values, S2, onto the struc
 uf.desc[-1].add_prompt("relax> pymol.macro_apply('s2')")
 uf.desc[-1].add_prompt("relax> pymol.macro_apply(data_type='s2')")
 uf.desc[-1].add_prompt("relax> pymol.macro_apply(data_type='s2', style=\"classic\")")
-uf.backend = pymol_control.macro_apply
+uf.backend = 'pipe_control.pymol_control.macro_apply'
 uf.menu_text = "&macro_apply"
 uf.gui_icon = "relax.pymol_icon"
 uf.wizard_height_desc = 400
@@ -303,7 +302,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To execute the macro file 's2.pml' located in the directory 'pymol', type:")
 uf.desc[-1].add_prompt("relax> pymol.macro_run(file='s2.pml')")
 uf.desc[-1].add_prompt("relax> pymol.macro_run(file='s2.pml', dir='pymol')")
-uf.backend = pymol_control.macro_run
+uf.backend = 'pipe_control.pymol_control.macro_run'
 uf.menu_text = "macro_&run"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (700, 400)
@@ -408,7 +407,7 @@ uf.desc[-1].add_paragraph("To create a PyMOL macro mapping the order parameter v
 uf.desc[-1].add_prompt("relax> pymol.macro_write('s2')")
 uf.desc[-1].add_prompt("relax> pymol.macro_write(data_type='s2')")
 uf.desc[-1].add_prompt("relax> pymol.macro_write(data_type='s2', style=\"classic\", file='s2.pml', dir='pymol')")
-uf.backend = pymol_control.macro_write
+uf.backend = 'pipe_control.pymol_control.macro_write'
 uf.menu_text = "macro_&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 330
@@ -445,7 +444,7 @@ uf.desc[-1].add_list_element("label 'sele', name")
 uf.desc[-1].add_paragraph("The simulation axes, the residues 'SIM', are displayed using the commands:")
 uf.desc[-1].add_list_element("select resn SIM")
 uf.desc[-1].add_list_element("colour cyan, 'sele'")
-uf.backend = pymol_control.tensor_pdb
+uf.backend = 'pipe_control.pymol_control.tensor_pdb'
 uf.menu_text = "&tensor_pdb"
 uf.wizard_height_desc = 550
 uf.wizard_size = (1000, 750)
@@ -470,7 +469,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("A PDB file of the macromolecule must have previously been loaded as the vector distribution will be overlain with the macromolecule within PyMOL.  The PDB file containing the vector distribution must be created using the complementary structure.create_vector_dist user function.")
 uf.desc[-1].add_paragraph("The vector distribution PDB file is read in using the command:")
 uf.desc[-1].add_list_element("load file")
-uf.backend = pymol_control.vector_dist
+uf.backend = 'pipe_control.pymol_control.vector_dist'
 uf.menu_text = "vector_&dist"
 uf.wizard_size = (800, 500)
 uf.wizard_height_desc = 450
@@ -486,7 +485,7 @@ uf.desc[-1].add_paragraph("This will simply launch Pymol.")
 # Prompt examples.
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_prompt("relax> pymol.view()")
-uf.backend = pymol_control.view
+uf.backend = 'pipe_control.pymol_control.view'
 uf.menu_text = "&view"
 uf.wizard_size = (600, 350)
 uf.wizard_apply_button = False
@@ -24,7 +24,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import align_tensor, pipes, rdc
+from pipe_control import align_tensor, pipes
 from pipe_control.mol_res_spin import get_spin_ids
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
@@ -56,7 +56,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will back calculate the residual dipolar couplings (RDCs) if an alignment tensor is present and inter-dipole vectors have been loaded into the relax data store.")
-uf.backend = rdc.back_calc
+uf.backend = 'pipe_control.rdc.back_calc'
 uf.menu_text = "&back_calc"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -90,7 +90,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To calculate the RDC Q factor for only the spins '@H26', '@H27', and '@H28', type one of:")
 uf.desc[-1].add_prompt("relax> rdc.calc_q_factors('@H26 & @H27 & @H28')")
 uf.desc[-1].add_prompt("relax> rdc.calc_q_factors(spin_id='@H26 & @H27 & @H28')")
-uf.backend = rdc.q_factors
+uf.backend = 'pipe_control.rdc.q_factors'
 uf.menu_text = "&calc_q_factors"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -149,7 +149,7 @@ uf.desc[-1].add_prompt("relax> rdc.copy(pipe_from='m1', pipe_to='m9', align_id=N
 uf.desc[-1].add_paragraph("To copy only the 'Th' RDC data from 'm3' to 'm6', type one of:")
 uf.desc[-1].add_prompt("relax> rdc.copy('m3', 'm6', 'Th')")
 uf.desc[-1].add_prompt("relax> rdc.copy(pipe_from='m3', pipe_to='m6', align_id='Th')")
-uf.backend = rdc.copy
+uf.backend = 'pipe_control.rdc.copy'
 uf.menu_text = "cop&y"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -216,7 +216,7 @@ uf.desc[-1].add_prompt("relax> rdc.corr_plot()")
 uf.desc[-1].add_paragraph("To create a plain text list of the measured and back-calculated data, type one of:")
 uf.desc[-1].add_prompt("relax> rdc.corr_plot(None)")
 uf.desc[-1].add_prompt("relax> rdc.corr_plot(format=None)")
-uf.backend = rdc.corr_plot
+uf.backend = 'pipe_control.rdc.corr_plot'
 uf.menu_text = "corr_&plot"
 uf.gui_icon = "relax.grace_icon"
 uf.wizard_size = (900, 600)
@@ -245,7 +245,7 @@ uf.desc[-1].add_paragraph("This will delete all RDC data associated with the ali
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To delete the RDC data corresponding to align_id='PH_gel', type:")
 uf.desc[-1].add_prompt("relax> rdc.delete('PH_gel')")
-uf.backend = rdc.delete
+uf.backend = 'pipe_control.rdc.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -279,7 +279,7 @@ uf.desc[-1].add_paragraph("This will display all of the RDC data associated with
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To display the 'phage' RDC data, type:")
 uf.desc[-1].add_prompt("relax> rdc.display('phage')")
-uf.backend = rdc.display
+uf.backend = 'pipe_control.rdc.display'
 uf.menu_text = "di&splay"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -392,7 +392,7 @@ uf.desc[-1].add_prompt("relax> rdc.read('Tb', 'Tb.txt', sep=',')")
 uf.desc[-1].add_paragraph("If the individual spin RDC errors are located in the file 'rdc_err.txt' in column number 5, then to read these values into relax, assuming J + D was measured, type one of:")
 uf.desc[-1].add_prompt("relax> rdc.read('phage', 'rdc_err.txt', data_type='D', error_col=5)")
 uf.desc[-1].add_prompt("relax> rdc.read(align_id='phage', file='rdc_err.txt', data_type='D', error_col=5)")
-uf.backend = rdc.read
+uf.backend = 'pipe_control.rdc.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 300
@@ -440,7 +440,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("If the RDC errors have not already been read from a RDC data file or if they need to be changed, then the errors can be set via this user function.")
-uf.backend = rdc.set_errors
+uf.backend = 'pipe_control.rdc.set_errors'
 uf.menu_text = "&set_errors"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -476,7 +476,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This can be used to force the RDC to contribute more or less to the chi-squared optimisation statistic.  The higher the value, the more importance the RDC will have.")
-uf.backend = rdc.weight
+uf.backend = 'pipe_control.rdc.weight'
 uf.menu_text = "wei&ght"
 uf.wizard_size = (700, 500)
 uf.wizard_image = WIZARD_IMAGE_PATH + 'align_tensor.png'
@@ -525,7 +525,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("If no directory name is given, the file will be placed in the current working directory.  The alignment ID is required for selecting which RDC data set will be written to file.")
-uf.backend = rdc.write
+uf.backend = 'pipe_control.rdc.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (800, 600)
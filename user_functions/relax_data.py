@@ -27,7 +27,7 @@ from os import sep
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import pipes, relax_data
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -70,7 +70,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This allows relaxation data of the given type and frequency to be back calculated from the model parameter values.  If the relaxation data ID, type and frequency are not given, then relaxation data matching that currently loaded in the relax data store will be back-calculated.")
-uf.backend = relax_data.back_calc
+uf.backend = 'pipe_control.relax_data.back_calc'
 uf.menu_text = "&back_calc"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'fid.png'
@@ -106,7 +106,7 @@ uf.add_keyarg(
     desc_short = "relaxation data ID string",
     desc = "The relaxation data ID string.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True,
     can_be_none = True
 )
@@ -123,7 +123,7 @@ uf.desc[-1].add_prompt("relax> relax_data.copy(pipe_from='m1', pipe_to='m9', ri_
 uf.desc[-1].add_paragraph("To copy only the NOE relaxation data with the ID string of 'NOE_800' from 'm3' to 'm6', type one of:")
 uf.desc[-1].add_prompt("relax> relax_data.copy('m3', 'm6', 'NOE_800')")
 uf.desc[-1].add_prompt("relax> relax_data.copy(pipe_from='m3', pipe_to='m6', ri_id='NOE_800')")
-uf.backend = relax_data.copy
+uf.backend = 'pipe_control.relax_data.copy'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (700, 500)
@@ -140,7 +140,7 @@ uf.add_keyarg(
     desc_short = "relaxation data ID string",
     desc = "The relaxation data ID string.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True
 )
 # Description.
@@ -150,7 +150,7 @@ uf.desc[-1].add_paragraph("The relaxation data corresponding to the given relaxa
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To delete the relaxation data corresponding to the ID 'NOE_600', type:")
 uf.desc[-1].add_prompt("relax> relax_data.delete('NOE_600')")
-uf.backend = relax_data.delete
+uf.backend = 'pipe_control.relax_data.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_size = (700, 400)
@@ -168,7 +168,7 @@ uf.add_keyarg(
     desc_short = "relaxation data ID string",
     desc = "The relaxation data ID string.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True
 )
 # Description.
@@ -178,7 +178,7 @@ uf.desc[-1].add_paragraph("This will display the relaxation data corresponding t
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To display the NOE relaxation data at 600 MHz with the ID string 'NOE_600', type:")
 uf.desc[-1].add_prompt("relax> relax_data.display('NOE_600')")
-uf.backend = relax_data.display
+uf.backend = 'pipe_control.relax_data.display'
 uf.menu_text = "dis&play"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_size = (700, 400)
@@ -196,7 +196,7 @@ uf.add_keyarg(
     desc_short = "relaxation data ID string",
     desc = "The relaxation data ID string.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True
 )
 uf.add_keyarg(
@@ -212,7 +212,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This is essential for BMRB data deposition.  It is used to specify whether peak heights or peak volumes were measured.  The two currently allowed values for the peak intensity type are 'height' and 'volume'.")
-uf.backend = relax_data.peak_intensity_type
+uf.backend = 'pipe_control.relax_data.peak_intensity_type'
 uf.menu_text = "peak_&intensity_type"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 300
@@ -349,7 +349,7 @@ uf.desc[-1].add_prompt("relax> relax_data.read('R2_800', 'R2', 8.0 * 1e8, 'r2.ou
 uf.desc[-1].add_prompt("relax> relax_data.read(ri_id='R2_800', ri_type='R2', frq=8.0*1e8, file='r2.out', res_num_col=2, res_name_col=3, data_col=5, error_col=6, sep=',')")
 uf.desc[-1].add_paragraph("The following commands will read the R1 data out of the file 'r1.out' where the columns are separated by the symbol '%'")
 uf.desc[-1].add_prompt("relax> relax_data.read('R1_300', 'R1', 300.1 * 1e6, 'r1.out', sep='%')")
-uf.backend = relax_data.read
+uf.backend = 'pipe_control.relax_data.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 450
@@ -367,7 +367,7 @@ uf.add_keyarg(
     desc_short = "relaxation data ID string",
     desc = "The relaxation data ID string.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True
 )
 uf.add_keyarg(
@@ -391,7 +391,7 @@ uf.desc[-1].add_list_element("'methanol',")
 uf.desc[-1].add_list_element("'monoethylene glycol',")
 uf.desc[-1].add_list_element("'no calibration applied'.")
 uf.desc[-1].add_paragraph("Other methods will be accepted if supplied.")
-uf.backend = relax_data.temp_calibration
+uf.backend = 'pipe_control.relax_data.temp_calibration'
 uf.menu_text = "&temp_calibration"
 uf.gui_icon = "oxygen.status.weather-clear"
 uf.wizard_height_desc = 550
@@ -409,7 +409,7 @@ uf.add_keyarg(
     desc_short = "relaxation data ID string",
     desc = "The relaxation data ID string.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True
 )
 uf.add_keyarg(
@@ -439,7 +439,7 @@ uf.desc[-1].add_list_element("'single scan interleaving and temperature compensa
 uf.desc[-1].add_list_element("'single fid interleaving',")
 uf.desc[-1].add_list_element("'single experiment interleaving',")
 uf.desc[-1].add_list_element("'no temperature control applied'.")
-uf.backend = relax_data.temp_control
+uf.backend = 'pipe_control.relax_data.temp_control'
 uf.menu_text = "temp_contro&l"
 uf.gui_icon = "oxygen.status.weather-clear"
 uf.wizard_size = (1000, 750)
@@ -457,7 +457,7 @@ uf.add_keyarg(
     desc_short = "relaxation ID string",
     desc = "The relaxation data ID string of the data to set the frequency of.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True
 )
 uf.add_keyarg(
@@ -472,7 +472,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This allows the type associated with the relaxation data to be either set or reset.  This type must be one of 'R1', 'R2', or 'NOE'.")
-uf.backend = relax_data.type
+uf.backend = 'pipe_control.relax_data.type'
 uf.menu_text = "&type"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_image = WIZARD_IMAGE_PATH + 'fid.png'
@@ -489,7 +489,7 @@ uf.add_keyarg(
     desc_short = "relaxation data ID string",
     desc = "The relaxation data ID string.",
     wiz_element_type = 'combo',
-    wiz_combo_iter = relax_data.get_ids,
+    wiz_combo_iter = 'pipe_control.relax_data.get_ids',
     wiz_read_only = True
 )
 uf.add_keyarg(
@@ -522,7 +522,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("If no directory name is given, the file will be placed in the current working directory.  The relaxation data ID string is required for selecting which relaxation data to write to file.")
-uf.backend = relax_data.write
+uf.backend = 'pipe_control.relax_data.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (800, 600)
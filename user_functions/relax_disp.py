@@ -28,19 +28,11 @@
 from os import sep
 
 # relax module imports.
-from lib.dispersion.variables import EXP_TYPE_CPMG_DQ, EXP_TYPE_CPMG_MQ, EXP_TYPE_CPMG_SQ, EXP_TYPE_CPMG_ZQ, EXP_TYPE_CPMG_PROTON_MQ, EXP_TYPE_CPMG_PROTON_SQ, EXP_TYPE_R1RHO, MODEL_B14, MODEL_B14_FULL, MODEL_CR72, MODEL_CR72_FULL, MODEL_DPL94, MODEL_IT99, MODEL_LIST_FIT_R1, MODEL_LM63, MODEL_LM63_3SITE, MODEL_M61, MODEL_M61B, MODEL_MMQ_CR72, MODEL_MP05, MODEL_NOREX, MODEL_NS_CPMG_2SITE_3D, MODEL_NS_CPMG_2SITE_3D_FULL, MODEL_NS_CPMG_2SITE_EXPANDED, MODEL_NS_CPMG_2SITE_STAR, MODEL_NS_CPMG_2SITE_STAR_FULL, MODEL_NS_MMQ_2SITE, MODEL_NS_MMQ_3SITE, MODEL_NS_MMQ_3SITE_LINEAR, MODEL_NS_R1RHO_2SITE, MODEL_NS_R1RHO_3SITE, MODEL_NS_R1RHO_3SITE_LINEAR, MODEL_R2EFF, MODEL_TAP03, MODEL_TP02, MODEL_TSMFK01
+from lib.dispersion.variables import EXP_TYPE_CPMG_DQ, EXP_TYPE_CPMG_MQ, EXP_TYPE_CPMG_SQ, EXP_TYPE_CPMG_ZQ, EXP_TYPE_CPMG_PROTON_MQ, EXP_TYPE_CPMG_PROTON_SQ, EXP_TYPE_R1RHO, INTERPOLATE_DISP, INTERPOLATE_OFFSET, MODEL_B14, MODEL_B14_FULL, MODEL_CR72, MODEL_CR72_FULL, MODEL_DPL94, MODEL_IT99, MODEL_LIST_FIT_R1, MODEL_LM63, MODEL_LM63_3SITE, MODEL_M61, MODEL_M61B, MODEL_MMQ_CR72, MODEL_MP05, MODEL_NOREX, MODEL_NS_CPMG_2SITE_3D, MODEL_NS_CPMG_2SITE_3D_FULL, MODEL_NS_CPMG_2SITE_EXPANDED, MODEL_NS_CPMG_2SITE_STAR, MODEL_NS_CPMG_2SITE_STAR_FULL, MODEL_NS_MMQ_2SITE, MODEL_NS_MMQ_3SITE, MODEL_NS_MMQ_3SITE_LINEAR, MODEL_NS_R1RHO_2SITE, MODEL_NS_R1RHO_3SITE, MODEL_NS_R1RHO_3SITE_LINEAR, MODEL_R2EFF, MODEL_TAP03, MODEL_TP02, MODEL_TSMFK01, X_AXIS_DISP, X_AXIS_W_EFF, X_AXIS_THETA, Y_AXIS_R2_R1RHO, Y_AXIS_R2_EFF
 from lib.text.gui import dw, dw_AB, dw_BC, dwH, dwH_AB, dwH_BC, i0, kex, kAB, kBC, kAC, phi_ex, phi_exB, phi_exC, nu_1, nu_cpmg, r1rho, r1rho_prime, r2, r2a, r2b, r2eff, tex, theta, w_eff, w_rf
 from graphics import ANALYSIS_IMAGE_PATH, WIZARD_IMAGE_PATH
 from pipe_control import pipes, spectrum
 from pipe_control.mol_res_spin import get_spin_ids
-from specific_analyses.relax_disp.catia import catia_execute, catia_input
-from specific_analyses.relax_disp.cpmgfit import cpmgfit_execute, cpmgfit_input
-from specific_analyses.relax_disp.estimate_r2eff import estimate_r2eff_err
-from specific_analyses.relax_disp.data import cpmg_setup, insignificance, plot_disp_curves, plot_exp_curves, r2eff_read, r2eff_read_spin, relax_time, set_exp_type, r20_from_min_r2eff, spin_lock_field, spin_lock_offset, write_disp_curves
-from specific_analyses.relax_disp.data import INTERPOLATE_DISP, INTERPOLATE_OFFSET, X_AXIS_DISP, X_AXIS_W_EFF, X_AXIS_THETA, Y_AXIS_R2_R1RHO, Y_AXIS_R2_EFF
-from specific_analyses.relax_disp.nessy import nessy_input
-from specific_analyses.relax_disp.parameters import copy
-from specific_analyses.relax_disp.sherekhan import sherekhan_input
 from specific_analyses.relax_disp import uf as relax_disp_uf
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
@@ -78,7 +70,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("CATIA will be executed as")
 uf.desc[-1].add_prompt("$ catia < Fit.catia")
 uf.desc[-1].add_paragraph("If you would like to use a different CATIA executable file, change the binary name to the appropriate file name.  If the file is not located within the environment's path, include the full path in front of the binary file name.")
-uf.backend = catia_execute
+uf.backend = 'specific_analyses.relax_disp.catia.catia_execute'
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.menu_text = "catia_e&xecute"
 uf.wizard_size = (800, 600)
@@ -108,7 +100,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will create all of the input file required for CATIA as well as the CATIA results output directory.")
-uf.backend = catia_input
+uf.backend = 'specific_analyses.relax_disp.catia.catia_input'
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.menu_text = "&catia_input"
 uf.wizard_size = (800, 600)
@@ -147,7 +139,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To add the spins ':1@N' and ':3@N' to a new cluster called 'cluster', type one of:")
 uf.desc[-1].add_prompt("relax> relax_disp.cluster('cluster', ':1,3@N')")
 uf.desc[-1].add_prompt("relax> relax_disp.cluster(cluster_id='cluster', spin_id=':1,3@N')")
-uf.backend = relax_disp_uf.cluster
+uf.backend = 'specific_analyses.relax_disp.uf.cluster'
 uf.menu_text = "c&luster"
 uf.gui_icon = "relax.cluster"
 uf.wizard_height_desc = 500
@@ -193,7 +185,7 @@ uf.desc[-1].add_paragraph("To identify the reference spectrum called 'reference_
 uf.desc[-1].add_prompt("relax> relax_disp.cpmg_setup(spectrum_id='reference_spectrum', cpmg_frq=None)")
 uf.desc[-1].add_paragraph("To set a frequency of 200 Hz for the spectrum '200_Hz_spectrum', type:")
 uf.desc[-1].add_prompt("relax> relax_disp.cpmg_setup(spectrum_id='200_Hz_spectrum', cpmg_frq=200)")
-uf.backend = cpmg_setup
+uf.backend = 'specific_analyses.relax_disp.data.cpmg_setup'
 uf.menu_text = "&cpmg_setup"
 uf.wizard_size = (900, 600)
 uf.wizard_image = ANALYSIS_IMAGE_PATH + 'relax_disp_200x200.png'
@@ -230,7 +222,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("CPMGFit will be executed once per spin as:")
 uf.desc[-1].add_prompt("$ cpmgfit -grid -xmgr -f dir/spin_x.in | tee dir/spin_x.out")
 uf.desc[-1].add_paragraph("where x is replaced by each spin ID string.  If you would like to use a different CPMGFit executable file, change the binary name to the appropriate file name.  If the file is not located within the environment's path, be sure to include the full path in front of the binary file name so it can be found.")
-uf.backend = cpmgfit_execute
+uf.backend = 'specific_analyses.relax_disp.cpmgfit.cpmgfit_execute'
 uf.menu_text = "&cpmgfit_execute"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_size = (800, 600)
@@ -277,7 +269,7 @@ uf.desc[-1].add_paragraph("The following files are created:")
 uf.desc[-1].add_list_element("'dir/spin_x.in',")
 uf.desc[-1].add_list_element("'dir/run.sh'.")
 uf.desc[-1].add_paragraph("One CPMGFit input file is created per spin and named 'dir/spin_x.in', where x is the spin ID string.  The file 'dir/run.sh' is a batch file for executing CPMGFit for all of the spin input files.  If you would like to use a different CPMGFit executable file, change the binary name to the appropriate file name.  If the file is not located within the environment's path, be sure to include the full path in front of the binary name so it can be found.")
-uf.backend = cpmgfit_input
+uf.backend = 'specific_analyses.relax_disp.cpmgfit.cpmgfit_input'
 uf.menu_text = "&cpmgfit_input"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_size = (800, 600)
@@ -341,7 +333,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To set the experiment type to 'SQ CPMG' for the spectrum ID 'nu_4500.0_800MHz', type one of:")
 uf.desc[-1].add_prompt("relax> relax_disp.exp_type('nu_4500.0_800MHz', 'SQ CPMG')")
 uf.desc[-1].add_prompt("relax> relax_disp.exp_type(spectrum_id='nu_4500.0_800MHz', exp_type='SQ CPMG')")
-uf.backend = set_exp_type
+uf.backend = 'specific_analyses.relax_disp.data.set_exp_type'
 uf.menu_text = "&exp_type"
 uf.wizard_height_desc = 400
 uf.wizard_size = (900, 600)
@@ -364,7 +356,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This can be used to deselect all spins which have insignificant dispersion profiles.  The insignificance value is the R2eff/R1rho value in rad/s by which to judge the dispersion curves by.  If the maximum difference between two points on all dispersion curves for a spin is less than this value, that spin will be deselected.")
-uf.backend = insignificance
+uf.backend = 'specific_analyses.relax_disp.data.insignificance'
 uf.gui_icon = "relax.spin_grey"
 uf.menu_text = "&insignificance"
 uf.wizard_size = (800, 550)
@@ -400,7 +392,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will create a single NESSY save file called 'save.NESSY'.  This will contain all of the dispersion data currently loaded in the relax data store.  If the directory name is not supplied, this will default to the current directory.")
-uf.backend = nessy_input
+uf.backend = 'specific_analyses.relax_disp.nessy.nessy_input'
 uf.menu_text = "&nessy_input"
 uf.gui_icon = "relax.nessy"
 uf.wizard_size = (800, 600)
@@ -437,7 +429,7 @@ uf.desc[-1].add_paragraph("For the cluster specific parameters, i.e. the populat
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To copy the CSA values from the data pipe 'm1' to 'm2', type:")
 uf.desc[-1].add_prompt("relax> value.parameter_copy('m1', 'm2', 'csa')")
-uf.backend = copy
+uf.backend = 'specific_analyses.relax_disp.parameters.copy'
 uf.menu_text = "&parameter_copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (800, 500)
@@ -538,7 +530,7 @@ uf.desc[-1].add_paragraph("This is used to create 2D Grace plots of the dispersi
 uf.desc[-1].add_paragraph("Four sets of curves of R2eff/R1rho values will be produced per experiment and per magnetic field strength.  These are the experimental values, the fitted values, the interpolated dispersion curves for the fitted solution, and the residuals.  Different dispersion models result in different interpolated dispersion curves.  For the numeric models which use CPMG-type data, the maximum interpolation resolution is constrained by the frequency of a single CPMG block for the entire relaxation period.  For all other models, the interpolation resolution is not constrained and can be as fine as desired by setting the total number of interpolation points.  Interpolated curves are not produced for the 'R2eff' model as they are not necessary.")
 uf.desc[-1].add_paragraph("For R1rho models, graphs can be interpolated against Spin-lock offset, but this feature is not available for CPMG experiment types.  It is also possible to select values on X-axis of 'Effective field in rotating frame %s (rad/s)' or 'Rotating frame tilt angle %s (rad)'."%("w_eff", "theta"))
 uf.desc[-1].add_paragraph("For R1rho models, special Y-value %s %s can for example be plotted as function of %s.  %s is calculated as: %s=(%s - %s cos^2(%s)) / sin^2(%s)."%("R2", "R1rho", "w_eff", "R2", "R2", "R1rho", "R1", "theta", "theta"))
-uf.backend = plot_disp_curves
+uf.backend = 'specific_analyses.relax_disp.data.plot_disp_curves'
 uf.menu_text = "&plot_disp_curves"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (950, 700)
@@ -581,7 +573,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This is used to create 2D Grace plots of the individual exponential curves used to find the R2eff or R1rho values.  This supplements the grace.write user function which is not capable of generating these curves in a reasonable format.")
-uf.backend = plot_exp_curves
+uf.backend = 'specific_analyses.relax_disp.data.plot_exp_curves'
 uf.menu_text = "&plot_exp_curves"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (800, 600)
@@ -602,7 +594,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This user function allows the optimisation of R1 values to be turned on an off for the relaxation dispersion dispersion models.  If turned off, the current values of R1 will be fixed.  Otherwise the R1 values will be added to the model parameter set.  For models which do not support the R1 parameter for off-resonance effects, this setting will have no effect.  Only the models %s support R1 optimisation." % MODEL_LIST_FIT_R1)
-uf.backend = relax_disp_uf.r1_fit
+uf.backend = 'specific_analyses.relax_disp.uf.r1_fit'
 uf.menu_text = "r&1_fit"
 uf.gui_icon = "oxygen.status.object-locked"
 uf.wizard_size = (800, 500)
@@ -645,7 +637,7 @@ uf.desc[-1].add_paragraph("This method is inspired from the GNU Scientific Libra
 uf.desc[-1].add_paragraph("The covariance matrix is given by: covar = Qxx = (J^T.W.J)^-1, where the weight matrix W is constructed by the multiplication of an Identity matrix I and a weight array w.  The weight array is 1/errors^2, which then gives W = I.w = I x 1/errors^2.")
 uf.desc[-1].add_paragraph("Qxx is computed by QR decomposition, J^T.W.J=QR, Qxx=R^-1. Q^T.  The columns of R which satisfy: |R_{kk}| <= epsrel |R_{11}| are considered linearly-dependent and are excluded from the covariance matrix (the corresponding rows and columns of the covariance matrix are set to zero).")
 uf.desc[-1].add_paragraph("The parameter 'epsrel' is used to remove linear-dependent columns when J is rank deficient.")
-uf.backend = estimate_r2eff_err
+uf.backend = 'specific_analyses.relax_disp.estimate_r2eff.estimate_r2eff_err'
 uf.menu_text = "&r2eff_err_estimate"
 uf.gui_icon = "relax.relax_fit"
 uf.wizard_size = (800, 800)
@@ -761,7 +753,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will read R2eff/R1rho data directly from a file.  The data will be associated with an experiment ID string.  A partial ID is to be supplied and then the full ID string will be constructed as this ID followed by an underscore and then the dispersion point value from the file (as '%s_%s' % (id, disp_point)).  The full IDs must already exist and have been used to set the type of dispersion experiment the data is from, spectrometer proton frequency of the data, and if needed the time of the relaxation period.")
 uf.desc[-1].add_paragraph("The format of this text file must be that each row corresponds to a unique spin system and that there is one file per dispersion point (i.e. per CPMG frequency nu_CPMG or per spin-lock field strength nu1).  The file must be in columnar format and information to identify the spin must be in columns of the file.")
-uf.backend = r2eff_read
+uf.backend = 'specific_analyses.relax_disp.data.r2eff_read'
 uf.menu_text = "&r2eff_read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (1000, 600)
@@ -848,7 +840,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will read R2eff/R1rho data for a single spin directly from a file.  The data will be associated with an experiment ID string.  This ID can be used for setting the type of dispersion experiment the data is from, spectrometer proton frequency of the data, and the time of the relaxation period.")
 uf.desc[-1].add_paragraph("The format of this text file must be that each row corresponds to a dispersion point (i.e. per CPMG frequency nu_CPMG or per spin-lock field strength nu1) and that there is one file per unique spin system.  The file must be in columnar format.  For R1rho data, the dispersion point column can be substituted for the offset values in Hertz.")
-uf.backend = r2eff_read_spin
+uf.backend = 'specific_analyses.relax_disp.data.r2eff_read_spin'
 uf.menu_text = "&r2eff_read_spin"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (900, 700)
@@ -878,7 +870,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("Peak intensities should be loaded before calling this user function via the spectrum.read_intensities user function.  The intensity values will then be associated with a spectrum identifier.  To associate each spectrum identifier with a time point in the relaxation curve prior to optimisation, this user function should be called.")
-uf.backend = relax_time
+uf.backend = 'specific_analyses.relax_disp.data.relax_time'
 uf.menu_text = "&relax_time"
 uf.gui_icon = "oxygen.actions.chronometer"
 uf.wizard_size = (800, 500)
@@ -1009,7 +1001,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To pick the 2-site fast exchange model for all selected spins, type one of:")
 uf.desc[-1].add_prompt("relax> relax_disp.select_model('%s')" % MODEL_LM63)
 uf.desc[-1].add_prompt("relax> relax_disp.select_model(model='%s')" % MODEL_LM63)
-uf.backend = relax_disp_uf.select_model
+uf.backend = 'specific_analyses.relax_disp.uf.select_model'
 uf.menu_text = "&select_model"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_height_desc = 500
@@ -1034,7 +1026,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("Set the R20 parameter values to that of the minimum R2eff value.  This user function will look through all R2eff values per magnetic field strength, find the minimum value, and set the R20, R20A, R20B, and R1rho' parameters of the model to this value.  This can serve a number of purposes including using the values for the chi-squared space mapping via the dx.map user function, speeding up optimisation by avoiding the grid search for these parameters, and as initial parameter values for other dispersion software.")
 uf.desc[-1].add_paragraph("Instead of finding the initial values for the R20 parameter using the grid search, the minimum for the R2eff points can be used instead.  This is often a good initial position for minimisation.  For example for a two field CPMG experiment with model CR72, that would drop the number of uniform grid search points from 5D to 3D, i.e. two orders of magnitude faster.  When using the standard 21 grid increments per dimension, it would allow the grid search to be 441 times faster.  Note that the relaxation dispersion auto-analysis will take all pre-set parameter values into account and will automatically exclude these from the grid search.")
 uf.desc[-1].add_paragraph("Note that for optimisation, that this is an experimental and unpublished feature of the dispersion analysis.  If R20 << min(R2eff), the grid search will be performed in a region of the optimisation space quite distant from the true minimum.  If unsure, do not activate this option, and let the grid search find a better starting value.")
-uf.backend = r20_from_min_r2eff
+uf.backend = 'specific_analyses.relax_disp.data.r20_from_min_r2eff'
 uf.menu_text = "&r20_from_min_r2eff"
 uf.gui_icon = "relax.grid_search"
 uf.wizard_height_desc = 500
@@ -1070,7 +1062,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This creates the files required for the ShereKhan server located at http://sherekhan.bionmr.org/.  One file per spin cluster per field strength will be created.  These will be placed in the directory 'clusterx' and named 'sherekhan_frqy.in', where x is the cluster index starting from 1 and y is the magnetic field strength index starting from 1.")
-uf.backend = sherekhan_input
+uf.backend = 'specific_analyses.relax_disp.sherekhan.sherekhan_input'
 uf.menu_text = "&sherekhan_input"
 uf.gui_icon = "relax.sherekhan"
 uf.wizard_size = (800, 500)
@@ -1106,7 +1098,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To set a spin-lock field strength of 2.1 kHz for the spectrum 'nu1_2.1kHz_relaxT_0.010', type one of:")
 uf.desc[-1].add_prompt("relax> relax_disp.spin_lock_field(2100, 'nu1_2.1kHz_relaxT_0.010')")
 uf.desc[-1].add_prompt("relax> relax_disp.spin_lock_field(field=2100, spectrum_id='nu1_2.1kHz_relaxT_0.010')")
-uf.backend = spin_lock_field
+uf.backend = 'specific_analyses.relax_disp.data.spin_lock_field'
 uf.menu_text = "spin_lock_&field"
 uf.wizard_size = (800, 500)
 uf.wizard_image = ANALYSIS_IMAGE_PATH + 'relax_disp_200x200.png'
@@ -1140,7 +1132,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To set a spin-lock offset of 110.0 ppm for the spectrum 'nu1_2.1kHz_relaxT_0.010', type one of:")
 uf.desc[-1].add_prompt("relax> relax_disp.spin_lock_offset('nu1_2.1kHz_relaxT_0.010', 110.0)")
 uf.desc[-1].add_prompt("relax> relax_disp.spin_lock_offset(spectrum_id='nu1_2.1kHz_relaxT_0.010', offset=110.0)")
-uf.backend = spin_lock_offset
+uf.backend = 'specific_analyses.relax_disp.data.spin_lock_offset'
 uf.menu_text = "spin_lock_&offset"
 uf.wizard_size = (800, 500)
 uf.wizard_image = ANALYSIS_IMAGE_PATH + 'relax_disp_200x200.png'
@@ -1167,7 +1159,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This is used to created text files of the dispersion curves of R2eff/R1rho values, both measured and back calculated from the optimised dispersion model.  The columns of the text file will be the experiment name, the magnetic field strength (as the proton frequency in MHz), dispersion point (nu_CPMG or the spin-lock field strength), the experimental R2eff value, the back-calculated R2eff value, and the experimental R2eff error.  One file will be created per spin system with the name 'disp_x.out', where x is the spin ID string.")
-uf.backend = write_disp_curves
+uf.backend = 'specific_analyses.relax_disp.data.write_disp_curves'
 uf.menu_text = "&write_disp_curves"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (700, 500)
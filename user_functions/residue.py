@@ -25,7 +25,7 @@
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
 from pipe_control import pipes
-from pipe_control.mol_res_spin import copy_residue, create_residue, delete_residue, display_residue, get_molecule_names, get_residue_ids, id_string_doc, name_residue, number_residue
+from pipe_control.mol_res_spin import get_molecule_names, get_residue_ids, id_string_doc
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -90,7 +90,7 @@ uf.desc[-1].add_prompt("relax> residue.copy(res_from='#Old mol:1', res_to='#New
 uf.desc[-1].add_paragraph("To copy the residue data of residue 1 from the data pipe 'm1' to 'm2', assuming the current data pipe is 'm1', type:")
 uf.desc[-1].add_prompt("relax> residue.copy(res_from=':1', pipe_to='m2')")
 uf.desc[-1].add_prompt("relax> residue.copy(pipe_from='m1', res_from=':1', pipe_to='m2', res_to=':1')")
-uf.backend = copy_residue
+uf.backend = 'pipe_control.mol_res_spin.copy_residue'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (800, 600)
@@ -137,7 +137,7 @@ uf.desc[-1].add_paragraph("The following sequence of commands will generate the
 uf.desc[-1].add_prompt("relax> residue.create(1, 'ALA')")
 uf.desc[-1].add_prompt("relax> residue.create(2, 'GLY')")
 uf.desc[-1].add_prompt("relax> residue.create(3, 'LYS')")
-uf.backend = create_residue
+uf.backend = 'pipe_control.mol_res_spin.create_residue'
 uf.menu_text = "c&reate"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_size = (700, 500)
@@ -161,7 +161,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This can be used to delete a single or sets of residues.  See the ID string documentation for more information.  If spin system/atom ids are included a RelaxError will be raised.")
 uf.desc.append(id_string_doc)
-uf.backend = delete_residue
+uf.backend = 'pipe_control.mol_res_spin.delete_residue'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_height_desc = 550
@@ -187,7 +187,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will display the residue data loaded into the current data pipe.")
 uf.desc.append(id_string_doc)
-uf.backend = display_residue
+uf.backend = 'pipe_control.mol_res_spin.display_residue'
 uf.menu_text = "dis&play"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_height_desc = 550
@@ -234,7 +234,7 @@ uf.desc[-1].add_prompt("relax> residue.name(':2', 'XXX', force=True)")
 uf.desc[-1].add_prompt("relax> residue.name(':3', 'XXX', force=True)")
 uf.desc[-1].add_paragraph("Alternatively:")
 uf.desc[-1].add_prompt("relax> residue.name(':1,2,3', 'XXX', force=True)")
-uf.backend = name_residue
+uf.backend = 'pipe_control.mol_res_spin.name_residue'
 uf.menu_text = "&name"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 500
@@ -280,7 +280,7 @@ uf.desc[-1].add_paragraph("The following sequence of commands will renumber the
 uf.desc[-1].add_prompt("relax> residue.number(':1', 101, force=True)")
 uf.desc[-1].add_prompt("relax> residue.number(':2', 102, force=True)")
 uf.desc[-1].add_prompt("relax> residue.number(':3', 103, force=True)")
-uf.backend = number_residue
+uf.backend = 'pipe_control.mol_res_spin.number_residue'
 uf.menu_text = "&number"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 500
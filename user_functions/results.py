@@ -24,7 +24,6 @@
 """The results user function definitions."""
 
 # relax module imports.
-from pipe_control import results
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 from user_functions.wildcards import WILDCARD_RELAX_RESULT
@@ -45,7 +44,7 @@ uf.display = True
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will print to screen (STDOUT) the results contained within the current data pipe.")
-uf.backend = results.display
+uf.backend = 'pipe_control.results.display'
 uf.menu_text = "&display"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_size = (600, 300)
@@ -75,7 +74,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This is able to handle uncompressed, bzip2 compressed files, or gzip compressed files automatically.  The full file name including extension can be supplied, however, if the file cannot be found the file with '.bz2' appended followed by the file name with '.gz' appended will be searched for.")
-uf.backend = results.read
+uf.backend = 'pipe_control.results.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (700, 500)
@@ -137,7 +136,7 @@ uf.desc[-1].add_item_list_element("0", "No compression (no file extension),")
 uf.desc[-1].add_item_list_element("1", "bzip2 compression ('.bz2' file extension),")
 uf.desc[-1].add_item_list_element("2", "gzip compression ('.gz' file extension).")
 uf.desc[-1].add_paragraph("The complementary read function will automatically handle the compressed files.")
-uf.backend = results.write
+uf.backend = 'pipe_control.results.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 450
@@ -23,7 +23,6 @@
 """The script user function definitions."""
 
 # relax module imports.
-from pipe_control import script
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 from user_functions.wildcards import WILDCARD_RELAX_SCRIPT
@@ -50,7 +49,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will execute a relax or any ordinary Python script.")
-uf.backend = script.script
+uf.backend = 'pipe_control.script.script'
 uf.menu_text = "&script"
 uf.gui_icon = "oxygen.mimetypes.application-x-desktop"
 uf.wizard_size = (700, 400)
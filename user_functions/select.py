@@ -25,7 +25,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import domain, selection, spectrum
+from pipe_control import domain, selection
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -49,7 +49,7 @@ uf.desc[-1].add_paragraph("This will select all spins, irregardless of their cur
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To select all spins, simply type:")
 uf.desc[-1].add_prompt("relax> select.all()")
-uf.backend = selection.sel_all
+uf.backend = 'pipe_control.selection.sel_all'
 uf.menu_text = "&all"
 uf.wizard_size = (600, 550)
 uf.wizard_apply_button = False
@@ -68,7 +68,7 @@ uf.desc[-1].add_paragraph("This simply prints out the current spin selections.")
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To show the current selections, type:")
 uf.desc[-1].add_prompt("relax> select.display()")
-uf.backend = selection.display
+uf.backend = 'pipe_control.selection.display'
 uf.menu_text = "dis&play"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_size = (600, 550)
@@ -126,7 +126,7 @@ uf.desc[-1].add_prompt("relax> select.domain(domain_id='N-dom', change_all=True)
 uf.desc[-1].add_paragraph("To select all spins of the domain 'N-dom', preserving the current selections, simply type one of:")
 uf.desc[-1].add_prompt("relax> select.domain('N-dom', 'AND', True)")
 uf.desc[-1].add_prompt("relax> select.domain(domain_id='N-dom', boolean='AND', change_all=True)")
-uf.backend = selection.sel_domain
+uf.backend = 'pipe_control.selection.sel_domain'
 uf.menu_text = "&domain"
 uf.wizard_height_desc = 500
 uf.wizard_size = (1000, 750)
@@ -189,7 +189,7 @@ uf.desc[-1].add_prompt("relax> select.interatom(spin_id1='@N', spin_id2='@H')")
 uf.desc[-1].add_paragraph("To select all H-H interatomic vectors of a small organic molecule, type one of:")
 uf.desc[-1].add_prompt("relax> select.interatom('@H*', '@H*')")
 uf.desc[-1].add_prompt("relax> select.interatom(spin_id1='@H*', spin_id2='@H*')")
-uf.backend = selection.sel_interatom
+uf.backend = 'pipe_control.selection.sel_interatom'
 uf.menu_text = "&interatom"
 uf.wizard_height_desc = 450
 uf.wizard_size = (1000, 750)
@@ -315,7 +315,7 @@ uf.desc[-1].add_prompt("relax> select.read(file='isolated_peaks', res_num_col=1)
 uf.desc[-1].add_paragraph("To select the spins in the second column of the relaxation data file 'r1.600' while deselecting all other spins, for example type:")
 uf.desc[-1].add_prompt("relax> select.read('r1.600', spin_num_col=2, change_all=True)")
 uf.desc[-1].add_prompt("relax> select.read(file='r1.600', spin_num_col=2, change_all=True)")
-uf.backend = selection.sel_read
+uf.backend = 'pipe_control.selection.sel_read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 400
@@ -342,7 +342,7 @@ uf.desc[-1].add_paragraph("By supplying the spin ID string, a subset of spins ca
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To select all currently deselected spins and deselect those which are selected type:")
 uf.desc[-1].add_prompt("relax> select.reverse()")
-uf.backend = selection.reverse
+uf.backend = 'pipe_control.selection.reverse'
 uf.menu_text = "re&verse"
 uf.gui_icon = "oxygen.actions.system-switch-user"
 uf.wizard_size = (700, 550)
@@ -404,7 +404,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To select all spins with a signal to noise ratio higher than 10.0:")
 uf.desc[-1].add_prompt("relax> select.sn_ratio(ratio=10.0, operation='>')")
 uf.desc[-1].add_prompt("relax> select.sn_ratio(ratio=10.0, operation='>', all_sn=False)")
-uf.backend = spectrum.sn_ratio_selection
+uf.backend = 'pipe_control.spectrum.sn_ratio_selection'
 uf.menu_text = "&sn_ratio"
 uf.gui_icon = "relax.fid"
 uf.wizard_height_desc = 500
@@ -460,7 +460,7 @@ uf.desc[-1].add_paragraph("To select residue 5 CYS in addition to the currently
 uf.desc[-1].add_prompt("relax> select.spin(':5')")
 uf.desc[-1].add_prompt("relax> select.spin(':5&:CYS')")
 uf.desc[-1].add_prompt("relax> select.spin(spin_id=':5&:CYS')")
-uf.backend = selection.sel_spin
+uf.backend = 'pipe_control.selection.sel_spin'
 uf.menu_text = "&spin"
 uf.gui_icon = "relax.spin"
 uf.wizard_height_desc = 500
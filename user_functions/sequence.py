@@ -24,7 +24,7 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control import pipes, sequence
+from pipe_control import pipes
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -47,7 +47,7 @@ uf.desc[-1].add_paragraph("This can be used to attach protons to all the heteron
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To attach protons, simply type:")
 uf.desc[-1].add_prompt("relax> sequence.attach_protons()")
-uf.backend = sequence.attach_protons
+uf.backend = 'pipe_control.sequence.attach_protons'
 uf.menu_text = "&attach_protons"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_size = (700, 500)
@@ -98,7 +98,7 @@ uf.desc[-1].add_prompt("relax> sequence.copy(pipe_to='m9')")
 uf.desc[-1].add_paragraph("To copy the sequence from the data pipe 'm1' to 'm2', type:")
 uf.desc[-1].add_prompt("relax> sequence.copy('m1', 'm2')")
 uf.desc[-1].add_prompt("relax> sequence.copy(pipe_from='m1', pipe_to='m2')")
-uf.backend = sequence.copy
+uf.backend = 'pipe_control.sequence.copy'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (800, 500)
@@ -155,7 +155,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will print out the sequence information of all loaded spins in the current data pipe.")
-uf.backend = sequence.display
+uf.backend = 'pipe_control.sequence.display'
 uf.menu_text = "&display"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_size = (700, 500)
@@ -262,7 +262,7 @@ uf.desc[-1].add_prompt("relax> sequence.read(file='noe.600.out', res_num_col=2,
 uf.desc[-1].add_paragraph("The following commands will read the RNA residues and atoms (including C2, C5, C6, C8, N1, and N3) from the file '500.NOE', where the residue number, residue name, spin number, and spin name are in the first to fourth columns respectively:")
 uf.desc[-1].add_prompt("relax> sequence.read('500.NOE', res_num_col=1, res_name_col=2, spin_num_col=3, spin_name_col=4)")
 uf.desc[-1].add_prompt("relax> sequence.read(file='500.NOE', res_num_col=1, res_name_col=2, spin_num_col=3, spin_name_col=4)")
-uf.backend = sequence.read
+uf.backend = 'pipe_control.sequence.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (900, 600)
@@ -339,7 +339,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("Write the sequence data to file.  If no directory name is given, the file will be placed in the current working directory.")
-uf.backend = sequence.write
+uf.backend = 'pipe_control.sequence.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_size = (900, 700)
@@ -25,7 +25,6 @@
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
 from pipe_control import spectrum
-import pipe_control.spectrometer
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -72,7 +71,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This allows the spectrometer frequency of a given experiment to be set.  The expected units are that of the proton resonance frequency in Hertz.  See the 'sfrq' parameter in the Varian procpar file or the 'SFO1' parameter in the Bruker acqus file for the exact value.")
-uf.backend = pipe_control.spectrometer.set_frequency
+uf.backend = 'pipe_control.spectrometer.set_frequency'
 uf.menu_text = "&frequency"
 uf.gui_icon = "relax.frq"
 uf.wizard_size = (750, 500)
@@ -98,7 +97,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This allows the temperature of an experiment to be set.  This value should be in Kalvin.  In certain analyses, for example those which use pseudocontact shift data, knowledge of the temperature is essential.  For the pseudocontact shift, the experiment ID string should match one of the alignment IDs.")
-uf.backend = pipe_control.spectrometer.set_temperature
+uf.backend = 'pipe_control.spectrometer.set_temperature'
 uf.menu_text = "&temperature"
 uf.gui_icon = "oxygen.status.weather-clear"
 uf.wizard_size = (700, 500)
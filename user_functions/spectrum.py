@@ -73,7 +73,7 @@ uf.add_keyarg(
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The spectrum ID identifies the spectrum associated with the error and must correspond to a previously loaded set of intensities.  If the spin ID is unset, then the error value for all spins will be set to the supplied value.")
-uf.backend = spectrum.baseplane_rmsd
+uf.backend = 'pipe_control.spectrum.baseplane_rmsd'
 uf.menu_text = "&baseplane_rmsd"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_size = (800, 500)
@@ -100,7 +100,7 @@ uf.desc[-1].add_paragraph("The spectral data corresponding to the given spectrum
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To delete the peak height data corresponding to the ID 'R1 ncyc5', type:")
 uf.desc[-1].add_prompt("relax> spectrum.delete('R1 ncyc5')")
-uf.backend = spectrum.delete
+uf.backend = 'pipe_control.spectrum.delete'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_size = (700, 400)
@@ -163,7 +163,7 @@ uf.desc[-1].add_paragraph("When peak volumes are measured by any integration met
 # Peak volumes with all spectra replicated.
 uf.desc.append(Desc_container("Peak volumes with all spectra replicated"))
 uf.desc[-1].add_paragraph("With all spectra replicated and again using any integration methodology, the intensity errors can be calculated as described in the 'Peak heights with all spectra replicated' section above.")
-uf.backend = spectrum.error_analysis
+uf.backend = 'pipe_control.spectrum.error_analysis'
 uf.menu_text = "&error_analysis"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_height_desc = 530
@@ -185,7 +185,7 @@ uf.desc[-1].add_paragraph("This function is meant as a short-cut for the spectru
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To collect all spectrum IDs per field strength, and perform peak intensity error analysis:")
 uf.desc[-1].add_prompt("relax> spectrum.error_analysis_per_field()")
-uf.backend = spectrum.error_analysis_per_field
+uf.backend = 'pipe_control.spectrum.error_analysis_per_field'
 uf.menu_text = "&error_analysis_per_field"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_height_desc = 530
@@ -226,7 +226,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("For a complete description of which integration methods and how many points N are used for different integration techniques, please see the spectrum.error_analysis user function documentation.")
 uf.desc[-1].add_paragraph("The spectrum ID identifies the spectrum associated with the value of N and must correspond to a previously loaded set of intensities.  If the spin ID is unset, then the number of summed points for all spins will be set to the supplied value.")
-uf.backend = spectrum.integration_points
+uf.backend = 'pipe_control.spectrum.integration_points'
 uf.menu_text = "&integration_points"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_size = (900, 600)
@@ -381,7 +381,7 @@ uf.desc[-1].add_prompt("relax> spectrum.read_intensities(file='sat.list', spectr
 uf.desc[-1].add_paragraph("To read the reference and saturated spectra peak heights from the XEasy formatted files 'ref.text' and 'sat.text', type:")
 uf.desc[-1].add_prompt("relax> spectrum.read_intensities(file='ref.text', spectrum_id='ref')")
 uf.desc[-1].add_prompt("relax> spectrum.read_intensities(file='sat.text', spectrum_id='sat')")
-uf.backend = spectrum.read
+uf.backend = 'pipe_control.spectrum.read'
 uf.menu_text = "&read_intensities"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 300
@@ -497,7 +497,7 @@ uf.desc[-1].add_prompt("relax> spectrum.read_spins(file='sat.list')")
 uf.desc[-1].add_paragraph("To read the spin assignments from the XEasy formatted files 'ref.text' and 'sat.text', type:")
 uf.desc[-1].add_prompt("relax> spectrum.read_spins(file='ref.text')")
 uf.desc[-1].add_prompt("relax> spectrum.read_spins(file='sat.text')")
-uf.backend = spectrum.read_spins
+uf.backend = 'pipe_control.spectrum.read_spins'
 uf.menu_text = "&read_spins"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 300
@@ -531,7 +531,7 @@ uf.desc[-1].add_prompt("relax> spectrum.replicated(['ref1', 'ref2', 'ref3'])")
 uf.desc[-1].add_prompt("relax> spectrum.replicated(spectrum_ids=['ref1', 'ref2', 'ref3'])")
 uf.desc[-1].add_paragraph("To specify that the two R2 spectra 'ncyc2' and 'ncyc2b' are the same time point, type:")
 uf.desc[-1].add_prompt("relax> spectrum.replicated(['ncyc2', 'ncyc2b'])")
-uf.backend = spectrum.replicated
+uf.backend = 'pipe_control.spectrum.replicated'
 uf.menu_text = "re&plicated"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_size = (700, 500)
@@ -549,7 +549,7 @@ uf.desc[-1].add_paragraph("This user function will per spin calculate the signal
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To calculate the Signal to Noise ratio per spin.")
 uf.desc[-1].add_prompt("relax> spectrum.sn_ratio()")
-uf.backend = spectrum.signal_noise_ratio
+uf.backend = 'pipe_control.spectrum.signal_noise_ratio'
 uf.menu_text = "&sn_ratio"
 uf.gui_icon = "relax.fid"
 uf.wizard_size = (600, 400)
@@ -25,7 +25,7 @@
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
 from pipe_control import pipes
-from pipe_control.mol_res_spin import copy_spin, create_pseudo_spin, create_spin, delete_spin, display_spin, get_molecule_names, get_residue_ids, get_residue_names, get_residue_nums, get_spin_ids, id_string_doc, name_spin, number_spin, set_spin_element, set_spin_isotope
+from pipe_control.mol_res_spin import get_molecule_names, get_residue_ids, get_residue_names, get_residue_nums, get_spin_ids, id_string_doc
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -89,7 +89,7 @@ uf.desc[-1].add_prompt("relax> spin.copy(spin_from='#Old mol@1', spin_to='#New m
 uf.desc[-1].add_paragraph("To copy the spin data of spin 1 from the data pipe 'm1' to 'm2', assuming the current data pipe is 'm1', type:")
 uf.desc[-1].add_prompt("relax> spin.copy(spin_from='@1', pipe_to='m2')")
 uf.desc[-1].add_prompt("relax> spin.copy(pipe_from='m1', spin_from='@1', pipe_to='m2', spin_to='@1')")
-uf.backend = copy_spin
+uf.backend = 'pipe_control.mol_res_spin.copy_spin'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_size = (700, 600)
@@ -153,7 +153,7 @@ uf.desc[-1].add_paragraph("The following sequence of commands will add the spins
 uf.desc[-1].add_prompt("relax> spin.create('C4',  1, res_num=10)")
 uf.desc[-1].add_prompt("relax> spin.create('C9',  2, res_num=10)")
 uf.desc[-1].add_prompt("relax> spin.create('C15', 3, res_num=10)")
-uf.backend = create_spin
+uf.backend = 'pipe_control.mol_res_spin.create_spin'
 uf.menu_text = "c&reate"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_size = (700, 500)
@@ -218,7 +218,7 @@ uf.desc.append(id_string_doc)
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("The following will create the pseudo-atom named 'Q9' consisting of the protons '@H16', '@H17', '@H18':")
 uf.desc[-1].add_prompt("relax> spin.create_pseudo('Q9', members=['@H16', '@H17', '@H18'])")
-uf.backend = create_pseudo_spin
+uf.backend = 'pipe_control.mol_res_spin.create_pseudo_spin'
 uf.menu_text = "create_p&seudo"
 uf.gui_icon = "oxygen.actions.list-add-relax-blue"
 uf.wizard_height_desc = 350
@@ -242,7 +242,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This can be used to delete a single or sets of spins.  See the identification string documentation below for more information.")
 uf.desc.append(id_string_doc)
-uf.backend = delete_spin
+uf.backend = 'pipe_control.mol_res_spin.delete_spin'
 uf.menu_text = "&delete"
 uf.gui_icon = "oxygen.actions.list-remove"
 uf.wizard_height_desc = 550
@@ -268,7 +268,7 @@ uf.add_keyarg(
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will display the spin data loaded into the current data pipe.")
 uf.desc.append(id_string_doc)
-uf.backend = display_spin
+uf.backend = 'pipe_control.mol_res_spin.display_spin'
 uf.menu_text = "dis&play"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_height_desc = 550
@@ -314,7 +314,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("The set all spins of residue 1 to be carbons, type one of:")
 uf.desc[-1].add_prompt("relax> spin.element('@1', 'C', force=True)")
 uf.desc[-1].add_prompt("relax> spin.element(spin_id='@1', element='C', force=True)")
-uf.backend = set_spin_element
+uf.backend = 'pipe_control.mol_res_spin.set_spin_element'
 uf.menu_text = "&element"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 500
@@ -360,7 +360,7 @@ uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("The set all spins of residue 1 to the '13C' nuclear isotope, type one of:")
 uf.desc[-1].add_prompt("relax> spin.isotope('@1', '13C', force=True)")
 uf.desc[-1].add_prompt("relax> spin.isotope(spin_id='@1', isotope='13C', force=True)")
-uf.backend = set_spin_isotope
+uf.backend = 'pipe_control.mol_res_spin.set_spin_isotope'
 uf.menu_text = "&isotope"
 uf.gui_icon = "relax.nuclear_symbol"
 uf.wizard_height_desc = 500
@@ -403,7 +403,7 @@ uf.desc[-1].add_paragraph("The following sequence of commands will rename the se
 uf.desc[-1].add_prompt("relax> spin.name('@1', 'C11', force=True)")
 uf.desc[-1].add_prompt("relax> spin.name('@2', 'C12', force=True)")
 uf.desc[-1].add_prompt("relax> spin.name('@3', 'C13', force=True)")
-uf.backend = name_spin
+uf.backend = 'pipe_control.mol_res_spin.name_spin'
 uf.menu_text = "&name"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 500
@@ -450,7 +450,7 @@ uf.desc[-1].add_paragraph("The following sequence of commands will renumber the
 uf.desc[-1].add_prompt("relax> spin.number('@1', -1, force=True)")
 uf.desc[-1].add_prompt("relax> spin.number('@2', -2, force=True)")
 uf.desc[-1].add_prompt("relax> spin.number('@3', -3, force=True)")
-uf.backend = number_spin
+uf.backend = 'pipe_control.mol_res_spin.number_spin'
 uf.menu_text = "num&ber"
 uf.gui_icon = "oxygen.actions.edit-rename"
 uf.wizard_height_desc = 500
@@ -23,7 +23,6 @@
 """The state user function definitions."""
 
 # relax module imports.
-from pipe_control.state import load_state, save_state
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 from user_functions.wildcards import WILDCARD_RELAX_SAVE
@@ -77,7 +76,7 @@ uf.desc[-1].add_prompt("relax> state.load('save')")
 uf.desc[-1].add_prompt("relax> state.load(state='save')")
 uf.desc[-1].add_prompt("relax> state.load('save.bz2')")
 uf.desc[-1].add_prompt("relax> state.load(state='save.bz2', force=True)")
-uf.backend = load_state
+uf.backend = 'pipe_control.state.load_state'
 uf.menu_text = "&load"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_size = (800, 600)
@@ -140,7 +139,7 @@ uf.desc[-1].add_prompt("relax> state.save(state='save.bz2')")
 uf.desc[-1].add_paragraph("If the file 'save' already exists, the following commands will save the current program state by overwriting the file.")
 uf.desc[-1].add_prompt("relax> state.save('save', force=True)")
 uf.desc[-1].add_prompt("relax> state.save(state='save', force=True)")
-uf.backend = save_state
+uf.backend = 'pipe_control.state.save_state'
 uf.menu_text = "&save"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 400
@@ -24,7 +24,6 @@
 
 # relax module imports.
 from graphics import WIZARD_IMAGE_PATH
-from pipe_control.statistics import aic, model_statistics
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -43,7 +42,7 @@ uf.title_short = "Calculate AIC values."
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will perform a calculation to obtain the chi-squared statistic for the current parameter values for each model, count the number of parameters per model and calculate Akaike's Information Criterion (AIC) using the formula AIC = chi2 + 2k.  The AIC values, chi-squared values, and number of parameters will be stored in the appropriate location for the model in the relax data store.")
-uf.backend = aic
+uf.backend = 'pipe_control.statistics.aic'
 uf.menu_text = "&aic"
 uf.gui_icon = "relax.discrepancy_curve"
 uf.wizard_apply_button = False
@@ -58,7 +57,7 @@ uf.title_short = "Model statistics."
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will perform a back-calculation to obtain the chi-squared statistic for the current parameter values, count the number of parameters and data points per model, and place all the values in the relax data store.")
-uf.backend = model_statistics
+uf.backend = 'pipe_control.statistics.model_statistics'
 uf.menu_text = "&model"
 uf.gui_icon = "oxygen.categories.applications-education"
 uf.wizard_apply_button = False
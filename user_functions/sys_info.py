@@ -28,9 +28,6 @@ from os import sep
 
 # relax module imports.
 from graphics import WIZARD_OXYGEN_PATH
-from info import print_sys_info
-from lib.timing import print_time
-from pipe_control.system import cd, pwd
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -59,7 +56,7 @@ uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("The equivalent of python module os.chdir(path).  Change the current working directory to the specified path.")
 uf.desc[-1].add_paragraph("To change the current working directory, type:")
 uf.desc[-1].add_prompt("relax> system.cd(\"/path/to/dir\")")
-uf.backend = cd
+uf.backend = 'pipe_control.system.cd'
 uf.display = False
 uf.menu_text = "&cd"
 uf.gui_icon = "oxygen.places.folder-favorites"
@@ -79,7 +76,7 @@ uf.desc[-1].add_paragraph("This will display the current working directory.")
 uf.desc[-1].add_paragraph("The directory can be changed with the system.cd(path) user function.")
 uf.desc[-1].add_prompt("relax> system.pwd()")
 uf.desc[-1].add_prompt("relax> system.cd(\"/path/to/dir\")")
-uf.backend = pwd
+uf.backend = 'pipe_control.system.pwd'
 uf.menu_text = "&pwd"
 uf.gui_icon = "oxygen.places.folder-development"
 uf.wizard_size = (700, 400)
@@ -95,7 +92,7 @@ uf.display = True
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This will display all of the relax, Python, python package and hardware information currently being used by relax.  This is useful for seeing if all packages are up to date and if the correct software versions are being used.  It is also very useful information for reporting relax bugs.")
-uf.backend = print_sys_info
+uf.backend = 'info.print_sys_info'
 uf.menu_text = "s&ys_info"
 uf.gui_icon = "oxygen.actions.help-about"
 uf.wizard_size = (700, 400)
@@ -110,7 +107,7 @@ uf.display = True
 # Description.
 uf.desc.append(Desc_container())
 uf.desc[-1].add_paragraph("This user function will display the current time which can be useful for timing long calculations by having time information in any saved log files.")
-uf.backend = print_time
+uf.backend = 'lib.timing.print_time'
 uf.menu_text = "&time"
 uf.gui_icon = "oxygen.actions.chronometer"
 uf.wizard_size = (700, 400)
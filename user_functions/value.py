@@ -100,7 +100,7 @@ uf.desc.append(frame_order_params.uf_doc(label="table: frame order parameters"))
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_paragraph("To copy the CSA values from the data pipe 'm1' to 'm2', type:")
 uf.desc[-1].add_prompt("relax> value.copy('m1', 'm2', 'csa')")
-uf.backend = value.copy
+uf.backend = 'pipe_control.value.copy'
 uf.menu_text = "&copy"
 uf.gui_icon = "oxygen.actions.list-add"
 uf.wizard_height_desc = 500
@@ -145,7 +145,7 @@ uf.desc[-1].add_prompt("relax> value.display('csa')")
 uf.desc[-1].add_paragraph("To display the model-free Rex values scaled to 600 MHz, type one of:")
 uf.desc[-1].add_prompt("relax> value.display('rex', scaling=(2.0*pi*600e6)**2)")
 uf.desc[-1].add_prompt("relax> value.display(param='rex', scaling=(2.0*pi*600e6)**2)")
-uf.backend = value.display
+uf.backend = 'pipe_control.value.display'
 uf.menu_text = "&display"
 uf.gui_icon = "oxygen.actions.document-preview"
 uf.wizard_height_desc = 550
@@ -280,7 +280,7 @@ uf.desc[-1].add_paragraph("To load 15N CSA values from the file 'csa_values' in
 uf.desc[-1].add_prompt("relax> value.read('csa', 'data/csa_value', spin_id='@N')")
 uf.desc[-1].add_prompt("relax> value.read('csa', 'csa_value', dir='data', spin_id='@N')")
 uf.desc[-1].add_prompt("relax> value.read(param='csa', file='csa_value', dir='data', res_num_col=1, res_name_col=2, data_col=3, error_col=4, spin_id='@N')")
-uf.backend = value.read
+uf.backend = 'pipe_control.value.read'
 uf.menu_text = "&read"
 uf.gui_icon = "oxygen.actions.document-open"
 uf.wizard_height_desc = 450
@@ -393,7 +393,7 @@ uf.desc[-1].add_paragraph("To set the S2 and te parameter values of residue 126,
 uf.desc[-1].add_prompt("relax> value.set([0.56, 13e-12], ['s2', 'te'], ':126@Ca')")
 uf.desc[-1].add_prompt("relax> value.set(val=[0.56, 13e-12], param=['s2', 'te'], spin_id=':126@Ca')")
 uf.desc[-1].add_prompt("relax> value.set(val=[0.56, 13e-12], param=['s2', 'te'], spin_id=':126@Ca')")
-uf.backend = value.set
+uf.backend = 'pipe_control.value.set'
 uf.menu_text = "&set"
 uf.wizard_height_desc = 440
 uf.wizard_size = (1000, 750)
@@ -476,7 +476,7 @@ uf.desc[-1].add_prompt("relax> value.write(param='noe', file='noe.out', force=Tr
 uf.desc[-1].add_paragraph("To write the model-free Rex values scaled to 600 MHz to the file 'rex_600', type one of:")
 uf.desc[-1].add_prompt("relax> value.write('rex', 'rex_600', scaling=(2.0*pi*600e6)**2)")
 uf.desc[-1].add_prompt("relax> value.write(param='rex', file='rex_600', scaling=(2.0*pi*600e6)**2)")
-uf.backend = value.write
+uf.backend = 'pipe_control.value.write'
 uf.menu_text = "&write"
 uf.gui_icon = "oxygen.actions.document-save"
 uf.wizard_height_desc = 400
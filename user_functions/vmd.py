@@ -23,7 +23,6 @@
 """The vmd user function definitions for controlling VMD."""
 
 # relax module imports.
-from pipe_control import vmd
 from user_functions.data import Uf_info; uf_info = Uf_info()
 from user_functions.objects import Desc_container
 
@@ -43,7 +42,7 @@ uf.desc[-1].add_paragraph("This will launch VMD with all of the structures loade
 # Prompt examples.
 uf.desc.append(Desc_container("Prompt examples"))
 uf.desc[-1].add_prompt("relax> vmd.view()")
-uf.backend = vmd.view
+uf.backend = 'pipe_control.vmd.view'
 uf.menu_text = "&view"
 uf.wizard_size = (700, 400)
 uf.wizard_apply_button = False
@@ -31,7 +31,7 @@ except ImportError:
 
 # relax module imports.
 from lib.compat import SYSTEM
-import lib.structure.internal.object
+import lib.structure.internal
 from status import Status; status = Status()
 
 
@@ -150,5 +150,5 @@ def version_full():
 # Fetch the repository information, if present.
 repo_information()
 
-# Set the version in the relax internal structural object.
-lib.structure.internal.object.RELAX_VERSION = version_full()
+# Set the version for the relax internal structural object (the object module itself is not imported, to improve program start up speeds).
+lib.structure.internal.RELAX_VERSION = version_full()